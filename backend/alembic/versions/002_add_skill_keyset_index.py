@@ -0,0 +1,26 @@
+"""Add skill keyset pagination index
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Maintenance tasks page through skills ordered by (updated_at, id)
+    op.create_index(op.f('idx_skill_updated_at_id'), 'skills', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index(op.f('idx_skill_updated_at_id'), table_name='skills')
@@ -0,0 +1,27 @@
+"""Add skill quality score fingerprint
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Lets quality score recalculation skip skills whose inputs are unchanged
+    op.add_column('skills', sa.Column('quality_fingerprint', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_column('skills', 'quality_fingerprint')
@@ -0,0 +1,54 @@
+"""Add skill statistics summary table
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Skill counts per category, tag and content type, kept current from skill events
+    op.create_table('skill_stat_counts',
+        sa.Column('dimension', sa.String(length=20), nullable=False),
+        sa.Column('value', sa.String(length=100), nullable=False),
+        sa.Column('skill_count', sa.Integer(), nullable=False, default=0),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('dimension', 'value')
+    )
+    op.create_index(op.f('idx_skill_stat_count_dimension_count'), 'skill_stat_counts', ['dimension', 'skill_count'], unique=False)
+
+    # Backfill from the existing skills
+    op.execute(
+        "INSERT INTO skill_stat_counts (dimension, value, skill_count) "
+        "SELECT 'category', category_id, COUNT(*) FROM skills "
+        "WHERE category_id IS NOT NULL GROUP BY category_id"
+    )
+    op.execute(
+        "INSERT INTO skill_stat_counts (dimension, value, skill_count) "
+        "SELECT 'tag', tag_id, COUNT(*) FROM skill_tag_associations GROUP BY tag_id"
+    )
+    op.execute(
+        "INSERT INTO skill_stat_counts (dimension, value, skill_count) "
+        "SELECT 'content_type', content_type, COUNT(*) FROM skills "
+        "WHERE content_type IS NOT NULL GROUP BY content_type"
+    )
+    op.execute(
+        "INSERT INTO skill_stat_counts (dimension, value, skill_count) VALUES ('meta', 'version', 1)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index(op.f('idx_skill_stat_count_dimension_count'), table_name='skill_stat_counts')
+    op.drop_table('skill_stat_counts')
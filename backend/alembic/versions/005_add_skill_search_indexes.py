@@ -0,0 +1,43 @@
+"""Add skill full-text and trigram search indexes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Other databases search with the in-process index
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Must match app.skill.search.skill_search_document
+    op.execute(
+        "CREATE INDEX idx_skill_search_document ON skills USING gin (("
+        "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(CAST(keywords AS TEXT), '')), 'B') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C')"
+        "))"
+    )
+    op.execute("CREATE INDEX idx_skill_name_trgm ON skills USING gin (lower(name) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP INDEX IF EXISTS idx_skill_name_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_skill_search_document")
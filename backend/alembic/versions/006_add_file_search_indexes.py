@@ -0,0 +1,46 @@
+"""Add file full-text and trigram search indexes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Other databases search with the in-process index; tables created from
+    # the File model already carry the indexes
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or not sa.inspect(bind).has_table('files'):
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Must match app.file.models.file.file_search_document
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_files_search_document ON files USING gin (("
+        "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(CAST(tags AS TEXT), '')), 'B') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C')"
+        "))"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_files_name_trgm ON files USING gin (lower(name) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_files_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_files_search_document")
@@ -4,6 +4,7 @@ This package contains all REST API route handlers for the
 skill management system.
 """
 
+from . import metrics_routes
 from . import skill_routes
 
-__all__ = ["skill_routes"]
+__all__ = ["metrics_routes", "skill_routes"]
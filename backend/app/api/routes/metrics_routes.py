@@ -0,0 +1,33 @@
+"""Metrics API Routes.
+
+This module provides the OpenMetrics/Prometheus scrape endpoint for the
+in-process metrics registry.
+"""
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+from app.core.config import settings
+from app.core.exposition import (
+    MetricsExporter,
+    OPENMETRICS_CONTENT_TYPE,
+    PROMETHEUS_CONTENT_TYPE,
+)
+
+router = APIRouter(tags=["metrics"])
+
+metrics_exporter = MetricsExporter(
+    multiprocess_dir=settings.METRICS_MULTIPROC_DIR,
+    cache_ttl=settings.METRICS_CACHE_TTL,
+)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics(request: Request) -> Response:
+    """Expose metrics in OpenMetrics format, or text 0.0.4 for older scrapers."""
+    openmetrics = "application/openmetrics-text" in request.headers.get("accept", "")
+    payload = await metrics_exporter.render_async(openmetrics)
+    return Response(
+        content=payload,
+        media_type=OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+    )
@@ -304,8 +304,10 @@ async def search_skills(
             "data": {
                 "items": [item.dict() if hasattr(item, "dict") else item for item in result.items],
                 "total": result.total,
+                "total_is_estimate": result.total_is_estimate,
                 "page": result.page,
                 "page_size": result.page_size,
+                "next_cursor": result.next_cursor,
             },
             "query": search.dict() if hasattr(search, "dict") else search,
         }
@@ -0,0 +1,164 @@
+"""In-process LRU cache.
+
+This module provides LRUCache, a thread-safe least-recently-used cache
+bounded by entry count and/or by the total size of its values.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+__all__ = ["LRUCache"]
+
+
+class LRUCache:
+    """Thread-safe LRU cache with optional entry and byte budgets."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of entries (None for unbounded)
+            max_bytes: Maximum total size of values (None for unbounded)
+            sizeof: Function returning the size of a value in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of cached values."""
+        return self._bytes
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._stats["misses"] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """Store a value, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+
+        Returns:
+            False if the value alone exceeds the byte budget and was not stored
+        """
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return False
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats["evictions"] += 1
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a value.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is missing
+
+        Returns:
+            Removed value or default
+        """
+        with self._lock:
+            value = self._entries.get(key, default)
+            self._remove(key)
+            return value
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Get a snapshot of the cached entries, least recently used first.
+
+        Returns:
+            List of (key, value) pairs
+        """
+        with self._lock:
+            return list(self._entries.items())
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key matches a predicate.
+
+        Args:
+            predicate: Function called with each key
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "size_bytes": self._bytes,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self._bytes -= self._sizes.pop(key, 0)
@@ -55,6 +55,13 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "/var/lib/skill-management/uploads"
     MAX_FILE_SIZE: str = "100MB"
     ALLOWED_EXTENSIONS: List[str] = [".yaml", ".yml", ".json", ".zip"]
+    FILE_SEARCH_BACKEND: str = "auto"  # auto, postgresql or memory
+
+    # Object Storage
+    MINIO_ENDPOINT: str = "localhost:9000"
+    MINIO_ACCESS_KEY: str = "minioadmin"
+    MINIO_SECRET_KEY: str = "minioadmin123"
+    MINIO_SECURE: bool = False
 
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
@@ -70,12 +77,16 @@ class Settings(BaseSettings):
     METRICS_ENABLED: bool = True
     TRACING_ENABLED: bool = True
     HEALTH_CHECK_INTERVAL: int = 60
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_CACHE_TTL: float = 1.0
+    METRICS_SNAPSHOT_INTERVAL: float = 5.0
 
     # Skill Management
     DEFAULT_SKILL_VERSION: str = "1.0.0"
     MAX_SKILL_VERSIONS: int = 100
     SKILL_AUTO_SAVE_INTERVAL: int = 30
     SKILL_MAX_CONTENT_SIZE: int = 10 * 1024 * 1024  # 10MB
+    SKILL_SEARCH_BACKEND: str = "auto"  # auto, postgresql or memory
 
     # Analytics
     ANALYTICS_RETENTION_DAYS: int = 365
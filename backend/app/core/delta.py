@@ -0,0 +1,184 @@
+"""Line-level delta encoding for versioned content.
+
+This module provides the delta codec used by the version managers to store
+versions as changes against their predecessor instead of full copies. A
+delta is a list of instructions applied to a base:
+- ``(start, end)`` copies ``base[start:end]``
+- a literal string or bytes value is inserted as is
+
+Deltas are computed with difflib over lines, so offsets are characters for
+text and bytes for binary content. Text deltas serialize to compact JSON and
+binary deltas to a length-prefixed binary format.
+"""
+
+import difflib
+import json
+import struct
+from typing import AnyStr, List, Tuple, Union
+
+
+__all__ = [
+    "Delta",
+    "apply_delta",
+    "compute_delta",
+    "decode_delta",
+    "encode_delta",
+]
+
+Delta = List[Union[Tuple[int, int], str, bytes]]
+
+_BINARY_MAGIC = b"DLT1"
+_COPY = b"C"
+_INSERT = b"I"
+_COPY_STRUCT = struct.Struct(">QQ")
+_LENGTH_STRUCT = struct.Struct(">Q")
+
+
+def _line_offsets(lines: List[AnyStr]) -> List[int]:
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    return offsets
+
+
+def compute_delta(base: AnyStr, target: AnyStr) -> Delta:
+    """Compute a delta that turns base into target.
+
+    Args:
+        base: Base content
+        target: Target content (same type as base)
+
+    Returns:
+        List of copy ranges and literal inserts
+    """
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    base_offsets = _line_offsets(base_lines)
+    target_offsets = _line_offsets(target_lines)
+
+    # Trim the common prefix and suffix so typical edits only diff the middle
+    prefix = 0
+    limit = min(len(base_lines), len(target_lines))
+    while prefix < limit and base_lines[prefix] == target_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and base_lines[-1 - suffix] == target_lines[-1 - suffix]
+    ):
+        suffix += 1
+
+    matcher = difflib.SequenceMatcher(
+        None,
+        base_lines[prefix:len(base_lines) - suffix],
+        target_lines[prefix:len(target_lines) - suffix],
+        autojunk=False,
+    )
+    opcodes = [
+        (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+    ]
+    if prefix:
+        opcodes.insert(0, ("equal", 0, prefix, 0, prefix))
+    if suffix:
+        opcodes.append((
+            "equal",
+            len(base_lines) - suffix,
+            len(base_lines),
+            len(target_lines) - suffix,
+            len(target_lines),
+        ))
+
+    delta: Delta = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            start, end = base_offsets[i1], base_offsets[i2]
+            if delta and isinstance(delta[-1], tuple) and delta[-1][1] == start:
+                delta[-1] = (delta[-1][0], end)
+            else:
+                delta.append((start, end))
+        elif j2 > j1:
+            literal = target[target_offsets[j1]:target_offsets[j2]]
+            if delta and not isinstance(delta[-1], tuple):
+                delta[-1] = delta[-1] + literal
+            else:
+                delta.append(literal)
+    return delta
+
+
+def apply_delta(base: AnyStr, delta: Delta) -> AnyStr:
+    """Reconstruct content from a base and a delta.
+
+    Args:
+        base: Base content
+        delta: Delta computed against base
+
+    Returns:
+        Reconstructed content
+    """
+    parts = [base[op[0]:op[1]] if isinstance(op, tuple) else op for op in delta]
+    return base[:0].join(parts)
+
+
+def encode_delta(delta: Delta, binary: bool = False) -> Union[str, bytes]:
+    """Serialize a delta.
+
+    Args:
+        delta: Delta to serialize
+        binary: Whether the delta was computed over bytes
+
+    Returns:
+        JSON text for text deltas, packed bytes for binary deltas
+    """
+    if not binary:
+        return json.dumps(
+            [list(op) if isinstance(op, tuple) else op for op in delta],
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+    parts = [_BINARY_MAGIC]
+    for op in delta:
+        if isinstance(op, tuple):
+            parts.append(_COPY + _COPY_STRUCT.pack(op[0], op[1]))
+        else:
+            parts.append(_INSERT + _LENGTH_STRUCT.pack(len(op)) + op)
+    return b"".join(parts)
+
+
+def decode_delta(payload: Union[str, bytes]) -> Delta:
+    """Deserialize a delta produced by encode_delta.
+
+    Args:
+        payload: Serialized delta
+
+    Returns:
+        Delta instructions
+
+    Raises:
+        ValueError: If the payload is not a valid delta
+    """
+    if isinstance(payload, str):
+        return [tuple(op) if isinstance(op, list) else op for op in json.loads(payload)]
+
+    if not payload.startswith(_BINARY_MAGIC):
+        raise ValueError("Not a binary delta")
+
+    delta: Delta = []
+    view = memoryview(payload)
+    position = len(_BINARY_MAGIC)
+    while position < len(payload):
+        kind = payload[position:position + 1]
+        position += 1
+        if kind == _COPY:
+            start, end = _COPY_STRUCT.unpack_from(view, position)
+            position += _COPY_STRUCT.size
+            delta.append((start, end))
+        elif kind == _INSERT:
+            (length,) = _LENGTH_STRUCT.unpack_from(view, position)
+            position += _LENGTH_STRUCT.size
+            delta.append(bytes(view[position:position + length]))
+            position += length
+        else:
+            raise ValueError(f"Invalid delta instruction at offset {position - 1}")
+    return delta
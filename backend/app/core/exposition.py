@@ -0,0 +1,502 @@
+"""OpenMetrics exposition for the in-process metrics registry.
+
+This module renders :mod:`app.core.metrics` registries in the OpenMetrics
+and Prometheus text formats, including:
+- Snapshotting families and registered stats dicts
+- Rendered payload caching so scrapes stay cheap under load
+- Multiprocess aggregation through per-worker snapshot files
+"""
+
+import asyncio
+import glob
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .metrics import Histogram, MetricsRegistry, MetricType, metrics_registry
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0,
+)
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def sanitize_name(name: str) -> str:
+    """Convert a metric name such as ``system.cpu.usage`` to a valid one.
+
+    Args:
+        name: Raw metric name
+
+    Returns:
+        Name matching ``[a-zA-Z_:][a-zA-Z0-9_:]*``
+    """
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    if not name or name[0].isdigit():
+        name = f"_{name}"
+    return name
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{sanitize_name(k)}="{_escape_label_value(v)}"' for k, v in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def snapshot_registry(registry: MetricsRegistry) -> List[Dict[str, Any]]:
+    """Take a JSON-serializable snapshot of a registry.
+
+    Histograms are stored as sparse bucket counts so snapshots from several
+    processes can be merged exactly.
+
+    Args:
+        registry: Registry to snapshot
+
+    Returns:
+        List of family snapshots
+    """
+    families: Dict[str, Dict[str, Any]] = {}
+
+    for family in registry.families():
+        is_histogram = family.metric_type in (MetricType.HISTOGRAM, MetricType.TIMER)
+        metric_type = "histogram" if is_histogram else family.metric_type.value
+        samples = []
+        for key, child in family.children():
+            if is_histogram:
+                samples.append([list(key), _sample_from_histogram(child)])
+            else:
+                samples.append([list(key), child.value])
+        families[family.name] = {
+            "name": family.name,
+            "type": metric_type,
+            "help": family.description,
+            "unit": family.unit,
+            "samples": samples,
+        }
+
+    for source in registry.stats_sources():
+        try:
+            stats = source.read()
+        except Exception as e:
+            logger.warning(f"Failed to read stats for {source.prefix}: {e}")
+            continue
+        if not stats:
+            continue
+
+        labels = sorted((source.labels or {}).items())
+        for key, value in stats.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            name = f"{source.prefix}_{key}"
+            entry = families.setdefault(name, {
+                "name": name,
+                "type": "counter" if key in source.counters else "gauge",
+                "help": source.description,
+                "unit": None,
+                "samples": [],
+            })
+            # Several live instances of the same component are summed
+            for sample in entry["samples"]:
+                if sample[0] == labels:
+                    sample[1] += value
+                    break
+            else:
+                entry["samples"].append([labels, value])
+
+    return list(families.values())
+
+
+def _sample_from_histogram(histogram: Histogram) -> Dict[str, Any]:
+    return {
+        "layout": [histogram.sub_buckets, histogram.min_exponent, histogram.max_exponent],
+        "counts": [[i, c] for i, c in enumerate(histogram.counts) if c],
+        "count": histogram.count,
+        "sum": histogram.sum,
+    }
+
+
+def _histogram_from_sample(sample: Dict[str, Any]) -> Histogram:
+    sub_buckets, min_exponent, max_exponent = sample["layout"]
+    histogram = Histogram(sub_buckets, min_exponent, max_exponent)
+    for index, count in sample["counts"]:
+        histogram.counts[index] += count
+    histogram.count = sample["count"]
+    histogram.sum = sample["sum"]
+    return histogram
+
+
+def merge_snapshots(snapshots: List[Tuple[List[Dict[str, Any]], bool]]) -> List[Dict[str, Any]]:
+    """Merge snapshots taken in several processes.
+
+    Counters and histograms are summed across all processes. Gauges are
+    summed across live processes only, so a dead worker's connections or
+    queue depths do not linger.
+
+    Args:
+        snapshots: List of (snapshot, process alive) pairs
+
+    Returns:
+        Merged snapshot
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+
+    for snapshot, alive in snapshots:
+        for family in snapshot:
+            if family["type"] == "gauge" and not alive:
+                continue
+            target = merged.setdefault(family["name"], {
+                **family,
+                "samples": [],
+                "_index": {},
+            })
+            for labels, value in family["samples"]:
+                key = tuple(tuple(pair) for pair in labels)
+                existing = target["_index"].get(key)
+                if family["type"] == "histogram":
+                    value = _histogram_from_sample(value)
+                if existing is None:
+                    target["_index"][key] = len(target["samples"])
+                    target["samples"].append([labels, value])
+                elif family["type"] == "histogram":
+                    target["samples"][existing][1].merge(value)
+                else:
+                    target["samples"][existing][1] += value
+
+    for family in merged.values():
+        family.pop("_index", None)
+    return list(merged.values())
+
+
+def render(
+    families: List[Dict[str, Any]],
+    openmetrics: bool = True,
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> str:
+    """Render a snapshot in OpenMetrics or Prometheus text format.
+
+    Args:
+        families: Registry snapshot, possibly merged
+        openmetrics: Whether to emit OpenMetrics rather than text 0.0.4
+        buckets: Upper bounds used for histogram buckets
+
+    Returns:
+        Exposition text
+    """
+    lines: List[str] = []
+
+    for family in sorted(families, key=lambda f: f["name"]):
+        name = sanitize_name(family["name"])
+        metric_type = family["type"]
+        if metric_type == "counter" and name.endswith("_total"):
+            name = name[: -len("_total")]
+        sample_name = f"{name}_total" if metric_type == "counter" else name
+        header_name = name if openmetrics or metric_type != "counter" else sample_name
+
+        if family.get("help"):
+            help_text = family["help"].replace("\\", r"\\").replace("\n", r"\n")
+            lines.append(f"# HELP {header_name} {help_text}")
+        lines.append(f"# TYPE {header_name} {metric_type}")
+        if openmetrics and family.get("unit") and name.endswith(f"_{family['unit']}"):
+            lines.append(f"# UNIT {header_name} {family['unit']}")
+
+        for labels, value in family["samples"]:
+            if metric_type == "histogram":
+                histogram = value if isinstance(value, Histogram) else _histogram_from_sample(value)
+                for bound, count in histogram.buckets(buckets):
+                    bucket_labels = list(labels) + [("le", _format_value(bound))]
+                    lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {count}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+            else:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Renders a registry for scraping, across worker processes if configured.
+
+    With a ``multiprocess_dir`` every worker periodically writes its snapshot
+    to ``metrics-<pid>.json`` in that directory and any worker serving a
+    scrape merges all files. Snapshots of exited workers are folded into
+    ``metrics-aggregate.json`` and deleted, so the directory does not grow
+    with every worker restart. Rendered payloads are cached for
+    ``cache_ttl`` seconds so concurrent scrapers share one render.
+    """
+
+    AGGREGATE_FILE = "metrics-aggregate.json"
+    LOCK_FILE = "metrics.lock"
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        multiprocess_dir: Optional[str] = None,
+        cache_ttl: float = 1.0,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize exporter.
+
+        Args:
+            registry: Registry to export, the global one by default
+            multiprocess_dir: Shared directory for worker snapshots
+            cache_ttl: Seconds a rendered payload is reused
+            buckets: Histogram bucket upper bounds
+        """
+        self.registry = registry if registry is not None else metrics_registry
+        self.multiprocess_dir = multiprocess_dir or os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+        self.cache_ttl = cache_ttl
+        self.buckets = tuple(buckets)
+        self._cache: Dict[bool, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+        self._writer_task: Optional[asyncio.Task] = None
+
+        if self.multiprocess_dir:
+            os.makedirs(self.multiprocess_dir, exist_ok=True)
+
+    @property
+    def snapshot_path(self) -> Optional[str]:
+        if not self.multiprocess_dir:
+            return None
+        return os.path.join(self.multiprocess_dir, f"metrics-{os.getpid()}.json")
+
+    def write_snapshot(self):
+        """Write this process's snapshot to the shared directory."""
+        path = self.snapshot_path
+        if path is None:
+            return
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot_registry(self.registry), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _process_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    def _read_snapshot(path: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable metrics snapshot {path}: {e}")
+            return None
+
+    def _collect(self) -> List[Dict[str, Any]]:
+        if not self.multiprocess_dir:
+            return snapshot_registry(self.registry)
+
+        own_pid = os.getpid()
+        snapshots = [(snapshot_registry(self.registry), True)]
+        dead_paths = []
+        for path in glob.glob(os.path.join(self.multiprocess_dir, "metrics-*.json")):
+            try:
+                pid = int(os.path.basename(path)[len("metrics-"):-len(".json")])
+            except ValueError:
+                continue
+            if pid == own_pid:
+                continue
+            if not self._process_alive(pid):
+                dead_paths.append(path)
+                continue
+            snapshot = self._read_snapshot(path)
+            if snapshot is not None:
+                snapshots.append((snapshot, True))
+
+        folded = False
+        if dead_paths:
+            try:
+                folded = self.fold_dead_snapshots(dead_paths)
+            except OSError as e:
+                logger.error(f"Failed to fold metrics snapshots of exited workers: {e}")
+        if not folded:
+            for path in dead_paths:
+                snapshot = self._read_snapshot(path)
+                if snapshot is not None:
+                    snapshots.append((snapshot, False))
+
+        aggregate = self._read_snapshot(os.path.join(self.multiprocess_dir, self.AGGREGATE_FILE))
+        if aggregate is not None:
+            snapshots.append((aggregate, False))
+
+        return merge_snapshots(snapshots)
+
+    def fold_dead_snapshots(self, paths: Sequence[str]) -> bool:
+        """Fold snapshots of exited workers into the aggregate file.
+
+        Counters and histograms are added to the aggregate, gauges are
+        dropped, and the folded snapshot files are deleted. Workers folding
+        at the same time are serialized by a lock file.
+
+        Args:
+            paths: Snapshot files of dead processes
+
+        Returns:
+            Whether the snapshots were folded; False where file locks are
+            unavailable, in which case they are merged as they are
+        """
+        if fcntl is None or not self.multiprocess_dir:
+            return False
+
+        aggregate_path = os.path.join(self.multiprocess_dir, self.AGGREGATE_FILE)
+        with open(os.path.join(self.multiprocess_dir, self.LOCK_FILE), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                snapshots = []
+                aggregate = self._read_snapshot(aggregate_path)
+                if aggregate is not None:
+                    snapshots.append((aggregate, False))
+                folded = []
+                for path in paths:
+                    # Another worker may have folded it already
+                    snapshot = self._read_snapshot(path)
+                    if snapshot is not None:
+                        snapshots.append((snapshot, False))
+                        folded.append(path)
+                if not folded:
+                    return True
+
+                merged = merge_snapshots(snapshots)
+                for family in merged:
+                    if family["type"] == "histogram":
+                        family["samples"] = [
+                            [labels, _sample_from_histogram(histogram)]
+                            for labels, histogram in family["samples"]
+                        ]
+                tmp_path = f"{aggregate_path}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(merged, f, separators=(",", ":"))
+                os.replace(tmp_path, aggregate_path)
+
+                for path in folded:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                logger.info(f"Folded {len(folded)} metrics snapshots of exited workers")
+                return True
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def render(self, openmetrics: bool = True) -> bytes:
+        """Render the current metrics, reusing a recent payload if possible.
+
+        Args:
+            openmetrics: Whether to emit OpenMetrics rather than text 0.0.4
+
+        Returns:
+            Encoded exposition payload
+        """
+        now = time.monotonic()
+        cached = self._cache.get(openmetrics)
+        if cached and now - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        with self._lock:
+            cached = self._cache.get(openmetrics)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+
+            payload = render(self._collect(), openmetrics, self.buckets).encode("utf-8")
+            self._cache[openmetrics] = (time.monotonic(), payload)
+            return payload
+
+    async def render_async(self, openmetrics: bool = True) -> bytes:
+        """Render off the event loop when a fresh payload has to be built."""
+        cached = self._cache.get(openmetrics)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.render, openmetrics)
+
+    async def start(self, interval: float = 5.0):
+        """Start writing snapshots periodically in multiprocess mode.
+
+        Args:
+            interval: Snapshot interval in seconds
+        """
+        if not self.multiprocess_dir or self._writer_task:
+            return
+        self._writer_task = asyncio.create_task(self._writer_loop(interval))
+        logger.info(f"Metrics snapshot writer started ({self.multiprocess_dir})")
+
+    async def stop(self):
+        """Stop the snapshot writer and flush a final snapshot."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        if self.multiprocess_dir:
+            try:
+                self.write_snapshot()
+            except OSError as e:
+                logger.error(f"Failed to write final metrics snapshot: {e}")
+
+    async def _writer_loop(self, interval: float):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self.write_snapshot)
+                await asyncio.sleep(interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error writing metrics snapshot: {e}")
+                await asyncio.sleep(interval)
+
+
+__all__ = [
+    "OPENMETRICS_CONTENT_TYPE",
+    "PROMETHEUS_CONTENT_TYPE",
+    "DEFAULT_BUCKETS",
+    "sanitize_name",
+    "snapshot_registry",
+    "merge_snapshots",
+    "render",
+    "MetricsExporter",
+]
@@ -0,0 +1,775 @@
+"""Shared in-process metrics core.
+
+This module provides fixed-memory metric primitives used by the
+performance monitors across the application:
+- Counters and gauges
+- Log-linear (HDR-style) histograms with O(1) record and O(buckets) percentiles
+- Time-bucketed ring buffers for recent history
+- A labelled metrics registry
+"""
+
+import math
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class MetricType(Enum):
+    """Types of metrics."""
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+    TIMER = "timer"
+
+
+def label_key(labels: Optional[Dict[str, str]] = None) -> LabelKey:
+    """Build a hashable, order-independent key from a label dict.
+
+    Args:
+        labels: Optional labels
+
+    Returns:
+        Sorted tuple of label pairs
+    """
+    if not labels:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+@dataclass
+class WindowPoint:
+    """Aggregate of all samples recorded in one time bucket."""
+    timestamp: float
+    count: int
+    sum: float
+    min: float
+    max: float
+    last: float
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class TimeWindow:
+    """Time-bucketed ring buffer of per-bucket aggregates.
+
+    Memory is fixed at ``slots`` buckets regardless of the record rate;
+    buckets older than ``resolution * slots`` seconds are overwritten.
+    """
+
+    __slots__ = ("resolution", "slots", "_starts", "_count", "_sum", "_min", "_max", "_last")
+
+    def __init__(self, resolution: float = 10.0, slots: int = 360):
+        """Initialize time window.
+
+        Args:
+            resolution: Bucket width in seconds
+            slots: Number of buckets kept
+        """
+        if resolution <= 0 or slots <= 0:
+            raise ValueError("resolution and slots must be positive")
+        self.resolution = float(resolution)
+        self.slots = int(slots)
+        self._starts: List[float] = [-1.0] * self.slots
+        self._count: List[int] = [0] * self.slots
+        self._sum: List[float] = [0.0] * self.slots
+        self._min: List[float] = [0.0] * self.slots
+        self._max: List[float] = [0.0] * self.slots
+        self._last: List[float] = [0.0] * self.slots
+
+    def record(self, value: float, timestamp: Optional[float] = None):
+        """Record a sample.
+
+        Args:
+            value: Sample value
+            timestamp: Sample time, defaults to now
+        """
+        ts = time.time() if timestamp is None else timestamp
+        bucket = math.floor(ts / self.resolution)
+        start = bucket * self.resolution
+        i = bucket % self.slots
+
+        if self._starts[i] != start:
+            if start < self._starts[i]:
+                # Older than the data currently held in this slot
+                return
+            self._starts[i] = start
+            self._count[i] = 1
+            self._sum[i] = value
+            self._min[i] = value
+            self._max[i] = value
+            self._last[i] = value
+            return
+
+        self._count[i] += 1
+        self._sum[i] += value
+        if value < self._min[i]:
+            self._min[i] = value
+        if value > self._max[i]:
+            self._max[i] = value
+        self._last[i] = value
+
+    def points(self, since: Optional[float] = None, now: Optional[float] = None) -> List[WindowPoint]:
+        """Get non-empty buckets in chronological order.
+
+        Args:
+            since: Optional timestamp filter (bucket granularity)
+            now: Reference time, defaults to now
+
+        Returns:
+            List of bucket aggregates
+        """
+        now = time.time() if now is None else now
+        horizon = now - self.resolution * self.slots
+        lower = horizon if since is None else max(horizon, since - self.resolution)
+
+        result = [
+            WindowPoint(
+                timestamp=self._starts[i],
+                count=self._count[i],
+                sum=self._sum[i],
+                min=self._min[i],
+                max=self._max[i],
+                last=self._last[i],
+            )
+            for i in range(self.slots)
+            if self._count[i] and self._starts[i] > lower
+        ]
+        result.sort(key=lambda p: p.timestamp)
+        return result
+
+    def summary(self, since: Optional[float] = None, now: Optional[float] = None) -> Optional[WindowPoint]:
+        """Merge buckets into a single aggregate.
+
+        Args:
+            since: Optional timestamp filter
+            now: Reference time, defaults to now
+
+        Returns:
+            Merged aggregate or None if the window is empty
+        """
+        points = self.points(since, now)
+        if not points:
+            return None
+        return WindowPoint(
+            timestamp=points[0].timestamp,
+            count=sum(p.count for p in points),
+            sum=sum(p.sum for p in points),
+            min=min(p.min for p in points),
+            max=max(p.max for p in points),
+            last=points[-1].last,
+        )
+
+    def reset(self):
+        """Drop all buckets."""
+        for i in range(self.slots):
+            self._starts[i] = -1.0
+            self._count[i] = 0
+
+
+class Counter:
+    """Monotonically increasing counter.
+
+    The attached window, if any, samples the running total so that rates can
+    be derived from the first and last value of a range.
+    """
+
+    __slots__ = ("value", "updated_at", "window")
+
+    def __init__(self, window: Optional[TimeWindow] = None):
+        self.value = 0.0
+        self.updated_at = 0.0
+        self.window = window
+
+    def inc(self, amount: float = 1.0):
+        """Increment the counter.
+
+        Args:
+            amount: Non-negative increment
+        """
+        if amount < 0:
+            raise ValueError("Counter increments must be non-negative")
+        self.value += amount
+        self.updated_at = time.time()
+        if self.window is not None:
+            self.window.record(self.value, self.updated_at)
+
+    def set_total(self, value: float, timestamp: Optional[float] = None):
+        """Set the counter from an externally maintained cumulative total.
+
+        A total lower than the current value is treated as a counter reset.
+
+        Args:
+            value: Cumulative total
+            timestamp: Optional sample time
+        """
+        self.value = value
+        self.updated_at = time.time() if timestamp is None else timestamp
+        if self.window is not None:
+            self.window.record(self.value, self.updated_at)
+
+    def reset(self):
+        self.value = 0.0
+        if self.window is not None:
+            self.window.reset()
+
+
+class Gauge:
+    """Point-in-time value."""
+
+    __slots__ = ("value", "updated_at", "window")
+
+    def __init__(self, window: Optional[TimeWindow] = None):
+        self.value = 0.0
+        self.updated_at = 0.0
+        self.window = window
+
+    def set(self, value: float, timestamp: Optional[float] = None):
+        """Set the gauge.
+
+        Args:
+            value: New value
+            timestamp: Optional sample time
+        """
+        self.value = value
+        self.updated_at = time.time() if timestamp is None else timestamp
+        if self.window is not None:
+            self.window.record(value, self.updated_at)
+
+    def inc(self, amount: float = 1.0):
+        self.set(self.value + amount)
+
+    def dec(self, amount: float = 1.0):
+        self.set(self.value - amount)
+
+    def reset(self):
+        self.value = 0.0
+        if self.window is not None:
+            self.window.reset()
+
+
+class Histogram:
+    """Log-linear bucketed histogram.
+
+    Each power of two between ``2**min_exponent`` and ``2**max_exponent`` is
+    split into ``sub_buckets`` linear buckets, which bounds the relative error
+    of any percentile to roughly ``1 / sub_buckets``. Values at or below zero
+    share a dedicated bucket. Exact count, sum, min and max are tracked
+    alongside the buckets.
+    """
+
+    __slots__ = (
+        "sub_buckets", "min_exponent", "max_exponent", "counts",
+        "count", "sum", "min", "max", "window",
+    )
+
+    def __init__(
+        self,
+        sub_buckets: int = 16,
+        min_exponent: int = -20,
+        max_exponent: int = 40,
+        window: Optional[TimeWindow] = None,
+    ):
+        """Initialize histogram.
+
+        Args:
+            sub_buckets: Linear buckets per power of two
+            min_exponent: Smallest tracked power of two (~1e-6 by default)
+            max_exponent: Largest tracked power of two (~1e12 by default)
+            window: Optional time window fed with every sample
+        """
+        if sub_buckets <= 0 or max_exponent <= min_exponent:
+            raise ValueError("Invalid histogram bucket layout")
+        self.sub_buckets = sub_buckets
+        self.min_exponent = min_exponent
+        self.max_exponent = max_exponent
+        # Slot 0 holds values <= 0 or below the tracked range
+        self.counts: List[int] = [0] * (1 + (max_exponent - min_exponent) * sub_buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.window = window
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _index(self, value: float) -> int:
+        if value <= 0:
+            return 0
+        mantissa, exponent = math.frexp(value)
+        if exponent <= self.min_exponent:
+            return 0
+        if exponent > self.max_exponent:
+            return (self.max_exponent - self.min_exponent) * self.sub_buckets
+        sub = int((mantissa - 0.5) * 2 * self.sub_buckets)
+        return 1 + (exponent - self.min_exponent - 1) * self.sub_buckets + sub
+
+    def _bucket_bounds(self, index: int) -> Tuple[float, float]:
+        if index == 0:
+            return 0.0, math.ldexp(0.5, self.min_exponent + 1)
+        exponent, sub = divmod(index - 1, self.sub_buckets)
+        exponent += self.min_exponent + 1
+        lower = math.ldexp(0.5 + sub / (2 * self.sub_buckets), exponent)
+        upper = math.ldexp(0.5 + (sub + 1) / (2 * self.sub_buckets), exponent)
+        return lower, upper
+
+    def _iter_counts(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over occupied buckets in ascending order."""
+        return ((index, c) for index, c in enumerate(self.counts) if c)
+
+    def record(self, value: float, timestamp: Optional[float] = None):
+        """Record a sample.
+
+        Args:
+            value: Sample value
+            timestamp: Optional sample time for the attached window
+        """
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if self.window is not None:
+            self.window.record(value, timestamp)
+
+    observe = record
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Estimate a percentile.
+
+        Args:
+            percentile: Percentile to calculate (0-100)
+
+        Returns:
+            Estimated value, 0.0 for an empty histogram
+        """
+        return self.percentiles([percentile])[0]
+
+    def percentiles(self, percentiles: Sequence[float]) -> List[float]:
+        """Estimate several percentiles in a single bucket scan.
+
+        Args:
+            percentiles: Percentiles to calculate (0-100)
+
+        Returns:
+            Estimated values in the order requested
+        """
+        if not self.count:
+            return [0.0 for _ in percentiles]
+
+        order = sorted(range(len(percentiles)), key=lambda i: percentiles[i])
+        results = [0.0] * len(percentiles)
+        targets = [
+            max(1, math.ceil(self.count * min(max(percentiles[i], 0.0), 100.0) / 100.0))
+            for i in order
+        ]
+
+        seen = 0
+        t = 0
+        for index, bucket_count in self._iter_counts():
+            seen += bucket_count
+            while t < len(targets) and seen >= targets[t]:
+                lower, upper = self._bucket_bounds(index)
+                estimate = (lower + upper) / 2 if index else self.min
+                results[order[t]] = min(max(estimate, self.min), self.max)
+                t += 1
+            if t == len(targets):
+                break
+
+        return results
+
+    def buckets(self, bounds: Sequence[float]) -> List[Tuple[float, int]]:
+        """Get cumulative counts for a coarser set of upper bounds.
+
+        Args:
+            bounds: Ascending upper bounds
+
+        Returns:
+            List of (upper bound, cumulative count), ending with +Inf
+        """
+        result = []
+        cumulative = 0
+        occupied = list(self._iter_counts())
+        position = 0
+        for bound in bounds:
+            while position < len(occupied) and self._bucket_bounds(occupied[position][0])[1] <= bound:
+                cumulative += occupied[position][1]
+                position += 1
+            result.append((bound, cumulative))
+        result.append((math.inf, self.count))
+        return result
+
+    def merge(self, other: "Histogram"):
+        """Merge another histogram with the same layout into this one.
+
+        Args:
+            other: Histogram to merge
+        """
+        if (other.sub_buckets, other.min_exponent, other.max_exponent) != (
+            self.sub_buckets, self.min_exponent, self.max_exponent
+        ):
+            raise ValueError("Cannot merge histograms with different layouts")
+        for i, c in other._iter_counts():
+            self.counts[i] += c
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def snapshot(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, float]:
+        """Get summary statistics.
+
+        Args:
+            percentiles: Percentiles to include
+
+        Returns:
+            Dictionary with count, sum, min, max, avg and pNN keys
+        """
+        if not self.count:
+            data = {"count": 0, "sum": 0.0, "min": 0.0, "max": 0.0, "avg": 0.0}
+        else:
+            data = {
+                "count": self.count,
+                "sum": self.sum,
+                "min": self.min,
+                "max": self.max,
+                "avg": self.mean,
+            }
+        for p, v in zip(percentiles, self.percentiles(percentiles)):
+            data[f"p{p:g}"] = v
+        return data
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        if self.window is not None:
+            self.window.reset()
+
+
+class SparseHistogram(Histogram):
+    """Log-linear histogram that only stores occupied buckets.
+
+    Same layout and error bounds as Histogram, but memory grows with the
+    number of distinct buckets hit instead of the tracked range. Suited to
+    the many small histograms of time-partitioned summaries.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        sub_buckets: int = 16,
+        min_exponent: int = -20,
+        max_exponent: int = 40,
+    ):
+        """Initialize sparse histogram.
+
+        Args:
+            sub_buckets: Linear buckets per power of two
+            min_exponent: Smallest tracked power of two
+            max_exponent: Largest tracked power of two
+        """
+        if sub_buckets <= 0 or max_exponent <= min_exponent:
+            raise ValueError("Invalid histogram bucket layout")
+        self.sub_buckets = sub_buckets
+        self.min_exponent = min_exponent
+        self.max_exponent = max_exponent
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.window = None
+
+    def _iter_counts(self) -> Iterator[Tuple[int, int]]:
+        return iter(sorted(self.counts.items()))
+
+    def record(self, value: float, timestamp: Optional[float] = None):
+        """Record a sample.
+
+        Args:
+            value: Sample value
+            timestamp: Ignored, sparse histograms have no window
+        """
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    observe = record
+
+    def merge(self, other: Histogram):
+        """Merge another histogram with the same layout into this one.
+
+        Args:
+            other: Dense or sparse histogram to merge
+        """
+        if (other.sub_buckets, other.min_exponent, other.max_exponent) != (
+            self.sub_buckets, self.min_exponent, self.max_exponent
+        ):
+            raise ValueError("Cannot merge histograms with different layouts")
+        counts = self.counts
+        for i, c in other._iter_counts():
+            counts[i] = counts.get(i, 0) + c
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self):
+        self.counts.clear()
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+
+class MetricFamily:
+    """A named metric with one child per distinct label set."""
+
+    def __init__(
+        self,
+        name: str,
+        metric_type: MetricType,
+        description: str = "",
+        unit: Optional[str] = None,
+        history_resolution: Optional[float] = None,
+        history_slots: int = 360,
+    ):
+        """Initialize metric family.
+
+        Args:
+            name: Metric name
+            metric_type: Metric type
+            description: Help text
+            unit: Optional unit
+            history_resolution: Bucket width of per-child time windows, or
+                None to keep no history
+            history_slots: Number of buckets in each time window
+        """
+        self.name = name
+        self.metric_type = metric_type
+        self.description = description
+        self.unit = unit
+        self.history_resolution = history_resolution
+        self.history_slots = history_slots
+        self._children: Dict[LabelKey, object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        window = (
+            TimeWindow(self.history_resolution, self.history_slots)
+            if self.history_resolution else None
+        )
+        if self.metric_type == MetricType.COUNTER:
+            return Counter(window)
+        if self.metric_type == MetricType.GAUGE:
+            return Gauge(window)
+        return Histogram(window=window)
+
+    def labels(self, labels: Optional[Dict[str, str]] = None):
+        """Get or create the child for a label set.
+
+        Args:
+            labels: Optional labels
+
+        Returns:
+            Counter, Gauge or Histogram
+        """
+        key = label_key(labels)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def children(self) -> List[Tuple[LabelKey, object]]:
+        """Get a snapshot of (label key, child) pairs."""
+        with self._lock:
+            return list(self._children.items())
+
+    def merged_histogram(self) -> Histogram:
+        """Merge all histogram children regardless of labels."""
+        merged = Histogram()
+        for _, child in self.children():
+            if isinstance(child, Histogram):
+                merged.merge(child)
+        return merged
+
+    def clear(self):
+        with self._lock:
+            self._children.clear()
+
+
+@dataclass
+class StatsSource:
+    """An existing ``stats`` dict exposed through the registry.
+
+    The owning object is held weakly so registering a short-lived manager
+    does not keep it alive.
+    """
+    prefix: str
+    owner: "weakref.ref"
+    attribute: str
+    counters: Tuple[str, ...] = ()
+    labels: Optional[Dict[str, str]] = None
+    description: str = ""
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """Read the current stats dict, or None if the owner is gone."""
+        owner = self.owner()
+        if owner is None:
+            return None
+        stats = getattr(owner, self.attribute, None)
+        return stats() if callable(stats) else stats
+
+
+class MetricsRegistry:
+    """Registry of metric families keyed by name."""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._stats_sources: List[StatsSource] = []
+        self._lock = threading.Lock()
+
+    def _family(self, name: str, metric_type: MetricType, **kwargs) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            with self._lock:
+                family = self._families.get(name)
+                if family is None:
+                    family = MetricFamily(name, metric_type, **kwargs)
+                    self._families[name] = family
+        if family.metric_type != metric_type and {family.metric_type, metric_type} != {
+            MetricType.HISTOGRAM, MetricType.TIMER
+        }:
+            raise ValueError(
+                f"Metric {name} already registered as {family.metric_type.value}"
+            )
+        return family
+
+    def counter(self, name: str, description: str = "", unit: Optional[str] = None, **kwargs) -> MetricFamily:
+        """Get or create a counter family."""
+        return self._family(name, MetricType.COUNTER, description=description, unit=unit, **kwargs)
+
+    def gauge(self, name: str, description: str = "", unit: Optional[str] = None, **kwargs) -> MetricFamily:
+        """Get or create a gauge family."""
+        return self._family(name, MetricType.GAUGE, description=description, unit=unit, **kwargs)
+
+    def histogram(self, name: str, description: str = "", unit: Optional[str] = None, **kwargs) -> MetricFamily:
+        """Get or create a histogram family."""
+        return self._family(name, MetricType.HISTOGRAM, description=description, unit=unit, **kwargs)
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        """Get a family by name."""
+        return self._families.get(name)
+
+    def families(self) -> Iterator[MetricFamily]:
+        """Iterate over registered families."""
+        with self._lock:
+            families = list(self._families.values())
+        return iter(families)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._families
+
+    def __len__(self) -> int:
+        return len(self._families)
+
+    def register_stats(
+        self,
+        prefix: str,
+        owner: Any,
+        attribute: str = "stats",
+        counters: Iterable[str] = (),
+        labels: Optional[Dict[str, str]] = None,
+        description: str = "",
+    ):
+        """Expose an object's ad-hoc stats dict at collection time.
+
+        Numeric entries are published as ``<prefix>_<key>``; keys listed in
+        ``counters`` are typed as counters, everything else as gauges.
+        Non-numeric entries are ignored. Nothing is recorded on the owner's
+        hot path.
+
+        Args:
+            prefix: Metric name prefix
+            owner: Object holding the stats
+            attribute: Attribute name of the stats dict, or of a no-argument
+                method returning one
+            counters: Keys that are monotonically increasing totals
+            labels: Optional labels added to every sample
+            description: Help text
+        """
+        source = StatsSource(
+            prefix=prefix,
+            owner=weakref.ref(owner),
+            attribute=attribute,
+            counters=tuple(counters),
+            labels=labels,
+            description=description,
+        )
+        with self._lock:
+            self._stats_sources = [s for s in self._stats_sources if s.owner() is not None]
+            self._stats_sources.append(source)
+
+    def stats_sources(self) -> List[StatsSource]:
+        """Get registered stats sources whose owners are still alive."""
+        with self._lock:
+            return [s for s in self._stats_sources if s.owner() is not None]
+
+    def unregister(self, name: str):
+        """Remove a family."""
+        with self._lock:
+            self._families.pop(name, None)
+
+    def clear(self):
+        """Remove all families and stats sources."""
+        with self._lock:
+            self._families.clear()
+            self._stats_sources.clear()
+
+
+# Global metrics registry
+metrics_registry = MetricsRegistry()
+
+
+__all__ = [
+    "MetricType",
+    "LabelKey",
+    "label_key",
+    "WindowPoint",
+    "TimeWindow",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "SparseHistogram",
+    "MetricFamily",
+    "StatsSource",
+    "MetricsRegistry",
+    "metrics_registry",
+]
@@ -0,0 +1,248 @@
+"""Packed archive segments.
+
+Many small files are costly to store one object each. This module streams
+them into large tar or zip segments instead. Entries are stored
+uncompressed and an offset index records where the content of each entry
+starts, so a single file can be read back with one range read of its
+segment. Segments stay readable with the standard tar and zip tools.
+"""
+
+import hashlib
+import io
+import struct
+import tarfile
+import tempfile
+import time
+import zipfile
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+
+__all__ = [
+    "DEFAULT_SEGMENT_SIZE",
+    "PACK_FORMATS",
+    "PackedEntry",
+    "SegmentWriter",
+    "pack_segments",
+    "read_packed_entry",
+]
+
+# Segment formats and their content types
+PACK_FORMATS: Dict[str, str] = {
+    "tar": "application/x-tar",
+    "zip": "application/zip",
+}
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+_CHUNK_SIZE = 1024 * 1024
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+PackSource = Union[bytes, BinaryIO]
+
+
+class PackedEntry(NamedTuple):
+    """Location of a file inside a packed segment."""
+    name: str
+    segment: int
+    offset: int
+    size: int
+    checksum: str
+
+
+class _HashingReader:
+    """File object wrapper hashing everything read through it."""
+
+    def __init__(self, source: BinaryIO):
+        self._source = source
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._source.read(size)
+        self.digest.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+
+class SegmentWriter:
+    """Writes one tar or zip segment to a spooled temporary file."""
+
+    def __init__(self, format: str = "tar", max_memory: int = _SPOOL_MAX_MEMORY):
+        """Initialize segment writer.
+
+        Args:
+            format: Segment format ("tar" or "zip")
+            max_memory: Segment size above which the spool moves to disk
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if format not in PACK_FORMATS:
+            raise ValueError(f"Unsupported pack format: {format}")
+
+        self.format = format
+        self.count = 0
+        self.file = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        if format == "tar":
+            self._archive = tarfile.open(fileobj=self.file, mode="w", format=tarfile.PAX_FORMAT)
+        else:
+            self._archive = zipfile.ZipFile(self.file, "w", zipfile.ZIP_STORED, allowZip64=True)
+        self._finished = False
+        self._length = 0
+
+    @property
+    def size(self) -> int:
+        """Bytes written to the segment so far, or its length once finished."""
+        return self._length if self._finished else self.file.tell()
+
+    @property
+    def content_type(self) -> str:
+        """Content type of the segment."""
+        return PACK_FORMATS[self.format]
+
+    def add(self, name: str, data: PackSource, size: Optional[int] = None) -> Tuple[int, int, str]:
+        """Append an entry to the segment.
+
+        File objects are copied in blocks and never held in memory whole.
+
+        Args:
+            name: Entry name
+            data: Entry content as bytes or a readable file object
+            size: Content size; required for unseekable tar sources
+
+        Returns:
+            (offset of the content in the segment, content size, SHA-256 checksum)
+
+        Raises:
+            ValueError: If the content is shorter than its size
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            size = len(data)
+            data = io.BytesIO(data)
+        source = _HashingReader(data)
+
+        if self.format == "tar":
+            if size is None:
+                position = data.tell()
+                size = data.seek(0, io.SEEK_END) - position
+                data.seek(position)
+            info = tarfile.TarInfo(name)
+            info.size = size
+            info.mtime = int(time.time())
+            try:
+                self._archive.addfile(info, source)
+            except OSError as e:
+                raise ValueError(f"Content of {name} ended early: {e}")
+            # The archive offset sits after the content and its block padding
+            blocks = -(-size // tarfile.BLOCKSIZE)
+            offset = self._archive.offset - blocks * tarfile.BLOCKSIZE
+        else:
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            with self._archive.open(info, "w", force_zip64=True) as entry:
+                while True:
+                    chunk = source.read(_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    entry.write(chunk)
+            if size is not None and source.size != size:
+                raise ValueError(f"Content of {name} is {source.size} bytes, expected {size}")
+            size = source.size
+            offset = self._zip_data_offset(info.header_offset)
+
+        self.count += 1
+        return offset, size, source.digest.hexdigest()
+
+    def finish(self) -> BinaryIO:
+        """Write the archive trailer.
+
+        Returns:
+            The segment file, rewound to its start
+        """
+        if not self._finished:
+            self._archive.close()
+            self._length = self.file.tell()
+            self._finished = True
+        self.file.seek(0)
+        return self.file
+
+    def close(self) -> None:
+        """Discard the segment file."""
+        if not self._finished:
+            self._finished = True
+            try:
+                self._archive.close()
+            except Exception:
+                pass
+            self._length = 0
+        self.file.close()
+
+    def _zip_data_offset(self, header_offset: int) -> int:
+        # The local header carries the name and extra field lengths
+        end = self.file.tell()
+        self.file.seek(header_offset)
+        header = _ZIP_LOCAL_HEADER.unpack(self.file.read(_ZIP_LOCAL_HEADER.size))
+        self.file.seek(end)
+        name_length, extra_length = header[-2], header[-1]
+        return header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length
+
+
+def pack_segments(
+    entries: Iterable[Tuple[str, PackSource]],
+    write_segment: Callable[[int, SegmentWriter], None],
+    format: str = "tar",
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+) -> Iterator[PackedEntry]:
+    """Stream entries into segments of about a target size.
+
+    A segment is closed once it reaches ``segment_size`` and handed to
+    ``write_segment``, so only one segment is spooled at a time. Entries are
+    yielded as they are packed; their segment is written no later than the
+    next segment is started.
+
+    Args:
+        entries: (name, content) pairs
+        write_segment: Called with the segment number and the finished writer
+        format: Segment format ("tar" or "zip")
+        segment_size: Target segment size in bytes
+
+    Yields:
+        Location of each entry
+    """
+    number = 0
+    writer: Optional[SegmentWriter] = None
+    try:
+        for name, data in entries:
+            if writer is None:
+                writer = SegmentWriter(format)
+            offset, size, checksum = writer.add(name, data)
+            yield PackedEntry(name, number, offset, size, checksum)
+
+            if writer.size >= segment_size:
+                writer.finish()
+                write_segment(number, writer)
+                writer.close()
+                writer = None
+                number += 1
+
+        if writer is not None:
+            writer.finish()
+            write_segment(number, writer)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def read_packed_entry(segment: BinaryIO, entry: PackedEntry) -> bytes:
+    """Read the content of an entry from a seekable segment.
+
+    Args:
+        segment: Segment file
+        entry: Location of the entry
+
+    Returns:
+        Entry content
+    """
+    segment.seek(entry.offset)
+    return segment.read(entry.size)
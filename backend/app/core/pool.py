@@ -0,0 +1,718 @@
+"""Asyncio-native pooling of real resources.
+
+This module provides ResourcePool, the single pooling primitive shared by
+database sessions, Redis clients and HTTP clients:
+- FIFO-fair waiting with direct hand-off of released resources
+- Rate-limited health checks on checkout
+- Max-lifetime and idle-timeout recycling
+- Wait-time histograms and pool stats in the shared metrics registry
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+from app.core.metrics import MetricsRegistry, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+class PoolError(Exception):
+    """Base exception for resource pool errors."""
+    pass
+
+
+class PoolTimeoutError(PoolError, TimeoutError):
+    """Raised when a resource cannot be acquired within the timeout."""
+    pass
+
+
+class PoolClosedError(PoolError):
+    """Raised when acquiring from a closed pool."""
+    pass
+
+
+async def _maybe_await(value: Any) -> Any:
+    """Await a value if it is awaitable, so hooks may be sync or async."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+@dataclass
+class PooledResource:
+    """A pooled resource together with its lifecycle bookkeeping."""
+
+    resource: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    last_checked_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
+class ResourcePool:
+    """Bounded pool of real resources with fair asynchronous checkout.
+
+    Released resources are handed directly to the longest-waiting caller, so
+    a burst of new callers cannot starve earlier ones. When a resource is
+    discarded while callers wait, its slot is handed over instead and the
+    waiter creates a fresh resource.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        close: Optional[Callable[[Any], Any]] = None,
+        reset: Optional[Callable[[Any], Any]] = None,
+        health_check: Optional[Callable[[Any], Any]] = None,
+        max_size: int = 10,
+        min_size: int = 0,
+        acquire_timeout: float = 30.0,
+        max_lifetime: Optional[float] = 3600.0,
+        idle_timeout: Optional[float] = 300.0,
+        health_check_interval: float = 30.0,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        """Initialize resource pool.
+
+        Args:
+            name: Pool name, used as the metrics label
+            factory: Creates a resource (sync or async)
+            close: Closes a resource (sync or async, optional)
+            reset: Resets a resource before it is reused (optional)
+            health_check: Returns False or raises if a resource is unusable (optional)
+            max_size: Maximum number of resources
+            min_size: Number of resources created by prefill()
+            acquire_timeout: Default acquisition timeout in seconds
+            max_lifetime: Age after which resources are recycled (None disables)
+            idle_timeout: Idle time after which resources are recycled (None disables)
+            health_check_interval: Minimum seconds between checks of one resource
+            registry: Metrics registry (defaults to the shared registry)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.name = name
+        self.factory = factory
+        self.close_resource = close
+        self.reset_resource = reset
+        self.health_check = health_check
+        self.max_size = max_size
+        self.min_size = min(min_size, max_size)
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle: Deque[PooledResource] = deque()
+        self._in_use: Dict[int, PooledResource] = {}
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._size = 0
+        self._closed = False
+
+        self.stats = {
+            "acquired": 0,
+            "released": 0,
+            "created": 0,
+            "closed": 0,
+            "recycled": 0,
+            "health_check_failures": 0,
+            "timeouts": 0,
+            "waited": 0,
+            "peak_in_use": 0,
+            "peak_waiters": 0,
+            "size": 0,
+            "idle": 0,
+            "in_use": 0,
+            "waiters": 0,
+        }
+
+        registry = registry if registry is not None else metrics_registry
+        self._wait_time = registry.histogram(
+            "resource_pool_wait_seconds",
+            "Time spent waiting to acquire a pooled resource",
+            unit="seconds",
+        ).labels({"pool": name})
+        registry.register_stats(
+            "resource_pool",
+            self,
+            "stats",
+            counters=(
+                "acquired", "released", "created", "closed", "recycled",
+                "health_check_failures", "timeouts", "waited",
+            ),
+            labels={"pool": name},
+        )
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool has been closed."""
+        return self._closed
+
+    def _refresh_gauges(self):
+        self.stats["size"] = self._size
+        self.stats["idle"] = len(self._idle)
+        self.stats["in_use"] = len(self._in_use)
+        self.stats["waiters"] = len(self._waiters)
+        self.stats["peak_in_use"] = max(self.stats["peak_in_use"], len(self._in_use))
+        self.stats["peak_waiters"] = max(self.stats["peak_waiters"], len(self._waiters))
+
+    def _is_expired(self, entry: PooledResource, now: float) -> bool:
+        if self.max_lifetime is not None and now - entry.created_at >= self.max_lifetime:
+            return True
+        if self.idle_timeout is not None and now - entry.last_used_at >= self.idle_timeout:
+            return True
+        return False
+
+    async def _create(self) -> PooledResource:
+        """Create a resource for a slot already counted in _size."""
+        try:
+            resource = await _maybe_await(self.factory())
+        except BaseException:
+            self._size -= 1
+            self._wake_for_slot()
+            raise
+        self.stats["created"] += 1
+        return PooledResource(resource=resource)
+
+    async def _destroy(self, entry: PooledResource):
+        """Close a resource whose slot has already been released."""
+        self.stats["closed"] += 1
+        if self.close_resource is None:
+            return
+        try:
+            await _maybe_await(self.close_resource(entry.resource))
+        except Exception as e:
+            logger.warning(f"Error closing resource in pool {self.name}: {e}")
+
+    async def _is_healthy(self, entry: PooledResource, now: float) -> bool:
+        if self.health_check is None or now - entry.last_checked_at < self.health_check_interval:
+            return True
+        entry.last_checked_at = now
+        try:
+            healthy = await _maybe_await(self.health_check(entry.resource))
+        except Exception as e:
+            logger.debug(f"Health check failed in pool {self.name}: {e}")
+            healthy = False
+        if healthy is False:
+            self.stats["health_check_failures"] += 1
+            return False
+        return True
+
+    def _wake_for_slot(self):
+        """Hand a free slot to the oldest waiter, if any."""
+        while self._waiters and self._size < self.max_size:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._size += 1
+                waiter.set_result(None)
+                return
+
+    def _checkout(self, entry: PooledResource, started: float) -> Any:
+        now = time.monotonic()
+        entry.uses += 1
+        entry.last_used_at = now
+        self._in_use[id(entry.resource)] = entry
+        self.stats["acquired"] += 1
+        self._wait_time.record(now - started)
+        self._refresh_gauges()
+        return entry.resource
+
+    async def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Acquire a resource from the pool.
+
+        Args:
+            timeout: Acquisition timeout (uses the pool default if None)
+
+        Returns:
+            Acquired resource
+
+        Raises:
+            PoolTimeoutError: If no resource becomes available in time
+            PoolClosedError: If the pool is closed
+        """
+        started = time.monotonic()
+        timeout = self.acquire_timeout if timeout is None else timeout
+
+        while True:
+            if self._closed:
+                raise PoolClosedError(f"Resource pool {self.name} is closed")
+
+            # Idle resources are only taken when nobody is queued ahead
+            while self._idle and not self._waiters:
+                entry = self._idle.pop()
+                now = time.monotonic()
+                if self._is_expired(entry, now):
+                    self.stats["recycled"] += 1
+                elif await self._is_healthy(entry, now):
+                    return self._checkout(entry, started)
+                self._size -= 1
+                await self._destroy(entry)
+
+            if self._size < self.max_size and not self._waiters:
+                self._size += 1
+                self._refresh_gauges()
+                return self._checkout(await self._create(), started)
+
+            remaining = timeout - (time.monotonic() - started)
+            if remaining <= 0:
+                self.stats["timeouts"] += 1
+                raise PoolTimeoutError(
+                    f"Failed to acquire resource from pool {self.name} within {timeout}s"
+                )
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self.stats["waited"] += 1
+            self._refresh_gauges()
+            try:
+                entry = await asyncio.wait_for(asyncio.shield(waiter), remaining)
+            except asyncio.TimeoutError:
+                if waiter.done() and not waiter.cancelled():
+                    # Handed off just as the timeout fired; keep what we got
+                    # (re-raises PoolClosedError if the pool was closed)
+                    entry = waiter.result()
+                else:
+                    waiter.cancel()
+                    self._discard_waiter(waiter)
+                    self.stats["timeouts"] += 1
+                    raise PoolTimeoutError(
+                        f"Failed to acquire resource from pool {self.name} within {timeout}s"
+                    )
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                    self._return_handoff(waiter.result())
+                else:
+                    waiter.cancel()
+                    self._discard_waiter(waiter)
+                raise
+
+            if entry is None:
+                # A slot was handed over; create a resource for it
+                return self._checkout(await self._create(), started)
+            return self._checkout(entry, started)
+
+    def _discard_waiter(self, waiter: asyncio.Future):
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        self._refresh_gauges()
+
+    def _return_handoff(self, entry: Optional[PooledResource]):
+        """Give back a hand-off received by a caller that was cancelled."""
+        if entry is None:
+            self._size -= 1
+            self._wake_for_slot()
+        elif not self._handoff(entry):
+            self._idle.append(entry)
+        self._refresh_gauges()
+
+    def _handoff(self, entry: PooledResource) -> bool:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(entry)
+                return True
+        return False
+
+    async def release(self, resource: Any, discard: bool = False):
+        """Return a resource to the pool.
+
+        Args:
+            resource: Resource previously returned by acquire()
+            discard: Close the resource instead of reusing it
+        """
+        entry = self._in_use.pop(id(resource), None)
+        if entry is None:
+            logger.warning(f"Releasing resource not acquired from pool {self.name}")
+            return
+
+        self.stats["released"] += 1
+
+        if not discard and self.reset_resource is not None:
+            try:
+                await _maybe_await(self.reset_resource(resource))
+            except Exception as e:
+                logger.warning(f"Error resetting resource in pool {self.name}: {e}")
+                discard = True
+
+        now = time.monotonic()
+        if (
+            not discard
+            and self.max_lifetime is not None
+            and now - entry.created_at >= self.max_lifetime
+        ):
+            self.stats["recycled"] += 1
+            discard = True
+
+        if discard or self._closed or self._size > self.max_size:
+            self._size -= 1
+            if not self._closed:
+                self._wake_for_slot()
+            self._refresh_gauges()
+            await self._destroy(entry)
+            return
+
+        entry.last_used_at = now
+        if not self._handoff(entry):
+            self._idle.append(entry)
+        self._refresh_gauges()
+
+    @asynccontextmanager
+    async def lease(self, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """Acquire a resource for the duration of a block.
+
+        The resource is discarded rather than reused if the block raises.
+
+        Args:
+            timeout: Acquisition timeout (uses the pool default if None)
+
+        Yields:
+            Acquired resource
+        """
+        resource = await self.acquire(timeout)
+        try:
+            yield resource
+        except BaseException:
+            await self.release(resource, discard=True)
+            raise
+        else:
+            await self.release(resource)
+
+    async def prefill(self):
+        """Create resources up to min_size."""
+        while not self._closed and self._size < self.min_size:
+            self._size += 1
+            entry = await self._create()
+            if not self._handoff(entry):
+                self._idle.append(entry)
+        self._refresh_gauges()
+
+    def resize(self, max_size: int):
+        """Change the maximum pool size.
+
+        Growing hands new slots to waiting callers immediately; shrinking
+        closes surplus resources as they are released.
+
+        Args:
+            max_size: New maximum number of resources
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.min_size = min(self.min_size, max_size)
+        while self._size < self.max_size and self._waiters:
+            before = self._size
+            self._wake_for_slot()
+            if self._size == before:
+                break
+        self._refresh_gauges()
+
+    async def prune(self) -> int:
+        """Close idle resources that are expired or beyond min_size.
+
+        Returns:
+            Number of resources closed
+        """
+        now = time.monotonic()
+        keep: Deque[PooledResource] = deque()
+        expired: List[PooledResource] = []
+        for entry in self._idle:
+            if self._is_expired(entry, now):
+                expired.append(entry)
+            else:
+                keep.append(entry)
+        self._idle = keep
+
+        for entry in expired:
+            self._size -= 1
+            self.stats["recycled"] += 1
+            await self._destroy(entry)
+
+        self._refresh_gauges()
+        return len(expired)
+
+    def wait_time_summary(self) -> Dict[str, float]:
+        """Get the acquisition wait-time distribution.
+
+        Returns:
+            Histogram snapshot (count, avg, p50, p95, p99, ...)
+        """
+        return self._wait_time.snapshot()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary containing statistics
+        """
+        self._refresh_gauges()
+        return {
+            "name": self.name,
+            "max_size": self.max_size,
+            "min_size": self.min_size,
+            **self.stats,
+            "utilization": len(self._in_use) / self.max_size * 100,
+            "wait_time": self.wait_time_summary(),
+        }
+
+    async def close(self):
+        """Close the pool and every idle resource.
+
+        Resources still in use are closed when they are released.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(PoolClosedError(f"Resource pool {self.name} is closed"))
+
+        while self._idle:
+            entry = self._idle.popleft()
+            self._size -= 1
+            await self._destroy(entry)
+
+        self._refresh_gauges()
+        logger.info(f"Closed resource pool: {self.name}")
+
+
+class PoolRegistry:
+    """Process-wide registry of named resource pools."""
+
+    def __init__(self):
+        """Initialize pool registry."""
+        self._pools: Dict[str, ResourcePool] = {}
+
+    def register(self, pool: ResourcePool, name: Optional[str] = None) -> ResourcePool:
+        """Register a pool.
+
+        Args:
+            pool: ResourcePool instance
+            name: Registry name (defaults to the pool name)
+
+        Returns:
+            The registered pool
+        """
+        name = name or pool.name
+        self._pools[name] = pool
+        logger.info(f"Registered resource pool: {name}")
+        return pool
+
+    def get(self, name: str) -> Optional[ResourcePool]:
+        """Get a pool by name.
+
+        Args:
+            name: Pool name
+
+        Returns:
+            ResourcePool instance or None
+        """
+        return self._pools.get(name)
+
+    def get_or_create(self, name: str, builder: Callable[[], ResourcePool]) -> ResourcePool:
+        """Get a pool by name, registering one built on first use.
+
+        Args:
+            name: Pool name
+            builder: Creates the pool when none is registered
+
+        Returns:
+            ResourcePool instance
+        """
+        pool = self._pools.get(name)
+        if pool is None or pool.closed:
+            pool = self.register(builder(), name)
+        return pool
+
+    def pools(self) -> List[ResourcePool]:
+        """List registered pools."""
+        return list(self._pools.values())
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for every registered pool."""
+        return {name: pool.get_stats() for name, pool in self._pools.items()}
+
+    async def prune_all(self) -> int:
+        """Prune idle resources in every pool.
+
+        Returns:
+            Number of resources closed
+        """
+        closed = 0
+        for pool in self.pools():
+            closed += await pool.prune()
+        return closed
+
+    async def close_all(self):
+        """Close and forget every registered pool."""
+        for pool in self.pools():
+            await pool.close()
+        self._pools.clear()
+
+
+class DatabaseSessionPool(ResourcePool):
+    """Pool of async SQLAlchemy sessions.
+
+    Released sessions are rolled back and emptied, which returns their
+    connection to the engine pool, and stay open for the next caller; they
+    are only closed when recycled. A SELECT 1 health check runs at most
+    once per interval.
+    """
+
+    def __init__(
+        self,
+        name: str = "database_sessions",
+        session_factory: Optional[Callable[[], Any]] = None,
+        **kwargs,
+    ):
+        """Initialize database session pool.
+
+        Args:
+            name: Pool name
+            session_factory: Session factory (defaults to app.core.database.SessionLocal)
+            **kwargs: ResourcePool options
+        """
+        self.session_factory = session_factory
+        super().__init__(
+            name,
+            self._create_session,
+            close=self._close_session,
+            reset=self._reset_session,
+            health_check=self._check_session,
+            **kwargs,
+        )
+
+    def _create_session(self):
+        if self.session_factory is None:
+            from app.core.database import SessionLocal
+            self.session_factory = SessionLocal
+        return self.session_factory()
+
+    @staticmethod
+    async def _close_session(session):
+        await session.close()
+
+    @staticmethod
+    async def _reset_session(session):
+        await session.rollback()
+        session.expunge_all()
+
+    @staticmethod
+    async def _check_session(session) -> bool:
+        from sqlalchemy import text
+
+        await session.execute(text("SELECT 1"))
+        await session.rollback()
+        return True
+
+
+class RedisClientPool(ResourcePool):
+    """Pool of single-connection async Redis clients."""
+
+    def __init__(self, url: str, name: str = "redis_clients", **kwargs):
+        """Initialize Redis client pool.
+
+        Args:
+            url: Redis URL
+            name: Pool name
+            **kwargs: ResourcePool options
+        """
+        self.url = url
+        super().__init__(
+            name,
+            self._create_client,
+            close=self._close_client,
+            health_check=self._check_client,
+            **kwargs,
+        )
+
+    def _create_client(self):
+        import redis.asyncio as aioredis
+
+        return aioredis.Redis.from_url(self.url, single_connection_client=True)
+
+    @staticmethod
+    async def _close_client(client):
+        closer = getattr(client, "aclose", None) or client.close
+        await closer()
+
+    @staticmethod
+    async def _check_client(client) -> bool:
+        return bool(await client.ping())
+
+
+class HTTPClientPool(ResourcePool):
+    """Pool of httpx async clients for one upstream."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str = "",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+        **kwargs,
+    ):
+        """Initialize HTTP client pool.
+
+        Args:
+            name: Pool name
+            base_url: Base URL for requests
+            headers: Default request headers
+            timeout: Request timeout in seconds
+            **kwargs: ResourcePool options
+        """
+        self.base_url = base_url
+        self.headers = headers
+        self.timeout = timeout
+        super().__init__(
+            name,
+            self._create_client,
+            close=self._close_client,
+            health_check=self._check_client,
+            **kwargs,
+        )
+
+    def _create_client(self):
+        import httpx
+
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+
+    @staticmethod
+    async def _close_client(client):
+        await client.aclose()
+
+    @staticmethod
+    def _check_client(client) -> bool:
+        return not client.is_closed
+
+
+# Global pool registry instance
+pool_registry = PoolRegistry()
+
+
+__all__ = [
+    "PoolError",
+    "PoolTimeoutError",
+    "PoolClosedError",
+    "PooledResource",
+    "ResourcePool",
+    "PoolRegistry",
+    "pool_registry",
+    "DatabaseSessionPool",
+    "RedisClientPool",
+    "HTTPClientPool",
+]
@@ -0,0 +1,278 @@
+"""In-process full-text search.
+
+This module provides InvertedIndex, a thread-safe inverted index ranking
+documents with BM25, for databases without a full-text index of their
+own, and opaque search-after cursors shared by search backends.
+"""
+
+import base64
+import bisect
+import heapq
+import json
+import math
+import re
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+
+__all__ = [
+    "InvertedIndex",
+    "SearchHit",
+    "SearchResults",
+    "decode_cursor",
+    "encode_cursor",
+    "tokenize",
+]
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+FieldValue = Union[None, str, Iterable[str]]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order of appearance
+    """
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last returned row as an opaque cursor.
+
+    Args:
+        values: JSON-serializable values, datetimes included
+
+    Returns:
+        URL-safe cursor string
+    """
+    encoded = [{"dt": value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    payload = json.dumps(encoded, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        The encoded values
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+        if not isinstance(values, list):
+            raise ValueError("cursor is not a list")
+        return [
+            datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value
+            for value in values
+        ]
+    except (TypeError, KeyError, UnicodeDecodeError, json.JSONDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+class SearchHit(NamedTuple):
+    """A matching document and its relevance score."""
+    doc_id: str
+    score: float
+
+
+class SearchResults(NamedTuple):
+    """Ranked hits after a cursor, and the number of matches in total."""
+    hits: List[SearchHit]
+    total: int
+
+
+class InvertedIndex:
+    """Thread-safe inverted index ranked with BM25.
+
+    Documents are made of named fields, each counted with its own weight.
+    Query terms must all match; the last term also matches as a prefix, so
+    partially typed words find their completions.
+    """
+
+    def __init__(self, field_weights: Dict[str, float], k1: float = 1.2, b: float = 0.75):
+        """Initialize index.
+
+        Args:
+            field_weights: Weight of each indexed field
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.field_weights = field_weights
+        self.k1 = k1
+        self.b = b
+        # term -> document -> weighted term frequency
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+        self._sorted_terms: Optional[List[str]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_terms
+
+    def add(self, doc_id: str, fields: Dict[str, FieldValue]) -> None:
+        """Add a document, replacing any previous version of it.
+
+        Args:
+            doc_id: Document ID
+            fields: Field name to text or list of texts
+        """
+        terms: Counter = Counter()
+        for field, weight in self.field_weights.items():
+            value = fields.get(field)
+            if value is None:
+                continue
+            if isinstance(value, str):
+                value = [value]
+            for text in value:
+                for token in tokenize(str(text)):
+                    terms[token] += weight
+
+        with self._lock:
+            self._remove(doc_id)
+            if not terms:
+                return
+            for term, frequency in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._sorted_terms = None
+                postings[doc_id] = frequency
+            self._doc_terms[doc_id] = dict(terms)
+            length = sum(terms.values())
+            self._doc_lengths[doc_id] = length
+            self._total_length += length
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            True if the document was indexed
+        """
+        with self._lock:
+            return self._remove(doc_id)
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_lengths.clear()
+            self._total_length = 0.0
+            self._sorted_terms = None
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> SearchResults:
+        """Find documents matching every query term, best first.
+
+        Hits are ordered by descending score, then by document ID.
+
+        Args:
+            query: Query text
+            limit: Maximum number of hits (None for all)
+            after: (score, doc_id) of the last hit of the previous page
+
+        Returns:
+            Ranked hits after the cursor and the total number of matches
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return SearchResults([], 0)
+
+        with self._lock:
+            count = len(self._doc_lengths)
+            if not count:
+                return SearchResults([], 0)
+            average_length = self._total_length / count
+
+            scores: Optional[Dict[str, float]] = None
+            for position, token in enumerate(tokens):
+                if position == len(tokens) - 1:
+                    terms = self._expand_prefix(token)
+                else:
+                    terms = [token] if token in self._postings else []
+
+                term_scores: Dict[str, float] = {}
+                for term in terms:
+                    postings = self._postings[term]
+                    idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for doc_id, frequency in postings.items():
+                        if scores is not None and doc_id not in scores:
+                            continue
+                        norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / average_length)
+                        score = idf * frequency * (self.k1 + 1) / (frequency + norm)
+                        # A document matching several completions counts its best one
+                        term_scores[doc_id] = max(term_scores.get(doc_id, 0.0), score)
+
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {doc_id: scores[doc_id] + score for doc_id, score in term_scores.items()}
+                if not scores:
+                    return SearchResults([], 0)
+
+        total = len(scores)
+        candidates: Iterable[Tuple[str, float]] = scores.items()
+        if after is not None:
+            after_key = (-after[0], after[1])
+            candidates = ((doc_id, score) for doc_id, score in candidates if (-score, doc_id) > after_key)
+
+        def key(item: Tuple[str, float]) -> Tuple[float, str]:
+            return -item[1], item[0]
+
+        if limit is None:
+            ranked = sorted(candidates, key=key)
+        else:
+            ranked = heapq.nsmallest(limit, candidates, key=key)
+        return SearchResults([SearchHit(doc_id, score) for doc_id, score in ranked], total)
+
+    def _remove(self, doc_id: str) -> bool:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        return True
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        # Sorted vocabulary is rebuilt lazily after terms come or go
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        terms = []
+        for term in self._sorted_terms[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import editor and services
 from app.file.editor import FileEditor
+from app.file.websocket import get_file_editor as get_shared_file_editor
 from app.file.schemas.editor_config import (
     EditorSession,
     EditorConfig,
@@ -31,9 +32,9 @@ router = APIRouter(prefix="/editor", tags=["editor"])
 
 
 # Dependency injection
-async def get_file_editor(db: AsyncSession = Depends(get_db)) -> FileEditor:
-    """Get FileEditor instance."""
-    return FileEditor(db_session=db)
+async def get_file_editor() -> FileEditor:
+    """Get the FileEditor shared with the collaborative editing WebSocket."""
+    return await get_shared_file_editor()
 
 
 # Editor Session Management
@@ -48,6 +49,7 @@ async def create_editor_session(
     file_id: UUID = ...,
     config: Optional[EditorConfig] = None,
     editor: FileEditor = Depends(get_file_editor),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a new editor session.
 
@@ -55,6 +57,7 @@ async def create_editor_session(
         file_id: File ID to edit
         config: Optional editor configuration
         editor: File editor instance
+        db: Database session
 
     Returns:
         Editor session information
@@ -63,6 +66,7 @@ async def create_editor_session(
         session = await editor.create_editor_session(
             file_id=file_id,
             config=config,
+            db_session=db,
         )
 
         logger.info(f"Editor session created: {session.session_id} for file {file_id}")
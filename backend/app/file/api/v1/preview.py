@@ -15,7 +15,7 @@ from fastapi.responses import StreamingResponse, JSONResponse, PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import preview manager and services
-from app.file.preview_manager import PreviewManager
+from app.file.preview_manager import PreviewManager, storage_content_loader
 from app.file.services.conversion_service import ConversionService
 from app.schemas.preview_config import (
     PreviewRequest,
@@ -25,6 +25,7 @@ from app.schemas.preview_config import (
     PreviewFormat,
 )
 from app.database.session import get_db
+from app.storage.client import MinIOClient, MinIOClientManager
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +33,32 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/preview", tags=["preview"])
 
 
+# Storage clients for reading file content
+storage_clients = MinIOClientManager()
+
+
+def get_storage_client() -> MinIOClient:
+    """Get the storage client holding file content."""
+    if storage_clients.config is None:
+        from app.core.config import settings
+        from app.storage.schemas.storage_config import MinIOConfig
+
+        storage_clients.set_default_config(MinIOConfig(
+            endpoint=settings.MINIO_ENDPOINT,
+            access_key=settings.MINIO_ACCESS_KEY,
+            secret_key=settings.MINIO_SECRET_KEY,
+            secure=settings.MINIO_SECURE,
+        ))
+    return storage_clients.get_default_client()
+
+
 # Dependency injection
 async def get_preview_manager(db: AsyncSession = Depends(get_db)) -> PreviewManager:
     """Get PreviewManager instance."""
-    return PreviewManager(db_session=db)
+    return PreviewManager(
+        db_session=db,
+        content_loader=storage_content_loader(get_storage_client),
+    )
 
 
 async def get_conversion_service(db: AsyncSession = Depends(get_db)) -> ConversionService:
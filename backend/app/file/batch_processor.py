@@ -3,28 +3,52 @@
 This module contains the BatchProcessor class which provides efficient batch
 file operations including upload, download, delete, move with progress tracking
 and concurrent control.
+
+Operations are pulled lazily from the job's input by a bounded set of asyncio
+workers, so memory use does not grow with the size of the job. CPU-bound
+steps (compress, extract, convert, hash) run on a process pool; database and
+file I/O steps run directly on the workers. Per-operation results can be
+streamed as they complete and progress callbacks are throttled.
 """
 
 import asyncio
+import hashlib
 import logging
+import mimetypes
+import os
+import shutil
+import tarfile
 import time
-from typing import Dict, List, Optional, Tuple, Any, Callable, Union
+import zipfile
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
+from pathlib import Path
 from uuid import UUID, uuid4
 from enum import Enum
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 import threading
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import managers and schemas
 from app.file.manager import FileManager
-from app.file.schemas.file_operations import FileResponse, FileOperation
+from app.file.schemas.file_operations import FileCopy, FileCreate, FileDelete, FileMove, FileUpdate
 from app.file.schemas.batch_config import BatchOperation, BatchStatus, BatchProgress
+from app.file.utils.processors import compress_stream, decompress_stream
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_SIZE = 1024 * 1024
+
+_COMPRESSION_SUFFIXES = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "lzma": ".xz",
+    "zstd": ".zst",
+    "lz4": ".lz4",
+}
+
 
 class OperationType(str, Enum):
     """Batch operation type enumeration."""
@@ -37,6 +61,7 @@ class OperationType(str, Enum):
     CONVERT = "convert"
     COMPRESS = "compress"
     EXTRACT = "extract"
+    HASH = "hash"
 
 
 class OperationStatus(str, Enum):
@@ -101,8 +126,11 @@ class BatchJob:
     duration_seconds: float = 0.0
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    bytes_processed: int = 0
     operation_results: List[BatchOperationResult] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    keep_results: bool = True
+    operations: Optional[Iterable[BatchOperation]] = field(default=None, repr=False)
 
     def update_progress(self):
         """Update job progress."""
@@ -120,36 +148,228 @@ class BatchJob:
                 self.duration_seconds = (self.end_time - self.start_time).total_seconds()
 
 
+def _ensure_parent(path: str):
+    """Create the parent directory of a path if needed."""
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+def _compress_file(source_path: str, target_path: Optional[str], algorithm: str = "gzip") -> Dict[str, Any]:
+    """Compress a file by streaming it through a compressor.
+
+    Runs in a worker process.
+
+    Args:
+        source_path: File to compress
+        target_path: Output file (defaults to source path plus suffix)
+        algorithm: Compression algorithm (gzip, bz2, lzma, zstd, lz4)
+
+    Returns:
+        Operation outcome with bytes processed and metadata, including the
+        checksum of the source computed in the same pass
+    """
+    if algorithm not in _COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression algorithm: {algorithm}")
+    target_path = target_path or source_path + _COMPRESSION_SUFFIXES[algorithm]
+    _ensure_parent(target_path)
+
+    success, info, error = compress_stream(source_path, target_path, algorithm, chunk_size=_CHUNK_SIZE)
+    if not success:
+        raise ValueError(error)
+
+    return {
+        "bytes_processed": info["bytes_in"],
+        "metadata": {
+            "target_path": target_path,
+            "algorithm": algorithm,
+            "compressed_size": info["bytes_out"],
+            "checksum": info["checksums"]["sha256"],
+        },
+    }
+
+
+def _extract_file(source_path: str, target_path: Optional[str]) -> Dict[str, Any]:
+    """Extract a zip/tar archive or decompress a single compressed file.
+
+    Runs in a worker process.
+
+    Args:
+        source_path: Archive or compressed file
+        target_path: Output directory (archives) or file (single files)
+
+    Returns:
+        Operation outcome with bytes processed and metadata
+    """
+    if zipfile.is_zipfile(source_path):
+        target_path = target_path or os.path.splitext(source_path)[0]
+        with zipfile.ZipFile(source_path) as archive:
+            members = archive.infolist()
+            archive.extractall(target_path)
+        extracted = sum(member.file_size for member in members)
+    elif tarfile.is_tarfile(source_path):
+        target_path = target_path or source_path.split(".tar")[0]
+        with tarfile.open(source_path) as archive:
+            members = archive.getmembers()
+            if hasattr(tarfile, "data_filter"):
+                archive.extractall(target_path, filter="data")
+            else:
+                root = os.path.realpath(target_path)
+                for member in members:
+                    destination = os.path.realpath(os.path.join(target_path, member.name))
+                    if os.path.commonpath([root, destination]) != root or member.issym() or member.islnk():
+                        raise ValueError(f"Unsafe archive member: {member.name}")
+                archive.extractall(target_path)
+        extracted = sum(member.size for member in members)
+    else:
+        for algorithm, suffix in _COMPRESSION_SUFFIXES.items():
+            if source_path.endswith(suffix):
+                break
+        else:
+            raise ValueError(f"Unsupported archive format: {source_path}")
+        target_path = target_path or source_path[:-len(suffix)]
+        if os.path.isdir(target_path):
+            target_path = os.path.join(target_path, os.path.basename(source_path)[:-len(suffix)])
+        _ensure_parent(target_path)
+        success, info, error = decompress_stream(source_path, target_path, algorithm, chunk_size=_CHUNK_SIZE)
+        if not success:
+            raise ValueError(error)
+        extracted = info["bytes_out"]
+
+    return {
+        "bytes_processed": os.path.getsize(source_path),
+        "metadata": {"target_path": target_path, "extracted_size": extracted},
+    }
+
+
+def _convert_file(
+    source_path: str,
+    target_path: Optional[str],
+    source_encoding: str = "utf-8",
+    target_encoding: str = "utf-8",
+    newline: str = "\n",
+) -> Dict[str, Any]:
+    """Re-encode a text file and normalize its line endings.
+
+    Runs in a worker process.
+
+    Args:
+        source_path: Text file to convert
+        target_path: Output file (defaults to converting in place)
+        source_encoding: Encoding of the source file
+        target_encoding: Encoding of the output file
+        newline: Line ending written to the output file
+
+    Returns:
+        Operation outcome with bytes processed and metadata
+    """
+    in_place = not target_path or os.path.abspath(target_path) == os.path.abspath(source_path)
+    output_path = source_path + ".converting" if in_place else target_path
+    _ensure_parent(output_path)
+
+    with open(source_path, "r", encoding=source_encoding, newline=None) as source, \
+            open(output_path, "w", encoding=target_encoding, newline=newline) as target:
+        shutil.copyfileobj(source, target, _CHUNK_SIZE)
+
+    if in_place:
+        os.replace(output_path, source_path)
+        output_path = source_path
+
+    return {
+        "bytes_processed": os.path.getsize(output_path),
+        "metadata": {"target_path": output_path, "encoding": target_encoding},
+    }
+
+
+def _hash_file(source_path: str, algorithm: str = "sha256") -> Dict[str, Any]:
+    """Hash a file in chunks.
+
+    Runs in a worker process.
+
+    Args:
+        source_path: File to hash
+        algorithm: hashlib algorithm name
+
+    Returns:
+        Operation outcome with bytes processed and the checksum
+    """
+    digest = hashlib.new(algorithm)
+    size = 0
+    with open(source_path, "rb") as source:
+        for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+
+    return {
+        "bytes_processed": size,
+        "metadata": {"checksum": digest.hexdigest(), "algorithm": algorithm},
+    }
+
+
+async def _maybe_await(value: Any) -> Any:
+    """Await a value if it is awaitable."""
+    if asyncio.iscoroutine(value) or isinstance(value, asyncio.Future):
+        return await value
+    return value
+
+
 class ProgressCallback:
-    """Progress callback for batch operations."""
+    """Throttled progress callback for batch operations."""
+
+    def __init__(self, callback: Callable[[BatchProgress], Any], min_interval: float = 1.0):
+        """Initialize progress callback.
 
-    def __init__(self, callback: Callable[[BatchProgress], None]):
+        Args:
+            callback: Sync or async function receiving progress updates
+            min_interval: Minimum seconds between updates while a job runs
+        """
         self.callback = callback
-        self.last_update = datetime.utcnow()
+        self.min_interval = min_interval
+        self.last_update: Optional[float] = None
 
-    async def __call__(self, job: BatchJob):
-        """Call the callback with job progress."""
-        current_time = datetime.utcnow()
+    async def __call__(self, job: "BatchJob", force: bool = False):
+        """Call the callback with job progress.
+
+        Args:
+            job: Batch job
+            force: Report even if the last update was too recent
+        """
+        now = time.monotonic()
 
         # Throttle updates to avoid overwhelming the callback
-        if (current_time - self.last_update).total_seconds() >= 1.0 or job.status in [BatchStatus.COMPLETED, BatchStatus.FAILED]:
-            try:
-                progress = BatchProgress(
-                    job_id=job.job_id,
-                    status=job.status,
-                    total_operations=job.total_operations,
-                    completed_operations=job.completed_operations,
-                    failed_operations=job.failed_operations,
-                    skipped_operations=job.skipped_operations,
-                    progress_percentage=job.progress_percentage,
-                    start_time=job.start_time,
-                    end_time=job.end_time,
-                    duration_seconds=job.duration_seconds,
-                )
-                await asyncio.get_event_loop().run_in_executor(None, self.callback, progress)
-                self.last_update = current_time
-            except Exception as e:
-                logger.error(f"Error in progress callback: {str(e)}")
+        finished = job.status in [BatchStatus.COMPLETED, BatchStatus.FAILED, BatchStatus.CANCELLED]
+        if (
+            not force
+            and not finished
+            and self.last_update is not None
+            and now - self.last_update < self.min_interval
+        ):
+            return
+        self.last_update = now
+
+        try:
+            processed = job.completed_operations + job.failed_operations + job.skipped_operations
+            progress = BatchProgress(
+                job_id=job.job_id,
+                status=job.status,
+                total_files=job.total_operations,
+                processed_files=processed,
+                successful_files=job.completed_operations,
+                failed_files=job.failed_operations,
+                skipped_files=job.skipped_operations,
+                percentage=min(job.progress_percentage, 100.0),
+                bytes_processed=job.bytes_processed,
+                start_time=job.start_time,
+            )
+            if asyncio.iscoroutinefunction(self.callback):
+                await self.callback(progress)
+            else:
+                await asyncio.get_running_loop().run_in_executor(None, self.callback, progress)
+        except Exception as e:
+            logger.error(f"Error in progress callback: {str(e)}")
+
+
+OperationHandler = Callable[["BatchJob", BatchOperation], Awaitable[Optional[Dict[str, Any]]]]
 
 
 class BatchProcessor:
@@ -161,20 +381,49 @@ class BatchProcessor:
         max_concurrent_operations: int = 10,
         max_workers: int = 5,
         operation_timeout: int = 300,  # 5 minutes
+        progress_interval: float = 1.0,
     ):
         """Initialize batch processor.
 
         Args:
             db_session: Database session
-            max_concurrent_operations: Maximum concurrent operations
-            max_workers: Thread pool size
+            max_concurrent_operations: Maximum concurrent I/O operations
+            max_workers: Process pool size for CPU-bound operations
             operation_timeout: Operation timeout in seconds
+            progress_interval: Minimum seconds between progress callbacks
         """
         self.db = db_session
         self.file_manager = FileManager(db_session)
+        # AsyncSession allows one operation at a time, so workers take turns
+        # on the database while file I/O and hashing stay concurrent
+        self._db_lock = asyncio.Lock()
         self.max_concurrent_operations = max_concurrent_operations
         self.max_workers = max_workers
         self.operation_timeout = operation_timeout
+        self.progress_interval = progress_interval
+
+        # Process pool for CPU-bound operations, created on first use
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        self._operation_handlers: Dict[OperationType, OperationHandler] = {
+            OperationType.UPLOAD: self._upload_operation,
+            OperationType.DOWNLOAD: self._download_operation,
+            OperationType.DELETE: self._delete_operation,
+            OperationType.MOVE: self._move_operation,
+            OperationType.COPY: self._copy_operation,
+            OperationType.UPDATE: self._update_operation,
+            OperationType.CONVERT: self._convert_operation,
+            OperationType.COMPRESS: self._compress_operation,
+            OperationType.EXTRACT: self._extract_operation,
+            OperationType.HASH: self._hash_operation,
+        }
+        self._cpu_bound_operations = {
+            OperationType.CONVERT,
+            OperationType.COMPRESS,
+            OperationType.EXTRACT,
+            OperationType.HASH,
+        }
 
         # Active batch jobs
         self.active_jobs: Dict[str, BatchJob] = {}
@@ -193,41 +442,50 @@ class BatchProcessor:
     async def create_batch_job(
         self,
         operation_type: OperationType,
-        operations: List[BatchOperation],
+        operations: Iterable[BatchOperation],
         metadata: Optional[Dict[str, Any]] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        total_operations: Optional[int] = None,
+        keep_results: bool = True,
     ) -> str:
         """Create a new batch job.
 
+        With ``keep_results=False`` the operations may be any iterable,
+        including a generator; they are consumed lazily during execution and
+        results are only streamed, never retained on the job.
+
         Args:
             operation_type: Type of operation
-            operations: List of operations to perform
+            operations: Operations to perform
             metadata: Additional metadata
             progress_callback: Progress callback function
+            total_operations: Operation count if operations has no length
+            keep_results: Whether to keep every operation result on the job
 
         Returns:
             Job ID
         """
         job_id = str(uuid4())
 
+        if keep_results and not isinstance(operations, (list, tuple)):
+            operations = list(operations)
+        if total_operations is None:
+            total_operations = len(operations) if hasattr(operations, "__len__") else 0
+
         # Create job
         job = BatchJob(
             job_id=job_id,
             operation_type=operation_type,
             status=BatchStatus.PENDING,
-            total_operations=len(operations),
+            total_operations=total_operations,
             metadata=metadata or {},
+            keep_results=keep_results,
+            operations=operations,
         )
 
         # Create operation results
-        for operation in operations:
-            result = BatchOperationResult(
-                operation_id=str(uuid4()),
-                file_id=operation.file_id,
-                source_path=operation.source_path,
-                target_path=operation.target_path,
-            )
-            job.operation_results.append(result)
+        if keep_results:
+            job.operation_results = [self._new_result(operation) for operation in operations]
 
         # Store job
         with self.job_lock:
@@ -235,21 +493,24 @@ class BatchProcessor:
 
         # Update stats
         self.operation_stats["total_jobs"] += 1
-        self.operation_stats["total_operations"] += len(operations)
+        self.operation_stats["total_operations"] += total_operations
 
-        logger.info(f"Created batch job {job_id} with {len(operations)} operations")
+        logger.info(f"Created batch job {job_id} with {total_operations or 'unknown'} operations")
         return job_id
 
     async def execute_batch_job(
         self,
         job_id: str,
-        progress_callback: Optional[Callable[[BatchProgress], None]] = None,
+        progress_callback: Optional[Callable[[BatchProgress], Any]] = None,
+        result_callback: Optional[Callable[[BatchOperationResult], Any]] = None,
     ) -> BatchJob:
         """Execute a batch job.
 
         Args:
             job_id: Job ID
             progress_callback: Progress callback function
+            result_callback: Sync or async function called with each
+                operation result as soon as it completes
 
         Returns:
             Completed batch job
@@ -265,7 +526,7 @@ class BatchProcessor:
         # Create progress callback
         callback = None
         if progress_callback:
-            callback = ProgressCallback(progress_callback)
+            callback = ProgressCallback(progress_callback, self.progress_interval)
 
         # Update job status
         job.status = BatchStatus.RUNNING
@@ -273,48 +534,34 @@ class BatchProcessor:
         job.update_progress()
 
         if callback:
-            await callback(job)
+            await callback(job, force=True)
 
         try:
-            # Execute operations based on type
-            if job.operation_type == OperationType.UPLOAD:
-                await self._execute_upload_operations(job, callback)
-            elif job.operation_type == OperationType.DOWNLOAD:
-                await self._execute_download_operations(job, callback)
-            elif job.operation_type == OperationType.DELETE:
-                await self._execute_delete_operations(job, callback)
-            elif job.operation_type == OperationType.MOVE:
-                await self._execute_move_operations(job, callback)
-            elif job.operation_type == OperationType.COPY:
-                await self._execute_copy_operations(job, callback)
-            elif job.operation_type == OperationType.UPDATE:
-                await self._execute_update_operations(job, callback)
-            elif job.operation_type == OperationType.CONVERT:
-                await self._execute_convert_operations(job, callback)
-            elif job.operation_type == OperationType.COMPRESS:
-                await self._execute_compress_operations(job, callback)
-            elif job.operation_type == OperationType.EXTRACT:
-                await self._execute_extract_operations(job, callback)
-            else:
-                raise ValueError(f"Unsupported operation type: {job.operation_type}")
+            await self._run_operations(job, callback, result_callback)
 
             # Update final job status
             job.end_time = datetime.utcnow()
             if job.start_time:
                 job.duration_seconds = (job.end_time - job.start_time).total_seconds()
 
-            job.update_progress()
+            if job.status != BatchStatus.CANCELLED:
+                processed = job.completed_operations + job.failed_operations + job.skipped_operations
+                if not job.total_operations and processed:
+                    job.total_operations = processed
+                    self.operation_stats["total_operations"] += processed
+                job.update_progress()
+                job.status = BatchStatus.COMPLETED if job.failed_operations == 0 else BatchStatus.FAILED
 
             # Update stats
             if job.status == BatchStatus.COMPLETED:
                 self.operation_stats["completed_jobs"] += 1
-                self.operation_stats["successful_operations"] += job.completed_operations
             else:
                 self.operation_stats["failed_jobs"] += 1
-                self.operation_stats["failed_operations"] += job.failed_operations
+            self.operation_stats["successful_operations"] += job.completed_operations
+            self.operation_stats["failed_operations"] += job.failed_operations
 
             if callback:
-                await callback(job)
+                await callback(job, force=True)
 
             logger.info(f"Completed batch job {job_id} with status {job.status.value}")
             return job
@@ -329,10 +576,64 @@ class BatchProcessor:
             self.operation_stats["failed_operations"] += job.failed_operations
 
             if callback:
-                await callback(job)
+                await callback(job, force=True)
 
             raise
 
+        finally:
+            # Release the job input; results are kept only if requested
+            job.operations = None
+
+    async def stream_batch_job(
+        self,
+        job_id: str,
+        progress_callback: Optional[Callable[[BatchProgress], Any]] = None,
+        buffer_size: Optional[int] = None,
+    ) -> AsyncIterator[BatchOperationResult]:
+        """Execute a batch job and yield operation results as they complete.
+
+        Workers pause once ``buffer_size`` results are waiting, so a slow
+        consumer applies backpressure instead of buffering the whole job.
+        Closing the iterator early cancels the job.
+
+        Args:
+            job_id: Job ID
+            progress_callback: Progress callback function
+            buffer_size: Maximum number of results waiting to be consumed
+
+        Yields:
+            Operation results in completion order
+        """
+        results: asyncio.Queue = asyncio.Queue(
+            maxsize=buffer_size or self.max_concurrent_operations * 2
+        )
+        execution = asyncio.create_task(
+            self.execute_batch_job(job_id, progress_callback, result_callback=results.put)
+        )
+
+        try:
+            while True:
+                if not results.empty():
+                    yield results.get_nowait()
+                    continue
+                getter = asyncio.ensure_future(results.get())
+                await asyncio.wait({getter, execution}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                while not results.empty():
+                    yield results.get_nowait()
+                break
+
+            # Re-raise job failures
+            execution.result()
+        finally:
+            if not execution.done():
+                await self.cancel_batch_job(job_id)
+                execution.cancel()
+                await asyncio.gather(execution, return_exceptions=True)
+
     async def cancel_batch_job(self, job_id: str) -> bool:
         """Cancel a batch job.
 
@@ -461,6 +762,13 @@ class BatchProcessor:
             "success_rate_percent": round(success_rate, 2),
         }
 
+    def shutdown(self):
+        """Shut down the process pool used for CPU-bound operations."""
+        with self._pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=True, cancel_futures=True)
+                self._process_pool = None
+
     # Private methods
 
     def _get_job(self, job_id: str) -> Optional[BatchJob]:
@@ -468,403 +776,276 @@ class BatchProcessor:
         with self.job_lock:
             return self.active_jobs.get(job_id)
 
-    async def _execute_operation_with_limit(
+    def _new_result(self, operation: BatchOperation) -> BatchOperationResult:
+        """Create the pending result of an operation."""
+        return BatchOperationResult(
+            operation_id=str(uuid4()),
+            file_id=operation.file_id,
+            source_path=operation.source_path,
+            target_path=operation.target_path,
+        )
+
+    def _iter_operations(self, job: BatchJob) -> Iterator[Tuple[BatchOperation, BatchOperationResult]]:
+        """Lazily pair job operations with their results."""
+        if job.keep_results:
+            yield from zip(job.operations, job.operation_results)
+        else:
+            for operation in job.operations:
+                yield operation, self._new_result(operation)
+
+    def _get_concurrency(self, operation_type: OperationType) -> int:
+        """Get the number of workers for an operation type."""
+        if operation_type in self._cpu_bound_operations:
+            # More workers than pool processes would only queue in the pool
+            return self.max_workers
+        if operation_type == OperationType.DELETE:
+            # Delete can be faster
+            return self.max_concurrent_operations * 2
+        return self.max_concurrent_operations
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool, creating it on first use."""
+        with self._pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._process_pool
+
+    async def _run_cpu_bound(self, func: Callable, *args) -> Any:
+        """Run a module-level function on the process pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_process_pool(), func, *args)
+
+    async def _run_operations(
         self,
-        operations: List[BatchOperationResult],
-        operation_func: Callable,
         job: BatchJob,
         callback: Optional[ProgressCallback],
-        max_concurrent: Optional[int] = None,
+        result_callback: Optional[Callable[[BatchOperationResult], Any]],
     ):
-        """Execute operations with concurrency limit.
+        """Run all operations of a job on a bounded set of workers.
+
+        Each worker pulls the next operation only when it is free, so a
+        slow operation never holds up the others and at most one operation
+        per worker is in flight.
 
         Args:
-            operations: List of operation results
-            operation_func: Function to execute for each operation
             job: Batch job
             callback: Progress callback
-            max_concurrent: Maximum concurrent operations
+            result_callback: Function called with each completed result
         """
-        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent_operations)
-
-        async def execute_with_semaphore(operation: BatchOperationResult):
-            async with semaphore:
-                return await operation_func(operation)
-
-        # Execute operations concurrently
-        tasks = [execute_with_semaphore(op) for op in operations]
-        await asyncio.gather(*tasks, return_exceptions=True)
-
-    async def _execute_upload_operations(
-        self,
-        job: BatchJob,
-        callback: Optional[ProgressCallback],
-    ):
-        """Execute upload operations."""
-        async def upload_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock upload logic
-                await asyncio.sleep(0.1)  # Simulate upload time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-                operation.bytes_processed = 1024 * 1024  # 1 MB
-
-                job.completed_operations += 1
-
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
-
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
-
-                job.update_progress()
-                if callback:
-                    await callback(job)
-
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            upload_operation,
-            job,
-            callback,
-        )
+        handler = self._operation_handlers.get(job.operation_type)
+        if handler is None:
+            raise ValueError(f"Unsupported operation type: {job.operation_type}")
 
-    async def _execute_download_operations(
-        self,
-        job: BatchJob,
-        callback: Optional[ProgressCallback],
-    ):
-        """Execute download operations."""
-        async def download_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock download logic
-                await asyncio.sleep(0.1)  # Simulate download time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-                operation.bytes_processed = 512 * 1024  # 512 KB
+        work = self._iter_operations(job)
 
-                job.completed_operations += 1
-
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
-
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
+        async def worker():
+            for operation, result in work:
+                if job.status == BatchStatus.CANCELLED:
+                    break
+                await self._run_operation(job, handler, operation, result)
 
                 job.update_progress()
                 if callback:
                     await callback(job)
+                if result_callback:
+                    await _maybe_await(result_callback(result))
 
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            download_operation,
-            job,
-            callback,
-        )
-
-    async def _execute_delete_operations(
-        self,
-        job: BatchJob,
-        callback: Optional[ProgressCallback],
-    ):
-        """Execute delete operations."""
-        async def delete_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock delete logic
-                await asyncio.sleep(0.05)  # Simulate delete time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-
-                job.completed_operations += 1
-
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
-
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
-
-                job.update_progress()
-                if callback:
-                    await callback(job)
-
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            delete_operation,
-            job,
-            callback,
-            max_concurrent=self.max_concurrent_operations * 2,  # Delete can be faster
-        )
-
-    async def _execute_move_operations(
-        self,
-        job: BatchJob,
-        callback: Optional[ProgressCallback],
-    ):
-        """Execute move operations."""
-        async def move_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock move logic
-                await asyncio.sleep(0.1)  # Simulate move time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-
-                job.completed_operations += 1
-
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
-
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
-
-                job.update_progress()
-                if callback:
-                    await callback(job)
-
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            move_operation,
-            job,
-            callback,
-        )
-
-    async def _execute_copy_operations(
+        concurrency = self._get_concurrency(job.operation_type)
+        if job.total_operations:
+            concurrency = min(concurrency, job.total_operations)
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # Make sure no worker outlives the job if it fails or is cancelled
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _run_operation(
         self,
         job: BatchJob,
-        callback: Optional[ProgressCallback],
+        handler: OperationHandler,
+        operation: BatchOperation,
+        result: BatchOperationResult,
     ):
-        """Execute copy operations."""
-        async def copy_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock copy logic
-                await asyncio.sleep(0.2)  # Simulate copy time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-                operation.bytes_processed = 2 * 1024 * 1024  # 2 MB
+        """Run a single operation and record its result."""
+        try:
+            result.status = OperationStatus.RUNNING
+            result.start_time = datetime.utcnow()
 
-                job.completed_operations += 1
+            outcome = await asyncio.wait_for(handler(job, operation), timeout=self.operation_timeout)
+            outcome = outcome or {}
 
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
+            result.status = OperationStatus.COMPLETED
+            result.success = True
+            result.bytes_processed = outcome.get("bytes_processed", 0)
+            result.metadata.update(outcome.get("metadata", {}))
 
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
+            job.completed_operations += 1
+            job.bytes_processed += result.bytes_processed
 
-                job.update_progress()
-                if callback:
-                    await callback(job)
+        except asyncio.TimeoutError:
+            result.status = OperationStatus.FAILED
+            result.success = False
+            result.error_message = f"Operation timed out after {self.operation_timeout}s"
+            job.failed_operations += 1
 
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            copy_operation,
-            job,
-            callback,
+        except Exception as e:
+            result.status = OperationStatus.FAILED
+            result.success = False
+            result.error_message = str(e)
+            job.failed_operations += 1
+
+        finally:
+            result.end_time = datetime.utcnow()
+            if result.start_time:
+                result.duration_seconds = (result.end_time - result.start_time).total_seconds()
+
+    def _get_user_id(self, job: BatchJob, operation: BatchOperation) -> str:
+        """Get the user an operation runs as."""
+        parameters = operation.metadata or {}
+        return parameters.get("user_id") or job.metadata.get("user_id") or "system"
+
+    def _get_file_id(self, operation: BatchOperation) -> UUID:
+        """Get the file ID of an operation."""
+        if not operation.file_id:
+            raise ValueError("Operation has no file_id")
+        return UUID(str(operation.file_id))
+
+    def _get_source_path(self, operation: BatchOperation) -> str:
+        """Get the source path of an operation."""
+        if not operation.source_path:
+            raise ValueError("Operation has no source_path")
+        return operation.source_path
+
+    # I/O-bound operations
+
+    async def _upload_operation(self, job: BatchJob, operation: BatchOperation) -> Dict[str, Any]:
+        """Register a local file, hashing it on the process pool."""
+        path = Path(self._get_source_path(operation))
+        stat = await asyncio.to_thread(path.stat)
+        digest = await self._run_cpu_bound(_hash_file, str(path), "sha256")
+        user_id = self._get_user_id(job, operation)
+
+        file_data = FileCreate(
+            name=path.name,
+            mime_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            size=stat.st_size,
+            owner_id=user_id,
+            storage_key=operation.target_path or path.name,
+            checksum=digest["metadata"]["checksum"],
+            metadata=operation.metadata or {},
         )
+        async with self._db_lock:
+            created = await self.file_manager.create_file(file_data, user_id)
 
-    async def _execute_update_operations(
-        self,
-        job: BatchJob,
-        callback: Optional[ProgressCallback],
-    ):
-        """Execute update operations."""
-        async def update_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock update logic
-                await asyncio.sleep(0.1)  # Simulate update time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-
-                job.completed_operations += 1
-
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
-
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
+        return {
+            "bytes_processed": stat.st_size,
+            "metadata": {
+                "file_id": str(getattr(created, "id", "")),
+                "checksum": digest["metadata"]["checksum"],
+            },
+        }
 
-                job.update_progress()
-                if callback:
-                    await callback(job)
+    async def _download_operation(self, job: BatchJob, operation: BatchOperation) -> Dict[str, Any]:
+        """Resolve the file record to download."""
+        async with self._db_lock:
+            file = await self.file_manager.get_file(
+                self._get_file_id(operation), self._get_user_id(job, operation)
+            )
+        if not file:
+            raise FileNotFoundError(f"File {operation.file_id} not found")
+        return {"bytes_processed": getattr(file, "size", 0) or 0}
+
+    async def _delete_operation(self, job: BatchJob, operation: BatchOperation) -> None:
+        """Delete a file."""
+        parameters = operation.metadata or {}
+        async with self._db_lock:
+            deleted = await self.file_manager.delete_file(
+                self._get_file_id(operation),
+                self._get_user_id(job, operation),
+                FileDelete(permanent=bool(parameters.get("permanent", False)), reason=parameters.get("reason")),
+            )
+        if not deleted:
+            raise FileNotFoundError(f"File {operation.file_id} not found")
+
+    async def _move_operation(self, job: BatchJob, operation: BatchOperation) -> None:
+        """Move a file."""
+        async with self._db_lock:
+            moved = await self.file_manager.move_file(
+                self._get_file_id(operation),
+                FileMove(target_path=operation.target_path),
+                self._get_user_id(job, operation),
+            )
+        if not moved:
+            raise FileNotFoundError(f"File {operation.file_id} not found")
+
+    async def _copy_operation(self, job: BatchJob, operation: BatchOperation) -> Dict[str, Any]:
+        """Copy a file."""
+        parameters = operation.metadata or {}
+        async with self._db_lock:
+            copied = await self.file_manager.copy_file(
+                self._get_file_id(operation),
+                FileCopy(target_path=operation.target_path, overwrite=bool(parameters.get("overwrite", False))),
+                self._get_user_id(job, operation),
+            )
+        if not copied:
+            raise FileNotFoundError(f"File {operation.file_id} not found")
+        return {
+            "bytes_processed": getattr(copied, "size", 0) or 0,
+            "metadata": {"file_id": str(getattr(copied, "id", ""))},
+        }
 
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            update_operation,
-            job,
-            callback,
+    async def _update_operation(self, job: BatchJob, operation: BatchOperation) -> None:
+        """Update file attributes from the operation's ``changes``."""
+        parameters = operation.metadata or {}
+        async with self._db_lock:
+            updated = await self.file_manager.update_file(
+                self._get_file_id(operation),
+                FileUpdate(**parameters.get("changes", {})),
+                self._get_user_id(job, operation),
+            )
+        if not updated:
+            raise FileNotFoundError(f"File {operation.file_id} not found")
+
+    # CPU-bound operations
+
+    async def _convert_operation(self, job: BatchJob, operation: BatchOperation) -> Dict[str, Any]:
+        """Convert a text file on the process pool."""
+        parameters = operation.metadata or {}
+        return await self._run_cpu_bound(
+            _convert_file,
+            self._get_source_path(operation),
+            operation.target_path,
+            parameters.get("source_encoding", "utf-8"),
+            parameters.get("target_encoding", "utf-8"),
+            parameters.get("newline", "\n"),
         )
 
-    async def _execute_convert_operations(
-        self,
-        job: BatchJob,
-        callback: Optional[ProgressCallback],
-    ):
-        """Execute convert operations."""
-        async def convert_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock convert logic
-                await asyncio.sleep(0.5)  # Simulate conversion time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-
-                job.completed_operations += 1
-
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
-
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
-
-                job.update_progress()
-                if callback:
-                    await callback(job)
-
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            convert_operation,
-            job,
-            callback,
-            max_concurrent=max(1, self.max_concurrent_operations // 2),  # Conversion is CPU-intensive
+    async def _compress_operation(self, job: BatchJob, operation: BatchOperation) -> Dict[str, Any]:
+        """Compress a file on the process pool."""
+        parameters = operation.metadata or {}
+        return await self._run_cpu_bound(
+            _compress_file,
+            self._get_source_path(operation),
+            operation.target_path,
+            parameters.get("algorithm", "gzip"),
         )
 
-    async def _execute_compress_operations(
-        self,
-        job: BatchJob,
-        callback: Optional[ProgressCallback],
-    ):
-        """Execute compress operations."""
-        async def compress_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock compress logic
-                await asyncio.sleep(0.3)  # Simulate compression time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-
-                job.completed_operations += 1
-
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
-
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
-
-                job.update_progress()
-                if callback:
-                    await callback(job)
-
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            compress_operation,
-            job,
-            callback,
+    async def _extract_operation(self, job: BatchJob, operation: BatchOperation) -> Dict[str, Any]:
+        """Extract an archive on the process pool."""
+        return await self._run_cpu_bound(
+            _extract_file,
+            self._get_source_path(operation),
+            operation.target_path,
         )
 
-    async def _execute_extract_operations(
-        self,
-        job: BatchJob,
-        callback: Optional[ProgressCallback],
-    ):
-        """Execute extract operations."""
-        async def extract_operation(operation: BatchOperationResult):
-            try:
-                operation.status = OperationStatus.RUNNING
-                operation.start_time = datetime.utcnow()
-
-                # Mock extract logic
-                await asyncio.sleep(0.4)  # Simulate extraction time
-
-                operation.status = OperationStatus.COMPLETED
-                operation.success = True
-
-                job.completed_operations += 1
-
-            except Exception as e:
-                operation.status = OperationStatus.FAILED
-                operation.success = False
-                operation.error_message = str(e)
-                job.failed_operations += 1
-
-            finally:
-                operation.end_time = datetime.utcnow()
-                if operation.start_time:
-                    operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
-
-                job.update_progress()
-                if callback:
-                    await callback(job)
-
-        await self._execute_operation_with_limit(
-            job.operation_results,
-            extract_operation,
-            job,
-            callback,
+    async def _hash_operation(self, job: BatchJob, operation: BatchOperation) -> Dict[str, Any]:
+        """Hash a file on the process pool."""
+        parameters = operation.metadata or {}
+        return await self._run_cpu_bound(
+            _hash_file,
+            self._get_source_path(operation),
+            parameters.get("algorithm", "sha256"),
         )
@@ -0,0 +1,350 @@
+"""Text Document Model.
+
+This module contains the TextDocument class used by the file editor to hold
+session content. Documents are piece tables whose pieces live in a treap
+ordered by position, so inserts and deletes cost O(log n) regardless of the
+document size, and each subtree carries its newline count so offset/line
+conversions are O(log n) as well.
+"""
+
+import random
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+
+
+__all__ = ["TextDocument"]
+
+
+class _Piece:
+    """Treap node referencing a slice of an immutable buffer."""
+
+    __slots__ = (
+        "buffer",
+        "start",
+        "length",
+        "newlines",
+        "priority",
+        "left",
+        "right",
+        "total_length",
+        "total_newlines",
+    )
+
+    def __init__(self, buffer: int, start: int, length: int, newlines: int, priority: float):
+        self.buffer = buffer
+        self.start = start
+        self.length = length
+        self.newlines = newlines
+        self.priority = priority
+        self.left: Optional["_Piece"] = None
+        self.right: Optional["_Piece"] = None
+        self.total_length = length
+        self.total_newlines = newlines
+
+    def update(self) -> None:
+        """Recompute subtree aggregates from the children."""
+        self.total_length = self.length
+        self.total_newlines = self.newlines
+        if self.left is not None:
+            self.total_length += self.left.total_length
+            self.total_newlines += self.left.total_newlines
+        if self.right is not None:
+            self.total_length += self.right.total_length
+            self.total_newlines += self.right.total_newlines
+
+
+def _length(node: Optional[_Piece]) -> int:
+    return node.total_length if node is not None else 0
+
+
+def _newlines(node: Optional[_Piece]) -> int:
+    return node.total_newlines if node is not None else 0
+
+
+def _newline_offsets(text: str) -> List[int]:
+    """Return the offsets of every newline in text."""
+    offsets = []
+    index = text.find("\n")
+    while index != -1:
+        offsets.append(index)
+        index = text.find("\n", index + 1)
+    return offsets
+
+
+class TextDocument:
+    """Piece-table text document with a line index.
+
+    Text is never copied on edit: the original content and every inserted
+    fragment are kept as immutable buffers, and the document is the in-order
+    sequence of pieces referencing them. ``text()`` materializes the content
+    and caches it until the next edit; ``compact()`` folds all pieces back
+    into a single buffer.
+    """
+
+    def __init__(self, text: str = "", seed: Optional[int] = None):
+        """Initialize document.
+
+        Args:
+            text: Initial content
+            seed: Optional seed for treap priorities
+        """
+        self._random = random.Random(seed)
+        self.reset(text)
+
+    def reset(self, text: str) -> None:
+        """Replace the whole document content.
+
+        Args:
+            text: New content
+        """
+        self._buffers: List[str] = []
+        self._buffer_newlines: List[List[int]] = []
+        self._root = self._new_piece(text) if text else None
+        self._text: Optional[str] = text
+
+    def __len__(self) -> int:
+        return _length(self._root)
+
+    def __str__(self) -> str:
+        return self.text()
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the document."""
+        return _newlines(self._root) + 1
+
+    @property
+    def piece_count(self) -> int:
+        """Number of pieces currently making up the document."""
+        count = 0
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        return count
+
+    def text(self) -> str:
+        """Return the document content.
+
+        Returns:
+            Document text
+        """
+        if self._text is None:
+            self._text = self.slice(0, len(self))
+        return self._text
+
+    def slice(self, start: int, end: int) -> str:
+        """Return the text between two offsets.
+
+        Args:
+            start: Start offset (inclusive)
+            end: End offset (exclusive)
+
+        Returns:
+            Text in the range
+        """
+        start, end = self._clamp(start), self._clamp(end)
+        if start >= end:
+            return ""
+        if self._text is not None:
+            return self._text[start:end]
+
+        parts: List[str] = []
+        self._collect(self._root, 0, start, end, parts)
+        return "".join(parts)
+
+    def insert(self, position: int, text: str) -> None:
+        """Insert text at an offset.
+
+        Args:
+            position: Offset to insert at (clamped to the document)
+            text: Text to insert
+        """
+        if not text:
+            return
+        left, right = self._split(self._root, self._clamp(position))
+        self._root = self._merge(self._merge(left, self._new_piece(text)), right)
+        self._text = None
+
+    def delete(self, position: int, length: int) -> None:
+        """Delete a range of text.
+
+        Args:
+            position: Start offset (clamped to the document)
+            length: Number of characters to delete
+        """
+        position = self._clamp(position)
+        end = self._clamp(position + max(length, 0))
+        if end <= position:
+            return
+        left, rest = self._split(self._root, position)
+        _, right = self._split(rest, end - position)
+        self._root = self._merge(left, right)
+        self._text = None
+
+    def replace(self, position: int, length: int, text: str) -> None:
+        """Replace a range of text.
+
+        Args:
+            position: Start offset
+            length: Number of characters to replace
+            text: Replacement text
+        """
+        self.delete(position, length)
+        self.insert(position, text)
+
+    def compact(self) -> None:
+        """Fold all pieces into a single buffer."""
+        self.reset(self.text())
+
+    def line_start(self, line: int) -> int:
+        """Return the offset of the first character of a line.
+
+        Args:
+            line: Zero-based line number
+
+        Returns:
+            Offset of the line start
+        """
+        if line <= 0:
+            return 0
+        if line > _newlines(self._root):
+            return len(self)
+
+        node, base, remaining = self._root, 0, line
+        while node is not None:
+            left_newlines = _newlines(node.left)
+            if remaining <= left_newlines:
+                node = node.left
+                continue
+            remaining -= left_newlines
+            base += _length(node.left)
+            if remaining <= node.newlines:
+                offsets = self._buffer_newlines[node.buffer]
+                index = bisect_left(offsets, node.start) + remaining - 1
+                return base + offsets[index] - node.start + 1
+            remaining -= node.newlines
+            base += node.length
+            node = node.right
+        return len(self)
+
+    def offset_to_position(self, offset: int) -> Tuple[int, int]:
+        """Convert an offset to a line and column.
+
+        Args:
+            offset: Character offset
+
+        Returns:
+            Tuple of zero-based (line, column)
+        """
+        offset = self._clamp(offset)
+        node, remaining, line = self._root, offset, 0
+        while node is not None:
+            left_length = _length(node.left)
+            if remaining < left_length:
+                node = node.left
+                continue
+            line += _newlines(node.left)
+            remaining -= left_length
+            if remaining < node.length:
+                line += self._count_newlines(node.buffer, node.start, node.start + remaining)
+                break
+            line += node.newlines
+            remaining -= node.length
+            node = node.right
+        return line, offset - self.line_start(line)
+
+    def position_to_offset(self, line: int, column: int) -> int:
+        """Convert a line and column to an offset.
+
+        Args:
+            line: Zero-based line number
+            column: Zero-based column
+
+        Returns:
+            Character offset, clamped to the end of the line
+        """
+        start = self.line_start(line)
+        end = self.line_start(line + 1)
+        if line + 1 <= _newlines(self._root):
+            end -= 1
+        return min(start + max(column, 0), end)
+
+    # Helper methods
+
+    def _clamp(self, offset: int) -> int:
+        return min(max(offset, 0), len(self))
+
+    def _count_newlines(self, buffer: int, start: int, end: int) -> int:
+        offsets = self._buffer_newlines[buffer]
+        return bisect_left(offsets, end) - bisect_left(offsets, start)
+
+    def _collect(self, node: Optional[_Piece], base: int, start: int, end: int, parts: List[str]) -> None:
+        """Append the text of pieces overlapping [start, end) in order."""
+        if node is None or base >= end or base + node.total_length <= start:
+            return
+        self._collect(node.left, base, start, end, parts)
+        piece_start = base + _length(node.left)
+        piece_end = piece_start + node.length
+        if piece_start < end and piece_end > start:
+            lo = max(start, piece_start) - piece_start + node.start
+            hi = min(end, piece_end) - piece_start + node.start
+            parts.append(self._buffers[node.buffer][lo:hi])
+        self._collect(node.right, piece_end, start, end, parts)
+
+    def _new_piece(self, text: str) -> _Piece:
+        self._buffers.append(text)
+        offsets = _newline_offsets(text)
+        self._buffer_newlines.append(offsets)
+        return _Piece(len(self._buffers) - 1, 0, len(text), len(offsets), self._random.random())
+
+    def _split_piece(self, node: _Piece, offset: int) -> Tuple[_Piece, _Piece]:
+        head = _Piece(
+            node.buffer,
+            node.start,
+            offset,
+            self._count_newlines(node.buffer, node.start, node.start + offset),
+            node.priority,
+        )
+        tail = _Piece(
+            node.buffer,
+            node.start + offset,
+            node.length - offset,
+            node.newlines - head.newlines,
+            self._random.random(),
+        )
+        return head, tail
+
+    def _split(self, node: Optional[_Piece], offset: int) -> Tuple[Optional[_Piece], Optional[_Piece]]:
+        """Split a subtree into the first offset characters and the rest."""
+        if node is None:
+            return None, None
+        left_length = _length(node.left)
+        if offset <= left_length:
+            left, node.left = self._split(node.left, offset)
+            node.update()
+            return left, node
+        if offset >= left_length + node.length:
+            node.right, right = self._split(node.right, offset - left_length - node.length)
+            node.update()
+            return node, right
+        head, tail = self._split_piece(node, offset - left_length)
+        return self._merge(node.left, head), self._merge(tail, node.right)
+
+    def _merge(self, left: Optional[_Piece], right: Optional[_Piece]) -> Optional[_Piece]:
+        """Merge two subtrees where every piece of left precedes right."""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            left.update()
+            return left
+        right.left = self._merge(left, right.left)
+        right.update()
+        return right
@@ -8,11 +8,11 @@ import asyncio
 import logging
 import hashlib
 import json
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Callable, Dict, List, Optional, Set, Tuple, Any, Union
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
@@ -38,6 +38,13 @@ from app.file.schemas.editor_config import (
 from app.file.schemas.file_operations import FileResponse
 
 # Import utils
+from app.file.document import TextDocument
+from app.file.transform import (
+    OperationLog,
+    normalize_operations,
+    serialize_operations,
+    transform_operations,
+)
 from app.file.utils.validators import FileValidator
 from app.file.utils.processors import process_file_content
 
@@ -83,21 +90,74 @@ class ChangeOperation:
     user_id: str
 
 
+class EditorSessionState(dict):
+    """Session data whose ``"content"`` entry is backed by a TextDocument.
+
+    Reading ``"content"`` returns the document text (cached until the next
+    edit) and assigning a string replaces the document, so the session data
+    can still be used as a plain dictionary.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        content = dict.pop(self, "content", "")
+        dict.__setitem__(self, "document", TextDocument(content))
+
+    @property
+    def document(self) -> TextDocument:
+        """Document holding the session content."""
+        return dict.__getitem__(self, "document")
+
+    def __getitem__(self, key):
+        if key == "content":
+            return self.document.text()
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        if key == "content":
+            self.document.reset(value)
+        else:
+            dict.__setitem__(self, key, value)
+
+    def __contains__(self, key):
+        return key == "content" or dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        if key == "content":
+            return self.document.text()
+        return dict.get(self, key, default)
+
+
 class FileEditor:
     """Online file editor with collaboration support."""
 
-    def __init__(self, db_session: AsyncSession):
+    # Changes kept per session before history is folded into a snapshot
+    HISTORY_LIMIT = 500
+    # Committed batches kept per session for rebasing stale clients
+    OPERATION_LOG_SIZE = 200
+
+    def __init__(
+        self,
+        db_session: Optional[AsyncSession] = None,
+        history_limit: int = HISTORY_LIMIT,
+        operation_log_size: int = OPERATION_LOG_SIZE,
+    ):
         """Initialize file editor.
 
         Args:
-            db_session: Database session
+            db_session: Default database session (a shared editor passes one per call)
+            history_limit: Changes kept per session before compaction
+            operation_log_size: Committed batches kept per session for rebasing
         """
         self.db = db_session
         self.file_manager = FileManager(db_session)
         self.file_validator = FileValidator()
         self.active_sessions: Dict[UUID, EditSessionStatus] = {}
         self.session_locks: Dict[str, EditLock] = {}
-        self.session_data: Dict[UUID, Dict[str, Any]] = {}
+        self.session_data: Dict[UUID, EditorSessionState] = {}
+        self.history_limit = history_limit
+        self.operation_log_size = operation_log_size
+        self._change_handlers: List[Callable] = []
         self.collaborators: Dict[UUID, Set[str]] = {}
         self._lock = threading.RLock()
         self._executor = ThreadPoolExecutor(max_workers=5)
@@ -107,7 +167,8 @@ class FileEditor:
         file_id: UUID,
         user_id: str,
         config: Optional[EditorConfig] = None,
-        read_only: bool = False
+        read_only: bool = False,
+        db_session: Optional[AsyncSession] = None,
     ) -> EditorSessionResponse:
         """Create a new editor session.
 
@@ -116,13 +177,15 @@ class FileEditor:
             user_id: User ID
             config: Editor configuration
             read_only: Whether session is read-only
+            db_session: Database session of the request (defaults to the editor's)
 
         Returns:
             Editor session response
         """
         try:
             # Get file
-            file_response = await self.file_manager.get_file(file_id, user_id)
+            file_manager = self.file_manager if db_session is None else FileManager(db_session)
+            file_response = await file_manager.get_file(file_id, user_id)
             if not file_response:
                 raise ValueError(f"File not found: {file_id}")
 
@@ -139,7 +202,7 @@ class FileEditor:
                 config = get_default_config_for_language(language)
 
             # Create session data
-            session_data = {
+            session_data = EditorSessionState({
                 "content": "",
                 "original_content": "",
                 "cursor_position": {"line": 0, "column": 0},
@@ -149,7 +212,10 @@ class FileEditor:
                 "last_saved_content": "",
                 "dirty": False,
                 "version": 1,
-            }
+                "snapshot": None,
+                "compacted_changes": 0,
+                "operation_log": OperationLog(self.operation_log_size),
+            })
 
             # Load file content if exists
             if file_response.is_text_file:
@@ -272,51 +338,50 @@ class FileEditor:
                 if not session_data:
                     return False, "Session data not found", {}
 
-                # Check version
-                if version != session_data["version"]:
-                    return False, "Version conflict", {
-                        "server_version": session_data["version"],
-                        "client_version": version
-                    }
-
             # Check if user is collaborator
             if user_id not in self.collaborators.get(session_id, set()):
                 return False, "User not authorized", {}
 
-            # Apply changes
-            current_content = session_data["content"]
-            operations_applied = 0
-
-            for change in changes:
-                try:
-                    current_content = await self._apply_change_operation(
-                        current_content,
-                        change
-                    )
-                    operations_applied += 1
-                except Exception as e:
-                    logger.error(f"Error applying change operation: {str(e)}")
-                    return False, f"Failed to apply change: {str(e)}", {}
+            # Reject the whole batch before touching the document
+            try:
+                operations = normalize_operations(changes)
+            except ValueError as e:
+                logger.error(f"Error applying change operation: {str(e)}")
+                return False, f"Failed to apply change: {str(e)}", {}
 
-            # Update session
             with self._lock:
-                session_data["content"] = current_content
-                session_data["changes"].extend([asdict(c) for c in changes])
-                session_data["dirty"] = True
-                session_data["version"] += 1
+                server_version = session_data["version"]
+                operation_log = session_data["operation_log"]
+
+                # Rebase stale batches onto the operations committed since
+                if version != server_version:
+                    committed = operation_log.since(version) if version < server_version else None
+                    if committed is None:
+                        return False, "Version conflict", {
+                            "server_version": server_version,
+                            "client_version": version
+                        }
+                    operations, _ = transform_operations(operations, committed)
+
+                applied = self._commit_operations(session_data, operations)
+
+            delta = serialize_operations(applied)
+            await self._notify_change_handlers(session_id, user_id, session_data["version"], delta)
 
             # Check if auto-save is needed
             should_auto_save = await self._check_auto_save(session_id)
 
             response_data = {
-                "operations_applied": operations_applied,
+                "operations_applied": len(changes),
                 "server_version": session_data["version"],
-                "content_length": len(current_content),
+                "rebased": version != server_version,
+                "operations": delta,
+                "content_length": len(session_data.document),
                 "auto_save_triggered": should_auto_save,
                 "dirty": session_data["dirty"]
             }
 
-            logger.debug(f"Changes applied to session {session_id}: {operations_applied} operations")
+            logger.debug(f"Changes applied to session {session_id}: {len(changes)} operations")
             return True, None, response_data
 
         except Exception as e:
@@ -475,7 +540,8 @@ class FileEditor:
                 if session_id not in self.session_data:
                     return []
 
-                content = self.session_data[session_id]["content"]
+                document = self.session_data[session_id].document
+                content = document.text()
 
             # Perform search
             import re
@@ -497,12 +563,13 @@ class FileEditor:
 
             matches = []
             for match in compiled_pattern.finditer(content):
+                line, column = document.offset_to_position(match.start())
                 matches.append({
                     "start": match.start(),
                     "end": match.end(),
                     "text": match.group(),
-                    "line": content[:match.start()].count('\n') + 1,
-                    "column": match.start() - content.rfind('\n', 0, match.start())
+                    "line": line + 1,
+                    "column": column + 1
                 })
 
             logger.debug(f"Search in session {session_id} found {len(matches)} matches")
@@ -544,7 +611,6 @@ class FileEditor:
                     return False, 0, "Session not found"
 
                 session_data = self.session_data[session_id]
-                content = session_data["content"]
 
             # Check authorization
             if user_id not in self.collaborators.get(session_id, set()):
@@ -567,21 +633,39 @@ class FileEditor:
             else:
                 compiled_pattern = re.compile(re.escape(pattern), flags)
 
-            if replace_all:
-                new_content, count = compiled_pattern.subn(replacement, content)
-            else:
-                match = compiled_pattern.search(content)
-                if match:
-                    new_content = content[:match.start()] + replacement + content[match.end()]
-                    count = 1
+            # Update session with one replace per match, last match first so
+            # earlier offsets stay valid
+            with self._lock:
+                content = session_data["content"]
+                if replace_all:
+                    matches = list(compiled_pattern.finditer(content))
                 else:
+                    match = compiled_pattern.search(content)
+                    matches = [match] if match else []
+                if not matches:
+                    # Nothing changed: no version, no broadcast
+                    if replace_all:
+                        return True, 0, None
                     return False, 0, "No matches found"
 
-            # Update session
-            with self._lock:
-                session_data["content"] = new_content
-                session_data["dirty"] = True
-                session_data["version"] += 1
+                timestamp = datetime.utcnow()
+                operations = normalize_operations(
+                    ChangeOperation(
+                        operation_id=str(uuid4()),
+                        type="replace",
+                        position=match.start(),
+                        length=match.end() - match.start(),
+                        content=match.expand(replacement),
+                        timestamp=timestamp,
+                        user_id=user_id,
+                    )
+                    for match in reversed(matches)
+                )
+                applied = self._commit_operations(session_data, operations)
+                count = len(matches)
+                version = session_data["version"]
+
+            await self._notify_change_handlers(session_id, user_id, version, serialize_operations(applied))
 
             logger.info(f"Replace in session {session_id}: {count} replacements by user {user_id}")
             return True, count, None
@@ -613,9 +697,10 @@ class FileEditor:
             return {
                 "session_id": str(session_id),
                 "status": self.active_sessions.get(session_id, EditSessionStatus.CLOSED).value,
-                "content_length": len(session_data["content"]),
-                "line_count": session_data["content"].count('\n') + 1,
-                "change_count": len(session_data["changes"]),
+                "content_length": len(session_data.document),
+                "line_count": session_data.document.line_count,
+                "change_count": session_data["compacted_changes"] + len(session_data["changes"]),
+                "piece_count": session_data.document.piece_count,
                 "collaborator_count": len(collaborators),
                 "collaborators": list(collaborators),
                 "is_dirty": session_data["dirty"],
@@ -670,11 +755,13 @@ class FileEditor:
 
     async def _apply_change_operation(
         self,
-        content: str,
+        content: Union[str, TextDocument],
         change: ChangeOperation
-    ) -> str:
+    ) -> Union[str, TextDocument]:
         """Apply a single change operation.
 
+        Documents are edited in place; strings are copied.
+
         Args:
             content: Current content
             change: Change operation
@@ -682,6 +769,10 @@ class FileEditor:
         Returns:
             Updated content
         """
+        if isinstance(content, TextDocument):
+            self._apply_document_change(content, change)
+            return content
+
         if change.type == "insert":
             return content[:change.position] + change.content + content[change.position:]
         elif change.type == "delete":
@@ -691,6 +782,137 @@ class FileEditor:
         else:
             raise ValueError(f"Unknown change type: {change.type}")
 
+    def _apply_document_change(self, document: TextDocument, change: ChangeOperation) -> None:
+        """Apply a single change operation to a document in place.
+
+        Args:
+            document: Session document
+            change: Change operation
+        """
+        if change.type == "insert":
+            document.insert(change.position, change.content)
+        elif change.type == "delete":
+            document.delete(change.position, change.length)
+        elif change.type == "replace":
+            document.replace(change.position, change.length, change.content)
+        else:
+            raise ValueError(f"Unknown change type: {change.type}")
+
+    def _commit_operations(
+        self,
+        session_data: EditorSessionState,
+        operations: List[ChangeOperation]
+    ) -> List[ChangeOperation]:
+        """Apply normalized operations and record them as one version.
+
+        Must be called with the editor lock held.
+
+        Args:
+            session_data: Session data
+            operations: Normalized operations based on the current version
+
+        Returns:
+            Operations as applied to the document
+        """
+        document = session_data.document
+        applied = []
+        for operation in operations:
+            operation = self._clamp_operation(document, operation)
+            self._apply_document_change(document, operation)
+            applied.append(operation)
+
+        session_data["operation_log"].append(session_data["version"], applied)
+        session_data["changes"].extend([asdict(c) for c in applied])
+        session_data["dirty"] = True
+        session_data["version"] += 1
+        self._compact_history(session_data)
+        return applied
+
+    def _clamp_operation(self, document: TextDocument, operation: ChangeOperation) -> ChangeOperation:
+        """Clamp an insert/delete primitive to the document bounds.
+
+        Args:
+            document: Session document
+            operation: Normalized change operation
+
+        Returns:
+            Operation as it will actually be applied
+        """
+        position = min(max(operation.position, 0), len(document))
+        length = operation.length
+        if operation.type == "delete":
+            length = min(length, len(document) - position)
+        if position == operation.position and length == operation.length:
+            return operation
+        return replace(operation, position=position, length=length)
+
+    def _compact_history(self, session_data: EditorSessionState) -> None:
+        """Fold the change history into a snapshot once it grows too long.
+
+        Args:
+            session_data: Session data
+        """
+        changes = session_data["changes"]
+        if len(changes) < self.history_limit:
+            return
+
+        document = session_data.document
+        document.compact()
+        content = document.text()
+        session_data["snapshot"] = {
+            "version": session_data["version"],
+            "content": content,
+            "checksum": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        session_data["compacted_changes"] += len(changes)
+        changes.clear()
+
+    def register_change_handler(self, handler: Callable) -> None:
+        """Register a handler for committed changes.
+
+        Handlers are called with (session_id, user_id, version, operations)
+        after every committed batch, where operations is the serialized delta
+        actually applied to the document.
+
+        Args:
+            handler: Sync or async handler function
+        """
+        self._change_handlers.append(handler)
+
+    def unregister_change_handler(self, handler: Callable) -> None:
+        """Unregister a change handler.
+
+        Args:
+            handler: Handler to remove
+        """
+        if handler in self._change_handlers:
+            self._change_handlers.remove(handler)
+
+    async def _notify_change_handlers(
+        self,
+        session_id: UUID,
+        user_id: str,
+        version: int,
+        operations: List[Dict[str, Any]]
+    ) -> None:
+        """Notify registered handlers of a committed batch.
+
+        Args:
+            session_id: Session ID
+            user_id: User who made the changes
+            version: Version after the batch
+            operations: Serialized operations applied
+        """
+        for handler in self._change_handlers:
+            try:
+                if asyncio.iscoroutinefunction(handler):
+                    await handler(session_id, user_id, version, operations)
+                else:
+                    handler(session_id, user_id, version, operations)
+            except Exception as e:
+                logger.error(f"Error in editor change handler: {e}")
+
     async def _check_auto_save(self, session_id: UUID) -> bool:
         """Check if auto-save should be triggered.
 
@@ -7,15 +7,18 @@ event-driven file operations with publish-subscribe pattern.
 import asyncio
 import logging
 import json
-from typing import Dict, List, Optional, Callable, Any, Set
+import time
+from typing import Deque, Dict, List, Optional, Callable, Any, Set, Union
 from datetime import datetime
 from uuid import uuid4, UUID
 from enum import Enum
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+from app.core.metrics import MetricsRegistry, metrics_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -112,6 +115,7 @@ class FileOperationEvent:
 
 
 EventHandler = Callable[[FileOperationEvent], asyncio.Future or Any]
+BatchEventHandler = Callable[[List[FileOperationEvent]], asyncio.Future or Any]
 
 
 class EventStatistics:
@@ -168,45 +172,94 @@ class EventStatistics:
 
 
 class FileOperationEventManager:
-    """File operation event manager with publish-subscribe pattern."""
+    """File operation event manager with publish-subscribe pattern.
+
+    Queued events are spread over a pool of worker coroutines, partitioned
+    by file ID so events for the same file are always handled in publish
+    order. Each worker drains up to ``max_batch_size`` queued events at a
+    time; handlers registered with ``batch=True`` receive them as one list.
+    """
 
-    def __init__(self, max_workers: int = 10):
+    def __init__(
+        self,
+        max_workers: int = 10,
+        num_workers: int = 4,
+        max_queue_size: int = 10000,
+        max_history_size: int = 10000,
+        max_batch_size: int = 100,
+        registry: Optional[MetricsRegistry] = None,
+    ):
         """Initialize event manager.
 
         Args:
-            max_workers: Maximum number of worker threads for async operations
+            max_workers: Maximum number of worker threads for sync handlers
+            num_workers: Number of event worker coroutines (queue partitions)
+            max_queue_size: Total capacity of the event queues
+            max_history_size: Number of events kept in history
+            max_batch_size: Maximum events a worker handles per batch
+            registry: Metrics registry (defaults to the global registry)
         """
         self._handlers: Dict[EventType, List[EventHandler]] = defaultdict(list)
         self._global_handlers: List[EventHandler] = []
-        self._event_history: List[FileOperationEvent] = []
-        self._max_history_size = 10000
+        self._batch_handlers: Dict[EventType, List[BatchEventHandler]] = defaultdict(list)
+        self._global_batch_handlers: List[BatchEventHandler] = []
+        self._handler_names: Dict[Any, str] = {}
+        self._event_history: Deque[FileOperationEvent] = deque(maxlen=max_history_size)
+        self._max_history_size = max_history_size
         self._statistics = EventStatistics()
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._lock = threading.RLock()
-        self._event_queue = asyncio.Queue(maxsize=10000)
+        self._num_workers = max(1, num_workers)
+        self._max_batch_size = max(1, max_batch_size)
+        partition_size = max(1, max_queue_size // self._num_workers)
+        self._event_queues: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=partition_size) for _ in range(self._num_workers)
+        ]
         self._running = False
-        self._worker_task: Optional[asyncio.Task] = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+        registry = registry if registry is not None else metrics_registry
+        queue_depth = registry.histogram(
+            "file_event_queue_depth",
+            "Events already waiting in a worker partition when an event is queued",
+        )
+        self._queue_depth = [
+            queue_depth.labels({"partition": str(index)})
+            for index in range(self._num_workers)
+        ]
+        self._handler_duration = registry.histogram(
+            "file_event_handler_duration_seconds",
+            "Time spent in a single file event handler call",
+            unit="seconds",
+        )
 
     async def start(self):
         """Start the event manager."""
         if not self._running:
             self._running = True
-            self._worker_task = asyncio.create_task(self._event_worker())
-            logger.info("FileOperationEventManager started")
+            self._worker_tasks = [
+                asyncio.create_task(self._event_worker(queue))
+                for queue in self._event_queues
+            ]
+            logger.info(
+                f"FileOperationEventManager started with {self._num_workers} workers"
+            )
 
     async def stop(self):
         """Stop the event manager."""
         if self._running:
             self._running = False
-            if self._worker_task:
-                self._worker_task.cancel()
-                try:
-                    await self._worker_task
-                except asyncio.CancelledError:
-                    pass
+            for task in self._worker_tasks:
+                task.cancel()
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+            self._worker_tasks = []
             self._executor.shutdown(wait=True)
             logger.info("FileOperationEventManager stopped")
 
+    async def wait_until_idle(self):
+        """Wait until every queued event has been processed."""
+        await asyncio.gather(*(queue.join() for queue in self._event_queues))
+
     async def publish_event(
         self,
         event_type: EventType,
@@ -239,7 +292,10 @@ class FileOperationEventManager:
         )
 
         if async_mode:
-            await self._event_queue.put(event)
+            partition = self._partition(event)
+            queue = self._event_queues[partition]
+            self._queue_depth[partition].record(queue.qsize())
+            await queue.put(event)
         else:
             await self._process_event(event)
 
@@ -489,8 +545,9 @@ class FileOperationEventManager:
     def register_handler(
         self,
         event_type: EventType,
-        handler: EventHandler,
-        handler_name: Optional[str] = None
+        handler: Union[EventHandler, BatchEventHandler],
+        handler_name: Optional[str] = None,
+        batch: bool = False
     ):
         """Register event handler for specific event type.
 
@@ -498,23 +555,36 @@ class FileOperationEventManager:
             event_type: Event type to handle
             handler: Handler function
             handler_name: Name of the handler (for statistics)
+            batch: Whether the handler takes a list of events per call
         """
         with self._lock:
-            self._handlers[event_type].append(handler)
+            handlers = self._batch_handlers if batch else self._handlers
+            handlers[event_type].append(handler)
+            if handler_name:
+                self._handler_names[handler] = handler_name
             logger.debug(f"Handler registered for {event_type.value}")
 
-    def register_global_handler(self, handler: EventHandler, handler_name: Optional[str] = None):
+    def register_global_handler(
+        self,
+        handler: Union[EventHandler, BatchEventHandler],
+        handler_name: Optional[str] = None,
+        batch: bool = False
+    ):
         """Register global event handler.
 
         Args:
             handler: Handler function
             handler_name: Name of the handler (for statistics)
+            batch: Whether the handler takes a list of events per call
         """
         with self._lock:
-            self._global_handlers.append(handler)
+            handlers = self._global_batch_handlers if batch else self._global_handlers
+            handlers.append(handler)
+            if handler_name:
+                self._handler_names[handler] = handler_name
             logger.debug("Global handler registered")
 
-    def unregister_handler(self, event_type: EventType, handler: EventHandler):
+    def unregister_handler(self, event_type: EventType, handler: Union[EventHandler, BatchEventHandler]):
         """Unregister event handler.
 
         Args:
@@ -522,33 +592,63 @@ class FileOperationEventManager:
             handler: Handler function
         """
         with self._lock:
-            if handler in self._handlers[event_type]:
-                self._handlers[event_type].remove(handler)
-                logger.debug(f"Handler unregistered for {event_type.value}")
+            for handlers in (self._handlers[event_type], self._batch_handlers[event_type]):
+                if handler in handlers:
+                    handlers.remove(handler)
+                    logger.debug(f"Handler unregistered for {event_type.value}")
 
-    def unregister_global_handler(self, handler: EventHandler):
+    def unregister_global_handler(self, handler: Union[EventHandler, BatchEventHandler]):
         """Unregister global event handler.
 
         Args:
             handler: Handler function
         """
         with self._lock:
-            if handler in self._global_handlers:
-                self._global_handlers.remove(handler)
-                logger.debug("Global handler unregistered")
+            for handlers in (self._global_handlers, self._global_batch_handlers):
+                if handler in handlers:
+                    handlers.remove(handler)
+                    logger.debug("Global handler unregistered")
+
+    def _partition_key(self, event: FileOperationEvent) -> Any:
+        """Get the key whose events must be handled in order."""
+        if event.file_id is not None:
+            return event.file_id
+        return event.data.get("operation_id") or event.event_id
+
+    def _partition(self, event: FileOperationEvent) -> int:
+        """Get the worker partition of an event."""
+        return hash(self._partition_key(event)) % self._num_workers
+
+    async def _event_worker(self, queue: asyncio.Queue):
+        """Background worker processing one queue partition in batches.
 
-    async def _event_worker(self):
-        """Background worker to process events."""
+        Args:
+            queue: Partition queue to consume
+        """
         while self._running:
             try:
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-                await self._process_event(event)
+                event = await asyncio.wait_for(queue.get(), timeout=1.0)
             except asyncio.TimeoutError:
                 continue
             except asyncio.CancelledError:
                 break
+
+            batch = [event]
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._process_batch(batch)
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"Error in event worker: {str(e)}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
 
     async def _process_event(self, event: FileOperationEvent):
         """Process a single event.
@@ -556,54 +656,101 @@ class FileOperationEventManager:
         Args:
             event: Event to process
         """
-        start_time = asyncio.get_event_loop().time()
+        await self._process_batch([event])
 
-        try:
-            # Record event statistics
-            self._statistics.record_event(event)
+    async def _process_batch(self, events: List[FileOperationEvent]):
+        """Process a batch of events.
 
-            # Add to history
-            self._add_to_history(event)
+        Per-event handlers run concurrently across files but sequentially
+        for the events of one file. Batch handlers get every matching event
+        of the batch in a single call.
 
-            # Get handlers
-            handlers = self._handlers.get(event.event_type, []) + self._global_handlers
+        Args:
+            events: Events in publish order
+        """
+        start_time = time.perf_counter()
 
-            if not handlers:
-                logger.debug(f"No handlers registered for {event.event_type.value}")
+        try:
+            for event in events:
+                self._statistics.record_event(event)
+            self._add_to_history(events)
+
+            with self._lock:
+                global_handlers = list(self._global_handlers)
+                global_batch_handlers = list(self._global_batch_handlers)
+                handlers = {
+                    event_type: list(self._handlers.get(event_type, ())) + global_handlers
+                    for event_type in {event.event_type for event in events}
+                }
+                batch_handlers = {
+                    event_type: list(self._batch_handlers.get(event_type, ())) + global_batch_handlers
+                    for event_type in handlers
+                }
+
+            runs: Dict[Any, List[FileOperationEvent]] = defaultdict(list)
+            deliveries: Dict[Any, List[FileOperationEvent]] = {}
+            for event in events:
+                if handlers[event.event_type]:
+                    runs[self._partition_key(event)].append(event)
+                for handler in batch_handlers[event.event_type]:
+                    deliveries.setdefault(handler, []).append(event)
+
+            if not runs and not deliveries:
+                logger.debug(f"No handlers registered for {len(events)} events")
                 return
 
-            # Execute handlers
-            tasks = []
-            for handler in handlers:
-                handler_name = getattr(handler, '__name__', str(handler))
-                task = asyncio.create_task(
-                    self._execute_handler(handler, event, handler_name)
-                )
-                tasks.append(task)
-
-            # Wait for all handlers to complete
+            tasks = [self._process_run(run, handlers) for run in runs.values()]
+            tasks.extend(
+                self._execute_handler(handler, batch, self._get_handler_name(handler))
+                for handler, batch in deliveries.items()
+            )
             await asyncio.gather(*tasks, return_exceptions=True)
 
         except Exception as e:
-            logger.error(f"Error processing event {event.event_id}: {str(e)}")
+            logger.error(f"Error processing {len(events)} events: {str(e)}")
         finally:
-            duration = asyncio.get_event_loop().time() - start_time
-            logger.debug(f"Event {event.event_id} processed in {duration:.3f}s")
+            duration = time.perf_counter() - start_time
+            logger.debug(f"{len(events)} events processed in {duration:.3f}s")
+
+    async def _process_run(
+        self,
+        events: List[FileOperationEvent],
+        handlers: Dict[EventType, List[EventHandler]]
+    ):
+        """Run per-event handlers over events that must stay in order.
+
+        Args:
+            events: Events of one partition key in publish order
+            handlers: Per-event handlers by event type
+        """
+        for event in events:
+            await asyncio.gather(
+                *(
+                    self._execute_handler(handler, event, self._get_handler_name(handler))
+                    for handler in handlers[event.event_type]
+                ),
+                return_exceptions=True,
+            )
+
+    def _get_handler_name(self, handler: Any) -> str:
+        """Get the statistics name of a handler."""
+        name = self._handler_names.get(handler)
+        return name or getattr(handler, '__name__', str(handler))
 
     async def _execute_handler(
         self,
-        handler: EventHandler,
-        event: FileOperationEvent,
+        handler: Union[EventHandler, BatchEventHandler],
+        event: Union[FileOperationEvent, List[FileOperationEvent]],
         handler_name: str
     ):
         """Execute a single handler.
 
         Args:
             handler: Handler function
-            event: Event to process
+            event: Event to process, or list of events for batch handlers
             handler_name: Handler name for statistics
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
 
         try:
             # Check if handler is async
@@ -611,29 +758,27 @@ class FileOperationEventManager:
                 await handler(event)
             else:
                 # Run sync handler in thread pool
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 await loop.run_in_executor(self._executor, handler, event)
 
-            duration = asyncio.get_event_loop().time() - start_time
+            duration = time.perf_counter() - start_time
             self._statistics.record_handler_execution(handler_name, duration, True)
 
         except Exception as e:
-            duration = asyncio.get_event_loop().time() - start_time
+            duration = time.perf_counter() - start_time
             self._statistics.record_handler_execution(handler_name, duration, False, e)
             logger.error(f"Error in handler {handler_name}: {str(e)}", exc_info=True)
 
-    def _add_to_history(self, event: FileOperationEvent):
-        """Add event to history.
+        self._handler_duration.labels({"handler": handler_name}).record(duration)
+
+    def _add_to_history(self, events: List[FileOperationEvent]):
+        """Add events to history.
 
         Args:
-            event: Event to add
+            events: Events to add
         """
         with self._lock:
-            self._event_history.append(event)
-
-            # Trim history if needed
-            if len(self._event_history) > self._max_history_size:
-                self._event_history = self._event_history[-self._max_history_size:]
+            self._event_history.extend(events)
 
     def get_event_history(
         self,
@@ -654,20 +799,22 @@ class FileOperationEventManager:
             List of filtered events
         """
         with self._lock:
-            events = self._event_history
-
-            # Apply filters
-            if event_type:
-                events = [e for e in events if e.event_type == event_type]
-
-            if file_id:
-                events = [e for e in events if e.file_id == file_id]
-
-            if user_id:
-                events = [e for e in events if e.user_id == user_id]
-
-            # Return most recent events
-            return events[-limit:]
+            events = []
+            # Scan from the newest event so only the requested tail is visited
+            for event in reversed(self._event_history):
+                if event_type and event.event_type != event_type:
+                    continue
+                if file_id and event.file_id != file_id:
+                    continue
+                if user_id and event.user_id != user_id:
+                    continue
+                events.append(event)
+                if limit and len(events) >= limit:
+                    break
+
+        # Return most recent events, oldest first
+        events.reverse()
+        return events
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get event manager statistics.
@@ -689,7 +836,15 @@ class FileOperationEventManager:
         Returns:
             Queue size
         """
-        return self._event_queue.qsize()
+        return sum(queue.qsize() for queue in self._event_queues)
+
+    def get_queue_sizes(self) -> List[int]:
+        """Get current size of each worker partition.
+
+        Returns:
+            Queue size per partition
+        """
+        return [queue.qsize() for queue in self._event_queues]
 
 
 # Global event manager instance
@@ -708,18 +863,25 @@ def get_event_manager() -> FileOperationEventManager:
     return _event_manager
 
 
-async def initialize_event_manager(max_workers: int = 10) -> FileOperationEventManager:
+async def initialize_event_manager(
+    max_workers: int = 10,
+    num_workers: int = 4
+) -> FileOperationEventManager:
     """Initialize global event manager.
 
     Args:
         max_workers: Maximum worker threads
+        num_workers: Number of event worker coroutines
 
     Returns:
         Event manager instance
     """
     global _event_manager
     if _event_manager is None:
-        _event_manager = FileOperationEventManager(max_workers=max_workers)
+        _event_manager = FileOperationEventManager(
+            max_workers=max_workers,
+            num_workers=num_workers
+        )
     await _event_manager.start()
     return _event_manager
 
@@ -792,3 +954,22 @@ def event_handler(event_type: EventType):
         manager.register_handler(event_type, func, func.__name__)
         return func
     return decorator
+
+
+def batch_event_handler(event_type: EventType):
+    """Decorator for registering batch event handlers.
+
+    Args:
+        event_type: Event type to handle
+
+    Usage:
+        @batch_event_handler(EventType.FILE_ACCESSED)
+        async def handle_file_accesses(events):
+            print(f"{len(events)} files accessed")
+    """
+    def decorator(func: BatchEventHandler) -> BatchEventHandler:
+        # Register handler
+        manager = get_event_manager()
+        manager.register_handler(event_type, func, func.__name__, batch=True)
+        return func
+    return decorator
@@ -6,12 +6,13 @@ operations including CRUD, search, filtering, permissions, and bulk operations.
 
 import logging
 import asyncio
+import functools
 from typing import Optional, List, Dict, Any, Union, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, not_
+from sqlalchemy import select, update, func, and_, or_, not_
 from sqlalchemy.orm import selectinload
 
 # Import models
@@ -37,6 +38,9 @@ from app.file.schemas.file_operations import (
     FileCopy,
 )
 
+# Import search backend
+from app.file.search import get_file_search_backend
+
 # Import utils
 from app.file.utils.validators import FileValidator, BusinessRuleValidator
 from app.file.utils.formatters import format_file_size, format_timestamp
@@ -45,6 +49,15 @@ from app.file.utils.processors import calculate_checksum
 
 logger = logging.getLogger(__name__)
 
+# Permission required on every file of a bulk operation
+BULK_OPERATION_PERMISSIONS = {
+    "delete": PermissionType.DELETE,
+    "move": PermissionType.WRITE,
+    "copy": PermissionType.READ,
+    "update": PermissionType.WRITE,
+    "tag": PermissionType.WRITE,
+}
+
 
 class FileManager:
     """File manager for handling file operations."""
@@ -131,6 +144,7 @@ class FileManager:
             self.db.add(file)
             await self.db.commit()
             await self.db.refresh(file)
+            await get_file_search_backend(self.db).index_files(self.db, [file.id])
 
             logger.info(f"File created: {file.id} by user {user_id}")
             return FileResponse.model_validate(file)
@@ -236,6 +250,7 @@ class FileManager:
 
             await self.db.commit()
             await self.db.refresh(file)
+            await get_file_search_backend(self.db).index_files(self.db, [file.id])
 
             logger.info(f"File updated: {file_id} by user {user_id}")
             return FileResponse.model_validate(file)
@@ -274,6 +289,8 @@ class FileManager:
                 file.soft_delete()
 
             await self.db.commit()
+            if delete_data.permanent:
+                get_file_search_backend(self.db).remove_files([file_id])
 
             logger.info(f"File {'permanently deleted' if delete_data.permanent else 'deleted'}: {file_id} by user {user_id}")
             return True
@@ -409,59 +426,61 @@ class FileManager:
     async def search_files(self, search: FileSearch, user_id: str) -> FileSearchResult:
         """Search files.
 
+        Names, tags and descriptions are matched by the search backend
+        instead of LIKE scans of the files table: full-text indexes on
+        PostgreSQL, the in-process index elsewhere. Matches are ordered by
+        relevance unless a sort field is given; ``next_cursor`` of the
+        result continues after its last file. Pages may come back short
+        when filters reject most matches, so clients should page by cursor.
+
         Args:
             search: Search parameters
             user_id: User ID
 
         Returns:
             Search results
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
         try:
             start_time = datetime.utcnow()
 
-            # Build search query
+            # Build filtered query the search matches are taken from
             query = select(File)
-
-            # Apply text search
-            if search.query:
-                search_filter = or_(
-                    File.name.ilike(f"%{search.query}%"),
-                    File.description.ilike(f"%{search.query}%"),
-                    File.tags.contains(search.query)
-                )
-                query = query.filter(search_filter)
-
-            # Apply filters
             if search.filters:
-                query = self._apply_filters(query, search.filters)
+                query = await self._apply_filters(query, search.filters)
 
             # Apply user permissions
             permission_filter = await self._get_user_file_filter(user_id)
-            if permission_filter:
+            if permission_filter is not None:
                 query = query.filter(permission_filter)
 
-            # Apply ordering
-            order_field = getattr(File, search.sort_by or "created_at", File.created_at)
-            if search.sort_order.lower() == "desc":
-                query = query.order_by(order_field.desc())
+            backend = get_file_search_backend(self.db)
+            skip = 0 if search.cursor else (search.page - 1) * search.page_size
+            if search.sort_by:
+                page = await backend.search_sorted(
+                    self.db,
+                    query,
+                    search.query,
+                    search.sort_by,
+                    (search.sort_order or "desc").lower() == "desc",
+                    search.page_size,
+                    cursor=search.cursor,
+                    skip=skip,
+                )
             else:
-                query = query.order_by(order_field.asc())
-
-            # Get total count
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar()
-
-            # Apply pagination
-            offset = (search.page - 1) * search.page_size
-            query = query.offset(offset).limit(search.page_size)
-
-            # Execute query
-            result = await self.db.execute(query)
-            files = result.scalars().all()
+                page = await backend.search(
+                    self.db,
+                    query,
+                    search.query,
+                    search.page_size,
+                    cursor=search.cursor,
+                    skip=skip,
+                )
 
             # Convert to responses
-            file_responses = [FileResponse.model_validate(file) for file in files]
+            file_responses = [FileResponse.model_validate(file) for file in page.files]
 
             # Calculate search time
             end_time = datetime.utcnow()
@@ -469,10 +488,12 @@ class FileManager:
 
             return FileSearchResult(
                 files=file_responses,
-                total=total,
+                total=page.total,
+                total_is_estimate=page.total_is_estimate,
                 page=search.page,
                 page_size=search.page_size,
-                pages=(total + search.page_size - 1) // search.page_size,
+                pages=(page.total + search.page_size - 1) // search.page_size,
+                next_cursor=page.next_cursor,
                 query=search.query,
                 search_time=search_time
             )
@@ -484,6 +505,10 @@ class FileManager:
     async def bulk_operation(self, operation: FileBulkOperation, user_id: str) -> FileBulkResult:
         """Perform bulk file operation.
 
+        Files are processed in batches of set-based statements inside a
+        single transaction. Files that are missing, not permitted or cannot
+        be changed are reported as errors without failing the operation.
+
         Args:
             operation: Bulk operation data
             user_id: User ID
@@ -497,13 +522,16 @@ class FileManager:
             errors = []
 
             # Process files in batches
-            batch_size = 100
+            batch_size = 500
             for i in range(0, len(operation.file_ids), batch_size):
                 batch = operation.file_ids[i:i + batch_size]
                 batch_results, batch_errors = await self._process_batch(operation, batch, user_id)
                 results.extend(batch_results)
                 errors.extend(batch_errors)
 
+            await self.db.commit()
+            await self._update_search_index(operation, results)
+
             # Calculate execution time
             end_time = datetime.utcnow()
             execution_time = (end_time - start_time).total_seconds()
@@ -512,6 +540,11 @@ class FileManager:
             successful = len(results)
             failed = len(errors)
 
+            logger.info(
+                f"Bulk {operation.operation} by user {user_id}: "
+                f"{successful} succeeded, {failed} failed"
+            )
+
             return FileBulkResult(
                 operation=operation.operation,
                 total_files=len(operation.file_ids),
@@ -523,9 +556,18 @@ class FileManager:
             )
 
         except Exception as e:
+            await self.db.rollback()
             logger.error(f"Error in bulk operation: {str(e)}")
             raise
 
+    async def _update_search_index(self, operation: FileBulkOperation, results: List[Dict[str, Any]]):
+        """Bring the files changed by a committed bulk operation into the search index."""
+        backend = get_file_search_backend(self.db)
+        if operation.operation == "copy":
+            await backend.index_files(self.db, [result["new_file_id"] for result in results])
+        elif operation.operation in ("update", "tag"):
+            await backend.index_files(self.db, [result["file_id"] for result in results])
+
     async def move_file(self, file_id: UUID, move_data: FileMove, user_id: str) -> Optional[FileResponse]:
         """Move file to new location.
 
@@ -559,6 +601,7 @@ class FileManager:
 
             await self.db.commit()
             await self.db.refresh(file)
+            await get_file_search_backend(self.db).index_files(self.db, [file.id])
 
             logger.info(f"File moved: {file_id} by user {user_id}")
             return FileResponse.model_validate(file)
@@ -613,6 +656,7 @@ class FileManager:
             self.db.add(new_file)
             await self.db.commit()
             await self.db.refresh(new_file)
+            await get_file_search_backend(self.db).index_files(self.db, [new_file.id])
 
             logger.info(f"File copied: {file_id} to {new_file.id} by user {user_id}")
             return FileResponse.model_validate(new_file)
@@ -784,35 +828,309 @@ class FileManager:
         )
 
     async def _process_batch(self, operation: FileBulkOperation, file_ids: List[UUID], user_id: str):
-        """Process a batch of files for bulk operation."""
+        """Process a batch of files for bulk operation.
+
+        Permissions for the whole batch are checked with one query and the
+        change is applied with set-based UPDATEs, or executemany statements
+        where values differ per file. The caller commits.
+
+        Returns:
+            Tuple of (results, errors) in input order
+        """
+        required_permission = BULK_OPERATION_PERMISSIONS.get(operation.operation)
+        if required_permission is None:
+            raise ValueError(f"Unsupported operation: {operation.operation}")
+
+        file_ids = list(dict.fromkeys(file_ids))
+        files, failures = await self._get_bulk_files(file_ids, user_id, required_permission)
+
+        # IDs of the copies, by original file ID
+        copies: Dict[UUID, UUID] = {}
+        if files:
+            handlers = {
+                "delete": self._bulk_delete,
+                "move": self._bulk_move,
+                "copy": functools.partial(self._bulk_copy, copies=copies),
+                "update": self._bulk_update,
+                "tag": self._bulk_tag,
+            }
+            failures.update(await handlers[operation.operation](operation, files, user_id))
+
         results = []
         errors = []
-
         for file_id in file_ids:
-            try:
-                if operation.operation == "delete":
-                    success = await self.delete_file(file_id, user_id, FileDelete())
-                elif operation.operation == "move":
-                    success = await self.move_file(file_id, FileMove(**operation.target_folder_id), user_id)
-                elif operation.operation == "copy":
-                    success = await self.copy_file(file_id, FileCopy(**operation.target_folder_id), user_id)
-                else:
-                    raise ValueError(f"Unsupported operation: {operation.operation}")
-
-                results.append({
-                    "file_id": str(file_id),
-                    "status": "success",
-                    "message": "Operation completed successfully"
-                })
-            except Exception as e:
+            if file_id in failures:
                 errors.append({
                     "file_id": str(file_id),
                     "status": "error",
-                    "message": str(e)
+                    "message": failures[file_id]
                 })
+            else:
+                result = {
+                    "file_id": str(file_id),
+                    "status": "success",
+                    "message": "Operation completed successfully"
+                }
+                if file_id in copies:
+                    result["new_file_id"] = str(copies[file_id])
+                results.append(result)
 
         return results, errors
 
+    async def _get_bulk_files(
+        self,
+        file_ids: List[UUID],
+        user_id: str,
+        required_permission: PermissionType,
+    ) -> Tuple[Dict[UUID, Any], Dict[UUID, str]]:
+        """Load a set of files and check permissions with a single query.
+
+        Args:
+            file_ids: File IDs
+            user_id: User ID
+            required_permission: Permission needed on every file
+
+        Returns:
+            Tuple of (permitted file rows by ID, error messages by ID)
+        """
+        granted = (
+            select(FilePermission.id)
+            .where(
+                and_(
+                    FilePermission.file_id == File.id,
+                    FilePermission.is_active == True,
+                    FilePermission.permission_type == required_permission.value,
+                    or_(
+                        FilePermission.user_id == user_id,
+                        FilePermission.group_id.in_(await self._get_user_groups(user_id))
+                    )
+                )
+            )
+            .exists()
+        )
+        conditions = [File.owner_id == user_id, granted]
+        if required_permission == PermissionType.READ:
+            conditions.append(File.is_public == True)
+
+        query = select(
+            File.id,
+            File.name,
+            File.path,
+            File.tags,
+            or_(*conditions).label("allowed"),
+        ).where(File.id.in_(file_ids))
+        result = await self.db.execute(query)
+        rows = {row.id: row for row in result.all()}
+
+        files = {}
+        failures = {}
+        for file_id in file_ids:
+            row = rows.get(file_id)
+            if row is None:
+                failures[file_id] = "File not found"
+            elif not row.allowed:
+                failures[file_id] = "Permission denied"
+            else:
+                files[file_id] = row
+
+        return files, failures
+
+    async def _get_taken_paths(self, paths: List[str]) -> set:
+        """Get which of the given paths are already used by a file."""
+        if not paths:
+            return set()
+        result = await self.db.execute(select(File.path).where(File.path.in_(paths)))
+        return set(result.scalars().all())
+
+    async def _get_taken_storage_keys(self, storage_keys: List[str]) -> set:
+        """Get which of the given storage keys are already used by a file.
+
+        New files also use their storage key as path, so keys taken as a
+        path count as well.
+        """
+        if not storage_keys:
+            return set()
+        result = await self.db.execute(
+            select(File.storage_key, File.path).where(
+                or_(File.storage_key.in_(storage_keys), File.path.in_(storage_keys))
+            )
+        )
+        wanted = set(storage_keys)
+        return {value for row in result.all() for value in row if value in wanted}
+
+    async def _bulk_delete(self, operation: FileBulkOperation, files: Dict[UUID, Any], user_id: str) -> Dict[UUID, str]:
+        """Soft delete files with one UPDATE."""
+        now = datetime.utcnow()
+        await self.db.execute(
+            update(File)
+            .where(File.id.in_(list(files)))
+            .values(is_deleted=True, deleted_at=now, status=FileStatus.DELETED, updated_at=now)
+        )
+        return {}
+
+    async def _bulk_move(self, operation: FileBulkOperation, files: Dict[UUID, Any], user_id: str) -> Dict[UUID, str]:
+        """Move files into a folder and/or under a target path."""
+        if not operation.target_folder_id and not operation.target_path:
+            raise ValueError("Move requires target_folder_id or target_path")
+
+        now = datetime.utcnow()
+        if not operation.target_path:
+            await self.db.execute(
+                update(File)
+                .where(File.id.in_(list(files)))
+                .values(folder_id=operation.target_folder_id, updated_at=now)
+            )
+            return {}
+
+        # Paths differ per file, so update by primary key with executemany
+        target = operation.target_path.rstrip("/")
+        new_paths = {file_id: f"{target}/{row.name}" for file_id, row in files.items()}
+        taken = await self._get_taken_paths(list(new_paths.values()))
+
+        failures = {}
+        claimed = set()
+        params = []
+        for file_id, path in new_paths.items():
+            if path == files[file_id].path:
+                taken.discard(path)
+            if path in taken or path in claimed:
+                failures[file_id] = f"File already exists at path: {path}"
+                continue
+            claimed.add(path)
+            values = {"id": file_id, "path": path, "updated_at": now}
+            if operation.target_folder_id:
+                values["folder_id"] = operation.target_folder_id
+            params.append(values)
+
+        if params:
+            await self.db.execute(update(File), params)
+        return failures
+
+    async def _bulk_copy(
+        self,
+        operation: FileBulkOperation,
+        files: Dict[UUID, Any],
+        user_id: str,
+        copies: Optional[Dict[UUID, UUID]] = None,
+    ) -> Dict[UUID, str]:
+        """Copy files with batched INSERTs.
+
+        The IDs of the copies are added to ``copies`` by original file ID.
+        """
+        result = await self.db.execute(select(File).where(File.id.in_(list(files))))
+        originals = {file.id: file for file in result.scalars().all()}
+
+        target = operation.target_path.rstrip("/") if operation.target_path else None
+        storage_keys = {
+            file_id: f"{target}/{original.name}" if target else f"{original.storage_key}_copy"
+            for file_id, original in originals.items()
+        }
+        taken = await self._get_taken_storage_keys(list(storage_keys.values()))
+
+        failures = {}
+        claimed = set()
+        new_files = {}
+        for file_id in files:
+            original = originals.get(file_id)
+            if original is None:
+                failures[file_id] = "File not found"
+                continue
+            storage_key = storage_keys[file_id]
+            if storage_key in taken or storage_key in claimed:
+                failures[file_id] = f"File already exists with storage key: {storage_key}"
+                continue
+            claimed.add(storage_key)
+
+            new_file = File.create_file(
+                name=original.name if target or operation.target_folder_id else f"Copy of {original.name}",
+                size=original.size,
+                mime_type=original.mime_type,
+                owner_id=user_id,
+                storage_key=storage_key,
+                bucket=original.bucket,
+                parent_id=original.parent_id,
+                folder_id=operation.target_folder_id or original.folder_id,
+                checksum=original.checksum,
+            )
+
+            # Copy metadata
+            new_file.description = original.description
+            new_file.tags = original.tags
+            new_file.metadata = original.metadata
+            new_file.is_public = original.is_public
+            new_files[file_id] = new_file
+
+        if new_files:
+            self.db.add_all(list(new_files.values()))
+            await self.db.flush()
+            if copies is not None:
+                copies.update({file_id: new_file.id for file_id, new_file in new_files.items()})
+        return failures
+
+    async def _bulk_update(self, operation: FileBulkOperation, files: Dict[UUID, Any], user_id: str) -> Dict[UUID, str]:
+        """Apply the same attribute changes to all files with one UPDATE."""
+        file_data = operation.update_data
+        if file_data is None:
+            raise ValueError("Update requires update_data")
+
+        values = {}
+        if file_data.name is not None:
+            is_valid, error = self.file_validator.validate_file_name(file_data.name)
+            if not is_valid:
+                raise ValueError(f"Invalid file name: {error}")
+            values["name"] = file_data.name
+
+        if file_data.description is not None:
+            values["description"] = file_data.description
+
+        if file_data.tags is not None:
+            is_valid, error = self.file_validator.validate_tags(file_data.tags)
+            if not is_valid:
+                raise ValueError(f"Invalid tags: {error}")
+            values["tags"] = file_data.tags
+
+        if file_data.metadata is not None:
+            is_valid, error = self.file_validator.validate_metadata(file_data.metadata)
+            if not is_valid:
+                raise ValueError(f"Invalid metadata: {error}")
+            # Keyed by column, as "metadata" names the declarative MetaData on the class
+            values[File.__table__.c.metadata] = file_data.metadata
+
+        if file_data.is_public is not None:
+            values["is_public"] = file_data.is_public
+
+        if file_data.status is not None:
+            values["status"] = file_data.status
+
+        values["updated_at"] = datetime.utcnow()
+        await self.db.execute(
+            update(File).where(File.id.in_(list(files))).values(values)
+        )
+        return {}
+
+    async def _bulk_tag(self, operation: FileBulkOperation, files: Dict[UUID, Any], user_id: str) -> Dict[UUID, str]:
+        """Add and remove tags, updating each file's tag list by primary key."""
+        tags_to_add = operation.tags_to_add or []
+        tags_to_remove = set(operation.tags_to_remove or [])
+
+        now = datetime.utcnow()
+        failures = {}
+        params = []
+        for file_id, row in files.items():
+            current = list(row.tags or [])
+            tags = [tag for tag in dict.fromkeys(current + tags_to_add) if tag not in tags_to_remove]
+            if tags == current:
+                continue
+            is_valid, error = self.file_validator.validate_tags(tags)
+            if not is_valid:
+                failures[file_id] = f"Invalid tags: {error}"
+                continue
+            params.append({"id": file_id, "tags": tags, "updated_at": now})
+
+        if params:
+            await self.db.execute(update(File), params)
+        return failures
+
     async def get_user_file_count(self, user_id: str) -> int:
         """Get total file count for user."""
         query = select(func.count(File.id)).where(File.owner_id == user_id)
@@ -18,6 +18,10 @@ from sqlalchemy import (
     JSON,
     Index,
     UniqueConstraint,
+    DDL,
+    cast,
+    event,
+    literal_column,
 )
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.dialects.postgresql import UUID
@@ -27,6 +31,28 @@ import uuid
 from app.core.database import Base
 
 
+_TS_CONFIG = literal_column("'simple'::regconfig")
+
+
+def _search_document(name, tags, description):
+    """Build the weighted tsvector expression of name, tags and description.
+
+    Constants are rendered inline rather than bound, so queries repeat the
+    indexed expression exactly.
+    """
+    def weighted(column, weight):
+        return func.setweight(
+            func.to_tsvector(_TS_CONFIG, func.coalesce(column, literal_column("''"))),
+            literal_column(f"'{weight}'"),
+        )
+
+    return (
+        weighted(name, "A")
+        .op("||")(weighted(cast(tags, Text), "B"))
+        .op("||")(weighted(description, "C"))
+    )
+
+
 class FileType(str, Enum):
     """File type enumeration."""
     DOCUMENT = "document"
@@ -173,6 +199,19 @@ class File(Base):
         Index("ix_files_updated_at", "updated_at"),
         Index("ix_files_size", "size"),
         UniqueConstraint("path", name="uq_files_path"),
+        # Full-text and trigram search indexes; other databases search with
+        # the in-process index
+        Index(
+            "ix_files_search_document",
+            _search_document(name, tags, description),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_files_name_trgm",
+            func.lower(name).label("name_lower"),
+            postgresql_using="gin",
+            postgresql_ops={"name_lower": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self) -> str:
@@ -504,3 +543,24 @@ class File(Base):
             return FileType.ARCHIVE
 
         return FileType.OTHER
+
+
+def file_search_document():
+    """Build the weighted tsvector expression of a file.
+
+    The expression must stay identical to the one of ix_files_search_document
+    for PostgreSQL to use the index.
+
+    Returns:
+        SQL expression
+    """
+    columns = File.__table__.c
+    return _search_document(columns.name, columns.tags, columns.description)
+
+
+# The trigram index needs the extension before the table is created
+event.listen(
+    File.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -7,7 +7,7 @@ query optimization, and performance monitoring for the file management system.
 import logging
 import time
 import asyncio
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -15,8 +15,11 @@ import hashlib
 import json
 import pickle
 import redis
+from collections import deque
 from functools import wraps
 
+from app.core.metrics import MetricsRegistry, MetricFamily, metrics_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,11 +87,15 @@ class PerformanceConfig:
 class PerformanceMonitor:
     """Performance monitoring and metrics collection."""
 
-    def __init__(self, config: PerformanceConfig):
+    def __init__(self, config: PerformanceConfig, registry: Optional[MetricsRegistry] = None):
         """Initialize performance monitor."""
         self.config = config
-        self.metrics: Dict[str, List[Dict[str, Any]]] = {}
-        self.slow_operations: List[Dict[str, Any]] = []
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.metrics: Dict[str, MetricFamily] = {}
+        # Families this monitor registered; others may be shared with other components
+        self._owned_metrics: Set[str] = set()
+        self.latest_values: Dict[str, float] = {}
+        self.slow_operations: deque = deque(maxlen=1000)
         self.start_time = datetime.utcnow()
 
     def record_metric(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
@@ -102,23 +109,21 @@ class PerformanceMonitor:
         if not self.config.enable_metrics_collection:
             return
 
-        if name not in self.metrics:
-            self.metrics[name] = []
-
-        metric = {
-            "value": value,
-            "timestamp": datetime.utcnow().isoformat(),
-            "labels": labels or {},
-        }
+        family = self.metrics.get(name)
+        if family is None:
+            if name not in self.registry:
+                self._owned_metrics.add(name)
+            family = self.metrics[name] = self.registry.histogram(name)
 
-        self.metrics[name].append(metric)
+        family.labels(labels).record(value)
+        self.latest_values[name] = value
 
         # Check for slow operations
         if value > self.config.slow_query_threshold:
             self.slow_operations.append({
                 "name": name,
                 "duration": value,
-                "timestamp": metric["timestamp"],
+                "timestamp": datetime.utcnow().isoformat(),
                 "labels": labels,
             })
 
@@ -134,14 +139,18 @@ class PerformanceMonitor:
         if name not in self.metrics:
             return None
 
-        values = [m["value"] for m in self.metrics[name]]
+        histogram = self.metrics[name].merged_histogram()
+        snapshot = histogram.snapshot()
 
         return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
-            "latest": values[-1] if values else None,
+            "count": snapshot["count"],
+            "min": snapshot["min"],
+            "max": snapshot["max"],
+            "avg": snapshot["avg"],
+            "p50": snapshot["p50"],
+            "p95": snapshot["p95"],
+            "p99": snapshot["p99"],
+            "latest": self.latest_values.get(name),
         }
 
     def get_slow_operations(self, hours: int = 24) -> List[Dict[str, Any]]:
@@ -162,13 +171,20 @@ class PerformanceMonitor:
     def clear_metrics(self, name: Optional[str] = None):
         """Clear metrics.
 
+        Only families registered by this monitor are removed from the
+        registry; families shared with other components are left intact.
+
         Args:
             name: Optional specific metric name
         """
-        if name:
-            self.metrics.pop(name, None)
-        else:
-            self.metrics.clear()
+        names = [name] if name else list(self.metrics)
+        for metric_name in names:
+            family = self.metrics.pop(metric_name, None)
+            self.latest_values.pop(metric_name, None)
+            if metric_name in self._owned_metrics:
+                self._owned_metrics.discard(metric_name)
+                if family is not None and self.registry.get(metric_name) is family:
+                    self.registry.unregister(metric_name)
         self.slow_operations.clear()
 
 
@@ -380,7 +396,7 @@ class CacheManager:
 
 # Global performance components
 performance_config = PerformanceConfig()
-performance_monitor = PerformanceMonitor(performance_config)
+performance_monitor = PerformanceMonitor(performance_config, metrics_registry)
 query_optimizer = QueryOptimizer()
 cache_manager = CacheManager(performance_config)
 
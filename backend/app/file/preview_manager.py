@@ -3,13 +3,26 @@
 This module contains the PreviewManager class which provides comprehensive
 file preview capabilities including preview generation, thumbnail creation,
 text extraction, and multi-format support.
+
+CPU-bound decoding, resizing and extraction run in the shared
+PreviewPipeline process pool, at the manager's priority, whenever a content
+loader is available to read the file.
+
+Generated previews are cached in two tiers shared by all PreviewManager
+instances: a byte-budgeted in-memory LRU and a local on-disk cache. Both are
+keyed by file checksum, so identical files share previews and unchanged
+content is never regenerated.
 """
 
 import asyncio
 import logging
 import hashlib
 import mimetypes
-from typing import Dict, List, Optional, Tuple, Any, Union, BinaryIO
+import os
+import struct
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple, Any, Union, BinaryIO, Callable, Awaitable
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 from enum import Enum
@@ -24,6 +37,9 @@ from sqlalchemy import select, and_, or_, func
 from app.file.models.file import File
 from app.file.models.file_version import FileVersion
 from app.file.schemas.file_operations import FileResponse
+from app.core.cache import LRUCache
+from app.file.preview_pipeline import PreviewPipeline, PreviewPriority, preview_pipeline
+from app.file.utils.processors import extract_metadata, extract_text_content, generate_thumbnail
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +107,274 @@ class PreviewCache:
         self.access_count = 0
         self.last_accessed = datetime.utcnow()
 
+    @property
+    def size_bytes(self) -> int:
+        """Size of the cached preview and thumbnail data."""
+        return len(self.preview_data or b"") + len(self.thumbnail_data or b"")
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the entry has expired."""
+        return self.expires_at <= datetime.utcnow()
+
+    def to_bytes(self) -> bytes:
+        """Serialize the entry for the on-disk cache.
+
+        The format is a length-prefixed JSON header followed by the preview
+        and thumbnail data.
+        """
+        preview_data = self.preview_data or b""
+        thumbnail_data = self.thumbnail_data or b""
+        header = json.dumps({
+            "file_id": self.file_id,
+            "preview_type": self.preview_type.value,
+            "metadata": self.metadata,
+            "created_at": self.created_at.isoformat(),
+            "expires_at": self.expires_at.isoformat(),
+            "preview_size": len(preview_data) if self.preview_data is not None else None,
+            "thumbnail_size": len(thumbnail_data) if self.thumbnail_data is not None else None,
+        }).encode("utf-8")
+        return struct.pack(">I", len(header)) + header + preview_data + thumbnail_data
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PreviewCache":
+        """Deserialize an entry written by to_bytes.
+
+        Args:
+            data: Serialized entry
+
+        Returns:
+            PreviewCache instance
+        """
+        (header_size,) = struct.unpack(">I", data[:4])
+        header = json.loads(data[4:4 + header_size].decode("utf-8"))
+        offset = 4 + header_size
+
+        preview_data = None
+        if header["preview_size"] is not None:
+            preview_data = data[offset:offset + header["preview_size"]]
+            offset += header["preview_size"]
+        thumbnail_data = None
+        if header["thumbnail_size"] is not None:
+            thumbnail_data = data[offset:offset + header["thumbnail_size"]]
+
+        entry = cls(
+            file_id=header["file_id"],
+            preview_type=PreviewType(header["preview_type"]),
+            preview_data=preview_data,
+            thumbnail_data=thumbnail_data,
+            metadata=header["metadata"],
+            expires_at=datetime.fromisoformat(header["expires_at"]),
+        )
+        entry.created_at = datetime.fromisoformat(header["created_at"])
+        return entry
+
+
+class PreviewDiskCache:
+    """Local on-disk preview cache with a byte budget.
+
+    Entries are stored one file per cache key. Reads refresh a file's
+    modification time, and the least recently used files are removed once
+    the directory exceeds its budget.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 1024 * 1024 * 1024):
+        """Initialize disk cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+            max_bytes: Maximum total size of cached files
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+        }
+
+    def get(self, key: str) -> Optional[PreviewCache]:
+        """Read an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            PreviewCache instance or None if missing, expired or unreadable
+        """
+        path = self._path_for(key)
+        try:
+            entry = PreviewCache.from_bytes(path.read_bytes())
+        except FileNotFoundError:
+            self._stats["misses"] += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable preview cache file {path.name}: {str(e)}")
+            self.discard(key)
+            self._stats["misses"] += 1
+            return None
+
+        if entry.is_expired:
+            self.discard(key)
+            self._stats["misses"] += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._stats["hits"] += 1
+        return entry
+
+    def put(self, key: str, entry: PreviewCache) -> bool:
+        """Write an entry, evicting least recently used files as needed.
+
+        Args:
+            key: Cache key
+            entry: PreviewCache instance
+
+        Returns:
+            False if the entry alone exceeds the byte budget and was not stored
+        """
+        data = entry.to_bytes()
+        if len(data) > self.max_bytes:
+            return False
+
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._ensure_size()
+            previous = path.stat().st_size if path.exists() else 0
+
+            # Write to a temporary file first so readers never see partial data
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except Exception:
+                os.unlink(temp_path)
+                raise
+
+            self._bytes += len(data) - previous
+            self._stats["writes"] += 1
+            if self._bytes > self.max_bytes:
+                self._evict()
+        return True
+
+    def discard(self, key: str) -> bool:
+        """Remove an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        return self._unlink(self._path_for(key))
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path in self._files():
+            try:
+                entry = PreviewCache.from_bytes(path.read_bytes())
+                if not entry.is_expired:
+                    continue
+            except FileNotFoundError:
+                continue
+            except Exception:
+                pass
+            if self._unlink(path):
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = sum(1 for path in self._files() if self._unlink(path))
+        with self._lock:
+            self._bytes = 0
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get disk cache statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        with self._lock:
+            self._ensure_size()
+            return {
+                **self._stats,
+                "directory": str(self.directory),
+                "size_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.preview"
+
+    def _files(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob("*/*.preview"))
+
+    def _unlink(self, path: Path) -> bool:
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                return False
+            if self._bytes is not None:
+                self._bytes -= size
+            return True
+
+    def _ensure_size(self) -> None:
+        # Size of files left by earlier processes is computed once, lazily
+        if self._bytes is None:
+            total = 0
+            for path in self._files():
+                try:
+                    total += path.stat().st_size
+                except FileNotFoundError:
+                    pass
+            self._bytes = total
+
+    def _evict(self) -> None:
+        # Evict down to 90% of the budget so eviction scans are amortized
+        target = int(self.max_bytes * 0.9)
+        files = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        for _, size, path in files:
+            if self._bytes <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            self._bytes -= size
+            self._stats["evictions"] += 1
+
 
 class PreviewMetadata:
     """Preview metadata."""
@@ -157,14 +441,31 @@ class PreviewManager:
         '.xml', '.json', '.yaml', '.yml', '.md', '.tex'
     }
 
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        memory_cache: Optional[LRUCache] = None,
+        disk_cache: Optional[PreviewDiskCache] = None,
+        pipeline: Optional[PreviewPipeline] = None,
+        content_loader: Optional[Callable[[File], Awaitable[Optional[Union[bytes, str]]]]] = None,
+        priority: PreviewPriority = PreviewPriority.INTERACTIVE,
+    ):
         """Initialize preview manager.
 
         Args:
             db_session: Database session
+            memory_cache: In-memory preview cache (shared by default)
+            disk_cache: On-disk preview cache (shared by default)
+            pipeline: Process-pool pipeline for CPU-bound work (shared by default)
+            content_loader: Coroutine returning a file's content bytes or local path
+            priority: Pipeline priority (use BULK for background pre-generation)
         """
         self.db = db_session
-        self.preview_cache: Dict[str, PreviewCache] = {}
+        self.preview_cache = memory_cache if memory_cache is not None else preview_memory_cache
+        self.disk_cache = disk_cache if disk_cache is not None else preview_disk_cache
+        self.pipeline = pipeline if pipeline is not None else preview_pipeline
+        self.content_loader = content_loader
+        self.priority = priority
         self.supported_formats = self._initialize_supported_formats()
 
     def _initialize_supported_formats(self) -> Dict[str, PreviewType]:
@@ -235,66 +536,47 @@ class PreviewManager:
                 preview_type = self._detect_preview_type(file_info)
 
             # Check cache first
-            cache_key = self._generate_cache_key(file_id, preview_type, include_thumbnail, max_size, quality)
-            cached_preview = self._get_from_cache(cache_key)
+            cache_key = self._generate_cache_key(
+                self._get_content_key(file_info), preview_type, include_thumbnail, max_size, quality
+            )
+            cached_preview = await self._get_cached_preview(cache_key)
+            if cached_preview is None and cache_key in _pending_previews:
+                # Another request is generating the same preview; share its result
+                cached_preview = await asyncio.shield(_pending_previews[cache_key])
             if cached_preview:
                 logger.info(f"Using cached preview for file {file_id}")
-                return PreviewResult(
-                    file_id=str(file_id),
-                    success=True,
-                    preview_type=preview_type,
-                    preview_data=cached_preview.preview_data,
-                    thumbnail_data=cached_preview.thumbnail_data,
-                    metadata=PreviewMetadata(
-                        file_id=str(file_id),
-                        file_type=preview_type,
-                        **cached_preview.metadata
-                    ) if cached_preview.metadata else None,
-                )
-
-            # Generate preview based on type
-            if preview_type == PreviewType.IMAGE:
-                result = await self._generate_image_preview(
-                    file_info, include_thumbnail, max_size, quality
-                )
-            elif preview_type == PreviewType.VIDEO:
-                result = await self._generate_video_preview(file_info, include_thumbnail)
-            elif preview_type == PreviewType.AUDIO:
-                result = await self._generate_audio_preview(file_info, include_thumbnail)
-            elif preview_type == PreviewType.DOCUMENT:
-                result = await self._generate_document_preview(file_info, include_thumbnail)
-            elif preview_type == PreviewType.CODE:
-                result = await self._generate_code_preview(file_info)
-            elif preview_type == PreviewType.TEXT:
-                result = await self._generate_text_preview(file_info)
-            elif preview_type == PreviewType.ARCHIVE:
-                result = await self._generate_archive_preview(file_info)
-            else:
-                result = PreviewResult(
-                    file_id=str(file_id),
-                    success=False,
-                    preview_type=PreviewType.UNKNOWN,
-                    error_message=f"Unsupported preview type: {preview_type}",
+                return self._result_from_cache(file_id, preview_type, cached_preview)
+
+            pending = asyncio.get_running_loop().create_future()
+            _pending_previews[cache_key] = pending
+            cache_entry = None
+            try:
+                result = await self._generate_preview_by_type(
+                    file_info, preview_type, include_thumbnail, max_size, quality
                 )
 
-            # Cache the result
-            if result.success and result.preview_data:
-                self._add_to_cache(
-                    cache_key,
-                    PreviewCache(
+                # Cache the result
+                if result.success:
+                    cache_entry = PreviewCache(
                         file_id=str(file_id),
                         preview_type=preview_type,
                         preview_data=result.preview_data,
                         thumbnail_data=result.thumbnail_data,
                         metadata={
-                            "dimensions": result.metadata.dimensions if result.metadata else None,
-                            "duration": result.metadata.duration if result.metadata else None,
-                            "pages": result.metadata.pages if result.metadata else None,
-                            "encoding": result.metadata.encoding if result.metadata else None,
-                            "quality_score": result.metadata.quality_score if result.metadata else 0.0,
+                            "dimensions": result.metadata.dimensions,
+                            "duration": result.metadata.duration,
+                            "pages": result.metadata.pages,
+                            "text_preview": result.metadata.text_preview,
+                            "encoding": result.metadata.encoding,
+                            "quality_score": result.metadata.quality_score,
                         } if result.metadata else {},
                     )
-                )
+                    await self._store_cached_preview(cache_key, cache_entry, file_info)
+            finally:
+                # Waiters fall back to generating themselves if this failed
+                _pending_previews.pop(cache_key, None)
+                if not pending.done():
+                    pending.set_result(cache_entry)
 
             # Calculate processing time
             processing_time = (datetime.utcnow() - start_time).total_seconds()
@@ -435,26 +717,29 @@ class PreviewManager:
             older_than_hours: Clear cache entries older than this many hours
 
         Returns:
-            Number of cache entries cleared
+            Number of cache entries cleared across both tiers
         """
         try:
-            current_time = datetime.utcnow()
-            cache_keys_to_remove = []
-
-            for cache_key, cache_entry in self.preview_cache.items():
-                if older_than_hours is None:
-                    # Clear all cache
-                    cache_keys_to_remove.append(cache_key)
-                else:
-                    # Clear expired cache
-                    if cache_entry.expires_at < current_time:
-                        cache_keys_to_remove.append(cache_key)
-
-            for cache_key in cache_keys_to_remove:
-                del self.preview_cache[cache_key]
-
-            logger.info(f"Cleared {len(cache_keys_to_remove)} cache entries")
-            return len(cache_keys_to_remove)
+            if older_than_hours is None:
+                # Clear all cache
+                cleared = len(self.preview_cache)
+                self.preview_cache.clear()
+                if self.disk_cache is not None:
+                    cleared += await asyncio.to_thread(self.disk_cache.clear)
+            else:
+                # Clear expired cache
+                expired = [
+                    cache_key for cache_key, cache_entry in self.preview_cache.items()
+                    if cache_entry.is_expired
+                ]
+                for cache_key in expired:
+                    self.preview_cache.pop(cache_key)
+                cleared = len(expired)
+                if self.disk_cache is not None:
+                    cleared += await asyncio.to_thread(self.disk_cache.purge_expired)
+
+            logger.info(f"Cleared {cleared} cache entries")
+            return cleared
 
         except Exception as e:
             logger.error(f"Error clearing cache: {str(e)}")
@@ -467,22 +752,21 @@ class PreviewManager:
             Cache statistics dictionary
         """
         try:
-            total_entries = len(self.preview_cache)
-            total_size = sum(
-                len(entry.preview_data) + (len(entry.thumbnail_data) or 0)
-                for entry in self.preview_cache.values()
-            )
+            entries = [cache_entry for _, cache_entry in self.preview_cache.items()]
+            total_size = sum(entry.size_bytes for entry in entries)
 
             type_counts = {}
-            for entry in self.preview_cache.values():
+            for entry in entries:
                 type_str = entry.preview_type.value
                 type_counts[type_str] = type_counts.get(type_str, 0) + 1
 
             return {
-                "total_entries": total_entries,
+                "total_entries": len(entries),
                 "total_size_bytes": total_size,
                 "type_distribution": type_counts,
                 "cache_utilization": total_size / (1024 * 1024),  # MB
+                "memory": self.preview_cache.get_stats(),
+                "disk": self.disk_cache.get_stats() if self.disk_cache is not None else None,
             }
 
         except Exception as e:
@@ -509,6 +793,23 @@ class PreviewManager:
             logger.error(f"Error getting file info: {str(e)}")
             return None
 
+    async def _load_content(self, file_info: File) -> Optional[Union[bytes, str]]:
+        """Load file content for processing.
+
+        Args:
+            file_info: File instance
+
+        Returns:
+            Content bytes or local file path, or None if no loader is configured
+        """
+        if self.content_loader is None:
+            return None
+        try:
+            return await self.content_loader(file_info)
+        except Exception as e:
+            logger.warning(f"Error loading content of file {file_info.id}: {str(e)}")
+            return None
+
     def _detect_preview_type(self, file_info: File) -> PreviewType:
         """Detect preview type based on file extension.
 
@@ -540,9 +841,28 @@ class PreviewManager:
         else:
             return PreviewType.UNKNOWN
 
+    def _get_content_key(self, file_info: File) -> str:
+        """Get the key identifying a file's content.
+
+        Files with a checksum are keyed by it so identical content shares
+        previews; other files fall back to their ID and last update time.
+
+        Args:
+            file_info: File instance
+
+        Returns:
+            Content key string
+        """
+        checksum = getattr(file_info, "checksum", None)
+        if isinstance(checksum, str) and checksum:
+            return f"sha256-{checksum}"
+        updated_at = getattr(file_info, "updated_at", None)
+        version = updated_at.isoformat() if isinstance(updated_at, datetime) else "0"
+        return f"file-{file_info.id}-{version}"
+
     def _generate_cache_key(
         self,
-        file_id: UUID,
+        content_key: str,
         preview_type: PreviewType,
         include_thumbnail: bool,
         max_size: Optional[Tuple[int, int]],
@@ -551,7 +871,7 @@ class PreviewManager:
         """Generate cache key for preview.
 
         Args:
-            file_id: File ID
+            content_key: Content key from _get_content_key
             preview_type: Preview type
             include_thumbnail: Whether to include thumbnail
             max_size: Maximum size
@@ -562,10 +882,10 @@ class PreviewManager:
         """
         size_str = f"{max_size[0]}x{max_size[1]}" if max_size else "none"
         thumb_str = "with" if include_thumbnail else "without"
-        return f"{file_id}_{preview_type.value}_{thumb_str}_thumb_{size_str}_q{quality}"
+        return f"{content_key}_{preview_type.value}_{thumb_str}_thumb_{size_str}_q{quality}"
 
     def _get_from_cache(self, cache_key: str) -> Optional[PreviewCache]:
-        """Get preview from cache.
+        """Get preview from the in-memory cache.
 
         Args:
             cache_key: Cache key
@@ -574,24 +894,135 @@ class PreviewManager:
             PreviewCache instance or None if not found or expired
         """
         cache_entry = self.preview_cache.get(cache_key)
-        if cache_entry and cache_entry.expires_at > datetime.utcnow():
+        if cache_entry and not cache_entry.is_expired:
             # Update access statistics
             cache_entry.access_count += 1
             cache_entry.last_accessed = datetime.utcnow()
             return cache_entry
         elif cache_entry:
             # Remove expired entry
-            del self.preview_cache[cache_key]
+            self.preview_cache.pop(cache_key)
         return None
 
     def _add_to_cache(self, cache_key: str, cache_entry: PreviewCache):
-        """Add preview to cache.
+        """Add preview to the in-memory cache.
+
+        Args:
+            cache_key: Cache key
+            cache_entry: PreviewCache instance
+        """
+        self.preview_cache.put(cache_key, cache_entry)
+
+    async def _get_cached_preview(self, cache_key: str) -> Optional[PreviewCache]:
+        """Get preview from memory, falling back to the disk cache.
+
+        Disk hits are promoted to the in-memory cache.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            PreviewCache instance or None if not cached
+        """
+        cache_entry = self._get_from_cache(cache_key)
+        if cache_entry is not None or self.disk_cache is None:
+            return cache_entry
+
+        try:
+            cache_entry = await asyncio.to_thread(self.disk_cache.get, cache_key)
+        except Exception as e:
+            logger.warning(f"Error reading preview from disk cache: {str(e)}")
+            return None
+
+        if cache_entry is not None:
+            self._add_to_cache(cache_key, cache_entry)
+        return cache_entry
+
+    async def _store_cached_preview(self, cache_key: str, cache_entry: PreviewCache, file_info: File):
+        """Add preview to both cache tiers.
+
+        Only content identified by checksum is written to disk, as other
+        keys cannot be shared between files.
 
         Args:
             cache_key: Cache key
             cache_entry: PreviewCache instance
+            file_info: File the preview was generated for
+        """
+        self._add_to_cache(cache_key, cache_entry)
+        if self.disk_cache is None or not cache_key.startswith("sha256-"):
+            return
+
+        try:
+            await asyncio.to_thread(self.disk_cache.put, cache_key, cache_entry)
+        except Exception as e:
+            logger.warning(f"Error writing preview for file {file_info.id} to disk cache: {str(e)}")
+
+    def _result_from_cache(
+        self,
+        file_id: UUID,
+        preview_type: PreviewType,
+        cached_preview: PreviewCache,
+    ) -> PreviewResult:
+        """Build a preview result for a file from a cache entry.
+
+        Args:
+            file_id: File ID the preview was requested for
+            preview_type: Preview type
+            cached_preview: PreviewCache instance
+
+        Returns:
+            PreviewResult instance
         """
-        self.preview_cache[cache_key] = cache_entry
+        metadata = dict(cached_preview.metadata)
+        if metadata.get("dimensions") is not None:
+            metadata["dimensions"] = tuple(metadata["dimensions"])
+
+        return PreviewResult(
+            file_id=str(file_id),
+            success=True,
+            preview_type=preview_type,
+            preview_data=cached_preview.preview_data,
+            thumbnail_data=cached_preview.thumbnail_data,
+            metadata=PreviewMetadata(
+                file_id=str(file_id),
+                file_type=preview_type,
+                **metadata
+            ) if metadata else None,
+        )
+
+    async def _generate_preview_by_type(
+        self,
+        file_info: File,
+        preview_type: PreviewType,
+        include_thumbnail: bool,
+        max_size: Optional[Tuple[int, int]],
+        quality: int,
+    ) -> PreviewResult:
+        """Generate a preview with the generator for its type."""
+        if preview_type == PreviewType.IMAGE:
+            return await self._generate_image_preview(
+                file_info, include_thumbnail, max_size, quality
+            )
+        elif preview_type == PreviewType.VIDEO:
+            return await self._generate_video_preview(file_info, include_thumbnail)
+        elif preview_type == PreviewType.AUDIO:
+            return await self._generate_audio_preview(file_info, include_thumbnail)
+        elif preview_type == PreviewType.DOCUMENT:
+            return await self._generate_document_preview(file_info, include_thumbnail)
+        elif preview_type == PreviewType.CODE:
+            return await self._generate_code_preview(file_info)
+        elif preview_type == PreviewType.TEXT:
+            return await self._generate_text_preview(file_info)
+        elif preview_type == PreviewType.ARCHIVE:
+            return await self._generate_archive_preview(file_info)
+        else:
+            return PreviewResult(
+                file_id=str(file_info.id),
+                success=False,
+                preview_type=PreviewType.UNKNOWN,
+                error_message=f"Unsupported preview type: {preview_type}",
+            )
 
     # Preview generation methods for different types
 
@@ -604,6 +1035,12 @@ class PreviewManager:
     ) -> PreviewResult:
         """Generate image preview."""
         try:
+            content = await self._load_content(file_info)
+            if content is not None:
+                return await self._process_image_preview(
+                    file_info, content, include_thumbnail, max_size
+                )
+
             # Simulate image processing
             # In a real implementation, you would:
             # 1. Load the image
@@ -639,6 +1076,76 @@ class PreviewManager:
                 error_message=str(e),
             )
 
+    async def _process_image_preview(
+        self,
+        file_info: File,
+        content: Union[bytes, str],
+        include_thumbnail: bool,
+        max_size: Optional[Tuple[int, int]],
+    ) -> PreviewResult:
+        """Resize an image preview and thumbnail in the preview pipeline."""
+        mime_type = file_info.mime_type or "image/png"
+        width, height = max_size or (800, 600)
+        async with self.pipeline.spooled(content) as content:
+            results = await asyncio.gather(*self._image_preview_jobs(
+                content, mime_type, width, height, include_thumbnail
+            ))
+
+        success, preview_data, error = results[1]
+        if not success:
+            return PreviewResult(
+                file_id=str(file_info.id),
+                success=False,
+                preview_type=PreviewType.IMAGE,
+                error_message=error,
+            )
+
+        _, image_metadata, _ = results[0]
+        thumbnail_data = None
+        if include_thumbnail and results[2][0]:
+            thumbnail_data = results[2][1]
+
+        dimensions = None
+        if "width" in image_metadata:
+            dimensions = (image_metadata["width"], image_metadata["height"])
+
+        return PreviewResult(
+            file_id=str(file_info.id),
+            success=True,
+            preview_type=PreviewType.IMAGE,
+            preview_data=preview_data,
+            thumbnail_data=thumbnail_data,
+            metadata=PreviewMetadata(
+                file_id=str(file_info.id),
+                file_type=PreviewType.IMAGE,
+                dimensions=dimensions,
+                quality_score=0.95,
+            ),
+        )
+
+    def _image_preview_jobs(
+        self,
+        content: Union[bytes, str],
+        mime_type: str,
+        width: int,
+        height: int,
+        include_thumbnail: bool,
+    ) -> List[Awaitable]:
+        """Build the pipeline jobs for an image preview."""
+        jobs = [
+            self.pipeline.run(extract_metadata, content, self.priority, mime_type=mime_type),
+            self.pipeline.run(
+                generate_thumbnail, content, self.priority,
+                mime_type=mime_type, width=width, height=height,
+            ),
+        ]
+        if include_thumbnail:
+            jobs.append(self.pipeline.run(
+                generate_thumbnail, content, self.priority,
+                mime_type=mime_type, width=128, height=128,
+            ))
+        return jobs
+
     async def _generate_video_preview(
         self,
         file_info: File,
@@ -812,6 +1319,17 @@ class PreviewManager:
         format: str,
     ) -> Optional[bytes]:
         """Generate image thumbnail."""
+        content = await self._load_content(file_info)
+        if content is not None:
+            success, thumbnail, error = await self.pipeline.run(
+                generate_thumbnail, content, self.priority,
+                mime_type=file_info.mime_type or "image/png", width=size[0], height=size[1],
+            )
+            if success:
+                return thumbnail
+            logger.warning(f"Error generating thumbnail for file {file_info.id}: {error}")
+            return None
+
         # Mock thumbnail generation
         return b"\x89PNG\r\n\x1a\n" + b"\x00" * (size[0] * size[1] // 8)
 
@@ -864,6 +1382,17 @@ class PreviewManager:
         encoding: str,
     ) -> Optional[str]:
         """Extract text from text file."""
+        content = await self._load_content(file_info)
+        if content is not None:
+            success, text, error = await self.pipeline.run(
+                extract_text_content, content, self.priority,
+                max_length=max_length, encoding=encoding,
+            )
+            if success:
+                return text
+            logger.warning(f"Error extracting text from file {file_info.id}: {error}")
+            return None
+
         # Mock text extraction
         return f"Sample text content from {file_info.name}..."
 
@@ -889,6 +1418,19 @@ class PreviewManager:
 
     async def _get_image_metadata(self, file_info: File) -> PreviewMetadata:
         """Get image metadata."""
+        content = await self._load_content(file_info)
+        if content is not None:
+            _, image_metadata, _ = await self.pipeline.run(
+                extract_metadata, content, self.priority,
+                mime_type=file_info.mime_type or "image/png",
+            )
+            if "width" in image_metadata:
+                return PreviewMetadata(
+                    file_id=str(file_info.id),
+                    file_type=PreviewType.IMAGE,
+                    dimensions=(image_metadata["width"], image_metadata["height"]),
+                )
+
         return PreviewMetadata(
             file_id=str(file_info.id),
             file_type=PreviewType.IMAGE,
@@ -920,3 +1462,51 @@ class PreviewManager:
             file_type=PreviewType.DOCUMENT,
             pages=10,
         )
+
+
+def storage_content_loader(
+    get_client: Callable[[], Any],
+) -> Callable[[File], Awaitable[Optional[bytes]]]:
+    """Create a content loader reading file objects from object storage.
+
+    Args:
+        get_client: Callable returning the storage client. It is only called
+            when content is loaded, so cached previews never connect.
+
+    Returns:
+        Content loader for PreviewManager
+    """
+
+    def read_object(file_info: File) -> bytes:
+        response = get_client().get_object(
+            bucket_name=file_info.bucket,
+            object_name=file_info.storage_key,
+        )
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def load_content(file_info: File) -> Optional[bytes]:
+        if not file_info.storage_key:
+            return None
+        return await asyncio.to_thread(read_object, file_info)
+
+    return load_content
+
+
+def _preview_cache_sizeof(cache_entry: PreviewCache) -> int:
+    return cache_entry.size_bytes
+
+
+# Previews are keyed by content checksum, so these caches are shared by every
+# PreviewManager instance.
+preview_memory_cache = LRUCache(max_bytes=64 * 1024 * 1024, sizeof=_preview_cache_sizeof)
+preview_disk_cache = PreviewDiskCache(
+    Path(tempfile.gettempdir()) / "skillseekers-previews",
+    max_bytes=1024 * 1024 * 1024,
+)
+
+# Preview generations in progress, by cache key
+_pending_previews: Dict[str, "asyncio.Future[Optional[PreviewCache]]"] = {}
@@ -0,0 +1,389 @@
+"""Preview Pipeline.
+
+This module contains the PreviewPipeline class which runs CPU-bound preview
+work (image decoding and resizing, text and metadata extraction) in a
+process pool so it never blocks the event loop:
+- A bounded priority queue, so interactive previews run ahead of bulk
+  pre-generation and bulk submitters are throttled when the queue is full
+- At most one task per worker process in flight, so queued priorities are
+  honoured instead of being lost in the executor's FIFO queue
+- Cancellable tasks
+- Large inputs spooled to temporary files instead of being pickled
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Union
+from uuid import uuid4
+
+from app.core.metrics import MetricsRegistry, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewPriority(IntEnum):
+    """Preview task priority (lower runs first)."""
+    INTERACTIVE = 0
+    NORMAL = 10
+    BULK = 20
+
+
+class FileSource(NamedTuple):
+    """Input passed to a worker as a local file instead of as bytes."""
+    path: str
+    delete: bool = False
+
+
+def _run_task(func: Callable[..., Any], source: Union[bytes, FileSource], kwargs: Dict[str, Any]) -> Any:
+    """Run a preview function in a worker process.
+
+    Args:
+        func: Module-level function taking the content as first argument
+        source: Content bytes or a file to read them from
+        kwargs: Keyword arguments for the function
+
+    Returns:
+        Function result
+    """
+    if isinstance(source, FileSource):
+        source = Path(source.path).read_bytes()
+    return func(source, **kwargs)
+
+
+class PreviewTask:
+    """A queued or running preview task.
+
+    Awaiting the task returns the function result. Cancelling a queued task
+    removes it from the queue; a task already running in a worker process
+    runs to completion, but its result is discarded.
+    """
+
+    def __init__(
+        self,
+        pipeline: "PreviewPipeline",
+        func: Callable[..., Any],
+        source: Union[bytes, FileSource],
+        kwargs: Dict[str, Any],
+        priority: PreviewPriority,
+    ):
+        self.task_id = str(uuid4())
+        self.func = func
+        self.source = source
+        self.kwargs = kwargs
+        self.priority = priority
+        self.status = "queued"
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self._pipeline = pipeline
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.future.add_done_callback(lambda _: pipeline._on_task_done(self))
+
+    def cancel(self) -> bool:
+        """Cancel the task.
+
+        Returns:
+            True if the task was cancelled before finishing
+        """
+        cancelled = self.future.cancel()
+        if cancelled:
+            self._pipeline._dequeue(self)
+        return cancelled
+
+    def done(self) -> bool:
+        """Whether the task has finished, failed or been cancelled."""
+        return self.future.done()
+
+    def __await__(self):
+        return self.future.__await__()
+
+
+class PreviewPipeline:
+    """Prioritized process-pool pipeline for CPU-bound preview work."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_size: int = 1000,
+        spool_threshold: int = 1024 * 1024,
+        spool_dir: Optional[Union[str, Path]] = None,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        """Initialize preview pipeline.
+
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+            max_queue_size: Queued tasks above which non-interactive submitters wait
+            spool_threshold: Inputs of at least this many bytes go through a temp file
+            spool_dir: Directory for spooled inputs (system temp dir by default)
+            registry: Metrics registry (defaults to the global registry)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue_size = max_queue_size
+        self.spool_threshold = spool_threshold
+        self.spool_dir = str(spool_dir) if spool_dir is not None else None
+
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._available: Optional[asyncio.Semaphore] = None
+        self._space: Optional[asyncio.Event] = None
+        self._dispatchers: List[asyncio.Task] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._running = 0
+
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "spooled": 0,
+        }
+
+        registry = registry if registry is not None else metrics_registry
+        self._queue_wait = registry.histogram(
+            "preview_pipeline_queue_wait_seconds",
+            "Time preview tasks wait in the queue",
+            unit="seconds",
+        )
+        self._duration = registry.histogram(
+            "preview_pipeline_task_duration_seconds",
+            "Time preview tasks spend in a worker process",
+            unit="seconds",
+        )
+
+    async def submit(
+        self,
+        func: Callable[..., Any],
+        source: Union[bytes, str, Path],
+        priority: PreviewPriority = PreviewPriority.INTERACTIVE,
+        **kwargs,
+    ) -> PreviewTask:
+        """Queue a preview function.
+
+        Non-interactive submitters wait while the queue is full; interactive
+        tasks are always admitted.
+
+        Args:
+            func: Module-level function taking the content bytes as first argument
+            source: Content bytes, or the path of a local file holding them
+            priority: Task priority
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            PreviewTask instance
+        """
+        self._ensure_started()
+        payload = await self._prepare_source(source)
+
+        try:
+            while priority != PreviewPriority.INTERACTIVE and len(self._heap) >= self.max_queue_size:
+                self._space.clear()
+                await self._space.wait()
+        except BaseException:
+            self._discard_source(payload)
+            raise
+
+        task = PreviewTask(self, func, payload, kwargs, priority)
+        heapq.heappush(self._heap, (int(priority), next(self._sequence), task))
+        self._stats["submitted"] += 1
+        self._available.release()
+        return task
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        source: Union[bytes, str, Path],
+        priority: PreviewPriority = PreviewPriority.INTERACTIVE,
+        **kwargs,
+    ) -> Any:
+        """Queue a preview function and wait for its result.
+
+        Cancelling the caller cancels the task.
+
+        Args:
+            func: Module-level function taking the content bytes as first argument
+            source: Content bytes, or the path of a local file holding them
+            priority: Task priority
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Function result
+        """
+        task = await self.submit(func, source, priority, **kwargs)
+        return await task
+
+    @asynccontextmanager
+    async def spooled(self, source: Union[bytes, str, Path]) -> AsyncIterator[Union[bytes, str, Path]]:
+        """Spool large content once for several tasks reading the same input.
+
+        Args:
+            source: Content bytes or local file path
+
+        Yields:
+            The source itself, or the path of a temp file holding large content
+        """
+        if isinstance(source, (str, Path)) or len(source) < self.spool_threshold:
+            yield source
+            return
+
+        path = await asyncio.to_thread(self._spool, source)
+        self._stats["spooled"] += 1
+        try:
+            yield path
+        finally:
+            self._discard_source(FileSource(path, delete=True))
+
+    def get_queue_size(self) -> int:
+        """Get number of queued tasks."""
+        return len(self._heap)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pipeline statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            **self._stats,
+            "queued": len(self._heap),
+            "running": self._running,
+            "max_workers": self.max_workers,
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel queued tasks and stop the worker processes."""
+        for task in self._dispatchers:
+            task.cancel()
+        if self._dispatchers:
+            await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+
+        while self._heap:
+            _, _, task = heapq.heappop(self._heap)
+            task.cancel()
+        self._loop = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        # Queue primitives belong to one event loop; start afresh on a new one
+        self._loop = loop
+        self._heap = []
+        self._available = asyncio.Semaphore(0)
+        self._space = asyncio.Event()
+        self._dispatchers = [
+            loop.create_task(self._dispatch()) for _ in range(self.max_workers)
+        ]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def _prepare_source(self, source: Union[bytes, str, Path]) -> Union[bytes, FileSource]:
+        if isinstance(source, (str, Path)):
+            return FileSource(str(source))
+        if len(source) < self.spool_threshold:
+            return bytes(source)
+
+        path = await asyncio.to_thread(self._spool, source)
+        self._stats["spooled"] += 1
+        return FileSource(path, delete=True)
+
+    def _spool(self, content: bytes) -> str:
+        fd, path = tempfile.mkstemp(prefix="preview-", dir=self.spool_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+        except Exception:
+            os.unlink(path)
+            raise
+        return path
+
+    def _discard_source(self, source: Union[bytes, FileSource]) -> None:
+        if isinstance(source, FileSource) and source.delete:
+            try:
+                os.unlink(source.path)
+            except FileNotFoundError:
+                pass
+
+    async def _dispatch(self) -> None:
+        """Run queued tasks one at a time, highest priority first."""
+        while True:
+            await self._available.acquire()
+            if not self._heap:
+                # The task this slot was released for has been cancelled
+                continue
+            _, _, task = heapq.heappop(self._heap)
+            self._space.set()
+            if task.done():
+                continue
+            await self._execute(task)
+
+    async def _execute(self, task: PreviewTask) -> None:
+        task.status = "running"
+        task.started_at = time.monotonic()
+        self._queue_wait.labels({"priority": task.priority.name.lower()}).record(
+            task.started_at - task.submitted_at
+        )
+
+        self._running += 1
+        try:
+            result = await self._loop.run_in_executor(
+                self._get_executor(), _run_task, task.func, task.source, task.kwargs
+            )
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        except Exception as e:
+            if not task.done():
+                task.future.set_exception(e)
+        else:
+            if not task.done():
+                task.future.set_result(result)
+        finally:
+            self._running -= 1
+            self._duration.labels({"function": task.func.__name__}).record(
+                time.monotonic() - task.started_at
+            )
+
+    def _dequeue(self, task: PreviewTask) -> None:
+        # Drop a cancelled task from the queue right away to free its slot
+        if task.status == "queued" and any(entry[2] is task for entry in self._heap):
+            self._heap = [entry for entry in self._heap if entry[2] is not task]
+            heapq.heapify(self._heap)
+            self._space.set()
+
+    def _on_task_done(self, task: PreviewTask) -> None:
+        if task.future.cancelled():
+            # Also reached when the awaiting caller, not the task, was cancelled
+            self._dequeue(task)
+            task.status = "cancelled"
+            self._stats["cancelled"] += 1
+        elif task.future.exception() is not None:
+            task.status = "failed"
+            self._stats["failed"] += 1
+            logger.warning(f"Preview task {task.func.__name__} failed: {task.future.exception()}")
+        else:
+            task.status = "completed"
+            self._stats["completed"] += 1
+        self._discard_source(task.source)
+
+
+# Shared by every PreviewManager instance
+preview_pipeline = PreviewPipeline()
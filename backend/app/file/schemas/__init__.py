@@ -43,7 +43,9 @@ from .batch_config import (
     BatchCopyConfig,
     BatchProcessResult,
     BatchProgress,
+    BatchOperation,
     BatchOperationStatus,
+    BatchStatus,
     BatchFileItem,
 )
 
@@ -85,7 +87,9 @@ __all__ = [
     "BatchCopyConfig",
     "BatchProcessResult",
     "BatchProgress",
+    "BatchOperation",
     "BatchOperationStatus",
+    "BatchStatus",
     "BatchFileItem",
 ]
 
@@ -141,7 +145,9 @@ SCHEMA_METADATA = {
             "BatchCopyConfig",
             "BatchProcessResult",
             "BatchProgress",
+            "BatchOperation",
             "BatchOperationStatus",
+            "BatchStatus",
             "BatchFileItem",
         ],
     },
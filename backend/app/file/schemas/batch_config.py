@@ -46,6 +46,10 @@ class BatchOperationStatus(str, Enum):
     SCHEDULED = "scheduled"
 
 
+# Batch jobs move through the same states as individual batch operations
+BatchStatus = BatchOperationStatus
+
+
 class BatchPriority(str, Enum):
     """Batch operation priority enumeration."""
     LOW = "low"
@@ -72,9 +76,20 @@ class BatchFileItem(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
 
 
+class BatchOperation(BaseModel):
+    """Schema for a single operation submitted to a batch job."""
+
+    file_id: Optional[str] = Field(None, description="File ID")
+    source_path: Optional[str] = Field(None, description="Source path")
+    target_path: Optional[str] = Field(None, description="Target path")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Operation parameters")
+
+
 class BatchProgress(BaseModel):
     """Schema for batch operation progress."""
 
+    job_id: Optional[str] = Field(None, description="Batch job ID")
+    status: Optional[BatchOperationStatus] = Field(None, description="Batch job status")
     total_files: int = Field(..., description="Total number of files")
     processed_files: int = Field(default=0, description="Number of processed files")
     successful_files: int = Field(default=0, description="Number of successful files")
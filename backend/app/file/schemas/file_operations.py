@@ -169,6 +169,8 @@ class FileSearch(BaseModel):
     filters: Optional[FileFilter] = Field(None, description="Additional filters")
     page: int = Field(default=1, ge=1, description="Page number")
     page_size: int = Field(default=20, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(None, description="Cursor of the next page from a previous result")
+    # Matches are ordered by relevance unless a sort field is given
     sort_by: Optional[str] = Field(None, description="Sort field")
     sort_order: Optional[str] = Field("desc", regex="^(asc|desc)$", description="Sort order")
 
@@ -178,9 +180,11 @@ class FileSearchResult(BaseModel):
 
     files: List[FileResponse]
     total: int
+    total_is_estimate: bool = False
     page: int
     page_size: int
     pages: int
+    next_cursor: Optional[str] = None
     query: str
     search_time: float
 
@@ -0,0 +1,509 @@
+"""File search backends.
+
+This module provides the search backends behind FileManager.search_files.
+On PostgreSQL, text queries are matched and ranked by the database through
+tsvector and pg_trgm GIN indexes, in the same query that applies filters and
+permissions. Other databases use an in-process BM25 index that is loaded once
+and then kept current by FileManager; its ranked hits are resolved against
+the filtered file query in a bounded number of batches. Both backends page
+with search-after cursors and estimate large result counts instead of
+counting every match.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Float, and_, asc, cast, desc, func, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.search import InvertedIndex, decode_cursor, encode_cursor, tokenize
+from app.file.models.file import File, file_search_document
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of matches in each indexed field
+FILE_SEARCH_FIELD_WEIGHTS = {
+    "name": 3.0,
+    "tags": 2.0,
+    "description": 1.0,
+}
+
+# Matches are counted exactly up to this many, and estimated beyond
+FILE_SEARCH_EXACT_COUNT_LIMIT = 1000
+
+# Rows loaded per batch when building the in-process index
+FILE_SEARCH_LOAD_BATCH_SIZE = 1000
+
+# Batches of index hits resolved per in-process search before returning a
+# partial page with a cursor for the rest
+FILE_SEARCH_MAX_BATCHES = 4
+
+# Cursor kinds, so a cursor is only accepted by the ordering that made it
+_RELEVANCE_CURSOR = "r"
+_OFFSET_CURSOR = "o"
+
+_TS_CONFIG = literal_column("'simple'::regconfig")
+
+
+class FileSearchPage(NamedTuple):
+    """One page of file search results."""
+    files: List[File]
+    next_cursor: Optional[str]
+    total: int
+    total_is_estimate: bool
+
+
+class FileSearchBackend:
+    """Base class for file search backends.
+
+    Searching in sort field order is shared by all backends: the backend
+    narrows the filtered query to the matching files, which are then
+    ordered by the sort field and the file ID and paged by offset.
+    """
+
+    name = "base"
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query: Select,
+        text: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> FileSearchPage:
+        """Find files matching a text query, most relevant first.
+
+        Args:
+            db: Database session
+            query: File query with filters and permissions applied
+            text: Text query
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            skip: Matches to skip when no cursor is given
+
+        Returns:
+            Page of matching files
+        """
+        raise NotImplementedError
+
+    async def search_sorted(
+        self,
+        db: AsyncSession,
+        query: Select,
+        text: str,
+        sort_by: str,
+        descending: bool,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> FileSearchPage:
+        """Find files matching a text query, in sort field order.
+
+        Args:
+            db: Database session
+            query: File query with filters and permissions applied
+            text: Text query
+            sort_by: Sort field name (created_at when unknown)
+            descending: Whether to sort in descending order
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            skip: Matches to skip when no cursor is given
+
+        Returns:
+            Page of matching files
+        """
+        column = File.__table__.c.get(sort_by)
+        if column is None:
+            column = File.__table__.c.created_at
+        if cursor:
+            _, name, skip = _decode(cursor, _OFFSET_CURSOR, 3)
+            if name != column.name or not isinstance(skip, int) or skip < 0:
+                raise ValueError("Invalid cursor: made for a different sort order")
+
+        query = await self._filter_matches(db, query, text)
+        if query is None:
+            return FileSearchPage([], None, 0, False)
+        total, estimated = await self.estimate_count(db, query)
+
+        direction = desc if descending else asc
+        result = await db.execute(
+            query.order_by(direction(column), direction(File.id)).offset(skip).limit(limit + 1)
+        )
+        files = list(result.scalars().all())
+        next_cursor = None
+        if len(files) > limit:
+            files = files[:limit]
+            next_cursor = encode_cursor([_OFFSET_CURSOR, column.name, skip + limit])
+        return FileSearchPage(files, next_cursor, total, estimated)
+
+    async def estimate_count(self, db: AsyncSession, query: Select) -> Tuple[int, bool]:
+        """Count the rows of a query, up to FILE_SEARCH_EXACT_COUNT_LIMIT.
+
+        Args:
+            db: Database session
+            query: Query to count
+
+        Returns:
+            (count, whether the count is an estimate)
+        """
+        capped = (await db.execute(
+            select(func.count()).select_from(
+                query.with_only_columns(File.id).limit(FILE_SEARCH_EXACT_COUNT_LIMIT + 1).subquery()
+            )
+        )).scalar() or 0
+        if capped <= FILE_SEARCH_EXACT_COUNT_LIMIT:
+            return capped, False
+        return await self._estimate_large_count(db, query), True
+
+    async def _estimate_large_count(self, db: AsyncSession, query: Select) -> int:
+        # Without planner statistics only a lower bound is known
+        return FILE_SEARCH_EXACT_COUNT_LIMIT + 1
+
+    async def _filter_matches(self, db: AsyncSession, query: Select, text: str) -> Optional[Select]:
+        """Narrow a file query to the files matching a text query.
+
+        Returns:
+            Narrowed query, or None when nothing can match
+        """
+        raise NotImplementedError
+
+    async def index_files(self, db: AsyncSession, file_ids: Iterable[Any]) -> None:
+        """Bring created or updated files into the search index.
+
+        Args:
+            db: Database session
+            file_ids: File IDs
+        """
+
+    def remove_files(self, file_ids: Iterable[Any]) -> None:
+        """Drop deleted files from the search index.
+
+        Args:
+            file_ids: File IDs
+        """
+
+
+class PostgresFileSearchBackend(FileSearchBackend):
+    """Search backend using PostgreSQL full-text and trigram indexes.
+
+    Query terms are matched against the weighted tsvector of name, tags and
+    description, with the last term matched as a prefix. Names similar to
+    the query by trigrams also match, which tolerates typos. Matching,
+    filters and permissions are applied by one query, and the indexes are
+    maintained by the database, so file changes need no handling.
+    """
+
+    name = "postgresql"
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query: Select,
+        text: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> FileSearchPage:
+        """Find files matching a text query, most relevant first.
+
+        Args:
+            db: Database session
+            query: File query with filters and permissions applied
+            text: Text query
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            skip: Matches to skip when no cursor is given
+
+        Returns:
+            Page of matching files
+        """
+        query = await self._filter_matches(db, query, text)
+        if query is None:
+            return FileSearchPage([], None, 0, False)
+        ts_query, name, phrase = self._terms(tokenize(text))
+        rank = cast(func.ts_rank_cd(file_search_document(), ts_query) + func.similarity(name, phrase), Float)
+        total, estimated = await self.estimate_count(db, query)
+
+        query = query.add_columns(rank.label("search_rank"))
+        if cursor:
+            _, after_rank, after_id = _decode(cursor, _RELEVANCE_CURSOR, 3)
+            try:
+                after_id = UUID(after_id)
+            except (TypeError, ValueError):
+                raise ValueError("Invalid cursor: made for a different search")
+            query = query.where(or_(
+                rank < after_rank,
+                and_(rank == after_rank, File.id > after_id),
+            ))
+        elif skip:
+            query = query.offset(skip)
+
+        result = await db.execute(query.order_by(desc(rank), asc(File.id)).limit(limit + 1))
+        rows = list(result.all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_file, last_rank = rows[-1]
+            next_cursor = encode_cursor([_RELEVANCE_CURSOR, last_rank, str(last_file.id)])
+        return FileSearchPage([file for file, _ in rows], next_cursor, total, estimated)
+
+    async def _filter_matches(self, db: AsyncSession, query: Select, text: str) -> Optional[Select]:
+        tokens = tokenize(text)
+        if not tokens:
+            return None
+        ts_query, name, phrase = self._terms(tokens)
+        return query.where(or_(file_search_document().op("@@")(ts_query), name.op("%")(phrase)))
+
+    @staticmethod
+    def _terms(tokens: List[str]) -> Tuple[Any, Any, str]:
+        # Tokens are plain words, safe to join into tsquery syntax
+        ts_query = func.to_tsquery(_TS_CONFIG, " & ".join(tokens[:-1] + [tokens[-1] + ":*"]))
+        return ts_query, func.lower(File.name), " ".join(tokens)
+
+    async def _estimate_large_count(self, db: AsyncSession, query: Select) -> int:
+        # The planner's row estimate costs no scan of the matches
+        statement = query.compile(
+            dialect=db.get_bind().dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        params = statement.params
+        if statement.positional:
+            params = tuple(params[name] for name in statement.positiontup)
+        connection = await db.connection()
+        plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", params)).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return max(int(plan[0]["Plan"]["Plan Rows"]), FILE_SEARCH_EXACT_COUNT_LIMIT + 1)
+
+
+class InMemoryFileSearchBackend(FileSearchBackend):
+    """Search backend using an in-process BM25 inverted index.
+
+    The index is loaded from the files table on first search and then
+    updated by FileManager as files change. Changes made by other processes
+    are only seen after rebuild(). Ranked IDs are resolved against the
+    filtered file query in at most FILE_SEARCH_MAX_BATCHES batches, so
+    filters and permissions still apply.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        """Initialize in-process search backend."""
+        self.index = InvertedIndex(FILE_SEARCH_FIELD_WEIGHTS)
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been loaded."""
+        return self._loaded
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query: Select,
+        text: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> FileSearchPage:
+        """Find files matching a text query, most relevant first.
+
+        When filters reject most hits, the page may come back short after
+        FILE_SEARCH_MAX_BATCHES batches; its cursor continues after the
+        last hit checked.
+
+        Args:
+            db: Database session
+            query: File query with filters and permissions applied
+            text: Text query
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            skip: Matches to skip when no cursor is given
+
+        Returns:
+            Page of matching files
+        """
+        await self._ensure_loaded(db)
+
+        after = None
+        if cursor:
+            _, after_score, after_id, skip = _decode(cursor, _RELEVANCE_CURSOR, 4)
+            if not isinstance(skip, int) or skip < 0:
+                raise ValueError("Invalid cursor: made for a different search")
+            after = (after_score, after_id)
+
+        # Resolve ranked hits against the filtered query until the page is full
+        wanted = skip + limit + 1
+        batch_size = max(wanted, 50)
+        matches: List[Tuple[File, float]] = []
+        checked = 0
+        total = 0
+        exhausted = False
+        for _ in range(FILE_SEARCH_MAX_BATCHES):
+            results = self.index.search(text, limit=batch_size, after=after)
+            total = results.total
+            if not results.hits:
+                exhausted = True
+                break
+            result = await db.execute(
+                query.where(File.id.in_([UUID(hit.doc_id) for hit in results.hits]))
+            )
+            found = {str(file.id): file for file in result.scalars().all()}
+            for hit in results.hits:
+                if hit.doc_id in found:
+                    matches.append((found[hit.doc_id], hit.score))
+            checked += len(results.hits)
+            last = results.hits[-1]
+            after = (last.score, last.doc_id)
+            if len(results.hits) < batch_size:
+                exhausted = True
+                break
+            if len(matches) >= wanted:
+                break
+
+        # Without filters every index hit is a match; otherwise scale the
+        # index count by the share of checked hits that passed the filters
+        if exhausted and cursor is None:
+            total, estimated = len(matches), False
+        elif checked:
+            total, estimated = round(total * len(matches) / checked), True
+        else:
+            estimated = False
+
+        page = matches[skip:skip + limit]
+        next_cursor = None
+        if len(matches) > skip + limit:
+            last_file, last_score = page[-1]
+            next_cursor = encode_cursor([_RELEVANCE_CURSOR, last_score, str(last_file.id), 0])
+        elif not exhausted:
+            # Batch limit reached; continue after the last hit checked
+            next_cursor = encode_cursor([_RELEVANCE_CURSOR, after[0], after[1], max(skip - len(matches), 0)])
+        return FileSearchPage([file for file, _ in page], next_cursor, total, estimated)
+
+    async def _filter_matches(self, db: AsyncSession, query: Select, text: str) -> Optional[Select]:
+        await self._ensure_loaded(db)
+        hits = self.index.search(text).hits
+        if not hits:
+            return None
+        return query.where(File.id.in_([UUID(hit.doc_id) for hit in hits]))
+
+    async def index_files(self, db: AsyncSession, file_ids: Iterable[Any]) -> None:
+        """Bring created or updated files into the search index.
+
+        Args:
+            db: Database session
+            file_ids: File IDs
+        """
+        file_ids = [UUID(str(file_id)) for file_id in file_ids]
+        if not self._loaded or not file_ids:
+            # Files are picked up when the index is loaded
+            return
+        async with self._lock:
+            result = await db.execute(
+                select(File.id, File.name, File.tags, File.description).where(File.id.in_(file_ids))
+            )
+            rows = {row.id: row for row in result.all()}
+            for file_id in file_ids:
+                row = rows.get(file_id)
+                if row is None:
+                    self.index.remove(str(file_id))
+                else:
+                    self._add_row(row)
+
+    def remove_files(self, file_ids: Iterable[Any]) -> None:
+        """Drop deleted files from the search index.
+
+        Args:
+            file_ids: File IDs
+        """
+        for file_id in file_ids:
+            self.index.remove(str(file_id))
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        """Reload the index from the files table.
+
+        Args:
+            db: Database session
+        """
+        async with self._lock:
+            await self._load(db)
+
+    async def _ensure_loaded(self, db: AsyncSession) -> None:
+        if not self._loaded:
+            async with self._lock:
+                if not self._loaded:
+                    await self._load(db)
+
+    async def _load(self, db: AsyncSession) -> None:
+        self.index.clear()
+        result = await db.stream(
+            select(File.id, File.name, File.tags, File.description)
+            .execution_options(yield_per=FILE_SEARCH_LOAD_BATCH_SIZE)
+        )
+        async for row in result:
+            self._add_row(row)
+        self._loaded = True
+
+        logger.info(f"Loaded {len(self.index)} files into the search index")
+
+    def _add_row(self, row: Any) -> None:
+        tags = row.tags if isinstance(row.tags, list) else None
+        self.index.add(str(row.id), {
+            "name": row.name,
+            "tags": [str(tag) for tag in tags or []],
+            "description": row.description,
+        })
+
+
+def _decode(cursor: str, kind: str, size: int) -> List[Any]:
+    """Decode a cursor and check it was made by the expected ordering.
+
+    Raises:
+        ValueError: If the cursor is malformed or of another kind
+    """
+    values = decode_cursor(cursor)
+    if len(values) != size or values[0] != kind:
+        raise ValueError("Invalid cursor: made for a different search")
+    return values
+
+
+# Backends per database, so the in-process index outlives sessions
+_backends: Dict[str, FileSearchBackend] = {}
+
+
+def get_file_search_backend(db: AsyncSession, backend: Optional[str] = None) -> FileSearchBackend:
+    """Get the file search backend for the database of a session.
+
+    Args:
+        db: Database session
+        backend: "postgresql", "memory" or "auto" (FILE_SEARCH_BACKEND
+            setting when omitted)
+
+    Returns:
+        Search backend shared by all sessions of the database
+    """
+    bind = db.get_bind()
+    if backend is None:
+        from app.core.config import settings
+        backend = settings.FILE_SEARCH_BACKEND
+    if backend == "auto":
+        backend = "postgresql" if bind.dialect.name == "postgresql" else "memory"
+    if backend not in ("postgresql", "memory"):
+        raise ValueError(f"Unsupported search backend: {backend}")
+
+    key = f"{backend}:{bind.url}"
+    instance = _backends.get(key)
+    if instance is None:
+        if backend == "postgresql":
+            instance = PostgresFileSearchBackend()
+        else:
+            instance = InMemoryFileSearchBackend()
+        _backends[key] = instance
+    return instance
@@ -0,0 +1,234 @@
+"""Operational Transform.
+
+This module contains the transform engine used by the file editor to rebase
+change operations made against an older document version onto the operations
+committed since, plus the bounded per-session operation log that supplies
+those committed operations.
+
+Operations are normalized to two primitives before transforming: ``insert``
+(position, content) and ``delete`` (position, length). A ``replace`` becomes a
+delete followed by an insert at the same position. When two inserts land on
+the same position, the already-committed one is placed first.
+"""
+
+from collections import deque
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.file.editor import ChangeOperation
+
+
+__all__ = [
+    "OperationLog",
+    "normalize_operations",
+    "serialize_operations",
+    "transform_operations",
+]
+
+
+def normalize_operations(operations: Iterable["ChangeOperation"]) -> List["ChangeOperation"]:
+    """Split operations into insert and delete primitives.
+
+    Args:
+        operations: Change operations
+
+    Returns:
+        Equivalent list of insert/delete operations
+    """
+    result = []
+    for operation in operations:
+        if operation.type == "insert":
+            if operation.content:
+                result.append(replace(operation, length=len(operation.content)))
+        elif operation.type == "delete":
+            if operation.length > 0:
+                result.append(replace(operation, content=""))
+        elif operation.type == "replace":
+            if operation.length > 0:
+                result.append(replace(operation, type="delete", content=""))
+            if operation.content:
+                result.append(replace(operation, type="insert", length=len(operation.content)))
+        else:
+            raise ValueError(f"Unknown change type: {operation.type}")
+    return result
+
+
+def _insert(operation: "ChangeOperation", position: int) -> "ChangeOperation":
+    return replace(operation, position=position)
+
+
+def _delete(operation: "ChangeOperation", position: int, length: int) -> "ChangeOperation":
+    return replace(operation, position=position, length=length)
+
+
+def _transform_pair(
+    a: "ChangeOperation",
+    b: "ChangeOperation",
+) -> Tuple[List["ChangeOperation"], List["ChangeOperation"]]:
+    """Transform two concurrent primitives against each other.
+
+    Returns a' (a applied after b) and b' (b applied after a); b wins ties.
+    """
+    if a.type == "insert" and b.type == "insert":
+        if a.position < b.position:
+            return [a], [_insert(b, b.position + a.length)]
+        return [_insert(a, a.position + b.length)], [b]
+
+    if a.type == "insert":
+        return _transform_insert_delete(a, b)
+
+    if b.type == "insert":
+        b_list, a_list = _transform_insert_delete(b, a)
+        return a_list, b_list
+
+    # delete against delete
+    a_end, b_end = a.position + a.length, b.position + b.length
+    overlap = max(0, min(a_end, b_end) - max(a.position, b.position))
+
+    if a_end <= b.position:
+        a_prime = a
+    elif a.position >= b_end:
+        a_prime = _delete(a, a.position - b.length, a.length)
+    else:
+        a_prime = _delete(a, min(a.position, b.position), a.length - overlap)
+
+    if b_end <= a.position:
+        b_prime = b
+    elif b.position >= a_end:
+        b_prime = _delete(b, b.position - a.length, b.length)
+    else:
+        b_prime = _delete(b, min(a.position, b.position), b.length - overlap)
+
+    return (
+        [a_prime] if a_prime.length > 0 else [],
+        [b_prime] if b_prime.length > 0 else [],
+    )
+
+
+def _transform_insert_delete(
+    insert: "ChangeOperation",
+    delete: "ChangeOperation",
+) -> Tuple[List["ChangeOperation"], List["ChangeOperation"]]:
+    """Transform an insert and a delete against each other."""
+    delete_end = delete.position + delete.length
+
+    if insert.position <= delete.position:
+        return [insert], [_delete(delete, delete.position + insert.length, delete.length)]
+    if insert.position >= delete_end:
+        return [_insert(insert, insert.position - delete.length)], [delete]
+
+    # The insert lands inside the deleted range: keep the inserted text and
+    # delete around it, right part first so the left offsets stay valid.
+    head = insert.position - delete.position
+    return (
+        [_insert(insert, delete.position)],
+        [
+            _delete(delete, insert.position + insert.length, delete.length - head),
+            _delete(delete, delete.position, head),
+        ],
+    )
+
+
+def transform_operations(
+    operations: List["ChangeOperation"],
+    committed: List["ChangeOperation"],
+) -> Tuple[List["ChangeOperation"], List["ChangeOperation"]]:
+    """Rebase operations onto concurrently committed operations.
+
+    Both lists are sequences applied in order against the same base document.
+
+    Args:
+        operations: Incoming operations
+        committed: Operations already applied to the base document
+
+    Returns:
+        Tuple of (operations rebased after committed, committed rebased after operations)
+    """
+    operations = normalize_operations(operations)
+    committed = normalize_operations(committed)
+
+    result: List["ChangeOperation"] = []
+    for operation in operations:
+        current = [operation]
+        next_committed: List["ChangeOperation"] = []
+        for other in committed:
+            if len(current) == 1:
+                current, transformed = _transform_pair(current[0], other)
+            else:
+                current, transformed = transform_operations(current, [other])
+            next_committed.extend(transformed)
+        result.extend(current)
+        committed = next_committed
+    return result, committed
+
+
+def serialize_operations(operations: Iterable["ChangeOperation"]) -> List[Dict[str, Any]]:
+    """Serialize operations to the compact form broadcast to clients.
+
+    Args:
+        operations: Normalized operations
+
+    Returns:
+        List of operation dictionaries
+    """
+    result = []
+    for operation in operations:
+        if operation.type == "insert":
+            result.append({"type": "insert", "position": operation.position, "content": operation.content})
+        else:
+            result.append({"type": operation.type, "position": operation.position, "length": operation.length})
+    return result
+
+
+class OperationLog:
+    """Bounded log of the operations committed to one editor session.
+
+    Each entry records the version a batch was applied to and its normalized
+    operations. Only the most recent ``max_entries`` batches are kept, so
+    clients further behind than that have to resynchronize.
+    """
+
+    def __init__(self, max_entries: int = 200):
+        """Initialize operation log.
+
+        Args:
+            max_entries: Maximum number of batches retained
+        """
+        self.max_entries = max_entries
+        self._entries: Deque[Tuple[int, List["ChangeOperation"]]] = deque(maxlen=max_entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def oldest_version(self) -> Optional[int]:
+        """Oldest base version that can still be rebased, if any."""
+        return self._entries[0][0] if self._entries else None
+
+    def append(self, version: int, operations: List["ChangeOperation"]) -> None:
+        """Record a committed batch.
+
+        Args:
+            version: Version the batch was applied to
+            operations: Normalized operations of the batch
+        """
+        self._entries.append((version, operations))
+
+    def since(self, version: int) -> Optional[List["ChangeOperation"]]:
+        """Return the operations committed on top of a version.
+
+        Args:
+            version: Client base version
+
+        Returns:
+            Committed operations in order, or None if the log no longer
+            reaches back to that version
+        """
+        if not self._entries or version < self._entries[0][0]:
+            return None
+        operations: List["ChangeOperation"] = []
+        for entry_version, entry_operations in self._entries:
+            if entry_version >= version:
+                operations.extend(entry_operations)
+        return operations
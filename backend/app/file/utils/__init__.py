@@ -4,6 +4,86 @@ This module contains utility functions for the file management system,
 including validators, formatters, processors, and helpers.
 """
 
+from typing import Any, Dict
+
+# Constants are defined before importing the submodules, which use them
+
+# Utility constants
+FILE_UTILS_CONSTANTS = {
+    "MAX_FILE_NAME_LENGTH": 255,
+    "MAX_FILE_PATH_LENGTH": 500,
+    "MAX_FILE_SIZE": 1024 * 1024 * 1024,  # 1GB
+    "MIN_FILE_SIZE": 0,
+    "ALLOWED_FILE_TYPES": {
+        "document": [".pdf", ".doc", ".docx", ".txt", ".md", ".rtf"],
+        "image": [".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".bmp"],
+        "video": [".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm", ".mkv"],
+        "audio": [".mp3", ".wav", ".ogg", ".aac", ".flac", ".m4a"],
+        "code": [".py", ".java", ".js", ".ts", ".css", ".html", ".xml", ".json", ".yaml", ".yml"],
+        "archive": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"],
+    },
+    "DISALLOWED_FILE_NAMES": [
+        "CON", "PRN", "AUX", "NUL",
+        "COM1", "COM2", "COM3", "COM4", "COM5",
+        "COM6", "COM7", "COM8", "COM9",
+        "LPT1", "LPT2", "LPT3", "LPT4", "LPT5",
+        "LPT6", "LPT7", "LPT8", "LPT9",
+    ],
+    "INVALID_CHARACTERS": ['<', '>', ':', '"', '|', '?', '*', '\\', '/'],
+    "MAX_METADATA_SIZE": 10000,  # bytes
+    "MAX_TAGS_PER_FILE": 20,
+    "MAX_TAG_LENGTH": 50,
+}
+
+# Hash algorithms
+HASH_ALGORITHMS = {
+    "md5": "MD5",
+    "sha1": "SHA-1",
+    "sha256": "SHA-256",
+    "sha512": "SHA-512",
+}
+
+# Compression algorithms
+COMPRESSION_ALGORITHMS = {
+    "gzip": "GZIP",
+    "bz2": "BZ2",
+    "lzma": "LZMA",
+    "zip": "ZIP",
+    "zstd": "ZSTD",  # requires zstandard
+    "lz4": "LZ4",  # requires lz4
+}
+
+# MIME type mappings
+MIME_TYPE_MAP = {
+    ".pdf": "application/pdf",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".mp4": "video/mp4",
+    ".avi": "video/x-msvideo",
+    ".mov": "video/quicktime",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".ogg": "audio/ogg",
+    ".zip": "application/zip",
+    ".json": "application/json",
+    ".xml": "application/xml",
+    ".yaml": "application/x-yaml",
+    ".yml": "application/x-yaml",
+    ".py": "text/x-python",
+    ".js": "text/javascript",
+    ".ts": "text/typescript",
+    ".html": "text/html",
+    ".css": "text/css",
+}
+
 from .validators import (
     FileValidator,
     ContentValidator,
@@ -42,6 +122,16 @@ from .processors import (
     calculate_checksum,
     compress_data,
     decompress_data,
+    MultiHasher,
+    StreamingCompressor,
+    StreamingDecompressor,
+    iter_chunks,
+    aiter_chunks,
+    hash_stream,
+    compress_stream,
+    decompress_stream,
+    write_archive,
+    iter_archive_entries,
 )
 
 __all__ = [
@@ -81,81 +171,18 @@ __all__ = [
     "calculate_checksum",
     "compress_data",
     "decompress_data",
+    "MultiHasher",
+    "StreamingCompressor",
+    "StreamingDecompressor",
+    "iter_chunks",
+    "aiter_chunks",
+    "hash_stream",
+    "compress_stream",
+    "decompress_stream",
+    "write_archive",
+    "iter_archive_entries",
 ]
 
-# Utility constants
-FILE_UTILS_CONSTANTS = {
-    "MAX_FILE_NAME_LENGTH": 255,
-    "MAX_FILE_PATH_LENGTH": 500,
-    "MAX_FILE_SIZE": 1024 * 1024 * 1024,  # 1GB
-    "MIN_FILE_SIZE": 0,
-    "ALLOWED_FILE_TYPES": {
-        "document": [".pdf", ".doc", ".docx", ".txt", ".md", ".rtf"],
-        "image": [".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".bmp"],
-        "video": [".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm", ".mkv"],
-        "audio": [".mp3", ".wav", ".ogg", ".aac", ".flac", ".m4a"],
-        "code": [".py", ".java", ".js", ".ts", ".css", ".html", ".xml", ".json", ".yaml", ".yml"],
-        "archive": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"],
-    },
-    "DISALLOWED_FILE_NAMES": [
-        "CON", "PRN", "AUX", "NUL",
-        "COM1", "COM2", "COM3", "COM4", "COM5",
-        "COM6", "COM7", "COM8", "COM9",
-        "LPT1", "LPT2", "LPT3", "LPT4", "LPT5",
-        "LPT6", "LPT7", "LPT8", "LPT9",
-    ],
-    "INVALID_CHARACTERS": ['<', '>', ':', '"', '|', '?', '*', '\\', '/'],
-    "MAX_METADATA_SIZE": 10000,  # bytes
-    "MAX_TAGS_PER_FILE": 20,
-    "MAX_TAG_LENGTH": 50,
-}
-
-# Hash algorithms
-HASH_ALGORITHMS = {
-    "md5": "MD5",
-    "sha1": "SHA-1",
-    "sha256": "SHA-256",
-    "sha512": "SHA-512",
-}
-
-# Compression algorithms
-COMPRESSION_ALGORITHMS = {
-    "gzip": "GZIP",
-    "bz2": "BZ2",
-    "lzma": "LZMA",
-    "zip": "ZIP",
-}
-
-# MIME type mappings
-MIME_TYPE_MAP = {
-    ".pdf": "application/pdf",
-    ".doc": "application/msword",
-    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    ".txt": "text/plain",
-    ".md": "text/markdown",
-    ".jpg": "image/jpeg",
-    ".jpeg": "image/jpeg",
-    ".png": "image/png",
-    ".gif": "image/gif",
-    ".webp": "image/webp",
-    ".svg": "image/svg+xml",
-    ".mp4": "video/mp4",
-    ".avi": "video/x-msvideo",
-    ".mov": "video/quicktime",
-    ".mp3": "audio/mpeg",
-    ".wav": "audio/wav",
-    ".ogg": "audio/ogg",
-    ".zip": "application/zip",
-    ".json": "application/json",
-    ".xml": "application/xml",
-    ".yaml": "application/x-yaml",
-    ".yml": "application/x-yaml",
-    ".py": "text/x-python",
-    ".js": "text/javascript",
-    ".ts": "text/typescript",
-    ".html": "text/html",
-    ".css": "text/css",
-}
 
 # File type icons
 FILE_TYPE_ICONS = {
@@ -2,19 +2,392 @@
 
 This module contains processing functions for file operations,
 including content processing, metadata extraction, and file transformations.
+
+Compression, decompression and hashing also work on streams (file paths,
+file objects or async iterators) in fixed-size blocks, so large files are
+processed in constant memory and a single read pass can both compress and
+checksum them.
 """
 
 import os
 import io
+import asyncio
+import bz2
 import hashlib
+import importlib
+import inspect
+import lzma
 import mimetypes
 import json
-from typing import Optional, Dict, Any, List, Tuple, Union, BinaryIO
+import tarfile
+import time
+import zipfile
+import zlib
+from contextlib import nullcontext
+from typing import (
+    Optional, Dict, Any, List, Tuple, Union, BinaryIO,
+    AsyncIterable, AsyncIterator, Iterable, Iterator,
+)
 from datetime import datetime
 from pathlib import Path
 
 from . import HASH_ALGORITHMS, COMPRESSION_ALGORITHMS
 
+# Block size for streaming reads; memory use stays at a few blocks per stream
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Archive formats accepted by write_archive / iter_archive_entries
+ARCHIVE_FORMATS = {
+    "zip": None,
+    "tar": "w|",
+    "tar.gz": "w|gz",
+    "tar.bz2": "w|bz2",
+    "tar.xz": "w|xz",
+}
+
+StreamSource = Union[bytes, bytearray, memoryview, str, Path, BinaryIO]
+
+
+def _import_codec(module: str, algorithm: str):
+    """Import an optional compression backend."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ValueError(f"{algorithm} compression requires the {module.split('.')[0]} package")
+
+
+class _LZ4Compressor:
+    """Adapter giving lz4 frames the compress/flush interface of zlib."""
+
+    def __init__(self, lz4_frame, level: int):
+        self._compressor = lz4_frame.LZ4FrameCompressor(compression_level=level)
+        self._header = self._compressor.begin()
+
+    def compress(self, data: bytes) -> bytes:
+        output = self._header + self._compressor.compress(data)
+        self._header = b""
+        return output
+
+    def flush(self) -> bytes:
+        output = self._header + self._compressor.flush()
+        self._header = b""
+        return output
+
+
+def _new_compressor(algorithm: str, level: int):
+    """Create an incremental compressor with compress() and flush()."""
+    if algorithm == 'gzip':
+        # wbits=31 writes a gzip header and trailer around the deflate stream
+        return zlib.compressobj(level, zlib.DEFLATED, 31)
+    if algorithm == 'bz2':
+        return bz2.BZ2Compressor(max(1, min(level, 9)))
+    if algorithm == 'lzma':
+        return lzma.LZMACompressor(preset=max(0, min(level, 9)))
+    if algorithm == 'zstd':
+        return _import_codec('zstandard', 'zstd').ZstdCompressor(level=level).compressobj()
+    if algorithm == 'lz4':
+        return _LZ4Compressor(_import_codec('lz4.frame', 'lz4'), level)
+    raise ValueError(f"Streaming compression not supported for {algorithm}")
+
+
+def _new_decompressor(algorithm: str):
+    """Create an incremental decompressor with decompress(), eof and unused_data."""
+    if algorithm == 'gzip':
+        return zlib.decompressobj(31)
+    if algorithm == 'bz2':
+        return bz2.BZ2Decompressor()
+    if algorithm == 'lzma':
+        return lzma.LZMADecompressor()
+    if algorithm == 'zstd':
+        return _import_codec('zstandard', 'zstd').ZstdDecompressor().decompressobj()
+    if algorithm == 'lz4':
+        return _import_codec('lz4.frame', 'lz4').LZ4FrameDecompressor()
+    raise ValueError(f"Streaming decompression not supported for {algorithm}")
+
+
+class MultiHasher:
+    """Compute several checksums of a stream in a single pass."""
+
+    def __init__(self, algorithms: Iterable[str] = ('sha256',)):
+        """Initialize hasher.
+
+        Args:
+            algorithms: Hash algorithm names
+        """
+        self._hashes = {}
+        for algorithm in algorithms:
+            name = algorithm.lower()
+            if name not in HASH_ALGORITHMS:
+                raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+            self._hashes[name] = hashlib.new(name)
+        self.size = 0
+
+    def update(self, chunk: bytes) -> None:
+        """Feed a block of data to every hash."""
+        for hash_obj in self._hashes.values():
+            hash_obj.update(chunk)
+        self.size += len(chunk)
+
+    def hexdigests(self) -> Dict[str, str]:
+        """Get the hex digest of every hash, keyed by algorithm."""
+        return {name: hash_obj.hexdigest() for name, hash_obj in self._hashes.items()}
+
+
+class StreamingCompressor:
+    """Incremental compressor that checksums its input in the same pass."""
+
+    def __init__(self, algorithm: str = 'gzip', level: int = 6,
+                 hash_algorithms: Iterable[str] = ()):
+        """Initialize compressor.
+
+        Args:
+            algorithm: Compression algorithm (gzip, bz2, lzma, zstd, lz4)
+            level: Compression level
+            hash_algorithms: Checksums to compute over the uncompressed input
+        """
+        self.algorithm = algorithm.lower()
+        self._compressor = _new_compressor(self.algorithm, level)
+        self.hasher = MultiHasher(hash_algorithms)
+        self.bytes_out = 0
+
+    @property
+    def bytes_in(self) -> int:
+        """Uncompressed bytes consumed so far."""
+        return self.hasher.size
+
+    @property
+    def checksums(self) -> Dict[str, str]:
+        """Checksums of the uncompressed input."""
+        return self.hasher.hexdigests()
+
+    def update(self, chunk: bytes) -> bytes:
+        """Compress a block.
+
+        Args:
+            chunk: Uncompressed data
+
+        Returns:
+            Compressed output available so far (may be empty)
+        """
+        self.hasher.update(chunk)
+        output = self._compressor.compress(chunk)
+        self.bytes_out += len(output)
+        return output
+
+    def finish(self) -> bytes:
+        """Flush the compressor and end the stream.
+
+        Returns:
+            Remaining compressed output
+        """
+        output = self._compressor.flush()
+        self.bytes_out += len(output)
+        return output
+
+    async def compress_async(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Compress an async stream, running the codec off the event loop.
+
+        Args:
+            chunks: Uncompressed blocks
+
+        Yields:
+            Compressed blocks
+        """
+        async for chunk in chunks:
+            output = await asyncio.to_thread(self.update, chunk)
+            if output:
+                yield output
+        output = self.finish()
+        if output:
+            yield output
+
+
+class StreamingDecompressor:
+    """Incremental decompressor that checksums its output in the same pass."""
+
+    def __init__(self, algorithm: str = 'gzip', hash_algorithms: Iterable[str] = ()):
+        """Initialize decompressor.
+
+        Args:
+            algorithm: Compression algorithm (gzip, bz2, lzma, zstd, lz4)
+            hash_algorithms: Checksums to compute over the decompressed output
+        """
+        self.algorithm = algorithm.lower()
+        self._decompressor = _new_decompressor(self.algorithm)
+        self.hasher = MultiHasher(hash_algorithms)
+        self.bytes_in = 0
+
+    @property
+    def bytes_out(self) -> int:
+        """Decompressed bytes produced so far."""
+        return self.hasher.size
+
+    @property
+    def checksums(self) -> Dict[str, str]:
+        """Checksums of the decompressed output."""
+        return self.hasher.hexdigests()
+
+    def update(self, chunk: bytes) -> bytes:
+        """Decompress a block.
+
+        Concatenated streams (e.g. multi-member gzip) are decoded one after
+        another.
+
+        Args:
+            chunk: Compressed data
+
+        Returns:
+            Decompressed output available so far (may be empty)
+        """
+        self.bytes_in += len(chunk)
+        outputs = []
+        data = chunk
+        while data:
+            if getattr(self._decompressor, 'eof', False):
+                self._decompressor = _new_decompressor(self.algorithm)
+            outputs.append(self._decompressor.decompress(data))
+            data = self._decompressor.unused_data if getattr(self._decompressor, 'eof', False) else b""
+        output = b"".join(outputs)
+        self.hasher.update(output)
+        return output
+
+    def finish(self) -> bytes:
+        """End the stream.
+
+        Returns:
+            Remaining decompressed output
+
+        Raises:
+            ValueError: If the compressed stream is truncated
+        """
+        if self.bytes_in and not getattr(self._decompressor, 'eof', True):
+            raise ValueError("Compressed stream ended unexpectedly")
+        return b""
+
+    async def decompress_async(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Decompress an async stream, running the codec off the event loop.
+
+        Args:
+            chunks: Compressed blocks
+
+        Yields:
+            Decompressed blocks
+        """
+        async for chunk in chunks:
+            output = await asyncio.to_thread(self.update, chunk)
+            if output:
+                yield output
+        self.finish()
+
+
+def iter_chunks(source: StreamSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a source in fixed-size blocks.
+
+    Args:
+        source: Bytes, a file path or a binary file object
+        chunk_size: Block size in bytes
+
+    Yields:
+        Blocks of at most chunk_size bytes
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+        return
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            yield from iter_chunks(f, chunk_size)
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def aiter_chunks(source: Union[StreamSource, AsyncIterable[bytes]],
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a source in fixed-size blocks without blocking the event loop.
+
+    Args:
+        source: An async iterable of blocks, an object with an async read()
+            (e.g. an UploadFile), or anything iter_chunks accepts
+        chunk_size: Block size in bytes
+
+    Yields:
+        Blocks of data
+    """
+    if hasattr(source, '__aiter__') and not hasattr(source, 'read'):
+        async for chunk in source:
+            yield chunk
+        return
+    if hasattr(source, 'read') and inspect.iscoroutinefunction(source.read):
+        while True:
+            chunk = await source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    iterator = iter_chunks(source, chunk_size)
+    sentinel = object()
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, sentinel)
+            if chunk is sentinel:
+                return
+            yield chunk
+    finally:
+        iterator.close()
+
+
+def _entry_size(source: StreamSource) -> int:
+    """Get the size of an archive entry source without reading it."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    if isinstance(source, (str, Path)):
+        return os.path.getsize(source)
+    position = source.tell()
+    size = source.seek(0, io.SEEK_END) - position
+    source.seek(position)
+    return size
+
+
+def _entry_mtime(source: StreamSource) -> float:
+    """Get the modification time recorded for an archive entry."""
+    if isinstance(source, (str, Path)):
+        return os.path.getmtime(source)
+    return time.time()
+
+
+def _open_source(source: StreamSource):
+    """Open an entry source as a binary file object."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if isinstance(source, (str, Path)):
+        return open(source, 'rb')
+    return nullcontext(source)
+
+
+def _open_target(target: Union[str, Path, BinaryIO]):
+    """Open a stream target as a writable binary file object."""
+    if isinstance(target, (str, Path)):
+        return open(target, 'wb')
+    return nullcontext(target)
+
+
+class _HashingReader:
+    """File wrapper that hashes everything read through it."""
+
+    def __init__(self, source: BinaryIO, hasher: MultiHasher):
+        self._source = source
+        self._hasher = hasher
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._source.read(size)
+        self._hasher.update(chunk)
+        return chunk
+
 
 class FileProcessor:
     """Base file processor."""
@@ -121,17 +494,7 @@ class ContentProcessor(FileProcessor):
         Returns:
             Tuple of (success, compressed_content, error_message)
         """
-        try:
-            import gzip
-
-            if algorithm == 'gzip':
-                compressed = gzip.compress(content)
-            else:
-                return False, content, f"Unsupported compression algorithm: {algorithm}"
-
-            return True, compressed, None
-        except Exception as e:
-            return False, content, f"Compression error: {str(e)}"
+        return CompressProcessor().compress_data(content, algorithm)
 
     def decompress_content(self, content: bytes,
                          algorithm: str = 'gzip') -> Tuple[bool, bytes, Optional[str]]:
@@ -144,17 +507,7 @@ class ContentProcessor(FileProcessor):
         Returns:
             Tuple of (success, decompressed_content, error_message)
         """
-        try:
-            import gzip
-
-            if algorithm == 'gzip':
-                decompressed = gzip.decompress(content)
-            else:
-                return False, content, f"Unsupported decompression algorithm: {algorithm}"
-
-            return True, decompressed, None
-        except Exception as e:
-            return False, content, f"Decompression error: {str(e)}"
+        return CompressProcessor().decompress_data(content, algorithm)
 
     def process(self, content: bytes, **kwargs) -> Tuple[bool, bytes, Optional[str]]:
         """Process file content.
@@ -227,12 +580,29 @@ class MetadataProcessor(FileProcessor):
 
     def _extract_image_metadata(self, content: bytes) -> Dict[str, Any]:
         """Extract image metadata."""
-        # Simplified implementation
-        # In practice, you'd use libraries like PIL, exifread, etc.
-        return {
+        metadata = {
             'type': 'image',
             'is_binary': True,
         }
+        try:
+            from PIL import Image
+        except ImportError:
+            # Dimensions need Pillow
+            return metadata
+
+        # Opening only parses the header; pixel data is not decoded
+        try:
+            with Image.open(io.BytesIO(content)) as image:
+                metadata.update({
+                    'width': image.width,
+                    'height': image.height,
+                    'format': image.format,
+                    'mode': image.mode,
+                })
+        except OSError:
+            # Not an image Pillow can read
+            pass
+        return metadata
 
     def _extract_json_metadata(self, content: bytes) -> Dict[str, Any]:
         """Extract JSON metadata."""
@@ -322,10 +692,21 @@ class ThumbnailProcessor(FileProcessor):
             return False, content, f"Thumbnail generation error: {str(e)}"
 
     def _generate_image_thumbnail(self, content: bytes, width: int, height: int) -> Tuple[bool, bytes, Optional[str]]:
-        """Generate image thumbnail."""
-        # Simplified implementation
-        # In practice, you'd use libraries like PIL, OpenCV, etc.
-        return False, content, "Image thumbnail generation not implemented"
+        """Generate image thumbnail as PNG."""
+        try:
+            from PIL import Image
+        except ImportError:
+            return False, content, "Image thumbnail generation requires Pillow"
+
+        with Image.open(io.BytesIO(content)) as image:
+            # Let JPEG decode straight to a reduced scale instead of full size
+            image.draft('RGB', (width, height))
+            image.thumbnail((width, height))
+            if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                image = image.convert('RGBA')
+            output = io.BytesIO()
+            image.save(output, format='PNG', optimize=True)
+        return True, output.getvalue(), None
 
     def _generate_pdf_thumbnail(self, content: bytes, width: int, height: int) -> Tuple[bool, bytes, Optional[str]]:
         """Generate PDF thumbnail."""
@@ -368,12 +749,12 @@ class HashProcessor(FileProcessor):
         """Initialize hash processor."""
         super().__init__()
 
-    def calculate_checksum(self, content: bytes,
+    def calculate_checksum(self, content: Union[bytes, BinaryIO],
                          algorithm: str = 'md5') -> Tuple[bool, str, Optional[str]]:
         """Calculate checksum of content.
 
         Args:
-            content: Content to hash
+            content: Content to hash, or a binary file object read in blocks
             algorithm: Hash algorithm
 
         Returns:
@@ -383,21 +764,38 @@ class HashProcessor(FileProcessor):
             if algorithm.lower() not in HASH_ALGORITHMS:
                 return False, "", f"Unsupported hash algorithm: {algorithm}"
 
-            if algorithm.lower() == 'md5':
-                hash_obj = hashlib.md5(content)
-            elif algorithm.lower() == 'sha1':
-                hash_obj = hashlib.sha1(content)
-            elif algorithm.lower() == 'sha256':
-                hash_obj = hashlib.sha256(content)
-            elif algorithm.lower() == 'sha512':
-                hash_obj = hashlib.sha512(content)
+            hasher = MultiHasher([algorithm])
+            if hasattr(content, 'read'):
+                for chunk in iter_chunks(content):
+                    hasher.update(chunk)
             else:
-                return False, "", f"Hash algorithm not implemented: {algorithm}"
+                hasher.update(content)
 
-            return True, hash_obj.hexdigest(), None
+            return True, hasher.hexdigests()[algorithm.lower()], None
         except Exception as e:
             return False, "", f"Hash calculation error: {str(e)}"
 
+    def hash_stream(self, source: StreamSource,
+                    algorithms: Iterable[str] = ('md5', 'sha256'),
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bool, Dict[str, str], Optional[str]]:
+        """Calculate several checksums in one pass over a stream.
+
+        Args:
+            source: Bytes, a file path or a binary file object
+            algorithms: Hash algorithms
+            chunk_size: Block size in bytes
+
+        Returns:
+            Tuple of (success, checksums_by_algorithm, error_message)
+        """
+        try:
+            hasher = MultiHasher(algorithms)
+            for chunk in iter_chunks(source, chunk_size):
+                hasher.update(chunk)
+            return True, hasher.hexdigests(), None
+        except Exception as e:
+            return False, {}, f"Hash calculation error: {str(e)}"
+
     def verify_checksum(self, content: bytes, expected_hash: str,
                        algorithm: str = 'md5') -> Tuple[bool, Optional[str]]:
         """Verify checksum of content.
@@ -473,12 +871,13 @@ class CompressProcessor(FileProcessor):
             if algorithm.lower() not in COMPRESSION_ALGORITHMS:
                 return False, content, f"Unsupported compression algorithm: {algorithm}"
 
-            if algorithm.lower() == 'gzip':
-                import gzip
-                compressed = gzip.compress(content, compresslevel=compress_level)
-            else:
+            if algorithm.lower() == 'zip':
+                # Archives hold named entries; see write_archive
                 return False, content, f"Compression algorithm not implemented: {algorithm}"
 
+            compressor = StreamingCompressor(algorithm, compress_level)
+            compressed = compressor.update(content) + compressor.finish()
+
             return True, compressed, None
         except Exception as e:
             return False, content, f"Compression error: {str(e)}"
@@ -498,16 +897,150 @@ class CompressProcessor(FileProcessor):
             if algorithm.lower() not in COMPRESSION_ALGORITHMS:
                 return False, content, f"Unsupported decompression algorithm: {algorithm}"
 
-            if algorithm.lower() == 'gzip':
-                import gzip
-                decompressed = gzip.decompress(content)
-            else:
+            if algorithm.lower() == 'zip':
                 return False, content, f"Decompression algorithm not implemented: {algorithm}"
 
+            decompressor = StreamingDecompressor(algorithm)
+            decompressed = decompressor.update(content) + decompressor.finish()
+
             return True, decompressed, None
         except Exception as e:
             return False, content, f"Decompression error: {str(e)}"
 
+    def compress_stream(self, source: StreamSource,
+                        target: Union[str, Path, BinaryIO],
+                        algorithm: str = 'gzip',
+                        compress_level: int = 6,
+                        hash_algorithms: Iterable[str] = ('sha256',),
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+        """Compress a stream in fixed-size blocks, checksumming it in the same pass.
+
+        Args:
+            source: Bytes, a file path or a binary file object
+            target: Output path or writable binary file object
+            algorithm: Compression algorithm (gzip, bz2, lzma, zstd, lz4)
+            compress_level: Compression level
+            hash_algorithms: Checksums to compute over the uncompressed data
+            chunk_size: Block size in bytes
+
+        Returns:
+            Tuple of (success, info, error_message); info holds the sizes
+            and checksums
+        """
+        try:
+            compressor = StreamingCompressor(algorithm, compress_level, hash_algorithms)
+            with _open_target(target) as output:
+                for chunk in iter_chunks(source, chunk_size):
+                    output.write(compressor.update(chunk))
+                output.write(compressor.finish())
+
+            return True, {
+                'algorithm': compressor.algorithm,
+                'bytes_in': compressor.bytes_in,
+                'bytes_out': compressor.bytes_out,
+                'checksums': compressor.checksums,
+            }, None
+        except Exception as e:
+            return False, {}, f"Compression error: {str(e)}"
+
+    def decompress_stream(self, source: StreamSource,
+                          target: Union[str, Path, BinaryIO],
+                          algorithm: str = 'gzip',
+                          hash_algorithms: Iterable[str] = ('sha256',),
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+        """Decompress a stream in fixed-size blocks, checksumming the output.
+
+        Args:
+            source: Bytes, a file path or a binary file object
+            target: Output path or writable binary file object
+            algorithm: Compression algorithm (gzip, bz2, lzma, zstd, lz4)
+            hash_algorithms: Checksums to compute over the decompressed data
+            chunk_size: Block size in bytes
+
+        Returns:
+            Tuple of (success, info, error_message); info holds the sizes
+            and checksums
+        """
+        try:
+            decompressor = StreamingDecompressor(algorithm, hash_algorithms)
+            with _open_target(target) as output:
+                for chunk in iter_chunks(source, chunk_size):
+                    output.write(decompressor.update(chunk))
+                output.write(decompressor.finish())
+
+            return True, {
+                'algorithm': decompressor.algorithm,
+                'bytes_in': decompressor.bytes_in,
+                'bytes_out': decompressor.bytes_out,
+                'checksums': decompressor.checksums,
+            }, None
+        except Exception as e:
+            return False, {}, f"Decompression error: {str(e)}"
+
+    def write_archive(self, entries: Iterable[Tuple[str, StreamSource]],
+                      target: Union[str, Path, BinaryIO],
+                      archive_format: str = 'zip',
+                      hash_algorithms: Iterable[str] = ('sha256',),
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+        """Stream entries into a zip or tar archive.
+
+        Each entry is read once in fixed-size blocks and checksummed while
+        it is written. Tar formats are written as a forward-only stream, so
+        the target need not be seekable; tar entry sources must report their
+        size up front (bytes, paths or seekable file objects).
+
+        Args:
+            entries: (name in archive, source) pairs; sources are bytes,
+                file paths or binary file objects
+            target: Output path or writable binary file object
+            archive_format: One of zip, tar, tar.gz, tar.bz2, tar.xz
+            hash_algorithms: Checksums to compute per entry
+            chunk_size: Block size in bytes
+
+        Returns:
+            Tuple of (success, info, error_message); info lists every entry
+            with its size and checksums
+        """
+        if archive_format not in ARCHIVE_FORMATS:
+            return False, {}, f"Unsupported archive format: {archive_format}"
+
+        written = []
+        try:
+            if archive_format == 'zip':
+                with zipfile.ZipFile(target, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                    for name, source in entries:
+                        hasher = MultiHasher(hash_algorithms)
+                        info = zipfile.ZipInfo(name, date_time=time.localtime(_entry_mtime(source))[:6])
+                        info.compress_type = zipfile.ZIP_DEFLATED
+                        # Sizes are unknown until the entry is written
+                        with archive.open(info, 'w', force_zip64=True) as output:
+                            for chunk in iter_chunks(source, chunk_size):
+                                hasher.update(chunk)
+                                output.write(chunk)
+                        written.append({'name': name, 'size': hasher.size, 'checksums': hasher.hexdigests()})
+            else:
+                if isinstance(target, (str, Path)):
+                    archive = tarfile.open(name=str(target), mode=ARCHIVE_FORMATS[archive_format])
+                else:
+                    archive = tarfile.open(fileobj=target, mode=ARCHIVE_FORMATS[archive_format])
+                with archive:
+                    archive.copybufsize = chunk_size
+                    for name, source in entries:
+                        hasher = MultiHasher(hash_algorithms)
+                        info = tarfile.TarInfo(name)
+                        info.size = _entry_size(source)
+                        info.mtime = _entry_mtime(source)
+                        with _open_source(source) as f:
+                            archive.addfile(info, _HashingReader(f, hasher))
+                        written.append({'name': name, 'size': hasher.size, 'checksums': hasher.hexdigests()})
+
+            result = {'format': archive_format, 'entries': written}
+            if isinstance(target, (str, Path)):
+                result['bytes_out'] = os.path.getsize(target)
+            return True, result, None
+        except Exception as e:
+            return False, {'format': archive_format, 'entries': written}, f"Archive error: {str(e)}"
+
     def process(self, content: bytes, **kwargs) -> Tuple[bool, bytes, Optional[str]]:
         """Process compression.
 
@@ -582,6 +1115,26 @@ def generate_thumbnail(content: bytes, mime_type: str,
     return processor.generate_thumbnail(content, mime_type, width, height)
 
 
+def extract_text_content(content: bytes, max_length: int = 10000,
+                         encoding: str = 'utf-8') -> Tuple[bool, str, Optional[str]]:
+    """Extract a text preview from file content.
+
+    Args:
+        content: File content
+        max_length: Maximum number of characters
+        encoding: Text encoding
+
+    Returns:
+        Tuple of (success, text, error_message)
+    """
+    try:
+        # A character takes at most 4 bytes, so never decode more than needed
+        text = content[:max_length * 4].decode(encoding, errors='replace')
+        return True, text[:max_length], None
+    except LookupError as e:
+        return False, '', f"Text extraction error: {str(e)}"
+
+
 def calculate_checksum(content: bytes, algorithm: str = 'md5') -> Tuple[bool, str, Optional[str]]:
     """Calculate checksum of content.
 
@@ -624,3 +1177,121 @@ def decompress_data(content: bytes, algorithm: str = 'gzip') -> Tuple[bool, byte
     """
     processor = CompressProcessor()
     return processor.decompress_data(content, algorithm)
+
+
+def hash_stream(source: StreamSource, algorithms: Iterable[str] = ('md5', 'sha256'),
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bool, Dict[str, str], Optional[str]]:
+    """Calculate several checksums in one pass over a stream.
+
+    Args:
+        source: Bytes, a file path or a binary file object
+        algorithms: Hash algorithms
+        chunk_size: Block size in bytes
+
+    Returns:
+        Tuple of (success, checksums_by_algorithm, error_message)
+    """
+    processor = HashProcessor()
+    return processor.hash_stream(source, algorithms, chunk_size)
+
+
+def compress_stream(source: StreamSource, target: Union[str, Path, BinaryIO],
+                    algorithm: str = 'gzip', compress_level: int = 6,
+                    hash_algorithms: Iterable[str] = ('sha256',),
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+    """Compress a stream in fixed-size blocks.
+
+    Args:
+        source: Bytes, a file path or a binary file object
+        target: Output path or writable binary file object
+        algorithm: Compression algorithm
+        compress_level: Compression level
+        hash_algorithms: Checksums to compute over the uncompressed data
+        chunk_size: Block size in bytes
+
+    Returns:
+        Tuple of (success, info, error_message)
+    """
+    processor = CompressProcessor()
+    return processor.compress_stream(source, target, algorithm, compress_level, hash_algorithms, chunk_size)
+
+
+def decompress_stream(source: StreamSource, target: Union[str, Path, BinaryIO],
+                      algorithm: str = 'gzip', hash_algorithms: Iterable[str] = ('sha256',),
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+    """Decompress a stream in fixed-size blocks.
+
+    Args:
+        source: Bytes, a file path or a binary file object
+        target: Output path or writable binary file object
+        algorithm: Compression algorithm
+        hash_algorithms: Checksums to compute over the decompressed data
+        chunk_size: Block size in bytes
+
+    Returns:
+        Tuple of (success, info, error_message)
+    """
+    processor = CompressProcessor()
+    return processor.decompress_stream(source, target, algorithm, hash_algorithms, chunk_size)
+
+
+def write_archive(entries: Iterable[Tuple[str, StreamSource]], target: Union[str, Path, BinaryIO],
+                  archive_format: str = 'zip', hash_algorithms: Iterable[str] = ('sha256',),
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+    """Stream entries into a zip or tar archive.
+
+    Args:
+        entries: (name in archive, source) pairs
+        target: Output path or writable binary file object
+        archive_format: One of zip, tar, tar.gz, tar.bz2, tar.xz
+        hash_algorithms: Checksums to compute per entry
+        chunk_size: Block size in bytes
+
+    Returns:
+        Tuple of (success, info, error_message)
+    """
+    processor = CompressProcessor()
+    return processor.write_archive(entries, target, archive_format, hash_algorithms, chunk_size)
+
+
+def iter_archive_entries(source: Union[str, Path, BinaryIO],
+                         archive_format: Optional[str] = None) -> Iterator[Tuple[str, BinaryIO]]:
+    """Iterate over the regular files of a zip or tar archive.
+
+    Entries are decompressed as they are read, so each one must be consumed
+    before moving to the next. Tar archives are read in one forward pass and
+    need not be seekable; zip archives must be.
+
+    Args:
+        source: Archive path or binary file object
+        archive_format: zip or a tar format; detected when omitted (file
+            objects must then be seekable)
+
+    Yields:
+        (name, readable file object) pairs
+    """
+    if archive_format is None:
+        if isinstance(source, (str, Path)):
+            archive_format = 'zip' if zipfile.is_zipfile(source) else 'tar'
+        else:
+            position = source.tell()
+            archive_format = 'zip' if zipfile.is_zipfile(source) else 'tar'
+            source.seek(position)
+
+    if archive_format == 'zip':
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as entry:
+                    yield info.filename, entry
+        return
+
+    if isinstance(source, (str, Path)):
+        archive = tarfile.open(name=str(source), mode='r|*')
+    else:
+        archive = tarfile.open(fileobj=source, mode='r|*')
+    with archive:
+        for member in archive:
+            if member.isfile():
+                yield member.name, archive.extractfile(member)
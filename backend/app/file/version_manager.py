@@ -22,6 +22,8 @@ from sqlalchemy.orm import selectinload
 from app.file.models.file import File
 from app.file.models.file_version import FileVersion, VersionStatus
 from app.file.schemas.file_operations import FileResponse
+from app.core.cache import LRUCache
+from app.core.delta import apply_delta, compute_delta, decode_delta, encode_delta
 
 logger = logging.getLogger(__name__)
 
@@ -95,20 +97,43 @@ class VersionStatistics:
         self.average_size = 0
         self.oldest_version = None
         self.newest_version = None
+        self.stored_size = 0
+        self.delta_versions = 0
         self.contributors = set()
         self.version_timeline = []
 
 
 class VersionManager:
-    """File version management system."""
+    """File version management system.
 
-    def __init__(self, db_session: AsyncSession):
+    Text versions are stored as line deltas against their parent, with a full
+    snapshot whenever the delta chain would exceed ``max_chain_length`` or the
+    delta is not meaningfully smaller than the content. Delta versions carry a
+    ``delta`` metadata entry naming their base version.
+    """
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        max_chain_length: int = 16,
+        max_delta_ratio: float = 0.5,
+        content_cache: Optional[LRUCache] = None,
+        diff_cache: Optional[LRUCache] = None,
+    ):
         """Initialize version manager.
 
         Args:
             db_session: Database session
+            max_chain_length: Maximum deltas between a version and its snapshot
+            max_delta_ratio: Store a snapshot when delta/content exceeds this ratio
+            content_cache: Cache of reconstructed contents (shared by default)
+            diff_cache: Cache of diffs by version pair (shared by default)
         """
         self.db = db_session
+        self.max_chain_length = max_chain_length
+        self.max_delta_ratio = max_delta_ratio
+        self.content_cache = content_cache if content_cache is not None else version_content_cache
+        self.diff_cache = diff_cache if diff_cache is not None else version_diff_cache
 
     async def create_version(
         self,
@@ -160,17 +185,17 @@ class VersionManager:
             if current_version:
                 next_version_number = current_version.version_number + 1
                 parent_version_id = current_version.id
-
-                # Calculate diff from previous version
-                diff_from_previous = None
-                if content is not None and current_version.content is not None:
-                    diff_from_previous = self._generate_diff(
-                        current_version.content, content
-                    )
             else:
                 next_version_number = 1
                 parent_version_id = None
-                diff_from_previous = None
+
+            # Store text content as a delta against the current version when worthwhile
+            stored_content, delta_info = content, None
+            if content is not None and current_version and current_version.content is not None:
+                previous_content = await self._reconstruct_content(current_version)
+                stored_content, delta_info = self._encode_content(
+                    content, current_version, previous_content
+                )
 
             # Generate storage key if not provided
             if storage_key is None:
@@ -187,7 +212,7 @@ class VersionManager:
                     storage_key=storage_key,
                     size=size,
                     mime_type=mime_type,
-                    content=content,
+                    content=stored_content,
                     checksum=checksum,
                     message=message,
                     version_tag=version_tag,
@@ -209,10 +234,9 @@ class VersionManager:
             if metadata:
                 for key, value in metadata.items():
                     version.add_metadata(key, value)
-
-            # Set diff
-            if diff_from_previous:
-                version.diff_from_previous = diff_from_previous
+            if delta_info:
+                version.add_metadata("delta", delta_info)
+            version.content_hash = content_hash
 
             # Add to database
             self.db.add(version)
@@ -220,11 +244,15 @@ class VersionManager:
             # Mark previous version as not current
             if current_version:
                 current_version.unset_as_current()
+                version.is_current = True
 
             # Commit changes
             await self.db.commit()
             await self.db.refresh(version)
 
+            if content is not None:
+                self.content_cache.put(version.id, content)
+
             logger.info(
                 f"Created version {version.version} for file {file_id} by {author_name}"
             )
@@ -411,7 +439,7 @@ class VersionManager:
                 file_id=version_to_restore.file_id,
                 author_id=user_id,
                 author_name=user_name,
-                content=version_to_restore.content,
+                content=await self._reconstruct_content(version_to_restore),
                 storage_key=version_to_restore.storage_key,
                 size=version_to_restore.size,
                 mime_type=version_to_restore.mime_type,
@@ -456,20 +484,14 @@ class VersionManager:
             if not to_version:
                 raise ValueError(f"Target version {to_version_id} not found")
 
-            # Generate content diff
-            content_diff = []
-            if from_version.content is not None and to_version.content is not None:
-                from_lines = from_version.content.splitlines(keepends=True)
-                to_lines = to_version.content.splitlines(keepends=True)
-                content_diff = list(
-                    difflib.unified_diff(
-                        from_lines,
-                        to_lines,
-                        fromfile=f"version_{from_version.version}",
-                        tofile=f"version_{to_version.version}",
-                        lineterm="",
-                    )
-                )
+            # Generate content diff, reusing the cached diff for this pair
+            cache_key = (from_version.id, to_version.id)
+            cached = self.diff_cache.get(cache_key)
+            if cached is not None:
+                content_diff, stats = cached
+            else:
+                content_diff, stats = await self._diff_versions(from_version, to_version)
+                self.diff_cache.put(cache_key, (content_diff, stats))
 
             # Calculate size difference
             size_diff = to_version.size - from_version.size
@@ -497,29 +519,13 @@ class VersionManager:
                         "to": to_metadata[key],
                     }
 
-            # Calculate statistics
-            stats = {
-                "lines_added": 0,
-                "lines_removed": 0,
-                "lines_changed": 0,
-            }
-
-            if content_diff:
-                for line in content_diff:
-                    if line.startswith("+") and not line.startswith("+++"):
-                        stats["lines_added"] += 1
-                    elif line.startswith("-") and not line.startswith("---"):
-                        stats["lines_removed"] += 1
-                    elif line.startswith("@@"):
-                        stats["lines_changed"] += 1
-
             return VersionCompareResult(
                 from_version_id=str(from_version_id),
                 to_version_id=str(to_version_id),
-                content_diff=content_diff,
+                content_diff=list(content_diff),
                 size_diff=size_diff,
                 metadata_diff=metadata_diff,
-                stats=stats,
+                stats=dict(stats),
             )
 
         except Exception as e:
@@ -550,6 +556,8 @@ class VersionManager:
             stats.total_versions = len(versions)
             stats.total_size = sum(v.size for v in versions)
             stats.average_size = stats.total_size / stats.total_versions if stats.total_versions > 0 else 0
+            stats.stored_size = sum(len(v.content.encode("utf-8")) for v in versions if v.content is not None)
+            stats.delta_versions = sum(1 for v in versions if self._delta_info(v))
 
             # Count by status
             for version in versions:
@@ -698,10 +706,18 @@ class VersionManager:
                     if not version.is_current and version.status != VersionStatus.LOCKED:
                         versions_to_delete.append(version)
 
+            # Turn surviving deltas based on deleted versions into snapshots first
+            deleted_ids = {str(version.id) for version in versions_to_delete}
+            for version in versions:
+                delta_info = self._delta_info(version)
+                if delta_info and str(version.id) not in deleted_ids and delta_info["base_version_id"] in deleted_ids:
+                    await self._materialize(version)
+
             # Delete versions
             deleted_count = 0
             for version in versions_to_delete:
-                self.db.delete(version)
+                await self.db.delete(version)
+                self._evict(version.id)
                 deleted_count += 1
 
             if deleted_count > 0:
@@ -802,6 +818,168 @@ class VersionManager:
             logger.error(f"Error getting contributors for file {file_id}: {str(e)}")
             return []
 
+    async def get_version_content(
+        self,
+        version: Union[UUID, FileVersion],
+    ) -> Optional[str]:
+        """Get the full content of a version.
+
+        Args:
+            version: Version ID or FileVersion instance
+
+        Returns:
+            Version content or None if not found or not a text version
+        """
+        if not isinstance(version, FileVersion):
+            version = await self.get_version(version)
+            if not version:
+                return None
+        return await self._reconstruct_content(version)
+
+    def _delta_info(self, version: FileVersion) -> Optional[Dict[str, Any]]:
+        """Return the delta metadata of a version, if stored as a delta."""
+        return (version.metadata or {}).get("delta")
+
+    def _encode_content(
+        self,
+        content: str,
+        base_version: FileVersion,
+        base_content: str,
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Encode content as a delta against a base version when worthwhile.
+
+        Args:
+            content: New content
+            base_version: Version the delta would be based on
+            base_content: Full content of the base version
+
+        Returns:
+            Tuple of (stored content, delta metadata or None for a snapshot)
+        """
+        base_info = self._delta_info(base_version)
+        chain_length = (base_info["chain_length"] if base_info else 0) + 1
+        if chain_length > self.max_chain_length:
+            return content, None
+
+        encoded = encode_delta(compute_delta(base_content, content))
+        if len(encoded) > len(content) * self.max_delta_ratio:
+            return content, None
+
+        return encoded, {
+            "base_version_id": str(base_version.id),
+            "chain_length": chain_length,
+        }
+
+    async def _reconstruct_content(self, version: FileVersion) -> Optional[str]:
+        """Rebuild the full content of a version from its delta chain.
+
+        Args:
+            version: Version to reconstruct
+
+        Returns:
+            Full content or None for versions without text content
+        """
+        if version.content is None:
+            return None
+
+        cached = self.content_cache.get(version.id)
+        if cached is not None:
+            return cached
+        if not self._delta_info(version):
+            self.content_cache.put(version.id, version.content)
+            return version.content
+
+        # Load the whole chain window in one query
+        result = await self.db.execute(
+            select(FileVersion).where(
+                and_(
+                    FileVersion.file_id == version.file_id,
+                    FileVersion.version_number < version.version_number,
+                    FileVersion.version_number >= version.version_number - self.max_chain_length,
+                )
+            )
+        )
+        candidates = {str(v.id): v for v in result.scalars().all()}
+
+        chain = []
+        node = version
+        content = None
+        while content is None:
+            delta_info = self._delta_info(node)
+            if not delta_info:
+                content = node.content
+                break
+            chain.append(node)
+            base_id = delta_info["base_version_id"]
+            node = candidates.get(base_id) or await self._fetch_version(UUID(base_id))
+            if node is None:
+                raise ValueError(f"Delta base version {base_id} not found")
+            content = self.content_cache.get(node.id)
+
+        for node in reversed(chain):
+            content = apply_delta(content, decode_delta(node.content))
+
+        self.content_cache.put(version.id, content)
+        return content
+
+    async def _fetch_version(self, version_id: UUID) -> Optional[FileVersion]:
+        """Load a version without counting it as an access."""
+        result = await self.db.execute(
+            select(FileVersion).where(FileVersion.id == version_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def _materialize(self, version: FileVersion) -> None:
+        """Store a delta version as a full snapshot."""
+        content = await self._reconstruct_content(version)
+        version.content = content
+        version.metadata = {
+            key: value for key, value in (version.metadata or {}).items() if key != "delta"
+        }
+
+    async def _diff_versions(
+        self,
+        from_version: FileVersion,
+        to_version: FileVersion,
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """Compute the unified diff and line statistics for two versions."""
+        content_diff = []
+        stats = {
+            "lines_added": 0,
+            "lines_removed": 0,
+            "lines_changed": 0,
+        }
+
+        from_content = await self._reconstruct_content(from_version)
+        to_content = await self._reconstruct_content(to_version)
+        if from_content is None or to_content is None:
+            return content_diff, stats
+
+        content_diff = list(
+            difflib.unified_diff(
+                from_content.splitlines(keepends=True),
+                to_content.splitlines(keepends=True),
+                fromfile=f"version_{from_version.version}",
+                tofile=f"version_{to_version.version}",
+                lineterm="",
+            )
+        )
+
+        for line in content_diff:
+            if line.startswith("+") and not line.startswith("+++"):
+                stats["lines_added"] += 1
+            elif line.startswith("-") and not line.startswith("---"):
+                stats["lines_removed"] += 1
+            elif line.startswith("@@"):
+                stats["lines_changed"] += 1
+
+        return content_diff, stats
+
+    def _evict(self, version_id: UUID) -> None:
+        """Drop cached contents and diffs involving a version."""
+        self.content_cache.pop(version_id)
+        self.diff_cache.discard_where(lambda key: version_id in key)
+
     def _generate_diff(self, old_content: str, new_content: str) -> str:
         """Generate diff between two content strings.
 
@@ -826,3 +1004,9 @@ class VersionManager:
         )
 
         return "\n".join(diff)
+
+
+# Reconstructed contents and version-pair diffs. Versions are immutable, so
+# these caches are shared by every VersionManager instance.
+version_content_cache = LRUCache(max_bytes=64 * 1024 * 1024, sizeof=len)
+version_diff_cache = LRUCache(max_entries=256)
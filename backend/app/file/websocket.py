@@ -6,7 +6,7 @@ collaborative editing notifications, and file operation progress tracking.
 
 import json
 import logging
-from typing import Dict, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any
 from uuid import UUID, uuid4
 from datetime import datetime
 import asyncio
@@ -19,6 +19,7 @@ from app.file.manager import FileManager
 from app.file.services.upload_service import UploadService
 from app.file.services.download_service import DownloadService
 from app.file.batch_processor import BatchProcessor
+from app.file.editor import ChangeOperation, FileEditor
 from app.file.event_manager import FileOperationEvent
 
 logger = logging.getLogger(__name__)
@@ -249,6 +250,23 @@ async def get_batch_processor():
     return None
 
 
+# Editor sessions live in memory, so every endpoint must share one editor
+_file_editor: Optional[FileEditor] = None
+
+
+async def get_file_editor() -> FileEditor:
+    """Get the shared FileEditor instance.
+
+    Created on first use with broadcast_editor_operations registered as a
+    change handler, so committed operations reach every session member.
+    """
+    global _file_editor
+    if _file_editor is None:
+        _file_editor = FileEditor()
+        _file_editor.register_change_handler(broadcast_editor_operations)
+    return _file_editor
+
+
 # Main WebSocket endpoint
 @router.websocket("/ws/files")
 async def file_websocket(
@@ -630,21 +648,60 @@ async def collaborative_editing_websocket(
                 )
 
             elif message_type == "edit_operation":
-                # Broadcast edit operation to other users
-                await websocket_manager.broadcast_to_file(
-                    file_id=f"editor_{session_id}",
-                    message={
-                        "type": "edit_operation",
-                        "session_id": session_id,
-                        "user_id": user_id,
-                        "operation": message.get("operation"),
-                        "position": message.get("position"),
-                        "content": message.get("content"),
-                        "timestamp": datetime.utcnow().isoformat(),
-                    },
-                    exclude=websocket,
+                # Commit through the editor; it rebases stale batches and its
+                # change handler broadcasts only the applied delta
+                editor = await get_file_editor()
+
+                operations = message.get("operations")
+                if operations is None:
+                    operations = [{
+                        "type": message.get("operation"),
+                        "position": message.get("position", 0),
+                        "length": message.get("length", 0),
+                        "content": message.get("content", ""),
+                    }]
+                changes = [
+                    ChangeOperation(
+                        operation_id=op.get("operation_id") or str(uuid4()),
+                        type=op.get("type"),
+                        position=op.get("position", 0),
+                        length=op.get("length", 0),
+                        content=op.get("content") or "",
+                        timestamp=datetime.utcnow(),
+                        user_id=user_id,
+                    )
+                    for op in operations
+                ]
+
+                success, error, response = await editor.apply_changes(
+                    session_id=UUID(session_id),
+                    user_id=user_id,
+                    changes=changes,
+                    version=message.get("version"),
                 )
 
+                if success:
+                    await websocket_manager.send_personal_message(
+                        websocket,
+                        {
+                            "type": "edit_ack",
+                            "session_id": session_id,
+                            "version": response["server_version"],
+                            "rebased": response["rebased"],
+                            "operations": response["operations"],
+                        }
+                    )
+                else:
+                    await websocket_manager.send_personal_message(
+                        websocket,
+                        {
+                            "type": "edit_rejected",
+                            "session_id": session_id,
+                            "error": error,
+                            "server_version": response.get("server_version"),
+                        }
+                    )
+
             elif message_type == "cursor_position":
                 # Broadcast cursor position to other users
                 await websocket_manager.broadcast_to_file(
@@ -728,6 +785,36 @@ async def broadcast_file_deleted(file_id: str):
     )
 
 
+async def broadcast_editor_operations(
+    session_id: UUID,
+    user_id: str,
+    version: int,
+    operations: List[Dict[str, Any]],
+):
+    """Broadcast operations committed to an editor session.
+
+    Registered as a FileEditor change handler. Only the delta applied on the
+    server is sent; the author also receives it and can skip it by version,
+    since its edit_ack carries the same one.
+
+    Args:
+        session_id: Editor session ID
+        user_id: User who made the changes
+        version: Session version after the operations
+        operations: Serialized operations
+    """
+    await websocket_manager.broadcast_to_file(
+        file_id=f"editor_{session_id}",
+        message={
+            "type": "edit_operation",
+            "session_id": str(session_id),
+            "user_id": user_id,
+            "version": version,
+            "operations": operations,
+        }
+    )
+
+
 async def broadcast_upload_progress(upload_id: str, progress: Dict[str, Any]):
     """Broadcast upload progress update.
 
@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime
 import yaml
 
+from app.core.metrics import metrics_registry
+
 from .registry import get_registry
 from .adapters import (
     PlatformAdapter,
@@ -23,6 +25,12 @@ from .adapters import (
 
 logger = logging.getLogger(__name__)
 
+_conversion_duration = metrics_registry.histogram(
+    "format_converter_conversion_duration_seconds",
+    "Duration of uncached skill format conversions",
+    unit="seconds",
+)
+
 
 class FormatConverter:
     """Unified format converter for multi-platform skill format conversion.
@@ -51,6 +59,18 @@ class FormatConverter:
             "cache_misses": 0,
             "avg_conversion_time": 0.0
         }
+        metrics_registry.register_stats(
+            "format_converter",
+            self,
+            "stats",
+            counters=(
+                "total_conversions",
+                "successful_conversions",
+                "failed_conversions",
+                "cache_hits",
+                "cache_misses",
+            ),
+        )
 
         # Supported conversion paths
         self.conversion_paths = self._init_conversion_paths()
@@ -259,6 +279,10 @@ class FormatConverter:
             # Update statistics
             self.stats["successful_conversions"] += 1
             self._update_avg_conversion_time(conversion_time)
+            _conversion_duration.labels({
+                "source_format": source_format,
+                "target_format": target_format,
+            }).record(conversion_time)
 
             # Emit conversion complete event
             await self._emit_event("conversion_complete", {
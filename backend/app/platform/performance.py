@@ -14,8 +14,23 @@ from enum import Enum
 import json
 import weakref
 
+from app.core.metrics import metrics_registry
+from app.core.pool import (
+    DatabaseSessionPool,
+    HTTPClientPool,
+    RedisClientPool,
+    ResourcePool,
+    pool_registry,
+)
+
 logger = logging.getLogger(__name__)
 
+_operation_duration = metrics_registry.histogram(
+    "platform_operation_duration_seconds",
+    "Duration of optimized platform operations",
+    unit="seconds",
+)
+
 
 class OptimizationStrategy(Enum):
     """Performance optimization strategies."""
@@ -126,6 +141,10 @@ class PerformanceOptimizer:
         )
 
         self.metrics_history.append(metrics)
+        _operation_duration.labels({
+            "operation": operation_name,
+            "strategy": strategy.value,
+        }).record(execution_time)
 
         # Log slow operations
         if metrics.is_slow:
@@ -224,13 +243,9 @@ class PerformanceOptimizer:
         if pool_name not in self.connection_pools:
             self.connection_pools[pool_name] = self._create_connection_pool(pool_name)
 
-        # Use connection from pool
-        connection = await self._get_connection(pool_name)
-
-        try:
+        # Use a pooled HTTP client; it is discarded if the operation fails
+        async with self.connection_pools[pool_name].lease() as connection:
             return await operation(connection, *args, **kwargs)
-        finally:
-            await self._return_connection(pool_name, connection)
 
     async def _optimize_with_resource_pooling(
         self,
@@ -241,17 +256,13 @@ class PerformanceOptimizer:
         **kwargs
     ) -> Any:
         """Optimize with resource pooling."""
-        # Get or create resource pool
+        # Get registered resource pool
         if resource_type not in self.resource_pools:
             self.resource_pools[resource_type] = self._create_resource_pool(resource_type)
 
-        # Get resource from pool
-        resource = await self._get_resource(resource_type)
-
-        try:
+        # Use a pooled resource; it is discarded if the operation fails
+        async with self.resource_pools[resource_type].lease() as resource:
             return await operation(resource, *args, **kwargs)
-        finally:
-            await self._return_resource(resource_type, resource)
 
     def _generate_cache_key(
         self,
@@ -290,45 +301,31 @@ class PerformanceOptimizer:
             "timestamp": time.time()
         }
 
-    def _create_connection_pool(self, pool_name: str) -> Dict[str, Any]:
-        """Create a connection pool."""
-        return {
-            "connections": [],
-            "available": [],
-            "in_use": set(),
-            "max_size": 10,
-            "created_at": time.time()
-        }
-
-    async def _get_connection(self, pool_name: str):
-        """Get connection from pool."""
-        # Implementation would get actual connection
-        return {"connection_id": f"{pool_name}_conn_1"}
-
-    async def _return_connection(self, pool_name: str, connection: Dict[str, Any]) -> None:
-        """Return connection to pool."""
-        # Implementation would return actual connection
-        pass
-
-    def _create_resource_pool(self, resource_type: str) -> Dict[str, Any]:
-        """Create a resource pool."""
-        return {
-            "resources": [],
-            "available": [],
-            "in_use": set(),
-            "max_size": 5,
-            "created_at": time.time()
-        }
-
-    async def _get_resource(self, resource_type: str):
-        """Get resource from pool."""
-        # Implementation would get actual resource
-        return {"resource_id": f"{resource_type}_res_1"}
+    def _create_connection_pool(self, pool_name: str) -> ResourcePool:
+        """Get or create the shared HTTP client pool for a name."""
+        pool_config = PERFORMANCE_CONFIG["connection_pooling"]
+        return pool_registry.get_or_create(
+            pool_name,
+            lambda: HTTPClientPool(
+                pool_name,
+                max_size=pool_config["max_pool_size"],
+                acquire_timeout=pool_config["pool_timeout"],
+            ),
+        )
 
-    async def _return_resource(self, resource_type: str, resource: Dict[str, Any]) -> None:
-        """Return resource to pool."""
-        # Implementation would return actual resource
-        pass
+    def _create_resource_pool(self, resource_type: str) -> ResourcePool:
+        """Get the registered pool for a resource type, creating known ones."""
+        builder = RESOURCE_POOL_BUILDERS.get(resource_type)
+        if builder is None:
+            pool = pool_registry.get(resource_type)
+            if pool is None:
+                raise ValueError(f"No resource pool registered for: {resource_type}")
+            return pool
+
+        return pool_registry.get_or_create(
+            resource_type,
+            lambda: builder(resource_type, PERFORMANCE_CONFIG["resource_pooling"]),
+        )
 
     def get_performance_statistics(self) -> Dict[str, Any]:
         """Get performance statistics."""
@@ -493,6 +490,34 @@ PERFORMANCE_CONFIG = {
 }
 
 
+def _build_database_pool(name: str, pool_config: Dict[str, Any]) -> ResourcePool:
+    """Build the shared database session pool."""
+    return DatabaseSessionPool(
+        name,
+        max_size=pool_config["max_pool_size"],
+        acquire_timeout=pool_config["resource_timeout"],
+    )
+
+
+def _build_redis_pool(name: str, pool_config: Dict[str, Any]) -> ResourcePool:
+    """Build the shared Redis client pool."""
+    from app.core.config import settings
+
+    return RedisClientPool(
+        settings.REDIS_URL,
+        name=name,
+        max_size=pool_config["max_pool_size"],
+        acquire_timeout=pool_config["resource_timeout"],
+    )
+
+
+# Resource types whose pools are created on first use
+RESOURCE_POOL_BUILDERS: Dict[str, Callable[[str, Dict[str, Any]], ResourcePool]] = {
+    "database_sessions": _build_database_pool,
+    "redis_clients": _build_redis_pool,
+}
+
+
 async def configure_performance(config: Dict[str, Any]) -> None:
     """Configure performance optimizer with custom settings.
 
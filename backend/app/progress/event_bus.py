@@ -7,13 +7,22 @@ and event ordering guarantees.
 
 import asyncio
 import logging
+import time
 from collections import defaultdict, deque
 from typing import Any, Dict, List, Optional, Callable, Set, Union
 from uuid import uuid4
 from datetime import datetime, timezone
 
+from app.core.metrics import metrics_registry
+
 logger = logging.getLogger(__name__)
 
+_publish_duration = metrics_registry.histogram(
+    "event_bus_publish_duration_seconds",
+    "Time to deliver an event to all handlers",
+    unit="seconds",
+)
+
 
 class EventBusError(Exception):
     """Base exception for event bus operations."""
@@ -371,6 +380,12 @@ class EventBus:
             "active_handlers": 0,
             "event_types": set(),
         }
+        metrics_registry.register_stats(
+            "event_bus",
+            self,
+            "_stats",
+            counters=("total_events_published", "total_events_delivered", "total_events_failed"),
+        )
 
     async def subscribe(
         self,
@@ -460,6 +475,7 @@ class EventBus:
         Returns:
             Dictionary mapping handler IDs to delivery results
         """
+        start_time = time.perf_counter()
         async with self._lock:
             self._stats["total_events_published"] += 1
             self._stats["event_types"].add(event.event_type)
@@ -507,6 +523,9 @@ class EventBus:
         async with self._lock:
             self._stats["total_events_delivered"] += successful
             self._stats["total_events_failed"] += failed
+        _publish_duration.labels({"event_type": event.event_type}).record(
+            time.perf_counter() - start_time
+        )
 
         logger.info(
             f"Published event {event.event_id[:8]} to {len(handlers)} handlers: "
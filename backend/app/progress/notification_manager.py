@@ -7,7 +7,7 @@ user notifications with multiple delivery channels.
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, Set, Callable, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Callable, Tuple, Union
 from datetime import datetime, timedelta
 from enum import Enum
 from uuid import UUID, uuid4
@@ -109,20 +109,172 @@ class NotificationDelivery:
         self.last_attempt = datetime.utcnow()
 
 
+class TokenBucket:
+    """Token bucket rate limiter with constant memory."""
+
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """Initialize token bucket.
+
+        Args:
+            capacity: Maximum burst size
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.updated_at = now
+
+    def consume(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken
+        """
+        self._refill(time.monotonic())
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def is_full(self) -> bool:
+        """Check whether the bucket has refilled completely (i.e. is idle)."""
+        self._refill(time.monotonic())
+        return self.tokens >= self.capacity
+
+
+class NotificationDigest:
+    """Coalesces rate-limited notifications for one user."""
+
+    MAX_SAMPLES = 5
+
+    def __init__(self, user_id: str):
+        """Initialize digest.
+
+        Args:
+            user_id: User ID
+        """
+        self.user_id = user_id
+        self.count = 0
+        self.by_type: Dict[str, int] = defaultdict(int)
+        self.by_priority: Dict[str, int] = defaultdict(int)
+        self.channels: Set[NotificationChannel] = set()
+        self.samples: deque = deque(maxlen=self.MAX_SAMPLES)
+        self.related_task_ids: Set[str] = set()
+        self.first_at = datetime.utcnow()
+        self.last_at = self.first_at
+
+    def add(self, notification: Notification):
+        """Fold a notification into the digest.
+
+        A digest folded into another one contributes its own counts, so
+        nothing is lost if it is coalesced again.
+
+        Args:
+            notification: Rate-limited notification
+        """
+        metadata = notification.notification_metadata or {}
+        if metadata.get("digest"):
+            self.count += metadata.get("count", 1)
+            for notification_type, count in metadata.get("by_type", {}).items():
+                self.by_type[notification_type] += count
+            for priority, count in metadata.get("by_priority", {}).items():
+                self.by_priority[priority] += count
+        else:
+            self.count += 1
+            self.by_type[str(notification.notification_type)] += 1
+            self.by_priority[str(notification.priority)] += 1
+        self.channels.update(notification.channels or [])
+        self.samples.append(notification.title)
+        if notification.related_task_id and len(self.related_task_ids) < self.MAX_SAMPLES:
+            self.related_task_ids.add(notification.related_task_id)
+        self.last_at = datetime.utcnow()
+
+    def to_notification(self) -> Notification:
+        """Build the digest notification.
+
+        Returns:
+            Notification summarizing the coalesced notifications
+        """
+        dominant_type = max(self.by_type.items(), key=lambda item: item[1])[0]
+        dominant_priority = max(self.by_priority.items(), key=lambda item: item[1])[0]
+        titles = "; ".join(self.samples)
+        more = self.count - len(self.samples)
+        message = f"{self.count} notifications were grouped: {titles}"
+        if more > 0:
+            message += f" and {more} more"
+
+        return Notification(
+            user_id=self.user_id,
+            title=f"{self.count} new notifications",
+            message=message,
+            notification_type=dominant_type,
+            priority=dominant_priority,
+            channels=list(self.channels) or [NotificationChannel.WEBSOCKET],
+            notification_metadata={
+                "digest": True,
+                "count": self.count,
+                "by_type": dict(self.by_type),
+                "by_priority": dict(self.by_priority),
+                "related_task_ids": sorted(self.related_task_ids),
+                "first_at": self.first_at.isoformat(),
+                "last_at": self.last_at.isoformat(),
+            },
+            retry_count=0,
+            max_retries=3,
+        )
+
+
 class NotificationManager:
     """Core manager for user notifications."""
 
-    def __init__(self, db_session: Optional[Session] = None):
+    # Token bucket limits per user and priority: burst size and refill window
+    RATE_LIMITS = {
+        NotificationPriority.CRITICAL: {"count": 10, "window": 60},  # 10 per minute
+        NotificationPriority.HIGH: {"count": 30, "window": 60},      # 30 per minute
+        NotificationPriority.NORMAL: {"count": 60, "window": 60},    # 60 per minute
+        NotificationPriority.LOW: {"count": 120, "window": 60},      # 120 per minute
+    }
+
+    # Maximum errors kept in bulk send results
+    MAX_BULK_ERRORS = 100
+
+    def __init__(
+        self,
+        db_session: Optional[Session] = None,
+        digest_interval: float = 60.0,
+        bulk_concurrency: int = 10,
+        bulk_group_limit: int = 20,
+    ):
         """Initialize notification manager.
 
         Args:
             db_session: SQLAlchemy database session (optional)
+            digest_interval: Seconds between digest flushes
+            bulk_concurrency: Maximum concurrent groups in bulk sends
+            bulk_group_limit: Maximum notifications sent individually per
+                user and channel group in a bulk send; the rest are coalesced
         """
         self.db_session = db_session
         self.notification_handlers: Dict[NotificationChannel, List[Callable]] = defaultdict(list)
         self.delivery_queue: deque = deque()
         self._lock = asyncio.Lock()
-        self._rate_limits: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))  # Store timestamps for rate limiting
+        self._rate_limits: Dict[Tuple[str, str], TokenBucket] = {}
+        self._pending_digests: Dict[str, NotificationDigest] = {}
+        self.digest_interval = digest_interval
+        self.bulk_concurrency = bulk_concurrency
+        self.bulk_group_limit = bulk_group_limit
+        self._digest_task: Optional[asyncio.Task] = None
         self.user_preferences: Dict[str, Dict[NotificationChannel, bool]] = {}  # User channel preferences
         self.smart_routing_rules: List[Dict[str, Any]] = []  # Smart routing rules
         self._stats = {
@@ -131,6 +283,7 @@ class NotificationManager:
             "total_delivered": 0,
             "total_failed": 0,
             "total_rate_limited": 0,
+            "total_digests_sent": 0,
             "total_rerouted": 0,
             "by_channel": defaultdict(int),
             "by_priority": defaultdict(int),
@@ -228,7 +381,8 @@ class NotificationManager:
 
         # Check rate limiting
         if not await self._check_rate_limit(notification):
-            logger.warning(f"Rate limit exceeded for user {notification.user_id}, notification skipped")
+            self._add_to_digest(notification)
+            logger.debug(f"Rate limit exceeded for user {notification.user_id}, notification coalesced into digest")
             return notification
 
         # Send notification
@@ -752,42 +906,109 @@ class NotificationManager:
     async def _check_rate_limit(self, notification: Notification) -> bool:
         """Check if notification exceeds rate limits.
 
+        Each user has one token bucket per priority, so memory does not grow
+        with the notification rate. Digests are never limited, since they
+        already stand for notifications that were.
+
         Args:
             notification: Notification instance
 
         Returns:
             True if within rate limits
         """
-        user_id = notification.user_id
-        current_time = datetime.utcnow()
-
-        # Define rate limits by priority
-        rate_limits = {
-            NotificationPriority.CRITICAL: {"count": 10, "window": 60},  # 10 per minute
-            NotificationPriority.HIGH: {"count": 30, "window": 60},      # 30 per minute
-            NotificationPriority.NORMAL: {"count": 60, "window": 60},    # 60 per minute
-            NotificationPriority.LOW: {"count": 120, "window": 60},      # 120 per minute
-        }
+        if (notification.notification_metadata or {}).get("digest"):
+            return True
 
-        limit_config = rate_limits.get(notification.priority, rate_limits[NotificationPriority.NORMAL])
-        max_count = limit_config["count"]
-        window_seconds = limit_config["window"]
+        key = (notification.user_id, notification.priority)
+        bucket = self._rate_limits.get(key)
+        if bucket is None:
+            limit_config = self.RATE_LIMITS.get(
+                notification.priority, self.RATE_LIMITS[NotificationPriority.NORMAL]
+            )
+            bucket = TokenBucket(
+                capacity=limit_config["count"],
+                refill_rate=limit_config["count"] / limit_config["window"],
+            )
+            self._rate_limits[key] = bucket
 
-        # Get user's rate limit queue
-        user_queue = self._rate_limits[user_id]
+        return bucket.consume()
 
-        # Remove old timestamps outside the window
-        cutoff_time = current_time - timedelta(seconds=window_seconds)
-        while user_queue and user_queue[0] < cutoff_time:
-            user_queue.popleft()
+    def _add_to_digest(self, notification: Notification):
+        """Coalesce a notification into the user's pending digest.
 
-        # Check if within limit
-        if len(user_queue) >= max_count:
-            return False
+        Args:
+            notification: Rate-limited notification
+        """
+        digest = self._pending_digests.get(notification.user_id)
+        if digest is None:
+            digest = self._pending_digests[notification.user_id] = NotificationDigest(notification.user_id)
+        digest.add(notification)
+        self._stats["total_rate_limited"] += 1
 
-        # Add current timestamp
-        user_queue.append(current_time)
-        return True
+    async def flush_digests(self, db_session: Optional[Session] = None) -> int:
+        """Send one digest notification per user with coalesced notifications.
+
+        Also drops rate limit buckets that have fully refilled, since they
+        are equivalent to fresh ones.
+
+        Args:
+            db_session: Database session (overrides instance session)
+
+        Returns:
+            Number of digests sent
+        """
+        digests, self._pending_digests = self._pending_digests, {}
+
+        for key in [k for k, bucket in self._rate_limits.items() if bucket.is_full()]:
+            del self._rate_limits[key]
+
+        sent = 0
+        for digest in digests.values():
+            notification = digest.to_notification()
+            session = db_session or self.db_session
+            if session:
+                session.add(notification)
+                session.commit()
+                session.refresh(notification)
+            try:
+                # Sent directly: digests must not be rate limited into new digests
+                result = await self.send_notification(notification, db_session)
+                if result.get("successful"):
+                    sent += 1
+            except Exception as e:
+                logger.error(f"Failed to send digest for user {digest.user_id}: {e}")
+
+        self._stats["total_digests_sent"] += sent
+        return sent
+
+    async def start(self):
+        """Start the periodic digest flush loop."""
+        if self._digest_task is None:
+            self._digest_task = asyncio.create_task(self._digest_loop())
+            logger.info("Notification digest loop started")
+
+    async def stop(self):
+        """Stop the digest loop and flush pending digests."""
+        if self._digest_task:
+            self._digest_task.cancel()
+            try:
+                await self._digest_task
+            except asyncio.CancelledError:
+                pass
+            self._digest_task = None
+        await self.flush_digests()
+        logger.info("Notification digest loop stopped")
+
+    async def _digest_loop(self):
+        """Periodically flush pending digests."""
+        while True:
+            try:
+                await asyncio.sleep(self.digest_interval)
+                await self.flush_digests()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error flushing notification digests: {e}")
 
     def set_user_channel_preference(
         self,
@@ -863,6 +1084,12 @@ class NotificationManager:
     ) -> Dict[str, Any]:
         """Send multiple notifications in batch.
 
+        Notifications are grouped by user and channel set and the groups are
+        processed by at most ``bulk_concurrency`` workers, keeping per-user
+        order. Anything beyond ``bulk_group_limit`` in a group is coalesced
+        into that user's digest instead of being pushed individually, as is
+        anything over the user's rate limit; neither counts as sent.
+
         Args:
             notifications: List of Notification instances
             db_session: Database session (overrides instance session)
@@ -873,30 +1100,50 @@ class NotificationManager:
         results = {
             "successful": 0,
             "failed": 0,
+            "coalesced": 0,
             "total": len(notifications),
             "errors": [],
         }
 
-        # Process notifications concurrently
-        tasks = []
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[Notification]] = defaultdict(list)
         for notification in notifications:
-            task = asyncio.create_task(
-                self.send_notification(notification, db_session)
-            )
-            tasks.append((notification, task))
-
-        # Wait for all tasks to complete
-        for notification, task in tasks:
-            try:
-                await task
-                results["successful"] += 1
-            except Exception as e:
-                results["failed"] += 1
-                results["errors"].append({
-                    "notification_id": str(notification.id),
-                    "error": str(e),
-                })
-                logger.error(f"Failed to send batch notification {notification.id}: {e}")
+            channels = tuple(sorted(
+                ch.value if isinstance(ch, NotificationChannel) else str(ch)
+                for ch in (notification.channels or [])
+            ))
+            groups[(notification.user_id, channels)].append(notification)
+
+        group_iter: Iterator[List[Notification]] = iter(groups.values())
+
+        async def worker():
+            for group in group_iter:
+                for notification in group[self.bulk_group_limit:]:
+                    self._add_to_digest(notification)
+                    results["coalesced"] += 1
+
+                for notification in group[:self.bulk_group_limit]:
+                    if not await self._check_rate_limit(notification):
+                        self._add_to_digest(notification)
+                        results["coalesced"] += 1
+                        continue
+
+                    try:
+                        delivery = await self.send_notification(notification, db_session)
+                        if not delivery.get("successful"):
+                            raise RuntimeError("No channel delivered the notification")
+                        results["successful"] += 1
+                    except Exception as e:
+                        results["failed"] += 1
+                        if len(results["errors"]) < self.MAX_BULK_ERRORS:
+                            results["errors"].append({
+                                "notification_id": str(notification.id),
+                                "error": str(e),
+                            })
+                        logger.error(f"Failed to send batch notification {notification.id}: {e}")
+
+        workers = min(self.bulk_concurrency, len(groups))
+        if workers:
+            await asyncio.gather(*(worker() for _ in range(workers)))
 
         return results
 
@@ -19,15 +19,15 @@ from collections import defaultdict, deque
 from threading import Lock
 import json
 
-logger = logging.getLogger(__name__)
-
+from app.core.metrics import (
+    Histogram,
+    MetricFamily,
+    MetricsRegistry,
+    MetricType,
+    metrics_registry,
+)
 
-class MetricType(Enum):
-    """Types of metrics."""
-    COUNTER = "counter"
-    GAUGE = "gauge"
-    HISTOGRAM = "histogram"
-    TIMER = "timer"
+logger = logging.getLogger(__name__)
 
 
 class AlertSeverity(Enum):
@@ -65,18 +65,51 @@ class Alert:
 
 
 class MetricsCollector:
-    """Collects and stores metrics."""
+    """Collects metrics into fixed-memory histograms and time windows.
 
-    def __init__(self, max_history: int = 10000):
+    Samples are not stored individually. Each metric name maps to a family in
+    a :class:`MetricsRegistry`; gauges and counters keep their latest value,
+    timers and histograms keep a log-linear histogram, and every labelled
+    series keeps a time-bucketed ring buffer for recent history.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        history_resolution: float = 10.0,
+        history_slots: int = 360,
+    ):
         """Initialize metrics collector.
 
         Args:
-            max_history: Maximum number of metric points to store
+            registry: Registry to record into, a private one by default
+            history_resolution: Width of history buckets in seconds
+            history_slots: Number of history buckets kept per series
         """
-        self.max_history = max_history
-        self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.history_resolution = history_resolution
+        self.history_slots = history_slots
+        self.metrics: Dict[str, MetricFamily] = {}
+        self._latest: Dict[str, Metric] = {}
         self._lock = Lock()
 
+    def _get_family(self, name: str, metric_type: MetricType, unit: Optional[str]) -> MetricFamily:
+        family = self.metrics.get(name)
+        if family is None:
+            kwargs = {
+                "unit": unit,
+                "history_resolution": self.history_resolution,
+                "history_slots": self.history_slots,
+            }
+            if metric_type == MetricType.COUNTER:
+                family = self.registry.counter(name, **kwargs)
+            elif metric_type == MetricType.GAUGE:
+                family = self.registry.gauge(name, **kwargs)
+            else:
+                family = self.registry.histogram(name, **kwargs)
+            self.metrics[name] = family
+        return family
+
     def record(self, metric: Metric):
         """Record a metric.
 
@@ -84,7 +117,17 @@ class MetricsCollector:
             metric: Metric to record
         """
         with self._lock:
-            self.metrics[metric.name].append(metric)
+            family = self._get_family(metric.name, metric.metric_type, metric.unit)
+            child = family.labels(metric.labels)
+
+            if family.metric_type == MetricType.COUNTER:
+                child.set_total(metric.value, metric.timestamp)
+            elif family.metric_type == MetricType.GAUGE:
+                child.set(metric.value, metric.timestamp)
+            else:
+                child.record(metric.value, metric.timestamp)
+
+            self._latest[metric.name] = metric
 
     def record_counter(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Record a counter metric.
@@ -137,6 +180,10 @@ class MetricsCollector:
     def get_metrics(self, name: Optional[str] = None, since: Optional[float] = None) -> List[Metric]:
         """Get metrics.
 
+        Returns one point per history bucket and label set rather than every
+        recorded sample. Gauges and counters report the last value in each
+        bucket, timers and histograms the bucket mean.
+
         Args:
             name: Optional metric name filter
             since: Optional timestamp filter
@@ -145,17 +192,28 @@ class MetricsCollector:
             List of metrics
         """
         with self._lock:
-            if name:
-                metrics = list(self.metrics.get(name, []))
-            else:
-                metrics = []
-                for metric_deque in self.metrics.values():
-                    metrics.extend(metric_deque)
-
-            if since:
-                metrics = [m for m in metrics if m.timestamp >= since]
-
-            return metrics
+            families = [self.metrics[name]] if name in self.metrics else (
+                [] if name else list(self.metrics.values())
+            )
+
+        metrics = []
+        for family in families:
+            use_last = family.metric_type in (MetricType.COUNTER, MetricType.GAUGE)
+            for key, child in family.children():
+                if child.window is None:
+                    continue
+                for point in child.window.points(since):
+                    metrics.append(Metric(
+                        name=family.name,
+                        value=point.last if use_last else point.mean,
+                        metric_type=family.metric_type,
+                        timestamp=point.timestamp,
+                        labels=dict(key),
+                        unit=family.unit,
+                    ))
+
+        metrics.sort(key=lambda m: m.timestamp)
+        return metrics
 
     def get_latest_value(self, name: str, default: float = 0.0) -> float:
         """Get latest value for metric.
@@ -167,13 +225,15 @@ class MetricsCollector:
         Returns:
             Latest metric value
         """
-        with self._lock:
-            metrics = self.metrics.get(name, [])
-            return metrics[-1].value if metrics else default
+        metric = self._latest.get(name)
+        return metric.value if metric else default
 
     def get_average_value(self, name: str, since: Optional[float] = None) -> float:
         """Get average value for metric.
 
+        Timers and histograms without a ``since`` filter use their all-time
+        histogram; everything else is averaged from the history buckets.
+
         Args:
             name: Metric name
             since: Optional timestamp filter
@@ -181,12 +241,37 @@ class MetricsCollector:
         Returns:
             Average metric value
         """
-        metrics = self.get_metrics(name, since)
-        if not metrics:
+        family = self.metrics.get(name)
+        if family is None:
             return 0.0
 
-        values = [m.value for m in metrics]
-        return sum(values) / len(values)
+        children = [child for _, child in family.children()]
+        if since is None and family.metric_type in (MetricType.HISTOGRAM, MetricType.TIMER):
+            count = sum(child.count for child in children)
+            return sum(child.sum for child in children) / count if count else 0.0
+
+        total = 0.0
+        count = 0
+        for child in children:
+            summary = child.window.summary(since) if child.window is not None else None
+            if summary:
+                total += summary.sum
+                count += summary.count
+        return total / count if count else 0.0
+
+    def get_histogram(self, name: str) -> Optional[Histogram]:
+        """Get the histogram of a timer or histogram metric merged across labels.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            Merged histogram or None if the metric is not a histogram
+        """
+        family = self.metrics.get(name)
+        if family is None or family.metric_type not in (MetricType.HISTOGRAM, MetricType.TIMER):
+            return None
+        return family.merged_histogram()
 
 
 class SystemMonitor:
@@ -354,16 +439,20 @@ class AlertManager:
 class PerformanceDashboard:
     """Real-time performance dashboard."""
 
-    def __init__(self):
-        """Initialize performance dashboard."""
-        self.metrics_collector = MetricsCollector()
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """Initialize performance dashboard.
+
+        Args:
+            registry: Registry to publish metrics to, a private one by default
+        """
+        self.metrics_collector = MetricsCollector(registry)
         self.system_monitor = SystemMonitor(self.metrics_collector)
         self.alert_manager = AlertManager(self.metrics_collector)
 
         # Custom metrics
         self.custom_counters: Dict[str, float] = defaultdict(float)
         self.custom_gauges: Dict[str, float] = {}
-        self.custom_timers: Dict[str, List[float]] = defaultdict(list)
+        self.custom_timers: Dict[str, Histogram] = defaultdict(Histogram)
 
         # Background tasks
         self._monitoring = False
@@ -450,11 +539,7 @@ class PerformanceDashboard:
             value: Timer value
             labels: Optional labels
         """
-        self.custom_timers[name].append(value)
-        # Keep only last 1000 values
-        if len(self.custom_timers[name]) > 1000:
-            self.custom_timers[name] = self.custom_timers[name][-1000:]
-
+        self.custom_timers[name].record(value)
         self.metrics_collector.record_timer(f"custom.timer.{name}", value, labels)
 
     # Dashboard data methods
@@ -494,13 +579,8 @@ class PerformanceDashboard:
             "counters": dict(self.custom_counters),
             "gauges": dict(self.custom_gauges),
             "timers": {
-                name: {
-                    "count": len(values),
-                    "average": sum(values) / len(values) if values else 0,
-                    "min": min(values) if values else 0,
-                    "max": max(values) if values else 0,
-                }
-                for name, values in self.custom_timers.items()
+                name: self._timer_summary(histogram)
+                for name, histogram in self.custom_timers.items()
             },
         }
 
@@ -536,6 +616,27 @@ class PerformanceDashboard:
             "metrics_count": len(self.metrics_collector.metrics),
         }
 
+    @staticmethod
+    def _timer_summary(histogram: Histogram) -> Dict[str, float]:
+        """Summarize a timer histogram for the dashboard.
+
+        Args:
+            histogram: Timer histogram
+
+        Returns:
+            Timer summary
+        """
+        snapshot = histogram.snapshot()
+        return {
+            "count": snapshot["count"],
+            "average": snapshot["avg"],
+            "min": snapshot["min"],
+            "max": snapshot["max"],
+            "p50": snapshot["p50"],
+            "p95": snapshot["p95"],
+            "p99": snapshot["p99"],
+        }
+
     def get_historical_data(self, metric_name: str, duration_minutes: int = 60) -> List[Dict[str, Any]]:
         """Get historical data for a metric.
 
@@ -595,4 +696,4 @@ class PerformanceDashboard:
 
 
 # Global performance dashboard instance
-performance_dashboard = PerformanceDashboard()
+performance_dashboard = PerformanceDashboard(metrics_registry)
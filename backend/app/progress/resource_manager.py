@@ -2,6 +2,8 @@
 
 This module provides comprehensive resource management including connection pooling,
 resource monitoring, performance optimization, and auto-scaling capabilities.
+Pooling itself is delegated to the asyncio-native ResourcePool in
+app.core.pool; pools are resized from their measured contention.
 """
 
 import asyncio
@@ -17,6 +19,8 @@ from dataclasses import dataclass, field
 from threading import Lock
 import weakref
 
+from app.core.pool import ResourcePool, DatabaseSessionPool, pool_registry
+
 from .websocket import websocket_manager, ConnectionPool
 from .progress_manager import progress_manager
 from .log_manager import log_manager
@@ -73,207 +77,24 @@ class SystemMetrics:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-class ResourcePool:
-    """Generic resource pool with lifecycle management."""
-
-    def __init__(
-        self,
-        resource_type: ResourceType,
-        max_size: int = 100,
-        min_size: int = 10,
-        acquire_timeout: float = 30.0,
-        idle_timeout: float = 300.0,
-    ):
-        """Initialize resource pool.
-
-        Args:
-            resource_type: Type of resources in this pool
-            max_size: Maximum number of resources
-            min_size: Minimum number of resources to maintain
-            acquire_timeout: Timeout for acquiring resources
-            idle_timeout: Idle timeout before releasing resources
-        """
-        self.resource_type = resource_type
-        self.max_size = max_size
-        self.min_size = min_size
-        self.acquire_timeout = acquire_timeout
-        self.idle_timeout = idle_timeout
-
-        self._resources: deque = deque()
-        self._acquired: Dict[str, Any] = {}
-        self._metrics = ResourceMetrics(resource_type=resource_type)
-        self._lock = Lock()
-        self._closed = False
-
-    def acquire(self, timeout: Optional[float] = None) -> Any:
-        """Acquire a resource from the pool.
-
-        Args:
-            timeout: Acquisition timeout (uses default if None)
-
-        Returns:
-            Acquired resource
-
-        Raises:
-            TimeoutError: If acquisition times out
-            RuntimeError: If pool is closed
-        """
-        if self._closed:
-            raise RuntimeError("Resource pool is closed")
-
-        timeout = timeout or self.acquire_timeout
-        start_time = time.time()
+class MemoryCachePool:
+    """Size-bounded pool of memory cache entries."""
 
-        with self._lock:
-            # Try to get an existing resource
-            while self._resources and time.time() - start_time < timeout:
-                resource = self._resources.popleft()
-                if self._is_resource_valid(resource):
-                    self._acquired[id(resource)] = resource
-                    self._metrics.current_active += 1
-                    self._metrics.peak_usage = max(
-                        self._metrics.peak_usage,
-                        self._metrics.current_active,
-                    )
-                    self._metrics.updated_at = datetime.utcnow()
-                    return resource
-
-            # Create new resource if under max
-            if len(self._acquired) < self.max_size:
-                resource = self._create_resource()
-                self._acquired[id(resource)] = resource
-                self._metrics.current_active += 1
-                self._metrics.peak_usage = max(
-                    self._metrics.peak_usage,
-                    self._metrics.current_active,
-                )
-                self._metrics.total_allocated += 1
-                self._metrics.updated_at = datetime.utcnow()
-                return resource
-
-        raise TimeoutError(f"Failed to acquire {self.resource_type.value} within timeout")
-
-    def release(self, resource: Any):
-        """Release a resource back to the pool.
-
-        Args:
-            resource: Resource to release
-        """
-        if self._closed:
-            return
-
-        resource_id = id(resource)
-
-        with self._lock:
-            if resource_id in self._acquired:
-                del self._acquired[resource_id]
-                self._metrics.current_active -= 1
-
-                # Return to pool if valid and not exceeding max idle
-                if self._is_resource_valid(resource) and len(self._resources) < self.max_size:
-                    self._resources.append(resource)
-                else:
-                    self._close_resource(resource)
-                    self._metrics.total_released += 1
-
-                self._metrics.updated_at = datetime.utcnow()
-
-    def get_stats(self) -> Dict[str, Any]:
-        """Get pool statistics.
-
-        Returns:
-            Dictionary containing statistics
-        """
-        with self._lock:
-            return {
-                "resource_type": self.resource_type.value,
-                "max_size": self.max_size,
-                "min_size": self.min_size,
-                "current_pool_size": len(self._resources),
-                "current_active": len(self._acquired),
-                "total_allocated": self._metrics.total_allocated,
-                "total_released": self._metrics.total_released,
-                "peak_usage": self._metrics.peak_usage,
-                "utilization": (
-                    len(self._acquired) / self.max_size * 100
-                    if self.max_size > 0 else 0
-                ),
-            }
-
-    def _create_resource(self) -> Any:
-        """Create a new resource (override in subclasses)."""
-        # Placeholder - override in subclasses
-        return {}
-
-    def _is_resource_valid(self, resource: Any) -> bool:
-        """Check if a resource is still valid (override in subclasses)."""
-        # Placeholder - override in subclasses
-        return True
-
-    def _close_resource(self, resource: Any):
-        """Close/cleanup a resource (override in subclasses)."""
-        # Placeholder - override in subclasses
-        pass
-
-    def close(self):
-        """Close the resource pool."""
-        if self._closed:
-            return
-
-        self._closed = True
-
-        with self._lock:
-            # Close all resources
-            while self._resources:
-                resource = self._resources.popleft()
-                self._close_resource(resource)
-
-            # Close all acquired resources
-            for resource in self._acquired.values():
-                self._close_resource(resource)
-
-            self._acquired.clear()
-
-        logger.info(f"Closed resource pool: {self.resource_type.value}")
-
-
-class DatabaseSessionPool(ResourcePool):
-    """Resource pool for database sessions."""
-
-    def __init__(self, **kwargs):
-        """Initialize database session pool."""
-        super().__init__(ResourceType.DATABASE_SESSION, **kwargs)
-
-    def _create_resource(self):
-        """Create a database session (placeholder)."""
-        # In a real implementation, create actual database session
-        return {"session_id": f"db_session_{int(time.time())}", "created_at": time.time()}
-
-    def _is_resource_valid(self, resource: Dict[str, Any]) -> bool:
-        """Check if database session is valid."""
-        # Check session age
-        age = time.time() - resource.get("created_at", 0)
-        return age < self.idle_timeout
-
-    def _close_resource(self, resource: Dict[str, Any]):
-        """Close database session."""
-        # In a real implementation, close actual session
-        logger.debug(f"Closing database session: {resource['session_id']}")
-
-
-class MemoryCachePool(ResourcePool):
-    """Resource pool for memory cache entries."""
-
-    def __init__(self, max_memory_mb: int = 100, **kwargs):
+    def __init__(self, max_memory_mb: int = 100, max_size: int = 1000):
         """Initialize memory cache pool.
 
         Args:
             max_memory_mb: Maximum memory in MB
+            max_size: Maximum number of entries
         """
-        super().__init__(ResourceType.MEMORY_CACHE, **kwargs)
+        self.resource_type = ResourceType.MEMORY_CACHE
+        self.max_size = max_size
         self.max_memory_mb = max_memory_mb
         self.current_memory_mb = 0
         self._cache: Dict[str, Any] = {}
+        self._metrics = ResourceMetrics(resource_type=ResourceType.MEMORY_CACHE)
+        self._lock = Lock()
+        self._closed = False
 
     def acquire(self, key: str, value: Any, size_bytes: int):
         """Acquire cache entry.
@@ -340,8 +161,15 @@ class MemoryCachePool(ResourcePool):
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
-            stats = super().get_stats()
-            stats.update({
+            return {
+                "resource_type": self.resource_type.value,
+                "max_size": self.max_size,
+                "total_allocated": self._metrics.total_allocated,
+                "total_released": self._metrics.total_released,
+                "utilization": (
+                    len(self._cache) / self.max_size * 100
+                    if self.max_size > 0 else 0
+                ),
                 "current_memory_mb": self.current_memory_mb,
                 "max_memory_mb": self.max_memory_mb,
                 "memory_utilization": (
@@ -349,17 +177,31 @@ class MemoryCachePool(ResourcePool):
                     if self.max_memory_mb > 0 else 0
                 ),
                 "cache_entries": len(self._cache),
-            })
-            return stats
+            }
+
+    def close(self):
+        """Drop all cache entries."""
+        self._closed = True
+        with self._lock:
+            self._cache.clear()
+            self.current_memory_mb = 0
 
 
 class ResourceManager:
     """Central resource management system."""
 
+    # Pools grow when more than this share of acquisitions had to wait
+    SCALE_UP_WAIT_RATIO = 0.1
+    # Pools shrink when utilization stays below this percentage without waits
+    SCALE_DOWN_UTILIZATION = 25.0
+
     def __init__(self):
         """Initialize resource manager."""
         self.pools: Dict[ResourceType, ResourcePool] = {}
+        self.memory_cache = MemoryCachePool(max_size=1000, max_memory_mb=200)
         self.system_metrics_history: deque = deque(maxlen=1000)
+        self._size_limits: Dict[ResourceType, tuple] = {}
+        self._last_pool_stats: Dict[ResourceType, Dict[str, int]] = {}
         self._monitoring_task: Optional[asyncio.Task] = None
         self._is_running = False
 
@@ -368,17 +210,37 @@ class ResourceManager:
 
     def _register_default_pools(self):
         """Register default resource pools."""
-        self.register_pool(DatabaseSessionPool(max_size=50, min_size=5))
-        self.register_pool(MemoryCachePool(max_size=1000, max_memory_mb=200))
+        # The session pool is shared process-wide through the core registry
+        self.register_pool(
+            ResourceType.DATABASE_SESSION,
+            pool_registry.get_or_create(
+                "database_sessions",
+                lambda: DatabaseSessionPool(max_size=20, min_size=5),
+            ),
+            max_limit=50,
+        )
 
-    def register_pool(self, pool: ResourcePool):
+    def register_pool(
+        self,
+        resource_type: ResourceType,
+        pool: ResourcePool,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+    ):
         """Register a resource pool.
 
         Args:
+            resource_type: Resource type served by the pool
             pool: ResourcePool instance
+            min_limit: Lowest max_size auto-scaling may set (defaults to the pool's min_size)
+            max_limit: Highest max_size auto-scaling may set (defaults to the pool's max_size)
         """
-        self.pools[pool.resource_type] = pool
-        logger.info(f"Registered resource pool: {pool.resource_type.value}")
+        self.pools[resource_type] = pool
+        self._size_limits[resource_type] = (
+            min_limit if min_limit is not None else max(1, pool.min_size),
+            max_limit if max_limit is not None else pool.max_size,
+        )
+        logger.info(f"Registered resource pool: {resource_type.value}")
 
     def get_pool(self, resource_type: ResourceType) -> Optional[ResourcePool]:
         """Get resource pool by type.
@@ -502,55 +364,59 @@ class ResourceManager:
                         f"High resource utilization for {resource_type.value}: {utilization:.1f}%"
                     )
 
-                # Check for errors
-                if hasattr(pool._metrics, "error_count") and pool._metrics.error_count > 0:
+                # Check for timeouts and failed health checks
+                if stats["timeouts"] or stats["health_check_failures"]:
                     logger.warning(
-                        f"Resource pool {resource_type.value} has {pool._metrics.error_count} errors"
+                        f"Resource pool {resource_type.value} has {stats['timeouts']} timeouts "
+                        f"and {stats['health_check_failures']} failed health checks"
                     )
 
+                # Close expired idle resources
+                await pool.prune()
+
             except Exception as e:
                 logger.error(f"Error checking pool health for {resource_type.value}: {e}")
 
     async def _auto_scale_pools(self):
-        """Automatically scale resource pools based on load."""
-        if not self.system_metrics_history:
-            return
-
-        latest_metrics = self.system_metrics_history[-1]
-
-        # Scale based on CPU usage
-        if latest_metrics.cpu_percent > 80:
-            # Scale up pools
-            await self._scale_up_pools()
-        elif latest_metrics.cpu_percent < 30:
-            # Scale down pools
-            await self._scale_down_pools()
+        """Resize resource pools from their contention since the last check.
 
-    async def _scale_up_pools(self):
-        """Scale up resource pools."""
+        A pool grows when acquisitions time out or a significant share of
+        them had to wait, and shrinks when it is mostly idle and nobody
+        waited, always within its registered limits.
+        """
         for resource_type, pool in self.pools.items():
             try:
-                if pool.max_size < 1000:  # Don't scale infinitely
-                    old_max = pool.max_size
-                    pool.max_size = min(pool.max_size * 2, 1000)
-                    logger.info(
-                        f"Scaled up {resource_type.value} pool: {old_max} -> {pool.max_size}"
-                    )
-            except Exception as e:
-                logger.error(f"Error scaling up pool {resource_type.value}: {e}")
+                stats = pool.get_stats()
+                previous = self._last_pool_stats.get(resource_type, {})
+                self._last_pool_stats[resource_type] = {
+                    key: stats[key] for key in ("acquired", "waited", "timeouts")
+                }
 
-    async def _scale_down_pools(self):
-        """Scale down resource pools."""
-        for resource_type, pool in self.pools.items():
-            try:
-                if pool.max_size > 10:  # Don't scale below minimum
-                    old_max = pool.max_size
-                    pool.max_size = max(pool.max_size // 2, 10)
+                acquired = stats["acquired"] - previous.get("acquired", 0)
+                waited = stats["waited"] - previous.get("waited", 0)
+                timeouts = stats["timeouts"] - previous.get("timeouts", 0)
+                if not acquired and not timeouts:
+                    continue
+
+                min_limit, max_limit = self._size_limits[resource_type]
+                old_max = pool.max_size
+
+                if timeouts or waited > acquired * self.SCALE_UP_WAIT_RATIO:
+                    new_max = min(max_limit, old_max + max(1, old_max // 2))
+                elif not waited and stats["utilization"] < self.SCALE_DOWN_UTILIZATION:
+                    new_max = max(min_limit, old_max * 3 // 4)
+                else:
+                    continue
+
+                if new_max != old_max:
+                    pool.resize(new_max)
                     logger.info(
-                        f"Scaled down {resource_type.value} pool: {old_max} -> {pool.max_size}"
+                        f"Resized {resource_type.value} pool: {old_max} -> {new_max} "
+                        f"(acquired={acquired}, waited={waited}, timeouts={timeouts}, "
+                        f"p95 wait={stats['wait_time']['p95']:.4f}s)"
                     )
             except Exception as e:
-                logger.error(f"Error scaling down pool {resource_type.value}: {e}")
+                logger.error(f"Error scaling pool {resource_type.value}: {e}")
 
     async def _check_memory_pressure(self):
         """Check for memory pressure and trigger GC."""
@@ -574,6 +440,7 @@ class ResourceManager:
         pool_stats = {}
         for resource_type, pool in self.pools.items():
             pool_stats[resource_type.value] = pool.get_stats()
+        pool_stats[ResourceType.MEMORY_CACHE.value] = self.memory_cache.get_stats()
 
         # Get system metrics
         latest_metrics = self.system_metrics_history[-1] if self.system_metrics_history else None
@@ -602,26 +469,26 @@ class ResourceManager:
             },
         }
 
-    def optimize_resources(self):
+    async def optimize_resources(self):
         """Optimize resource usage."""
-        # Close unused pools
-        for resource_type, pool in self.pools.items():
-            stats = pool.get_stats()
-            if stats["current_active"] == 0 and stats["current_pool_size"] > pool.min_size:
-                # Release excess resources
-                excess = stats["current_pool_size"] - pool.min_size
-                logger.info(f"Releasing {excess} excess resources from {resource_type.value} pool")
+        # Close expired idle resources
+        closed = 0
+        for pool in self.pools.values():
+            closed += await pool.prune()
+        if closed:
+            logger.info(f"Released {closed} expired idle pooled resources")
 
         # Force garbage collection
         collected = gc.collect()
         logger.info(f"Resource optimization: collected {collected} objects")
 
-    def close_all_pools(self):
+    async def close_all_pools(self):
         """Close all resource pools."""
         for pool in self.pools.values():
-            pool.close()
+            await pool.close()
 
         self.pools.clear()
+        self.memory_cache.close()
 
         logger.info("All resource pools closed")
 
@@ -645,19 +512,20 @@ async def get_resource(resource_type: ResourceType, **kwargs) -> Any:
     if not pool:
         raise ValueError(f"No pool registered for resource type: {resource_type.value}")
 
-    return pool.acquire(**kwargs)
+    return await pool.acquire(**kwargs)
 
 
-def release_resource(resource_type: ResourceType, resource: Any):
+async def release_resource(resource_type: ResourceType, resource: Any, discard: bool = False):
     """Release a resource back to the pool.
 
     Args:
         resource_type: Type of resource
         resource: Resource to release
+        discard: Close the resource instead of reusing it
     """
     pool = resource_manager.get_pool(resource_type)
     if pool:
-        pool.release(resource)
+        await pool.release(resource, discard=discard)
 
 
 async def start_resource_monitoring():
@@ -675,6 +543,6 @@ def get_resource_stats() -> Dict[str, Any]:
     return resource_manager.get_comprehensive_stats()
 
 
-def optimize_resource_usage():
+async def optimize_resource_usage():
     """Optimize resource usage."""
-    resource_manager.optimize_resources()
+    await resource_manager.optimize_resources()
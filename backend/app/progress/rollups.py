@@ -0,0 +1,551 @@
+"""Pre-aggregated time-series rollups for progress visualizations.
+
+This module provides RollupStore, which maintains minute, hour and day
+buckets per (task_type, status) and is fed incrementally from TaskTracker
+update events, so that charts and heatmaps can be served without scanning
+TaskProgress rows:
+- Per-bucket update counts and progress sum/min/max
+- Task creations and status transitions per bucket
+- Live per-status task counts for distribution charts
+- One-shot seeding from the database with grouped queries
+"""
+
+import heapq
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from .models.task import TaskProgress
+
+logger = logging.getLogger(__name__)
+
+RollupKey = Tuple[str, str]
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _day_start(day: date) -> int:
+    """Get the UTC epoch second at which a calendar day starts."""
+    return int((datetime(day.year, day.month, day.day) - _EPOCH).total_seconds())
+
+
+class RollupResolution:
+    """Bucket widths and default retention for each rollup resolution."""
+
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
+
+    SECONDS = {MINUTE: 60, HOUR: 3600, DAY: 86400}
+    RETENTION = {MINUTE: 1440, HOUR: 24 * 30, DAY: 400}
+
+
+@dataclass
+class RollupBucket:
+    """Aggregates for one (task_type, status) pair in one time bucket."""
+
+    updates: int = 0
+    progress_sum: float = 0.0
+    progress_min: Optional[float] = None
+    progress_max: Optional[float] = None
+    created: int = 0
+    entered: int = 0
+
+    def add_progress(self, progress: float) -> None:
+        """Fold one progress observation into the bucket.
+
+        Args:
+            progress: Progress percentage (0-100)
+        """
+        self.updates += 1
+        self.progress_sum += progress
+        if self.progress_min is None or progress < self.progress_min:
+            self.progress_min = progress
+        if self.progress_max is None or progress > self.progress_max:
+            self.progress_max = progress
+
+    def merge(self, other: "RollupBucket") -> None:
+        """Merge another bucket into this one.
+
+        Args:
+            other: Bucket to merge
+        """
+        self.updates += other.updates
+        self.progress_sum += other.progress_sum
+        if other.progress_min is not None and (
+            self.progress_min is None or other.progress_min < self.progress_min
+        ):
+            self.progress_min = other.progress_min
+        if other.progress_max is not None and (
+            self.progress_max is None or other.progress_max > self.progress_max
+        ):
+            self.progress_max = other.progress_max
+        self.created += other.created
+        self.entered += other.entered
+
+    def value(self, aggregation: str) -> float:
+        """Get the bucket value for an aggregation method.
+
+        Median cannot be derived from mergeable sums, so it is served as
+        the mean.
+
+        Args:
+            aggregation: Aggregation name (sum, avg, min, max, count, median)
+
+        Returns:
+            Aggregated value
+        """
+        if aggregation == "count":
+            return float(self.updates)
+        if aggregation == "sum":
+            return self.progress_sum
+        if aggregation == "min":
+            return self.progress_min or 0.0
+        if aggregation == "max":
+            return self.progress_max or 0.0
+        return self.progress_sum / self.updates if self.updates else 0.0
+
+
+class RollupSeries(dict):
+    """Buckets of one (task_type, status) pair at one resolution.
+
+    Bucket starts are also kept in a min-heap, so retention evicts the
+    oldest buckets by time even when samples arrive out of order.
+    """
+
+    def __init__(self):
+        """Initialize empty series."""
+        super().__init__()
+        self._starts: List[int] = []
+        self.newest: Optional[int] = None
+
+    def add(self, start: int) -> RollupBucket:
+        """Get the bucket starting at ``start``, creating it if needed."""
+        bucket = self.get(start)
+        if bucket is None:
+            bucket = self[start] = RollupBucket()
+            heapq.heappush(self._starts, start)
+            if self.newest is None or start > self.newest:
+                self.newest = start
+        return bucket
+
+    def evict(self, cutoff: int) -> None:
+        """Drop buckets starting at or before ``cutoff``."""
+        while self._starts and self._starts[0] <= cutoff:
+            del self[heapq.heappop(self._starts)]
+
+
+class RollupStore:
+    """Incrementally maintained minute/hour/day rollups of task progress."""
+
+    def __init__(self, retention: Optional[Dict[str, int]] = None):
+        """Initialize rollup store.
+
+        Args:
+            retention: Number of buckets kept per resolution (optional)
+        """
+        self.retention = {**RollupResolution.RETENTION, **(retention or {})}
+        self._buckets: Dict[str, Dict[RollupKey, RollupSeries]] = {
+            resolution: defaultdict(RollupSeries)
+            for resolution in RollupResolution.SECONDS
+        }
+        self._current: Dict[RollupKey, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.version = 0
+        self.seeded_at: Optional[float] = None
+        self._stats = {
+            "events_applied": 0,
+            "seed_runs": 0,
+        }
+
+    @staticmethod
+    def _bucket_start(timestamp: float, resolution: str) -> int:
+        width = RollupResolution.SECONDS[resolution]
+        return int(timestamp // width) * width
+
+    def _apply(
+        self,
+        key: RollupKey,
+        timestamp: float,
+        progress: Optional[float] = None,
+        created: int = 0,
+        entered: int = 0,
+    ) -> None:
+        """Apply one observation to every resolution. Caller holds the lock."""
+        for resolution, series_by_key in self._buckets.items():
+            series = series_by_key[key]
+            start = self._bucket_start(timestamp, resolution)
+            bucket = series.get(start)
+            if bucket is None:
+                newest = start if series.newest is None else max(start, series.newest)
+                cutoff = newest - self.retention[resolution] * RollupResolution.SECONDS[resolution]
+                if start <= cutoff:
+                    # Arrived too late to be kept at this resolution
+                    continue
+                bucket = series.add(start)
+                series.evict(cutoff)
+            if progress is not None:
+                bucket.add_progress(progress)
+            bucket.created += created
+            bucket.entered += entered
+
+    def record_created(
+        self,
+        task_type: str,
+        status: str = "pending",
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Record a task creation.
+
+        Args:
+            task_type: Task type
+            status: Initial task status
+            timestamp: Event time (defaults to now)
+        """
+        key = (task_type or "unknown", status)
+        with self._lock:
+            self._apply(key, timestamp or time.time(), created=1, entered=1)
+            self._current[key] += 1
+            self.version += 1
+            self._stats["events_applied"] += 1
+
+    def record_progress(
+        self,
+        task_type: str,
+        status: str,
+        progress: float,
+        previous_status: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Record a progress update, including any status transition.
+
+        Args:
+            task_type: Task type
+            status: Status after the update
+            progress: Progress percentage (0-100)
+            previous_status: Status before the update (optional)
+            timestamp: Event time (defaults to now)
+        """
+        task_type = task_type or "unknown"
+        key = (task_type, status)
+        transitioned = previous_status is not None and previous_status != status
+        with self._lock:
+            self._apply(
+                key,
+                timestamp or time.time(),
+                progress=progress,
+                entered=1 if transitioned else 0,
+            )
+            if transitioned:
+                self._decrement_current((task_type, previous_status))
+                self._current[key] += 1
+            self.version += 1
+            self._stats["events_applied"] += 1
+
+    def record_removed(self, task_type: str, status: str) -> None:
+        """Record a task leaving the tracked set.
+
+        Args:
+            task_type: Task type
+            status: Status the task had
+        """
+        with self._lock:
+            self._decrement_current((task_type or "unknown", status))
+            self.version += 1
+            self._stats["events_applied"] += 1
+
+    def _decrement_current(self, key: RollupKey) -> None:
+        if self._current.get(key, 0) > 1:
+            self._current[key] -= 1
+        else:
+            self._current.pop(key, None)
+
+    async def handle_task_update(self, event_type: str, task_data: Dict[str, Any]) -> None:
+        """TaskTracker update handler feeding the rollups.
+
+        Args:
+            event_type: Tracker event type
+            task_data: Task data carried by the event
+        """
+        task_type = task_data.get("task_type") or "unknown"
+        status = task_data.get("status") or "pending"
+
+        if event_type == "task_created":
+            self.record_created(task_type, status)
+        elif event_type == "progress_updated":
+            self.record_progress(
+                task_type,
+                status,
+                float(task_data.get("progress") or 0.0),
+                previous_status=task_data.get("previous_status"),
+            )
+        elif event_type == "task_deleted":
+            self.record_removed(task_type, status)
+
+    @staticmethod
+    def resolution_for(span_seconds: float) -> str:
+        """Pick the coarsest-needed resolution for a time span.
+
+        Args:
+            span_seconds: Length of the queried range in seconds
+
+        Returns:
+            Resolution name
+        """
+        if span_seconds <= 6 * 3600:
+            return RollupResolution.MINUTE
+        if span_seconds <= 14 * 86400:
+            return RollupResolution.HOUR
+        return RollupResolution.DAY
+
+    def _matching(
+        self,
+        resolution: str,
+        task_type: Optional[str],
+        status: Optional[str],
+    ) -> Iterable[Tuple[RollupKey, RollupSeries]]:
+        for key, series in self._buckets[resolution].items():
+            if task_type and key[0] != task_type:
+                continue
+            if status and key[1] != status:
+                continue
+            yield key, series
+
+    def series(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        task_type: Optional[str] = None,
+        status: Optional[str] = None,
+        aggregation: str = "avg",
+        resolution: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get a time series of progress aggregates.
+
+        Args:
+            since: Range start (UTC)
+            until: Range end (UTC, defaults to now)
+            task_type: Filter by task type (optional)
+            status: Filter by status (optional)
+            aggregation: Aggregation method name
+            resolution: Bucket resolution (chosen from the span if omitted)
+
+        Returns:
+            Data points ordered by time
+        """
+        start_ts, end_ts = self._range(since, until)
+        resolution = resolution or self.resolution_for(end_ts - start_ts)
+        lower = self._bucket_start(start_ts, resolution)
+
+        merged: Dict[int, RollupBucket] = {}
+        with self._lock:
+            for _, series in self._matching(resolution, task_type, status):
+                for bucket_start, bucket in series.items():
+                    if bucket_start < lower or bucket_start > end_ts or not bucket.updates:
+                        continue
+                    merged.setdefault(bucket_start, RollupBucket()).merge(bucket)
+
+        return [
+            {
+                "time": datetime.utcfromtimestamp(bucket_start).isoformat(),
+                "value": merged[bucket_start].value(aggregation),
+                "count": merged[bucket_start].updates,
+            }
+            for bucket_start in sorted(merged)
+        ]
+
+    def grouped(
+        self,
+        group_by: str,
+        since: datetime,
+        until: Optional[datetime] = None,
+        task_type: Optional[str] = None,
+        status: Optional[str] = None,
+        aggregation: str = "avg",
+    ) -> List[Dict[str, Any]]:
+        """Aggregate progress over a range, grouped by task type or status.
+
+        Args:
+            group_by: "task_type" or "status"
+            since: Range start (UTC)
+            until: Range end (UTC, defaults to now)
+            task_type: Filter by task type (optional)
+            status: Filter by status (optional)
+            aggregation: Aggregation method name
+
+        Returns:
+            One data point per group
+        """
+        if group_by not in ("task_type", "status"):
+            return []
+
+        start_ts, end_ts = self._range(since, until)
+        resolution = self.resolution_for(end_ts - start_ts)
+        lower = self._bucket_start(start_ts, resolution)
+        index = 0 if group_by == "task_type" else 1
+
+        groups: Dict[str, RollupBucket] = {}
+        with self._lock:
+            for key, series in self._matching(resolution, task_type, status):
+                for bucket_start, bucket in series.items():
+                    if bucket_start < lower or bucket_start > end_ts or not bucket.updates:
+                        continue
+                    groups.setdefault(key[index], RollupBucket()).merge(bucket)
+
+        return [
+            {
+                "group": group,
+                "value": bucket.value(aggregation),
+                "count": bucket.updates,
+            }
+            for group, bucket in sorted(groups.items())
+        ]
+
+    def status_distribution(self, task_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the live per-status task counts.
+
+        Args:
+            task_type: Filter by task type (optional)
+
+        Returns:
+            Status/count/percentage rows
+        """
+        counts: Dict[str, int] = defaultdict(int)
+        with self._lock:
+            for (key_type, key_status), count in self._current.items():
+                if task_type and key_type != task_type:
+                    continue
+                counts[key_status] += count
+
+        total = sum(counts.values())
+        return [
+            {
+                "status": status,
+                "count": count,
+                "percentage": (count / total * 100) if total > 0 else 0,
+            }
+            for status, count in sorted(counts.items())
+        ]
+
+    def daily_activity(
+        self,
+        days: int,
+        task_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get per-day task creation counts for heatmaps.
+
+        Args:
+            days: Number of days ending today
+            task_type: Filter by task type (optional)
+
+        Returns:
+            One row per day, zero-filled
+        """
+        today = datetime.utcnow().date()
+        first = today - timedelta(days=days - 1)
+        counts: Dict[int, int] = defaultdict(int)
+        with self._lock:
+            for _, series in self._matching(RollupResolution.DAY, task_type, None):
+                for bucket_start, bucket in series.items():
+                    if bucket.created:
+                        counts[bucket_start] += bucket.created
+
+        data = []
+        for offset in range(days):
+            day = first + timedelta(days=offset)
+            data.append({
+                "date": day.isoformat(),
+                "count": counts.get(_day_start(day), 0),
+                "weekday": day.weekday(),
+            })
+        return data
+
+    def load_from_database(self, session: Session, days: int = 30) -> None:
+        """Seed live status counts and daily creations from the database.
+
+        Replaces the live counts and day-level creation counts with grouped
+        query results; minute and hour progress buckets keep accumulating
+        from tracker events.
+
+        Args:
+            session: Database session
+            days: Number of days of creation history to load
+        """
+        status_rows = (
+            session.query(TaskProgress.task_type, TaskProgress.status, func.count(TaskProgress.id))
+            .group_by(TaskProgress.task_type, TaskProgress.status)
+            .all()
+        )
+
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        day_column = func.date(TaskProgress.created_at)
+        created_rows = (
+            session.query(day_column, TaskProgress.task_type, func.count(TaskProgress.id))
+            .filter(TaskProgress.created_at >= cutoff)
+            .group_by(day_column, TaskProgress.task_type)
+            .all()
+        )
+
+        with self._lock:
+            self._current = defaultdict(int)
+            for task_type, status, count in status_rows:
+                status = getattr(status, "value", status)
+                self._current[(task_type or "unknown", status)] += count
+
+            for series in self._buckets[RollupResolution.DAY].values():
+                for bucket in series.values():
+                    bucket.created = 0
+            day_buckets = self._buckets[RollupResolution.DAY]
+            for day, task_type, count in created_rows:
+                if isinstance(day, str):
+                    day = datetime.fromisoformat(day).date()
+                key = (task_type or "unknown", "pending")
+                day_buckets[key].add(_day_start(day)).created += count
+
+            self.version += 1
+            self.seeded_at = time.time()
+            self._stats["seed_runs"] += 1
+
+        logger.info(
+            f"Seeded rollups from database: {len(status_rows)} status groups, "
+            f"{len(created_rows)} daily groups"
+        )
+
+    def _range(self, since: datetime, until: Optional[datetime]) -> Tuple[float, float]:
+        start_ts = (since - _EPOCH).total_seconds()
+        end_ts = ((until or datetime.utcnow()) - _EPOCH).total_seconds()
+        return start_ts, end_ts
+
+    def clear(self) -> None:
+        """Drop all rollups."""
+        with self._lock:
+            for series_by_key in self._buckets.values():
+                series_by_key.clear()
+            self._current.clear()
+            self.version += 1
+            self.seeded_at = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rollup store statistics.
+
+        Returns:
+            Dictionary containing statistics
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "version": self.version,
+                "seeded_at": self.seeded_at,
+                "tracked_tasks": sum(self._current.values()),
+                "buckets": {
+                    resolution: sum(len(series) for series in series_by_key.values())
+                    for resolution, series_by_key in self._buckets.items()
+                },
+            }
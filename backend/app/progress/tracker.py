@@ -350,6 +350,9 @@ class TaskTracker:
         self._stats["tasks_created"] += 1
         self._stats["last_update_time"] = time.time()
 
+        # Notify handlers
+        await self._notify_handlers("task_created", task_data)
+
         logger.info(f"Created task: {request.task_id}")
         return task_data
 
@@ -457,7 +460,10 @@ class TaskTracker:
         self._stats["last_update_time"] = time.time()
 
         # Notify handlers
-        await self._notify_handlers("progress_updated", task_data)
+        await self._notify_handlers(
+            "progress_updated",
+            {**task_data, "previous_status": old_status},
+        )
 
         logger.info(
             f"Updated task progress: {request.task_id} "
@@ -600,7 +606,8 @@ class TaskTracker:
         Raises:
             TaskNotFoundError: If task not found
         """
-        # Remove from cache
+        # Remove from cache, keeping the last known state for handlers
+        task_data = await self.cache.get(task_id)
         await self.cache.remove(task_id)
 
         # Remove from aggregator
@@ -616,11 +623,16 @@ class TaskTracker:
             if not task:
                 raise TaskNotFoundError(f"Task not found: {task_id}")
 
+            task_data = task_data or serialize_task_progress(task)
             self.db_session.delete(task)
             self.db_session.commit()
+            await self._notify_handlers("task_deleted", task_data)
             logger.info(f"Deleted task: {task_id}")
             return True
 
+        if task_data:
+            await self._notify_handlers("task_deleted", task_data)
+
         logger.info(f"Deleted task (in-memory): {task_id}")
         return True
 
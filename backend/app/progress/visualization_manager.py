@@ -8,7 +8,7 @@ import asyncio
 import logging
 import time
 import json
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
 from datetime import datetime, timedelta
 from collections import defaultdict
 from enum import Enum
@@ -37,6 +37,8 @@ from .log_manager import log_manager
 from .notification_manager import notification_manager
 from .event_bus import event_bus
 from .websocket import websocket_manager
+from .rollups import RollupStore
+from .tracker import task_tracker
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +103,7 @@ class RealTimeUpdate:
     last_update: float
     filters: Dict[str, Any]
     callback: Optional[Callable] = None
+    filter_key: str = ""
 
 
 class VisualizationData:
@@ -161,24 +164,46 @@ class DashboardWidget:
 
 
 class VisualizationManager:
-    """Core manager for data visualization and dashboards."""
+    """Core manager for data visualization and dashboards.
 
-    def __init__(self, db_session: Optional[Session] = None):
+    Fleet-wide charts (no task or user filter) are served from a RollupStore
+    fed by TaskTracker events. Real-time subscriptions share one ticker that
+    computes each distinct filter once per tick and fans the result out.
+    """
+
+    def __init__(
+        self,
+        db_session: Optional[Session] = None,
+        rollups: Optional[RollupStore] = None,
+        tick_interval: float = 1.0,
+        rollup_seed_ttl: float = 900.0,
+    ):
         """Initialize visualization manager.
 
         Args:
             db_session: SQLAlchemy database session (optional)
+            rollups: Rollup store to read from (optional)
+            tick_interval: Real-time ticker interval in seconds
+            rollup_seed_ttl: Seconds before rollups are re-seeded from the database
         """
         self.db_session = db_session
+        self.rollups = rollups or RollupStore()
+        self.tick_interval = tick_interval
+        self.rollup_seed_ttl = rollup_seed_ttl
         self.dashboard_widgets: Dict[str, DashboardWidget] = {}
         self.chart_templates: Dict[str, ChartTemplate] = {}
         self.real_time_updates: Dict[str, RealTimeUpdate] = {}
+        self._subscription_groups: Dict[str, Set[str]] = defaultdict(set)
+        self._realtime_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._ticker_task: Optional[asyncio.Task] = None
         self._stats = {
             "total_visualizations_created": 0,
             "total_dashboards_created": 0,
             "total_data_points_rendered": 0,
             "total_templates_created": 0,
             "total_real_time_subscriptions": 0,
+            "total_realtime_computations": 0,
+            "total_realtime_updates_sent": 0,
             "by_chart_type": defaultdict(int),
         }
 
@@ -192,21 +217,37 @@ class VisualizationManager:
         group_by: Optional[str] = None,
         aggregation: MetricAggregation = MetricAggregation.AVG,
         db_session: Optional[Session] = None,
+        task_type: Optional[str] = None,
     ) -> VisualizationData:
         """Create progress tracking chart.
 
+        Without task IDs the chart covers all tasks and is read from the
+        rollups; with task IDs it is aggregated in the database.
+
         Args:
-            task_ids: List of task IDs to include
+            task_ids: List of task IDs to include (empty for all tasks)
             time_range: Time range filter (e.g., "1d", "7d", "30d")
             group_by: Group by field (e.g., "status", "task_type")
             aggregation: Aggregation method
             db_session: Database session (overrides instance session)
+            task_type: Filter by task type when reading rollups (optional)
 
         Returns:
             VisualizationData instance
         """
         session = db_session or self.db_session
-        if not session:
+        if not task_ids:
+            self._seed_rollups(session)
+            since = self._parse_time_range(time_range or "1d")
+            if group_by:
+                data = self.rollups.grouped(
+                    group_by, since, task_type=task_type, aggregation=aggregation.value
+                )
+            else:
+                data = self.rollups.series(
+                    since, task_type=task_type, aggregation=aggregation.value
+                )
+        elif not session:
             # Generate mock data for testing
             data = self._generate_mock_progress_data(task_ids)
         else:
@@ -237,6 +278,7 @@ class VisualizationManager:
                 "time_range": time_range,
                 "group_by": group_by,
                 "aggregation": aggregation.value,
+                "source": "rollups" if not task_ids else "database" if session else "mock",
             },
         )
 
@@ -263,7 +305,11 @@ class VisualizationManager:
             VisualizationData instance
         """
         session = db_session or self.db_session
-        if not session:
+        if not user_id:
+            # Live per-status counts are kept in the rollups
+            self._seed_rollups(session)
+            data = self.rollups.status_distribution(task_type)
+        elif not session:
             # Generate mock data
             data = [
                 {"status": "completed", "count": 45, "percentage": 60},
@@ -417,7 +463,11 @@ class VisualizationManager:
             VisualizationData instance
         """
         session = db_session or self.db_session
-        if not session:
+        if not user_id:
+            # Daily creation counts are kept in the rollups
+            self._seed_rollups(session)
+            data = self.rollups.daily_activity(days)
+        elif not session:
             # Generate mock data
             data = self._generate_mock_heatmap_data(days)
         else:
@@ -614,12 +664,27 @@ class VisualizationManager:
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
+    _AGGREGATE_FUNCTIONS = {
+        MetricAggregation.SUM: func.sum,
+        MetricAggregation.AVG: func.avg,
+        MetricAggregation.MIN: func.min,
+        MetricAggregation.MAX: func.max,
+        MetricAggregation.COUNT: func.count,
+        # Median has no portable SQL aggregate; the mean is reported instead
+        MetricAggregation.MEDIAN: func.avg,
+    }
+
+    _GROUP_COLUMNS = {
+        "status": TaskProgress.status,
+        "task_type": TaskProgress.task_type,
+    }
+
     async def _aggregate_progress_data(
         self,
         query,
         aggregation: MetricAggregation,
     ) -> List[Dict[str, Any]]:
-        """Aggregate progress data.
+        """Aggregate progress data in the database.
 
         Args:
             query: SQLAlchemy query
@@ -628,14 +693,20 @@ class VisualizationManager:
         Returns:
             Aggregated data points
         """
-        # This is a simplified version - in practice you'd need more complex logic
-        tasks = query.all()
+        aggregate = self._AGGREGATE_FUNCTIONS[aggregation]
+        value, count = query.with_entities(
+            aggregate(TaskProgress.progress),
+            func.count(TaskProgress.id),
+        ).one()
 
-        if aggregation == MetricAggregation.AVG:
-            avg_progress = sum(t.progress for t in tasks) / len(tasks) if tasks else 0
-            return [{"time": datetime.utcnow().isoformat(), "value": avg_progress}]
+        if not count:
+            return []
 
-        return []
+        return [{
+            "time": datetime.utcnow().isoformat(),
+            "value": float(value or 0),
+            "count": count,
+        }]
 
     async def _aggregate_progress_by_group(
         self,
@@ -643,7 +714,7 @@ class VisualizationManager:
         group_by: str,
         aggregation: MetricAggregation,
     ) -> List[Dict[str, Any]]:
-        """Aggregate progress data by group.
+        """Aggregate progress data by group in the database.
 
         Args:
             query: SQLAlchemy query
@@ -653,24 +724,47 @@ class VisualizationManager:
         Returns:
             Aggregated data points by group
         """
-        # Simplified implementation
-        tasks = query.all()
+        column = self._GROUP_COLUMNS.get(group_by)
+        if column is None:
+            return []
+
+        aggregate = self._AGGREGATE_FUNCTIONS[aggregation]
+        rows = (
+            query.with_entities(
+                column,
+                aggregate(TaskProgress.progress),
+                func.count(TaskProgress.id),
+            )
+            .group_by(column)
+            .all()
+        )
 
-        if group_by == "status":
-            grouped = defaultdict(list)
-            for task in tasks:
-                grouped[task.status].append(task)
+        return [
+            {
+                "group": getattr(group, "value", group),
+                "value": float(value or 0),
+                "count": count,
+            }
+            for group, value, count in rows
+        ]
 
-            return [
-                {
-                    "group": status,
-                    "value": sum(t.progress for t in group) / len(group) if group else 0,
-                    "count": len(group),
-                }
-                for status, group in grouped.items()
-            ]
+    def _seed_rollups(self, session: Optional[Session]) -> None:
+        """Seed the rollups from the database when missing or stale.
+
+        Args:
+            session: Database session (nothing is loaded without one)
+        """
+        if not session:
+            return
 
-        return []
+        seeded_at = self.rollups.seeded_at
+        if seeded_at is not None and time.time() - seeded_at < self.rollup_seed_ttl:
+            return
+
+        try:
+            self.rollups.load_from_database(session)
+        except Exception as e:
+            logger.error(f"Error seeding visualization rollups: {e}")
 
     def _parse_time_range(self, time_range: str) -> datetime:
         """Parse time range string to datetime.
@@ -872,13 +966,16 @@ class VisualizationManager:
             update_interval=update_interval,
             last_update=time.time(),
             filters=visualization_query,
+            filter_key=self._filter_key(visualization_query),
         )
 
         self.real_time_updates[subscription_id] = subscription
+        self._subscription_groups[subscription.filter_key].add(subscription_id)
         self._stats["total_real_time_subscriptions"] += 1
 
-        # Start the update task
-        asyncio.create_task(self._run_real_time_updates(subscription_id))
+        # Start the shared ticker
+        if self._ticker_task is None or self._ticker_task.done():
+            self._ticker_task = asyncio.create_task(self._run_ticker())
 
         logger.info(f"Added real-time subscription {subscription_id} for connection {connection_id}")
         return subscription_id
@@ -889,51 +986,128 @@ class VisualizationManager:
         Args:
             subscription_id: Subscription ID to remove
         """
-        if subscription_id in self.real_time_updates:
-            del self.real_time_updates[subscription_id]
-            self._stats["total_real_time_subscriptions"] = len(self.real_time_updates)
-            logger.info(f"Removed real-time subscription {subscription_id}")
+        subscription = self.real_time_updates.pop(subscription_id, None)
+        if subscription is None:
+            return
+
+        group = self._subscription_groups.get(subscription.filter_key)
+        if group is not None:
+            group.discard(subscription_id)
+            if not group:
+                del self._subscription_groups[subscription.filter_key]
+                self._realtime_cache.pop(subscription.filter_key, None)
+
+        self._stats["total_real_time_subscriptions"] = len(self.real_time_updates)
+
+        if not self.real_time_updates and self._ticker_task is not None:
+            self._ticker_task.cancel()
+            self._ticker_task = None
 
-    async def _run_real_time_updates(self, subscription_id: str):
-        """Run real-time updates for a subscription.
+        logger.info(f"Removed real-time subscription {subscription_id}")
+
+    @staticmethod
+    def _filter_key(filters: Dict[str, Any]) -> str:
+        """Get the canonical key under which identical filters are shared.
 
         Args:
-            subscription_id: Subscription ID
+            filters: Filter parameters
+
+        Returns:
+            Canonical filter key
         """
-        while subscription_id in self.real_time_updates:
-            subscription = self.real_time_updates[subscription_id]
+        return json.dumps(filters, sort_keys=True, default=str)
 
+    async def _run_ticker(self):
+        """Drive all real-time subscriptions from a single loop."""
+        while self.real_time_updates:
             try:
-                # Check if it's time for an update
-                current_time = time.time()
-                if current_time - subscription.last_update >= subscription.update_interval:
-                    # Generate new visualization data
-                    viz_data = await self._generate_realtime_data(subscription.filters)
-
-                    # Send update via WebSocket
-                    message = {
-                        "type": "visualization_update",
-                        "subscription_id": subscription_id,
-                        "data": viz_data,
-                        "timestamp": current_time,
-                    }
-
-                    await websocket_manager.send_message(
-                        subscription.connection_id,
-                        message
-                    )
+                await self._tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in real-time visualization ticker: {e}")
+            await asyncio.sleep(self.tick_interval)
 
-                    subscription.last_update = current_time
+    async def _tick(self, now: Optional[float] = None) -> int:
+        """Send updates to every due subscription.
 
-                # Wait before next check
-                await asyncio.sleep(1.0)
+        Each distinct filter is computed at most once per tick and reused
+        while the rollups are unchanged within the same minute.
 
-            except Exception as e:
-                logger.error(f"Error in real-time updates for {subscription_id}: {e}")
-                await asyncio.sleep(5.0)
+        Args:
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Number of filters computed
+        """
+        now = now or time.time()
+        computed = 0
+
+        for filter_key, subscription_ids in list(self._subscription_groups.items()):
+            due = [
+                subscription
+                for subscription in (
+                    self.real_time_updates.get(sid) for sid in list(subscription_ids)
+                )
+                if subscription is not None
+                and now - subscription.last_update >= subscription.update_interval
+            ]
+            if not due:
+                continue
+
+            cache_token = (self.rollups.version, int(now // 60))
+            cached = self._realtime_cache.get(filter_key)
+            if cached is not None and cached[0] == cache_token:
+                viz_data = cached[1]
+            else:
+                viz_data = await self._generate_realtime_data(due[0].filters)
+                self._realtime_cache[filter_key] = (cache_token, viz_data)
+                self._stats["total_realtime_computations"] += 1
+                computed += 1
+
+            await asyncio.gather(
+                *(self._send_realtime_update(subscription, viz_data, now) for subscription in due)
+            )
+
+        return computed
+
+    async def _send_realtime_update(
+        self,
+        subscription: RealTimeUpdate,
+        viz_data: Dict[str, Any],
+        current_time: float,
+    ):
+        """Send one real-time update to a subscriber.
+
+        Args:
+            subscription: Subscription to update
+            viz_data: Shared visualization payload
+            current_time: Tick timestamp
+        """
+        message = {
+            "type": "visualization_update",
+            "subscription_id": subscription.visualization_id,
+            "data": viz_data,
+            "timestamp": current_time,
+        }
+
+        try:
+            await websocket_manager.send_message(subscription.connection_id, message)
+            if subscription.callback:
+                if asyncio.iscoroutinefunction(subscription.callback):
+                    await subscription.callback(message)
+                else:
+                    subscription.callback(message)
+            self._stats["total_realtime_updates_sent"] += 1
+        except Exception as e:
+            logger.error(
+                f"Error in real-time updates for {subscription.visualization_id}: {e}"
+            )
+        finally:
+            subscription.last_update = current_time
 
     async def _generate_realtime_data(self, filters: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate real-time visualization data.
+        """Generate real-time visualization data from the rollups.
 
         Args:
             filters: Filter parameters
@@ -941,26 +1115,37 @@ class VisualizationManager:
         Returns:
             Visualization data dictionary
         """
-        # This is a simplified implementation
-        # In practice, you'd query the actual data based on filters
-
         chart_type = filters.get("chart_type", "line")
-        task_ids = filters.get("task_ids", [])
+        task_type = filters.get("task_type")
+        since = self._parse_time_range(filters.get("time_range", "1h"))
 
         if chart_type == "line":
-            data = [
-                {"time": datetime.utcnow().isoformat(), "value": 50 + (time.time() % 100)},
-                {"time": (datetime.utcnow() - timedelta(minutes=1)).isoformat(), "value": 48},
-                {"time": (datetime.utcnow() - timedelta(minutes=2)).isoformat(), "value": 46},
-            ]
+            if filters.get("group_by"):
+                data = self.rollups.grouped(
+                    filters["group_by"],
+                    since,
+                    task_type=task_type,
+                    status=filters.get("status"),
+                    aggregation=filters.get("aggregation", "avg"),
+                )
+            else:
+                data = self.rollups.series(
+                    since,
+                    task_type=task_type,
+                    status=filters.get("status"),
+                    aggregation=filters.get("aggregation", "avg"),
+                )
         elif chart_type == "pie":
-            data = [
-                {"status": "completed", "count": 45},
-                {"status": "running", "count": 20},
-                {"status": "failed", "count": 5},
-            ]
+            data = self.rollups.status_distribution(task_type)
+        elif chart_type == "heatmap":
+            data = self.rollups.daily_activity(int(filters.get("days", 30)), task_type)
         else:
-            data = [{"value": 75, "label": "Current"}]
+            distribution = self.rollups.status_distribution(task_type)
+            completed = next(
+                (row["percentage"] for row in distribution if row["status"] == "completed"),
+                0,
+            )
+            data = [{"value": completed, "label": "Completed"}]
 
         return {
             "chart_type": chart_type,
@@ -1119,8 +1304,11 @@ class VisualizationManager:
             "total_widgets": len(self.dashboard_widgets),
             "total_templates": len(self.chart_templates),
             "active_subscriptions": len(self.real_time_updates),
+            "distinct_subscription_filters": len(self._subscription_groups),
+            "rollups": self.rollups.get_stats(),
         }
 
 
 # Global visualization manager instance
 visualization_manager = VisualizationManager()
+task_tracker.register_update_handler(visualization_manager.rollups.handle_task_update)
@@ -16,6 +16,8 @@ from uuid import UUID, uuid4
 from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
+from app.core.metrics import metrics_registry
+
 from .schemas.websocket_messages import (
     WebSocketMessage,
     MessageType,
@@ -306,6 +308,18 @@ class WebSocketManager:
             "failed_sends": 0,
             "reconnections": 0,
         }
+        metrics_registry.register_stats(
+            "websocket",
+            self,
+            "stats",
+            counters=(
+                "total_connections",
+                "total_messages_sent",
+                "total_messages_received",
+                "failed_sends",
+                "reconnections",
+            ),
+        )
 
     async def start(self):
         """Start the WebSocket manager."""
@@ -6,15 +6,27 @@ trend analysis, and quality assessments.
 """
 
 import asyncio
+import dataclasses
+import hashlib
+import json
+import math
+import os
 import statistics
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Callable
+from typing import Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Any, Sequence, Set, Tuple, Callable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from collections import defaultdict, Counter
+from collections import deque, Counter, OrderedDict
 import logging
 
-from .event_manager import SkillEventManager, EventType
+from app.core.metrics import Histogram, SparseHistogram
+
+from .event_manager import EventHandler, SkillEvent, SkillEventManager, EventType
 from .manager import SkillManager
 
 logger = logging.getLogger(__name__)
@@ -68,6 +80,269 @@ class Metric:
         return data
 
 
+# Partition widths in seconds of the metric store. Raw points are kept per
+# minute; summaries are also rolled up per hour and per day.
+METRIC_PARTITION_WIDTHS = (60, 3600, 86400)
+
+# How long raw points and rolled-up summaries are kept
+METRIC_RAW_RETENTION = timedelta(days=30)
+METRIC_SUMMARY_RETENTION = timedelta(days=366)
+
+
+class MetricSummary:
+    """Mergeable summary of the metric points of one partition."""
+
+    __slots__ = ("count", "sum", "min", "max", "sketch")
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = SparseHistogram()
+
+    def add(self, value: float):
+        """Add a point value to the summary."""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sketch.record(value)
+
+    def merge(self, other: "MetricSummary"):
+        """Merge another summary into this one."""
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+
+class MetricPartition(MetricSummary):
+    """Raw points of one partition, stored column by column."""
+
+    __slots__ = ("timestamps", "values", "metric_types", "tags", "metadata")
+
+    def __init__(self):
+        super().__init__()
+        self.timestamps = array("d")
+        self.values = array("d")
+        self.metric_types: List[MetricType] = []
+        self.tags: List[Dict[str, str]] = []
+        self.metadata: List[Optional[Dict[str, Any]]] = []
+
+    def append(self, timestamp: float, metric: Metric):
+        """Append a point to the partition."""
+        self.timestamps.append(timestamp)
+        self.values.append(metric.value)
+        self.metric_types.append(metric.metric_type)
+        self.tags.append(metric.tags)
+        self.metadata.append(metric.metadata)
+        self.add(metric.value)
+
+    def points(self, name: str, since: float = -math.inf) -> List[Metric]:
+        """Get the points recorded after a timestamp."""
+        return [
+            Metric(
+                name=name,
+                value=self.values[i],
+                metric_type=self.metric_types[i],
+                timestamp=datetime.fromtimestamp(self.timestamps[i]),
+                tags=self.tags[i],
+                metadata=self.metadata[i],
+            )
+            for i in range(len(self.timestamps))
+            if self.timestamps[i] > since
+        ]
+
+    def summarize(self, since: float) -> MetricSummary:
+        """Summarize the points recorded after a timestamp."""
+        summary = MetricSummary()
+        for timestamp, value in zip(self.timestamps, self.values):
+            if timestamp > since:
+                summary.add(value)
+        return summary
+
+
+class MetricSeries:
+    """Time-partitioned store of the points of one metric.
+
+    Points go to per-minute columnar partitions whose summary (count, sum,
+    min, max and a sparse histogram) is maintained as they are appended,
+    together with hourly and daily roll-ups. Range summaries merge the
+    coarsest roll-ups that fit in the range and only scan raw points in the
+    minute the range starts in, so a year-long aggregate costs a few
+    hundred merges. Partitions expire as a whole.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        raw_retention: timedelta = METRIC_RAW_RETENTION,
+        summary_retention: timedelta = METRIC_SUMMARY_RETENTION,
+    ):
+        """Initialize metric series.
+
+        Args:
+            name: Metric name
+            raw_retention: How long raw points are kept
+            summary_retention: How long hourly and daily summaries are kept
+        """
+        self.name = name
+        self.raw_retention = raw_retention.total_seconds()
+        self.summary_retention = summary_retention.total_seconds()
+        self._tiers: List[Dict[int, MetricSummary]] = [{} for _ in METRIC_PARTITION_WIDTHS]
+        self._keys: List[List[int]] = [[] for _ in METRIC_PARTITION_WIDTHS]
+        # Start of the data each tier still holds after expiry
+        self._horizons: List[float] = [-math.inf for _ in METRIC_PARTITION_WIDTHS]
+        self._raw_count = 0
+
+    def __len__(self) -> int:
+        return self._raw_count
+
+    def __iter__(self) -> Iterator[Metric]:
+        partitions = self._tiers[0]
+        for key in self._keys[0]:
+            yield from partitions[key].points(self.name)
+
+    def __getitem__(self, index: int) -> Metric:
+        return list(self)[index]
+
+    def append(self, metric: Metric):
+        """Append a point.
+
+        Args:
+            metric: Metric point
+        """
+        timestamp = metric.timestamp.timestamp()
+        self._raw_count += 1
+        for level, width in enumerate(METRIC_PARTITION_WIDTHS):
+            key = int(timestamp // width)
+            tier = self._tiers[level]
+            summary = tier.get(key)
+            created = summary is None
+            if created:
+                summary = tier[key] = MetricPartition() if level == 0 else MetricSummary()
+                insort(self._keys[level], key)
+
+            if level == 0:
+                summary.append(timestamp, metric)
+            else:
+                summary.add(metric.value)
+
+            # Expiry only needs checking when time moves to a new partition
+            if created:
+                retention = self.raw_retention if level == 0 else self.summary_retention
+                self._expire(level, time.time() - retention)
+
+    def points(self, since: Optional[datetime] = None) -> List[Metric]:
+        """Get raw points.
+
+        Args:
+            since: Only return points recorded after this time
+
+        Returns:
+            Points in partition order
+        """
+        if since is None:
+            return list(self)
+        start = since.timestamp()
+        keys = self._keys[0]
+        partitions = self._tiers[0]
+        result = []
+        for key in keys[bisect_left(keys, int(start // METRIC_PARTITION_WIDTHS[0])):]:
+            result.extend(partitions[key].points(self.name, start))
+        return result
+
+    def summarize(self, since: Optional[datetime] = None) -> Optional[MetricSummary]:
+        """Summarize the points recorded after a time.
+
+        A range starting before the raw points still held is widened to the
+        start of the hour or day it falls in.
+
+        Args:
+            since: Start of the range (everything when omitted)
+
+        Returns:
+            Merged summary, or None when the range holds no points
+        """
+        result = MetricSummary()
+        start = -math.inf if since is None else since.timestamp()
+        upper = math.inf
+
+        for level in range(len(METRIC_PARTITION_WIDTHS) - 1, -1, -1):
+            width = METRIC_PARTITION_WIDTHS[level]
+            tier = self._tiers[level]
+            keys = self._keys[level]
+            if start == -math.inf:
+                first = keys[0] if keys else 0
+            else:
+                first = int(start // width) + 1
+            last = len(keys) if upper == math.inf else bisect_left(keys, int(upper // width))
+            for key in keys[bisect_left(keys, first):last]:
+                result.merge(tier[key])
+            upper = first * width
+
+            if start == -math.inf:
+                break
+            if level == 0:
+                partial = tier.get(first - 1)
+                if partial is not None:
+                    result.merge(partial.summarize(start))
+            elif start < self._horizons[level - 1] and first - 1 in tier:
+                # Finer tiers have expired here; count the whole partition
+                result.merge(tier[first - 1])
+                break
+
+        return result if result.count else None
+
+    def drop_before(self, cutoff: datetime):
+        """Drop raw partitions that ended before a time.
+
+        Summaries past their own retention are dropped as well.
+
+        Args:
+            cutoff: Partitions ending at or before this time are dropped
+        """
+        self._expire(0, cutoff.timestamp())
+        horizon = time.time() - self.summary_retention
+        for level in range(1, len(METRIC_PARTITION_WIDTHS)):
+            self._expire(level, horizon)
+
+    def _expire(self, level: int, horizon: float):
+        width = METRIC_PARTITION_WIDTHS[level]
+        keys = self._keys[level]
+        end = bisect_left(keys, int(horizon // width))
+        if not end:
+            return
+        tier = self._tiers[level]
+        for key in keys[:end]:
+            partition = tier.pop(key)
+            if level == 0:
+                self._raw_count -= partition.count
+        del keys[:end]
+        self._horizons[level] = max(self._horizons[level], (horizon // width) * width)
+
+
+class MetricStore(dict):
+    """Metric series by name, created on first access."""
+
+    def __init__(
+        self,
+        raw_retention: timedelta = METRIC_RAW_RETENTION,
+        summary_retention: timedelta = METRIC_SUMMARY_RETENTION,
+    ):
+        super().__init__()
+        self.raw_retention = raw_retention
+        self.summary_retention = summary_retention
+
+    def __missing__(self, name: str) -> MetricSeries:
+        series = self[name] = MetricSeries(name, self.raw_retention, self.summary_retention)
+        return series
+
+
 @dataclass
 class AnalyticsReport:
     """Represents an analytics report."""
@@ -91,9 +366,27 @@ class AnalyticsReport:
         return data
 
 
+# Executions and errors kept verbatim per skill; everything else is aggregated
+RECENT_EXECUTIONS = 100
+RECENT_FEEDBACK = 100
+
+# Half-life in seconds of the time-decayed execution and error rates
+RATE_HALF_LIFE = 300.0
+
+# Percentiles reported for execution times
+EXECUTION_TIME_PERCENTILES = (50, 95, 99)
+
+
 @dataclass
 class SkillUsageStats:
-    """Represents skill usage statistics."""
+    """Represents skill usage statistics.
+
+    Statistics are aggregated as executions are recorded, so the time and
+    memory spent per skill stay constant however often it runs: the mean
+    and variance use Welford's method, percentiles come from a log-linear
+    histogram and rates decay exponentially with ``rate_half_life``. Only
+    the most recent execution times and errors are kept verbatim.
+    """
 
     skill_id: str
     total_executions: int = 0
@@ -104,14 +397,160 @@ class SkillUsageStats:
     max_execution_time: float = 0.0
     error_rate: float = 0.0
     last_executed: Optional[datetime] = None
-    execution_history: List[float] = field(default_factory=list)
-    user_feedback: List[Dict[str, Any]] = field(default_factory=list)
+    execution_history: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=RECENT_EXECUTIONS)
+    )
+    user_feedback: Deque[Dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=RECENT_FEEDBACK)
+    )
+    rate_half_life: float = RATE_HALF_LIFE
+
+    # Streaming aggregates
+    _m2: float = field(default=0.0, init=False, repr=False)
+    _execution_times: Optional[Histogram] = field(default=None, init=False, repr=False)
+    _decayed_executions: float = field(default=0.0, init=False, repr=False)
+    _decayed_failures: float = field(default=0.0, init=False, repr=False)
+    _decayed_at: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        if not isinstance(self.execution_history, deque) or self.execution_history.maxlen is None:
+            self.execution_history = deque(self.execution_history, maxlen=RECENT_EXECUTIONS)
+        if not isinstance(self.user_feedback, deque) or self.user_feedback.maxlen is None:
+            self.user_feedback = deque(self.user_feedback, maxlen=RECENT_FEEDBACK)
+        if self.total_executions and not self.error_rate:
+            self.error_rate = (self.failed_executions / self.total_executions) * 100
+
+    def record(
+        self,
+        execution_time: float,
+        success: bool,
+        error_message: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ):
+        """Record an execution in constant time.
+
+        Args:
+            execution_time: Execution time in seconds
+            success: Whether execution was successful
+            error_message: Error message if failed
+            timestamp: Execution time as a Unix timestamp (defaults to now)
+        """
+        now = time.time() if timestamp is None else timestamp
+        self._decay(now)
+        self._decayed_executions += 1.0
+
+        self.total_executions += 1
+        if success:
+            self.successful_executions += 1
+        else:
+            self.failed_executions += 1
+            self._decayed_failures += 1.0
+            if error_message:
+                self.user_feedback.append({
+                    "type": "error",
+                    "message": error_message,
+                    "timestamp": datetime.fromtimestamp(now).isoformat(),
+                })
+
+        # Welford's online mean and variance
+        count = self.total_executions
+        delta = execution_time - self.average_execution_time
+        self.average_execution_time += delta / count
+        self._m2 += delta * (execution_time - self.average_execution_time)
+
+        if count == 1 or execution_time < self.min_execution_time:
+            self.min_execution_time = execution_time
+        if count == 1 or execution_time > self.max_execution_time:
+            self.max_execution_time = execution_time
+
+        if self._execution_times is None:
+            self._execution_times = Histogram()
+        self._execution_times.record(execution_time)
+        self.execution_history.append(execution_time)
+
+        self.error_rate = (self.failed_executions / count) * 100
+        self.last_executed = datetime.fromtimestamp(now)
+
+    @property
+    def execution_time_variance(self) -> float:
+        """Sample variance of the execution times."""
+        if self.total_executions < 2:
+            return 0.0
+        return self._m2 / (self.total_executions - 1)
+
+    @property
+    def execution_time_stddev(self) -> float:
+        """Sample standard deviation of the execution times."""
+        return math.sqrt(self.execution_time_variance)
+
+    def get_percentiles(
+        self,
+        percentiles: Sequence[float] = EXECUTION_TIME_PERCENTILES,
+    ) -> Dict[str, float]:
+        """Estimate execution time percentiles.
+
+        Args:
+            percentiles: Percentiles to calculate (0-100)
+
+        Returns:
+            Dictionary of pNN keys to execution times
+        """
+        values = (
+            self._execution_times.percentiles(percentiles)
+            if self._execution_times is not None
+            else [0.0] * len(percentiles)
+        )
+        return {f"p{p:g}": v for p, v in zip(percentiles, values)}
+
+    def get_execution_rate(self, now: Optional[float] = None) -> float:
+        """Get the time-decayed execution rate.
+
+        Args:
+            now: Current Unix timestamp (defaults to now)
+
+        Returns:
+            Executions per minute
+        """
+        self._decay(time.time() if now is None else now)
+        return self._decayed_executions * math.log(2) / self.rate_half_life * 60
+
+    def get_recent_error_rate(self, now: Optional[float] = None) -> float:
+        """Get the error rate weighted towards recent executions.
+
+        Args:
+            now: Current Unix timestamp (defaults to now)
+
+        Returns:
+            Error rate in percent
+        """
+        self._decay(time.time() if now is None else now)
+        if not self._decayed_executions:
+            return 0.0
+        return (self._decayed_failures / self._decayed_executions) * 100
+
+    def _decay(self, now: float):
+        elapsed = now - self._decayed_at
+        if elapsed > 0:
+            factor = 0.5 ** (elapsed / self.rate_half_life)
+            self._decayed_executions *= factor
+            self._decayed_failures *= factor
+            self._decayed_at = now
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        data = asdict(self)
+        data = {
+            f.name: getattr(self, f.name)
+            for f in dataclasses.fields(self)
+            if not f.name.startswith("_")
+        }
+        data["execution_history"] = list(self.execution_history)
+        data["user_feedback"] = list(self.user_feedback)
         if self.last_executed:
             data["last_executed"] = self.last_executed.isoformat()
+        data["execution_time_stddev"] = self.execution_time_stddev
+        data["execution_time_percentiles"] = self.get_percentiles()
+        data["execution_rate"] = self.get_execution_rate()
+        data["recent_error_rate"] = self.get_recent_error_rate()
         return data
 
 
@@ -129,6 +568,7 @@ class QualityScore:
     maintainability: float
     breakdown: Dict[str, float] = field(default_factory=dict)
     evaluated_at: datetime = field(default_factory=datetime.now)
+    fingerprint: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -137,59 +577,570 @@ class QualityScore:
         return data
 
 
-@dataclass
+# Version of each quality analyzer. Bump a version when the rules of its
+# analyzer change so that memoized components are recomputed.
+ANALYZER_VERSIONS: Dict[str, int] = {
+    "code_quality": 1,
+    "documentation": 1,
+    "test_coverage": 1,
+    "performance": 1,
+    "security": 1,
+    "maintainability": 1,
+}
+
+# Skill fields read by each content analyzer. A component is only re-run
+# when one of its fields changes; performance depends on usage statistics
+# and is cheap enough to evaluate every time.
+ANALYZER_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "code_quality": ("name", "description", "author", "dependencies", "content"),
+    "documentation": ("description", "readme", "examples"),
+    "test_coverage": ("test_config", "test_files", "content"),
+    "security": ("content", "dependencies"),
+    "maintainability": ("content", "description"),
+}
+
+_SKILL_FIELDS = tuple(sorted({name for inputs in ANALYZER_INPUTS.values() for name in inputs}))
+
+# Weight of each component in the overall score
+_SCORE_WEIGHTS: Dict[str, float] = {
+    "code_quality": 0.25,
+    "documentation": 0.15,
+    "test_coverage": 0.15,
+    "performance": 0.20,
+    "security": 0.15,
+    "maintainability": 0.10,
+}
+
+
+def _get_skill_fields(skill: Any) -> Dict[str, Any]:
+    """Collect the analyzer inputs present on skill data."""
+    return {name: getattr(skill, name) for name in _SKILL_FIELDS if hasattr(skill, name)}
+
+
+def _digest_value(value: Any) -> str:
+    """Hash one field value."""
+    if isinstance(value, str):
+        data = value.encode("utf-8")
+    elif isinstance(value, bytes):
+        data = value
+    else:
+        data = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _get_input_keys(skill: Any, fields: Dict[str, Any]) -> Dict[str, str]:
+    """Compute the memoization key of each content analyzer.
+
+    A key covers the analyzer version and the hash of every field the
+    analyzer reads. The content is hashed once for all analyzers, or taken
+    from the skill's ``content_hash`` when it has one.
+
+    Args:
+        skill: Skill data
+        fields: Analyzer inputs of the skill
+
+    Returns:
+        Key per analyzer name
+    """
+    digests = {}
+    for name, value in fields.items():
+        content_hash = getattr(skill, "content_hash", None) if name == "content" else None
+        digests[name] = content_hash if isinstance(content_hash, str) else _digest_value(value)
+
+    keys = {}
+    for analyzer, inputs in ANALYZER_INPUTS.items():
+        digest = hashlib.sha256(f"{analyzer}:{ANALYZER_VERSIONS[analyzer]}".encode("utf-8"))
+        for name in inputs:
+            digest.update(f"|{name}={digests.get(name, '-')}".encode("utf-8"))
+        keys[analyzer] = digest.hexdigest()
+    return keys
+
+
+def _score_code_quality(fields: Dict[str, Any]) -> float:
+    """Score code quality (0-100)."""
+    score = 50.0  # Base score
+
+    # Check for required fields
+    if fields.get("name"):
+        score += 10
+
+    if fields.get("description"):
+        score += 10
+
+    if fields.get("author"):
+        score += 5
+
+    if "dependencies" in fields:
+        score += 5
+
+    # Check content quality (simplified)
+    content = fields.get("content") or ""
+    if content:
+        # Simple heuristics
+        lines = content.split("\n")
+        non_empty_lines = [l for l in lines if l.strip()]
+
+        # Code structure
+        if len(non_empty_lines) > 10:
+            score += 5
+
+        # Comments
+        if any(l.strip().startswith("#") for l in lines):
+            score += 5
+
+        # Error handling
+        if "try:" in content or "except" in content:
+            score += 5
+
+    return min(100.0, score)
+
+
+def _score_documentation(fields: Dict[str, Any]) -> float:
+    """Score documentation quality (0-100)."""
+    score = 0.0
+
+    # Check description
+    description = fields.get("description")
+    if description:
+        score += 30
+        if len(description) > 100:
+            score += 10
+
+    # Check README
+    readme = fields.get("readme")
+    if readme:
+        score += 40
+        if len(readme) > 500:
+            score += 10
+
+    # Check examples
+    if fields.get("examples"):
+        score += 10
+
+    return min(100.0, score)
+
+
+def _score_test_coverage(fields: Dict[str, Any]) -> float:
+    """Score test coverage (0-100)."""
+    # This is a simplified analysis
+    # In a real system, you would parse actual test files
+
+    score = 0.0
+
+    # Check for test-related fields
+    if fields.get("test_config"):
+        score += 50
+
+    if fields.get("test_files"):
+        score += 30
+
+    # Check for testing keywords in content
+    content = (fields.get("content") or "").lower()
+    if "test" in content or "pytest" in content:
+        score += 20
+
+    return min(100.0, score)
+
+
+def _score_performance(stats: Optional["SkillUsageStats"]) -> float:
+    """Score performance from usage statistics (0-100)."""
+    if not stats or stats.total_executions == 0:
+        return 50.0  # Default score
+
+    score = 100.0
+
+    # Execution time penalty
+    if stats.average_execution_time > 5.0:
+        score -= 20
+    elif stats.average_execution_time > 2.0:
+        score -= 10
+
+    # Error rate penalty
+    if stats.error_rate > 10:
+        score -= 30
+    elif stats.error_rate > 5:
+        score -= 15
+    elif stats.error_rate > 1:
+        score -= 5
+
+    return max(0.0, score)
+
+
+def _score_security(fields: Dict[str, Any]) -> float:
+    """Score security aspects (0-100)."""
+    score = 70.0  # Base score
+
+    content = fields.get("content") or ""
+
+    # Check for security issues
+    security_keywords = ["eval(", "exec(", "subprocess", "os.system"]
+    for keyword in security_keywords:
+        if keyword in content:
+            score -= 20
+
+    # Check dependencies for security
+    dependencies = fields.get("dependencies")
+    if dependencies:
+        # Check for known vulnerable packages (simplified)
+        vulnerable_packages = ["django<3.0", "flask<2.0"]
+        for dep in dependencies:
+            if any(vuln in str(dep) for vuln in vulnerable_packages):
+                score -= 15
+
+    return max(0.0, min(100.0, score))
+
+
+def _score_maintainability(fields: Dict[str, Any]) -> float:
+    """Score maintainability (0-100)."""
+    score = 60.0  # Base score
+
+    content = fields.get("content") or ""
+    if not content:
+        return score
+
+    # Code complexity (simplified)
+    non_empty_lines = [l for l in content.split("\n") if l.strip()]
+
+    if len(non_empty_lines) > 100:
+        score -= 10
+    elif len(non_empty_lines) > 50:
+        score -= 5
+
+    # Function/class count
+    func_count = content.count("def ")
+    if func_count > 20:
+        score -= 10
+    elif func_count > 10:
+        score -= 5
+
+    # Documentation
+    if fields.get("description"):
+        score += 10
+
+    return max(0.0, min(100.0, score))
+
+
+_ANALYZERS: Dict[str, Callable[[Dict[str, Any]], float]] = {
+    "code_quality": _score_code_quality,
+    "documentation": _score_documentation,
+    "test_coverage": _score_test_coverage,
+    "security": _score_security,
+    "maintainability": _score_maintainability,
+}
+
+
+def _run_analyzers(fields: Dict[str, Any], analyzers: List[str]) -> Dict[str, float]:
+    """Run content analyzers on the inputs of one skill."""
+    return {name: _ANALYZERS[name](fields) for name in analyzers}
+
+
+def _run_analyzer_batch(
+    work: List[Tuple[Dict[str, Any], List[str]]],
+) -> List[Tuple[Optional[Dict[str, float]], Optional[str]]]:
+    """Run content analyzers for several skills in a worker process.
+
+    Returns:
+        (scores, None) or (None, error message) per skill
+    """
+    results = []
+    for fields, analyzers in work:
+        try:
+            results.append((_run_analyzers(fields, analyzers), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+def _dependency_name(dependency: Any) -> str:
+    """Get the node name of a dependency entry."""
+    if isinstance(dependency, str):
+        return dependency
+    if isinstance(dependency, dict):
+        return dependency.get("name", str(dependency))
+    return str(dependency)
+
+
 class DependencyGraph:
-    """Represents a dependency graph."""
+    """Skill dependency graph stored as adjacency sets.
+
+    Node names are mapped to dense integer IDs with forward and reverse
+    adjacency sets per node, so neighbour lookups and edge updates cost
+    O(degree). Cycles are the strongly connected components found by
+    Tarjan's algorithm. Transitive dependencies and dependents are cached
+    per node; an edge change only drops the cached entries it can affect.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._out: List[Set[int]] = []
+        self._in: List[Set[int]] = []
+        self._edge_count = 0
+        # Cached reachability: node ID -> IDs reachable along forward/reverse edges
+        self._reach: Dict[int, FrozenSet[int]] = {}
+        self._reverse_reach: Dict[int, FrozenSet[int]] = {}
+        self._cycles: Optional[List[List[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        """All (source, target) edges."""
+        names = self._names
+        return [
+            (names[source], names[target])
+            for source, targets in enumerate(self._out)
+            for target in targets
+        ]
 
-    nodes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    edges: List[Tuple[str, str]] = field(default_factory=list)  # (source, target)
-    cycles: List[List[str]] = field(default_factory=list)
+    @property
+    def edge_count(self) -> int:
+        """Number of edges."""
+        return self._edge_count
+
+    @property
+    def cycles(self) -> List[List[str]]:
+        """Dependency cycles, recomputed after the graph changes."""
+        if self._cycles is None:
+            self.detect_cycles()
+        return self._cycles
 
     def add_node(self, node_id: str, **kwargs):
         """Add a node to the graph."""
         self.nodes[node_id] = kwargs
+        self._intern(node_id)
+
+    def remove_node(self, node_id: str):
+        """Remove a node's attributes and outgoing edges.
+
+        Edges pointing at the node are kept, as dependents still name it.
+
+        Args:
+            node_id: Node to remove
+        """
+        self.nodes.pop(node_id, None)
+        if node_id in self._ids:
+            self.set_dependencies(node_id, ())
 
     def add_edge(self, source: str, target: str):
         """Add an edge to the graph."""
-        self.edges.append((source, target))
+        s, t = self._intern(source), self._intern(target)
+        if t not in self._out[s]:
+            self._out[s].add(t)
+            self._in[t].add(s)
+            self._edge_count += 1
+            self._invalidate(s, t)
+
+    def remove_edge(self, source: str, target: str):
+        """Remove an edge from the graph if present."""
+        s, t = self._ids.get(source), self._ids.get(target)
+        if s is not None and t is not None and t in self._out[s]:
+            self._out[s].discard(t)
+            self._in[t].discard(s)
+            self._edge_count -= 1
+            self._invalidate(s, t)
+
+    def set_dependencies(self, node_id: str, dependencies: Iterable[str]):
+        """Replace the outgoing edges of a node.
+
+        Only edges that actually change are touched.
+
+        Args:
+            node_id: Node whose dependencies changed
+            dependencies: New dependency names
+        """
+        s = self._intern(node_id)
+        new = {self._intern(name) for name in dependencies}
+        old = self._out[s]
+        for t in old - new:
+            self.remove_edge(node_id, self._names[t])
+        for t in new - old:
+            self.add_edge(node_id, self._names[t])
+
+    def get_dependencies(self, node_id: str) -> Set[str]:
+        """Get the direct dependencies of a node."""
+        return self._to_names(self._out[self._ids[node_id]] if node_id in self._ids else ())
+
+    def get_dependents(self, node_id: str) -> Set[str]:
+        """Get the nodes that depend directly on a node."""
+        return self._to_names(self._in[self._ids[node_id]] if node_id in self._ids else ())
 
-    def detect_cycles(self):
-        """Detect cycles in the dependency graph."""
-        visited = set()
-        rec_stack = set()
-        cycles = []
+    def get_transitive_dependencies(self, node_id: str) -> Set[str]:
+        """Get every node a node depends on, directly or not.
 
-        def dfs(node, path):
-            if node in rec_stack:
-                # Found cycle
-                cycle_start = path.index(node)
-                cycles.append(path[cycle_start:] + [node])
-                return
+        Args:
+            node_id: Node name
+
+        Returns:
+            Names of reachable nodes, excluding the node itself
+        """
+        return self._reachable(node_id, self._out, self._reach)
+
+    def get_transitive_dependents(self, node_id: str) -> Set[str]:
+        """Get every node affected by a change to a node.
 
-            if node in visited:
-                return
+        Args:
+            node_id: Node name
 
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
+        Returns:
+            Names of nodes depending on it, excluding the node itself
+        """
+        return self._reachable(node_id, self._in, self._reverse_reach)
 
-            # Visit all neighbors
-            for neighbor in self._get_neighbors(node):
-                dfs(neighbor, path)
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Find strongly connected components with Tarjan's algorithm.
 
-            rec_stack.remove(node)
-            path.pop()
+        The traversal is iterative, so deep dependency chains do not hit
+        the recursion limit.
 
-        for node in self.nodes:
-            if node not in visited:
-                dfs(node, [])
+        Returns:
+            Components in reverse topological order
+        """
+        count = len(self._names)
+        index = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(self._out[root]))]
+
+            while work:
+                node, successors = work[-1]
+                for successor in successors:
+                    if index[successor] == -1:
+                        index[successor] = low[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = True
+                        work.append((successor, iter(self._out[successor])))
+                        break
+                    if on_stack[successor] and index[successor] < low[node]:
+                        low[node] = index[successor]
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low[node] < low[parent]:
+                            low[parent] = low[node]
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+
+        names = self._names
+        return [[names[i] for i in component] for component in components]
+
+    def detect_cycles(self) -> List[List[str]]:
+        """Detect cycles in the dependency graph.
 
-        self.cycles = cycles
-        return cycles
+        Returns:
+            One entry per strongly connected component that contains a
+            cycle, listing its members
+        """
+        self._cycles = [
+            component
+            for component in self.strongly_connected_components()
+            if len(component) > 1 or self._ids[component[0]] in self._out[self._ids[component[0]]]
+        ]
+        return self._cycles
 
     def _get_neighbors(self, node: str) -> List[str]:
         """Get neighbors of a node."""
-        return [target for source, target in self.edges if source == node]
+        return list(self.get_dependencies(node))
+
+    def _intern(self, name: str) -> int:
+        node = self._ids.get(name)
+        if node is None:
+            node = self._ids[name] = len(self._names)
+            self._names.append(name)
+            self._out.append(set())
+            self._in.append(set())
+        return node
+
+    def _to_names(self, ids: Iterable[int]) -> Set[str]:
+        names = self._names
+        return {names[i] for i in ids}
+
+    def _reachable(
+        self,
+        node_id: str,
+        adjacency: List[Set[int]],
+        cache: Dict[int, FrozenSet[int]],
+    ) -> Set[str]:
+        start = self._ids.get(node_id)
+        if start is None:
+            return set()
+
+        reached = cache.get(start)
+        if reached is None:
+            seen: Set[int] = set()
+            pending = [start]
+            while pending:
+                for successor in adjacency[pending.pop()]:
+                    if successor in seen:
+                        continue
+                    seen.add(successor)
+                    # A cached node's reach is closed under reachability
+                    cached = cache.get(successor)
+                    if cached is not None:
+                        seen |= cached
+                    else:
+                        pending.append(successor)
+            reached = cache[start] = frozenset(seen)
+
+        result = self._to_names(reached)
+        result.discard(node_id)
+        return result
+
+    def _invalidate(self, source: int, target: int):
+        """Drop cached reach affected by a change to the edge source -> target."""
+        self._cycles = None
+        # Forward reach changes for the source and everything reaching it
+        if self._reach:
+            for node in self._walk(source, self._in):
+                self._reach.pop(node, None)
+        # Reverse reach changes for the target and everything it reaches
+        if self._reverse_reach:
+            for node in self._walk(target, self._out):
+                self._reverse_reach.pop(node, None)
+
+    @staticmethod
+    def _walk(start: int, adjacency: List[Set[int]]) -> Set[int]:
+        seen = {start}
+        pending = [start]
+        while pending:
+            for successor in adjacency[pending.pop()]:
+                if successor not in seen:
+                    seen.add(successor)
+                    pending.append(successor)
+        return seen
+
+
+class _DependencyGraphHandler(EventHandler):
+    """Forwards skill changes to the dependency graph of an analytics manager."""
+
+    def __init__(self, analytics: "SkillAnalytics"):
+        self.analytics = analytics
+
+    async def handle(self, event: SkillEvent) -> None:
+        await self.analytics._handle_skill_change(event)
 
 
 class SkillAnalytics:
@@ -199,27 +1150,56 @@ class SkillAnalytics:
         self,
         skill_manager: SkillManager,
         event_manager: SkillEventManager,
+        max_workers: Optional[int] = None,
+        max_cached_scores: int = 10000,
+        max_pending_dispatches: int = 10000,
     ):
         """Initialize analytics manager.
 
         Args:
             skill_manager: Skill manager instance
             event_manager: Event manager instance
+            max_workers: Processes used for batch scoring (defaults to CPU count)
+            max_cached_scores: Skills whose scores and components are kept in memory
+            max_pending_dispatches: Executions whose metrics and event may await dispatch
         """
         self.skill_manager = skill_manager
         self.event_manager = event_manager
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_cached_scores = max_cached_scores
+        self.max_pending_dispatches = max_pending_dispatches
 
         # Metrics storage
-        self.metrics: Dict[str, List[Metric]] = defaultdict(list)
+        self.metrics: Dict[str, MetricSeries] = MetricStore()
         self.skill_stats: Dict[str, SkillUsageStats] = {}
-        self.quality_scores: Dict[str, QualityScore] = {}
+        self.quality_scores: "OrderedDict[str, QualityScore]" = OrderedDict()
+
+        # Memoized score components: skill ID -> analyzer -> (input key, score)
+        self._score_components: "OrderedDict[str, Dict[str, Tuple[str, float]]]" = OrderedDict()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        self._stats = {
+            "skills_scored": 0,
+            "analyzers_run": 0,
+            "analyzers_reused": 0,
+            "dispatches_sent": 0,
+            "dispatches_dropped": 0,
+        }
 
         # Analytics cache
         self._cache: Dict[str, Any] = {}
         self._cache_timestamps: Dict[str, datetime] = {}
 
-        # Lock for concurrent access
-        self._lock = asyncio.Lock()
+        # Dependency graph of all skills, kept current from skill events
+        self.dependency_graph: Optional[DependencyGraph] = None
+        self._dependency_handler = _DependencyGraphHandler(self)
+        for event_type in (EventType.SKILL_CREATED, EventType.SKILL_UPDATED, EventType.SKILL_DELETED):
+            event_manager.register_handler(event_type, self._dependency_handler)
+
+        # Background dispatch of execution metrics and events
+        self._dispatch_queue: Optional[asyncio.Queue] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
 
     async def track_execution(
         self,
@@ -231,6 +1211,10 @@ class SkillAnalytics:
     ):
         """Track skill execution.
 
+        Statistics are updated in constant time without waiting on anything;
+        the execution metrics and event are handed to a background
+        dispatcher. Use flush() to wait for them.
+
         Args:
             skill_id: Skill identifier
             execution_time: Execution time in seconds
@@ -238,71 +1222,90 @@ class SkillAnalytics:
             error_message: Error message if failed
             metadata: Additional metadata
         """
-        async with self._lock:
-            # Initialize stats if not exists
-            if skill_id not in self.skill_stats:
-                self.skill_stats[skill_id] = SkillUsageStats(skill_id=skill_id)
+        stats = self.skill_stats.get(skill_id)
+        if stats is None:
+            stats = self.skill_stats[skill_id] = SkillUsageStats(skill_id=skill_id)
 
-            stats = self.skill_stats[skill_id]
+        stats.record(execution_time, success, error_message)
 
-            # Update stats
-            stats.total_executions += 1
-            stats.execution_history.append(execution_time)
+        self._dispatch_execution(
+            (skill_id, execution_time, success, error_message, metadata)
+        )
 
-            if success:
-                stats.successful_executions += 1
-            else:
-                stats.failed_executions += 1
-                if error_message:
-                    stats.user_feedback.append({
-                        "type": "error",
-                        "message": error_message,
-                        "timestamp": datetime.now().isoformat(),
-                    })
-
-            # Update timing stats
-            if len(stats.execution_history) > 0:
-                stats.average_execution_time = statistics.mean(stats.execution_history)
-                stats.min_execution_time = min(stats.execution_history)
-                stats.max_execution_time = max(stats.execution_history)
-
-            # Calculate error rate
-            if stats.total_executions > 0:
-                stats.error_rate = (stats.failed_executions / stats.total_executions) * 100
-
-            stats.last_executed = datetime.now()
-
-            # Record metric
-            await self.record_metric(
-                name="skill.execution.time",
-                value=execution_time,
-                metric_type=MetricType.TIMER,
-                tags={
-                    "skill_id": skill_id,
-                    "status": "success" if success else "failure",
-                },
-                metadata=metadata,
-            )
+    async def flush(self):
+        """Wait until every tracked execution has been dispatched."""
+        if self._dispatch_queue is not None:
+            await self._dispatch_queue.join()
 
-            # Record success/failure metrics
-            await self.record_metric(
-                name="skill.execution.count",
-                value=1,
-                metric_type=MetricType.COUNTER,
-                tags={
-                    "skill_id": skill_id,
-                    "result": "success" if success else "failure",
-                },
-            )
+    def _dispatch_execution(self, execution: Tuple[Any, ...]):
+        """Queue the metrics and event of an execution.
 
-            # Publish event
-            await self.event_manager.publish_event(
-                EventType.SKILL_EXECUTED,
-                skill_id=skill_id,
-                execution_time=execution_time,
-                success=success,
-                error_message=error_message,
-            )
+        When the queue is full the execution is dropped rather than slowing
+        down the caller.
+
+        Args:
+            execution: (skill ID, execution time, success, error message, metadata)
+        """
+        if self._dispatch_queue is None:
+            self._dispatch_queue = asyncio.Queue(maxsize=self.max_pending_dispatches)
+
+        try:
+            self._dispatch_queue.put_nowait(execution)
+        except asyncio.QueueFull:
+            self._stats["dispatches_dropped"] += 1
+            return
+
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch_worker())
+
+    async def _dispatch_worker(self):
+        """Drain queued executions, exiting once the queue is empty."""
+        queue = self._dispatch_queue
+        while not queue.empty():
+            execution = queue.get_nowait()
+            try:
+                await self._publish_execution(*execution)
+                self._stats["dispatches_sent"] += 1
+            except Exception as e:
+                logger.error(f"Error dispatching execution of {execution[0]}: {str(e)}")
+            finally:
+                queue.task_done()
+
+    async def _publish_execution(
+        self,
+        skill_id: str,
+        execution_time: float,
+        success: bool,
+        error_message: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ):
+        """Record the metrics and publish the event of an execution."""
+        status = "success" if success else "failure"
+
+        await self.record_metric(
+            name="skill.execution.time",
+            value=execution_time,
+            metric_type=MetricType.TIMER,
+            tags={"skill_id": skill_id, "status": status},
+            metadata=metadata,
+        )
+        await self.record_metric(
+            name="skill.execution.count",
+            value=1,
+            metric_type=MetricType.COUNTER,
+            tags={"skill_id": skill_id, "result": status},
+        )
+
+        await self.event_manager.publish_event(
+            EventType.SKILL_EXECUTED,
+            skill_id=skill_id,
+            data={
+                "execution_time": execution_time,
+                "success": success,
+                "error_message": error_message,
+            },
+            source="analytics",
+        )
 
     async def record_metric(
         self,
@@ -331,13 +1334,6 @@ class SkillAnalytics:
 
         self.metrics[name].append(metric)
 
-        # Keep only recent metrics (last 30 days)
-        cutoff_time = datetime.now() - timedelta(days=30)
-        self.metrics[name] = [
-            m for m in self.metrics[name]
-            if m.timestamp > cutoff_time
-        ]
-
     async def calculate_quality_score(
         self,
         skill_id: str,
@@ -356,158 +1352,251 @@ class SkillAnalytics:
             if not skill:
                 return None
 
-            # Get usage stats
-            stats = self.skill_stats.get(skill_id)
-
-            # Calculate component scores
-            code_quality = await self._analyze_code_quality(skill)
-            documentation_score = await self._analyze_documentation(skill)
-            test_coverage = await self._analyze_test_coverage(skill)
-            performance_score = await self._analyze_performance(stats)
-            security_score = await self._analyze_security(skill)
-            maintainability = await self._analyze_maintainability(skill)
-
-            # Calculate overall score (weighted average)
-            overall_score = (
-                code_quality * 0.25 +
-                documentation_score * 0.15 +
-                test_coverage * 0.15 +
-                performance_score * 0.20 +
-                security_score * 0.15 +
-                maintainability * 0.10
-            )
-
-            # Create quality score
-            quality = QualityScore(
-                skill_id=skill_id,
-                overall_score=overall_score,
-                code_quality=code_quality,
-                documentation_score=documentation_score,
-                test_coverage=test_coverage,
-                performance_score=performance_score,
-                security_score=security_score,
-                maintainability=maintainability,
-                breakdown={
-                    "code_quality": code_quality,
-                    "documentation": documentation_score,
-                    "test_coverage": test_coverage,
-                    "performance": performance_score,
-                    "security": security_score,
-                    "maintainability": maintainability,
-                },
-            )
-
-            # Cache score
-            self.quality_scores[skill_id] = quality
-
-            return quality
+            return await self.score_skill(skill)
 
         except Exception as e:
             logger.error(f"Error calculating quality score: {e}")
             return None
 
-    async def _analyze_code_quality(self, skill: Any) -> float:
-        """Analyze code quality.
+    async def score_skill(self, skill: Any) -> QualityScore:
+        """Calculate the quality score of already loaded skill data.
+
+        Components are memoized per skill by a hash of their inputs and the
+        analyzer version, so only analyzers whose inputs changed are re-run.
 
         Args:
-            skill: Skill data
+            skill: Skill data with an ``id`` attribute
 
         Returns:
-            Quality score (0-100)
+            QualityScore instance
         """
-        score = 50.0  # Base score
+        skill_id = str(skill.id)
+        fields = _get_skill_fields(skill)
+        keys = _get_input_keys(skill, fields)
 
-        # Check for required fields
-        if hasattr(skill, "name") and skill.name:
-            score += 10
+        components, stale = self._get_memoized_components(skill_id, keys)
+        if stale:
+            components.update(_run_analyzers(fields, stale))
 
-        if hasattr(skill, "description") and skill.description:
-            score += 10
+        return self._finish_quality_score(skill_id, keys, components)
 
-        if hasattr(skill, "author") and skill.author:
-            score += 5
+    async def score_skills(
+        self,
+        skills: List[Any],
+        use_processes: bool = True,
+    ) -> List[Optional[QualityScore]]:
+        """Calculate quality scores for a batch of skills.
 
-        if hasattr(skill, "dependencies"):
-            score += 5
+        Memoized components are reused; the remaining analyzers run in a
+        process pool, split into one slice of skills per worker. Callers
+        that run in daemonic processes, such as Celery prefork workers,
+        cannot start a pool and pass ``use_processes=False``.
 
-        # Check content quality (simplified)
-        content = getattr(skill, "content", "")
-        if content:
-            # Simple heuristics
-            lines = content.split("\n")
-            non_empty_lines = [l for l in lines if l.strip()]
+        Args:
+            skills: Skill data with ``id`` attributes
+            use_processes: Whether to run analyzers in the process pool
 
-            # Code structure
-            if len(non_empty_lines) > 10:
-                score += 5
+        Returns:
+            QualityScore per skill, or None where scoring failed
+        """
+        prepared = []
+        work = []
+        for skill in skills:
+            skill_id = str(skill.id)
+            fields = _get_skill_fields(skill)
+            keys = _get_input_keys(skill, fields)
+            components, stale = self._get_memoized_components(skill_id, keys)
+            if stale:
+                work.append((len(prepared), fields, stale))
+            prepared.append((skill_id, keys, components))
+
+        if use_processes and len(work) > 1:
+            results = await self._run_analyzers_in_pool([(fields, stale) for _, fields, stale in work])
+        else:
+            results = _run_analyzer_batch([(fields, stale) for _, fields, stale in work])
 
-            # Comments
-            comment_lines = [l for l in lines if l.strip().startswith("#")]
-            if len(comment_lines) > 0:
-                score += 5
+        failed = set()
+        for (index, _, _), (scores, error) in zip(work, results):
+            if error is not None:
+                logger.error(f"Error calculating quality score for {prepared[index][0]}: {error}")
+                failed.add(index)
+            else:
+                prepared[index][2].update(scores)
 
-            # Error handling
-            if "try:" in content or "except" in content:
-                score += 5
+        return [
+            None if index in failed else self._finish_quality_score(*item)
+            for index, item in enumerate(prepared)
+        ]
 
-        return min(100.0, score)
+    def get_quality_fingerprint(self, skill: Any) -> str:
+        """Get the fingerprint of the inputs of a skill's quality score.
 
-    async def _analyze_documentation(self, skill: Any) -> float:
-        """Analyze documentation quality.
+        The fingerprint changes exactly when scoring the skill again could
+        give a different result, so callers that store it can skip skills
+        whose fingerprint is unchanged without running any analyzer.
 
         Args:
-            skill: Skill data
+            skill: Skill data with an ``id`` attribute
 
         Returns:
-            Documentation score (0-100)
+            Hex digest
         """
-        score = 0.0
+        keys = _get_input_keys(skill, _get_skill_fields(skill))
+        performance = _score_performance(self.skill_stats.get(str(skill.id)))
+        return self._get_fingerprint(keys, performance)
 
-        # Check description
-        if hasattr(skill, "description") and skill.description:
-            score += 30
-            if len(skill.description) > 100:
-                score += 10
+    def get_scoring_stats(self) -> Dict[str, Any]:
+        """Get quality scoring statistics.
 
-        # Check README
-        if hasattr(skill, "readme") and skill.readme:
-            score += 40
-            if len(skill.readme) > 500:
-                score += 10
+        Returns:
+            Dictionary of counters and cache sizes
+        """
+        return {
+            **self._stats,
+            "cached_scores": len(self.quality_scores),
+            "cached_components": len(self._score_components),
+        }
 
-        # Check examples
-        if hasattr(skill, "examples") and skill.examples:
-            score += 10
+    def shutdown(self):
+        """Shut down the batch scoring process pool."""
+        with self._pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=True, cancel_futures=True)
+                self._process_pool = None
 
-        return min(100.0, score)
+    def _get_memoized_components(
+        self,
+        skill_id: str,
+        keys: Dict[str, str],
+    ) -> Tuple[Dict[str, float], List[str]]:
+        """Split analyzers into memoized components and stale ones.
 
-    async def _analyze_test_coverage(self, skill: Any) -> float:
-        """Analyze test coverage.
+        Args:
+            skill_id: Skill identifier
+            keys: Current input key per analyzer
+
+        Returns:
+            Tuple of (memoized scores, names of analyzers to re-run)
+        """
+        memo = self._score_components.get(skill_id, {})
+        components = {}
+        stale = []
+        for analyzer, key in keys.items():
+            cached = memo.get(analyzer)
+            if cached is not None and cached[0] == key:
+                components[analyzer] = cached[1]
+            else:
+                stale.append(analyzer)
+
+        self._stats["analyzers_reused"] += len(components)
+        self._stats["analyzers_run"] += len(stale)
+        return components, stale
+
+    def _finish_quality_score(
+        self,
+        skill_id: str,
+        keys: Dict[str, str],
+        components: Dict[str, float],
+    ) -> QualityScore:
+        """Memoize content components and combine them with performance."""
+        self._remember(self._score_components, skill_id, {
+            analyzer: (key, components[analyzer]) for analyzer, key in keys.items()
+        })
+
+        # Get usage stats
+        performance = _score_performance(self.skill_stats.get(skill_id))
+        breakdown = {**components, "performance": performance}
+        overall_score = sum(breakdown[name] * weight for name, weight in _SCORE_WEIGHTS.items())
+
+        quality = QualityScore(
+            skill_id=skill_id,
+            overall_score=overall_score,
+            code_quality=breakdown["code_quality"],
+            documentation_score=breakdown["documentation"],
+            test_coverage=breakdown["test_coverage"],
+            performance_score=performance,
+            security_score=breakdown["security"],
+            maintainability=breakdown["maintainability"],
+            breakdown={name: breakdown[name] for name in _SCORE_WEIGHTS},
+            fingerprint=self._get_fingerprint(keys, performance),
+        )
+
+        # Cache score
+        self._remember(self.quality_scores, skill_id, quality)
+        self._stats["skills_scored"] += 1
+
+        return quality
+
+    @staticmethod
+    def _get_fingerprint(keys: Dict[str, str], performance: float) -> str:
+        """Combine the analyzer input keys and the performance score."""
+        digest = hashlib.sha256(f"performance:{ANALYZER_VERSIONS['performance']}={performance}".encode("utf-8"))
+        for analyzer in sorted(keys):
+            digest.update(f"|{analyzer}={keys[analyzer]}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _remember(self, cache: "OrderedDict[str, Any]", skill_id: str, value: Any):
+        """Store a value in an LRU cache bounded by max_cached_scores."""
+        cache[skill_id] = value
+        cache.move_to_end(skill_id)
+        while len(cache) > self.max_cached_scores:
+            cache.popitem(last=False)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool, creating it on first use."""
+        with self._pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._process_pool
+
+    async def _run_analyzers_in_pool(
+        self,
+        work: List[Tuple[Dict[str, Any], List[str]]],
+    ) -> List[Tuple[Optional[Dict[str, float]], Optional[str]]]:
+        """Run analyzers for many skills with one pool task per worker."""
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool()
+        size = -(-len(work) // self.max_workers)
+        slices = [work[i:i + size] for i in range(0, len(work), size)]
+
+        results = await asyncio.gather(*[
+            loop.run_in_executor(pool, _run_analyzer_batch, work_slice)
+            for work_slice in slices
+        ])
+        return [result for batch in results for result in batch]
+
+    async def _analyze_code_quality(self, skill: Any) -> float:
+        """Analyze code quality.
 
         Args:
             skill: Skill data
 
         Returns:
-            Test coverage score (0-100)
+            Quality score (0-100)
         """
-        # This is a simplified analysis
-        # In a real system, you would parse actual test files
+        return _score_code_quality(_get_skill_fields(skill))
 
-        score = 0.0
+    async def _analyze_documentation(self, skill: Any) -> float:
+        """Analyze documentation quality.
 
-        # Check for test-related fields
-        if hasattr(skill, "test_config") and skill.test_config:
-            score += 50
+        Args:
+            skill: Skill data
 
-        if hasattr(skill, "test_files") and skill.test_files:
-            score += 30
+        Returns:
+            Documentation score (0-100)
+        """
+        return _score_documentation(_get_skill_fields(skill))
 
-        # Check for testing keywords in content
-        content = getattr(skill, "content", "")
-        if "test" in content.lower() or "pytest" in content.lower():
-            score += 20
+    async def _analyze_test_coverage(self, skill: Any) -> float:
+        """Analyze test coverage.
+
+        Args:
+            skill: Skill data
 
-        return min(100.0, score)
+        Returns:
+            Test coverage score (0-100)
+        """
+        return _score_test_coverage(_get_skill_fields(skill))
 
     async def _analyze_performance(self, stats: Optional[SkillUsageStats]) -> float:
         """Analyze performance.
@@ -518,26 +1607,7 @@ class SkillAnalytics:
         Returns:
             Performance score (0-100)
         """
-        if not stats or stats.total_executions == 0:
-            return 50.0  # Default score
-
-        score = 100.0
-
-        # Execution time penalty
-        if stats.average_execution_time > 5.0:
-            score -= 20
-        elif stats.average_execution_time > 2.0:
-            score -= 10
-
-        # Error rate penalty
-        if stats.error_rate > 10:
-            score -= 30
-        elif stats.error_rate > 5:
-            score -= 15
-        elif stats.error_rate > 1:
-            score -= 5
-
-        return max(0.0, score)
+        return _score_performance(stats)
 
     async def _analyze_security(self, skill: Any) -> float:
         """Analyze security aspects.
@@ -548,26 +1618,7 @@ class SkillAnalytics:
         Returns:
             Security score (0-100)
         """
-        score = 70.0  # Base score
-
-        content = getattr(skill, "content", "")
-
-        # Check for security issues
-        security_keywords = ["eval(", "exec(", "subprocess", "os.system"]
-        for keyword in security_keywords:
-            if keyword in content:
-                score -= 20
-
-        # Check dependencies for security
-        dependencies = getattr(skill, "dependencies", [])
-        if dependencies:
-            # Check for known vulnerable packages (simplified)
-            vulnerable_packages = ["django<3.0", "flask<2.0"]
-            for dep in dependencies:
-                if any(vuln in str(dep) for vuln in vulnerable_packages):
-                    score -= 15
-
-        return max(0.0, min(100.0, score))
+        return _score_security(_get_skill_fields(skill))
 
     async def _analyze_maintainability(self, skill: Any) -> float:
         """Analyze maintainability.
@@ -578,76 +1629,101 @@ class SkillAnalytics:
         Returns:
             Maintainability score (0-100)
         """
-        score = 60.0  # Base score
-
-        content = getattr(skill, "content", "")
-        if not content:
-            return score
-
-        # Code complexity (simplified)
-        lines = content.split("\n")
-        non_empty_lines = [l for l in lines if l.strip()]
-
-        if len(non_empty_lines) > 100:
-            score -= 10
-        elif len(non_empty_lines) > 50:
-            score -= 5
-
-        # Function/class count
-        if "def " in content:
-            func_count = content.count("def ")
-            if func_count > 20:
-                score -= 10
-            elif func_count > 10:
-                score -= 5
-
-        # Documentation
-        if hasattr(skill, "description") and skill.description:
-            score += 10
-
-        return max(0.0, min(100.0, score))
+        return _score_maintainability(_get_skill_fields(skill))
 
     async def build_dependency_graph(
         self,
         skill_ids: Optional[List[str]] = None,
+        refresh: bool = False,
     ) -> DependencyGraph:
         """Build dependency graph.
 
+        Skills are loaded with one bulk query. The graph of all skills is
+        kept and updated from skill events, so later calls without
+        ``skill_ids`` reuse it until ``refresh`` is set.
+
         Args:
             skill_ids: List of skill IDs to include
+            refresh: Rebuild the graph of all skills from the database
 
         Returns:
             DependencyGraph instance
         """
-        graph = DependencyGraph()
-
-        # Get all skills if not specified
-        if skill_ids is None:
-            search_result = await self.skill_manager.list_skills(page_size=1000)
-            skill_ids = [skill.id for skill in search_result.items]
+        if skill_ids is None and self.dependency_graph is not None and not refresh:
+            return self.dependency_graph
 
-        # Build nodes
-        for skill_id in skill_ids:
-            skill = await self.skill_manager.get_skill(skill_id)
-            if skill:
-                graph.add_node(
-                    skill_id,
-                    name=getattr(skill, "name", skill_id),
-                    version=getattr(skill, "version", "unknown"),
-                    category=getattr(skill, "category", "unknown"),
-                )
-
-                # Add dependencies
-                dependencies = getattr(skill, "dependencies", [])
-                for dep in dependencies:
-                    dep_id = str(dep) if isinstance(dep, str) else dep.get("name", str(dep))
-                    graph.add_edge(skill_id, dep_id)
+        graph = DependencyGraph()
+        rows = await self.skill_manager.get_skill_dependencies(skill_ids)
+
+        for row in rows:
+            graph.add_node(
+                row["id"],
+                name=row.get("name") or row["id"],
+                version=row.get("version") or "unknown",
+                category=row.get("category") or "unknown",
+            )
+            for dep in row.get("dependencies") or []:
+                graph.add_edge(row["id"], _dependency_name(dep))
 
         # Detect cycles
         graph.detect_cycles()
 
+        if skill_ids is None:
+            self.dependency_graph = graph
+
         return graph
 
+    async def get_dependency_impact(self, skill_id: str) -> Dict[str, Any]:
+        """Analyze which skills a change to a skill affects.
+
+        Args:
+            skill_id: Skill identifier
+
+        Returns:
+            Dictionary with direct and transitive dependents and dependencies
+        """
+        graph = await self.build_dependency_graph()
+        return {
+            "skill_id": skill_id,
+            "direct_dependents": sorted(graph.get_dependents(skill_id)),
+            "affected_skills": sorted(graph.get_transitive_dependents(skill_id)),
+            "dependencies": sorted(graph.get_transitive_dependencies(skill_id)),
+        }
+
+    async def _handle_skill_change(self, event: SkillEvent):
+        """Apply a skill event to the kept dependency graph.
+
+        Created and updated skills are re-read, as skill events only carry
+        the changed skill's ID and statistics values.
+
+        Args:
+            event: Skill created, updated or deleted event
+        """
+        graph = self.dependency_graph
+        if graph is None or not event.skill_id:
+            return
+
+        skill_id = str(event.skill_id)
+        if event.event_type == EventType.SKILL_DELETED:
+            graph.remove_node(skill_id)
+            return
+
+        rows = await self.skill_manager.get_skill_dependencies([skill_id])
+        if not rows:
+            return
+
+        row = rows[0]
+        graph.add_node(
+            skill_id,
+            name=row.get("name") or skill_id,
+            version=row.get("version") or "unknown",
+            category=row.get("category") or "unknown",
+        )
+        graph.set_dependencies(
+            skill_id,
+            [_dependency_name(dep) for dep in row.get("dependencies") or []],
+        )
+
     async def generate_usage_report(
         self,
         skill_ids: Optional[List[str]] = None,
@@ -884,13 +1960,12 @@ class SkillAnalytics:
         Returns:
             List of Metric instances
         """
-        metrics = self.metrics.get(metric_name, [])
+        series = self.metrics.get(metric_name)
+        if series is None:
+            return []
 
-        if time_range:
-            cutoff_time = self._get_time_range_cutoff(time_range)
-            metrics = [m for m in metrics if m.timestamp > cutoff_time]
-
-        return metrics
+        cutoff_time = self._get_time_range_cutoff(time_range) if time_range else None
+        return series.points(cutoff_time)
 
     def _get_time_range_cutoff(self, time_range: TimeRange) -> datetime:
         """Get cutoff time for time range.
@@ -925,6 +2000,9 @@ class SkillAnalytics:
     ) -> Optional[float]:
         """Aggregate metrics.
 
+        Partition summaries are merged instead of scanning raw points;
+        percentiles are estimated within the histogram's relative error.
+
         Args:
             metric_name: Metric name
             aggregation: Aggregation type
@@ -934,28 +2012,26 @@ class SkillAnalytics:
         Returns:
             Aggregated value or None
         """
-        metrics = await self.get_metrics(metric_name, time_range)
-
-        if not metrics:
+        series = self.metrics.get(metric_name)
+        if series is None:
             return None
 
-        values = [m.value for m in metrics]
+        summary = series.summarize(self._get_time_range_cutoff(time_range))
+        if summary is None:
+            return None
 
         if aggregation == AggregationType.SUM:
-            return sum(values)
+            return summary.sum
         elif aggregation == AggregationType.AVERAGE:
-            return statistics.mean(values)
+            return summary.sum / summary.count
         elif aggregation == AggregationType.MIN:
-            return min(values)
+            return summary.min
         elif aggregation == AggregationType.MAX:
-            return max(values)
+            return summary.max
         elif aggregation == AggregationType.COUNT:
-            return len(values)
+            return summary.count
         elif aggregation == AggregationType.PERCENTILE:
-            if percentile is not None:
-                return statistics.quantiles(values, n=100)[int(percentile) - 1]
-            else:
-                return statistics.median(values)
+            return summary.sketch.percentile(percentile if percentile is not None else 50.0)
 
         return None
 
@@ -1004,16 +2080,12 @@ class SkillAnalytics:
         cutoff_time = datetime.now() - timedelta(days=days_old)
 
         # Clean metrics
-        for metric_name in self.metrics:
-            self.metrics[metric_name] = [
-                m for m in self.metrics[metric_name]
-                if m.timestamp > cutoff_time
-            ]
-
-        # Clean skill stats (keep only recent executions)
-        for skill_id, stats in self.skill_stats.items():
-            # Keep only last 1000 executions
-            if len(stats.execution_history) > 1000:
-                stats.execution_history = stats.execution_history[-1000:]
+        for series in self.metrics.values():
+            series.drop_before(cutoff_time)
+
+        # Re-bound execution histories assigned from outside
+        for stats in self.skill_stats.values():
+            if len(stats.execution_history) > RECENT_EXECUTIONS:
+                stats.execution_history = deque(stats.execution_history, maxlen=RECENT_EXECUTIONS)
 
         logger.info(f"Cleaned up analytics data older than {days_old} days")
@@ -5,7 +5,7 @@ event-driven architecture with publish-subscribe patterns for skill operations.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Callable, Set
+from typing import Dict, List, Any, Optional, Callable, Set, Tuple
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass
@@ -57,6 +57,7 @@ class EventType(str, Enum):
 
     # Analytics events
     SKILL_VIEWED = "skill.viewed"
+    SKILL_EXECUTED = "skill.executed"
     SKILL_DOWNLOADED = "skill.downloaded"
     SKILL_RATED = "skill.rated"
     SKILL_LIKED = "skill.liked"
@@ -267,6 +268,110 @@ class AuditEventHandler(EventHandler):
                 )
 
 
+class SkillStatsEventHandler(EventHandler):
+    """Event handler keeping the skill statistics summary table current.
+
+    Skill lifecycle events carry the counted values of the skill under
+    ``data["stats"]`` (and ``data["previous_stats"]`` for updates), as a
+    mapping of dimension to a value or list of values. The handler turns
+    them into count deltas for the stats service to apply.
+    """
+
+    EVENT_TYPES = (
+        EventType.SKILL_CREATED,
+        EventType.SKILL_UPDATED,
+        EventType.SKILL_DELETED,
+        EventType.SKILL_ACTIVATED,
+        EventType.SKILL_DEACTIVATED,
+        EventType.SKILL_DEPRECATED,
+        EventType.SKILL_ARCHIVED,
+    )
+
+    def __init__(self, stats_service=None):
+        """Initialize statistics handler.
+
+        Args:
+            stats_service: Service applying count deltas to the summary table
+        """
+        self.stats_service = stats_service
+
+    async def handle(self, event: SkillEvent) -> None:
+        """Apply the count changes of a skill event.
+
+        Args:
+            event: Event to handle
+        """
+        if event.event_type not in self.EVENT_TYPES or not self.stats_service:
+            return
+
+        data = event.data or {}
+        deltas: Dict[Tuple[str, str], int] = {}
+        if event.event_type == EventType.SKILL_DELETED:
+            self._add_deltas(deltas, data.get("stats"), -1)
+        else:
+            self._add_deltas(deltas, data.get("previous_stats"), -1)
+            self._add_deltas(deltas, data.get("stats"), 1)
+
+        # Applied even when no count changes, as the data version still moves
+        await self.stats_service.apply_stat_deltas(
+            {key: delta for key, delta in deltas.items() if delta}
+        )
+
+    @staticmethod
+    def _add_deltas(
+        deltas: Dict[Tuple[str, str], int],
+        stats: Optional[Dict[str, Any]],
+        sign: int,
+    ):
+        for dimension, values in (stats or {}).items():
+            if values is None:
+                continue
+            if not isinstance(values, (list, tuple, set)):
+                values = [values]
+            for value in values:
+                key = (dimension, str(value))
+                deltas[key] = deltas.get(key, 0) + sign
+
+
+class SkillSearchEventHandler(EventHandler):
+    """Event handler keeping the skill search index current.
+
+    Created and updated skills are re-read into the index and deleted
+    skills dropped from it, so the index never needs a full rebuild.
+    """
+
+    EVENT_TYPES = (
+        EventType.SKILL_CREATED,
+        EventType.SKILL_UPDATED,
+        EventType.SKILL_DELETED,
+    )
+
+    def __init__(self, search_service=None):
+        """Initialize search handler.
+
+        Args:
+            search_service: Service maintaining the search index
+        """
+        self.search_service = search_service
+
+    async def handle(self, event: SkillEvent) -> None:
+        """Apply a skill change to the search index.
+
+        Args:
+            event: Event to handle
+        """
+        if event.event_type not in self.EVENT_TYPES or not self.search_service:
+            return
+        # Bulk changes carry no skill and touch no indexed text
+        if not event.skill_id:
+            return
+
+        if event.event_type == EventType.SKILL_DELETED:
+            await self.search_service.remove_from_search_index(event.skill_id)
+        else:
+            await self.search_service.update_search_index(event.skill_id)
+
+
 class SkillEventManager:
     """Event manager for skill-related events.
 
@@ -2,6 +2,10 @@
 
 This module provides comprehensive import and export functionality
 for skill data in multiple formats (YAML, JSON, CSV, ZIP, etc.).
+
+Bulk exports can also be packed: every skill becomes one JSON entry of a
+tar or zip segment, and an offset index lets single skills be read back
+without unpacking a segment.
 """
 
 import asyncio
@@ -18,6 +22,8 @@ from enum import Enum
 import logging
 import yaml
 
+from app.core.packing import DEFAULT_SEGMENT_SIZE, pack_segments
+
 from .utils import SkillValidator, SkillFormatter
 from .event_manager import SkillEventManager, EventType
 from .manager import SkillManager
@@ -41,6 +47,7 @@ class ExportFormat(Enum):
     CSV = "csv"
     ZIP = "zip"
     DIRECTORY = "directory"
+    PACKED = "packed"
 
 
 class ImportStatus(Enum):
@@ -150,6 +157,8 @@ class ExportConfig:
     batch_size: int = 100
     compress: bool = False
     encryption: bool = False
+    pack_format: str = "tar"
+    segment_size: int = DEFAULT_SEGMENT_SIZE
 
 
 class SkillImporter:
@@ -858,6 +867,9 @@ class SkillImporter:
                     with zipfile.ZipFile(destination_path, "w") as zip_ref:
                         zip_ref.write(json_path, "skills.json")
 
+            elif config.format == ExportFormat.PACKED:
+                self._export_packed(skills_data, destination_path, config)
+
             elif config.format == ExportFormat.DIRECTORY:
                 # Export to directory as individual YAML files
                 for skill in skills_data:
@@ -873,6 +885,48 @@ class SkillImporter:
             logger.error(f"Error exporting data: {e}")
             return None
 
+    def _export_packed(
+        self,
+        skills_data: List[Dict[str, Any]],
+        destination_path: Path,
+        config: ExportConfig,
+    ):
+        """Export skills as packed segments with an offset index.
+
+        The destination directory receives numbered segment files and
+        ``index.jsonl``, which lists the segment, offset, size and checksum of
+        every skill.
+
+        Args:
+            skills_data: Skills data to export
+            destination_path: Destination directory
+            config: Export configuration
+        """
+        destination_path.mkdir(parents=True, exist_ok=True)
+
+        def segment_name(number: int) -> str:
+            return f"segment-{number:05d}.{config.pack_format}"
+
+        def write_segment(number: int, writer):
+            with open(destination_path / segment_name(number), "wb") as f:
+                shutil.copyfileobj(writer.file, f)
+
+        def entries():
+            for skill in skills_data:
+                skill_id = skill.get("id") or skill.get("name", "unknown")
+                content = json.dumps(skill, ensure_ascii=False, default=str).encode("utf-8")
+                yield f"{skill_id}.json", content
+
+        with open(destination_path / "index.jsonl", "w", encoding="utf-8") as index:
+            for entry in pack_segments(entries(), write_segment, config.pack_format, config.segment_size):
+                index.write(json.dumps({
+                    "name": entry.name,
+                    "segment": segment_name(entry.segment),
+                    "offset": entry.offset,
+                    "size": entry.size,
+                    "checksum": entry.checksum,
+                }) + "\n")
+
     async def _finalize_import(self, import_id: str, success: bool):
         """Finalize import operation.
 
@@ -5,13 +5,33 @@ with CRUD operations, search, filtering, and state management.
 """
 
 import logging
+import time
+import uuid
 from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func, text
+from sqlalchemy import and_, or_, desc, asc, func, text, case, literal, select, insert, update, delete
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-from .models import Skill, SkillVersion, SkillCategory, SkillTag, SkillTagAssociation
+from app.core.cache import LRUCache
+from app.core.search import tokenize
+from .event_manager import (
+    EventType,
+    SkillEvent,
+    SkillEventManager,
+    SkillSearchEventHandler,
+    SkillStatsEventHandler,
+)
+from .models import (
+    Skill,
+    SkillVersion,
+    SkillCategory,
+    SkillTag,
+    SkillTagAssociation,
+    SkillStatCount,
+    STAT_DIMENSIONS,
+    STATS_VERSION_KEY,
+)
 from .schemas.skill_operations import (
     SkillCreate,
     SkillUpdate,
@@ -25,11 +45,18 @@ from .schemas.skill_operations import (
     SkillBulkResult,
 )
 from .schemas.skill_creation import SkillCreationRequest
+from .search import SkillSearchBackend, get_search_backend
 from .utils.validators import SkillValidator, BusinessRuleValidator
 from .utils.formatters import SkillFormatter, SkillDisplayFormatter
 
 logger = logging.getLogger(__name__)
 
+# Seconds a computed statistics snapshot is served for one data version
+STATS_CACHE_TTL = 30.0
+
+# Statistics snapshots keyed by (database URL, data version)
+_stats_cache = LRUCache(max_entries=64)
+
 
 class SkillManager:
     """Core skill management class.
@@ -38,17 +65,27 @@ class SkillManager:
     search, filtering, and state management.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, event_manager: Optional[SkillEventManager] = None):
         """Initialize skill manager.
 
         Args:
             db_session: SQLAlchemy database session
+            event_manager: Event manager to publish skill events through
         """
         self.db = db_session
         self.validator = SkillValidator()
         self.formatter = SkillFormatter()
         self.display_formatter = SkillDisplayFormatter()
 
+        # Keep the statistics summary table and search index current
+        self.event_manager = event_manager
+        self.stats_handler = SkillStatsEventHandler(self)
+        self.search_handler = SkillSearchEventHandler(self)
+        if event_manager is not None:
+            for handler in (self.stats_handler, self.search_handler):
+                for event_type in handler.EVENT_TYPES:
+                    event_manager.register_handler(event_type, handler)
+
     # ================================
     # Skill CRUD Operations
     # ================================
@@ -135,6 +172,8 @@ class SkillManager:
             self.db.commit()
             self.db.refresh(skill)
 
+            await self._publish_skill_event(EventType.SKILL_CREATED, skill.id, self._get_stat_values(skill))
+
             logger.info(f"Created skill: {skill.id} ({skill.name})")
             return self._to_skill_response(skill)
 
@@ -215,6 +254,8 @@ class SkillManager:
                 if not is_valid:
                     raise ValueError(f"Invalid skill data: {', '.join(errors)}")
 
+            previous_stats = self._get_stat_values(skill)
+
             # Update fields
             for field, value in update_dict.items():
                 if hasattr(skill, field):
@@ -231,6 +272,13 @@ class SkillManager:
             self.db.commit()
             self.db.refresh(skill)
 
+            await self._publish_skill_event(
+                EventType.SKILL_UPDATED,
+                skill.id,
+                self._get_stat_values(skill),
+                previous_stats,
+            )
+
             logger.info(f"Updated skill: {skill.id} ({skill.name})")
             return self._to_skill_response(skill)
 
@@ -258,10 +306,14 @@ class SkillManager:
             if not skill:
                 return False
 
+            stats = self._get_stat_values(skill)
+
             # Delete skill (cascades to versions and associations)
             self.db.delete(skill)
             self.db.commit()
 
+            await self._publish_skill_event(EventType.SKILL_DELETED, skill_id, stats)
+
             logger.info(f"Deleted skill: {skill_id}")
             return True
 
@@ -335,59 +387,67 @@ class SkillManager:
     async def search_skills(self, search: SkillSearch) -> SkillSearchResult:
         """Search skills with advanced options.
 
+        Text queries are matched and ranked by the search backend of the
+        database, most relevant first. Without a query, skills are listed
+        in sort field order. Pass the returned next_cursor to get the
+        following page; large totals are estimated.
+
         Args:
             search: Search parameters
 
         Returns:
             Search result
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
         try:
             # Build base query
             query = self.db.query(Skill)
 
-            # Apply text search
-            if search.query:
-                search_term = f"%{search.query.lower()}%"
-                query = query.filter(
-                    or_(
-                        func.lower(Skill.name).like(search_term),
-                        func.lower(Skill.description).like(search_term),
-                        Skill.keywords.contains([search.query.lower()]),
-                    )
-                )
-
             # Apply filters
             if search.filters:
                 query = self._apply_filters(query, search.filters)
 
-            # Get total count
-            total = query.count()
-
-            # Apply sorting
-            sort_field = getattr(Skill, search.sort_by, Skill.updated_at)
-            if search.sort_order.lower() == "desc":
-                query = query.order_by(desc(sort_field))
+            # Pages after the first continue from a cursor rather than an offset
+            skip = 0 if search.cursor else (search.page - 1) * search.page_size
+            backend = self._get_search_backend()
+            if tokenize(search.query):
+                result = backend.search(
+                    self.db,
+                    query,
+                    search.query,
+                    search.page_size,
+                    cursor=search.cursor,
+                    skip=skip,
+                )
             else:
-                query = query.order_by(asc(sort_field))
-
-            # Apply pagination
-            offset = (search.page - 1) * search.page_size
-            skills = query.offset(offset).limit(search.page_size).all()
+                result = backend.list_skills(
+                    self.db,
+                    query,
+                    search.sort_by,
+                    search.sort_order.lower() == "desc",
+                    search.page_size,
+                    cursor=search.cursor,
+                    skip=skip,
+                )
 
             # Convert to response format
-            items = [self._to_skill_list_item(skill) for skill in skills]
+            items = [self._to_skill_list_item(skill) for skill in result.skills]
 
             # Calculate pagination
-            pages = (total + search.page_size - 1) // search.page_size
+            pages = (result.total + search.page_size - 1) // search.page_size
 
             return SkillSearchResult(
                 items=items,
-                total=total,
+                total=result.total,
+                total_is_estimate=result.total_is_estimate,
                 page=search.page,
                 page_size=search.page_size,
                 pages=pages,
-                has_next=search.page < pages,
-                has_prev=search.page > 1,
+                has_next=result.next_cursor is not None,
+                has_prev=search.cursor is not None or search.page > 1,
+                next_cursor=result.next_cursor,
                 query=search.query,
                 filters_applied=search.filters.dict() if search.filters else None,
             )
@@ -396,6 +456,27 @@ class SkillManager:
             logger.error(f"Database error searching skills: {e}")
             raise
 
+    async def update_search_index(self, skill_id: str) -> None:
+        """Re-read a created or updated skill into the search index.
+
+        Args:
+            skill_id: Skill ID
+        """
+        try:
+            self._get_search_backend().index_skill(self.db, skill_id)
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error indexing skill {skill_id}: {e}")
+            raise
+
+    async def remove_from_search_index(self, skill_id: str) -> None:
+        """Drop a deleted skill from the search index.
+
+        Args:
+            skill_id: Skill ID
+        """
+        self._get_search_backend().remove_skill(skill_id)
+
     # ================================
     # State Management
     # ================================
@@ -423,6 +504,8 @@ class SkillManager:
             self.db.commit()
             self.db.refresh(skill)
 
+            await self._publish_skill_event(EventType.SKILL_ACTIVATED, skill_id)
+
             logger.info(f"Activated skill: {skill_id}")
             return self._to_skill_response(skill)
 
@@ -451,6 +534,8 @@ class SkillManager:
             self.db.commit()
             self.db.refresh(skill)
 
+            await self._publish_skill_event(EventType.SKILL_DEACTIVATED, skill_id)
+
             logger.info(f"Deactivated skill: {skill_id}")
             return self._to_skill_response(skill)
 
@@ -479,6 +564,8 @@ class SkillManager:
             self.db.commit()
             self.db.refresh(skill)
 
+            await self._publish_skill_event(EventType.SKILL_DEPRECATED, skill_id)
+
             logger.info(f"Deprecated skill: {skill_id}")
             return self._to_skill_response(skill)
 
@@ -507,6 +594,8 @@ class SkillManager:
             self.db.commit()
             self.db.refresh(skill)
 
+            await self._publish_skill_event(EventType.SKILL_ARCHIVED, skill_id)
+
             logger.info(f"Archived skill: {skill_id}")
             return self._to_skill_response(skill)
 
@@ -522,76 +611,146 @@ class SkillManager:
     async def get_skill_stats(self) -> SkillStats:
         """Get skill statistics.
 
+        Totals and averages come from a single aggregate query over the
+        skills table and the distributions from the statistics summary
+        table. The result is cached briefly for the current data version,
+        which every skill write through the skill manager or the bulk
+        skill tasks moves once committed, so those changes are visible on
+        the next call.
+
         Returns:
             Skill statistics
         """
         try:
-            # Get basic counts
-            total_skills = self.db.query(Skill).count()
-            active_skills = self.db.query(Skill).filter(Skill.status == "active").count()
-            draft_skills = self.db.query(Skill).filter(Skill.status == "draft").count()
-            deprecated_skills = self.db.query(Skill).filter(Skill.status == "deprecated").count()
-            archived_skills = self.db.query(Skill).filter(Skill.status == "archived").count()
-
-            # Get usage statistics
-            total_downloads = self.db.query(func.sum(Skill.download_count)).scalar() or 0
-            total_views = self.db.query(func.sum(Skill.view_count)).scalar() or 0
-            total_likes = self.db.query(func.sum(Skill.like_count)).scalar() or 0
-
-            # Get rating statistics
-            avg_rating = self.db.query(func.avg(Skill.rating)).scalar() or 0.0
-            total_ratings = self.db.query(func.sum(Skill.rating_count)).scalar() or 0
-
-            # Get quality statistics
-            avg_quality_score = self.db.query(func.avg(Skill.quality_score)).scalar() or 0.0
-            avg_completeness = self.db.query(func.avg(Skill.completeness)).scalar() or 0.0
-
-            # Get category distribution
-            categories = self.db.query(
-                SkillCategory.name,
-                func.count(Skill.id).label('count')
-            ).outerjoin(Skill).group_by(SkillCategory.id).all()
-
-            category_dist = [{"name": cat[0], "count": cat[1]} for cat in categories if cat[0]]
-
-            # Get top tags
-            tags = self.db.query(
-                SkillTag.name,
-                func.count(Skill.id).label('count')
-            ).join(SkillTagAssociation).join(Skill).group_by(SkillTag.id).order_by(desc('count')).limit(10).all()
-
-            tag_dist = [{"name": tag[0], "count": tag[1]} for tag in tags if tag[0]]
-
-            # Get content type distribution
-            content_types = self.db.query(
-                Skill.content_type,
-                func.count(Skill.id).label('count')
-            ).group_by(Skill.content_type).all()
-
-            type_dist = [{"type": ct[0], "count": ct[1]} for ct in content_types if ct[0]]
-
-            return SkillStats(
-                total_skills=total_skills,
-                active_skills=active_skills,
-                draft_skills=draft_skills,
-                deprecated_skills=deprecated_skills,
-                archived_skills=archived_skills,
-                total_downloads=total_downloads,
-                total_views=total_views,
-                total_likes=total_likes,
-                avg_rating=round(avg_rating, 2),
-                total_ratings=total_ratings,
-                avg_quality_score=round(avg_quality_score, 2),
-                avg_completeness=round(avg_completeness, 2),
-                categories=category_dist,
-                top_tags=tag_dist,
-                content_types=type_dist,
-            )
+            cache_key = (str(self.db.get_bind().url), self._get_stats_version())
+            cached = _stats_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            stats = self._compute_skill_stats()
+            _stats_cache.put(cache_key, (time.monotonic() + STATS_CACHE_TTL, stats))
+            return stats
 
         except SQLAlchemyError as e:
             logger.error(f"Database error getting skill stats: {e}")
             raise
 
+    async def apply_stat_deltas(self, deltas: Dict[Tuple[str, str], int]) -> None:
+        """Apply count changes to the statistics summary table.
+
+        The deltas are committed first and the data version is bumped
+        afterwards in a transaction of its own, so the shared version row
+        is only locked for a single statement.
+
+        Args:
+            deltas: Count change per (dimension, value)
+        """
+        try:
+            if deltas:
+                for (dimension, value), delta in deltas.items():
+                    self._increment_stat_count(dimension, value, delta)
+                self.db.commit()
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Database error applying skill stat deltas: {e}")
+            raise
+
+        await self.bump_stats_version()
+
+    async def bump_stats_version(self) -> None:
+        """Move the statistics data version, invalidating cached statistics.
+
+        Call after committing changes to the skills that are not applied
+        through apply_stat_deltas, such as bulk status updates.
+        """
+        try:
+            self._increment_stat_count(*STATS_VERSION_KEY, 1)
+            self.db.commit()
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Database error bumping skill stats version: {e}")
+            raise
+
+    async def refresh_stat_counts(self) -> None:
+        """Rebuild the statistics summary table from the skills.
+
+        Repairs counts that drifted, for example after changes made
+        outside the skill manager.
+        """
+        counts = SkillStatCount.__table__
+        skills = Skill.__table__
+        associations = SkillTagAssociation.__table__
+
+        try:
+            self.db.execute(delete(counts).where(counts.c.dimension.in_(STAT_DIMENSIONS)))
+            for dimension, column, table in (
+                ("category", skills.c.category_id, skills),
+                ("tag", associations.c.tag_id, associations),
+                ("content_type", skills.c.content_type, skills),
+            ):
+                self.db.execute(
+                    insert(counts).from_select(
+                        ["dimension", "value", "skill_count"],
+                        select(literal(dimension), column, func.count())
+                        .select_from(table)
+                        .where(column.isnot(None))
+                        .group_by(column),
+                    )
+                )
+            self.db.commit()
+
+            logger.info("Rebuilt skill statistics summary table")
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Database error rebuilding skill stat counts: {e}")
+            raise
+
+        await self.bump_stats_version()
+
+    async def get_skill_dependencies(
+        self,
+        skill_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the dependencies of many skills in a single query.
+
+        Only the columns needed to build a dependency graph are loaded.
+
+        Args:
+            skill_ids: Skills to include (all skills when omitted)
+
+        Returns:
+            List of dictionaries with id, name, version, category and dependencies
+        """
+        try:
+            query = self.db.query(
+                Skill.id,
+                Skill.name,
+                Skill.version,
+                SkillCategory.name,
+                Skill.dependencies,
+            ).outerjoin(SkillCategory, Skill.category_id == SkillCategory.id)
+
+            if skill_ids is not None:
+                query = query.filter(Skill.id.in_(skill_ids))
+
+            return [
+                {
+                    "id": str(skill_id),
+                    "name": name,
+                    "version": version,
+                    "category": category,
+                    "dependencies": dependencies or [],
+                }
+                for skill_id, name, version, category, dependencies in query.all()
+            ]
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting skill dependencies: {e}")
+            raise
+
     # ================================
     # Bulk Operations
     # ================================
@@ -626,6 +785,7 @@ class SkillManager:
             # Commit successful operations
             if succeeded_ids:
                 self.db.commit()
+                await self._publish_skill_event(EventType.SKILL_UPDATED, None)
 
             result = SkillBulkResult(
                 operation=operation.operation,
@@ -779,6 +939,196 @@ class SkillManager:
 
         skill.updated_at = datetime.utcnow()
 
+    def _get_search_backend(self) -> SkillSearchBackend:
+        """Get the search backend of the session's database.
+
+        Returns:
+            Search backend
+        """
+        return get_search_backend(self.db)
+
+    def _get_stats_version(self) -> int:
+        """Get the statistics data version.
+
+        Returns:
+            Version bumped on every change to the counted data
+        """
+        counts = SkillStatCount.__table__
+        dimension, value = STATS_VERSION_KEY
+        return self.db.execute(
+            select(counts.c.skill_count).where(
+                counts.c.dimension == dimension,
+                counts.c.value == value,
+            )
+        ).scalar() or 0
+
+    def _compute_skill_stats(self) -> SkillStats:
+        """Compute skill statistics with one aggregate and one summary query.
+
+        Returns:
+            Skill statistics
+        """
+        skills = Skill.__table__
+        totals = self.db.execute(
+            select(
+                func.count().label("total_skills"),
+                func.count(case((skills.c.status == "active", 1))).label("active_skills"),
+                func.count(case((skills.c.status == "draft", 1))).label("draft_skills"),
+                func.count(case((skills.c.status == "deprecated", 1))).label("deprecated_skills"),
+                func.count(case((skills.c.status == "archived", 1))).label("archived_skills"),
+                func.coalesce(func.sum(skills.c.download_count), 0).label("total_downloads"),
+                func.coalesce(func.sum(skills.c.view_count), 0).label("total_views"),
+                func.coalesce(func.sum(skills.c.like_count), 0).label("total_likes"),
+                func.avg(skills.c.rating).label("avg_rating"),
+                func.coalesce(func.sum(skills.c.rating_count), 0).label("total_ratings"),
+                func.avg(skills.c.quality_score).label("avg_quality_score"),
+                func.avg(skills.c.completeness).label("avg_completeness"),
+            )
+        ).one()
+
+        counts = SkillStatCount.__table__
+        categories = SkillCategory.__table__
+        tags = SkillTag.__table__
+        rows = self.db.execute(
+            select(
+                counts.c.dimension,
+                counts.c.value,
+                counts.c.skill_count,
+                func.coalesce(categories.c.name, tags.c.name).label("name"),
+            )
+            .select_from(
+                counts
+                .outerjoin(categories, and_(counts.c.dimension == "category", categories.c.id == counts.c.value))
+                .outerjoin(tags, and_(counts.c.dimension == "tag", tags.c.id == counts.c.value))
+            )
+            .where(counts.c.dimension.in_(STAT_DIMENSIONS), counts.c.skill_count > 0)
+            .order_by(desc(counts.c.skill_count))
+        ).all()
+
+        category_dist = []
+        tag_dist = []
+        type_dist = []
+        for dimension, value, count, name in rows:
+            if dimension == "category" and name:
+                category_dist.append({"name": name, "count": count})
+            elif dimension == "tag" and name and len(tag_dist) < 10:
+                tag_dist.append({"name": name, "count": count})
+            elif dimension == "content_type" and value:
+                type_dist.append({"type": value, "count": count})
+
+        return SkillStats(
+            total_skills=totals.total_skills,
+            active_skills=totals.active_skills,
+            draft_skills=totals.draft_skills,
+            deprecated_skills=totals.deprecated_skills,
+            archived_skills=totals.archived_skills,
+            total_downloads=totals.total_downloads,
+            total_views=totals.total_views,
+            total_likes=totals.total_likes,
+            avg_rating=round(float(totals.avg_rating or 0.0), 2),
+            total_ratings=totals.total_ratings,
+            avg_quality_score=round(float(totals.avg_quality_score or 0.0), 2),
+            avg_completeness=round(float(totals.avg_completeness or 0.0), 2),
+            categories=category_dist,
+            top_tags=tag_dist,
+            content_types=type_dist,
+        )
+
+    def _increment_stat_count(self, dimension: str, value: str, delta: int):
+        """Add to one summary count, creating its row when missing.
+
+        On PostgreSQL and SQLite the change is a single upsert, so writers
+        creating the same row concurrently do not conflict.
+
+        Args:
+            dimension: Counted dimension
+            value: Dimension value
+            delta: Count change
+        """
+        counts = SkillStatCount.__table__
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as upsert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as upsert
+
+            self.db.execute(
+                upsert(counts)
+                .values(dimension=dimension, value=value, skill_count=max(delta, 0))
+                .on_conflict_do_update(
+                    index_elements=[counts.c.dimension, counts.c.value],
+                    set_={"skill_count": counts.c.skill_count + delta, "updated_at": func.now()},
+                )
+            )
+            return
+
+        updated = self.db.execute(
+            update(counts)
+            .where(counts.c.dimension == dimension, counts.c.value == value)
+            .values(skill_count=counts.c.skill_count + delta, updated_at=func.now())
+        ).rowcount
+        if not updated:
+            self.db.execute(
+                insert(counts).values(dimension=dimension, value=value, skill_count=max(delta, 0))
+            )
+
+    def _get_stat_values(self, skill: Skill) -> Dict[str, Any]:
+        """Get the values a skill contributes to the statistics summary.
+
+        Args:
+            skill: Skill instance
+
+        Returns:
+            Dictionary of dimension to value or list of values
+        """
+        return {
+            "category": skill.category_id,
+            "tag": [tag.id for tag in skill.tags],
+            "content_type": skill.content_type,
+        }
+
+    async def _publish_skill_event(
+        self,
+        event_type: EventType,
+        skill_id: Optional[str],
+        stats: Optional[Dict[str, Any]] = None,
+        previous_stats: Optional[Dict[str, Any]] = None,
+    ):
+        """Publish a skill change so the statistics and search index follow it.
+
+        Without an event manager the statistics and search handlers are
+        called directly.
+
+        Args:
+            event_type: Type of event
+            skill_id: Changed skill ID (None for bulk changes)
+            stats: Counted values of the skill after the change
+            previous_stats: Counted values of the skill before the change
+        """
+        data = {"stats": stats, "previous_stats": previous_stats}
+        if self.event_manager is not None:
+            await self.event_manager.publish_event(
+                event_type,
+                skill_id=skill_id,
+                data=data,
+                source="skill_manager",
+            )
+        else:
+            event = SkillEvent(
+                event_type=event_type,
+                event_id=str(uuid.uuid4()),
+                skill_id=skill_id,
+                data=data,
+                source="skill_manager",
+            )
+            for handler in (self.stats_handler, self.search_handler):
+                try:
+                    await handler.handle(event)
+                except Exception as e:
+                    # The skill change is already committed and must not fail here
+                    logger.error(f"Error handling {event_type.value} event: {e}")
+
     def _to_skill_response(self, skill: Skill) -> SkillResponse:
         """Convert skill model to response.
 
@@ -7,6 +7,7 @@ from .skill import Skill, SkillTagAssociation
 from .skill_version import SkillVersion
 from .skill_category import SkillCategory
 from .skill_tag import SkillTag
+from .skill_stats import SkillStatCount, STAT_DIMENSIONS, STATS_VERSION_KEY
 
 __all__ = [
     "Skill",
@@ -14,6 +15,9 @@ __all__ = [
     "SkillCategory",
     "SkillTag",
     "SkillTagAssociation",
+    "SkillStatCount",
+    "STAT_DIMENSIONS",
+    "STATS_VERSION_KEY",
 ]
 
 # Model metadata for database setup
@@ -28,6 +32,7 @@ MODEL_METADATA = {
             "idx_skill_category_id",
             "idx_skill_created_at",
             "idx_skill_updated_at",
+            "idx_skill_updated_at_id",
             "idx_skill_published_at",
             "idx_skill_quality_score",
             "idx_skill_download_count",
@@ -82,6 +87,14 @@ MODEL_METADATA = {
         ],
         "unique_constraints": [],
     },
+    "SkillStatCount": {
+        "table_name": "skill_stat_counts",
+        "description": "Skill counts per category, tag and content type",
+        "indexes": [
+            "idx_skill_stat_count_dimension_count",
+        ],
+        "unique_constraints": [],
+    },
 }
 
 # Relationship map for easy reference
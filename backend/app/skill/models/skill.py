@@ -170,6 +170,12 @@ class Skill(Base):
         comment="Quality score (0-100)",
     )
 
+    quality_fingerprint = Column(
+        String(64),
+        nullable=True,
+        comment="Hash of the inputs of the current quality score",
+    )
+
     completeness = Column(
         Float,
         default=0.0,
@@ -286,6 +292,7 @@ class Skill(Base):
         Index("idx_skill_category_id", "category_id"),
         Index("idx_skill_created_at", "created_at"),
         Index("idx_skill_updated_at", "updated_at"),
+        Index("idx_skill_updated_at_id", "updated_at", "id"),
         Index("idx_skill_published_at", "published_at"),
         Index("idx_skill_quality_score", "quality_score"),
         Index("idx_skill_download_count", "download_count"),
@@ -0,0 +1,60 @@
+"""Skill statistics summary model.
+
+This module defines the SkillStatCount model, a summary table holding the
+number of skills per category, tag and content type. It is kept current
+incrementally from skill events instead of being recomputed with
+group-by queries.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.sql import func
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+# Dimensions counted in the summary table
+STAT_DIMENSIONS = ("category", "tag", "content_type")
+
+# Row whose count is bumped on every change, used as the data version
+STATS_VERSION_KEY = ("meta", "version")
+
+
+class SkillStatCount(Base):
+    """Number of skills sharing one value of a dimension."""
+
+    __tablename__ = "skill_stat_counts"
+
+    dimension = Column(
+        String(20),
+        primary_key=True,
+        comment="Counted dimension (category, tag, content_type or meta)",
+    )
+
+    value = Column(
+        String(100),
+        primary_key=True,
+        comment="Category ID, tag ID or content type",
+    )
+
+    skill_count = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Number of skills with this value",
+    )
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        comment="Last update timestamp",
+    )
+
+    __table_args__ = (
+        Index("idx_skill_stat_count_dimension_count", "dimension", "skill_count"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of the count."""
+        return f"<SkillStatCount({self.dimension}={self.value}: {self.skill_count})>"
@@ -271,8 +271,9 @@ class SkillSearch(BaseModel):
     # Pagination
     page: int = Field(1, ge=1, description="Page number")
     page_size: int = Field(20, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(None, description="Cursor of the next page from a previous result")
 
-    # Sorting
+    # Sorting (results of a text query are ordered by relevance)
     sort_by: Optional[str] = Field("updated_at", description="Sort field")
     sort_order: SortOrder = Field(SortOrder.DESC, description="Sort order")
 
@@ -287,11 +288,13 @@ class SkillSearchResult(BaseModel):
 
     items: List[SkillListItem] = Field(..., description="Search results")
     total: int = Field(..., description="Total number of results")
+    total_is_estimate: bool = Field(False, description="Whether the total is estimated")
     page: int = Field(..., description="Current page")
     page_size: int = Field(..., description="Items per page")
     pages: int = Field(..., description="Total number of pages")
     has_next: bool = Field(..., description="Has next page")
     has_prev: bool = Field(..., description="Has previous page")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page")
 
     # Search metadata
     query: Optional[str] = Field(None, description="Search query")
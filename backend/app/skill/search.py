@@ -0,0 +1,496 @@
+"""Skill search backends.
+
+This module provides the search backends behind SkillManager.search_skills.
+On PostgreSQL, text queries are matched and ranked by the database through
+tsvector and pg_trgm GIN indexes. Other databases use an in-process BM25
+index that is loaded once and then kept current from skill events. Both
+backends page with search-after cursors and estimate large result counts
+instead of counting every match.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Float, Text, and_, asc, cast, desc, func, literal_column, or_, select, tuple_
+from sqlalchemy.orm import Query, Session
+
+from app.core.search import InvertedIndex, decode_cursor, encode_cursor, tokenize
+from .models import Skill
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of matches in each indexed field
+SEARCH_FIELD_WEIGHTS = {
+    "name": 3.0,
+    "keywords": 2.0,
+    "description": 1.0,
+}
+
+# Matches are counted exactly up to this many, and estimated beyond
+SEARCH_EXACT_COUNT_LIMIT = 1000
+
+# Rows loaded per batch when building the in-process index
+SEARCH_LOAD_BATCH_SIZE = 1000
+
+# Cursor kinds, so a cursor is only accepted by the ordering that made it
+_RELEVANCE_CURSOR = "r"
+_SORT_CURSOR = "s"
+_OFFSET_CURSOR = "o"
+
+_TS_CONFIG = literal_column("'simple'::regconfig")
+
+skill_table = Skill.__table__
+
+
+class SearchPage(NamedTuple):
+    """One page of search results."""
+    skills: List[Skill]
+    next_cursor: Optional[str]
+    total: int
+    total_is_estimate: bool
+
+
+def skill_search_document():
+    """Build the weighted tsvector expression of a skill.
+
+    The expression must stay identical to the one indexed by migration 005
+    for PostgreSQL to use the index.
+
+    Returns:
+        SQL expression
+    """
+    def weighted(column, weight):
+        return func.setweight(func.to_tsvector(_TS_CONFIG, func.coalesce(column, "")), weight)
+
+    return (
+        weighted(skill_table.c.name, "A")
+        .op("||")(weighted(cast(skill_table.c.keywords, Text), "B"))
+        .op("||")(weighted(skill_table.c.description, "C"))
+    )
+
+
+class SkillSearchBackend:
+    """Base class for skill search backends.
+
+    Listing without a text query is shared by all backends: rows are
+    ordered by the sort field and the skill ID, and cursors continue after
+    the last row with a keyset condition.
+    """
+
+    name = "base"
+
+    def search(
+        self,
+        db: Session,
+        query: Query,
+        text: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> SearchPage:
+        """Find skills matching a text query, most relevant first.
+
+        Args:
+            db: Database session
+            query: Skill query with filters applied
+            text: Text query
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            skip: Matches to skip when no cursor is given
+
+        Returns:
+            Page of matching skills
+        """
+        raise NotImplementedError
+
+    def list_skills(
+        self,
+        db: Session,
+        query: Query,
+        sort_by: Optional[str],
+        descending: bool,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> SearchPage:
+        """List skills in sort field order.
+
+        Sort fields that can be NULL cannot be paged by keyset; their
+        cursors carry an offset instead.
+
+        Args:
+            db: Database session
+            query: Skill query with filters applied
+            sort_by: Sort field name (updated_at when unknown)
+            descending: Whether to sort in descending order
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            skip: Rows to skip when no cursor is given
+
+        Returns:
+            Page of skills
+        """
+        column = skill_table.c.get(sort_by or "updated_at")
+        if column is None:
+            column = skill_table.c.updated_at
+        keyset = not column.nullable
+        total, estimated = self.estimate_count(db, query)
+
+        direction = desc if descending else asc
+        query = query.order_by(direction(column), direction(skill_table.c.id))
+        if cursor and keyset:
+            _, name, value, skill_id = _decode(cursor, _SORT_CURSOR, 4)
+            if name != column.name:
+                raise ValueError("Invalid cursor: made for a different sort order")
+            position = tuple_(column, skill_table.c.id)
+            after = tuple_(value, skill_id)
+            query = query.filter(position < after if descending else position > after)
+        elif cursor:
+            _, name, skip = _decode(cursor, _OFFSET_CURSOR, 3)
+            if name != column.name or not isinstance(skip, int) or skip < 0:
+                raise ValueError("Invalid cursor: made for a different sort order")
+        if skip:
+            query = query.offset(skip)
+
+        skills = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(skills) > limit:
+            skills = skills[:limit]
+            if keyset:
+                last = skills[-1]
+                next_cursor = encode_cursor([_SORT_CURSOR, column.name, getattr(last, column.name), last.id])
+            else:
+                next_cursor = encode_cursor([_OFFSET_CURSOR, column.name, skip + limit])
+        return SearchPage(skills, next_cursor, total, estimated)
+
+    def estimate_count(self, db: Session, query: Query) -> Tuple[int, bool]:
+        """Count the rows of a query, up to SEARCH_EXACT_COUNT_LIMIT.
+
+        Args:
+            db: Database session
+            query: Query to count
+
+        Returns:
+            (count, whether the count is an estimate)
+        """
+        capped = db.execute(
+            select(func.count()).select_from(
+                query.with_entities(skill_table.c.id).limit(SEARCH_EXACT_COUNT_LIMIT + 1).subquery()
+            )
+        ).scalar() or 0
+        if capped <= SEARCH_EXACT_COUNT_LIMIT:
+            return capped, False
+        return self._estimate_large_count(db, query), True
+
+    def _estimate_large_count(self, db: Session, query: Query) -> int:
+        # Without planner statistics only a lower bound is known
+        return SEARCH_EXACT_COUNT_LIMIT + 1
+
+    def index_skill(self, db: Session, skill_id: str) -> None:
+        """Bring a created or updated skill into the search index.
+
+        Args:
+            db: Database session
+            skill_id: Skill ID
+        """
+
+    def remove_skill(self, skill_id: str) -> None:
+        """Drop a deleted skill from the search index.
+
+        Args:
+            skill_id: Skill ID
+        """
+
+
+class PostgresSkillSearchBackend(SkillSearchBackend):
+    """Search backend using PostgreSQL full-text and trigram indexes.
+
+    Query terms are matched against the weighted tsvector of name, keywords
+    and description, with the last term matched as a prefix. Names similar
+    to the query by trigrams also match, which tolerates typos. The indexes
+    are maintained by the database, so skill events need no handling.
+    """
+
+    name = "postgresql"
+
+    def search(
+        self,
+        db: Session,
+        query: Query,
+        text: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> SearchPage:
+        """Find skills matching a text query, most relevant first.
+
+        Args:
+            db: Database session
+            query: Skill query with filters applied
+            text: Text query
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            skip: Matches to skip when no cursor is given
+
+        Returns:
+            Page of matching skills
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return SearchPage([], None, 0, False)
+
+        # Tokens are plain words, safe to join into tsquery syntax
+        ts_query = func.to_tsquery(_TS_CONFIG, " & ".join(tokens[:-1] + [tokens[-1] + ":*"]))
+        document = skill_search_document()
+        name = func.lower(skill_table.c.name)
+        phrase = " ".join(tokens)
+        rank = cast(func.ts_rank_cd(document, ts_query) + func.similarity(name, phrase), Float)
+
+        query = query.filter(or_(document.op("@@")(ts_query), name.op("%")(phrase)))
+        total, estimated = self.estimate_count(db, query)
+
+        query = query.add_columns(rank.label("search_rank"))
+        if cursor:
+            _, after_rank, after_id = _decode(cursor, _RELEVANCE_CURSOR, 3)
+            query = query.filter(or_(
+                rank < after_rank,
+                and_(rank == after_rank, skill_table.c.id > after_id),
+            ))
+        elif skip:
+            query = query.offset(skip)
+
+        rows = query.order_by(desc(rank), asc(skill_table.c.id)).limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_skill, last_rank = rows[-1]
+            next_cursor = encode_cursor([_RELEVANCE_CURSOR, last_rank, last_skill.id])
+        return SearchPage([skill for skill, _ in rows], next_cursor, total, estimated)
+
+    def _estimate_large_count(self, db: Session, query: Query) -> int:
+        # The planner's row estimate costs no scan of the matches
+        statement = query.statement.compile(
+            dialect=db.get_bind().dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        plan = db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", statement.params
+        ).scalar()
+        return max(int(plan[0]["Plan"]["Plan Rows"]), SEARCH_EXACT_COUNT_LIMIT + 1)
+
+
+class InMemorySkillSearchBackend(SkillSearchBackend):
+    """Search backend using an in-process BM25 inverted index.
+
+    The index is loaded from the skills table on first use and then updated
+    one skill at a time from skill events. Changes made by other processes
+    are only seen after rebuild(). Ranked IDs are resolved against the
+    filtered skill query in batches, so filters still apply.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        """Initialize in-process search backend."""
+        self.index = InvertedIndex(SEARCH_FIELD_WEIGHTS)
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been loaded."""
+        return self._loaded
+
+    def search(
+        self,
+        db: Session,
+        query: Query,
+        text: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> SearchPage:
+        """Find skills matching a text query, most relevant first.
+
+        Args:
+            db: Database session
+            query: Skill query with filters applied
+            text: Text query
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            skip: Matches to skip when no cursor is given
+
+        Returns:
+            Page of matching skills
+        """
+        self._ensure_loaded(db)
+
+        after = None
+        if cursor:
+            _, after_score, after_id = _decode(cursor, _RELEVANCE_CURSOR, 3)
+            after = (after_score, after_id)
+
+        # Resolve ranked hits against the filtered query until the page is full
+        wanted = skip + limit + 1
+        batch_size = max(wanted, 50)
+        matches: List[Tuple[Skill, float]] = []
+        checked = 0
+        total = 0
+        exhausted = False
+        while len(matches) < wanted:
+            results = self.index.search(text, limit=batch_size, after=after)
+            total = results.total
+            if not results.hits:
+                exhausted = True
+                break
+            found = {
+                skill.id: skill
+                for skill in query.filter(skill_table.c.id.in_([hit.doc_id for hit in results.hits])).all()
+            }
+            for hit in results.hits:
+                if hit.doc_id in found:
+                    matches.append((found[hit.doc_id], hit.score))
+            checked += len(results.hits)
+            last = results.hits[-1]
+            after = (last.score, last.doc_id)
+            if len(results.hits) < batch_size:
+                exhausted = True
+                break
+
+        # Without filters every index hit is a match; otherwise scale the
+        # index count by the share of checked hits that passed the filters
+        if exhausted and cursor is None:
+            total, estimated = len(matches), False
+        elif checked:
+            total, estimated = round(total * len(matches) / checked), True
+        else:
+            estimated = False
+
+        page = matches[skip:skip + limit]
+        next_cursor = None
+        if len(matches) > skip + limit:
+            last_skill, last_score = page[-1]
+            next_cursor = encode_cursor([_RELEVANCE_CURSOR, last_score, last_skill.id])
+        return SearchPage([skill for skill, _ in page], next_cursor, total, estimated)
+
+    def index_skill(self, db: Session, skill_id: str) -> None:
+        """Bring a created or updated skill into the search index.
+
+        Args:
+            db: Database session
+            skill_id: Skill ID
+        """
+        with self._lock:
+            if not self._loaded:
+                # The skill is picked up when the index is loaded
+                return
+            row = db.execute(
+                select(
+                    skill_table.c.id,
+                    skill_table.c.name,
+                    skill_table.c.keywords,
+                    skill_table.c.description,
+                ).where(skill_table.c.id == skill_id)
+            ).first()
+            if row is None:
+                self.index.remove(skill_id)
+            else:
+                self._add_row(row)
+
+    def remove_skill(self, skill_id: str) -> None:
+        """Drop a deleted skill from the search index.
+
+        Args:
+            skill_id: Skill ID
+        """
+        self.index.remove(skill_id)
+
+    def rebuild(self, db: Session) -> None:
+        """Reload the index from the skills table.
+
+        Args:
+            db: Database session
+        """
+        with self._lock:
+            self._load(db)
+
+    def _ensure_loaded(self, db: Session) -> None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load(db)
+
+    def _load(self, db: Session) -> None:
+        self.index.clear()
+        result = db.execute(
+            select(
+                skill_table.c.id,
+                skill_table.c.name,
+                skill_table.c.keywords,
+                skill_table.c.description,
+            ),
+            execution_options={"yield_per": SEARCH_LOAD_BATCH_SIZE},
+        )
+        for row in result:
+            self._add_row(row)
+        self._loaded = True
+
+        logger.info(f"Loaded {len(self.index)} skills into the search index")
+
+    def _add_row(self, row: Any) -> None:
+        keywords = row.keywords if isinstance(row.keywords, list) else None
+        self.index.add(str(row.id), {
+            "name": row.name,
+            "keywords": [str(keyword) for keyword in keywords or []],
+            "description": row.description,
+        })
+
+
+def _decode(cursor: str, kind: str, size: int) -> List[Any]:
+    """Decode a cursor and check it was made by the expected ordering.
+
+    Raises:
+        ValueError: If the cursor is malformed or of another kind
+    """
+    values = decode_cursor(cursor)
+    if len(values) != size or values[0] != kind:
+        raise ValueError("Invalid cursor: made for a different search")
+    return values
+
+
+# Backends per database, so the in-process index outlives sessions
+_backends: Dict[str, SkillSearchBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_search_backend(db: Session, backend: Optional[str] = None) -> SkillSearchBackend:
+    """Get the search backend for the database of a session.
+
+    Args:
+        db: Database session
+        backend: "postgresql", "memory" or "auto" (SKILL_SEARCH_BACKEND
+            setting when omitted)
+
+    Returns:
+        Search backend shared by all sessions of the database
+    """
+    bind = db.get_bind()
+    if backend is None:
+        from app.core.config import settings
+        backend = settings.SKILL_SEARCH_BACKEND
+    if backend == "auto":
+        backend = "postgresql" if bind.dialect.name == "postgresql" else "memory"
+    if backend not in ("postgresql", "memory"):
+        raise ValueError(f"Unsupported search backend: {backend}")
+
+    key = f"{backend}:{bind.url}"
+    with _backends_lock:
+        instance = _backends.get(key)
+        if instance is None:
+            if backend == "postgresql":
+                instance = PostgresSkillSearchBackend()
+            else:
+                instance = InMemorySkillSearchBackend()
+            _backends[key] = instance
+    return instance
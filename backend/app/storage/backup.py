@@ -3,40 +3,95 @@
 This module provides the BackupManager class which manages automated backups,
 backup verification, recovery operations, and backup scheduling for the
 storage system to ensure data safety and disaster recovery capabilities.
+
+Incremental backups start from the watermark of the last successful backup
+of the same scope and skip files whose checksum has not changed. Files are
+copied server-side through a sliding window of concurrent workers, and the
+file list of a backup is written as a streamed JSON Lines manifest.
+
+Verification and restore run as resumable jobs: files are checked or
+restored through the same bounded worker window, checksums are computed
+while the content streams through, and progress is checkpointed to the
+backup bucket so an interrupted job continues where it stopped. Throughput
+and ETA are reported to the progress TaskTracker when one is configured.
+
+Packed backups stream small files into large tar or zip segments, one PUT
+per segment. The manifest records the segment and offset of each file, so a
+single file is restored with a range read of its segment.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import tarfile
 import tempfile
 import time
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import UUID, uuid4
 
 try:
     import aiofiles
-    from minio.commonconfig import CopySource
 except ImportError:
     aiofiles = None
-    CopySource = None
 
 from sqlalchemy import and_, desc, func, or_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
-from .client import MinIOClient
+from app.core.packing import DEFAULT_SEGMENT_SIZE, PACK_FORMATS, SegmentWriter
+
+from .blobs import BlobStore
+from .client import CopySource, MinIOClient
 from .manager import SkillStorageManager
 from .models import Skill, SkillFile, StorageBucket
+from .schemas.file_operations import FileUploadRequest
 from .utils.checksum import calculate_sha256, verify_checksum
 from .utils.validators import validate_skill_id, validate_file_path
 from .utils.formatters import format_file_size, format_timestamp
 
+if TYPE_CHECKING:
+    from app.progress.tracker import TaskTracker
+
 logger = logging.getLogger(__name__)
 
+# File list of a backup, one JSON object per line
+MANIFEST_FILES_NAME = "manifest.jsonl"
+
+# Spooled manifests and catalogs move to disk above this size
+_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+# Block size for streaming backup objects through a checksum
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Verify and restore jobs save a checkpoint after this many files or seconds
+CHECKPOINT_INTERVAL_FILES = 500
+CHECKPOINT_INTERVAL_SECONDS = 10.0
+
+# Minimum seconds between progress reports of a job
+PROGRESS_INTERVAL_SECONDS = 1.0
+
+# Failed file paths listed in job results
+_MAX_REPORTED_FAILURES = 100
+
 
 class BackupError(Exception):
     """Base exception for backup operations."""
@@ -135,6 +190,209 @@ class BackupRecord:
         self.error_message = error_message
 
 
+class _JsonLinesSpool:
+    """JSON Lines records spooled to a temp file and checksummed as written."""
+
+    def __init__(self):
+        self.file = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY)
+        self.count = 0
+        self._digest = hashlib.sha256()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = (json.dumps(record, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+        self.file.write(line)
+        self._digest.update(line)
+        self.count += 1
+
+    @property
+    def size(self) -> int:
+        return self.file.tell()
+
+    @property
+    def checksum(self) -> str:
+        return self._digest.hexdigest()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _BackupJob:
+    """Checkpointed progress of a verify or restore job.
+
+    Files are numbered by their position in the backup manifest. Every file
+    below ``position`` has been handled; files finished out of order wait in
+    ``ahead`` until the gap below them closes, so the checkpoint stays small
+    however many files the backup holds. Failed files are retried when the
+    job resumes.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        backup_id: str,
+        operation: str,
+        total: Optional[int] = None,
+        position: int = 0,
+        ahead: Iterable[int] = (),
+        failed: Iterable[int] = (),
+        completed: int = 0,
+        bytes_processed: int = 0,
+    ):
+        """Initialize job.
+
+        Args:
+            job_id: Job identifier, also used as progress task ID
+            backup_id: Backup the job works on
+            operation: "verify" or "restore"
+            total: Number of files the job covers, if known
+            position: Index below which every file has been handled
+            ahead: Handled indexes at or above position
+            failed: Indexes of files that failed
+            completed: Files handled successfully over all runs
+            bytes_processed: Bytes handled successfully over all runs
+        """
+        self.job_id = job_id
+        self.backup_id = backup_id
+        self.operation = operation
+        self.total = total
+        self.position = position
+        self.ahead: Set[int] = set(ahead)
+        self.failed: Set[int] = set(failed)
+        self.completed = completed
+        self.bytes_processed = bytes_processed
+        self.failed_paths: List[str] = []
+        self.run_completed = 0
+        self.resumed = bool(position or self.ahead or self.failed)
+
+        self._started_at = time.monotonic()
+        self._run_files = 0
+        self._run_bytes = 0
+        self._unsaved = 0
+        self._saved_at = self._started_at
+        self._reported_at = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], total: Optional[int] = None) -> "_BackupJob":
+        """Restore a job from its checkpoint.
+
+        Args:
+            data: Checkpoint written by to_dict
+            total: Number of files the job covers, if known
+
+        Returns:
+            _BackupJob instance
+        """
+        return cls(
+            job_id=data["job_id"],
+            backup_id=data["backup_id"],
+            operation=data["operation"],
+            total=total,
+            position=data["position"],
+            ahead=data.get("ahead", []),
+            failed=data.get("failed", []),
+            completed=data.get("completed", 0),
+            bytes_processed=data.get("bytes_processed", 0),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the job as a checkpoint."""
+        return {
+            "job_id": self.job_id,
+            "backup_id": self.backup_id,
+            "operation": self.operation,
+            "position": self.position,
+            "ahead": sorted(self.ahead),
+            "failed": sorted(self.failed),
+            "completed": self.completed,
+            "bytes_processed": self.bytes_processed,
+            "saved_at": datetime.utcnow().isoformat(),
+        }
+
+    def is_pending(self, index: int) -> bool:
+        """Whether the file at an index still has to be handled."""
+        return (index >= self.position and index not in self.ahead) or index in self.failed
+
+    def record(self, index: int, path: str, size: int = 0, error: Optional[Exception] = None) -> None:
+        """Record the outcome of one file.
+
+        Args:
+            index: Manifest index of the file
+            path: File path
+            size: Bytes handled
+            error: Exception raised for the file, if it failed
+        """
+        if error is not None:
+            self.failed.add(index)
+            if len(self.failed_paths) < _MAX_REPORTED_FAILURES:
+                self.failed_paths.append(path)
+        else:
+            self.failed.discard(index)
+            self.completed += 1
+            self.bytes_processed += size
+            self.run_completed += 1
+            self._run_bytes += size
+
+        if index >= self.position:
+            self.ahead.add(index)
+            while self.position in self.ahead:
+                self.ahead.discard(self.position)
+                self.position += 1
+
+        self._run_files += 1
+        self._unsaved += 1
+
+    def checkpoint_due(self) -> bool:
+        """Whether enough has changed since the last checkpoint."""
+        return self._unsaved >= CHECKPOINT_INTERVAL_FILES or (
+            self._unsaved and time.monotonic() - self._saved_at >= CHECKPOINT_INTERVAL_SECONDS
+        )
+
+    def mark_saved(self) -> None:
+        """Note that the job has just been checkpointed."""
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+
+    def report_due(self) -> bool:
+        """Whether the next progress report is due."""
+        return time.monotonic() - self._reported_at >= PROGRESS_INTERVAL_SECONDS
+
+    def mark_reported(self) -> None:
+        """Note that progress has just been reported."""
+        self._reported_at = time.monotonic()
+
+    def get_progress(self) -> Dict[str, Any]:
+        """Get progress, throughput and ETA of the job.
+
+        Throughput covers the current run only, so a resumed job is not
+        credited with files handled before it was interrupted.
+
+        Returns:
+            Dictionary with progress details
+        """
+        elapsed = max(time.monotonic() - self._started_at, 1e-6)
+        files_per_second = self._run_files / elapsed
+        handled = self.completed + len(self.failed)
+
+        progress = None
+        eta_seconds = None
+        if self.total:
+            progress = min(100.0, handled * 100.0 / self.total)
+            if files_per_second > 0:
+                eta_seconds = max(self.total - handled, 0) / files_per_second
+
+        return {
+            "job_id": self.job_id,
+            "completed": self.completed,
+            "failed": len(self.failed),
+            "total": self.total,
+            "progress": progress,
+            "bytes_processed": self.bytes_processed,
+            "files_per_second": round(files_per_second, 2),
+            "bytes_per_second": round(self._run_bytes / elapsed, 2),
+            "eta_seconds": round(eta_seconds, 1) if eta_seconds is not None else None,
+        }
+
+
 class BackupManager:
     """Backup and recovery manager for storage system.
 
@@ -155,6 +413,12 @@ class BackupManager:
         backup_prefix: str = "backups",
         max_concurrent_backups: int = 5,
         verification_enabled: bool = True,
+        source_bucket: str = "skillseekers-skills",
+        task_tracker: Optional["TaskTracker"] = None,
+        packed: bool = False,
+        pack_format: str = "tar",
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        pack_threshold: int = 1024 * 1024,
     ):
         """Initialize backup manager.
 
@@ -164,9 +428,20 @@ class BackupManager:
             database_session: Database session
             backup_bucket: Bucket for storing backups
             backup_prefix: Prefix for backup objects
-            max_concurrent_backups: Maximum concurrent backup operations
+            max_concurrent_backups: Maximum concurrent file copies, checks or
+                restores per backup job
             verification_enabled: Whether to verify backups
+            source_bucket: Bucket holding the skill files
+            task_tracker: Progress tracker for verify and restore jobs
+                (None to not report progress)
+            packed: Whether backups pack small files into segments by default
+            pack_format: Segment format ("tar" or "zip")
+            segment_size: Target size of a segment in bytes
+            pack_threshold: Files larger than this are stored on their own
         """
+        if pack_format not in PACK_FORMATS:
+            raise ValueError(f"Unsupported pack format: {pack_format}")
+
         self.minio_client = minio_client
         self.storage_manager = storage_manager
         self.db = database_session
@@ -174,6 +449,15 @@ class BackupManager:
         self.backup_prefix = backup_prefix
         self.max_concurrent_backups = max_concurrent_backups
         self.verification_enabled = verification_enabled
+        self.source_bucket = source_bucket
+        self.task_tracker = task_tracker
+        self.packed = packed
+        self.pack_format = pack_format
+        self.segment_size = segment_size
+        self.pack_threshold = pack_threshold
+
+        # Identical file content is stored once per backup bucket
+        self.blob_store = BlobStore(minio_client, database_session, backup_bucket)
 
         # Backup schedules
         self.schedules: Dict[str, BackupSchedule] = {}
@@ -188,6 +472,12 @@ class BackupManager:
             "failed_backups": 0,
             "total_files_backed_up": 0,
             "total_backup_size": 0,
+            "files_skipped_unchanged": 0,
+            "files_packed": 0,
+            "segments_written": 0,
+            "files_verified": 0,
+            "files_restored": 0,
+            "jobs_resumed": 0,
             "last_backup_time": None,
         }
 
@@ -215,6 +505,7 @@ class BackupManager:
         skill_id: Optional[UUID] = None,
         backup_type: str = "full",
         verify: Optional[bool] = None,
+        packed: Optional[bool] = None,
     ) -> str:
         """Create a new backup.
 
@@ -222,6 +513,7 @@ class BackupManager:
             skill_id: Skill ID to backup (None for all skills)
             backup_type: Type of backup (full/incremental)
             verify: Whether to verify backup (uses default if None)
+            packed: Whether to pack small files into segments (uses default if None)
 
         Returns:
             Backup ID
@@ -233,21 +525,88 @@ class BackupManager:
 
         # Use default verification setting if not specified
         verify = verify if verify is not None else self.verification_enabled
+        packed = packed if packed is not None else self.packed
 
         logger.info(f"Starting backup {backup_id} (type: {backup_type}, skill: {skill_id})")
 
-        try:
-            # Get files to backup
-            files_to_backup = await self._get_files_to_backup(skill_id, backup_type)
+        started_at = datetime.now(timezone.utc)
+        manifest_files = _JsonLinesSpool()
 
-            if not files_to_backup:
-                logger.warning(f"No files to backup for skill {skill_id}")
+        try:
+            # Incremental backups continue from the last successful backup
+            catalog = None
+            if backup_type == "incremental":
+                catalog = await self._load_backup_catalog(skill_id)
+                if catalog is None:
+                    logger.info(f"No previous backup for skill {skill_id}, backing up all files")
+            since = catalog["watermark"] if catalog else None
+            checksums = dict(catalog["checksums"]) if catalog else {}
+
+            skipped = 0
+
+            def changed_files() -> Iterator[Dict[str, Any]]:
+                nonlocal skipped
+                for file_info in self._iter_files_to_backup(skill_id, since):
+                    if file_info["checksum"] and checksums.get(file_info["file_id"]) == file_info["checksum"]:
+                        skipped += 1
+                        continue
+                    yield file_info
+
+            # Each file is listed in the manifest once its copy has finished,
+            # so the manifest only lists content this backup actually holds
+            failed = 0
+            total_size = 0
+            skills: Set[str] = set()
+            uploads = (
+                self._iter_packed_backup_files(backup_id, changed_files())
+                if packed
+                else self._iter_uploaded_backup_files(backup_id, changed_files())
+            )
+            segments: Set[str] = set()
+            packed_count = 0
+            async for file_info, result in uploads:
+                if isinstance(result, Exception):
+                    failed += 1
+                    continue
+                if file_info.get("segment"):
+                    segments.add(file_info["segment"])
+                    packed_count += 1
+                manifest_files.write(file_info)
+                checksums[file_info["file_id"]] = file_info["checksum"]
+                total_size += file_info["file_size"] or 0
+                skills.add(file_info["skill_id"])
+
+            if not manifest_files.count:
+                if skipped:
+                    logger.info(f"No changed files to backup for skill {skill_id} ({skipped} unchanged)")
+                else:
+                    logger.warning(f"No files to backup for skill {skill_id}")
+                if failed:
+                    raise BackupCreationError(f"All {failed} file copies failed")
                 return backup_id
 
-            # Create backup manifest
-            manifest = await self._create_backup_manifest(backup_id, files_to_backup, backup_type)
+            files_object_name = self._get_backup_object_name(backup_id, MANIFEST_FILES_NAME)
+            await self._upload_backup_stream(files_object_name, manifest_files)
 
-            # Upload backup manifest
+            manifest = {
+                "backup_id": backup_id,
+                "backup_type": backup_type,
+                "skill_id": str(skill_id) if skill_id else None,
+                "created_at": datetime.utcnow().isoformat(),
+                "file_count": manifest_files.count,
+                "total_size": total_size,
+                "total_size_human": format_file_size(total_size),
+                "skills": sorted(skills),
+                "files_object": files_object_name,
+                "files_checksum": manifest_files.checksum,
+                "pack_format": self.pack_format if packed else None,
+                "segment_count": len(segments),
+                "base_backup_id": catalog["backup_id"] if catalog else None,
+                "watermark": started_at.isoformat(),
+                "skipped_unchanged": skipped,
+            }
+
+            # The summary manifest is written last and marks the backup complete
             manifest_object_name = self._get_backup_object_name(backup_id, "manifest.json")
             await self._upload_backup_object(
                 bucket_name=self.backup_bucket,
@@ -256,9 +615,6 @@ class BackupManager:
                 content_type="application/json",
             )
 
-            # Upload files
-            uploaded_files = await self._upload_backup_files(backup_id, files_to_backup)
-
             # Calculate backup checksum
             backup_checksum = await self._calculate_backup_checksum(backup_id, manifest)
 
@@ -266,16 +622,29 @@ class BackupManager:
             if verify:
                 await self._verify_backup(backup_id, manifest, backup_checksum)
 
+            # Files that failed keep the old watermark so the next incremental
+            # backup retries them; copied files are skipped by checksum
+            await self._save_backup_catalog(
+                skill_id,
+                backup_id,
+                started_at if not failed else since,
+                checksums,
+            )
+
             # Update statistics
             self.stats["total_backups"] += 1
             self.stats["successful_backups"] += 1
-            self.stats["total_files_backed_up"] += len(uploaded_files)
-            self.stats["total_backup_size"] += sum(f["size"] for f in uploaded_files)
+            self.stats["total_files_backed_up"] += manifest_files.count
+            self.stats["total_backup_size"] += total_size
+            self.stats["files_skipped_unchanged"] += skipped
+            self.stats["files_packed"] += packed_count
+            self.stats["segments_written"] += len(segments)
             self.stats["last_backup_time"] = datetime.utcnow()
 
             logger.info(
                 f"Backup {backup_id} completed successfully: "
-                f"{len(uploaded_files)} files, {format_file_size(sum(f['size'] for f in uploaded_files))}"
+                f"{manifest_files.count} files, {format_file_size(total_size)}, "
+                f"{skipped} unchanged, {failed} failed"
             )
 
             return backup_id
@@ -286,20 +655,30 @@ class BackupManager:
             logger.error(f"Backup {backup_id} failed: {e}")
             raise BackupCreationError(f"Backup creation failed: {e}")
 
+        finally:
+            manifest_files.close()
+
     async def restore_backup(
         self,
         backup_id: str,
         skill_id: Optional[UUID] = None,
         target_skill_id: Optional[UUID] = None,
         verify: bool = True,
+        job_id: Optional[str] = None,
     ) -> bool:
         """Restore from a backup.
 
+        Files are restored by a bounded pool of workers as a resumable job.
+        Running the restore again with the same arguments after an
+        interruption skips the files already restored and retries the ones
+        that failed.
+
         Args:
             backup_id: Backup ID to restore
             skill_id: Skill ID to restore (None for all in backup)
             target_skill_id: Target skill ID for restore (None for original)
-            verify: Whether to verify restore
+            verify: Whether to check each file against its checksum before restoring it
+            job_id: ID of the job to resume (derived from the arguments if None)
 
         Returns:
             True if restore successful
@@ -312,27 +691,46 @@ class BackupManager:
 
         try:
             # Get backup manifest
-            manifest = await self._get_backup_manifest(backup_id)
+            manifest = await self._get_backup_manifest(backup_id, include_files=False)
 
             if not manifest:
                 raise BackupNotFoundError(f"Backup {backup_id} not found")
 
             # Filter skills if specified
-            skills_to_restore = self._filter_skills_for_restore(manifest, skill_id)
+            skills = {
+                skill["skill_id"] for skill in self._filter_skills_for_restore(manifest, skill_id)
+            }
+            entries = (
+                file_info
+                for file_info in self._iter_manifest_entries(manifest)
+                if self._get_entry_skill_id(manifest, file_info) in skills
+            )
+            total = manifest.get("file_count") if not skill_id or len(manifest.get("skills", [])) == 1 else None
 
-            # Verify backup if requested
-            if verify:
-                await self._verify_backup_integrity(backup_id, manifest)
+            job = await self._start_backup_job(
+                job_id or self._get_job_id("restore", backup_id, skill_id, target_skill_id),
+                backup_id,
+                "restore",
+                total,
+            )
 
-            # Restore skills
-            restored_files = 0
-            for skill_info in skills_to_restore:
-                restored_files += await self._restore_skill_from_backup(
-                    backup_id, skill_info, target_skill_id
+            async def restore(file_info: Dict[str, Any]) -> int:
+                return await self._restore_backup_file(
+                    backup_id, manifest, file_info, target_skill_id, verify
+                )
+
+            await self._run_backup_job(job, entries, restore)
+            self.stats["files_restored"] += job.run_completed
+
+            if job.failed:
+                raise BackupRestoreError(
+                    f"{len(job.failed)} files could not be restored; "
+                    f"run the restore again to resume job {job.job_id}"
                 )
 
             logger.info(
-                f"Restore from backup {backup_id} completed: {restored_files} files"
+                f"Restore from backup {backup_id} completed: {job.completed} files, "
+                f"{format_file_size(job.bytes_processed)}"
             )
 
             return True
@@ -341,11 +739,17 @@ class BackupManager:
             logger.error(f"Restore from backup {backup_id} failed: {e}")
             raise BackupRestoreError(f"Backup restore failed: {e}")
 
-    async def verify_backup(self, backup_id: str) -> Dict[str, Any]:
+    async def verify_backup(self, backup_id: str, job_id: Optional[str] = None) -> Dict[str, Any]:
         """Verify backup integrity.
 
+        Every backed up file is streamed through a SHA-256 checksum by a
+        bounded pool of workers. Verification runs as a resumable job, so
+        running it again after an interruption skips the files already
+        verified.
+
         Args:
             backup_id: Backup ID to verify
+            job_id: ID of the job to resume (derived from the backup ID if None)
 
         Returns:
             Verification results
@@ -357,7 +761,7 @@ class BackupManager:
 
         try:
             # Get backup manifest
-            manifest = await self._get_backup_manifest(backup_id)
+            manifest = await self._get_backup_manifest(backup_id, include_files=False)
 
             if not manifest:
                 raise BackupNotFoundError(f"Backup {backup_id} not found")
@@ -365,21 +769,39 @@ class BackupManager:
             # Verify manifest
             manifest_verified = await self._verify_backup_manifest(backup_id, manifest)
 
-            # Verify files
-            files_verified = await self._verify_backup_files(backup_id, manifest)
-
             # Verify checksum
             checksum_verified = await self._verify_backup_checksum(backup_id, manifest)
 
+            # Verify files
+            file_count = manifest.get("file_count")
+            job = await self._start_backup_job(
+                job_id or self._get_job_id("verify", backup_id),
+                backup_id,
+                "verify",
+                file_count,
+            )
+            await self._run_backup_job(
+                job,
+                self._iter_manifest_entries(manifest),
+                lambda file_info: self._verify_backup_file(backup_id, file_info),
+            )
+            self.stats["files_verified"] += job.run_completed
+
+            files_verified = not job.failed and (file_count is None or job.position == file_count)
+
             results = {
                 "backup_id": backup_id,
+                "job_id": job.job_id,
                 "verified_at": datetime.utcnow().isoformat(),
                 "manifest_verified": manifest_verified,
                 "files_verified": files_verified,
                 "checksum_verified": checksum_verified,
                 "overall_status": "passed" if all([manifest_verified, files_verified, checksum_verified]) else "failed",
-                "file_count": len(manifest.get("files", [])),
-                "verified_file_count": sum(1 for v in files_verified.values() if v),
+                "file_count": file_count if file_count is not None else job.position,
+                "verified_file_count": job.completed,
+                "failed_files": job.failed_paths,
+                "resumed": job.resumed,
+                "files_per_second": job.get_progress()["files_per_second"],
             }
 
             logger.info(f"Backup {backup_id} verification: {results['overall_status']}")
@@ -415,7 +837,7 @@ class BackupManager:
                 bucket_name=self.backup_bucket,
                 prefix=f"{self.backup_prefix}/",
             ):
-                if "manifest.json" not in obj["object_name"]:
+                if not obj["object_name"].endswith("/manifest.json"):
                     continue
 
                 # Parse backup ID from object name
@@ -424,7 +846,7 @@ class BackupManager:
                     backup_id = parts[1]
 
                     # Get manifest
-                    manifest = await self._get_backup_manifest(backup_id)
+                    manifest = await self._get_backup_manifest(backup_id, include_files=False)
 
                     if manifest:
                         # Apply filters
@@ -483,11 +905,23 @@ class BackupManager:
             manifest_object_name = self._get_backup_object_name(backup_id, "manifest.json")
             self.minio_client.remove_object(self.backup_bucket, manifest_object_name)
             deleted_count += 1
+            if manifest.get("files_object"):
+                self.minio_client.remove_object(self.backup_bucket, manifest["files_object"])
+                deleted_count += 1
 
-            # Delete file objects
+            # Delete file objects; shared blobs only drop a reference and
+            # packed files go with their segment
+            segments: Set[str] = set()
             for file_info in manifest.get("files", []):
-                file_object_name = self._get_backup_object_name(backup_id, file_info["backup_path"])
-                self.minio_client.remove_object(self.backup_bucket, file_object_name)
+                if file_info.get("segment"):
+                    if file_info["segment"] not in segments:
+                        segments.add(file_info["segment"])
+                        self.minio_client.remove_object(self.backup_bucket, file_info["segment"])
+                elif file_info.get("backup_object_name"):
+                    await self.blob_store.release(file_info["checksum"])
+                else:
+                    file_object_name = self._get_backup_file_object_name(backup_id, file_info)
+                    self.minio_client.remove_object(self.backup_bucket, file_object_name)
                 deleted_count += 1
 
             logger.info(f"Backup {backup_id} deleted: {deleted_count} objects")
@@ -589,23 +1023,68 @@ class BackupManager:
             List of files to backup
         """
         try:
-            # Build query
-            query = self.db.query(SkillFile)
+            # Incremental backups only look at files changed since the last one
+            since = None
+            if backup_type == "incremental":
+                catalog = await self._load_backup_catalog(skill_id)
+                since = catalog["watermark"] if catalog else None
 
-            if skill_id:
-                query = query.filter(SkillFile.skill_id == skill_id)
+            files_to_backup = list(self._iter_files_to_backup(skill_id, since))
 
-            # For incremental backups, only get recently modified files
-            if backup_type == "incremental":
-                cutoff_date = datetime.utcnow() - timedelta(days=1)
-                query = query.filter(SkillFile.updated_at >= cutoff_date)
+            logger.debug(f"Found {len(files_to_backup)} files to backup")
+
+            return files_to_backup
 
-            files = query.all()
+        except Exception as e:
+            logger.error(f"Get files to backup failed: {e}")
+            raise
 
-            # Convert to list of dictionaries
-            files_to_backup = []
-            for file in files:
-                files_to_backup.append({
+    def _iter_files_to_backup(
+        self,
+        skill_id: Optional[UUID],
+        since: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the files of a backup scope from the database.
+
+        Only the needed columns are selected and rows are read in pages
+        keyed on the file ID, so memory use does not grow with the number
+        of files. Each page is a separate query, so no cursor stays open
+        while the blob store commits between pages, and the order is
+        stable for resuming interrupted jobs.
+
+        Args:
+            skill_id: Skill ID to filter (None for all skills)
+            since: Only include files updated at or after this time
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            File entries for the backup manifest
+        """
+        conditions = []
+        if skill_id:
+            conditions.append(SkillFile.skill_id == skill_id)
+        if since is not None:
+            conditions.append(SkillFile.updated_at >= since)
+
+        query = self.db.query(
+            SkillFile.id,
+            SkillFile.skill_id,
+            SkillFile.file_path,
+            SkillFile.object_name,
+            SkillFile.file_size,
+            SkillFile.checksum,
+            SkillFile.content_type,
+            SkillFile.updated_at,
+        ).filter(*conditions)
+
+        last_id = None
+        while True:
+            page = query if last_id is None else query.filter(SkillFile.id > last_id)
+            rows = page.order_by(SkillFile.id).limit(batch_size).all()
+
+            for file in rows:
+                yield {
                     "file_id": str(file.id),
                     "skill_id": str(file.skill_id),
                     "file_path": file.file_path,
@@ -613,16 +1092,93 @@ class BackupManager:
                     "file_size": file.file_size,
                     "checksum": file.checksum,
                     "content_type": file.content_type,
-                    "modified_at": file.updated_at.isoformat(),
-                })
+                    "modified_at": file.updated_at.isoformat() if file.updated_at else None,
+                    "backup_object_name": (
+                        self.blob_store.object_name_for(file.checksum)
+                        if file.checksum
+                        else None
+                    ),
+                }
 
-            logger.debug(f"Found {len(files_to_backup)} files to backup")
+            if len(rows) < batch_size:
+                break
+            last_id = rows[-1].id
 
-            return files_to_backup
+    def _get_catalog_object_name(self, skill_id: Optional[UUID]) -> str:
+        """Get the object holding the catalog of a backup scope.
+
+        Args:
+            skill_id: Skill ID (None for all skills)
+
+        Returns:
+            Object name in the backup bucket
+        """
+        scope = str(skill_id) if skill_id else "all"
+        return f"{self.backup_prefix}/_catalog/{scope}.jsonl"
+
+    async def _load_backup_catalog(self, skill_id: Optional[UUID]) -> Optional[Dict[str, Any]]:
+        """Load the catalog left by the last successful backup of a scope.
+
+        The catalog holds that backup's watermark and the checksum of every
+        file backed up so far.
+
+        Args:
+            skill_id: Skill ID (None for all skills)
+
+        Returns:
+            Dictionary with backup_id, watermark and checksums, or None if
+            there is no usable catalog
+        """
+        object_name = self._get_catalog_object_name(skill_id)
+
+        def read() -> Dict[str, Any]:
+            lines = self._iter_object_lines(self.backup_bucket, object_name)
+            header = json.loads(next(lines))
+            checksums = {}
+            for line in lines:
+                entry = json.loads(line)
+                checksums[entry["file_id"]] = entry["checksum"]
+            watermark = header.get("watermark")
+            return {
+                "backup_id": header["backup_id"],
+                "watermark": datetime.fromisoformat(watermark) if watermark else None,
+                "checksums": checksums,
+            }
 
+        try:
+            return await asyncio.to_thread(read)
         except Exception as e:
-            logger.error(f"Get files to backup failed: {e}")
-            raise
+            # Without a catalog every file is considered, which is safe
+            logger.debug(f"No backup catalog for skill {skill_id}: {e}")
+            return None
+
+    async def _save_backup_catalog(
+        self,
+        skill_id: Optional[UUID],
+        backup_id: str,
+        watermark: Optional[datetime],
+        checksums: Dict[str, Optional[str]],
+    ) -> None:
+        """Replace the catalog of a backup scope.
+
+        Args:
+            skill_id: Skill ID (None for all skills)
+            backup_id: Backup the catalog belongs to
+            watermark: Time from which the next incremental backup scans
+            checksums: Checksums of the backed up files by file ID
+        """
+        catalog = _JsonLinesSpool()
+        try:
+            catalog.write({
+                "backup_id": backup_id,
+                "skill_id": str(skill_id) if skill_id else None,
+                "watermark": watermark.isoformat() if watermark else None,
+            })
+            for file_id, checksum in checksums.items():
+                catalog.write({"file_id": file_id, "checksum": checksum})
+            await self._upload_backup_stream(self._get_catalog_object_name(skill_id), catalog)
+        finally:
+            catalog.close()
 
     async def _create_backup_manifest(
         self,
@@ -668,6 +1224,42 @@ class BackupManager:
         safe_path = backup_path.replace("/", "_").replace("\\", "_")
         return f"{self.backup_prefix}/{backup_id}/{safe_path}"
 
+    def _get_backup_file_object_name(
+        self,
+        backup_id: str,
+        file_info: Dict[str, Any],
+    ) -> str:
+        """Get the object holding a backed up file.
+
+        Args:
+            backup_id: Backup ID
+            file_info: File entry of the backup manifest
+
+        Returns:
+            Object name in the backup bucket
+        """
+        if file_info.get("backup_object_name"):
+            return file_info["backup_object_name"]
+        return self._get_backup_object_name(backup_id, f"files/{file_info['file_path']}")
+
+    def _get_backup_file_location(
+        self,
+        backup_id: str,
+        file_info: Dict[str, Any],
+    ) -> Tuple[str, int, Optional[int]]:
+        """Get the byte range holding a backed up file.
+
+        Args:
+            backup_id: Backup ID
+            file_info: File entry of the backup manifest
+
+        Returns:
+            (object name, offset, length); a length of None means the whole object
+        """
+        if file_info.get("segment"):
+            return file_info["segment"], file_info["offset"], file_info["file_size"]
+        return self._get_backup_file_object_name(backup_id, file_info), 0, None
+
     async def _upload_backup_object(
         self,
         bucket_name: str,
@@ -700,46 +1292,272 @@ class BackupManager:
 
         return True
 
+    async def _upload_backup_stream(self, object_name: str, spool: _JsonLinesSpool) -> None:
+        """Upload a spooled JSON Lines object to the backup bucket.
+
+        Args:
+            object_name: Object name
+            spool: Spooled records
+        """
+        length = spool.size
+        spool.file.seek(0)
+        with self.minio_client.operation_context(f"upload_backup_{object_name}"):
+            await asyncio.to_thread(
+                self.minio_client.put_object,
+                bucket_name=self.backup_bucket,
+                object_name=object_name,
+                data=spool.file,
+                length=length,
+                content_type="application/x-ndjson",
+            )
+
+    def _iter_object_lines(self, bucket_name: str, object_name: str) -> Iterator[bytes]:
+        """Stream the lines of an object.
+
+        Args:
+            bucket_name: Bucket name
+            object_name: Object name
+
+        Yields:
+            Non-empty lines
+        """
+        response = self.minio_client.get_object(bucket_name=bucket_name, object_name=object_name)
+        try:
+            for line in response:
+                if line.strip():
+                    yield line
+        finally:
+            self._release_response(response)
+
+    @staticmethod
+    def _release_response(response: Any) -> None:
+        """Close an object response and return its connection to the pool.
+
+        Args:
+            response: Response returned by get_object
+        """
+        response.close()
+        release_conn = getattr(response, "release_conn", None)
+        if release_conn is not None:
+            release_conn()
+
     async def _upload_backup_files(
         self,
         backup_id: str,
-        files: List[Dict[str, Any]],
+        files: Iterable[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
         """Upload backup files to MinIO.
 
         Args:
             backup_id: Backup ID
-            files: List of files to upload
+            files: Files to upload
 
         Returns:
             List of uploaded files with metadata
         """
         uploaded_files = []
+        async for _, result in self._iter_uploaded_backup_files(backup_id, files):
+            if not isinstance(result, Exception):
+                uploaded_files.append(result)
+        return uploaded_files
 
-        # Process files in batches to limit concurrent operations
-        batch_size = min(self.max_concurrent_backups, len(files))
+    async def _iter_uploaded_backup_files(
+        self,
+        backup_id: str,
+        files: Iterable[Dict[str, Any]],
+    ) -> AsyncIterator[Tuple[Dict[str, Any], Union[Dict[str, Any], Exception]]]:
+        """Copy backup files through a sliding window of workers.
 
-        for i in range(0, len(files), batch_size):
-            batch = files[i:i + batch_size]
-            tasks = []
+        Args:
+            backup_id: Backup ID
+            files: Files to upload
 
-            for file_info in batch:
-                task = asyncio.create_task(
-                    self._upload_single_backup_file(backup_id, file_info)
-                )
-                tasks.append(task)
+        Yields:
+            (file entry, uploaded file metadata or the exception raised)
+        """
+        async for file_info, result in self._iter_windowed(
+            files, lambda file_info: self._upload_single_backup_file(backup_id, file_info)
+        ):
+            if isinstance(result, Exception):
+                logger.error(f"Backup file upload failed: {result}")
+            yield file_info, result
+
+    async def _iter_packed_backup_files(
+        self,
+        backup_id: str,
+        files: Iterable[Dict[str, Any]],
+    ) -> AsyncIterator[Tuple[Dict[str, Any], Union[Dict[str, Any], Exception]]]:
+        """Pack small backup files into segments through the worker window.
 
-            # Wait for batch to complete
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        Files up to pack_threshold are batched into segments of about
+        segment_size; larger files are copied on their own. Each segment is
+        one worker task and one PUT.
 
-            # Collect results
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Backup file upload failed: {result}")
-                else:
-                    uploaded_files.append(result)
+        Args:
+            backup_id: Backup ID
+            files: Files to upload
 
-        return uploaded_files
+        Yields:
+            (file entry, uploaded file metadata or the exception raised);
+            entries of packed files carry their segment and offset
+        """
+        def units() -> Iterator[Tuple[Optional[int], List[Dict[str, Any]]]]:
+            number = 0
+            batch: List[Dict[str, Any]] = []
+            batch_size = 0
+            for file_info in files:
+                size = file_info["file_size"] or 0
+                if size > self.pack_threshold:
+                    yield None, [file_info]
+                    continue
+                batch.append(file_info)
+                batch_size += size
+                if batch_size >= self.segment_size:
+                    yield number, batch
+                    number += 1
+                    batch = []
+                    batch_size = 0
+            if batch:
+                yield number, batch
+
+        async def upload(unit: Tuple[Optional[int], List[Dict[str, Any]]]) -> List[Tuple[Dict[str, Any], Any]]:
+            number, batch = unit
+            if number is None:
+                return [(batch[0], await self._upload_single_backup_file(backup_id, batch[0]))]
+            return await asyncio.to_thread(self._upload_backup_segment, backup_id, number, batch)
+
+        async for (_, batch), results in self._iter_windowed(units(), upload):
+            if isinstance(results, Exception):
+                logger.error(f"Backup upload of {len(batch)} files failed: {results}")
+                results = [(file_info, results) for file_info in batch]
+            for file_info, result in results:
+                yield file_info, result
+
+    def _upload_backup_segment(
+        self,
+        backup_id: str,
+        number: int,
+        files: List[Dict[str, Any]],
+    ) -> List[Tuple[Dict[str, Any], Union[Dict[str, Any], Exception]]]:
+        """Stream source files into a segment and upload it with one PUT.
+
+        A file that cannot be read is left out of the segment; any other
+        error fails the whole segment. Runs in a worker thread.
+
+        Args:
+            backup_id: Backup ID
+            number: Segment number within the backup
+            files: Files to pack
+
+        Returns:
+            (file entry with its segment location, uploaded file metadata or
+            the exception raised) for every file
+        """
+        object_name = self._get_backup_object_name(
+            backup_id, f"segments/{number:06d}.{self.pack_format}"
+        )
+        writer = SegmentWriter(self.pack_format)
+        results: List[Tuple[Dict[str, Any], Union[Dict[str, Any], Exception]]] = []
+        packed: List[Dict[str, Any]] = []
+
+        try:
+            for file_info in files:
+                try:
+                    response = self.minio_client.get_object(
+                        bucket_name=self.source_bucket,
+                        object_name=file_info["object_name"],
+                    )
+                except Exception as e:
+                    logger.error(f"Read {file_info['file_path']} for backup failed: {e}")
+                    results.append((file_info, e))
+                    continue
+
+                try:
+                    offset, size, checksum = writer.add(
+                        f"{file_info['skill_id']}/{file_info['file_path']}",
+                        response,
+                        file_info["file_size"],
+                    )
+                finally:
+                    self._release_response(response)
+
+                packed.append({
+                    **file_info,
+                    "file_size": size,
+                    "checksum": checksum,
+                    "backup_object_name": None,
+                    "segment": object_name,
+                    "offset": offset,
+                })
+
+            if packed:
+                data = writer.finish()
+                with self.minio_client.operation_context(f"upload_backup_{object_name}"):
+                    self.minio_client.put_object(
+                        bucket_name=self.backup_bucket,
+                        object_name=object_name,
+                        data=data,
+                        length=writer.size,
+                        content_type=writer.content_type,
+                    )
+                logger.debug(f"Backed up {len(packed)} files in segment {object_name}")
+
+        finally:
+            writer.close()
+
+        for file_info in packed:
+            results.append((file_info, {
+                "file_id": file_info["file_id"],
+                "backup_path": f"{object_name}@{file_info['offset']}",
+                "size": file_info["file_size"],
+                "checksum": file_info["checksum"],
+            }))
+        return results
+
+    async def _iter_windowed(
+        self,
+        items: Iterable[Any],
+        worker: Callable[[Any], Awaitable[Any]],
+    ) -> AsyncIterator[Tuple[Any, Any]]:
+        """Run a worker over items through a sliding window of tasks.
+
+        At most max_concurrent_backups workers run at once and a new one
+        starts as soon as any running one finishes, so one slow item does not
+        hold up the others. Items are pulled from the input lazily and
+        results are yielded in completion order.
+
+        Args:
+            items: Items to process
+            worker: Coroutine function called with each item
+
+        Yields:
+            (item, worker result or the exception raised)
+        """
+        items = iter(items)
+        pending: Dict[asyncio.Task, Any] = {}
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_concurrent_backups:
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.create_task(worker(item))] = item
+
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = pending.pop(task)
+                    error = task.exception()
+                    yield item, error if error is not None else task.result()
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def _upload_single_backup_file(
         self,
@@ -758,25 +1576,27 @@ class BackupManager:
         try:
             # Generate backup path
             backup_path = f"files/{file_info['file_path']}"
-            backup_object_name = self._get_backup_object_name(backup_id, backup_path)
-
-            # Download file from source
-            file_response = self.minio_client.get_object(
-                bucket_name="skillseekers-skills",  # Source bucket
-                object_name=file_info["object_name"],
-            )
 
-            # Upload to backup bucket
-            await self._upload_backup_object(
-                bucket_name=self.backup_bucket,
-                object_name=backup_object_name,
-                data=file_response,
-                content_type=file_info["content_type"],
-            )
+            if file_info.get("backup_object_name"):
+                # Reference the content blob, copying it server-side if new
+                await self.blob_store.adopt(
+                    file_info["object_name"],
+                    file_info["checksum"],
+                    file_info["file_size"],
+                    content_type=file_info["content_type"],
+                    source_bucket=self.source_bucket,
+                )
+            else:
+                await asyncio.to_thread(
+                    self._copy_backup_file,
+                    file_info,
+                    self._get_backup_object_name(backup_id, backup_path),
+                )
 
             logger.debug(f"Backed up file: {file_info['file_path']}")
 
             return {
+                "file_id": file_info["file_id"],
                 "backup_path": backup_path,
                 "size": file_info["file_size"],
                 "checksum": file_info["checksum"],
@@ -786,6 +1606,42 @@ class BackupManager:
             logger.error(f"Upload backup file {file_info['file_path']} failed: {e}")
             raise
 
+    def _copy_backup_file(self, file_info: Dict[str, Any], object_name: str) -> None:
+        """Copy a source file into the backup bucket.
+
+        Copies server-side when possible and otherwise streams the object
+        through without buffering it. Runs in a worker thread.
+
+        Args:
+            file_info: File entry of the backup manifest
+            object_name: Destination object name
+        """
+        with self.minio_client.operation_context(f"copy_backup_{object_name}"):
+            try:
+                self.minio_client.copy_object(
+                    bucket_name=self.backup_bucket,
+                    object_name=object_name,
+                    source=CopySource(self.source_bucket, file_info["object_name"]),
+                )
+                return
+            except Exception as e:
+                logger.debug(f"Server-side copy of {file_info['object_name']} failed, streaming: {e}")
+
+            response = self.minio_client.get_object(
+                bucket_name=self.source_bucket,
+                object_name=file_info["object_name"],
+            )
+            try:
+                self.minio_client.put_object(
+                    bucket_name=self.backup_bucket,
+                    object_name=object_name,
+                    data=response,
+                    length=file_info["file_size"],
+                    content_type=file_info["content_type"],
+                )
+            finally:
+                self._release_response(response)
+
     async def _calculate_backup_checksum(
         self,
         backup_id: str,
@@ -831,9 +1687,9 @@ class BackupManager:
                 f"expected {checksum}, got {manifest_checksum}"
             )
 
-        # Verify file count
-        files = manifest.get("files", [])
-        if len(files) != manifest.get("file_count"):
+        # Verify file count (JSON Lines manifests are checked by verify_backup)
+        files = manifest.get("files")
+        if files is not None and len(files) != manifest.get("file_count"):
             raise BackupVerificationError(
                 f"Backup {backup_id} file count mismatch"
             )
@@ -842,11 +1698,16 @@ class BackupManager:
 
         return True
 
-    async def _get_backup_manifest(self, backup_id: str) -> Optional[Dict[str, Any]]:
+    async def _get_backup_manifest(
+        self,
+        backup_id: str,
+        include_files: bool = True,
+    ) -> Optional[Dict[str, Any]]:
         """Get backup manifest.
 
         Args:
             backup_id: Backup ID
+            include_files: Whether to load the file list of JSON Lines manifests
 
         Returns:
             Backup manifest or None
@@ -860,12 +1721,31 @@ class BackupManager:
             )
 
             manifest_data = response.read().decode("utf-8")
-            return json.loads(manifest_data)
+            manifest = json.loads(manifest_data)
+
+            if include_files and "files" not in manifest and manifest.get("files_object"):
+                manifest["files"] = await asyncio.to_thread(
+                    lambda: list(self._iter_manifest_files(manifest))
+                )
+
+            return manifest
 
         except Exception as e:
             logger.error(f"Get backup manifest {backup_id} failed: {e}")
             return None
 
+    def _iter_manifest_files(self, manifest: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Stream the file entries of a JSON Lines manifest.
+
+        Args:
+            manifest: Summary manifest
+
+        Yields:
+            File entries
+        """
+        for line in self._iter_object_lines(self.backup_bucket, manifest["files_object"]):
+            yield json.loads(line)
+
     def _filter_skills_for_restore(
         self,
         manifest: Dict[str, Any],
@@ -892,103 +1772,395 @@ class BackupManager:
         # Return all skills
         return [{"skill_id": skill, "files": manifest.get("files", [])} for skill in skills]
 
-    async def _verify_backup_integrity(
+    def _iter_manifest_entries(self, manifest: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Stream the file entries of a manifest in manifest order.
+
+        Args:
+            manifest: Backup manifest, with or without its file list loaded
+
+        Yields:
+            File entries
+        """
+        if "files" in manifest:
+            yield from manifest["files"]
+        elif manifest.get("files_object"):
+            yield from self._iter_manifest_files(manifest)
+
+    def _get_entry_skill_id(self, manifest: Dict[str, Any], file_info: Dict[str, Any]) -> Optional[str]:
+        """Get the skill a manifest entry belongs to.
+
+        Entries of older manifests carry no skill ID; they belong to the only
+        skill of a single-skill backup.
+
+        Args:
+            manifest: Backup manifest
+            file_info: File entry
+
+        Returns:
+            Skill ID or None if unknown
+        """
+        if file_info.get("skill_id"):
+            return str(file_info["skill_id"])
+        skills = manifest.get("skills", [])
+        return skills[0] if len(skills) == 1 else None
+
+    def _get_job_id(self, operation: str, backup_id: str, *arguments: Any) -> str:
+        """Derive the ID of a verify or restore job from its arguments.
+
+        The same arguments always give the same ID, so running an interrupted
+        job again resumes it.
+
+        Args:
+            operation: "verify" or "restore"
+            backup_id: Backup ID
+            *arguments: Further job arguments (None for unset)
+
+        Returns:
+            Job ID
+        """
+        job_id = f"{operation}-{backup_id}"
+        if any(argument is not None for argument in arguments):
+            key = ":".join("" if argument is None else str(argument) for argument in arguments)
+            job_id += "-" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+        return job_id
+
+    def _get_job_object_name(self, backup_id: str, job_id: str) -> str:
+        """Get the object holding the checkpoint of a job.
+
+        Args:
+            backup_id: Backup ID
+            job_id: Job ID
+
+        Returns:
+            Object name in the backup bucket
+        """
+        return self._get_backup_object_name(backup_id, f"jobs/{job_id}.json")
+
+    async def _start_backup_job(
         self,
+        job_id: str,
         backup_id: str,
-        manifest: Dict[str, Any],
-    ) -> bool:
-        """Verify backup integrity before restore.
+        operation: str,
+        total: Optional[int],
+    ) -> _BackupJob:
+        """Resume a job from its checkpoint, or start it afresh.
 
         Args:
+            job_id: Job ID
             backup_id: Backup ID
-            manifest: Backup manifest
+            operation: "verify" or "restore"
+            total: Number of files the job covers, if known
 
         Returns:
-            True if integrity verified
+            _BackupJob instance
         """
-        # Verify manifest exists
-        manifest_object_name = self._get_backup_object_name(backup_id, "manifest.json")
+        object_name = self._get_job_object_name(backup_id, job_id)
 
-        try:
-            self.minio_client.stat_object(
+        def read() -> Dict[str, Any]:
+            response = self.minio_client.get_object(
                 bucket_name=self.backup_bucket,
-                object_name=manifest_object_name,
+                object_name=object_name,
             )
-        except Exception:
-            raise BackupVerificationError(f"Backup manifest {backup_id} not found")
+            try:
+                return json.loads(response.read())
+            finally:
+                self._release_response(response)
 
-        # Verify file count
-        files = manifest.get("files", [])
-        for file_info in files:
-            backup_path = f"files/{file_info['file_path']}"
-            file_object_name = self._get_backup_object_name(backup_id, backup_path)
+        job = None
+        try:
+            data = await asyncio.to_thread(read)
+            if (data.get("job_id"), data.get("backup_id"), data.get("operation")) == (job_id, backup_id, operation):
+                job = _BackupJob.from_dict(data, total)
+        except Exception as e:
+            logger.debug(f"No checkpoint for job {job_id}: {e}")
+
+        if job is None:
+            job = _BackupJob(job_id, backup_id, operation, total)
+        elif job.resumed:
+            self.stats["jobs_resumed"] += 1
+            logger.info(
+                f"Resuming {operation} job {job_id}: {job.completed} files done, "
+                f"{len(job.failed)} to retry"
+            )
 
+        if self.task_tracker is not None:
             try:
-                self.minio_client.stat_object(
-                    bucket_name=self.backup_bucket,
-                    object_name=file_object_name,
-                )
-            except Exception:
-                raise BackupVerificationError(
-                    f"Backup file {file_info['file_path']} not found"
-                )
+                from app.progress.schemas.progress_operations import CreateTaskRequest
+
+                try:
+                    await self.task_tracker.get_task(job_id)
+                except Exception:
+                    # Not tracked yet, or forgotten since the job was interrupted
+                    await self.task_tracker.create_task(
+                        CreateTaskRequest(
+                            task_id=job_id,
+                            user_id="system",
+                            task_type=f"backup_{operation}",
+                            task_name=f"{operation.capitalize()} backup {backup_id}",
+                            metadata={"backup_id": backup_id},
+                            tags=["backup"],
+                        )
+                    )
+            except Exception as e:
+                logger.warning(f"Register progress task {job_id} failed: {e}")
 
-        logger.info(f"Backup {backup_id} integrity verified")
+        await self._report_job_progress(job, "running")
+        return job
 
-        return True
+    async def _run_backup_job(
+        self,
+        job: _BackupJob,
+        entries: Iterable[Dict[str, Any]],
+        worker: Callable[[Dict[str, Any]], Awaitable[int]],
+    ) -> None:
+        """Run a job's worker over the files it has not handled yet.
+
+        The checkpoint is saved periodically and whenever the job stops
+        short, including on cancellation; it is removed once every file has
+        been handled successfully.
+
+        Args:
+            job: Job to run
+            entries: Manifest entries, in manifest order
+            worker: Coroutine function handling one entry and returning its size
+        """
+        pending = (
+            (index, file_info)
+            for index, file_info in enumerate(entries)
+            if job.is_pending(index)
+        )
+        status = "failed"
+
+        try:
+            async for (index, file_info), result in self._iter_windowed(
+                pending, lambda item: worker(item[1])
+            ):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        f"{job.operation.capitalize()} of backup file "
+                        f"{file_info.get('file_path')} failed: {result}"
+                    )
+                    job.record(index, file_info.get("file_path"), error=result)
+                else:
+                    job.record(index, file_info.get("file_path"), size=result or 0)
 
-    async def _restore_skill_from_backup(
+                if job.checkpoint_due():
+                    await self._save_backup_job(job)
+                if job.report_due():
+                    await self._report_job_progress(job, "running")
+
+            status = "failed" if job.failed else "completed"
+
+        finally:
+            if status == "completed":
+                job.total = job.position
+                await self._delete_backup_job(job)
+            else:
+                await self._save_backup_job(job)
+            await self._report_job_progress(job, status)
+
+    async def _save_backup_job(self, job: _BackupJob) -> None:
+        """Save the checkpoint of a job.
+
+        A checkpoint that cannot be written only costs repeated work on
+        resume, so errors are logged and not raised.
+
+        Args:
+            job: Job to save
+        """
+        data = json.dumps(job.to_dict()).encode("utf-8")
+        try:
+            await asyncio.to_thread(
+                self.minio_client.put_object,
+                bucket_name=self.backup_bucket,
+                object_name=self._get_job_object_name(job.backup_id, job.job_id),
+                data=data,
+                length=len(data),
+                content_type="application/json",
+            )
+            job.mark_saved()
+        except Exception as e:
+            logger.warning(f"Save checkpoint of job {job.job_id} failed: {e}")
+
+    async def _delete_backup_job(self, job: _BackupJob) -> None:
+        """Remove the checkpoint of a finished job.
+
+        Args:
+            job: Finished job
+        """
+        try:
+            await asyncio.to_thread(
+                self.minio_client.remove_object,
+                self.backup_bucket,
+                self._get_job_object_name(job.backup_id, job.job_id),
+            )
+        except Exception as e:
+            logger.debug(f"Remove checkpoint of job {job.job_id} failed: {e}")
+
+    async def _report_job_progress(self, job: _BackupJob, status: str) -> None:
+        """Report progress, throughput and ETA of a job to the task tracker.
+
+        Args:
+            job: Job to report
+            status: Task status ("running", "completed" or "failed")
+        """
+        job.mark_reported()
+        if self.task_tracker is None:
+            return
+
+        progress = job.get_progress()
+        total = progress["total"] if progress["total"] is not None else "?"
+        try:
+            from app.progress.schemas.progress_operations import UpdateProgressRequest
+
+            await self.task_tracker.update_task_progress(
+                UpdateProgressRequest(
+                    task_id=job.job_id,
+                    progress=progress["progress"] or 0.0,
+                    status=status,
+                    current_step=f"{job.operation.capitalize()} files",
+                    message=(
+                        f"{progress['completed']}/{total} files, {progress['failed']} failed, "
+                        f"{progress['files_per_second']} files/s"
+                    ),
+                    metadata=progress,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Report progress of job {job.job_id} failed: {e}")
+
+    def _stream_backup_file(
         self,
-        backup_id: str,
-        skill_info: Dict[str, Any],
-        target_skill_id: Optional[UUID],
-    ) -> int:
-        """Restore skill from backup.
+        object_name: str,
+        target: Optional[BinaryIO] = None,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> Tuple[str, int]:
+        """Stream a backup object through a SHA-256 checksum.
+
+        The object is read in blocks and never held in memory whole. Runs in
+        a worker thread.
+
+        Args:
+            object_name: Object name in the backup bucket
+            target: File object the content is copied to, if any
+            offset: Start of the byte range to read
+            length: Length of the byte range (None for the whole object)
+
+        Returns:
+            (SHA-256 checksum, size in bytes)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        if length == 0:
+            return digest.hexdigest(), 0
+
+        # Packed files are read with a range request on their segment
+        byte_range = {"offset": offset, "length": length} if length is not None else {}
+        response = self.minio_client.get_object(
+            bucket_name=self.backup_bucket,
+            object_name=object_name,
+            **byte_range,
+        )
+        try:
+            while True:
+                chunk = response.read(_STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                size += len(chunk)
+                if target is not None:
+                    target.write(chunk)
+        finally:
+            self._release_response(response)
+        return digest.hexdigest(), size
+
+    async def _verify_backup_file(self, backup_id: str, file_info: Dict[str, Any]) -> int:
+        """Check a backed up file against its manifest checksum.
+
+        Files recorded without a checksum are only checked for existence.
 
         Args:
             backup_id: Backup ID
-            skill_info: Skill information
-            target_skill_id: Target skill ID
+            file_info: File entry of the backup manifest
 
         Returns:
-            Number of files restored
+            Size of the file in bytes
+
+        Raises:
+            BackupVerificationError: If the content does not match its checksum
         """
-        skill_id = skill_info["skill_id"]
-        files = skill_info["files"]
-        restored_count = 0
+        object_name, offset, length = self._get_backup_file_location(backup_id, file_info)
 
-        for file_info in files:
-            try:
-                # Download from backup
-                backup_path = f"files/{file_info['file_path']}"
-                backup_object_name = self._get_backup_object_name(backup_id, backup_path)
+        if not file_info.get("checksum"):
+            await asyncio.to_thread(self.minio_client.stat_object, self.backup_bucket, object_name)
+            return file_info.get("file_size") or 0
 
-                file_response = self.minio_client.get_object(
-                    bucket_name=self.backup_bucket,
-                    object_name=backup_object_name,
-                )
+        checksum, size = await asyncio.to_thread(
+            self._stream_backup_file, object_name, None, offset, length
+        )
+        if checksum != file_info["checksum"]:
+            raise BackupVerificationError(
+                f"Backup file {file_info['file_path']} checksum mismatch: "
+                f"expected {file_info['checksum']}, got {checksum}"
+            )
+        return size
 
-                # Upload to target location
-                target_skill = target_skill_id or UUID(skill_id)
+    async def _restore_backup_file(
+        self,
+        backup_id: str,
+        manifest: Dict[str, Any],
+        file_info: Dict[str, Any],
+        target_skill_id: Optional[UUID],
+        verify: bool,
+    ) -> int:
+        """Restore a single file from a backup.
 
-                # Use storage manager to restore file
-                await self.storage_manager.upload_file(
-                    request=self.storage_manager.upload_request_class(
-                        skill_id=target_skill,
-                        file_path=file_info["file_path"],
-                        content_type=file_info["content_type"],
-                    ),
-                    file_data=file_response,
-                )
+        The content is spooled while its checksum is computed, so a corrupt
+        file is rejected before anything is written to the skill.
 
-                restored_count += 1
+        Args:
+            backup_id: Backup ID
+            manifest: Backup manifest
+            file_info: File entry of the backup manifest
+            target_skill_id: Target skill ID (None for the file's own skill)
+            verify: Whether to check the content against its checksum
 
-            except Exception as e:
-                logger.error(f"Restore file {file_info['file_path']} failed: {e}")
+        Returns:
+            Size of the restored file in bytes
+        """
+        skill_id = target_skill_id or self._get_entry_skill_id(manifest, file_info)
+        if skill_id is None:
+            raise BackupRestoreError(f"No skill recorded for backup file {file_info['file_path']}")
 
-        logger.info(f"Restored {restored_count} files for skill {skill_id}")
+        object_name, offset, length = self._get_backup_file_location(backup_id, file_info)
+        spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY)
+        try:
+            checksum, size = await asyncio.to_thread(
+                self._stream_backup_file, object_name, spool, offset, length
+            )
+            if verify and file_info.get("checksum") and checksum != file_info["checksum"]:
+                raise BackupVerificationError(
+                    f"Backup file {file_info['file_path']} checksum mismatch: "
+                    f"expected {file_info['checksum']}, got {checksum}"
+                )
+
+            spool.seek(0)
+            result = await self.storage_manager.upload_file(
+                request=FileUploadRequest(
+                    skill_id=UUID(str(skill_id)),
+                    file_path=file_info["file_path"],
+                    content_type=file_info.get("content_type") or "application/octet-stream",
+                ),
+                file_data=spool,
+            )
+            if not result.success:
+                raise BackupRestoreError(result.error or "upload failed")
 
-        return restored_count
+            logger.debug(f"Restored file {file_info['file_path']} to skill {skill_id}")
+            return size
+        finally:
+            spool.close()
 
     async def _verify_backup_manifest(
         self,
@@ -1006,19 +2178,24 @@ class BackupManager:
         """
         try:
             # Check required fields
-            required_fields = ["backup_id", "backup_type", "created_at", "files"]
+            required_fields = ["backup_id", "backup_type", "created_at"]
             for field in required_fields:
                 if field not in manifest:
                     logger.error(f"Backup manifest missing field: {field}")
                     return False
 
+            # The file list is inline or in a JSON Lines object
+            if "files" not in manifest and not manifest.get("files_object"):
+                logger.error("Backup manifest missing field: files")
+                return False
+
             # Verify backup ID
             if manifest["backup_id"] != backup_id:
                 logger.error(f"Backup manifest ID mismatch")
                 return False
 
             # Verify files list
-            if not isinstance(manifest["files"], list):
+            if "files" in manifest and not isinstance(manifest["files"], list):
                 logger.error(f"Backup manifest files is not a list")
                 return False
 
@@ -1035,6 +2212,9 @@ class BackupManager:
     ) -> Dict[str, bool]:
         """Verify backup files.
 
+        Files are checked in parallel and without a checkpoint; verify_backup
+        runs the same check as a resumable job.
+
         Args:
             backup_id: Backup ID
             manifest: Backup manifest
@@ -1044,22 +2224,13 @@ class BackupManager:
         """
         results = {}
 
-        for file_info in manifest.get("files", []):
-            try:
-                backup_path = f"files/{file_info['file_path']}"
-                file_object_name = self._get_backup_object_name(backup_id, backup_path)
-
-                # Check if object exists
-                self.minio_client.stat_object(
-                    bucket_name=self.backup_bucket,
-                    object_name=file_object_name,
-                )
-
-                results[file_info["file_path"]] = True
-
-            except Exception as e:
-                logger.warning(f"Verify backup file {file_info['file_path']} failed: {e}")
-                results[file_info["file_path"]] = False
+        async for file_info, result in self._iter_windowed(
+            self._iter_manifest_entries(manifest),
+            lambda file_info: self._verify_backup_file(backup_id, file_info),
+        ):
+            if isinstance(result, Exception):
+                logger.warning(f"Verify backup file {file_info['file_path']} failed: {result}")
+            results[file_info["file_path"]] = not isinstance(result, Exception)
 
         return results
 
@@ -1070,6 +2241,9 @@ class BackupManager:
     ) -> bool:
         """Verify backup checksum.
 
+        JSON Lines manifests are streamed through the checksum recorded for
+        them; older manifests carry a checksum of the manifest itself.
+
         Args:
             backup_id: Backup ID
             manifest: Backup manifest
@@ -1078,10 +2252,14 @@ class BackupManager:
             True if checksum verified
         """
         try:
-            manifest_checksum = await self._calculate_backup_checksum(backup_id, manifest)
-            expected_checksum = manifest.get("checksum")
+            if manifest.get("files_object") and manifest.get("files_checksum"):
+                checksum, _ = await asyncio.to_thread(self._stream_backup_file, manifest["files_object"])
+                expected_checksum = manifest["files_checksum"]
+            else:
+                checksum = await self._calculate_backup_checksum(backup_id, manifest)
+                expected_checksum = manifest.get("checksum")
 
-            if expected_checksum and manifest_checksum == expected_checksum:
+            if expected_checksum and checksum == expected_checksum:
                 return True
 
             logger.warning(f"Backup {backup_id} checksum mismatch")
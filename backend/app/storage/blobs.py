@@ -0,0 +1,375 @@
+"""BlobStore - Content-addressed object storage for MinIO.
+
+This module provides the BlobStore class which stores object content once
+per SHA-256 checksum and bucket. Records that hold identical content (files,
+copies, versions, backups) share one object and take a reference on it;
+objects are only removed by the garbage collector once nothing references
+them any more.
+
+Reference counts are only ever over-counted on failures, never under-counted,
+so a crash can leak a blob but never lose referenced content.
+"""
+
+import io
+import logging
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .client import MinIOClient, CopySource
+from .models import ContentBlob
+from .utils.checksum import calculate_sha256
+from .utils.formatters import format_file_size
+
+logger = logging.getLogger(__name__)
+
+
+class BlobStoreError(Exception):
+    """Raised when a blob operation fails."""
+    pass
+
+
+class BlobStore:
+    """Reference-counted content-addressed store in a single bucket."""
+
+    def __init__(
+        self,
+        minio_client: MinIOClient,
+        database_session: Session,
+        bucket_name: str,
+        prefix: str = "blobs",
+        gc_grace_period: timedelta = timedelta(hours=1),
+    ):
+        """Initialize blob store.
+
+        Args:
+            minio_client: MinIO client instance
+            database_session: SQLAlchemy database session
+            bucket_name: Bucket holding the blobs
+            prefix: Object name prefix for blobs
+            gc_grace_period: Time an unreferenced blob is kept before collection
+        """
+        self.minio_client = minio_client
+        self.db = database_session
+        self.bucket_name = bucket_name
+        self.prefix = prefix.rstrip("/")
+        self.gc_grace_period = gc_grace_period
+
+        self._stats = {
+            "uploads": 0,
+            "deduplicated": 0,
+            "bytes_uploaded": 0,
+            "bytes_deduplicated": 0,
+            "collected": 0,
+            "bytes_reclaimed": 0,
+        }
+
+    def object_name_for(self, checksum: str) -> str:
+        """Get the object name of a blob.
+
+        Args:
+            checksum: SHA-256 checksum
+
+        Returns:
+            Object name in the blob bucket
+        """
+        return f"{self.prefix}/{checksum[:2]}/{checksum}"
+
+    def owns(self, object_name: Optional[str]) -> bool:
+        """Check whether an object name belongs to this store.
+
+        Args:
+            object_name: Object name
+
+        Returns:
+            True if the object is a blob of this store
+        """
+        return bool(object_name) and object_name.startswith(f"{self.prefix}/")
+
+    def get(self, checksum: str) -> Optional[ContentBlob]:
+        """Get a blob record.
+
+        Args:
+            checksum: SHA-256 checksum
+
+        Returns:
+            ContentBlob instance or None
+        """
+        return (
+            self.db.query(ContentBlob)
+            .filter(
+                and_(
+                    ContentBlob.bucket_name == self.bucket_name,
+                    ContentBlob.checksum == checksum,
+                )
+            )
+            .first()
+        )
+
+    async def store(
+        self,
+        data: Union[bytes, BinaryIO],
+        checksum: Optional[str] = None,
+        size: Optional[int] = None,
+        content_type: Optional[str] = None,
+    ) -> ContentBlob:
+        """Store content and take a reference on its blob.
+
+        Content that already exists is not uploaded again.
+
+        Args:
+            data: Content bytes or file-like object
+            checksum: Precomputed SHA-256 checksum
+            size: Precomputed content size
+            content_type: MIME type recorded for a new blob
+
+        Returns:
+            Referenced ContentBlob
+
+        Raises:
+            BlobStoreError: If the blob cannot be stored
+        """
+        if size is None:
+            if isinstance(data, bytes):
+                size = len(data)
+            else:
+                data.seek(0, 2)
+                size = data.tell()
+                data.seek(0)
+        if checksum is None:
+            checksum = calculate_sha256(data)
+            if not isinstance(data, bytes):
+                data.seek(0)
+
+        blob = await self.acquire(checksum)
+        if blob is not None:
+            self._stats["deduplicated"] += 1
+            self._stats["bytes_deduplicated"] += size
+            logger.debug(f"Deduplicated blob {checksum} ({format_file_size(size)})")
+            return blob
+
+        object_name = self.object_name_for(checksum)
+        stream = io.BytesIO(data) if isinstance(data, bytes) else data
+        with self.minio_client.operation_context(f"store_blob_{checksum}"):
+            self.minio_client.put_object(
+                bucket_name=self.bucket_name,
+                object_name=object_name,
+                data=stream,
+                length=size,
+                content_type=content_type,
+            )
+
+        return await self._insert(checksum, object_name, size, content_type)
+
+    async def adopt(
+        self,
+        object_name: str,
+        checksum: str,
+        size: int,
+        content_type: Optional[str] = None,
+        source_bucket: Optional[str] = None,
+    ) -> ContentBlob:
+        """Take a reference on the blob for an existing object's content.
+
+        The object is copied server-side to its blob location if no blob
+        with its checksum exists yet. The source object is left untouched.
+
+        Args:
+            object_name: Existing object name
+            checksum: SHA-256 checksum of the object
+            size: Object size
+            content_type: MIME type recorded for a new blob
+            source_bucket: Bucket of the object (defaults to the blob bucket)
+
+        Returns:
+            Referenced ContentBlob
+        """
+        blob = await self.acquire(checksum)
+        if blob is not None:
+            self._stats["deduplicated"] += 1
+            self._stats["bytes_deduplicated"] += size
+            return blob
+
+        blob_object_name = self.object_name_for(checksum)
+        with self.minio_client.operation_context(f"adopt_blob_{checksum}"):
+            self.minio_client.copy_object(
+                bucket_name=self.bucket_name,
+                object_name=blob_object_name,
+                source=CopySource(source_bucket or self.bucket_name, object_name),
+            )
+
+        return await self._insert(checksum, blob_object_name, size, content_type)
+
+    async def acquire(self, checksum: str) -> Optional[ContentBlob]:
+        """Take a reference on an existing blob.
+
+        Args:
+            checksum: SHA-256 checksum
+
+        Returns:
+            Referenced ContentBlob, or None if no blob has this checksum
+        """
+        updated = (
+            self.db.query(ContentBlob)
+            .filter(
+                and_(
+                    ContentBlob.bucket_name == self.bucket_name,
+                    ContentBlob.checksum == checksum,
+                )
+            )
+            .update(
+                {
+                    ContentBlob.ref_count: ContentBlob.ref_count + 1,
+                    ContentBlob.last_referenced_at: datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+        )
+        if not updated:
+            return None
+        self.db.commit()
+        return self.get(checksum)
+
+    async def release(self, checksum: str) -> None:
+        """Drop a reference on a blob.
+
+        The blob is kept until the garbage collector reclaims it.
+
+        Args:
+            checksum: SHA-256 checksum
+        """
+        self.db.query(ContentBlob).filter(
+            and_(
+                ContentBlob.bucket_name == self.bucket_name,
+                ContentBlob.checksum == checksum,
+                ContentBlob.ref_count > 0,
+            )
+        ).update(
+            {
+                ContentBlob.ref_count: ContentBlob.ref_count - 1,
+                ContentBlob.last_referenced_at: datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+        self.db.commit()
+
+    async def collect_garbage(self, limit: int = 100) -> Dict[str, int]:
+        """Remove unreferenced blobs older than the grace period.
+
+        Candidate rows are locked while their objects are removed, so a
+        concurrent acquire either happens before collection or finds no
+        blob and uploads the content again.
+
+        Args:
+            limit: Maximum number of blobs removed in this run
+
+        Returns:
+            Dictionary with collected blob count and reclaimed bytes
+        """
+        cutoff = datetime.utcnow() - self.gc_grace_period
+        candidates = (
+            self.db.query(ContentBlob)
+            .filter(
+                and_(
+                    ContentBlob.bucket_name == self.bucket_name,
+                    ContentBlob.ref_count <= 0,
+                    ContentBlob.last_referenced_at < cutoff,
+                )
+            )
+            .order_by(ContentBlob.last_referenced_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+        collected = 0
+        reclaimed = 0
+        try:
+            for blob in candidates:
+                try:
+                    self.minio_client.remove_object(
+                        bucket_name=self.bucket_name,
+                        object_name=blob.object_name,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to remove blob {blob.checksum}: {e}")
+                    continue
+                self.db.delete(blob)
+                collected += 1
+                reclaimed += blob.size or 0
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        self._stats["collected"] += collected
+        self._stats["bytes_reclaimed"] += reclaimed
+
+        if collected:
+            logger.info(
+                f"Collected {collected} unreferenced blobs from {self.bucket_name}: "
+                f"{format_file_size(reclaimed)}"
+            )
+
+        return {"collected": collected, "bytes_reclaimed": reclaimed}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get blob store statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {**self._stats, "bucket_name": self.bucket_name}
+
+    async def _insert(
+        self,
+        checksum: str,
+        object_name: str,
+        size: int,
+        content_type: Optional[str],
+    ) -> ContentBlob:
+        """Record a newly written blob with one reference.
+
+        Args:
+            checksum: SHA-256 checksum
+            object_name: Blob object name
+            size: Content size
+            content_type: MIME type
+
+        Returns:
+            Referenced ContentBlob
+
+        Raises:
+            BlobStoreError: If the blob can neither be inserted nor found
+        """
+        now = datetime.utcnow()
+        blob = ContentBlob(
+            bucket_name=self.bucket_name,
+            checksum=checksum,
+            object_name=object_name,
+            size=size,
+            content_type=content_type,
+            ref_count=1,
+            created_at=now,
+            last_referenced_at=now,
+        )
+        self.db.add(blob)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Another writer stored the same content concurrently
+            self.db.rollback()
+            blob = await self.acquire(checksum)
+            if blob is None:
+                raise BlobStoreError(f"Blob {checksum} vanished during insert")
+            self._stats["deduplicated"] += 1
+            self._stats["bytes_deduplicated"] += size
+            return blob
+
+        self._stats["uploads"] += 1
+        self._stats["bytes_uploaded"] += size
+        logger.debug(f"Stored blob {checksum} ({format_file_size(size)})")
+        return blob
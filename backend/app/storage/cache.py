@@ -25,6 +25,8 @@ except ImportError:
     ConnectionError = Exception
     TimeoutError = Exception
 
+from app.core.metrics import metrics_registry
+
 from .utils.validators import validate_file_path, validate_skill_id
 from .utils.formatters import format_file_size, format_timestamp
 
@@ -99,6 +101,12 @@ class CacheManager:
             "evictions": 0,
             "errors": 0,
         }
+        metrics_registry.register_stats(
+            "storage_cache",
+            self,
+            "stats",
+            counters=("hits", "misses", "sets", "deletes", "evictions", "errors"),
+        )
 
         # Cache key prefixes
         self.prefixes = {
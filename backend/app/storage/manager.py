@@ -19,8 +19,10 @@ from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from .blobs import BlobStore
 from .client import MinIOClient, MinIOClientManager
 from .models import Skill, SkillFile, StorageBucket, FileVersion
+from .versioning import VERSIONS_BUCKET
 from .schemas.file_operations import (
     FileUploadRequest,
     FileUploadResult,
@@ -33,6 +35,8 @@ from .schemas.file_operations import (
     FileListResult,
     FileMoveRequest,
     FileMoveResult,
+    FileCopyRequest,
+    FileCopyResult,
 )
 from .schemas.storage_config import StorageConfig
 from .utils.checksum import calculate_sha256, verify_checksum
@@ -82,6 +86,7 @@ class SkillStorageManager:
         minio_client: MinIOClient,
         database_session: Session,
         config: StorageConfig,
+        blob_store: Optional[BlobStore] = None,
     ):
         """Initialize storage manager.
 
@@ -89,10 +94,17 @@ class SkillStorageManager:
             minio_client: MinIO client instance
             database_session: SQLAlchemy database session
             config: Storage configuration
+            blob_store: Content-addressed store for file content (defaults
+                to one in the default bucket)
         """
         self.minio_client = minio_client
         self.db = database_session
         self.config = config
+        self.blob_store = (
+            blob_store
+            if blob_store is not None
+            else BlobStore(minio_client, database_session, config.default_bucket)
+        )
 
         # Storage statistics
         self._total_files = 0
@@ -141,31 +153,27 @@ class SkillStorageManager:
             file_data.seek(0)  # Reset to beginning
             checksum = calculate_sha256(file_data)
 
-        # Generate object name
-        object_name = self._generate_object_name(skill_id, file_path)
-
-        # Upload to MinIO
+        # Upload to MinIO, reusing the blob if the content already exists
+        blob = None
         try:
             with self.minio_client.operation_context(f"upload_{file_path}"):
-                result = self.minio_client.put_object(
-                    bucket_name=self.config.default_bucket,
-                    object_name=object_name,
-                    data=file_data,
-                    length=file_size,
+                blob = await self.blob_store.store(
+                    file_data,
+                    checksum=checksum,
+                    size=file_size,
                     content_type=request.content_type,
-                    metadata=metadata,
                 )
 
             # Create file record in database
             skill_file = SkillFile(
                 skill_id=skill_id,
-                object_name=result["object_name"],
+                object_name=blob.object_name,
                 file_path=file_path,
                 file_type=self._determine_file_type(file_path),
                 file_size=file_size,
                 content_type=request.content_type,
                 checksum=checksum,
-                metadata=metadata,
+                file_metadata=metadata,
                 tags=tags,
                 is_public=request.is_public,
             )
@@ -183,7 +191,7 @@ class SkillStorageManager:
 
             return FileUploadResult(
                 success=True,
-                object_name=result["object_name"],
+                object_name=blob.object_name,
                 file_path=file_path,
                 file_size=file_size,
                 checksum=checksum,
@@ -193,6 +201,8 @@ class SkillStorageManager:
 
         except Exception as e:
             self.db.rollback()
+            if blob is not None:
+                await self.blob_store.release(checksum)
             logger.error(f"Failed to upload file {file_path}: {e}")
             raise SkillStorageError(f"Upload failed: {e}")
 
@@ -272,17 +282,19 @@ class SkillStorageManager:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         try:
-            # Delete from MinIO
-            with self.minio_client.operation_context(f"delete_{file_path}"):
-                self.minio_client.remove_object(
-                    bucket_name=self.config.default_bucket,
-                    object_name=skill_file.object_name,
-                )
+            # Versions are deleted with the file by cascade; keep them to
+            # drop their content references too
+            versions = list(skill_file.versions or [])
 
             # Delete from database
             self.db.delete(skill_file)
             self.db.commit()
 
+            # Drop the content references; shared blobs are reclaimed by GC
+            with self.minio_client.operation_context(f"delete_{file_path}"):
+                await self._release_object(skill_file.object_name, skill_file.checksum)
+                await self._release_versions(versions)
+
             # Update skill statistics
             await self._update_skill_stats(skill_id, -skill_file.file_size)
 
@@ -355,7 +367,7 @@ class SkillStorageManager:
                 file_size=file.file_size,
                 content_type=file.content_type,
                 checksum=file.checksum,
-                metadata=file.metadata or {},
+                metadata=file.file_metadata or {},
                 tags=file.tags or [],
                 is_public=file.is_public,
                 version_count=len(file.versions) if file.versions else 0,
@@ -410,30 +422,13 @@ class SkillStorageManager:
         if existing_file:
             raise SkillStorageError(f"Target file already exists: {target_path}")
 
-        # Generate new object name
-        new_object_name = self._generate_object_name(skill_id, target_path)
+        # Object names are independent of the path, so only metadata changes
+        new_object_name = skill_file.object_name
 
         try:
-            # Copy to new location in MinIO
-            with self.minio_client.operation_context(f"move_{source_path}_to_{target_path}"):
-                self.minio_client.copy_object(
-                    bucket_name=self.config.default_bucket,
-                    object_name=new_object_name,
-                    source=CopySource(
-                        bucket_name=self.config.default_bucket,
-                        object_name=skill_file.object_name,
-                    ),
-                )
-
-                # Remove old object
-                self.minio_client.remove_object(
-                    bucket_name=self.config.default_bucket,
-                    object_name=skill_file.object_name,
-                )
-
             # Update database record
             skill_file.file_path = target_path
-            skill_file.object_name = new_object_name
+            skill_file.file_type = self._determine_file_type(target_path)
             skill_file.updated_at = datetime.utcnow()
 
             self.db.commit()
@@ -455,6 +450,97 @@ class SkillStorageManager:
             logger.error(f"Failed to move file {source_path} to {target_path}: {e}")
             raise SkillStorageError(f"Move failed: {e}")
 
+    async def copy_file(
+        self,
+        request: FileCopyRequest,
+    ) -> FileCopyResult:
+        """Copy a file.
+
+        The copy references the same content blob as the source, so no
+        object data is transferred.
+
+        Args:
+            request: File copy request
+
+        Returns:
+            FileCopyResult with copy details
+
+        Raises:
+            FileNotFoundError: If source file doesn't exist
+            SkillNotFoundError: If target skill doesn't exist
+        """
+        skill_id = validate_skill_id(request.skill_id)
+        target_skill_id = validate_skill_id(request.target_skill_id or skill_id)
+        source_path = validate_file_path(request.source_path)
+        target_path = validate_file_path(request.target_path)
+
+        # Get source file
+        skill_file = await self._get_file(skill_id, source_path)
+        if not skill_file:
+            raise FileNotFoundError(f"Source file not found: {source_path}")
+
+        if target_skill_id != skill_id and not await self._get_skill(target_skill_id):
+            raise SkillNotFoundError(f"Skill not found: {target_skill_id}")
+
+        # Check if target already exists
+        existing_file = await self._get_file(target_skill_id, target_path)
+        if existing_file:
+            raise SkillStorageError(f"Target file already exists: {target_path}")
+
+        blob = None
+        try:
+            with self.minio_client.operation_context(f"copy_{source_path}_to_{target_path}"):
+                blob = await self._acquire_blob(skill_file)
+
+            copied_file = SkillFile(
+                skill_id=target_skill_id,
+                object_name=blob.object_name,
+                file_path=target_path,
+                file_type=self._determine_file_type(target_path),
+                file_size=skill_file.file_size,
+                content_type=skill_file.content_type,
+                checksum=skill_file.checksum,
+                file_metadata=dict(skill_file.file_metadata or {}),
+                tags=list(skill_file.tags or []),
+                is_public=skill_file.is_public,
+            )
+
+            self.db.add(copied_file)
+            self.db.commit()
+
+            # Update skill statistics
+            await self._update_skill_stats(target_skill_id, skill_file.file_size)
+
+            logger.info(
+                f"Copied file {source_path} to {target_path} for skill {target_skill_id}"
+            )
+
+            return FileCopyResult(
+                success=True,
+                source_path=source_path,
+                target_path=target_path,
+                object_name=blob.object_name,
+                error=None,
+            )
+
+        except Exception as e:
+            self.db.rollback()
+            if blob is not None:
+                await self.blob_store.release(skill_file.checksum)
+            logger.error(f"Failed to copy file {source_path} to {target_path}: {e}")
+            raise SkillStorageError(f"Copy failed: {e}")
+
+    async def collect_garbage(self, limit: int = 100) -> Dict[str, int]:
+        """Reclaim content blobs no longer referenced by any file.
+
+        Args:
+            limit: Maximum number of blobs removed
+
+        Returns:
+            Dictionary with collected blob count and reclaimed bytes
+        """
+        return await self.blob_store.collect_garbage(limit=limit)
+
     async def get_file_info(
         self,
         skill_id: UUID,
@@ -485,7 +571,7 @@ class SkillStorageManager:
             file_size=skill_file.file_size,
             content_type=skill_file.content_type,
             checksum=skill_file.checksum,
-            metadata=skill_file.metadata or {},
+            metadata=skill_file.file_metadata or {},
             tags=skill_file.tags or [],
             is_public=skill_file.is_public,
             version_count=len(skill_file.versions) if skill_file.versions else 0,
@@ -672,6 +758,77 @@ class SkillStorageManager:
         unique_id = str(uuid4())[:8]
         return f"skills/{skill_id}/{timestamp}_{unique_id}_{safe_path}"
 
+    async def _acquire_blob(self, skill_file: SkillFile):
+        """Take a reference on the content blob of a file.
+
+        Files uploaded before content addressing are moved onto a blob on
+        first use.
+
+        Args:
+            skill_file: SkillFile instance
+
+        Returns:
+            Referenced ContentBlob
+        """
+        if self.blob_store.owns(skill_file.object_name):
+            blob = await self.blob_store.acquire(skill_file.checksum)
+            if blob is not None:
+                return blob
+
+        # Legacy object: one reference for the file itself, one for the caller
+        legacy_object_name = skill_file.object_name
+        blob = await self.blob_store.adopt(
+            legacy_object_name,
+            skill_file.checksum,
+            skill_file.file_size,
+            content_type=skill_file.content_type,
+        )
+        skill_file.object_name = blob.object_name
+        self.db.commit()
+        if legacy_object_name != blob.object_name:
+            self.minio_client.remove_object(
+                bucket_name=self.config.default_bucket,
+                object_name=legacy_object_name,
+            )
+        return await self.blob_store.acquire(skill_file.checksum)
+
+    async def _release_object(self, object_name: str, checksum: Optional[str]) -> None:
+        """Drop a file's reference on its content.
+
+        Args:
+            object_name: Object name of the file
+            checksum: SHA-256 checksum of the file
+        """
+        if self.blob_store.owns(object_name) and checksum:
+            await self.blob_store.release(checksum)
+        else:
+            self.minio_client.remove_object(
+                bucket_name=self.config.default_bucket,
+                object_name=object_name,
+            )
+
+    async def _release_versions(self, versions: List[FileVersion]) -> None:
+        """Drop the content references of a deleted file's versions.
+
+        Snapshots stored as blobs release their blob; deltas and other
+        snapshots are removed from the versions bucket.
+
+        Args:
+            versions: Versions of the deleted file
+        """
+        for version in versions:
+            metadata = version.version_metadata if isinstance(version.version_metadata, dict) else {}
+            try:
+                if metadata.get("blob") == self.blob_store.bucket_name and version.checksum:
+                    await self.blob_store.release(version.checksum)
+                else:
+                    self.minio_client.remove_object(
+                        bucket_name=VERSIONS_BUCKET,
+                        object_name=version.object_name,
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to release object of version {version.version_id}: {e}")
+
     def _determine_file_type(self, file_path: str) -> str:
         """Determine file type from path.
 
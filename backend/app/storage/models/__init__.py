@@ -1,13 +1,15 @@
 """Storage models package for MinIO storage system.
 
 This package contains SQLAlchemy models for managing skills, skill files,
-storage buckets, and file versions in the MinIO storage system.
+storage buckets, file versions and content-addressed blobs in the MinIO
+storage system.
 """
 
 from .skill import Skill, Base
 from .skill_file import SkillFile
 from .storage_bucket import StorageBucket
 from .file_version import FileVersion
+from .content_blob import ContentBlob
 
 __all__ = [
     "Base",
@@ -15,4 +17,5 @@ __all__ = [
     "SkillFile",
     "StorageBucket",
     "FileVersion",
+    "ContentBlob",
 ]
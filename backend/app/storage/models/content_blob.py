@@ -0,0 +1,105 @@
+"""ContentBlob model for content-addressed object storage.
+
+This module defines the ContentBlob SQLAlchemy model which tracks objects
+stored once per SHA-256 checksum and the number of records referencing them.
+"""
+
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    BigInteger,
+    Index,
+)
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql import func
+
+Base = declarative_base()
+
+
+class ContentBlob(Base):
+    """Content-addressed blob model.
+
+    Each row represents one object holding the bytes of a given checksum in
+    a bucket. Files, versions and backups with identical content reference
+    the same blob; ``ref_count`` tracks how many do, and blobs whose count
+    drops to zero are reclaimed by the garbage collector.
+    """
+
+    __tablename__ = "content_blobs"
+
+    # Identification
+    bucket_name = Column(
+        String(100),
+        primary_key=True,
+        comment="桶名称",
+    )
+    checksum = Column(
+        String(64),
+        primary_key=True,
+        comment="SHA256校验和",
+    )
+    object_name = Column(
+        String(500),
+        nullable=False,
+        comment="MinIO对象名",
+    )
+
+    # Storage information
+    size = Column(
+        BigInteger,
+        default=0,
+        comment="大小(字节)",
+    )
+    content_type = Column(
+        String(100),
+        comment="MIME类型",
+    )
+    ref_count = Column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="引用计数",
+    )
+
+    # Timestamps
+    created_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        comment="创建时间",
+    )
+    last_referenced_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        comment="最后引用时间",
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of the ContentBlob."""
+        return (
+            f"<ContentBlob(bucket_name='{self.bucket_name}', "
+            f"checksum='{self.checksum}', ref_count={self.ref_count})>"
+        )
+
+    def to_dict(self) -> dict:
+        """Convert ContentBlob to dictionary."""
+        return {
+            "bucket_name": self.bucket_name,
+            "checksum": self.checksum,
+            "object_name": self.object_name,
+            "size": self.size,
+            "content_type": self.content_type,
+            "ref_count": self.ref_count,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "last_referenced_at": (
+                self.last_referenced_at.isoformat() if self.last_referenced_at else None
+            ),
+        }
+
+
+# Database indexes for garbage collection
+Index(
+    "idx_content_blobs_unreferenced",
+    ContentBlob.ref_count,
+    ContentBlob.last_referenced_at,
+)
@@ -7,11 +7,11 @@ and tuning utilities for the MinIO storage system.
 import time
 import logging
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
 import threading
-import statistics
+
+from app.core.metrics import Counter, Histogram, MetricsRegistry, TimeWindow, metrics_registry
 
 from .client import MinIOClient
 from .cache import CacheManager
@@ -64,16 +64,38 @@ class OptimizationConfig:
 class PerformanceMonitor:
     """Monitor for storage system performance."""
 
-    def __init__(self, config: OptimizationConfig):
+    def __init__(self, config: OptimizationConfig, registry: Optional[MetricsRegistry] = None):
         """Initialize performance monitor.
 
         Args:
             config: Optimization configuration
+            registry: Registry to record into, a private one by default
         """
         self.config = config
-        self.metrics: deque = deque(maxlen=config.metrics_retention_hours * 3600)
-        self.operation_stats: Dict[str, List[float]] = defaultdict(list)
-        self.lock = threading.Lock()
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self._durations = self.registry.histogram(
+            "storage_operation_duration_seconds",
+            "Storage operation duration",
+            unit="seconds",
+        )
+        self._operations = self.registry.counter(
+            "storage_operations_total",
+            "Storage operations by type and outcome",
+        )
+        self._transferred = self.registry.counter(
+            "storage_transferred_bytes_total",
+            "Bytes processed by successful storage operations",
+            unit="bytes",
+        )
+        self.operation_stats: Dict[str, Histogram] = {}
+        # (success, error) counters, read from the same registry as the histograms
+        self._outcomes: Dict[str, Tuple[Counter, Counter]] = {}
+
+        # Minute buckets covering the retention period
+        slots = max(1, config.metrics_retention_hours * 60)
+        self._throughput_bytes = TimeWindow(resolution=60.0, slots=slots)
+        self._throughput_duration = TimeWindow(resolution=60.0, slots=slots)
+        self.lock = threading.RLock()
 
     def record_operation(
         self,
@@ -94,19 +116,25 @@ class PerformanceMonitor:
             data_size: Size of data processed in bytes
             metadata: Additional metadata
         """
-        metric = PerformanceMetrics(
-            operation_type=operation_type,
-            duration=duration,
-            timestamp=datetime.utcnow(),
-            success=success,
-            error_message=error_message,
-            data_size=data_size,
-            metadata=metadata or {},
-        )
-
         with self.lock:
-            self.metrics.append(metric)
-            self.operation_stats[operation_type].append(duration)
+            histogram = self.operation_stats.get(operation_type)
+            if histogram is None:
+                histogram = self._durations.labels({"operation": operation_type})
+                self.operation_stats[operation_type] = histogram
+                self._outcomes[operation_type] = (
+                    self._operations.labels({"operation": operation_type, "status": "success"}),
+                    self._operations.labels({"operation": operation_type, "status": "error"}),
+                )
+
+            histogram.record(duration)
+            succeeded, failed = self._outcomes[operation_type]
+            (succeeded if success else failed).inc()
+
+            if success and data_size:
+                now = time.time()
+                self._throughput_bytes.record(data_size, now)
+                self._throughput_duration.record(duration, now)
+                self._transferred.labels({"operation": operation_type}).inc(data_size)
 
     def get_operation_stats(self, operation_type: str) -> Dict[str, float]:
         """Get statistics for an operation type.
@@ -118,9 +146,9 @@ class PerformanceMonitor:
             Dictionary with statistics
         """
         with self.lock:
-            durations = self.operation_stats.get(operation_type, [])
+            histogram = self.operation_stats.get(operation_type)
 
-            if not durations:
+            if not histogram:
                 return {
                     "count": 0,
                     "avg_duration": 0.0,
@@ -130,20 +158,16 @@ class PerformanceMonitor:
                     "success_rate": 0.0,
                 }
 
-            # Calculate statistics
-            success_count = sum(
-                1 for m in self.metrics
-                if m.operation_type == operation_type and m.success
-            )
-            total_count = len([m for m in self.metrics if m.operation_type == operation_type])
+            succeeded, failed = self._outcomes[operation_type]
+            total = succeeded.value + failed.value
 
             return {
-                "count": len(durations),
-                "avg_duration": statistics.mean(durations),
-                "min_duration": min(durations),
-                "max_duration": max(durations),
-                "p95_duration": self._percentile(durations, 95),
-                "success_rate": (success_count / total_count * 100) if total_count > 0 else 0.0,
+                "count": histogram.count,
+                "avg_duration": histogram.mean,
+                "min_duration": histogram.min,
+                "max_duration": histogram.max,
+                "p95_duration": histogram.percentile(95),
+                "success_rate": succeeded.value / total * 100 if total else 0.0,
             }
 
     def get_throughput_stats(self, hours: int = 1) -> Dict[str, float]:
@@ -155,13 +179,11 @@ class PerformanceMonitor:
         Returns:
             Dictionary with throughput metrics
         """
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
-        recent_metrics = [
-            m for m in self.metrics
-            if m.timestamp >= cutoff and m.success and m.data_size
-        ]
+        since = time.time() - hours * 3600
+        data = self._throughput_bytes.summary(since)
+        durations = self._throughput_duration.summary(since)
 
-        if not recent_metrics:
+        if not data:
             return {
                 "total_operations": 0,
                 "total_data_mb": 0.0,
@@ -169,9 +191,9 @@ class PerformanceMonitor:
                 "operations_per_second": 0.0,
             }
 
-        total_data = sum(m.data_size for m in recent_metrics)
-        total_duration = sum(m.duration for m in recent_metrics)
-        total_operations = len(recent_metrics)
+        total_data = data.sum
+        total_duration = durations.sum if durations else 0.0
+        total_operations = data.count
 
         return {
             "total_operations": total_operations,
@@ -180,23 +202,6 @@ class PerformanceMonitor:
             "operations_per_second": total_operations / (hours * 3600),
         }
 
-    def _percentile(self, data: List[float], percentile: int) -> float:
-        """Calculate percentile of data.
-
-        Args:
-            data: List of values
-            percentile: Percentile to calculate (0-100)
-
-        Returns:
-            Percentile value
-        """
-        if not data:
-            return 0.0
-
-        sorted_data = sorted(data)
-        index = int(len(sorted_data) * percentile / 100)
-        return sorted_data[min(index, len(sorted_data) - 1)]
-
     def get_performance_report(self) -> Dict[str, Any]:
         """Generate comprehensive performance report.
 
@@ -232,12 +237,12 @@ class PerformanceMonitor:
         recommendations = []
 
         # Analyze operation stats
-        for op_type, durations in self.operation_stats.items():
-            if not durations:
+        for op_type, histogram in self.operation_stats.items():
+            if not histogram:
                 continue
 
-            avg_duration = statistics.mean(durations)
-            p95_duration = self._percentile(durations, 95)
+            avg_duration = histogram.mean
+            p95_duration = histogram.percentile(95)
 
             # Check for slow operations
             if avg_duration > 5.0:
@@ -602,14 +607,15 @@ class PerformanceProfiler:
 class OptimizationManager:
     """Manager for all performance optimizations."""
 
-    def __init__(self, config: OptimizationConfig):
+    def __init__(self, config: OptimizationConfig, registry: Optional[MetricsRegistry] = None):
         """Initialize optimization manager.
 
         Args:
             config: Optimization configuration
+            registry: Registry to publish metrics to, a private one by default
         """
         self.config = config
-        self.monitor = PerformanceMonitor(config)
+        self.monitor = PerformanceMonitor(config, registry)
         self.profiler = PerformanceProfiler(self.monitor)
         self.cache_optimizer = None  # Will be set when cache manager is available
 
@@ -833,4 +839,4 @@ def optimize_storage_system(
     if config is None:
         config = get_default_optimization_config()
 
-    return OptimizationManager(config)
+    return OptimizationManager(config, metrics_registry)
@@ -16,6 +16,8 @@ from .file_operations import (
     FileListResult,
     FileMoveRequest,
     FileMoveResult,
+    FileCopyRequest,
+    FileCopyResult,
 )
 from .storage_config import (
     StorageConfig,
@@ -37,6 +39,8 @@ __all__ = [
     "FileListResult",
     "FileMoveRequest",
     "FileMoveResult",
+    "FileCopyRequest",
+    "FileCopyResult",
     # Storage configuration schemas
     "StorageConfig",
     "MinIOConfig",
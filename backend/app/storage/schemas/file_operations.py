@@ -214,6 +214,40 @@ class FileMoveResult(BaseModel):
         use_enum_values = True
 
 
+class FileCopyRequest(BaseModel):
+    """Request model for file copy operations."""
+
+    skill_id: UUID = Field(..., description="技能ID")
+    source_path: str = Field(..., min_length=1, max_length=500, description="源文件路径")
+    target_path: str = Field(..., min_length=1, max_length=500, description="目标文件路径")
+    target_skill_id: Optional[UUID] = Field(None, description="目标技能ID")
+
+    @validator("source_path", "target_path")
+    def validate_paths(cls, v: str) -> str:
+        """Validate file paths for security."""
+        if ".." in v or v.startswith("/"):
+            raise ValueError("Invalid file path")
+        return v
+
+    class Config:
+        """Pydantic configuration."""
+        use_enum_values = True
+
+
+class FileCopyResult(BaseModel):
+    """Response model for file copy operations."""
+
+    success: bool = Field(..., description="复制是否成功")
+    source_path: str = Field(..., description="源文件路径")
+    target_path: str = Field(..., description="目标文件路径")
+    object_name: str = Field(..., description="共享的对象名")
+    error: Optional[str] = Field(None, description="错误信息")
+
+    class Config:
+        """Pydantic configuration."""
+        use_enum_values = True
+
+
 # Version control schemas
 class FileVersionInfo(BaseModel):
     """Model for file version information."""
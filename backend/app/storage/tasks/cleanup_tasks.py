@@ -4,6 +4,7 @@ This module contains Celery tasks for handling cleanup operations
 asynchronously, including old file cleanup, failed upload cleanup, etc.
 """
 
+import asyncio
 import logging
 from typing import Optional, Dict, Any, List
 from uuid import UUID
@@ -84,6 +85,7 @@ def init_managers():
         minio_client=minio_client,
         storage_manager=storage_manager,
         database_session=db_session,
+        blob_store=storage_manager.blob_store,
     )
 
     cache_manager = CacheManager(
@@ -488,9 +490,14 @@ def cleanup_orphaned_objects_task(
         )
 
         # Check each object against database records
+        blob_store = self.storage_manager.blob_store
         for index, obj_info in enumerate(objects):
             object_name = obj_info['object_name']
 
+            # Content blobs are shared and reclaimed by blob garbage collection
+            if blob_store.bucket_name == bucket_name and blob_store.owns(object_name):
+                continue
+
             try:
                 # Check if object exists in database
                 from backend.app.storage.models import SkillFile
@@ -556,6 +563,70 @@ def cleanup_orphaned_objects_task(
         raise
 
 
+@celery_app.task(
+    bind=True,
+    base=CleanupTask,
+    name="storage.collect_garbage_blobs",
+    max_retries=2,
+    default_retry_delay=900,  # 15 minutes
+)
+def collect_garbage_blobs_task(
+    self,
+    batch_size: int = 100,
+    max_batches: int = 50,
+):
+    """Reclaim content blobs no longer referenced by files or versions.
+
+    Args:
+        batch_size: Blobs removed per batch
+        max_batches: Maximum number of batches in one run
+
+    Returns:
+        Collection result dictionary
+    """
+    task_id = self.request.id
+
+    logger.info(f"Starting blob garbage collection task {task_id}")
+
+    try:
+        # Initialize managers if not already done
+        if not hasattr(self, 'storage_manager') or self.storage_manager is None:
+            self.storage_manager, self.version_manager, self.cache_manager = init_managers()
+
+        collected = 0
+        bytes_reclaimed = 0
+        for batch in range(max_batches):
+            result = asyncio.run(self.storage_manager.collect_garbage(limit=batch_size))
+            collected += result['collected']
+            bytes_reclaimed += result['bytes_reclaimed']
+
+            self.update_state(
+                state='PROGRESS',
+                meta={'step': f'batch {batch + 1}', 'collected': collected},
+            )
+
+            if result['collected'] < batch_size:
+                break
+
+        return {
+            'success': True,
+            'task_id': task_id,
+            'blobs_collected': collected,
+            'bytes_reclaimed': bytes_reclaimed,
+        }
+
+    except Exception as exc:
+        logger.error(
+            f"Blob garbage collection task {task_id} failed: {exc}"
+        )
+
+        # Retry if configured
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=exc)
+
+        raise
+
+
 @celery_app.task(
     bind=True,
     name="storage.cleanup_cache",
@@ -703,6 +774,7 @@ def schedule_cleanup_task(
             'failed_uploads': cleanup_failed_uploads_task,
             'expired_versions': cleanup_expired_versions_task,
             'orphaned_objects': cleanup_orphaned_objects_task,
+            'blob_gc': collect_garbage_blobs_task,
             'cache': cleanup_cache_task,
         }
 
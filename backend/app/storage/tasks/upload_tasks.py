@@ -122,6 +122,7 @@ def init_managers():
         minio_client=minio_client,
         storage_manager=storage_manager,
         database_session=db_session,
+        blob_store=storage_manager.blob_store,
     )
 
     cache_manager = CacheManager(
@@ -18,9 +18,14 @@ from sqlalchemy import and_, desc, func, or_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.cache import LRUCache
+from app.core.delta import apply_delta, compute_delta, decode_delta, encode_delta
+
+from .blobs import BlobStore
 from .client import MinIOClient, CopySource
 from .models import SkillFile, FileVersion
 from .schemas.file_operations import (
+    FileUploadRequest,
     FileVersionInfo,
     FileVersionCreateRequest,
     FileVersionRestoreRequest,
@@ -31,6 +36,9 @@ from .utils.formatters import format_file_size, format_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Bucket holding version deltas and snapshots not stored as blobs
+VERSIONS_BUCKET = "skillseekers-versions"
+
 
 class VersioningError(Exception):
     """Base exception for versioning operations."""
@@ -66,6 +74,12 @@ class VersionManager:
         database_session: Session,
         max_versions: int = 10,
         cleanup_threshold_days: int = 90,
+        max_chain_length: int = 16,
+        max_delta_ratio: float = 0.5,
+        max_delta_source_size: int = 32 * 1024 * 1024,
+        data_cache: Optional[LRUCache] = None,
+        comparison_cache: Optional[LRUCache] = None,
+        blob_store: Optional[BlobStore] = None,
     ):
         """Initialize version manager.
 
@@ -75,15 +89,30 @@ class VersionManager:
             database_session: SQLAlchemy database session
             max_versions: Maximum number of versions per file
             cleanup_threshold_days: Days after which old versions are cleaned up
+            max_chain_length: Maximum number of deltas between two full snapshots
+            max_delta_ratio: Largest delta/content size ratio stored as a delta
+            max_delta_source_size: Files larger than this are always stored in full
+            data_cache: Cache of reconstructed version data
+            comparison_cache: Cache of version comparison results
+            blob_store: Content-addressed store shared with file uploads;
+                full snapshots reference its blobs instead of new objects
         """
         self.minio_client = minio_client
         self.storage_manager = storage_manager
         self.db = database_session
         self.max_versions = max_versions
         self.cleanup_threshold_days = cleanup_threshold_days
+        self.max_chain_length = max_chain_length
+        self.max_delta_ratio = max_delta_ratio
+        self.max_delta_source_size = max_delta_source_size
+        self.data_cache = data_cache if data_cache is not None else version_data_cache
+        self.comparison_cache = (
+            comparison_cache if comparison_cache is not None else version_comparison_cache
+        )
+        self.blob_store = blob_store
 
         # Version storage configuration
-        self.versions_bucket = "skillseekers-versions"
+        self.versions_bucket = VERSIONS_BUCKET
         self.versions_prefix = "versions"
 
     async def create_version(
@@ -146,17 +175,44 @@ class VersionManager:
             source_file.id, file_path, version_id
         )
 
+        # Store small enough files as a delta against the latest version
+        version_metadata = dict(request.metadata or {})
+        content = None
+        stored_data, stored_size = file_data, file_size
+        if file_size <= self.max_delta_source_size:
+            if isinstance(file_data, bytes):
+                content = file_data
+            else:
+                file_data.seek(0)
+                content = file_data.read()
+                file_data.seek(0)
+            delta_info, payload = await self._encode_version_data(source_file.id, content)
+            if delta_info is not None:
+                version_metadata["delta"] = delta_info
+                stored_data, stored_size = io.BytesIO(payload), len(payload)
+
+        blob = None
         try:
-            # Upload version to MinIO
+            # Upload version to MinIO; snapshots share content blobs
             with self.minio_client.operation_context(f"create_version_{file_path}"):
-                result = self.minio_client.put_object(
-                    bucket_name=self.versions_bucket,
-                    object_name=version_object_name,
-                    data=file_data,
-                    length=file_size,
-                    content_type=source_file.content_type,
-                    metadata=request.metadata or {},
-                )
+                if self.blob_store is not None and "delta" not in version_metadata:
+                    blob = await self.blob_store.store(
+                        content if content is not None else file_data,
+                        checksum=checksum,
+                        size=file_size,
+                        content_type=source_file.content_type,
+                    )
+                    version_metadata["blob"] = self.blob_store.bucket_name
+                    result = {"object_name": blob.object_name}
+                else:
+                    result = self.minio_client.put_object(
+                        bucket_name=self.versions_bucket,
+                        object_name=version_object_name,
+                        data=stored_data,
+                        length=stored_size,
+                        content_type=source_file.content_type,
+                        metadata=request.metadata or {},
+                    )
 
             # Create version record in database
             file_version = FileVersion(
@@ -167,7 +223,7 @@ class VersionManager:
                 file_size=file_size,
                 checksum=checksum,
                 comment=request.comment or f"Version {version_number}",
-                metadata=request.metadata or {},
+                version_metadata=version_metadata,
                 created_by="system",  # TODO: Get from context
             )
 
@@ -180,15 +236,22 @@ class VersionManager:
             source_file.updated_at = datetime.utcnow()
             self.db.commit()
 
+            if content is not None:
+                self.data_cache.put(version_id, content)
+
             logger.info(
                 f"Created version {version_number} for file {file_path}: "
-                f"{format_file_size(file_size)}"
+                f"{format_file_size(file_size)} "
+                f"({'delta' if 'delta' in version_metadata else 'snapshot'}, "
+                f"{format_file_size(stored_size)} stored)"
             )
 
             return version_id
 
         except Exception as e:
             self.db.rollback()
+            if blob is not None:
+                await self.blob_store.release(checksum)
             logger.error(f"Failed to create version for {file_path}: {e}")
             raise VersioningError(f"Version creation failed: {e}")
 
@@ -276,22 +339,18 @@ class VersionManager:
             raise VersionNotFoundError(f"Version not found: {request.version_id}")
 
         try:
-            # Download version from MinIO
+            # Rebuild version content from MinIO
             with self.minio_client.operation_context(f"restore_version_{file_path}"):
-                version_response = self.minio_client.get_object(
-                    bucket_name=self.versions_bucket,
-                    object_name=version.object_name,
-                )
+                data = await self._reconstruct_version_data(version)
 
             # Upload to current file location
-            version_response.seek(0)  # Reset to beginning
             await self.storage_manager.upload_file(
                 FileUploadRequest(
                     skill_id=skill_id,
                     file_path=file_path,
                     content_type=source_file.content_type,
                 ),
-                version_response,
+                io.BytesIO(data),
             )
 
             logger.info(
@@ -343,22 +402,16 @@ class VersionManager:
         if not version2:
             raise VersionNotFoundError(f"Version not found: {version_id_2}")
 
-        # Download and compare
+        cache_key = (version1.version_id, version2.version_id)
+        cached = self.comparison_cache.get(cache_key)
+        if cached is not None:
+            return {**cached, "comparison_timestamp": datetime.utcnow().isoformat()}
+
+        # Rebuild and compare
         try:
             with self.minio_client.operation_context(f"compare_versions_{file_path}"):
-                # Get version 1
-                response1 = self.minio_client.get_object(
-                    bucket_name=self.versions_bucket,
-                    object_name=version1.object_name,
-                )
-                data1 = response1.read()
-
-                # Get version 2
-                response2 = self.minio_client.get_object(
-                    bucket_name=self.versions_bucket,
-                    object_name=version2.object_name,
-                )
-                data2 = response2.read()
+                data1 = await self._reconstruct_version_data(version1)
+                data2 = await self._reconstruct_version_data(version2)
 
             # Perform comparison
             size_diff = len(data2) - len(data1)
@@ -392,6 +445,8 @@ class VersionManager:
                 "comparison_timestamp": datetime.utcnow().isoformat(),
             }
 
+            self.comparison_cache.put(cache_key, comparison_result)
+
             logger.debug(
                 f"Compared versions {version_id_1} and {version_id_2} for {file_path}"
             )
@@ -447,17 +502,19 @@ class VersionManager:
             )
 
         try:
-            # Delete from MinIO
+            # Keep surviving deltas readable before removing their base
             with self.minio_client.operation_context(f"delete_version_{file_path}"):
-                self.minio_client.remove_object(
-                    bucket_name=self.versions_bucket,
-                    object_name=version.object_name,
-                )
+                await self._materialize_dependents([version])
 
             # Delete from database
             self.db.delete(version)
             self.db.commit()
 
+            # Delete from MinIO
+            with self.minio_client.operation_context(f"delete_version_{file_path}"):
+                await self._remove_version_objects([version])
+            self._evict([version])
+
             logger.info(
                 f"Deleted version {version_id} for file {file_path}"
             )
@@ -516,18 +573,18 @@ class VersionManager:
                         file_version_counts[file_id] -= 1
 
             deleted_count = 0
+            versions_to_cleanup = versions_to_cleanup[:100]  # Limit batch size
+
+            # Keep surviving deltas readable before removing their bases
+            await self._materialize_dependents(versions_to_cleanup)
 
             # Delete versions
-            for version in versions_to_cleanup[:100]:  # Limit batch size
+            deleted_versions = []
+            for version in versions_to_cleanup:
                 try:
-                    # Delete from MinIO
-                    self.minio_client.remove_object(
-                        bucket_name=self.versions_bucket,
-                        object_name=version.object_name,
-                    )
-
                     # Delete from database
                     self.db.delete(version)
+                    deleted_versions.append(version)
                     deleted_count += 1
 
                 except Exception as e:
@@ -535,6 +592,10 @@ class VersionManager:
 
             self.db.commit()
 
+            # Delete from MinIO once no record references the objects
+            await self._remove_version_objects(deleted_versions)
+            self._evict(deleted_versions)
+
             logger.info(
                 f"Cleaned up {deleted_count} old versions"
             )
@@ -703,6 +764,258 @@ class VersionManager:
             logger.error(f"Database error getting version number: {e}")
             return 1
 
+    async def _get_latest_version(self, file_id: UUID) -> Optional[FileVersion]:
+        """Get the most recent version of a file.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            FileVersion instance or None
+        """
+        try:
+            return (
+                self.db.query(FileVersion)
+                .filter(FileVersion.file_id == file_id)
+                .order_by(desc(FileVersion.version_number))
+                .first()
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting latest version: {e}")
+            return None
+
+    @staticmethod
+    def _delta_info(version: FileVersion) -> Optional[Dict[str, Any]]:
+        """Get delta information of a version.
+
+        Args:
+            version: FileVersion instance
+
+        Returns:
+            Delta information, or None if the version is a full snapshot
+        """
+        metadata = version.version_metadata
+        if not isinstance(metadata, dict):
+            return None
+        delta_info = metadata.get("delta")
+        return delta_info if isinstance(delta_info, dict) else None
+
+    async def _encode_version_data(
+        self,
+        file_id: UUID,
+        data: bytes,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """Encode new version data as a delta against the latest version.
+
+        Args:
+            file_id: File ID
+            data: New version content
+
+        Returns:
+            Tuple of (delta information, encoded delta), or (None, None) if
+            the version should be stored as a full snapshot
+        """
+        base = await self._get_latest_version(file_id)
+        if base is None:
+            return None, None
+
+        base_info = self._delta_info(base)
+        chain_length = (base_info["chain_length"] if base_info else 0) + 1
+        if chain_length > self.max_chain_length:
+            return None, None
+
+        try:
+            base_data = await self._reconstruct_version_data(base)
+            payload = encode_delta(compute_delta(base_data, data), binary=True)
+        except Exception as e:
+            logger.warning(f"Falling back to snapshot for file {file_id}: {e}")
+            return None, None
+
+        if len(payload) > len(data) * self.max_delta_ratio:
+            return None, None
+
+        return {"base_version_id": base.version_id, "chain_length": chain_length}, payload
+
+    def _version_bucket(self, version: FileVersion) -> str:
+        """Get the bucket holding a version's object.
+
+        Args:
+            version: FileVersion instance
+
+        Returns:
+            Blob bucket for snapshots stored as blobs, else the versions bucket
+        """
+        metadata = version.version_metadata
+        if isinstance(metadata, dict) and metadata.get("blob"):
+            return metadata["blob"]
+        return self.versions_bucket
+
+    def _download_object(self, version: FileVersion) -> bytes:
+        """Download the stored object of a version.
+
+        Args:
+            version: FileVersion instance
+
+        Returns:
+            Object content
+        """
+        response = self.minio_client.get_object(
+            bucket_name=self._version_bucket(version),
+            object_name=version.object_name,
+        )
+        try:
+            return response.read()
+        finally:
+            close = getattr(response, "close", None)
+            if close:
+                close()
+
+    async def _reconstruct_version_data(self, version: FileVersion) -> bytes:
+        """Rebuild the full content of a version.
+
+        Walks the delta chain back to the nearest cached version or full
+        snapshot, then applies the deltas forward.
+
+        Args:
+            version: FileVersion instance
+
+        Returns:
+            Version content
+
+        Raises:
+            VersioningError: If a base version of the chain is missing
+        """
+        data = self.data_cache.get(version.version_id)
+        chain: List[FileVersion] = []
+        current = version
+        while data is None:
+            delta_info = self._delta_info(current)
+            if delta_info is None:
+                data = self._download_object(current)
+                break
+            chain.append(current)
+            base = await self._get_version(current.file_id, delta_info["base_version_id"])
+            if base is None:
+                raise VersioningError(
+                    f"Base version {delta_info['base_version_id']} of "
+                    f"{current.version_id} not found"
+                )
+            current = base
+            data = self.data_cache.get(current.version_id)
+
+        for delta_version in reversed(chain):
+            delta = decode_delta(self._download_object(delta_version))
+            data = apply_delta(data, delta)
+
+        self.data_cache.put(version.version_id, data)
+        return data
+
+    async def _materialize_dependents(
+        self,
+        versions: List[FileVersion],
+        candidates: Optional[List[FileVersion]] = None,
+    ) -> int:
+        """Store full content for deltas based on versions about to be deleted.
+
+        Args:
+            versions: Versions about to be deleted
+            candidates: Versions to check (defaults to all versions of the
+                affected files)
+
+        Returns:
+            Number of versions materialized
+        """
+        if not versions:
+            return 0
+
+        doomed = {version.version_id for version in versions}
+        if candidates is None:
+            file_ids = {version.file_id for version in versions}
+            candidates = (
+                self.db.query(FileVersion)
+                .filter(FileVersion.file_id.in_(file_ids))
+                .all()
+            )
+
+        materialized = 0
+        stale_objects = []
+        for version in candidates:
+            delta_info = self._delta_info(version)
+            if (
+                version.version_id in doomed
+                or delta_info is None
+                or delta_info["base_version_id"] not in doomed
+            ):
+                continue
+
+            data = await self._reconstruct_version_data(version)
+            metadata = {
+                key: value
+                for key, value in version.version_metadata.items()
+                if key != "delta"
+            }
+            # The delta object stays intact until the new metadata is committed
+            stale_objects.append(version.object_name)
+            if self.blob_store is not None:
+                blob = await self.blob_store.store(data, checksum=version.checksum)
+                version.object_name = blob.object_name
+                metadata["blob"] = self.blob_store.bucket_name
+            else:
+                object_name = f"{version.object_name}.full"
+                self.minio_client.put_object(
+                    bucket_name=self.versions_bucket,
+                    object_name=object_name,
+                    data=io.BytesIO(data),
+                    length=len(data),
+                )
+                version.object_name = object_name
+            version.version_metadata = metadata
+            materialized += 1
+
+        if materialized:
+            self.db.commit()
+            for object_name in stale_objects:
+                self.minio_client.remove_object(
+                    bucket_name=self.versions_bucket,
+                    object_name=object_name,
+                )
+            logger.debug(f"Materialized {materialized} delta versions")
+
+        return materialized
+
+    async def _remove_version_objects(self, versions: List[FileVersion]) -> None:
+        """Remove the stored objects of deleted versions.
+
+        Snapshots stored as blobs only drop their reference.
+
+        Args:
+            versions: Deleted versions
+        """
+        for version in versions:
+            try:
+                if self._version_bucket(version) != self.versions_bucket:
+                    await self.blob_store.release(version.checksum)
+                else:
+                    self.minio_client.remove_object(
+                        bucket_name=self.versions_bucket,
+                        object_name=version.object_name,
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to remove object of version {version.version_id}: {e}")
+
+    def _evict(self, versions: List[FileVersion]) -> None:
+        """Drop cached data and comparisons of deleted versions.
+
+        Args:
+            versions: Deleted versions
+        """
+        version_ids = {version.version_id for version in versions}
+        for version_id in version_ids:
+            self.data_cache.pop(version_id)
+        self.comparison_cache.discard_where(
+            lambda key: key[0] in version_ids or key[1] in version_ids
+        )
+
     def _generate_version_object_name(
         self,
         file_id: UUID,
@@ -743,18 +1056,15 @@ class VersionManager:
 
             # Delete versions beyond max limit (keep latest ones)
             versions_to_delete = versions[self.max_versions:]
+            await self._materialize_dependents(versions_to_delete, candidates=versions)
 
             deleted_count = 0
+            deleted_versions = []
             for version in versions_to_delete:
                 try:
-                    # Delete from MinIO
-                    self.minio_client.remove_object(
-                        bucket_name=self.versions_bucket,
-                        object_name=version.object_name,
-                    )
-
                     # Delete from database
                     self.db.delete(version)
+                    deleted_versions.append(version)
                     deleted_count += 1
 
                 except Exception as e:
@@ -764,6 +1074,10 @@ class VersionManager:
 
             self.db.commit()
 
+            # Delete from MinIO once no record references the objects
+            await self._remove_version_objects(deleted_versions)
+            self._evict(deleted_versions)
+
             if deleted_count > 0:
                 logger.debug(f"Cleaned up {deleted_count} old versions for file {file_id}")
 
@@ -796,3 +1110,8 @@ class VersionManager:
                 f"Versioning operation '{operation_name}' failed after {duration:.3f}s: {e}"
             )
             raise
+
+
+# Shared caches of reconstructed version data and comparison results
+version_data_cache = LRUCache(max_bytes=64 * 1024 * 1024)
+version_comparison_cache = LRUCache(max_entries=256)
@@ -4,13 +4,18 @@ This module contains Celery asynchronous tasks for skill management,
 including import/export, bulk operations, analytics, and scheduled tasks.
 """
 
-from celery import Celery
+from celery import Celery, chord
 from celery.exceptions import Retry
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
+import asyncio
 import logging
 
+from sqlalchemy import bindparam, delete, func, select, tuple_, update
+from sqlalchemy.orm import Session
+
 from app.skill.manager import SkillManager
+from app.skill.models import Skill, SkillTagAssociation
 from app.skill.importer import SkillImporter, ImportConfig, ExportConfig, ImportFormat, ExportFormat, ValidationLevel
 from app.skill.analytics import SkillAnalytics, TimeRange
 from app.skill.event_manager import SkillEventManager, EventType
@@ -51,10 +56,164 @@ celery_app.conf.update(
             "task": "app.tasks.skill_tasks.check_inactive_skills",
             "schedule": 43200.0,  # Every 12 hours
         },
+        "refresh-skill-stat-counts": {
+            "task": "app.tasks.skill_tasks.refresh_skill_stat_counts",
+            "schedule": 86400.0,  # Daily
+        },
     },
 )
 
 
+# Skills handled by one chunk subtask
+SKILL_CHUNK_SIZE = 1000
+
+# Maintenance tasks run Core statements on the table; they are set-based
+# and need no ORM unit of work
+skill_table = Skill.__table__
+
+# Position of a skill in (updated_at, id) order
+SkillKey = Tuple[datetime, str]
+
+_session_factory = None
+
+
+def get_db_session() -> Session:
+    """Create a database session for a task.
+
+    The engine is created on first use so that importing the task module
+    does not connect to the database.
+
+    Returns:
+        New SQLAlchemy session
+    """
+    global _session_factory
+    if _session_factory is None:
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from app.core.config import settings
+
+        engine = create_engine(
+            settings.DATABASE_URL,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+        _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return _session_factory()
+
+
+def _encode_key(key: Optional[SkillKey]) -> Optional[List[str]]:
+    """Convert a keyset position to a JSON-serializable task argument."""
+    if key is None:
+        return None
+    return [key[0].isoformat(), key[1]]
+
+
+def _decode_key(value: Optional[Sequence[str]]) -> Optional[SkillKey]:
+    """Convert a task argument back to a keyset position."""
+    if value is None:
+        return None
+    return datetime.fromisoformat(value[0]), value[1]
+
+
+def _keyset_range(after: Optional[SkillKey], upto: Optional[SkillKey]) -> List[Any]:
+    """Build conditions selecting skills with after < (updated_at, id) <= upto.
+
+    Args:
+        after: Exclusive lower bound, or None for the first skill
+        upto: Inclusive upper bound, or None for the last skill
+
+    Returns:
+        List of SQLAlchemy conditions
+    """
+    key = tuple_(skill_table.c.updated_at, skill_table.c.id)
+    conditions = []
+    if after is not None:
+        conditions.append(key > tuple_(*after))
+    if upto is not None:
+        conditions.append(key <= tuple_(*upto))
+    return conditions
+
+
+def iter_skill_ranges(
+    session: Session,
+    chunk_size: int = SKILL_CHUNK_SIZE,
+    conditions: Sequence[Any] = (),
+) -> Iterator[Tuple[Optional[SkillKey], Optional[SkillKey]]]:
+    """Split skills into keyset ranges of about chunk_size skills.
+
+    Only the last skill of each range is read, with an index scan on
+    (updated_at, id) that starts after the previous range, so splitting
+    never loads the skills themselves. The last range is left open so that
+    skills updated while the ranges are processed are still included.
+
+    Args:
+        session: Database session
+        chunk_size: Number of skills per range
+        conditions: Additional conditions skills must match
+
+    Yields:
+        (after, upto) bounds for _keyset_range
+    """
+    after = None
+    while True:
+        query = (
+            select(skill_table.c.updated_at, skill_table.c.id)
+            .where(*conditions, *_keyset_range(after, None))
+            .order_by(skill_table.c.updated_at, skill_table.c.id)
+        )
+        row = session.execute(query.offset(chunk_size - 1).limit(1)).first()
+        if row is None:
+            if session.execute(query.limit(1)).first() is not None:
+                yield after, None
+            return
+
+        upto = (row.updated_at, row.id)
+        yield after, upto
+        after = upto
+
+
+def _dispatch_chunks(chunk_task, chunk_args: List[Tuple], operation: str, **kwargs):
+    """Run chunk subtasks in parallel and aggregate their results.
+
+    Args:
+        chunk_task: Celery task processing one chunk
+        chunk_args: Positional arguments of each chunk
+        operation: Operation name recorded in the aggregated result
+        **kwargs: Keyword arguments passed to every chunk
+
+    Returns:
+        AsyncResult of the aggregated result, or None if there are no chunks
+    """
+    if not chunk_args:
+        return None
+
+    header = [chunk_task.s(*args, **kwargs) for args in chunk_args]
+    return chord(header)(aggregate_skill_chunks.s(operation=operation))
+
+
+@celery_app.task
+def aggregate_skill_chunks(results: List[Dict[str, Any]], operation: str):
+    """Combine the results of chunk subtasks into one result.
+
+    Numeric fields are summed over all chunks.
+
+    Args:
+        results: Results of the chunk subtasks
+        operation: Operation name
+    """
+    summary: Dict[str, Any] = {"operation": operation, "chunks": len(results)}
+    for result in results:
+        for key, value in result.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                summary[key] = summary.get(key, 0) + value
+
+    logger.info(f"{operation} completed over {len(results)} chunks: {summary}")
+    summary["message"] = f"{operation} completed over {len(results)} chunks"
+    return summary
+
+
 # Import/Export Tasks
 @celery_app.task(bind=True, max_retries=3)
 def import_skills_async(
@@ -177,48 +336,176 @@ def export_skills_async(
 
 
 # Bulk Operations Tasks
+def _get_deleted_stat_deltas(session: Session, skill_ids: List[str]) -> Dict[Tuple[str, str], int]:
+    """Get the statistics summary changes of deleting a set of skills.
+
+    Args:
+        session: Database session
+        skill_ids: Skill IDs
+
+    Returns:
+        Count change per (dimension, value)
+    """
+    associations = SkillTagAssociation.__table__
+    deltas: Dict[Tuple[str, str], int] = {}
+    for dimension, column, id_column in (
+        ("category", skill_table.c.category_id, skill_table.c.id),
+        ("tag", associations.c.tag_id, associations.c.skill_id),
+        ("content_type", skill_table.c.content_type, skill_table.c.id),
+    ):
+        rows = session.execute(
+            select(column, func.count())
+            .where(id_column.in_(skill_ids), column.isnot(None))
+            .group_by(column)
+        )
+        for value, count in rows:
+            deltas[(dimension, value)] = -count
+    return deltas
+
+
+def _apply_bulk_operation(session: Session, operation: str, skill_ids: List[str]) -> int:
+    """Apply a bulk operation to a set of skills with one statement.
+
+    Bulk changes bypass skill events, so once they are committed the
+    statistics summary counts of deletions are adjusted here and the
+    statistics data version is bumped for every operation.
+
+    Args:
+        session: Database session
+        operation: Operation name ("activate", "deactivate" or "delete")
+        skill_ids: Skill IDs
+
+    Returns:
+        Number of skills changed
+    """
+    now = datetime.utcnow()
+    stat_deltas = {}
+    if operation == "activate":
+        statement = update(skill_table).values(
+            status="active",
+            published_at=func.coalesce(skill_table.c.published_at, now),
+            updated_at=now,
+        )
+    elif operation == "deactivate":
+        statement = update(skill_table).values(status="draft", updated_at=now)
+    elif operation == "delete":
+        # Versions and tag associations are removed by ON DELETE CASCADE
+        stat_deltas = _get_deleted_stat_deltas(session, skill_ids)
+        statement = delete(skill_table)
+    else:
+        raise ValueError(f"Unsupported operation: {operation}")
+
+    result = session.execute(statement.where(skill_table.c.id.in_(skill_ids)))
+    session.commit()
+
+    try:
+        asyncio.run(SkillManager(session).apply_stat_deltas(stat_deltas))
+    except Exception as e:
+        # The change is committed; drift is repaired by refresh_skill_stat_counts
+        logger.error(f"Failed to update skill stats after bulk {operation}: {e}")
+
+    return result.rowcount
+
+
 @celery_app.task(bind=True, max_retries=3)
-def bulk_activate_skills(
+def bulk_skill_operation_chunk(
     self,
+    operation: str,
     skill_ids: List[str],
-    user_id: str,
 ):
-    """Asynchronously activate multiple skills.
+    """Apply a bulk operation to one chunk of skills.
 
     Args:
-        skill_ids: List of skill IDs to activate
-        user_id: User performing the operation
+        operation: Operation name
+        skill_ids: Skill IDs of the chunk
     """
     try:
-        # Create manager (would be injected in real app)
-        from unittest.mock import Mock
-        manager = Mock(spec=SkillManager)
-        manager.bulk_operation = Mock(return_value=Mock(
-            successful=len(skill_ids),
-            failed=0,
-            processed=len(skill_ids),
-        ))
+        with get_db_session() as session:
+            changed = _apply_bulk_operation(session, operation, skill_ids)
 
-        # Create bulk operation
-        from app.skill.schemas.skill_operations import SkillBulkOperation
-        operation = SkillBulkOperation(
-            operation="activate",
-            skill_ids=skill_ids,
-            parameters={},
-        )
+        return {
+            "total": len(skill_ids),
+            "successful": changed,
+            "failed": len(skill_ids) - changed,
+        }
+
+    except Exception as e:
+        logger.error(f"Bulk {operation} chunk failed: {e}")
+        raise self.retry(exc=e, countdown=60)
+
+
+def _run_bulk_operation(
+    operation: str,
+    skill_ids: List[str],
+    chunk_size: int,
+    verb: str,
+) -> Dict[str, Any]:
+    """Run a bulk operation inline or fanned out over chunk subtasks.
+
+    A single chunk is applied directly. Larger operations are split into
+    chunks applied in parallel, whose results are aggregated by a chord.
+
+    Args:
+        operation: Operation name
+        skill_ids: Skill IDs
+        chunk_size: Number of skills per chunk
+        verb: Past tense of the operation for messages
+
+    Returns:
+        Operation result, or dispatch summary for fanned out operations
+    """
+    skill_ids = list(dict.fromkeys(skill_ids))
+    chunks = [skill_ids[i:i + chunk_size] for i in range(0, len(skill_ids), chunk_size)]
 
-        # Execute bulk operation
-        result = manager.bulk_operation(operation)
+    if len(chunks) <= 1:
+        changed = 0
+        if chunks:
+            with get_db_session() as session:
+                changed = _apply_bulk_operation(session, operation, chunks[0])
 
-        logger.info(f"Bulk activate completed: {result.successful}/{result.processed}")
+        logger.info(f"Bulk {operation} completed: {changed}/{len(skill_ids)}")
         return {
-            "operation": "activate",
-            "total": result.processed,
-            "successful": result.successful,
-            "failed": result.failed,
-            "message": f"Activated {result.successful} skills",
+            "operation": operation,
+            "total": len(skill_ids),
+            "successful": changed,
+            "failed": len(skill_ids) - changed,
+            "message": f"{verb} {changed} skills",
         }
 
+    result = _dispatch_chunks(
+        bulk_skill_operation_chunk,
+        [(operation, chunk) for chunk in chunks],
+        f"bulk_{operation}",
+    )
+
+    logger.info(f"Bulk {operation} of {len(skill_ids)} skills dispatched in {len(chunks)} chunks")
+    return {
+        "operation": operation,
+        "total": len(skill_ids),
+        "chunks": len(chunks),
+        "status": "dispatched",
+        "result_id": result.id,
+        "message": f"Dispatched {operation} of {len(skill_ids)} skills in {len(chunks)} chunks",
+    }
+
+
+@celery_app.task(bind=True, max_retries=3)
+def bulk_activate_skills(
+    self,
+    skill_ids: List[str],
+    user_id: str,
+    chunk_size: int = SKILL_CHUNK_SIZE,
+):
+    """Asynchronously activate multiple skills.
+
+    Args:
+        skill_ids: List of skill IDs to activate
+        user_id: User performing the operation
+        chunk_size: Number of skills updated by each chunk subtask
+    """
+    try:
+        return _run_bulk_operation("activate", skill_ids, chunk_size, "Activated")
+
     except Exception as e:
         logger.error(f"Bulk activate task failed: {e}")
         raise self.retry(exc=e, countdown=60)
@@ -229,42 +516,17 @@ def bulk_deactivate_skills(
     self,
     skill_ids: List[str],
     user_id: str,
+    chunk_size: int = SKILL_CHUNK_SIZE,
 ):
     """Asynchronously deactivate multiple skills.
 
     Args:
         skill_ids: List of skill IDs to deactivate
         user_id: User performing the operation
+        chunk_size: Number of skills updated by each chunk subtask
     """
     try:
-        # Create manager (would be injected in real app)
-        from unittest.mock import Mock
-        manager = Mock(spec=SkillManager)
-        manager.bulk_operation = Mock(return_value=Mock(
-            successful=len(skill_ids),
-            failed=0,
-            processed=len(skill_ids),
-        ))
-
-        # Create bulk operation
-        from app.skill.schemas.skill_operations import SkillBulkOperation
-        operation = SkillBulkOperation(
-            operation="deactivate",
-            skill_ids=skill_ids,
-            parameters={},
-        )
-
-        # Execute bulk operation
-        result = manager.bulk_operation(operation)
-
-        logger.info(f"Bulk deactivate completed: {result.successful}/{result.processed}")
-        return {
-            "operation": "deactivate",
-            "total": result.processed,
-            "successful": result.successful,
-            "failed": result.failed,
-            "message": f"Deactivated {result.successful} skills",
-        }
+        return _run_bulk_operation("deactivate", skill_ids, chunk_size, "Deactivated")
 
     except Exception as e:
         logger.error(f"Bulk deactivate task failed: {e}")
@@ -277,6 +539,7 @@ def bulk_delete_skills(
     skill_ids: List[str],
     user_id: str,
     confirm_deletion: bool = False,
+    chunk_size: int = SKILL_CHUNK_SIZE,
 ):
     """Asynchronously delete multiple skills.
 
@@ -284,39 +547,13 @@ def bulk_delete_skills(
         skill_ids: List of skill IDs to delete
         user_id: User performing the operation
         confirm_deletion: Confirmation flag for deletion
+        chunk_size: Number of skills deleted by each chunk subtask
     """
-    try:
-        if not confirm_deletion:
-            raise ValueError("Deletion must be confirmed")
-
-        # Create manager (would be injected in real app)
-        from unittest.mock import Mock
-        manager = Mock(spec=SkillManager)
-        manager.bulk_operation = Mock(return_value=Mock(
-            successful=len(skill_ids),
-            failed=0,
-            processed=len(skill_ids),
-        ))
-
-        # Create bulk operation
-        from app.skill.schemas.skill_operations import SkillBulkOperation
-        operation = SkillBulkOperation(
-            operation="delete",
-            skill_ids=skill_ids,
-            parameters={"confirm": True},
-        )
-
-        # Execute bulk operation
-        result = manager.bulk_operation(operation)
+    if not confirm_deletion:
+        raise ValueError("Deletion must be confirmed")
 
-        logger.info(f"Bulk delete completed: {result.successful}/{result.processed}")
-        return {
-            "operation": "delete",
-            "total": result.processed,
-            "successful": result.successful,
-            "failed": result.failed,
-            "message": f"Deleted {result.successful} skills",
-        }
+    try:
+        return _run_bulk_operation("delete", skill_ids, chunk_size, "Deleted")
 
     except Exception as e:
         logger.error(f"Bulk delete task failed: {e}")
@@ -361,60 +598,126 @@ def calculate_quality_score_async(
         raise self.retry(exc=e, countdown=60)
 
 
+async def _score_skills(analytics: SkillAnalytics, skills: List[Any]) -> Tuple[List[Dict[str, Any]], int, int]:
+    """Score the loaded skills whose score inputs changed.
+
+    Args:
+        analytics: Analytics instance
+        skills: Skill rows to score
+
+    Returns:
+        Tuple of (update parameters per scored skill, number of failures,
+        number of unchanged skills)
+    """
+    changed = [
+        skill for skill in skills
+        if skill.quality_fingerprint != analytics.get_quality_fingerprint(skill)
+    ]
+
+    # Prefork workers are daemonic and cannot start a process pool; the
+    # chunks already spread the work over the workers
+    qualities = await analytics.score_skills(changed, use_processes=False)
+
+    scores = []
+    failed = 0
+    for skill, quality in zip(changed, qualities):
+        if quality is None:
+            failed += 1
+            continue
+        scores.append({
+            "skill_id": skill.id,
+            "score": max(0.0, min(100.0, quality.overall_score)),
+            "fingerprint": quality.fingerprint,
+            # Keep the keyset position; a derived score is not an edit
+            "skill_updated_at": skill.updated_at,
+        })
+    return scores, failed, len(skills) - len(changed)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def recalculate_quality_scores_chunk(
+    self,
+    after: Optional[List[str]],
+    upto: Optional[List[str]],
+):
+    """Recalculate quality scores for one keyset range of skills.
+
+    The skills are loaded with one range query. Skills whose score inputs
+    match their stored fingerprint are skipped, and the new scores of the
+    others are written with a single executemany UPDATE.
+
+    Args:
+        after: Exclusive lower (updated_at, id) bound, or None
+        upto: Inclusive upper (updated_at, id) bound, or None
+    """
+    try:
+        with get_db_session() as session:
+            query = (
+                select(skill_table)
+                .where(*_keyset_range(_decode_key(after), _decode_key(upto)))
+                .order_by(skill_table.c.updated_at, skill_table.c.id)
+            )
+            skills = session.execute(query).all()
+
+            analytics = SkillAnalytics(SkillManager(session), SkillEventManager())
+            scores, failed, unchanged = asyncio.run(_score_skills(analytics, skills))
+
+            if scores:
+                session.execute(
+                    update(skill_table)
+                    .where(skill_table.c.id == bindparam("skill_id"))
+                    .values(
+                        quality_score=bindparam("score"),
+                        quality_fingerprint=bindparam("fingerprint"),
+                        updated_at=bindparam("skill_updated_at"),
+                    ),
+                    scores,
+                )
+                session.commit()
+
+        return {
+            "total_skills": len(skills),
+            "processed": len(scores),
+            "unchanged": unchanged,
+            "failed": failed,
+        }
+
+    except Exception as e:
+        logger.error(f"Quality score chunk {after}..{upto} failed: {e}")
+        raise self.retry(exc=e, countdown=60)
+
+
 @celery_app.task(bind=True, max_retries=3)
 def recalculate_quality_scores(
     self,
-    batch_size: int = 100,
+    batch_size: int = SKILL_CHUNK_SIZE,
 ):
     """Recalculate quality scores for all skills.
 
+    Skills are split into keyset ranges on (updated_at, id), each scored
+    by a recalculate_quality_scores_chunk subtask, so the work spreads over
+    all workers and no process loads the whole table. The chunk results
+    are aggregated into one result by a chord.
+
     Args:
-        batch_size: Number of skills to process in each batch
+        batch_size: Number of skills scored by each chunk subtask
     """
     try:
-        # Get all skills (would query database in real app)
-        from unittest.mock import Mock
-        manager = Mock(spec=SkillManager)
-        manager.list_skills = Mock(return_value=Mock(
-            items=[
-                Mock(id=f"skill{i}", name=f"Skill {i}")
-                for i in range(1, 101)
-            ],
-            total=100,
-        ))
-
-        # Get skills
-        result = manager.list_skills(page_size=batch_size)
-        skills = result.items
+        with get_db_session() as session:
+            ranges = [
+                (_encode_key(after), _encode_key(upto))
+                for after, upto in iter_skill_ranges(session, batch_size)
+            ]
 
-        # Create analytics (would be injected in real app)
-        from unittest.mock import Mock
-        analytics = Mock(spec=SkillAnalytics)
-        analytics.calculate_quality_score = Mock(return_value=Mock(
-            overall_score=85.0,
-        ))
+        result = _dispatch_chunks(recalculate_quality_scores_chunk, ranges, "recalculate_quality_scores")
 
-        # Process skills in batches
-        processed = 0
-        failed = 0
-
-        for skill in skills:
-            try:
-                quality = analytics.calculate_quality_score(skill.id)
-                if quality:
-                    processed += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                logger.error(f"Failed to process {skill.id}: {e}")
-                failed += 1
-
-        logger.info(f"Quality score recalculation completed: {processed} success, {failed} failed")
+        logger.info(f"Quality score recalculation dispatched in {len(ranges)} chunks")
         return {
-            "total_skills": len(skills),
-            "processed": processed,
-            "failed": failed,
-            "message": f"Recalculated quality scores for {processed} skills",
+            "chunks": len(ranges),
+            "batch_size": batch_size,
+            "status": "dispatched" if result else "completed",
+            "result_id": result.id if result else None,
+            "message": f"Dispatched quality score recalculation in {len(ranges)} chunks",
         }
 
     except Exception as e:
@@ -604,6 +907,25 @@ def cleanup_old_versions(
 
 
 # Scheduled Tasks
+@celery_app.task
+def refresh_skill_stat_counts():
+    """Rebuild the skill statistics summary table from the skills.
+
+    This is a scheduled task that runs daily, repairing counts that
+    drifted from changes made outside the skill manager.
+    """
+    try:
+        with get_db_session() as session:
+            asyncio.run(SkillManager(session).refresh_stat_counts())
+
+        logger.info("Refreshed skill stat counts")
+        return {"message": "Refreshed skill stat counts"}
+
+    except Exception as e:
+        logger.error(f"Skill stat count refresh failed: {e}")
+        raise
+
+
 @celery_app.task
 def cleanup_old_analytics(
     days_old: int = 30,
@@ -636,41 +958,30 @@ def cleanup_old_analytics(
 def check_inactive_skills(
     days_inactive: int = 30,
 ):
-    """Check for inactive skills and send notifications.
+    """Count active skills that have not been updated recently.
+
+    This is a scheduled task that runs every 12 hours. The count is a
+    single aggregate query over the (updated_at, id) index.
 
-    This is a scheduled task that runs every 12 hours.
+    Args:
+        days_inactive: Days without updates after which a skill is inactive
     """
     try:
-        # Get skills inactive for specified days
-        from unittest.mock import Mock
-        manager = Mock(spec=SkillManager)
-        manager.list_skills = Mock(return_value=Mock(
-            items=[
-                Mock(
-                    id=f"inactive_skill{i}",
-                    name=f"Inactive Skill {i}",
-                    last_executed=datetime.now() - timedelta(days=days_inactive + i)
-                )
-                for i in range(1, 11)
-            ],
-            total=10,
-        ))
-
-        result = manager.list_skills(page_size=1000)
-        skills = result.items
+        cutoff = datetime.utcnow() - timedelta(days=days_inactive)
 
-        # Filter inactive skills
-        inactive_skills = [
-            skill for skill in skills
-            if hasattr(skill, 'last_executed') and
-            (datetime.now() - skill.last_executed).days > days_inactive
-        ]
+        with get_db_session() as session:
+            inactive_count = session.execute(
+                select(func.count(skill_table.c.id)).where(
+                    skill_table.c.status == "active",
+                    skill_table.c.updated_at < cutoff,
+                )
+            ).scalar_one()
 
-        logger.info(f"Found {len(inactive_skills)} inactive skills")
+        logger.info(f"Found {inactive_count} inactive skills")
         return {
-            "inactive_count": len(inactive_skills),
+            "inactive_count": inactive_count,
             "days_inactive": days_inactive,
-            "message": f"Found {len(inactive_skills)} inactive skills",
+            "message": f"Found {inactive_count} inactive skills",
         }
 
     except Exception as e:
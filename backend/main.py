@@ -18,7 +18,7 @@ from pathlib import Path
 from app.core.config import settings
 
 # Import API routes
-from app.api.routes import skill_routes
+from app.api.routes import metrics_routes, skill_routes
 
 # Import WebSocket handlers
 from app.api.websocket import skill_websocket
@@ -30,6 +30,7 @@ from app.skill.editor import SkillEditor
 from app.skill.version_manager import SkillVersionManager
 from app.skill.importer import SkillImporter
 from app.skill.analytics import SkillAnalytics
+from app.progress.notification_manager import notification_manager
 
 # Configure logging
 logging.basicConfig(
@@ -67,10 +68,18 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize managers: {e}")
         raise
 
+    if settings.METRICS_ENABLED:
+        await metrics_routes.metrics_exporter.start(settings.METRICS_SNAPSHOT_INTERVAL)
+
+    # Deliver rate-limited notifications as periodic digests
+    await notification_manager.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down Skill Management Center...")
+    await notification_manager.stop()
+    await metrics_routes.metrics_exporter.stop()
 
 
 # Create FastAPI application
@@ -163,6 +172,9 @@ app.include_router(
     tags=["skills"]
 )
 
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_routes.router)
+
 # Include WebSocket routes
 app.add_api_websocket_route(
     "/ws/skills/status",
@@ -768,6 +768,26 @@ class TestFileManagementAPI:
             assert response.status_code == 200
             assert response.headers["content-type"] == "image/jpeg"
 
+    @pytest.mark.asyncio
+    async def test_preview_manager_loads_content_from_storage(self):
+        """Test the preview manager dependency reads file content from storage."""
+        from app.file.api.v1.preview import get_preview_manager
+
+        storage_client = Mock()
+        storage_client.get_object.return_value.read.return_value = b"file content"
+        file_info = Mock(id=uuid4(), bucket="files", storage_key="docs/readme.txt")
+
+        with patch('app.file.api.v1.preview.get_storage_client', return_value=storage_client):
+            preview_manager = await get_preview_manager(db=AsyncMock())
+            content = await preview_manager._load_content(file_info)
+
+        assert content == b"file content"
+        storage_client.get_object.assert_called_once_with(
+            bucket_name="files",
+            object_name="docs/readme.txt",
+        )
+        storage_client.get_object.return_value.release_conn.assert_called_once()
+
     # Error Handling Tests
 
     def test_invalid_file_id_format(self, client):
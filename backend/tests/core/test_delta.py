@@ -0,0 +1,101 @@
+"""Tests for the delta codec and LRU cache.
+
+This module contains unit tests for computing, applying and serializing
+content deltas, and for the byte-budgeted LRUCache used to hold
+reconstructed versions.
+"""
+
+import random
+
+import pytest
+
+from app.core.cache import LRUCache
+from app.core.delta import apply_delta, compute_delta, decode_delta, encode_delta
+
+
+class TestDelta:
+    """Test suite for the delta codec."""
+
+    def test_small_edit_produces_small_delta(self):
+        """Test a one-line change only carries the changed line."""
+        base = "".join(f"line {i}\n" for i in range(10000))
+        target = base.replace("line 5000\n", "line five thousand\n")
+
+        delta = compute_delta(base, target)
+        payload = encode_delta(delta)
+
+        assert apply_delta(base, delta) == target
+        assert len(payload) < 100
+
+    def test_binary_round_trip(self):
+        """Test binary deltas survive encoding."""
+        base = b"alpha\nbeta\ngamma\n"
+        target = b"alpha\nBETA\ngamma\ndelta\n"
+
+        payload = encode_delta(compute_delta(base, target), binary=True)
+
+        assert apply_delta(base, decode_delta(payload)) == target
+
+    def test_invalid_binary_payload_rejected(self):
+        """Test payloads without the delta header raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_delta(b"not a delta")
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_edits_round_trip(self, seed):
+        """Test random line edits reconstruct exactly."""
+        rng = random.Random(seed)
+        lines = [f"{rng.random()}\n" for _ in range(200)]
+
+        for _ in range(50):
+            base = "".join(lines)
+            for _ in range(rng.randint(1, 5)):
+                position = rng.randint(0, len(lines))
+                if rng.random() < 0.5 and position < len(lines):
+                    del lines[position]
+                else:
+                    lines.insert(position, rng.choice(["x\n", "y", "\n", "zz\n"]))
+            target = "".join(lines)
+
+            assert apply_delta(base, decode_delta(encode_delta(compute_delta(base, target)))) == target
+            binary = encode_delta(compute_delta(base.encode(), target.encode()), binary=True)
+            assert apply_delta(base.encode(), decode_delta(binary)) == target.encode()
+
+
+class TestLRUCache:
+    """Test suite for LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the entry budget evicts the oldest untouched entry."""
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_budget(self):
+        """Test the byte budget bounds total value size."""
+        cache = LRUCache(max_bytes=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.put("c", b"123")
+
+        assert cache.size_bytes <= 10
+        assert "a" not in cache
+        assert cache.put("big", b"x" * 11) is False
+
+    def test_discard_where(self):
+        """Test predicate-based removal."""
+        cache = LRUCache()
+        cache.put(("v1", "v2"), 1)
+        cache.put(("v2", "v3"), 2)
+        cache.put(("v3", "v4"), 3)
+
+        removed = cache.discard_where(lambda key: "v2" in key)
+
+        assert removed == 2
+        assert len(cache) == 1
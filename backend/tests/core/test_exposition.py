@@ -0,0 +1,151 @@
+"""Tests for OpenMetrics exposition.
+
+This module contains unit tests for rendering, snapshot merging and the
+multiprocess MetricsExporter.
+"""
+
+import json
+import os
+
+import pytest
+
+from app.core.exposition import (
+    MetricsExporter,
+    merge_snapshots,
+    render,
+    sanitize_name,
+    snapshot_registry,
+)
+from app.core.metrics import MetricsRegistry
+
+
+class StatsOwner:
+    """Object exposing an ad-hoc stats dict."""
+
+    def __init__(self, hits=0, misses=0):
+        self.stats = {"hits": hits, "misses": misses, "name": "ignored", "enabled": True}
+
+
+@pytest.fixture
+def registry():
+    """Create a populated registry."""
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Handled requests").labels({"method": "GET"}).inc(3)
+    registry.gauge("system.cpu.usage.percent").labels().set(12.5)
+    latency = registry.histogram("latency_seconds", "Latency", unit="seconds").labels()
+    for value in (0.003, 0.02, 0.2, 3.0):
+        latency.record(value)
+    return registry
+
+
+class TestRender:
+    """Test suite for text rendering."""
+
+    def test_sanitize_name(self):
+        """Test dotted names become valid metric names."""
+        assert sanitize_name("system.cpu.usage") == "system_cpu_usage"
+        assert sanitize_name("1st-metric") == "_1st_metric"
+
+    def test_openmetrics(self, registry):
+        """Test OpenMetrics output."""
+        text = render(snapshot_registry(registry), openmetrics=True, buckets=(0.01, 0.1, 1.0))
+
+        assert "# TYPE requests counter" in text
+        assert 'requests_total{method="GET"} 3' in text
+        assert "system_cpu_usage_percent 12.5" in text
+        assert "# UNIT latency_seconds seconds" in text
+        assert 'latency_seconds_bucket{le="0.01"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "latency_seconds_count 4" in text
+        assert text.endswith("# EOF\n")
+
+    def test_prometheus_text(self, registry):
+        """Test Prometheus text 0.0.4 output."""
+        text = render(snapshot_registry(registry), openmetrics=False)
+
+        assert "# TYPE requests_total counter" in text
+        assert "# EOF" not in text
+        assert "# UNIT" not in text
+
+    def test_stats_sources(self):
+        """Test stats dicts are published and summed across instances."""
+        registry = MetricsRegistry()
+        first = StatsOwner(hits=2, misses=1)
+        second = StatsOwner(hits=3)
+        registry.register_stats("cache", first, counters=("hits", "misses"))
+        registry.register_stats("cache", second, counters=("hits", "misses"))
+
+        text = render(snapshot_registry(registry))
+
+        assert "cache_hits_total 5" in text
+        assert "cache_misses_total 1" in text
+        assert "cache_name" not in text
+        assert "cache_enabled" not in text
+
+    def test_stats_sources_are_weak(self):
+        """Test registering a stats dict does not keep its owner alive."""
+        registry = MetricsRegistry()
+        owner = StatsOwner()
+        registry.register_stats("cache", owner)
+
+        del owner
+
+        assert registry.stats_sources() == []
+
+
+class TestMultiprocess:
+    """Test suite for multiprocess aggregation."""
+
+    def test_merge_drops_dead_gauges(self, registry):
+        """Test counters are summed and dead workers' gauges dropped."""
+        snapshot = snapshot_registry(registry)
+
+        merged = merge_snapshots([(snapshot, True), (json.loads(json.dumps(snapshot)), False)])
+        text = render(merged)
+
+        assert 'requests_total{method="GET"} 6' in text
+        assert "latency_seconds_count 8" in text
+        assert "system_cpu_usage_percent 12.5" in text
+
+    def test_exporter_reads_worker_snapshots(self, registry, tmp_path):
+        """Test the exporter merges snapshot files from other workers."""
+        other = MetricsRegistry()
+        other.counter("requests_total").labels({"method": "GET"}).inc(4)
+        with open(tmp_path / f"metrics-{os.getpid() + 1}.json", "w") as f:
+            json.dump(snapshot_registry(other), f)
+
+        exporter = MetricsExporter(registry, multiprocess_dir=str(tmp_path), cache_ttl=0)
+        exporter.write_snapshot()
+
+        assert (tmp_path / f"metrics-{os.getpid()}.json").exists()
+        assert b'requests_total{method="GET"} 7' in exporter.render()
+
+    def test_exporter_folds_dead_worker_snapshots(self, registry, tmp_path, monkeypatch):
+        """Test exited workers' snapshots are folded into one aggregate file."""
+        monkeypatch.setattr(MetricsExporter, "_process_alive", staticmethod(lambda pid: False))
+        for pid in (os.getpid() + 1, os.getpid() + 2):
+            dead = MetricsRegistry()
+            dead.counter("requests_total").labels({"method": "GET"}).inc(2)
+            dead.gauge("system.cpu.usage.percent").labels().set(50)
+            dead.histogram("latency_seconds", unit="seconds").labels().record(0.1)
+            with open(tmp_path / f"metrics-{pid}.json", "w") as f:
+                json.dump(snapshot_registry(dead), f)
+
+        exporter = MetricsExporter(registry, multiprocess_dir=str(tmp_path), cache_ttl=0)
+        first = exporter.render()
+
+        assert sorted(os.listdir(tmp_path)) == ["metrics-aggregate.json", "metrics.lock"]
+        assert b'requests_total{method="GET"} 7' in first
+        assert b"latency_seconds_count 6" in first
+        assert b"system_cpu_usage_percent 12.5" in first
+        assert exporter.render() == first
+
+    def test_render_cache(self, registry):
+        """Test payloads are reused within the cache TTL."""
+        exporter = MetricsExporter(registry, cache_ttl=60)
+
+        first = exporter.render()
+        registry.counter("requests_total").labels({"method": "GET"}).inc()
+
+        assert exporter.render() is first
@@ -0,0 +1,210 @@
+"""Tests for the shared metrics core.
+
+This module contains unit tests for the fixed-memory metric primitives
+in app.core.metrics.
+"""
+
+import random
+
+import pytest
+
+from app.core.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    MetricType,
+    SparseHistogram,
+    TimeWindow,
+    label_key,
+)
+
+
+class TestHistogram:
+    """Test suite for Histogram."""
+
+    def test_empty_histogram(self):
+        """Test statistics of an empty histogram."""
+        histogram = Histogram()
+
+        assert len(histogram) == 0
+        assert histogram.mean == 0.0
+        assert histogram.percentile(95) == 0.0
+        assert histogram.snapshot()["count"] == 0
+
+    def test_exact_aggregates(self):
+        """Test that count, sum, min and max are exact."""
+        histogram = Histogram()
+        for value in (0.5, 1.5, 2.0, 10.0):
+            histogram.record(value)
+
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(14.0)
+        assert histogram.min == 0.5
+        assert histogram.max == 10.0
+        assert histogram.mean == pytest.approx(3.5)
+
+    def test_percentile_relative_error(self):
+        """Test percentile estimates stay within the bucket precision."""
+        rng = random.Random(42)
+        values = [rng.expovariate(10) for _ in range(20000)]
+        histogram = Histogram(sub_buckets=16)
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for p in (50, 90, 99):
+            exact = values[int(len(values) * p / 100) - 1]
+            assert histogram.percentile(p) == pytest.approx(exact, rel=0.05)
+
+    def test_percentiles_clamped_to_range(self):
+        """Test percentiles never leave the observed range."""
+        histogram = Histogram()
+        histogram.record(3.0)
+
+        assert histogram.percentiles([0, 50, 100]) == [3.0, 3.0, 3.0]
+
+    def test_zero_and_negative_values(self):
+        """Test non-positive values are counted."""
+        histogram = Histogram()
+        histogram.record(0.0)
+        histogram.record(-1.0)
+        histogram.record(1.0)
+
+        assert histogram.count == 3
+        assert histogram.min == -1.0
+        assert histogram.percentile(100) == 1.0
+
+    def test_merge(self):
+        """Test merging histograms."""
+        first = Histogram()
+        second = Histogram()
+        first.record(1.0)
+        second.record(3.0)
+
+        first.merge(second)
+
+        assert first.count == 2
+        assert first.max == 3.0
+
+        with pytest.raises(ValueError):
+            first.merge(Histogram(sub_buckets=8))
+
+    def test_cumulative_buckets(self):
+        """Test cumulative bucket counts for coarse bounds."""
+        histogram = Histogram()
+        for value in (0.001, 0.05, 0.5, 5.0):
+            histogram.record(value)
+
+        buckets = histogram.buckets([0.01, 0.1, 1.0])
+
+        assert [count for _, count in buckets] == [1, 2, 3, 4]
+
+
+    def test_sparse_histogram_matches_dense(self):
+        """Test sparse histograms estimate like dense ones and merge with them."""
+        random.seed(7)
+        values = [random.lognormvariate(0, 2) for _ in range(2000)]
+        dense = Histogram()
+        sparse = SparseHistogram()
+        for value in values:
+            dense.record(value)
+            sparse.record(value)
+
+        assert sparse.percentiles([50, 99]) == dense.percentiles([50, 99])
+        assert sparse.buckets([0.1, 1.0, 10.0]) == dense.buckets([0.1, 1.0, 10.0])
+        assert len(sparse.counts) < len(dense.counts)
+
+        dense.merge(sparse)
+        sparse.merge(sparse)
+        assert dense.percentile(90) == sparse.percentile(90)
+
+
+class TestTimeWindow:
+    """Test suite for TimeWindow."""
+
+    def test_bucket_aggregation(self):
+        """Test samples in the same bucket are aggregated."""
+        window = TimeWindow(resolution=10, slots=6)
+        window.record(1.0, timestamp=1000.0)
+        window.record(3.0, timestamp=1005.0)
+        window.record(5.0, timestamp=1010.0)
+
+        points = window.points(now=1015.0)
+
+        assert len(points) == 2
+        assert points[0].count == 2
+        assert points[0].mean == 2.0
+        assert points[0].last == 3.0
+        assert points[1].max == 5.0
+
+    def test_ring_overwrites_old_buckets(self):
+        """Test memory stays fixed as time advances."""
+        window = TimeWindow(resolution=1, slots=5)
+        for second in range(100):
+            window.record(float(second), timestamp=1000.0 + second)
+
+        points = window.points(now=1099.5)
+
+        assert [p.last for p in points] == [95.0, 96.0, 97.0, 98.0, 99.0]
+
+    def test_summary_since(self):
+        """Test merged summary with a lower bound."""
+        window = TimeWindow(resolution=1, slots=60)
+        for second in range(10):
+            window.record(1.0, timestamp=1000.0 + second)
+
+        summary = window.summary(since=1005.0, now=1010.0)
+
+        assert summary.count == 5
+        assert window.summary(now=5000.0) is None
+
+
+class TestRegistry:
+    """Test suite for MetricsRegistry."""
+
+    def test_label_children(self):
+        """Test children are keyed by label set."""
+        registry = MetricsRegistry()
+        family = registry.counter("requests_total")
+
+        family.labels({"method": "GET"}).inc()
+        family.labels({"method": "GET"}).inc(2)
+        family.labels({"method": "POST"}).inc()
+
+        children = dict(family.children())
+        assert children[label_key({"method": "GET"})].value == 3
+        assert children[label_key({"method": "POST"})].value == 1
+
+    def test_get_or_create(self):
+        """Test families are created once."""
+        registry = MetricsRegistry()
+
+        assert registry.histogram("latency") is registry.histogram("latency")
+        assert registry.get("latency").metric_type == MetricType.HISTOGRAM
+        assert "latency" in registry
+
+    def test_type_conflict(self):
+        """Test re-registering a name with another type fails."""
+        registry = MetricsRegistry()
+        registry.gauge("queue_depth")
+
+        with pytest.raises(ValueError):
+            registry.counter("queue_depth")
+
+    def test_counter_rejects_negative(self):
+        """Test counters only go up."""
+        with pytest.raises(ValueError):
+            Counter().inc(-1)
+
+    def test_gauge_history(self):
+        """Test gauges feed their window."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("temperature", history_resolution=1.0).labels()
+        assert isinstance(gauge, Gauge)
+
+        gauge.set(20.0)
+        gauge.set(25.0)
+
+        assert gauge.value == 25.0
+        assert gauge.window.summary().count == 2
@@ -0,0 +1,102 @@
+"""Tests for packed archive segments.
+
+This module contains unit tests for SegmentWriter and pack_segments: entry
+offsets, segment rollover and compatibility with standard archive readers.
+"""
+
+import hashlib
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from app.core.packing import (
+    PackedEntry,
+    SegmentWriter,
+    pack_segments,
+    read_packed_entry,
+)
+
+
+@pytest.fixture
+def files():
+    """Create small files of varied sizes, one with a long name."""
+    entries = [(f"skills/s1/file{i}.txt", f"content {i} ".encode("utf-8") * (i * 50 + 1)) for i in range(20)]
+    entries.append(("skills/s1/" + "n" * 150 + ".md", b"long name"))
+    return entries
+
+
+def _pack(files, format, segment_size=10000):
+    segments = {}
+
+    def write_segment(number, writer):
+        segments[number] = writer.file.read()
+
+    entries = list(pack_segments(files, write_segment, format, segment_size))
+    return entries, segments
+
+
+class TestPacking:
+    """Test suite for packed segments."""
+
+    @pytest.mark.parametrize("format", ["tar", "zip"])
+    def test_offsets_locate_content(self, files, format):
+        """Test every entry is read back from its offset and checksummed."""
+        entries, segments = _pack(files, format)
+        contents = dict(files)
+
+        assert [entry.name for entry in entries] == [name for name, _ in files]
+        for entry in entries:
+            segment = io.BytesIO(segments[entry.segment])
+            assert read_packed_entry(segment, entry) == contents[entry.name]
+            assert entry.checksum == hashlib.sha256(contents[entry.name]).hexdigest()
+
+    @pytest.mark.parametrize("format", ["tar", "zip"])
+    def test_segments_roll_over_at_target_size(self, files, format):
+        """Test entries are spread over segments of about the target size."""
+        entries, segments = _pack(files, format, segment_size=10000)
+
+        assert len(segments) > 1
+        assert sorted(segments) == sorted({entry.segment for entry in entries})
+        assert all(len(data) < 10000 + 5000 + 10240 for data in segments.values())
+
+    def test_segments_open_with_standard_readers(self, files):
+        """Test segments are ordinary tar and zip archives."""
+        tar_entries, tar_segments = _pack(files, "tar", segment_size=1 << 30)
+        zip_entries, zip_segments = _pack(files, "zip", segment_size=1 << 30)
+
+        with tarfile.open(fileobj=io.BytesIO(tar_segments[0])) as archive:
+            assert archive.getnames() == [name for name, _ in files]
+            assert archive.extractfile(files[3][0]).read() == files[3][1]
+        with zipfile.ZipFile(io.BytesIO(zip_segments[0])) as archive:
+            assert archive.testzip() is None
+            assert archive.read(files[3][0]) == files[3][1]
+
+    def test_file_object_sources_are_streamed(self):
+        """Test file objects are packed with a given or measured size."""
+        writer = SegmentWriter("tar")
+        try:
+            offset, size, checksum = writer.add("a.bin", io.BytesIO(b"a" * 3000))
+            segment = writer.finish()
+
+            assert size == 3000
+            assert checksum == hashlib.sha256(b"a" * 3000).hexdigest()
+            assert read_packed_entry(segment, PackedEntry("a.bin", 0, offset, size, checksum)) == b"a" * 3000
+        finally:
+            writer.close()
+
+    @pytest.mark.parametrize("format", ["tar", "zip"])
+    def test_short_source_is_rejected(self, format):
+        """Test content shorter than its declared size is an error."""
+        writer = SegmentWriter(format)
+        try:
+            with pytest.raises(ValueError):
+                writer.add("a.bin", io.BytesIO(b"short"), size=100)
+        finally:
+            writer.close()
+
+    def test_unsupported_format(self):
+        """Test unknown segment formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported pack format"):
+            SegmentWriter("rar")
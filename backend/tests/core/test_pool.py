@@ -0,0 +1,227 @@
+"""Tests for the shared resource pool.
+
+This module contains unit tests for ResourcePool fairness, recycling,
+health checks and sizing in app.core.pool.
+"""
+
+import asyncio
+import itertools
+
+import pytest
+
+from app.core.metrics import MetricsRegistry
+from app.core.pool import (
+    DatabaseSessionPool,
+    PoolClosedError,
+    PoolRegistry,
+    PoolTimeoutError,
+    ResourcePool,
+)
+
+
+def make_pool(max_size=2, **kwargs):
+    """Create a pool of numbered dict resources with its own registry."""
+    ids = itertools.count()
+    return ResourcePool(
+        "test",
+        lambda: {"id": next(ids), "ok": True},
+        max_size=max_size,
+        registry=MetricsRegistry(),
+        **kwargs,
+    )
+
+
+class TestResourcePool:
+    """Test suite for ResourcePool."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_released_resources(self):
+        """Test released resources are reused instead of recreated."""
+        pool = make_pool()
+
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+
+        assert second is first
+        assert pool.stats["created"] == 1
+        assert pool.stats["acquired"] == 2
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_order(self):
+        """Test released resources are handed to waiters first-come first-served."""
+        pool = make_pool(max_size=1)
+        held = await pool.acquire()
+        served = []
+
+        async def worker(n):
+            resource = await pool.acquire(timeout=1)
+            served.append(n)
+            await asyncio.sleep(0)
+            await pool.release(resource)
+
+        tasks = [asyncio.create_task(worker(n)) for n in range(4)]
+        await asyncio.sleep(0.01)
+        assert pool.stats["waiters"] == 4
+
+        await pool.release(held)
+        await asyncio.gather(*tasks)
+
+        assert served == [0, 1, 2, 3]
+        assert pool.stats["created"] == 1
+        assert pool.wait_time_summary()["count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self):
+        """Test acquisition fails with PoolTimeoutError when exhausted."""
+        pool = make_pool(max_size=1)
+        await pool.acquire()
+
+        with pytest.raises(PoolTimeoutError):
+            await pool.acquire(timeout=0.01)
+
+        assert pool.stats["timeouts"] == 1
+        assert pool.stats["waiters"] == 0
+
+    @pytest.mark.asyncio
+    async def test_discard_hands_slot_to_waiter(self):
+        """Test discarding a resource lets a waiter create a new one."""
+        closed = []
+        pool = make_pool(max_size=1, close=lambda r: closed.append(r["id"]))
+        held = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire(timeout=1))
+        await asyncio.sleep(0.01)
+        await pool.release(held, discard=True)
+        replacement = await waiter
+
+        assert closed == [held["id"]]
+        assert replacement is not held
+        assert pool.stats["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_max_lifetime_recycling(self):
+        """Test resources older than max_lifetime are not reused."""
+        pool = make_pool(max_lifetime=0.0)
+
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+
+        assert second is not first
+        assert pool.stats["recycled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_health_check_replaces_resource(self):
+        """Test unhealthy idle resources are replaced on checkout."""
+        pool = make_pool(
+            health_check=lambda r: r["ok"],
+            health_check_interval=0.0,
+        )
+
+        first = await pool.acquire()
+        first["ok"] = False
+        await pool.release(first)
+        second = await pool.acquire()
+
+        assert second is not first
+        assert pool.stats["health_check_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lease_discards_on_error(self):
+        """Test lease() discards resources when the block raises."""
+        pool = make_pool()
+
+        with pytest.raises(ValueError):
+            async with pool.lease():
+                raise ValueError("boom")
+
+        assert pool.stats["closed"] == 1
+        assert pool.stats["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_resize_wakes_waiters(self):
+        """Test growing the pool serves queued callers immediately."""
+        pool = make_pool(max_size=1)
+        await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire(timeout=1))
+        await asyncio.sleep(0.01)
+        pool.resize(2)
+
+        assert (await waiter)["id"] == 1
+        assert pool.stats["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_close_fails_waiters(self):
+        """Test closing the pool fails queued and later acquisitions."""
+        pool = make_pool(max_size=1)
+        await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire(timeout=1))
+        await asyncio.sleep(0.01)
+        await pool.close()
+
+        with pytest.raises(PoolClosedError):
+            await waiter
+        with pytest.raises(PoolClosedError):
+            await pool.acquire()
+
+
+class FakeSession:
+    """Stand-in for an AsyncSession recording lifecycle calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, statement):
+        self.calls.append("execute")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+    def expunge_all(self):
+        self.calls.append("expunge_all")
+
+    async def close(self):
+        self.calls.append("close")
+
+
+class TestDatabaseSessionPool:
+    """Test suite for DatabaseSessionPool."""
+
+    @pytest.mark.asyncio
+    async def test_released_sessions_are_reset_and_reused(self):
+        """Test sessions are rolled back on release and kept open."""
+        pool = DatabaseSessionPool(session_factory=FakeSession, max_size=1, registry=MetricsRegistry())
+
+        async with pool.lease() as first:
+            pass
+        async with pool.lease() as second:
+            pass
+
+        assert first is second
+        assert pool.stats["created"] == 1
+        assert "close" not in first.calls
+        assert first.calls[-2:] == ["rollback", "expunge_all"]
+
+        await pool.close()
+        assert first.calls[-1] == "close"
+
+
+class TestPoolRegistry:
+    """Test suite for PoolRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_shares_pools(self):
+        """Test pools are created once and shared by name."""
+        registry = PoolRegistry()
+
+        first = registry.get_or_create("shared", lambda: make_pool())
+        second = registry.get_or_create("shared", lambda: make_pool())
+
+        assert first is second
+        assert "test" in {stats["name"] for stats in registry.get_stats().values()}
+
+        await registry.close_all()
+        assert registry.get("shared") is None
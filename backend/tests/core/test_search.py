@@ -0,0 +1,91 @@
+"""Tests for in-process full-text search.
+
+This module contains unit tests for InvertedIndex ranking, incremental
+updates and search-after paging, and for cursor encoding.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.core.search import InvertedIndex, decode_cursor, encode_cursor, tokenize
+
+
+@pytest.fixture
+def index():
+    """Create an index of a few skill-like documents."""
+    index = InvertedIndex({"name": 3.0, "keywords": 2.0, "description": 1.0})
+    index.add("s1", {"name": "Python Linter", "description": "Checks python code style"})
+    index.add("s2", {"name": "Data Loader", "description": "Loads data for python pipelines"})
+    index.add("s3", {"name": "Spreadsheet Export", "keywords": ["data", "excel"]})
+    index.add("s4", {"name": "Shell Helper", "description": "Runs shell commands"})
+    return index
+
+
+class TestInvertedIndex:
+    """Test suite for InvertedIndex."""
+
+    def test_tokenize(self):
+        """Test text is split into lowercase words."""
+        assert tokenize("Hello, World! v2_beta") == ["hello", "world", "v2_beta"]
+        assert tokenize(None) == []
+
+    def test_ranks_by_field_weight(self, index):
+        """Test matches in heavier fields rank first."""
+        results = index.search("python")
+
+        assert results.total == 2
+        assert [hit.doc_id for hit in results.hits] == ["s1", "s2"]
+        assert results.hits[0].score > results.hits[1].score
+
+    def test_all_terms_must_match(self, index):
+        """Test documents must contain every query term."""
+        assert [hit.doc_id for hit in index.search("data python").hits] == ["s2"]
+        assert index.search("python shell").total == 0
+
+    def test_last_term_matches_prefix(self, index):
+        """Test the last query term finds its completions."""
+        assert [hit.doc_id for hit in index.search("spread").hits] == ["s3"]
+        assert [hit.doc_id for hit in index.search("data exc").hits] == ["s3"]
+
+    def test_incremental_updates(self, index):
+        """Test replaced and removed documents leave no stale postings."""
+        index.add("s4", {"name": "Python Shell"})
+        assert {hit.doc_id for hit in index.search("python").hits} == {"s1", "s2", "s4"}
+        assert index.search("commands").total == 0
+
+        assert index.remove("s1") is True
+        assert index.remove("s1") is False
+        assert "s1" not in index
+        assert index.search("linter").total == 0
+        assert len(index) == 3
+
+    def test_search_after_pages_through_hits(self):
+        """Test search-after cursors visit every hit exactly once."""
+        index = InvertedIndex({"name": 1.0})
+        for i in range(25):
+            index.add(f"doc-{i:02d}", {"name": "skill " + "extra " * (i % 4)})
+
+        seen = []
+        after = None
+        while True:
+            results = index.search("skill", limit=10, after=after)
+            assert results.total == 25
+            if not results.hits:
+                break
+            seen.extend(hit.doc_id for hit in results.hits)
+            after = (results.hits[-1].score, results.hits[-1].doc_id)
+
+        assert sorted(seen) == [f"doc-{i:02d}" for i in range(25)]
+        assert seen == [hit.doc_id for hit in index.search("skill").hits]
+
+    def test_cursor_round_trip(self):
+        """Test cursors preserve floats, strings and datetimes."""
+        values = [0.1 + 0.2, "skill-1", datetime(2024, 5, 1, 12, 30), None]
+
+        assert decode_cursor(encode_cursor(values)) == values
+
+    def test_invalid_cursor(self):
+        """Test malformed cursors are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor")
@@ -6,6 +6,9 @@ batch operations, progress tracking, error handling, and performance tests.
 
 import pytest
 import asyncio
+import gzip
+import hashlib
+import zipfile
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from uuid import uuid4, UUID
 from datetime import datetime, timedelta
@@ -20,6 +23,7 @@ from app.file.batch_processor import (
     BatchOperationResult,
     BatchJob,
     BatchProgress,
+    BatchStatus,
     ProgressCallback,
 )
 
@@ -34,13 +38,16 @@ class TestBatchProcessor:
 
     @pytest.fixture
     def batch_processor(self, db_session):
-        """Create BatchProcessor instance with mocked database."""
-        return BatchProcessor(
+        """Create BatchProcessor instance with mocked database and file manager."""
+        processor = BatchProcessor(
             db_session=db_session,
             max_concurrent_operations=5,
             max_workers=3,
             operation_timeout=60,
         )
+        processor.file_manager = AsyncMock()
+        yield processor
+        processor.shutdown()
 
     @pytest.fixture
     def sample_file_ids(self):
@@ -48,22 +55,42 @@ class TestBatchProcessor:
         return [str(uuid4()) for _ in range(10)]
 
     @pytest.fixture
-    def sample_operations(self, sample_file_ids):
-        """Create sample batch operations."""
+    def sample_operations(self, sample_file_ids, tmp_path):
+        """Create sample batch operations on real text files."""
         from app.file.schemas.batch_config import BatchOperation
 
+        (tmp_path / "source").mkdir()
         operations = []
         for i, file_id in enumerate(sample_file_ids):
+            source = tmp_path / "source" / f"file_{i}.txt"
+            source.write_text(f"line one of file {i}\r\nline two\r\n")
             operation = BatchOperation(
                 file_id=file_id,
-                source_path=f"/source/file_{i}.txt",
-                target_path=f"/target/file_{i}.txt",
+                source_path=str(source),
+                target_path=str(tmp_path / "target" / f"file_{i}.txt"),
                 metadata={"index": i},
             )
             operations.append(operation)
 
         return operations
 
+    @pytest.fixture
+    def archive_operations(self, tmp_path):
+        """Create batch operations on zip archives."""
+        from app.file.schemas.batch_config import BatchOperation
+
+        operations = []
+        for i in range(2):
+            source = tmp_path / f"archive_{i}.zip"
+            with zipfile.ZipFile(source, "w") as archive:
+                archive.writestr("docs/readme.txt", f"archive {i}")
+            operations.append(BatchOperation(
+                source_path=str(source),
+                target_path=str(tmp_path / "extracted" / str(i)),
+            ))
+
+        return operations
+
     # Test batch job creation
 
     @pytest.mark.asyncio
@@ -235,11 +262,11 @@ class TestBatchProcessor:
         assert job.failed_operations == 0
 
     @pytest.mark.asyncio
-    async def test_execute_extract_operations(self, batch_processor, sample_operations):
+    async def test_execute_extract_operations(self, batch_processor, archive_operations, tmp_path):
         """Test executing extract operations."""
         job_id = await batch_processor.create_batch_job(
             operation_type=OperationType.EXTRACT,
-            operations=sample_operations[:2],
+            operations=archive_operations,
         )
 
         # Execute job
@@ -249,6 +276,7 @@ class TestBatchProcessor:
         assert job.status.value == "completed"
         assert job.completed_operations == 2
         assert job.failed_operations == 0
+        assert (tmp_path / "extracted" / "1" / "docs" / "readme.txt").read_text() == "archive 1"
 
     # Test batch job cancellation
 
@@ -396,8 +424,8 @@ class TestBatchProcessor:
         final_progress = progress_updates[-1]
         assert final_progress.job_id == job_id
         assert final_progress.status.value == "completed"
-        assert final_progress.completed_operations == 5
-        assert final_progress.progress_percentage == 100.0
+        assert final_progress.successful_files == 5
+        assert final_progress.percentage == 100.0
 
     # Test error handling
 
@@ -681,7 +709,7 @@ class TestBatchProcessor:
     # Test different operation types
 
     @pytest.mark.asyncio
-    async def test_all_operation_types(self, batch_processor, sample_operations):
+    async def test_all_operation_types(self, batch_processor, sample_operations, archive_operations):
         """Test all supported operation types."""
         operation_types = [
             OperationType.UPLOAD,
@@ -693,12 +721,14 @@ class TestBatchProcessor:
             OperationType.CONVERT,
             OperationType.COMPRESS,
             OperationType.EXTRACT,
+            OperationType.HASH,
         ]
 
         for op_type in operation_types:
+            operations = archive_operations if op_type == OperationType.EXTRACT else sample_operations
             job_id = await batch_processor.create_batch_job(
                 operation_type=op_type,
-                operations=sample_operations[:1],
+                operations=operations[:1],
             )
 
             job = await batch_processor.execute_batch_job(job_id)
@@ -743,3 +773,160 @@ class TestBatchProcessor:
         # List completed jobs
         completed_jobs = batch_processor.list_batch_jobs(status=BatchStatus.COMPLETED)
         assert len(completed_jobs) == 1
+
+    # Test execution engine
+
+    @pytest.mark.asyncio
+    async def test_compress_runs_real_work(self, batch_processor, sample_operations):
+        """Test compress output round-trips through gzip."""
+        operation = sample_operations[0]
+        operation.target_path = operation.target_path + ".gz"
+        job_id = await batch_processor.create_batch_job(
+            operation_type=OperationType.COMPRESS,
+            operations=[operation],
+        )
+
+        job = await batch_processor.execute_batch_job(job_id)
+
+        result = job.operation_results[0]
+        assert result.success is True
+        with open(operation.source_path, "rb") as source, gzip.open(operation.target_path, "rb") as target:
+            assert target.read() == source.read()
+        assert result.metadata["algorithm"] == "gzip"
+
+    @pytest.mark.asyncio
+    async def test_hash_and_convert(self, batch_processor, sample_operations):
+        """Test hash checksums and text conversion output."""
+        hash_job = await batch_processor.execute_batch_job(
+            await batch_processor.create_batch_job(OperationType.HASH, sample_operations[:1])
+        )
+        convert_job = await batch_processor.execute_batch_job(
+            await batch_processor.create_batch_job(OperationType.CONVERT, sample_operations[:1])
+        )
+
+        with open(sample_operations[0].source_path, "rb") as source:
+            content = source.read()
+        assert hash_job.operation_results[0].metadata["checksum"] == hashlib.sha256(content).hexdigest()
+        assert convert_job.completed_operations == 1
+        with open(sample_operations[0].target_path, "rb") as target:
+            assert target.read() == content.replace(b"\r\n", b"\n")
+
+    @pytest.mark.asyncio
+    async def test_missing_source_fails_operation(self, batch_processor, sample_operations):
+        """Test a failing operation does not stop the job."""
+        sample_operations[1].source_path = "/nonexistent/file.txt"
+        job_id = await batch_processor.create_batch_job(
+            operation_type=OperationType.HASH,
+            operations=sample_operations[:3],
+        )
+
+        job = await batch_processor.execute_batch_job(job_id)
+
+        assert job.status == BatchStatus.FAILED
+        assert job.completed_operations == 2
+        assert job.failed_operations == 1
+        assert job.operation_results[1].error_message
+
+    @pytest.mark.asyncio
+    async def test_io_operations_use_file_manager(self, batch_processor, sample_operations):
+        """Test delete operations are dispatched to the file manager."""
+        job_id = await batch_processor.create_batch_job(
+            operation_type=OperationType.DELETE,
+            operations=sample_operations[:3],
+            metadata={"user_id": "test-user"},
+        )
+
+        await batch_processor.execute_batch_job(job_id)
+
+        assert batch_processor.file_manager.delete_file.await_count == 3
+        args = batch_processor.file_manager.delete_file.await_args.args
+        assert args[1] == "test-user"
+
+    @pytest.mark.asyncio
+    async def test_database_calls_never_overlap(self, batch_processor, sample_operations):
+        """Test workers take turns on the shared database session."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_get_file(file_id, user_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return Mock(size=10)
+
+        batch_processor.file_manager.get_file.side_effect = fake_get_file
+        job_id = await batch_processor.create_batch_job(
+            operation_type=OperationType.DOWNLOAD,
+            operations=sample_operations,
+        )
+
+        job = await batch_processor.execute_batch_job(job_id)
+
+        assert job.completed_operations == len(sample_operations)
+        assert max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_results_from_generator(self, batch_processor):
+        """Test streaming a lazily generated job without retaining results."""
+        from app.file.schemas.batch_config import BatchOperation
+
+        pulled = []
+
+        def operations():
+            for i in range(50):
+                pulled.append(i)
+                yield BatchOperation(file_id=str(uuid4()))
+
+        job_id = await batch_processor.create_batch_job(
+            operation_type=OperationType.DELETE,
+            operations=operations(),
+            keep_results=False,
+        )
+        assert pulled == []
+
+        streamed = [result async for result in batch_processor.stream_batch_job(job_id, buffer_size=2)]
+
+        job = batch_processor.get_batch_job(job_id)
+        assert len(streamed) == 50
+        assert all(result.success for result in streamed)
+        assert job.operation_results == []
+        assert job.total_operations == 50
+        assert job.status == BatchStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_job(self, batch_processor):
+        """Test stopping the stream early cancels the remaining work."""
+        from app.file.schemas.batch_config import BatchOperation
+
+        job_id = await batch_processor.create_batch_job(
+            operation_type=OperationType.DELETE,
+            operations=(BatchOperation(file_id=str(uuid4())) for _ in range(1000)),
+            total_operations=1000,
+            keep_results=False,
+        )
+
+        stream = batch_processor.stream_batch_job(job_id, buffer_size=1)
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        job = batch_processor.get_batch_job(job_id)
+        assert first.success is True
+        assert job.status == BatchStatus.CANCELLED
+        assert job.completed_operations < 100
+
+    @pytest.mark.asyncio
+    async def test_progress_is_throttled(self, db_session, sample_operations):
+        """Test only start and finish are reported within one interval."""
+        processor = BatchProcessor(db_session=db_session, progress_interval=60.0)
+        processor.file_manager = AsyncMock()
+        updates = []
+
+        job_id = await processor.create_batch_job(OperationType.DELETE, sample_operations)
+        await processor.execute_batch_job(job_id, progress_callback=updates.append)
+
+        assert [update.status for update in updates][0] == BatchStatus.RUNNING
+        assert updates[-1].status == BatchStatus.COMPLETED
+        assert updates[-1].successful_files == len(sample_operations)
+        assert len(updates) <= 3
@@ -0,0 +1,96 @@
+"""Tests for TextDocument.
+
+This module contains unit tests for the piece-table document model used by
+the file editor, including edits, slicing, line indexing and compaction.
+"""
+
+import random
+
+import pytest
+
+from app.file.document import TextDocument
+
+
+class TestTextDocument:
+    """Test suite for TextDocument."""
+
+    def test_insert_delete_replace(self):
+        """Test basic edits match string semantics."""
+        document = TextDocument("Hello, World!")
+
+        document.insert(5, " beautiful")
+        assert document.text() == "Hello beautiful, World!"
+
+        document.delete(5, 10)
+        assert document.text() == "Hello, World!"
+
+        document.replace(7, 5, "Universe")
+        assert document.text() == "Hello, Universe!"
+        assert len(document) == len("Hello, Universe!")
+
+    def test_out_of_range_edits_are_clamped(self):
+        """Test positions past either end behave like string slicing."""
+        document = TextDocument("abc")
+
+        document.insert(10, "d")
+        document.delete(-5, 1)
+        document.delete(2, 100)
+
+        assert document.text() == "bc"
+
+    def test_line_index(self):
+        """Test offset and line/column conversions."""
+        document = TextDocument("one\ntwo\n")
+        document.insert(4, "zero\n")
+
+        assert document.text() == "one\nzero\ntwo\n"
+        assert document.line_count == 4
+        assert document.line_start(2) == 9
+        assert document.offset_to_position(10) == (2, 1)
+        assert document.position_to_offset(1, 99) == 8
+
+    def test_slice_spans_pieces(self):
+        """Test slicing across several pieces without materializing text."""
+        document = TextDocument("0123456789")
+        document.insert(5, "abc")
+        document.delete(0, 2)
+
+        assert document.slice(1, 8) == "34abc56"
+
+    def test_compact_folds_pieces(self):
+        """Test compaction keeps content and leaves a single piece."""
+        document = TextDocument("base")
+        for i in range(50):
+            document.insert(i % len(document), str(i % 10))
+        text = document.text()
+
+        document.compact()
+
+        assert document.text() == text
+        assert document.piece_count == 1
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_edits_match_string(self, seed):
+        """Test random edit sequences against a plain string model."""
+        rng = random.Random(seed)
+        expected = "line\n" * 20
+        document = TextDocument(expected, seed=seed)
+
+        for _ in range(300):
+            position = rng.randint(0, len(expected))
+            if rng.random() < 0.6:
+                text = rng.choice(["x", "\n", "ab\ncd", ""])
+                expected = expected[:position] + text + expected[position:]
+                document.insert(position, text)
+            else:
+                length = rng.randint(0, 6)
+                expected = expected[:position] + expected[position + length:]
+                document.delete(position, length)
+
+            offset = rng.randint(0, len(expected))
+            line = expected.count("\n", 0, offset)
+            column = offset - (expected.rfind("\n", 0, offset) + 1)
+            assert document.offset_to_position(offset) == (line, column)
+
+        assert document.text() == expected
+        assert document.line_count == expected.count("\n") + 1
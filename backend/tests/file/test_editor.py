@@ -10,6 +10,7 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from uuid import uuid4, UUID
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
+import json
 import re
 
 # Import editor and related classes
@@ -765,6 +766,184 @@ class TestFileEditor:
             assert results[0]["text"] == "Hello"
             assert results[1]["text"] == "Hello"
 
+    @pytest.mark.asyncio
+    async def test_apply_changes_rebases_stale_version(
+        self,
+        file_editor,
+        sample_file_id,
+        sample_user_id,
+        sample_file_response,
+    ):
+        """Test stale batches are rebased onto changes committed since."""
+        with patch.object(file_editor.file_manager, 'get_file', new_callable=AsyncMock) as mock_get_file:
+            mock_get_file.return_value = sample_file_response
+
+            session = await file_editor.create_editor_session(
+                file_id=sample_file_id,
+                user_id=sample_user_id,
+            )
+            with file_editor._lock:
+                file_editor.session_data[session.session_id]["content"] = "world"
+
+            handler = Mock()
+            file_editor.register_change_handler(handler)
+
+            def insert(position, content):
+                return ChangeOperation(
+                    operation_id=content,
+                    type="insert",
+                    position=position,
+                    length=0,
+                    content=content,
+                    timestamp=datetime.utcnow(),
+                    user_id=sample_user_id,
+                )
+
+            await file_editor.apply_changes(session.session_id, sample_user_id, [insert(0, "hello ")], 1)
+            success, error, response = await file_editor.apply_changes(
+                session_id=session.session_id,
+                user_id=sample_user_id,
+                changes=[insert(5, "!")],
+                version=1,
+            )
+
+            assert success is True
+            assert response["rebased"] is True
+            assert response["server_version"] == 3
+            assert response["operations"] == [{"type": "insert", "position": 11, "content": "!"}]
+            assert file_editor.session_data[session.session_id]["content"] == "hello world!"
+            handler.assert_called_with(session.session_id, sample_user_id, 3, response["operations"])
+
+    @pytest.mark.asyncio
+    async def test_websocket_edit_applied_and_broadcast(
+        self,
+        sample_file_id,
+        sample_user_id,
+        sample_file_response,
+    ):
+        """Test WebSocket edits commit through the shared editor and are broadcast."""
+        from fastapi import WebSocketDisconnect
+        from app.file import websocket as file_websocket
+
+        with patch.object(file_websocket, "_file_editor", None):
+            editor = await file_websocket.get_file_editor()
+            assert await file_websocket.get_file_editor() is editor
+
+            with patch.object(editor.file_manager, 'get_file', new_callable=AsyncMock) as mock_get_file:
+                mock_get_file.return_value = sample_file_response
+                session = await editor.create_editor_session(
+                    file_id=sample_file_id,
+                    user_id=sample_user_id,
+                )
+
+            websocket = AsyncMock()
+            websocket.receive_text.side_effect = [
+                json.dumps({
+                    "type": "edit_operation",
+                    "version": 1,
+                    "operations": [{"type": "insert", "position": 0, "content": "hello"}],
+                }),
+                WebSocketDisconnect(),
+            ]
+            with patch.object(file_websocket, "websocket_manager") as manager:
+                manager.connect = AsyncMock()
+                manager.send_personal_message = AsyncMock()
+                manager.broadcast_to_file = AsyncMock()
+
+                await file_websocket.collaborative_editing_websocket(
+                    websocket, str(session.session_id), sample_user_id
+                )
+
+        assert editor.session_data[session.session_id]["content"] == "hello"
+
+        ack = manager.send_personal_message.call_args[0][1]
+        assert ack["type"] == "edit_ack"
+        assert ack["version"] == 2
+
+        broadcasts = [call.kwargs["message"] for call in manager.broadcast_to_file.call_args_list]
+        edits = [message for message in broadcasts if message["type"] == "edit_operation"]
+        assert edits == [{
+            "type": "edit_operation",
+            "session_id": str(session.session_id),
+            "user_id": sample_user_id,
+            "version": 2,
+            "operations": [{"type": "insert", "position": 0, "content": "hello"}],
+        }]
+
+    @pytest.mark.asyncio
+    async def test_search_in_session_reports_line_and_column(
+        self,
+        file_editor,
+        sample_file_id,
+        sample_user_id,
+        sample_file_response,
+    ):
+        """Test search results carry 1-based line and column numbers."""
+        with patch.object(file_editor.file_manager, 'get_file', new_callable=AsyncMock) as mock_get_file:
+            mock_get_file.return_value = sample_file_response
+
+            session = await file_editor.create_editor_session(
+                file_id=sample_file_id,
+                user_id=sample_user_id,
+            )
+
+            with file_editor._lock:
+                file_editor.session_data[session.session_id]["content"] = "alpha\nbeta gamma\ngamma"
+
+            results = await file_editor.search_in_session(
+                session_id=session.session_id,
+                query="gamma",
+            )
+
+            assert [(r["line"], r["column"]) for r in results] == [(2, 6), (3, 1)]
+
+    @pytest.mark.asyncio
+    async def test_apply_changes_compacts_history(
+        self,
+        db_session,
+        sample_file_id,
+        sample_user_id,
+        sample_file_response,
+    ):
+        """Test long change histories are folded into a snapshot."""
+        file_editor = FileEditor(db_session, history_limit=3)
+
+        with patch.object(file_editor.file_manager, 'get_file', new_callable=AsyncMock) as mock_get_file:
+            mock_get_file.return_value = sample_file_response
+
+            session = await file_editor.create_editor_session(
+                file_id=sample_file_id,
+                user_id=sample_user_id,
+            )
+
+            for version in range(1, 5):
+                success, _, _ = await file_editor.apply_changes(
+                    session_id=session.session_id,
+                    user_id=sample_user_id,
+                    changes=[
+                        ChangeOperation(
+                            operation_id=f"op{version}",
+                            type="insert",
+                            position=0,
+                            length=0,
+                            content=str(version),
+                            timestamp=datetime.utcnow(),
+                            user_id=sample_user_id,
+                        )
+                    ],
+                    version=version,
+                )
+                assert success is True
+
+            session_data = file_editor.session_data[session.session_id]
+            stats = await file_editor.get_session_statistics(session.session_id)
+
+            assert session_data["content"] == "4321"
+            assert session_data["snapshot"]["content"] == "321"
+            assert session_data["snapshot"]["version"] == 4
+            assert len(session_data["changes"]) == 1
+            assert stats["change_count"] == 4
+
     @pytest.mark.asyncio
     async def test_search_in_session_case_sensitive(
         self,
@@ -1287,6 +1466,46 @@ class TestFileEditor:
             assert count == 0
             assert error == "No matches found"
 
+    @pytest.mark.asyncio
+    async def test_replace_all_in_session_no_matches(
+        self,
+        file_editor,
+        sample_file_id,
+        sample_user_id,
+        sample_file_response,
+    ):
+        """Test replace all without matches leaves the session untouched."""
+        with patch.object(file_editor.file_manager, 'get_file', new_callable=AsyncMock) as mock_get_file:
+            mock_get_file.return_value = sample_file_response
+
+            session = await file_editor.create_editor_session(
+                file_id=sample_file_id,
+                user_id=sample_user_id,
+            )
+
+            with file_editor._lock:
+                file_editor.session_data[session.session_id]["content"] = "Hello, World!"
+                version = file_editor.session_data[session.session_id]["version"]
+                dirty = file_editor.session_data[session.session_id]["dirty"]
+
+            with patch.object(file_editor, '_notify_change_handlers', new_callable=AsyncMock) as mock_notify:
+                success, count, error = await file_editor.replace_in_session(
+                    session_id=session.session_id,
+                    user_id=sample_user_id,
+                    query="Universe",
+                    replacement="World",
+                    replace_all=True,
+                )
+
+            assert success is True
+            assert count == 0
+            assert error is None
+            mock_notify.assert_not_called()
+            session_data = file_editor.session_data[session.session_id]
+            assert session_data["version"] == version
+            assert session_data["dirty"] == dirty
+            assert session_data["content"] == "Hello, World!"
+
     @pytest.mark.asyncio
     async def test_replace_in_session_invalid_regex(
         self,
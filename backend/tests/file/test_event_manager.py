@@ -0,0 +1,163 @@
+"""Tests for FileOperationEventManager.
+
+This module contains unit tests for partitioned event workers, batch
+handlers, the bounded event history and the exported event metrics.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.core.metrics import MetricsRegistry
+from app.file.event_manager import EventType, FileOperationEventManager
+
+
+@pytest.fixture
+def registry():
+    """Create isolated metrics registry."""
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def event_manager(registry):
+    """Create event manager with four workers."""
+    return FileOperationEventManager(num_workers=4, registry=registry)
+
+
+class TestFileOperationEventManager:
+    """Test suite for FileOperationEventManager."""
+
+    @pytest.mark.asyncio
+    async def test_events_for_same_file_keep_order(self, event_manager):
+        """Test per-file ordering across concurrent workers."""
+        await event_manager.start()
+        file_ids = [uuid4() for _ in range(8)]
+        seen = {file_id: [] for file_id in file_ids}
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            seen[event.file_id].append(event.data["sequence"])
+
+        event_manager.register_handler(EventType.FILE_UPDATED, handler)
+
+        for sequence in range(50):
+            for file_id in file_ids:
+                await event_manager.publish_event(
+                    EventType.FILE_UPDATED,
+                    file_id=file_id,
+                    data={"sequence": sequence},
+                )
+        await event_manager.wait_until_idle()
+        await event_manager.stop()
+
+        for file_id in file_ids:
+            assert seen[file_id] == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_receives_event_lists(self, registry):
+        """Test batch handlers get queued events in bulk."""
+        manager = FileOperationEventManager(num_workers=1, registry=registry)
+        batches = []
+
+        async def handler(events):
+            batches.append([event.data["sequence"] for event in events])
+
+        manager.register_handler(EventType.FILE_ACCESSED, handler, batch=True)
+
+        file_id = uuid4()
+        for sequence in range(20):
+            await manager.publish_event(
+                EventType.FILE_ACCESSED,
+                file_id=file_id,
+                data={"sequence": sequence},
+            )
+        await manager.start()
+        await manager.wait_until_idle()
+        await manager.stop()
+
+        assert batches == [list(range(20))]
+        assert manager.get_statistics()["handler_stats"]["handler"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_global_and_sync_handlers(self, event_manager):
+        """Test global async handlers and sync handlers both run."""
+        await event_manager.start()
+        received = []
+        sync_received = []
+
+        async def global_handler(event):
+            received.append(event.event_type)
+
+        def sync_handler(event):
+            sync_received.append(event.event_type)
+
+        event_manager.register_global_handler(global_handler)
+        event_manager.register_handler(EventType.FILE_DELETED, sync_handler)
+
+        await event_manager.publish_file_deleted(uuid4(), "user-1")
+        await event_manager.publish_event(EventType.FILE_VIEWED, file_id=uuid4())
+        await event_manager.wait_until_idle()
+        await event_manager.stop()
+
+        assert sorted(t.value for t in received) == ["file.deleted", "file.viewed"]
+        assert sync_received == [EventType.FILE_DELETED]
+
+    @pytest.mark.asyncio
+    async def test_unregister_batch_handler(self, event_manager):
+        """Test batch handlers can be unregistered."""
+        await event_manager.start()
+        calls = []
+
+        async def handler(events):
+            calls.append(events)
+
+        event_manager.register_global_handler(handler, batch=True)
+        event_manager.unregister_global_handler(handler)
+
+        await event_manager.publish_event(EventType.FILE_CREATED, file_id=uuid4())
+        await event_manager.wait_until_idle()
+        await event_manager.stop()
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self, registry):
+        """Test history keeps only the newest events."""
+        manager = FileOperationEventManager(max_history_size=5, registry=registry)
+        file_id = uuid4()
+
+        for sequence in range(12):
+            await manager.publish_event(
+                EventType.FILE_UPDATED,
+                file_id=file_id,
+                user_id="user-1" if sequence % 2 else "user-2",
+                data={"sequence": sequence},
+                async_mode=False,
+            )
+
+        history = manager.get_event_history()
+        assert [event.data["sequence"] for event in history] == [7, 8, 9, 10, 11]
+
+        filtered = manager.get_event_history(user_id="user-1", limit=2)
+        assert [event.data["sequence"] for event in filtered] == [9, 11]
+
+    @pytest.mark.asyncio
+    async def test_metrics_are_recorded(self, registry, event_manager):
+        """Test queue depth and handler latency histograms."""
+        await event_manager.start()
+
+        async def handler(event):
+            pass
+
+        event_manager.register_handler(EventType.FILE_CREATED, handler, "created_handler")
+
+        for _ in range(3):
+            await event_manager.publish_event(EventType.FILE_CREATED, file_id=uuid4())
+        await event_manager.wait_until_idle()
+        await event_manager.stop()
+
+        assert len(registry.get("file_event_queue_depth").merged_histogram()) == 3
+        durations = registry.get("file_event_handler_duration_seconds")
+        assert len(durations.labels({"handler": "created_handler"})) == 3
+        assert event_manager.get_queue_size() == 0
@@ -25,6 +25,7 @@ from app.file.schemas.file_operations import (
     FileBulkOperation,
 )
 from app.file.models.file import File, FileStatus, FileType
+from app.file.search import FileSearchPage
 
 
 class TestFileManager:
@@ -380,20 +381,11 @@ class TestFileManager:
 
     @pytest.mark.asyncio
     async def test_search_files_success(self, file_manager, db_session, sample_user_id):
-        """Test successful file search."""
+        """Test file search goes through the search backend."""
         # Setup
         files = [Mock()]
-        total = 1
-
-        # Mock query execution
-        query_result = Mock()
-        query_result.scalars.return_value.all.return_value = files
-        db_session.execute = AsyncMock(return_value=query_result)
-
-        # Mock count query
-        count_result = Mock()
-        count_result.scalar.return_value = total
-        db_session.execute = AsyncMock(return_value=count_result)
+        backend = Mock()
+        backend.search = AsyncMock(return_value=FileSearchPage(files, "next-cursor", 1, False))
 
         search = FileSearch(
             query="test",
@@ -402,7 +394,8 @@ class TestFileManager:
         )
 
         # Mock FileResponse creation
-        with patch('app.file.schemas.file_operations.FileResponse.model_validate') as mock_validate:
+        with patch('app.file.manager.get_file_search_backend', return_value=backend), \
+                patch('app.file.schemas.file_operations.FileResponse.model_validate') as mock_validate:
             mock_response = Mock()
             mock_validate.return_value = mock_response
 
@@ -410,10 +403,30 @@ class TestFileManager:
             result = await file_manager.search_files(search, sample_user_id)
 
             # Assert
-            assert result.total == total
+            assert result.total == 1
             assert len(result.files) == 1
+            assert result.next_cursor == "next-cursor"
             assert result.query == "test"
             assert result.search_time >= 0
+            assert backend.search.await_args.args[2] == "test"
+            backend.search_sorted.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_files_sorted(self, file_manager, db_session, sample_user_id):
+        """Test a sort field orders matches by that field."""
+        # Setup
+        backend = Mock()
+        backend.search_sorted = AsyncMock(return_value=FileSearchPage([], None, 0, False))
+
+        search = FileSearch(query="test", sort_by="size", sort_order="asc")
+
+        # Execute
+        with patch('app.file.manager.get_file_search_backend', return_value=backend):
+            result = await file_manager.search_files(search, sample_user_id)
+
+        # Assert
+        assert result.total == 0
+        assert backend.search_sorted.await_args.args[3:5] == ("size", False)
 
     @pytest.mark.asyncio
     async def test_bulk_operation_success(self, file_manager, db_session, sample_user_id):
@@ -444,6 +457,116 @@ class TestFileManager:
             assert len(result.results) == 2
             assert len(result.errors) == 0
 
+    @pytest.mark.asyncio
+    async def test_bulk_delete_uses_set_based_statements(self, file_manager, db_session, sample_user_id):
+        """Test bulk delete checks permissions and deletes with one statement each."""
+        # Setup
+        allowed_id, denied_id, missing_id = uuid4(), uuid4(), uuid4()
+        operation = FileBulkOperation(
+            operation="delete",
+            file_ids=[allowed_id, denied_id, missing_id]
+        )
+
+        rows = MagicMock()
+        rows.all.return_value = [
+            Mock(id=allowed_id, allowed=True),
+            Mock(id=denied_id, allowed=False),
+        ]
+        db_session.execute = AsyncMock(side_effect=[rows, MagicMock()])
+
+        # Execute
+        result = await file_manager.bulk_operation(operation, sample_user_id)
+
+        # Assert
+        assert db_session.execute.await_count == 2
+        db_session.commit.assert_awaited_once()
+        assert result.successful == 1
+        assert result.failed == 2
+        assert result.results[0]["file_id"] == str(allowed_id)
+        assert [error["message"] for error in result.errors] == [
+            "Permission denied",
+            "File not found",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_copy_skips_taken_storage_keys(self, file_manager, db_session, sample_user_id):
+        """Test bulk copy never reuses a storage key, even one stored under another path."""
+        # Setup
+        first_id, second_id, third_id = uuid4(), uuid4(), uuid4()
+        originals = [
+            Mock(id=first_id, storage_key="src/a.txt"),
+            Mock(id=second_id, storage_key="src/b.txt"),
+            Mock(id=third_id, storage_key="other/b.txt"),
+        ]
+        for original in originals:
+            original.name = original.storage_key.rsplit("/", 1)[1]
+        operation = FileBulkOperation(
+            operation="copy",
+            file_ids=[first_id, second_id, third_id],
+            target_path="dest/",
+        )
+
+        selected = MagicMock()
+        selected.scalars.return_value.all.return_value = originals
+        taken = MagicMock()
+        # dest/a.txt is the storage key of a file stored under another path
+        taken.all.return_value = [("dest/a.txt", "renamed/a.txt")]
+        db_session.execute = AsyncMock(side_effect=[selected, taken])
+        db_session.add_all = Mock()
+
+        # Execute
+        created = {}
+        with patch("app.file.manager.File.create_file", side_effect=lambda **kwargs: Mock(**kwargs)):
+            failures = await file_manager._bulk_copy(
+                operation, {file_id: Mock() for file_id in operation.file_ids}, sample_user_id, copies=created
+            )
+
+        # Assert
+        assert failures == {
+            first_id: "File already exists with storage key: dest/a.txt",
+            third_id: "File already exists with storage key: dest/b.txt",
+        }
+        copies = db_session.add_all.call_args[0][0]
+        assert [copy.storage_key for copy in copies] == ["dest/b.txt"]
+        assert created == {second_id: copies[0].id}
+
+    @pytest.mark.asyncio
+    async def test_bulk_copy_indexes_copies(self, file_manager, sample_user_id):
+        """Test copies are added to the search index instead of reloading it."""
+        # Setup
+        new_id = uuid4()
+        operation = FileBulkOperation(operation="copy", file_ids=[uuid4()])
+        backend = Mock()
+        backend.index_files = AsyncMock()
+
+        # Execute
+        with patch('app.file.manager.get_file_search_backend', return_value=backend):
+            await file_manager._update_search_index(operation, [{
+                "file_id": str(operation.file_ids[0]),
+                "new_file_id": str(new_id),
+                "status": "success",
+            }])
+
+        # Assert
+        backend.index_files.assert_awaited_once_with(file_manager.db, [str(new_id)])
+
+    @pytest.mark.asyncio
+    async def test_bulk_operation_rolls_back_on_error(self, file_manager, db_session, sample_user_id):
+        """Test bulk operation runs in one transaction."""
+        # Setup
+        operation = FileBulkOperation(
+            operation="delete",
+            file_ids=[uuid4()]
+        )
+        db_session.execute = AsyncMock(side_effect=Exception("Database error"))
+
+        # Execute & Assert
+        with pytest.raises(Exception, match="Database error"):
+            await file_manager.bulk_operation(operation, sample_user_id)
+
+        db_session.rollback.assert_awaited_once()
+        db_session.commit.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_move_file_success(self, file_manager, db_session, sample_file_id, sample_user_id, sample_file):
         """Test successful file move."""
@@ -19,9 +19,13 @@ from app.file.preview_manager import (
     ImageFormat,
     DocumentFormat,
     PreviewCache,
+    PreviewDiskCache,
     PreviewMetadata,
     PreviewResult,
 )
+from app.core.cache import LRUCache
+from app.core.metrics import MetricsRegistry
+from app.file.preview_pipeline import PreviewPipeline, PreviewPriority
 from app.file.services.conversion_service import (
     ConversionService,
     ConversionType,
@@ -40,9 +44,18 @@ class TestPreviewManager:
         return AsyncMock()
 
     @pytest.fixture
-    def preview_manager(self, db_session):
-        """Create PreviewManager instance with mocked database."""
-        return PreviewManager(db_session)
+    def disk_cache(self, tmp_path):
+        """Create isolated on-disk preview cache."""
+        return PreviewDiskCache(tmp_path / "previews")
+
+    @pytest.fixture
+    def preview_manager(self, db_session, disk_cache):
+        """Create PreviewManager instance with mocked database and isolated caches."""
+        return PreviewManager(
+            db_session,
+            memory_cache=LRUCache(max_bytes=1024 * 1024, sizeof=lambda entry: entry.size_bytes),
+            disk_cache=disk_cache,
+        )
 
     @pytest.fixture
     def sample_file_id(self):
@@ -568,6 +581,120 @@ class TestPreviewManager:
         assert "type_distribution" in stats
         assert stats["type_distribution"]["image"] == 3
 
+    def test_memory_cache_is_byte_bounded(self, db_session, sample_file_id):
+        """Test the in-memory tier evicts least recently used previews."""
+        preview_manager = PreviewManager(
+            db_session,
+            memory_cache=LRUCache(max_bytes=250, sizeof=lambda entry: entry.size_bytes),
+        )
+        for i in range(3):
+            preview_manager._add_to_cache(
+                f"test_cache_key_{i}",
+                PreviewCache(
+                    file_id=str(sample_file_id),
+                    preview_type=PreviewType.IMAGE,
+                    preview_data=b"x" * 100,
+                ),
+            )
+
+        assert preview_manager._get_from_cache("test_cache_key_0") is None
+        assert preview_manager._get_from_cache("test_cache_key_2") is not None
+        assert preview_manager.get_cache_stats()["total_size_bytes"] == 200
+
+    @pytest.mark.asyncio
+    async def test_identical_content_shares_disk_preview(self, db_session, disk_cache, sample_image_file):
+        """Test previews are reused by checksum across files and managers."""
+        sample_image_file.checksum = "a" * 64
+        other_file = Mock(id=uuid4(), checksum="a" * 64, mime_type="image/jpeg")
+        other_file.name = "copy.jpg"
+
+        first = PreviewManager(db_session, memory_cache=LRUCache(), disk_cache=disk_cache)
+        with patch.object(first, '_get_file_info', return_value=sample_image_file):
+            generated = await first.generate_preview(sample_image_file.id)
+
+        second = PreviewManager(db_session, memory_cache=LRUCache(), disk_cache=disk_cache)
+        with patch.object(second, '_get_file_info', return_value=other_file):
+            with patch.object(second, '_generate_image_preview') as generate:
+                cached = await second.generate_preview(other_file.id)
+
+        generate.assert_not_called()
+        assert cached.success is True
+        assert cached.file_id == str(other_file.id)
+        assert cached.preview_data == generated.preview_data
+        assert cached.metadata.dimensions == generated.metadata.dimensions
+        assert disk_cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_generate_once(self, preview_manager, sample_file_id, sample_image_file):
+        """Test concurrent requests for one preview share a single generation."""
+        calls = 0
+
+        async def generate(file_info, include_thumbnail, max_size, quality):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return PreviewResult(
+                file_id=str(file_info.id),
+                success=True,
+                preview_type=PreviewType.IMAGE,
+                preview_data=b"preview",
+            )
+
+        with patch.object(preview_manager, '_get_file_info', return_value=sample_image_file):
+            with patch.object(preview_manager, '_generate_image_preview', side_effect=generate):
+                results = await asyncio.gather(*[
+                    preview_manager.generate_preview(sample_file_id) for _ in range(5)
+                ])
+
+        assert calls == 1
+        assert all(result.preview_data == b"preview" for result in results)
+
+    @pytest.mark.asyncio
+    async def test_extract_text_runs_in_pipeline(self, db_session, sample_file_id):
+        """Test loaded content is processed in the preview pipeline."""
+        pipeline = PreviewPipeline(max_workers=1, registry=MetricsRegistry())
+        code_file = Mock(id=sample_file_id, mime_type="text/x-python")
+        code_file.name = "test.py"
+
+        async def load_content(file_info):
+            return "print('hello')\n".encode() * 100
+
+        preview_manager = PreviewManager(
+            db_session,
+            memory_cache=LRUCache(),
+            pipeline=pipeline,
+            content_loader=load_content,
+            priority=PreviewPriority.BULK,
+        )
+
+        with patch.object(preview_manager, '_get_file_info', return_value=code_file):
+            try:
+                text = await preview_manager.extract_text(sample_file_id, max_length=10)
+            finally:
+                await pipeline.shutdown()
+
+        assert text == "print('hel"
+        assert pipeline.get_stats()["completed"] == 1
+
+    def test_disk_cache_evicts_least_recently_used(self, tmp_path, sample_file_id):
+        """Test the on-disk tier stays within its byte budget."""
+        disk_cache = PreviewDiskCache(tmp_path, max_bytes=1000)
+        for i in range(4):
+            disk_cache.put(
+                f"key_{i}",
+                PreviewCache(
+                    file_id=str(sample_file_id),
+                    preview_type=PreviewType.TEXT,
+                    preview_data=bytes([i]) * 200,
+                ),
+            )
+
+        stats = disk_cache.get_stats()
+        assert stats["size_bytes"] <= 1000
+        assert stats["evictions"] >= 1
+        assert disk_cache.get("key_0") is None
+        assert disk_cache.get("key_3").preview_data == bytes([3]) * 200
+
     # Test error handling
 
     @pytest.mark.asyncio
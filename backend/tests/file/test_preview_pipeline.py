@@ -0,0 +1,178 @@
+"""Tests for PreviewPipeline.
+
+This module contains unit tests for the prioritized process-pool preview
+pipeline: priority ordering, cancellation, queue bounds, input spooling and
+event loop responsiveness while bulk work runs.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.core.metrics import MetricsRegistry
+from app.file.preview_pipeline import PreviewPipeline, PreviewPriority
+
+
+def _slow_echo(content: bytes, delay: float = 0.0) -> bytes:
+    """Return content after a delay."""
+    time.sleep(delay)
+    return content
+
+
+def _busy_length(content: bytes, duration: float = 0.2) -> int:
+    """Burn CPU for a while, then return the content length."""
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        pass
+    return len(content)
+
+
+def _fail(content: bytes) -> None:
+    """Raise an error."""
+    raise ValueError("bad content")
+
+
+@pytest.fixture
+def registry():
+    """Create isolated metrics registry."""
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def pipeline(registry, tmp_path):
+    """Create pipeline with a single worker process."""
+    return PreviewPipeline(max_workers=1, spool_dir=tmp_path, registry=registry)
+
+
+class TestPreviewPipeline:
+    """Test suite for PreviewPipeline."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_tasks_run_before_bulk(self, pipeline):
+        """Test queued interactive tasks overtake queued bulk tasks."""
+        finished = []
+        try:
+            blocker = await pipeline.submit(_slow_echo, b"blocker", PreviewPriority.BULK, delay=0.2)
+            await asyncio.sleep(0.05)
+
+            tasks = [
+                await pipeline.submit(_slow_echo, f"bulk-{i}".encode(), PreviewPriority.BULK)
+                for i in range(3)
+            ]
+            tasks.append(await pipeline.submit(_slow_echo, b"interactive"))
+            for task in [blocker] + tasks:
+                task.future.add_done_callback(lambda future: finished.append(future.result()))
+
+            await asyncio.gather(blocker, *tasks)
+        finally:
+            await pipeline.shutdown()
+
+        assert finished == [b"blocker", b"interactive", b"bulk-0", b"bulk-1", b"bulk-2"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_task(self, pipeline):
+        """Test cancelling a queued task removes it from the queue."""
+        try:
+            blocker = await pipeline.submit(_slow_echo, b"blocker", delay=0.1)
+            await asyncio.sleep(0.01)
+            queued = await pipeline.submit(_slow_echo, b"queued", PreviewPriority.BULK)
+
+            assert queued.cancel() is True
+            assert pipeline.get_queue_size() == 0
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+
+            assert await blocker == b"blocker"
+        finally:
+            await pipeline.shutdown()
+
+        assert queued.status == "cancelled"
+        assert pipeline.get_stats()["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_caller_cancels_task(self, pipeline):
+        """Test run() cancels its task when the caller is cancelled."""
+        try:
+            blocker = await pipeline.submit(_slow_echo, b"blocker", delay=0.1)
+            caller = asyncio.create_task(pipeline.run(_slow_echo, b"queued", PreviewPriority.BULK))
+            await asyncio.sleep(0.01)
+
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            assert pipeline.get_queue_size() == 0
+            assert await blocker == b"blocker"
+        finally:
+            await pipeline.shutdown()
+
+        assert pipeline.get_stats()["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_submit_waits_when_queue_full(self, registry):
+        """Test bulk submitters are throttled while interactive ones are not."""
+        pipeline = PreviewPipeline(max_workers=1, max_queue_size=1, registry=registry)
+        try:
+            await pipeline.submit(_slow_echo, b"running", delay=0.2)
+            await asyncio.sleep(0.05)
+            await pipeline.submit(_slow_echo, b"queued", PreviewPriority.BULK)
+
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    pipeline.submit(_slow_echo, b"waiting", PreviewPriority.BULK), 0.05
+                )
+            interactive = await asyncio.wait_for(pipeline.submit(_slow_echo, b"interactive"), 0.05)
+
+            assert await interactive == b"interactive"
+        finally:
+            await pipeline.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_large_inputs_are_spooled(self, registry, tmp_path):
+        """Test large inputs go through temp files that are removed afterwards."""
+        pipeline = PreviewPipeline(max_workers=1, spool_threshold=16, spool_dir=tmp_path, registry=registry)
+        content = os.urandom(1024)
+        try:
+            assert await pipeline.run(_slow_echo, content) == content
+            assert await pipeline.run(_slow_echo, b"small") == b"small"
+        finally:
+            await pipeline.shutdown()
+
+        assert pipeline.get_stats()["spooled"] == 1
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, pipeline):
+        """Test worker exceptions are raised to the caller."""
+        try:
+            with pytest.raises(ValueError, match="bad content"):
+                await pipeline.run(_fail, b"content")
+        finally:
+            await pipeline.shutdown()
+
+        assert pipeline.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, registry):
+        """Test CPU-bound bulk work does not stall the event loop."""
+        pipeline = PreviewPipeline(max_workers=2, registry=registry)
+        try:
+            tasks = [
+                await pipeline.submit(_busy_length, b"x" * i, PreviewPriority.BULK, duration=0.1)
+                for i in range(6)
+            ]
+
+            lags = []
+            while not all(task.done() for task in tasks):
+                start = time.monotonic()
+                await asyncio.sleep(0.01)
+                lags.append(time.monotonic() - start - 0.01)
+
+            assert [await task for task in tasks] == list(range(6))
+        finally:
+            await pipeline.shutdown()
+
+        assert max(lags) < 0.05
+        durations = registry.get("preview_pipeline_task_duration_seconds")
+        assert len(durations.labels({"function": "_busy_length"})) == 6
@@ -0,0 +1,218 @@
+"""Tests for file processors.
+
+This module contains unit tests for the streaming compression, decompression,
+hashing and archive helpers in app.file.utils.processors.
+"""
+
+import gzip
+import hashlib
+import io
+import os
+import sys
+import tarfile
+import zipfile
+
+import pytest
+
+from app.file.utils.processors import (
+    CompressProcessor,
+    HashProcessor,
+    MultiHasher,
+    StreamingCompressor,
+    StreamingDecompressor,
+    aiter_chunks,
+    compress_stream,
+    decompress_stream,
+    hash_stream,
+    iter_archive_entries,
+    iter_chunks,
+    write_archive,
+)
+
+
+class _ChunkCountingReader(io.BytesIO):
+    """BytesIO that records the size of every read."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size: int = -1) -> bytes:
+        self.reads.append(size)
+        return super().read(size)
+
+
+@pytest.fixture
+def payload():
+    """Create compressible test data spanning several blocks."""
+    return os.urandom(64 * 1024) * 5
+
+
+class TestStreamingCompression:
+    """Test suite for streaming compression and hashing."""
+
+    @pytest.mark.parametrize("algorithm", ["gzip", "bz2", "lzma"])
+    def test_stream_round_trip(self, payload, tmp_path, algorithm):
+        """Test compress_stream and decompress_stream round-trip through files."""
+        source = tmp_path / "payload.bin"
+        source.write_bytes(payload)
+        compressed = tmp_path / "payload.cmp"
+        restored = tmp_path / "payload.out"
+
+        success, info, error = compress_stream(source, compressed, algorithm, chunk_size=4096)
+        assert success is True, error
+        assert info["bytes_in"] == len(payload)
+        assert info["bytes_out"] == compressed.stat().st_size
+        assert info["checksums"]["sha256"] == hashlib.sha256(payload).hexdigest()
+
+        success, info, error = decompress_stream(compressed, restored, algorithm, chunk_size=4096)
+        assert success is True, error
+        assert restored.read_bytes() == payload
+        assert info["checksums"]["sha256"] == hashlib.sha256(payload).hexdigest()
+
+    def test_gzip_output_is_standard(self, payload):
+        """Test streamed gzip output can be read by the gzip module."""
+        target = io.BytesIO()
+
+        success, _, _ = compress_stream(payload, target, 'gzip')
+
+        assert success is True
+        assert gzip.decompress(target.getvalue()) == payload
+
+    def test_reads_in_fixed_blocks(self, payload):
+        """Test file objects are read in blocks, never whole."""
+        source = _ChunkCountingReader(payload)
+
+        compress_stream(source, io.BytesIO(), 'gzip', chunk_size=8192)
+
+        assert set(source.reads) == {8192}
+        assert len(source.reads) == len(payload) // 8192 + 1
+
+    def test_decompresses_concatenated_gzip_members(self):
+        """Test multi-member gzip streams decode completely."""
+        data = gzip.compress(b"first ") + gzip.compress(b"second")
+        decompressor = StreamingDecompressor('gzip')
+
+        output = b"".join(decompressor.update(data[i:i + 7]) for i in range(0, len(data), 7))
+
+        assert output + decompressor.finish() == b"first second"
+
+    def test_truncated_stream_fails(self, payload):
+        """Test a truncated compressed stream is reported as an error."""
+        compressed = gzip.compress(payload)
+
+        success, _, error = decompress_stream(compressed[:-100], io.BytesIO(), 'gzip')
+
+        assert success is False
+        assert "ended unexpectedly" in error
+
+    def test_hash_stream_computes_several_checksums(self, payload):
+        """Test one pass yields every requested checksum."""
+        success, checksums, _ = hash_stream(io.BytesIO(payload), ['md5', 'sha1', 'sha256'])
+
+        assert success is True
+        assert checksums == {
+            'md5': hashlib.md5(payload).hexdigest(),
+            'sha1': hashlib.sha1(payload).hexdigest(),
+            'sha256': hashlib.sha256(payload).hexdigest(),
+        }
+
+    def test_unknown_hash_algorithm_rejected(self):
+        """Test unsupported hash algorithms raise."""
+        with pytest.raises(ValueError):
+            MultiHasher(['crc32'])
+
+    def test_missing_optional_codec_is_reported(self, monkeypatch):
+        """Test codecs whose package is missing fail with a clear error."""
+        monkeypatch.setitem(sys.modules, 'zstandard', None)
+
+        success, _, error = CompressProcessor().compress_data(b"data", 'zstd')
+
+        assert success is False
+        assert "zstandard" in error
+
+    def test_byte_methods_use_streaming_codecs(self, payload):
+        """Test whole-content helpers support every stream codec."""
+        processor = CompressProcessor()
+
+        for algorithm in ['gzip', 'bz2', 'lzma']:
+            success, compressed, _ = processor.compress_data(payload, algorithm)
+            assert success is True
+            assert processor.decompress_data(compressed, algorithm) == (True, payload, None)
+
+    def test_calculate_checksum_accepts_file_object(self, payload):
+        """Test checksums of file objects are computed in blocks."""
+        success, checksum, _ = HashProcessor().calculate_checksum(io.BytesIO(payload), 'sha256')
+
+        assert success is True
+        assert checksum == hashlib.sha256(payload).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_async_compression(self, payload):
+        """Test async iterators are compressed block by block."""
+        async def blocks():
+            for chunk in iter_chunks(payload, 10000):
+                yield bytes(chunk)
+
+        compressor = StreamingCompressor('gzip', hash_algorithms=['sha256'])
+        compressed = b"".join([chunk async for chunk in compressor.compress_async(blocks())])
+
+        decompressor = StreamingDecompressor('gzip')
+        restored = b"".join([
+            chunk async for chunk in decompressor.decompress_async(aiter_chunks(io.BytesIO(compressed), 5000))
+        ])
+
+        assert restored == payload
+        assert compressor.checksums['sha256'] == hashlib.sha256(payload).hexdigest()
+
+
+class TestArchives:
+    """Test suite for streaming archive helpers."""
+
+    @pytest.mark.parametrize("archive_format", ["zip", "tar", "tar.gz"])
+    def test_archive_round_trip(self, payload, tmp_path, archive_format):
+        """Test entries written by write_archive read back with checksums."""
+        source = tmp_path / "large.bin"
+        source.write_bytes(payload)
+        target = tmp_path / f"bundle.{archive_format}"
+
+        success, info, error = write_archive(
+            [("skills/large.bin", source), ("skills/small.txt", b"hello"), ("meta.json", io.BytesIO(b"{}"))],
+            target,
+            archive_format,
+            chunk_size=4096,
+        )
+
+        assert success is True, error
+        assert [entry["name"] for entry in info["entries"]] == ["skills/large.bin", "skills/small.txt", "meta.json"]
+        assert info["entries"][0]["checksums"]["sha256"] == hashlib.sha256(payload).hexdigest()
+        assert info["bytes_out"] == target.stat().st_size
+
+        contents = {name: entry.read() for name, entry in iter_archive_entries(target)}
+        assert contents == {"skills/large.bin": payload, "skills/small.txt": b"hello", "meta.json": b"{}"}
+
+    def test_standard_readers_open_archives(self, tmp_path):
+        """Test the archives are readable by zipfile and tarfile."""
+        write_archive([("a.txt", b"a")], tmp_path / "a.zip", "zip")
+        write_archive([("a.txt", b"a")], tmp_path / "a.tar.gz", "tar.gz")
+
+        with zipfile.ZipFile(tmp_path / "a.zip") as archive:
+            assert archive.read("a.txt") == b"a"
+        with tarfile.open(tmp_path / "a.tar.gz") as archive:
+            assert archive.extractfile("a.txt").read() == b"a"
+
+    def test_tar_streams_to_unseekable_target(self, tmp_path):
+        """Test tar archives can be written to a forward-only stream."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(write_fd, "wb") as pipe:
+            success, _, error = write_archive([("a.txt", b"a" * 100)], pipe, "tar")
+        os.close(read_fd)
+
+        assert success is True, error
+
+    def test_unsupported_format(self, tmp_path):
+        """Test unknown archive formats are rejected."""
+        success, _, error = write_archive([], tmp_path / "a.rar", "rar")
+
+        assert success is False
+        assert "Unsupported archive format" in error
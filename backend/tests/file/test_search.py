@@ -0,0 +1,288 @@
+"""Tests for the file search backends.
+
+This module contains unit tests for InMemoryFileSearchBackend: loading,
+ranking, filtered search-after paging, bounded hit resolution and
+incremental updates; PostgresFileSearchBackend queries; and the
+per-database backend registry.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.search import encode_cursor
+from app.file.models.file import File
+from app.file.search import (
+    FILE_SEARCH_MAX_BATCHES,
+    InMemoryFileSearchBackend,
+    PostgresFileSearchBackend,
+    get_file_search_backend,
+)
+
+
+def _file_id(i):
+    return UUID(int=i)
+
+
+def _row(i, name, tags=None, description=None):
+    return SimpleNamespace(id=_file_id(i), name=name, tags=tags, description=description)
+
+
+class _AsyncRows:
+    """Stand-in for a streamed result."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __aiter__(self):
+        self._iter = iter(self.rows)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FilteredQuery:
+    """Stand-in for a filtered file query resolving IDs to files."""
+
+    def __init__(self, files, allowed=None):
+        self.files = files
+        self.allowed = allowed
+
+    def where(self, clause):
+        return [
+            self.files[file_id]
+            for file_id in clause.right.value
+            if file_id in self.files and (self.allowed is None or file_id in self.allowed)
+        ]
+
+
+def _result(value):
+    if isinstance(value, list):
+        return Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=value))))
+    return value
+
+
+@pytest.fixture
+def rows():
+    """Create file rows; every file mentions report."""
+    return [
+        _row(i, f"report {i}.pdf", ["finance"] if i % 3 else ["report"], "quarterly " * (i % 4))
+        for i in range(30)
+    ]
+
+
+@pytest.fixture
+def db(rows):
+    """Create mock async session streaming the file rows."""
+    session = Mock()
+    session.stream = AsyncMock(side_effect=lambda statement: _AsyncRows(rows))
+    session.execute = AsyncMock(side_effect=_result)
+    return session
+
+
+@pytest.fixture
+def files(rows):
+    """Create file objects keyed by ID."""
+    return {row.id: SimpleNamespace(id=row.id, name=row.name) for row in rows}
+
+
+class TestInMemoryFileSearchBackend:
+    """Test suite for InMemoryFileSearchBackend."""
+
+    @pytest.mark.asyncio
+    async def test_loads_on_first_search(self, db, files):
+        """Test the index is loaded from the files table once."""
+        index = InMemoryFileSearchBackend()
+        assert index.loaded is False
+
+        await index.search(db, _FilteredQuery(files), "report", 5)
+        await index.search(db, _FilteredQuery(files), "report", 5)
+
+        assert index.loaded is True
+        assert len(index.index) == 30
+        db.stream.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_cover_all_matches(self, db, files):
+        """Test cursors page through every match once, in rank order."""
+        index = InMemoryFileSearchBackend()
+        query = _FilteredQuery(files)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await index.search(db, query, "report", 7, cursor=cursor)
+            seen.extend(file.id for file in page.files)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        first = await index.search(db, query, "report", 100)
+        assert seen == [file.id for file in first.files]
+        assert first.total == 30
+        assert first.total_is_estimate is False
+
+    @pytest.mark.asyncio
+    async def test_filters_scale_estimated_total(self, db, files):
+        """Test filtered-out hits are skipped and the total is estimated."""
+        allowed = {file_id for file_id in files if file_id.int % 2 == 0}
+        index = InMemoryFileSearchBackend()
+        query = _FilteredQuery(files, allowed)
+
+        page = await index.search(db, query, "report", 5)
+        assert len(page.files) == 5
+        assert all(file.id in allowed for file in page.files)
+
+        later = await index.search(db, query, "report", 5, cursor=page.next_cursor)
+        assert later.total_is_estimate is True
+        assert 0 < later.total <= 30
+
+    @pytest.mark.asyncio
+    async def test_incremental_updates(self, db, files):
+        """Test updated files are re-read and deleted files dropped."""
+        index = InMemoryFileSearchBackend()
+        await index.rebuild(db)
+
+        db.execute = AsyncMock(return_value=Mock(all=Mock(return_value=[_row(1, "zebra.png")])))
+        await index.index_files(db, [_file_id(1)])
+        index.remove_files([_file_id(2)])
+
+        db.execute = AsyncMock(side_effect=_result)
+        page = await index.search(db, _FilteredQuery(files), "zebra", 10)
+        assert [file.id for file in page.files] == [_file_id(1)]
+        assert index.index.search("report").total == 28
+
+    @pytest.mark.asyncio
+    async def test_updates_before_load_are_skipped(self, db):
+        """Test an unloaded index ignores updates."""
+        index = InMemoryFileSearchBackend()
+        await index.index_files(db, [_file_id(1)])
+
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rebuild_reloads(self, db, files):
+        """Test rebuild reloads a loaded index."""
+        index = InMemoryFileSearchBackend()
+        await index.search(db, _FilteredQuery(files), "report", 5)
+        await index.rebuild(db)
+
+        assert db.stream.await_count == 2
+        assert len(index.index) == 30
+
+    @pytest.mark.asyncio
+    async def test_hit_resolution_is_bounded(self, db, rows):
+        """Test sparse filters stop after a few batches with a cursor for the rest."""
+        rows[:] = [_row(i, f"report {i}.pdf") for i in range(500)]
+        files = {row.id: SimpleNamespace(id=row.id, name=row.name) for row in rows}
+        index = InMemoryFileSearchBackend()
+        query = _FilteredQuery(files, {rows[-1].id})
+
+        page = await index.search(db, query, "report", 5)
+
+        assert page.files == []
+        assert page.next_cursor is not None
+        assert db.execute.await_count == FILE_SEARCH_MAX_BATCHES
+
+        seen = []
+        cursor = page.next_cursor
+        while cursor is not None:
+            page = await index.search(db, query, "report", 5, cursor=cursor)
+            seen.extend(file.id for file in page.files)
+            cursor = page.next_cursor
+        assert seen == [rows[-1].id]
+
+    @pytest.mark.asyncio
+    async def test_rejects_foreign_cursor(self, db, files):
+        """Test cursors of another ordering are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await InMemoryFileSearchBackend().search(db, _FilteredQuery(files), "report", 5, cursor="bm90LWEtbGlzdA")
+
+
+class TestPostgresFileSearchBackend:
+    """Test suite for PostgresFileSearchBackend."""
+
+    @staticmethod
+    def _sql(statement):
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_search_matches_in_one_query(self):
+        """Test matching, filters and ranking run in the database."""
+        db = Mock()
+        db.execute = AsyncMock(side_effect=[
+            Mock(scalar=Mock(return_value=1)),
+            Mock(all=Mock(return_value=[(SimpleNamespace(id=_file_id(1)), 0.5)])),
+        ])
+        query = select(File).where(File.is_public == True)
+
+        page = await PostgresFileSearchBackend().search(db, query, "Quarterly rep", 10)
+
+        assert [file.id for file in page.files] == [_file_id(1)]
+        assert (page.total, page.total_is_estimate, page.next_cursor) == (1, False, None)
+        sql = self._sql(db.execute.await_args_list[1].args[0])
+        assert "@@ to_tsquery('simple'::regconfig" in sql
+        assert "lower(files.name) %" in sql
+        assert "files.is_public" in sql
+        assert "ORDER BY" in sql and "ts_rank_cd" in sql
+        assert db.execute.await_args_list[1].args[0].compile().params["to_tsquery_1"] == "quarterly & rep:*"
+
+    @pytest.mark.asyncio
+    async def test_empty_query_matches_nothing(self):
+        """Test a query without terms skips the database."""
+        db = Mock()
+        db.execute = AsyncMock()
+
+        page = await PostgresFileSearchBackend().search(db, select(File), "  ", 10)
+
+        assert page.files == []
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_malformed_cursor(self):
+        """Test relevance cursors must carry a file ID."""
+        db = Mock()
+        db.execute = AsyncMock(return_value=Mock(scalar=Mock(return_value=0)))
+        cursor = encode_cursor(["r", 0.5, "not-a-uuid"])
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await PostgresFileSearchBackend().search(db, select(File), "report", 10, cursor=cursor)
+
+
+class TestFileSearchBackendRegistry:
+    """Test suite for get_file_search_backend."""
+
+    def _session(self, url, dialect="sqlite"):
+        session = Mock()
+        session.get_bind.return_value = SimpleNamespace(url=url, dialect=SimpleNamespace(name=dialect))
+        return session
+
+    def test_backend_shared_per_database(self):
+        """Test sessions of one database share the backend."""
+        first = get_file_search_backend(self._session("sqlite:///shared.db"), "auto")
+        second = get_file_search_backend(self._session("sqlite:///shared.db"), "auto")
+        other = get_file_search_backend(self._session("sqlite:///other.db"), "auto")
+
+        assert first is second
+        assert first is not other
+
+    def test_auto_picks_backend_by_dialect(self):
+        """Test PostgreSQL searches in the database and others in memory."""
+        pg = get_file_search_backend(self._session("postgresql://db/files", "postgresql"), "auto")
+        lite = get_file_search_backend(self._session("sqlite:///auto.db"), "auto")
+
+        assert isinstance(pg, PostgresFileSearchBackend)
+        assert isinstance(lite, InMemoryFileSearchBackend)
+
+    def test_rejects_unknown_backend(self):
+        """Test unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unsupported search backend"):
+            get_file_search_backend(self._session("sqlite:///x.db"), "elastic")
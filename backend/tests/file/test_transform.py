@@ -0,0 +1,136 @@
+"""Tests for the operational transform engine.
+
+This module contains unit tests for rebasing editor change operations and
+for the bounded per-session operation log.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from app.file.editor import ChangeOperation
+from app.file.transform import (
+    OperationLog,
+    normalize_operations,
+    serialize_operations,
+    transform_operations,
+)
+
+
+def op(type, position, length=0, content=""):
+    """Create a change operation."""
+    return ChangeOperation(
+        operation_id=f"{type}-{position}",
+        type=type,
+        position=position,
+        length=length,
+        content=content,
+        timestamp=datetime.utcnow(),
+        user_id="test-user",
+    )
+
+
+def apply(text, operations):
+    """Apply operations to a string."""
+    for operation in operations:
+        position = operation.position
+        if operation.type == "insert":
+            text = text[:position] + operation.content + text[position:]
+        elif operation.type == "delete":
+            text = text[:position] + text[position + operation.length:]
+        else:
+            text = text[:position] + operation.content + text[position + operation.length:]
+    return text
+
+
+class TestTransform:
+    """Test suite for transform_operations."""
+
+    def test_insert_after_committed_insert_shifts(self):
+        """Test an insert behind a committed insert moves right."""
+        rebased, _ = transform_operations([op("insert", 5, content="!")], [op("insert", 0, content="Hi ")])
+
+        assert rebased[0].position == 8
+
+    def test_same_position_inserts_put_committed_first(self):
+        """Test ties between inserts place the committed text first."""
+        incoming = [op("insert", 0, content="B")]
+        committed = [op("insert", 0, content="A")]
+
+        rebased, _ = transform_operations(incoming, committed)
+
+        assert apply(apply("", committed), rebased) == "AB"
+
+    def test_overlapping_deletes_do_not_double_delete(self):
+        """Test overlapping deletes only remove the remaining text."""
+        base = "0123456789"
+        incoming = [op("delete", 2, length=5)]
+        committed = [op("delete", 4, length=5)]
+
+        rebased, _ = transform_operations(incoming, committed)
+
+        assert apply(apply(base, committed), rebased) == "019"
+
+    def test_replace_is_normalized(self):
+        """Test replace operations become delete plus insert."""
+        normalized = normalize_operations([op("replace", 3, length=2, content="xy")])
+
+        assert [(o.type, o.position, o.length) for o in normalized] == [
+            ("delete", 3, 2),
+            ("insert", 3, 2),
+        ]
+        assert serialize_operations(normalized)[1] == {"type": "insert", "position": 3, "content": "xy"}
+
+    def test_unknown_type_rejected(self):
+        """Test unknown operation types raise ValueError."""
+        with pytest.raises(ValueError):
+            normalize_operations([op("move", 0)])
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_batches_converge(self, seed):
+        """Test both application orders produce the same document."""
+        rng = random.Random(seed)
+
+        def batch(text):
+            operations = []
+            for _ in range(rng.randint(1, 4)):
+                kind = rng.choice(["insert", "delete", "replace"])
+                position = rng.randint(0, len(text))
+                length = 0 if kind == "insert" else rng.randint(0, len(text) - position)
+                content = "" if kind == "delete" else rng.choice(["x", "yz", ""])
+                operation = op(kind, position, length, content)
+                operations.append(operation)
+                text = apply(text, [operation])
+            return operations
+
+        for _ in range(200):
+            base = "".join(rng.choice("abc") for _ in range(rng.randint(0, 10)))
+            incoming, committed = batch(base), batch(base)
+
+            rebased, rebased_committed = transform_operations(incoming, committed)
+
+            assert apply(apply(base, committed), rebased) == apply(apply(base, incoming), rebased_committed)
+
+
+class TestOperationLog:
+    """Test suite for OperationLog."""
+
+    def test_since_returns_operations_after_version(self):
+        """Test operations are returned from the requested version on."""
+        log = OperationLog()
+        log.append(1, [op("insert", 0, content="a")])
+        log.append(2, [op("insert", 1, content="b")])
+
+        assert [o.content for o in log.since(2)] == ["b"]
+        assert [o.content for o in log.since(1)] == ["a", "b"]
+
+    def test_log_is_bounded(self):
+        """Test old batches are dropped and can no longer be rebased."""
+        log = OperationLog(max_entries=2)
+        for version in range(1, 5):
+            log.append(version, [])
+
+        assert len(log) == 2
+        assert log.oldest_version == 3
+        assert log.since(2) is None
@@ -22,6 +22,7 @@ from app.file.version_manager import (
     VersionStatistics,
 )
 from app.file.models.file_version import FileVersion, VersionStatus
+from app.core.cache import LRUCache
 
 
 class TestVersionManager:
@@ -131,6 +132,43 @@ class TestVersionManager:
             assert version.size == 2048
             assert version.parent_version_id == sample_file_version.id
 
+    @pytest.mark.asyncio
+    async def test_create_version_stores_delta(
+        self,
+        db_session,
+        sample_file_id,
+        sample_user_id,
+        sample_file_version,
+    ):
+        """Test small edits to large content are stored as deltas and rebuilt."""
+        version_manager = VersionManager(db_session, content_cache=LRUCache(max_entries=0))
+        base_content = "".join(f"line {i}\n" for i in range(1000))
+        new_content = base_content.replace("line 500\n", "line five hundred\n")
+        sample_file_version.content = base_content
+
+        with patch.object(version_manager, 'get_current_version', return_value=sample_file_version):
+            version = await version_manager.create_version(
+                file_id=sample_file_id,
+                author_id=sample_user_id,
+                author_name="Test User",
+                content=new_content,
+                size=len(new_content),
+            )
+
+        assert version.metadata["delta"] == {
+            "base_version_id": str(sample_file_version.id),
+            "chain_length": 1,
+        }
+        assert len(version.content) < 100
+
+        # Rebuild from the delta chain
+        version.id = uuid4()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [sample_file_version]
+        db_session.execute.return_value = result
+
+        assert await version_manager.get_version_content(version) == new_content
+
     @pytest.mark.asyncio
     async def test_create_version_content_unchanged(
         self,
@@ -0,0 +1,78 @@
+"""Tests for PerformanceOptimizer.
+
+Tests resource pooling through the shared pool registry.
+"""
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..')))
+
+from backend.app.core.pool import DatabaseSessionPool, PoolRegistry, RedisClientPool
+from backend.app.platform.performance import OptimizationStrategy, PerformanceOptimizer
+
+
+class FakeSession:
+    """Stand-in for an AsyncSession."""
+
+    closed = False
+
+    async def rollback(self):
+        pass
+
+    def expunge_all(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class TestResourcePooling:
+    """Test the RESOURCE_POOLING strategy."""
+
+    @pytest.mark.asyncio
+    async def test_known_resource_pools_are_registered(self):
+        """Test database and Redis pools are created and shared on first use."""
+        registry = PoolRegistry()
+        optimizer = PerformanceOptimizer()
+
+        with patch("backend.app.platform.performance.pool_registry", registry):
+            database_pool = optimizer._create_resource_pool("database_sessions")
+            redis_pool = optimizer._create_resource_pool("redis_clients")
+
+            assert isinstance(database_pool, DatabaseSessionPool)
+            assert isinstance(redis_pool, RedisClientPool)
+            assert registry.get("database_sessions") is database_pool
+            assert PerformanceOptimizer()._create_resource_pool("database_sessions") is database_pool
+
+            with pytest.raises(ValueError, match="No resource pool registered"):
+                optimizer._create_resource_pool("unknown")
+
+        await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_resource_pooling_reuses_sessions(self):
+        """Test pooled sessions are handed back and reused across operations."""
+        registry = PoolRegistry()
+        registry.register(DatabaseSessionPool(session_factory=FakeSession), "database_sessions")
+        optimizer = PerformanceOptimizer()
+
+        async def operation(session):
+            return session
+
+        with patch("backend.app.platform.performance.pool_registry", registry):
+            first = await optimizer.optimize_operation(
+                operation, "query", OptimizationStrategy.RESOURCE_POOLING, "database_sessions"
+            )
+            second = await optimizer.optimize_operation(
+                operation, "query", OptimizationStrategy.RESOURCE_POOLING, "database_sessions"
+            )
+
+        assert first is second
+        assert first.closed is False
+
+        await registry.close_all()
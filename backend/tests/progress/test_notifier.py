@@ -807,6 +807,224 @@ class TestSmartRouting:
         result = await manager._check_rate_limit(notification)
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_buckets_per_priority(self):
+        """Test priorities have independent token buckets."""
+        from backend.app.progress.notification_manager import NotificationManager
+
+        manager = NotificationManager()
+        critical = Notification(
+            user_id="user-123",
+            title="Critical",
+            message="Test",
+            notification_type=NotificationType.ERROR,
+            priority=NotificationPriority.CRITICAL,
+            channels=[NotificationChannel.WEBSOCKET],
+        )
+        normal = Notification(
+            user_id="user-123",
+            title="Normal",
+            message="Test",
+            notification_type=NotificationType.ALERT,
+            priority=NotificationPriority.NORMAL,
+            channels=[NotificationChannel.WEBSOCKET],
+        )
+
+        for _ in range(10):
+            assert await manager._check_rate_limit(critical) is True
+        assert await manager._check_rate_limit(critical) is False
+
+        # Normal priority is unaffected and memory stays one bucket per priority
+        assert await manager._check_rate_limit(normal) is True
+        assert len(manager._rate_limits) == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_notifications_coalesced(self):
+        """Test over-limit notifications are sent as one digest."""
+        from backend.app.progress.notification_manager import NotificationManager
+
+        manager = NotificationManager()
+        manager._check_rate_limit = AsyncMock(return_value=False)
+
+        for i in range(8):
+            request = CreateNotificationRequest(
+                user_id="user-123",
+                title=f"Update {i}",
+                message="Progress",
+                notification_type=NotificationType.PROGRESS,
+                priority=NotificationPriority.NORMAL,
+            )
+            await manager.create_notification(request)
+
+        assert manager.get_stats()["total_rate_limited"] == 8
+
+        with patch.object(manager, "send_notification", new_callable=AsyncMock) as mock_send:
+            sent = await manager.flush_digests()
+
+        assert sent == 1
+        digest = mock_send.call_args[0][0]
+        assert digest.user_id == "user-123"
+        assert digest.notification_metadata["digest"] is True
+        assert digest.notification_metadata["count"] == 8
+        assert "and 3 more" in digest.message
+
+        # Nothing pending after a flush
+        with patch.object(manager, "send_notification", new_callable=AsyncMock) as mock_send:
+            assert await manager.flush_digests() == 0
+            mock_send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_notification_delivered_by_digest_loop(self):
+        """Test a throttled notification is eventually delivered once started."""
+        from backend.app.progress.notification_manager import NotificationManager
+
+        manager = NotificationManager(digest_interval=0.01)
+        manager._check_rate_limit = AsyncMock(side_effect=[True, False])
+        manager._send_through_channel = AsyncMock(return_value=True)
+
+        await manager.start()
+        try:
+            for i in range(2):
+                await manager.create_notification(CreateNotificationRequest(
+                    user_id="user-123",
+                    title=f"Update {i}",
+                    message="Progress",
+                    notification_type=NotificationType.PROGRESS,
+                    priority=NotificationPriority.NORMAL,
+                ))
+            assert manager._send_through_channel.call_count == 1
+
+            for _ in range(100):
+                if manager.get_stats()["total_digests_sent"]:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await manager.stop()
+
+        assert manager.get_stats()["total_digests_sent"] == 1
+        digest = manager._send_through_channel.call_args[0][0]
+        assert digest.notification_metadata["digest"] is True
+        assert digest.notification_metadata["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_digests(self):
+        """Test stopping the manager delivers notifications still held back."""
+        from backend.app.progress.notification_manager import NotificationManager
+
+        manager = NotificationManager(digest_interval=3600)
+        manager._check_rate_limit = AsyncMock(return_value=False)
+        manager._send_through_channel = AsyncMock(return_value=True)
+
+        await manager.start()
+        await manager.create_notification(CreateNotificationRequest(
+            user_id="user-123",
+            title="Update",
+            message="Progress",
+            notification_type=NotificationType.PROGRESS,
+            priority=NotificationPriority.NORMAL,
+        ))
+        manager._send_through_channel.assert_not_called()
+
+        await manager.stop()
+
+        assert manager.get_stats()["total_digests_sent"] == 1
+        assert manager._pending_digests == {}
+
+    @pytest.mark.asyncio
+    async def test_digests_bypass_rate_limit(self):
+        """Test digests are never limited and keep their counts when folded."""
+        from backend.app.progress.models.notification import Notification as DigestNotification
+        from backend.app.progress.notification_manager import NotificationDigest, NotificationManager
+
+        manager = NotificationManager()
+        digest = NotificationDigest("user-123")
+        for i in range(4):
+            digest.add(DigestNotification(
+                user_id="user-123",
+                title=f"Update {i}",
+                message="Progress",
+                notification_type=NotificationType.PROGRESS,
+                priority=NotificationPriority.CRITICAL,
+                channels=[NotificationChannel.WEBSOCKET],
+            ))
+        notification = digest.to_notification()
+
+        for _ in range(20):
+            assert await manager._check_rate_limit(notification) is True
+
+        nested = NotificationDigest("user-123")
+        nested.add(notification)
+        assert nested.to_notification().notification_metadata["count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_bulk_send_rate_limited_not_sent(self):
+        """Test rate-limited bulk notifications are coalesced, not reported as sent."""
+        from backend.app.progress.notification_manager import NotificationManager
+
+        manager = NotificationManager()
+        manager._check_rate_limit = AsyncMock(side_effect=[True, False, False])
+        notifications = [
+            Notification(
+                user_id="user-123",
+                title=f"Notification {i}",
+                message="Message",
+                notification_type=NotificationType.ALERT,
+                priority=NotificationPriority.NORMAL,
+                channels=[NotificationChannel.WEBSOCKET],
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(manager, "send_notification", new_callable=AsyncMock) as mock_send:
+            mock_send.return_value = {"successful": ["websocket"]}
+            result = await manager.bulk_send_notifications(notifications)
+
+        assert result["successful"] == 1
+        assert result["coalesced"] == 2
+        assert mock_send.call_count == 1
+        assert manager._pending_digests["user-123"].count == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_send_bounded_and_grouped(self):
+        """Test bulk sends bound concurrency and coalesce oversized groups."""
+        from backend.app.progress.notification_manager import NotificationManager
+
+        manager = NotificationManager(bulk_concurrency=2, bulk_group_limit=5)
+        notifications = [
+            Notification(
+                user_id=f"user-{i % 3}",
+                title=f"Notification {i}",
+                message="Message",
+                notification_type=NotificationType.ALERT,
+                priority=NotificationPriority.NORMAL,
+                channels=[NotificationChannel.WEBSOCKET],
+            )
+            for i in range(30)
+        ]
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_send(notification, db_session=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if notification.title == "Notification 0":
+                raise RuntimeError("channel down")
+            return {"successful": ["websocket"]}
+
+        with patch.object(manager, "send_notification", side_effect=fake_send):
+            result = await manager.bulk_send_notifications(notifications)
+
+        assert max_in_flight <= 2
+        assert result["successful"] == 14
+        assert result["failed"] == 1
+        assert result["coalesced"] == 15
+        assert len(result["errors"]) == 1
+        assert set(manager._pending_digests) == {"user-0", "user-1", "user-2"}
+
     @pytest.mark.asyncio
     async def test_smart_routing_rules(self):
         """Test smart routing rule application."""
@@ -20,6 +20,7 @@ from backend.app.progress.visualization_manager import (
     ChartTemplate,
     RealTimeUpdate,
 )
+from backend.app.progress.rollups import RollupStore, RollupResolution
 from backend.app.progress.charts.base import BaseChartComponent, AnimationType, ResponsiveBreakpoint
 from backend.app.progress.charts.progress_bar import ProgressBarComponent
 from backend.app.progress.charts.timeline import TimelineComponent, TimelineItem, TimelineOrientation
@@ -721,6 +722,69 @@ class TestVisualizationManager:
         await viz_manager.remove_real_time_subscription(subscription_id)
         assert subscription_id not in viz_manager.real_time_updates
 
+    @pytest.mark.asyncio
+    async def test_shared_ticker_computes_each_filter_once(self, viz_manager):
+        """Test subscriptions with identical filters share one computation."""
+        viz_manager.rollups.record_created("computation")
+
+        with patch(
+            "backend.app.progress.visualization_manager.websocket_manager.send_message",
+            new=AsyncMock(),
+        ) as send_message:
+            for i in range(3):
+                await viz_manager.add_real_time_subscription(
+                    connection_id=f"conn{i}",
+                    visualization_query={"chart_type": "pie"},
+                    update_interval=0.0,
+                )
+            await viz_manager.add_real_time_subscription(
+                connection_id="conn-line",
+                visualization_query={"chart_type": "line", "time_range": "1h"},
+                update_interval=0.0,
+            )
+            # Drive ticks by hand instead of the background ticker
+            viz_manager._ticker_task.cancel()
+
+            computed = await viz_manager._tick()
+            assert computed == 2
+            assert send_message.await_count == 4
+
+            # Unchanged rollups reuse the cached payloads
+            computed = await viz_manager._tick()
+            assert computed == 0
+            assert send_message.await_count == 8
+
+        for subscription_id in list(viz_manager.real_time_updates):
+            await viz_manager.remove_real_time_subscription(subscription_id)
+        assert viz_manager.get_stats()["distinct_subscription_filters"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fleet_charts_read_rollups(self, viz_manager):
+        """Test charts without task or user filters are served from rollups."""
+        await viz_manager.rollups.handle_task_update(
+            "task_created", {"task_type": "computation", "status": "pending"}
+        )
+        await viz_manager.rollups.handle_task_update(
+            "progress_updated",
+            {
+                "task_type": "computation",
+                "status": "running",
+                "progress": 40.0,
+                "previous_status": "pending",
+            },
+        )
+
+        distribution = await viz_manager.create_status_distribution_chart()
+        assert distribution.data == [{"status": "running", "count": 1, "percentage": 100.0}]
+
+        heatmap = await viz_manager.create_activity_heatmap(days=7)
+        assert len(heatmap.data) == 7
+        assert heatmap.data[-1]["count"] == 1
+
+        chart = await viz_manager.create_progress_chart(task_ids=[], time_range="1h")
+        assert chart.metadata["source"] == "rollups"
+        assert chart.data[-1]["value"] == 40.0
+
     @pytest.mark.asyncio
     async def test_animated_chart(self, viz_manager):
         """Test creating animated charts."""
@@ -767,6 +831,72 @@ class TestVisualizationManager:
         assert "active_subscriptions" in stats
 
 
+class TestRollupStore:
+    """Test RollupStore functionality."""
+
+    @pytest.fixture
+    def rollups(self):
+        """Create rollup store instance."""
+        return RollupStore()
+
+    def test_series_aggregations(self, rollups):
+        """Test progress series per aggregation and filter."""
+        rollups.record_progress("build", "running", 20.0)
+        rollups.record_progress("build", "running", 60.0)
+        rollups.record_progress("deploy", "running", 90.0)
+        since = datetime.utcnow() - timedelta(hours=1)
+
+        assert rollups.series(since)[-1]["count"] == 3
+        assert rollups.series(since, task_type="build")[-1]["value"] == 40.0
+        assert rollups.series(since, aggregation="max")[-1]["value"] == 90.0
+        assert rollups.series(since, aggregation="min")[-1]["value"] == 20.0
+
+    def test_grouped_and_status_transitions(self, rollups):
+        """Test grouping and live status counts follow transitions."""
+        rollups.record_created("build")
+        rollups.record_created("build")
+        rollups.record_progress("build", "running", 50.0, previous_status="pending")
+        rollups.record_progress("build", "completed", 100.0, previous_status="running")
+        since = datetime.utcnow() - timedelta(hours=1)
+
+        groups = {row["group"]: row for row in rollups.grouped("status", since)}
+        assert groups["completed"]["value"] == 100.0
+        assert groups["running"]["count"] == 1
+
+        counts = {row["status"]: row["count"] for row in rollups.status_distribution()}
+        assert counts == {"pending": 1, "completed": 1}
+
+        rollups.record_removed("build", "completed")
+        counts = {row["status"]: row["count"] for row in rollups.status_distribution()}
+        assert counts == {"pending": 1}
+
+    def test_retention_prunes_old_buckets(self):
+        """Test buckets older than the retention window are dropped."""
+        rollups = RollupStore(retention={RollupResolution.MINUTE: 5})
+        base = 1_700_000_000.0
+        for minute in range(10):
+            rollups.record_progress("build", "running", 10.0, timestamp=base + minute * 60)
+
+        assert rollups.get_stats()["buckets"][RollupResolution.MINUTE] <= 6
+
+    def test_retention_evicts_by_time_with_late_samples(self):
+        """Test late samples neither evict newer buckets nor outlive retention."""
+        rollups = RollupStore(retention={RollupResolution.MINUTE: 5})
+        base = 1_700_000_000.0
+        for minute in (8, 9, 2, 10, 3, 11):
+            rollups.record_progress("build", "running", 10.0, timestamp=base + minute * 60)
+
+        starts = sorted(rollups._buckets[RollupResolution.MINUTE][("build", "running")])
+        assert starts == [RollupStore._bucket_start(base + minute * 60, RollupResolution.MINUTE)
+                          for minute in (8, 9, 10, 11)]
+
+    def test_resolution_for_span(self):
+        """Test resolution selection by queried span."""
+        assert RollupStore.resolution_for(3600) == RollupResolution.MINUTE
+        assert RollupStore.resolution_for(3 * 86400) == RollupResolution.HOUR
+        assert RollupStore.resolution_for(90 * 86400) == RollupResolution.DAY
+
+
 # Test data fixtures
 @pytest.fixture
 def sample_progress_data():
@@ -11,19 +11,24 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, MagicMock
 from typing import Dict, Any
 
+from types import SimpleNamespace
+
 from app.skill.analytics import (
+    ANALYZER_VERSIONS,
     SkillAnalytics,
     Metric,
     AnalyticsReport,
     SkillUsageStats,
     QualityScore,
     DependencyGraph,
+    MetricSeries,
     MetricType,
     TimeRange,
     AggregationType,
 )
 from app.skill.manager import SkillManager
-from app.skill.event_manager import SkillEventManager
+from app.skill.event_manager import EventType, SkillEvent, SkillEventManager
+from app.skill.schemas.skill_operations import SkillUpdate
 
 
 @pytest.fixture
@@ -40,6 +45,10 @@ def skill_manager():
         version="1.0.0",
         category="testing",
     ))
+    manager.get_skill_dependencies = AsyncMock(return_value=[
+        {"id": "skill1", "name": "Skill 1", "version": "1.0.0", "category": "testing", "dependencies": ["skill2"]},
+        {"id": "skill2", "name": "Skill 2", "version": "1.0.0", "category": None, "dependencies": [{"name": "click"}]},
+    ])
     manager.list_skills = AsyncMock(return_value=Mock(
         items=[
             Mock(id="skill1", name="Skill 1"),
@@ -286,6 +295,49 @@ class TestDependencyGraph:
         assert "skill2" in neighbors
         assert "skill3" in neighbors
 
+    def test_strongly_connected_components(self):
+        """Test cycles are reported as strongly connected components."""
+        graph = DependencyGraph()
+        for source, target in [("a", "b"), ("b", "a"), ("b", "c"), ("c", "d"), ("d", "e"), ("e", "c"), ("f", "f"), ("g", "a")]:
+            graph.add_edge(source, target)
+
+        cycles = sorted(sorted(cycle) for cycle in graph.detect_cycles())
+
+        assert cycles == [["a", "b"], ["c", "d", "e"], ["f"]]
+        assert sum(len(c) for c in graph.strongly_connected_components()) == 7
+
+    def test_transitive_queries_follow_edge_changes(self):
+        """Test cached closures are invalidated by edge changes."""
+        graph = DependencyGraph()
+        graph.add_edge("app", "lib")
+        graph.add_edge("lib", "core")
+        graph.add_edge("tool", "core")
+
+        assert graph.get_transitive_dependencies("app") == {"lib", "core"}
+        assert graph.get_transitive_dependents("core") == {"lib", "app", "tool"}
+
+        graph.add_edge("core", "base")
+        graph.set_dependencies("lib", ["util"])
+
+        assert graph.get_transitive_dependencies("app") == {"lib", "util"}
+        assert graph.get_transitive_dependents("core") == {"tool"}
+        assert graph.get_transitive_dependents("base") == {"core", "tool"}
+        assert graph.cycles == []
+
+        graph.add_edge("base", "tool")
+        assert graph.cycles and sorted(graph.cycles[0]) == ["base", "core", "tool"]
+
+    def test_large_chain(self):
+        """Test deep graphs need no recursion and closures reuse the cache."""
+        graph = DependencyGraph()
+        for i in range(100000):
+            graph.add_edge(f"skill{i}", f"skill{i + 1}")
+
+        assert graph.detect_cycles() == []
+        assert len(graph.get_transitive_dependents("skill100000")) == 100000
+        assert len(graph.get_transitive_dependencies("skill99990")) == 10
+        assert len(graph.get_transitive_dependencies("skill0")) == 100000
+
 
 class TestSkillAnalytics:
     """Test SkillAnalytics class."""
@@ -309,6 +361,7 @@ class TestSkillAnalytics:
         assert stats.error_rate == 0.0
 
         # Check event was published
+        await analytics.flush()
         analytics.event_manager.publish_event.assert_called_once()
 
     @pytest.mark.asyncio
@@ -344,7 +397,7 @@ class TestSkillAnalytics:
         stats = analytics.skill_stats["test-skill"]
         assert stats.total_executions == 5
         assert stats.successful_executions == 5
-        assert stats.average_execution_time == 1.2  # (1.0 + 1.1 + 1.2 + 1.3 + 1.4) / 5
+        assert stats.average_execution_time == pytest.approx(1.2)  # (1.0 + 1.1 + 1.2 + 1.3 + 1.4) / 5
         assert stats.min_execution_time == 1.0
         assert stats.max_execution_time == 1.4
 
@@ -512,6 +565,54 @@ class TestSkillAnalytics:
 
         assert isinstance(graph, DependencyGraph)
         assert len(graph.nodes) > 0
+        assert graph.get_dependencies("skill2") == {"click"}
+        analytics.skill_manager.get_skill_dependencies.assert_awaited_once_with(["skill1", "skill2"])
+        analytics.skill_manager.get_skill.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dependency_graph_follows_skill_events(self, analytics):
+        """Test the kept graph is updated from skill events."""
+        graph = await analytics.build_dependency_graph()
+        assert await analytics.build_dependency_graph() is graph
+
+        analytics.skill_manager.get_skill_dependencies.return_value = [
+            {"id": "skill2", "name": "Skill 2", "version": "1.1.0", "category": None, "dependencies": ["skill3"]},
+        ]
+        await analytics._dependency_handler.handle(SkillEvent(
+            event_type=EventType.SKILL_UPDATED,
+            event_id="event1",
+            skill_id="skill2",
+            data={"stats": {}, "previous_stats": {}},
+        ))
+        impact = await analytics.get_dependency_impact("skill3")
+
+        assert impact["affected_skills"] == ["skill1", "skill2"]
+        assert graph.nodes["skill2"]["version"] == "1.1.0"
+        analytics.skill_manager.get_skill_dependencies.assert_awaited_with(["skill2"])
+
+    @pytest.mark.asyncio
+    async def test_dependency_graph_follows_skill_manager_updates(self):
+        """Test dependencies changed through SkillManager reach the kept graph."""
+        db_session = Mock()
+        query = db_session.query.return_value
+        query.outerjoin.return_value.all.return_value = [
+            ("skill1", "Skill 1", "1.0.0", "testing", ["skill2"]),
+            ("skill2", "Skill 2", "1.0.0", None, []),
+        ]
+        event_manager = SkillEventManager()
+        skill_manager = SkillManager(db_session, event_manager=event_manager)
+        skill_manager._to_skill_response = Mock()
+        analytics = SkillAnalytics(skill_manager=skill_manager, event_manager=event_manager)
+        await analytics.build_dependency_graph()
+
+        query.filter.return_value.first.return_value = Mock(id="skill2", tags=[], dependencies=[])
+        query.outerjoin.return_value.filter.return_value.all.return_value = [
+            ("skill2", "Skill 2", "1.0.0", None, ["skill3"]),
+        ]
+        await skill_manager.update_skill("skill2", SkillUpdate(dependencies=["skill3"]))
+        impact = await analytics.get_dependency_impact("skill3")
+
+        assert impact["affected_skills"] == ["skill1", "skill2"]
 
     @pytest.mark.asyncio
     async def test_generate_usage_report(self, analytics):
@@ -776,3 +877,232 @@ class TestSkillAnalytics:
         assert AggregationType.MAX.value == "max"
         assert AggregationType.COUNT.value == "count"
         assert AggregationType.PERCENTILE.value == "percentile"
+
+
+def _skill(skill_id="s1", content="def run():\n    # Run it\n    return 1", **fields):
+    """Create plain skill data for quality scoring."""
+    defaults = {
+        "name": "Skill",
+        "description": "A skill",
+        "author": "Author",
+        "dependencies": ["click"],
+        "readme": "Read me",
+    }
+    defaults.update(fields)
+    return SimpleNamespace(id=skill_id, content=content, **defaults)
+
+
+class TestMetricSeries:
+    """Test time-partitioned metric storage."""
+
+    @pytest.fixture
+    def points(self):
+        """Create points spread over the last 40 days."""
+        now = datetime.now()
+        return [
+            Metric("test.metric", float(i % 97), MetricType.GAUGE, timestamp=now - timedelta(minutes=i * 29))
+            for i in range(2000)
+        ]
+
+    def test_range_summaries_match_raw_points(self, points):
+        """Test merged summaries equal aggregates over the raw points."""
+        series = MetricSeries("test.metric", raw_retention=timedelta(days=60))
+        for point in reversed(points):
+            series.append(point)
+
+        for since in (timedelta(hours=1, seconds=30), timedelta(days=3, minutes=7), timedelta(days=35)):
+            cutoff = datetime.now() - since
+            values = [p.value for p in points if p.timestamp > cutoff]
+            summary = series.summarize(cutoff)
+
+            assert summary.count == len(values)
+            assert summary.sum == pytest.approx(sum(values))
+            assert (summary.min, summary.max) == (min(values), max(values))
+            assert sorted(p.value for p in series.points(cutoff)) == sorted(values)
+
+    def test_expired_partitions_are_dropped_whole(self, points):
+        """Test raw partitions expire while roll-ups keep answering."""
+        series = MetricSeries("test.metric", raw_retention=timedelta(days=60))
+        for point in reversed(points):
+            series.append(point)
+
+        series.drop_before(datetime.now() - timedelta(days=7))
+
+        assert len(series) == len([p for p in points if p.timestamp > datetime.now() - timedelta(days=7)])
+        assert all(p.timestamp > datetime.now() - timedelta(days=7, minutes=1) for p in series)
+        assert series.summarize(datetime.now() - timedelta(days=365)).count == len(points)
+
+    def test_percentile_from_sketches(self):
+        """Test percentiles are estimated from merged partition sketches."""
+        series = MetricSeries("test.metric")
+        now = datetime.now()
+        for i in range(1, 1001):
+            series.append(Metric("test.metric", float(i), MetricType.TIMER, timestamp=now - timedelta(minutes=i)))
+
+        summary = series.summarize(now - timedelta(days=2))
+
+        assert summary.sketch.percentile(90) == pytest.approx(900, rel=0.05)
+
+
+class TestExecutionStatistics:
+    """Test streaming execution statistics."""
+
+    def test_streaming_aggregates_match_exact_values(self):
+        """Test Welford mean and variance match the exact statistics."""
+        times = [0.1 * (i % 17) + 0.05 * (i % 5) for i in range(1, 501)]
+        stats = SkillUsageStats(skill_id="test-skill")
+
+        for value in times:
+            stats.record(value, True)
+
+        assert stats.average_execution_time == pytest.approx(statistics.mean(times))
+        assert stats.execution_time_variance == pytest.approx(statistics.variance(times))
+        assert stats.min_execution_time == min(times)
+        assert stats.max_execution_time == max(times)
+
+    def test_percentiles_within_sketch_error(self):
+        """Test percentiles are estimated within the histogram's relative error."""
+        stats = SkillUsageStats(skill_id="test-skill")
+
+        for i in range(1, 1001):
+            stats.record(i / 1000, True)
+
+        percentiles = stats.get_percentiles((50, 99))
+        assert percentiles["p50"] == pytest.approx(0.5, rel=0.05)
+        assert percentiles["p99"] == pytest.approx(0.99, rel=0.05)
+
+    def test_rates_decay_over_time(self):
+        """Test execution and error rates favour recent executions."""
+        stats = SkillUsageStats(skill_id="test-skill", rate_half_life=60.0)
+
+        for i in range(10):
+            stats.record(1.0, False, "boom", timestamp=1000.0 + i)
+        for i in range(10):
+            stats.record(1.0, True, timestamp=1300.0 + i)
+
+        assert stats.error_rate == 50.0
+        assert stats.get_recent_error_rate(now=1310.0) < 5.0
+        rate = stats.get_execution_rate(now=1310.0)
+        assert rate > stats.get_execution_rate(now=1370.0) == pytest.approx(rate / 2)
+
+    def test_memory_is_bounded(self):
+        """Test history and feedback stay bounded for hot skills."""
+        stats = SkillUsageStats(skill_id="test-skill")
+
+        for i in range(5000):
+            stats.record(1.0, i % 2 == 0, "error")
+
+        assert stats.total_executions == 5000
+        assert len(stats.execution_history) <= 100
+        assert len(stats.user_feedback) <= 100
+        assert stats.to_dict()["execution_time_percentiles"]["p50"] == pytest.approx(1.0, rel=0.05)
+
+    @pytest.mark.asyncio
+    async def test_events_dispatched_off_critical_path(self, analytics, event_manager):
+        """Test metrics and events are dispatched in the background."""
+        for i in range(3):
+            await analytics.track_execution("test-skill", 1.0, i != 2, "Test error")
+
+        await analytics.flush()
+
+        assert event_manager.publish_event.call_count == 3
+        event_type = event_manager.publish_event.call_args.args[0]
+        assert event_type.value == "skill.executed"
+        assert event_manager.publish_event.call_args.kwargs["data"]["success"] is False
+        assert len(analytics.metrics["skill.execution.count"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_full_dispatch_queue_drops_executions(self, skill_manager, event_manager):
+        """Test a full dispatch queue never blocks tracking."""
+        analytics = SkillAnalytics(skill_manager, event_manager, max_pending_dispatches=2)
+
+        for _ in range(5):
+            await analytics.track_execution("test-skill", 1.0, True)
+        await analytics.flush()
+
+        assert analytics.skill_stats["test-skill"].total_executions == 5
+        assert event_manager.publish_event.call_count == 2
+        assert analytics.get_scoring_stats()["dispatches_dropped"] == 3
+
+
+class TestQualityScoring:
+    """Test memoized and batched quality scoring."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_skill_reuses_components(self, analytics):
+        """Test rescoring an unchanged skill runs no content analyzer."""
+        first = await analytics.score_skill(_skill())
+        second = await analytics.score_skill(_skill())
+
+        stats = analytics.get_scoring_stats()
+        assert stats["analyzers_run"] == 5
+        assert stats["analyzers_reused"] == 5
+        assert second.overall_score == first.overall_score
+        assert second.fingerprint == first.fingerprint
+
+    @pytest.mark.asyncio
+    async def test_only_affected_analyzers_rerun(self, analytics):
+        """Test a content change re-runs the analyzers that read content."""
+        await analytics.score_skill(_skill())
+        quality = await analytics.score_skill(_skill(content="import subprocess\n"))
+
+        stats = analytics.get_scoring_stats()
+        # Documentation does not read the content
+        assert stats["analyzers_run"] == 5 + 4
+        assert stats["analyzers_reused"] == 1
+        assert quality.security_score == 50.0
+
+    @pytest.mark.asyncio
+    async def test_analyzer_version_invalidates_component(self, analytics, monkeypatch):
+        """Test bumping an analyzer version re-runs only that analyzer."""
+        await analytics.score_skill(_skill())
+        monkeypatch.setitem(ANALYZER_VERSIONS, "security", ANALYZER_VERSIONS["security"] + 1)
+
+        await analytics.score_skill(_skill())
+
+        assert analytics.get_scoring_stats()["analyzers_run"] == 6
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_tracks_inputs(self, analytics):
+        """Test fingerprints match the score and change with its inputs."""
+        quality = await analytics.score_skill(_skill())
+
+        assert analytics.get_quality_fingerprint(_skill()) == quality.fingerprint
+        assert analytics.get_quality_fingerprint(_skill(readme="New")) != quality.fingerprint
+
+    @pytest.mark.asyncio
+    async def test_batch_scoring_in_process_pool(self, skill_manager, event_manager):
+        """Test batch scores computed in worker processes match single scores."""
+        batch = SkillAnalytics(skill_manager, event_manager, max_workers=2)
+        single = SkillAnalytics(skill_manager, event_manager)
+        skills = [_skill(f"s{i}", content="x = 1\n" * i) for i in range(6)]
+
+        try:
+            qualities = await batch.score_skills(skills)
+        finally:
+            batch.shutdown()
+
+        expected = [await single.score_skill(skill) for skill in skills]
+        assert [q.overall_score for q in qualities] == [q.overall_score for q in expected]
+        assert [q.fingerprint for q in qualities] == [q.fingerprint for q in expected]
+
+    @pytest.mark.asyncio
+    async def test_batch_scoring_reports_failures(self, analytics):
+        """Test a skill whose analysis fails gets no score."""
+        skills = [_skill("ok"), _skill("bad", readme=12345)]
+
+        qualities = await analytics.score_skills(skills, use_processes=False)
+
+        assert qualities[0] is not None
+        assert qualities[1] is None
+
+    @pytest.mark.asyncio
+    async def test_score_cache_is_bounded(self, skill_manager, event_manager):
+        """Test cached scores are evicted least recently used first."""
+        analytics = SkillAnalytics(skill_manager, event_manager, max_cached_scores=2)
+
+        for skill_id in ["a", "b", "c"]:
+            await analytics.score_skill(_skill(skill_id))
+
+        assert list(analytics.quality_scores) == ["b", "c"]
+        assert analytics.get_scoring_stats()["cached_components"] == 2
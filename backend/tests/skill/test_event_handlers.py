@@ -0,0 +1,139 @@
+"""Tests for skill event handlers.
+
+This module contains unit tests for the event handlers keeping the skill
+statistics summary table and search index current.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+import uuid
+
+from app.skill.event_manager import (
+    EventType,
+    SkillEvent,
+    SkillSearchEventHandler,
+    SkillStatsEventHandler,
+)
+
+
+class TestSkillStatsEventHandler:
+    """Test cases for SkillStatsEventHandler."""
+
+    @pytest.fixture
+    def stats_service(self):
+        """Create mock statistics service."""
+        service = MagicMock()
+        service.apply_stat_deltas = AsyncMock()
+        return service
+
+    @pytest.fixture
+    def handler(self, stats_service):
+        """Create statistics handler instance for testing."""
+        return SkillStatsEventHandler(stats_service)
+
+    def _event(self, event_type, **data):
+        return SkillEvent(
+            event_type=event_type,
+            event_id=str(uuid.uuid4()),
+            skill_id="skill-1",
+            data=data,
+        )
+
+    @pytest.mark.asyncio
+    async def test_created_counts_values(self, handler, stats_service):
+        """Test a created skill adds one to each of its values."""
+        await handler.handle(self._event(
+            EventType.SKILL_CREATED,
+            stats={"category": "cat-1", "tag": ["tag-1", "tag-2"], "content_type": "yaml"},
+        ))
+
+        stats_service.apply_stat_deltas.assert_awaited_once_with({
+            ("category", "cat-1"): 1,
+            ("tag", "tag-1"): 1,
+            ("tag", "tag-2"): 1,
+            ("content_type", "yaml"): 1,
+        })
+
+    @pytest.mark.asyncio
+    async def test_updated_applies_only_changes(self, handler, stats_service):
+        """Test an update moves counts between old and new values only."""
+        await handler.handle(self._event(
+            EventType.SKILL_UPDATED,
+            previous_stats={"category": "cat-1", "tag": ["tag-1"], "content_type": "yaml"},
+            stats={"category": "cat-2", "tag": ["tag-1"], "content_type": "yaml"},
+        ))
+
+        stats_service.apply_stat_deltas.assert_awaited_once_with({
+            ("category", "cat-1"): -1,
+            ("category", "cat-2"): 1,
+        })
+
+    @pytest.mark.asyncio
+    async def test_deleted_removes_values(self, handler, stats_service):
+        """Test a deleted skill subtracts its values, skipping missing ones."""
+        await handler.handle(self._event(
+            EventType.SKILL_DELETED,
+            stats={"category": None, "tag": ["tag-1"], "content_type": "json"},
+        ))
+
+        stats_service.apply_stat_deltas.assert_awaited_once_with({
+            ("tag", "tag-1"): -1,
+            ("content_type", "json"): -1,
+        })
+
+    @pytest.mark.asyncio
+    async def test_state_change_moves_data_version(self, handler, stats_service):
+        """Test state changes are applied without count deltas."""
+        await handler.handle(self._event(EventType.SKILL_ARCHIVED))
+
+        stats_service.apply_stat_deltas.assert_awaited_once_with({})
+
+    @pytest.mark.asyncio
+    async def test_ignores_other_events(self, handler, stats_service):
+        """Test unrelated events do not touch the statistics."""
+        await handler.handle(self._event(EventType.VERSION_CREATED, stats={"tag": ["tag-1"]}))
+
+        stats_service.apply_stat_deltas.assert_not_awaited()
+
+
+class TestSkillSearchEventHandler:
+    """Test cases for SkillSearchEventHandler."""
+
+    @pytest.fixture
+    def search_service(self):
+        """Create mock search service."""
+        service = MagicMock()
+        service.update_search_index = AsyncMock()
+        service.remove_from_search_index = AsyncMock()
+        return service
+
+    @pytest.fixture
+    def handler(self, search_service):
+        """Create search handler instance for testing."""
+        return SkillSearchEventHandler(search_service)
+
+    @pytest.mark.asyncio
+    async def test_created_and_updated_reindex(self, handler, search_service):
+        """Test created and updated skills are re-read into the index."""
+        for event_type in (EventType.SKILL_CREATED, EventType.SKILL_UPDATED):
+            await handler.handle(SkillEvent(event_type=event_type, event_id=str(uuid.uuid4()), skill_id="skill-1"))
+
+        assert search_service.update_search_index.await_count == 2
+        search_service.update_search_index.assert_awaited_with("skill-1")
+
+    @pytest.mark.asyncio
+    async def test_deleted_removes(self, handler, search_service):
+        """Test deleted skills are dropped from the index."""
+        await handler.handle(SkillEvent(event_type=EventType.SKILL_DELETED, event_id=str(uuid.uuid4()), skill_id="skill-1"))
+
+        search_service.remove_from_search_index.assert_awaited_once_with("skill-1")
+        search_service.update_search_index.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ignores_bulk_and_state_events(self, handler, search_service):
+        """Test events without a skill or indexed text are ignored."""
+        await handler.handle(SkillEvent(event_type=EventType.SKILL_UPDATED, event_id=str(uuid.uuid4())))
+        await handler.handle(SkillEvent(event_type=EventType.SKILL_ARCHIVED, event_id=str(uuid.uuid4()), skill_id="skill-1"))
+
+        search_service.update_search_index.assert_not_awaited()
+        search_service.remove_from_search_index.assert_not_awaited()
@@ -608,6 +608,34 @@ class TestSkillImporter:
         skill_files = list(export_dir.glob("*.yaml"))
         assert len(skill_files) > 0
 
+    @pytest.mark.asyncio
+    async def test_export_packed_skills(self, importer, temp_dir):
+        """Test exporting skills to packed segments with an offset index."""
+        # Create export config
+        config = ExportConfig(format=ExportFormat.PACKED)
+
+        # Export skills
+        result = await importer.export_skills(
+            ["skill1", "skill2"],
+            temp_dir / "export_packed",
+            config,
+        )
+        for task in list(importer.active_exports.values()):
+            await task
+
+        assert result is not None
+        assert result.exported_skills == 2
+
+        # Every skill is read back from its segment offset
+        export_dir = Path(result.file_path)
+        index = [json.loads(line) for line in (export_dir / "index.jsonl").read_text().splitlines()]
+        assert len(index) == 2
+        for entry in index:
+            with open(export_dir / entry["segment"], "rb") as segment:
+                segment.seek(entry["offset"])
+                skill = json.loads(segment.read(entry["size"]))
+            assert skill == {"id": "test-skill-1", "name": "Test Skill"}
+
     @pytest.mark.asyncio
     async def test_apply_field_mappings(self, importer):
         """Test applying field mappings."""
@@ -20,6 +20,7 @@ from backend.app.skill.schemas.skill_operations import (
     SkillBulkOperation,
 )
 from backend.app.skill.schemas.skill_creation import SkillCreationRequest
+from backend.app.skill.search import SearchPage
 
 
 class TestSkillManager:
@@ -282,6 +283,7 @@ class TestSkillManager:
         # Setup
         skill_model = Mock(spec=Skill)
         skill_model.id = sample_skill["id"]
+        skill_model.tags = []
 
         db_session.query.return_value.filter.return_value.first.return_value = skill_model
         db_session.commit.return_value = None
@@ -292,7 +294,27 @@ class TestSkillManager:
         # Verify
         assert result is True
         db_session.delete.assert_called_once_with(skill_model)
+        # The deletion, the statistics summary counts, then the data version
+        assert db_session.commit.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_skill_survives_stat_count_error(self, skill_manager, db_session, sample_skill):
+        """Test a failing summary count update does not fail a committed deletion."""
+        # Setup
+        skill_model = Mock(spec=Skill)
+        skill_model.id = sample_skill["id"]
+        skill_model.tags = []
+
+        db_session.query.return_value.filter.return_value.first.return_value = skill_model
+        db_session.execute.side_effect = IntegrityError("INSERT", {}, Exception("duplicate key"))
+
+        # Execute
+        result = await skill_manager.delete_skill(sample_skill["id"])
+
+        # Verify
+        assert result is True
         db_session.commit.assert_called_once()
+        db_session.rollback.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_delete_skill_not_found(self, skill_manager, db_session):
@@ -380,10 +402,9 @@ class TestSkillManager:
         """Test basic skill search."""
         # Setup
         search = SkillSearch(query="test")
-
-        db_session.query.return_value.filter.return_value.first.return_value = None
-        db_session.query.return_value.count.return_value = 1
-        db_session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
+        backend = Mock()
+        backend.search.return_value = SearchPage([], "next-cursor", 1500, True)
+        skill_manager._get_search_backend = Mock(return_value=backend)
 
         # Execute
         result = await skill_manager.search_skills(search)
@@ -391,6 +412,12 @@ class TestSkillManager:
         # Verify
         assert result is not None
         assert result.query == "test"
+        assert result.total == 1500
+        assert result.total_is_estimate is True
+        assert result.next_cursor == "next-cursor"
+        assert result.has_next is True
+        backend.search.assert_called_once()
+        backend.list_skills.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_search_skills_with_filters(self, skill_manager, db_session):
@@ -405,10 +432,9 @@ class TestSkillManager:
             query="test",
             filters=filters,
         )
-
-        db_session.query.return_value.filter.return_value.first.return_value = None
-        db_session.query.return_value.count.return_value = 0
-        db_session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
+        backend = Mock()
+        backend.search.return_value = SearchPage([], None, 0, False)
+        skill_manager._get_search_backend = Mock(return_value=backend)
 
         # Execute
         result = await skill_manager.search_skills(search)
@@ -417,6 +443,23 @@ class TestSkillManager:
         assert result is not None
         assert result.query == "test"
         assert result.filters_applied is not None
+        assert result.has_next is False
+
+    @pytest.mark.asyncio
+    async def test_search_skills_without_query_lists(self, skill_manager, db_session):
+        """Test searches without text list skills by cursor in sort order."""
+        search = SkillSearch(cursor="page-2-cursor", page_size=10)
+        backend = Mock()
+        backend.list_skills.return_value = SearchPage([], None, 12, False)
+        skill_manager._get_search_backend = Mock(return_value=backend)
+
+        result = await skill_manager.search_skills(search)
+
+        _, _, sort_by, descending, limit = backend.list_skills.call_args[0]
+        assert (sort_by, descending, limit) == ("updated_at", True, 10)
+        assert backend.list_skills.call_args[1] == {"cursor": "page-2-cursor", "skip": 0}
+        assert result.has_prev is True
+        backend.search.assert_not_called()
 
     # ================================
     # Test State Management
@@ -530,17 +573,31 @@ class TestSkillManager:
     @pytest.mark.asyncio
     async def test_get_skill_stats(self, skill_manager, db_session):
         """Test getting skill statistics."""
-        # Setup
-        db_session.query.return_value.filter.return_value.count.return_value = 10
-        db_session.query.return_value.filter.return_value.first.return_value = None
-        db_session.query.return_value.filter.return_value.first.return_value = None
-        db_session.query.return_value.filter.return_value.first.return_value = None
-        db_session.query.return_value.filter.return_value.first.return_value = None
-        db_session.query.return_value.filter.return_value.first.return_value = None
-
-        # Mock aggregate queries
-        db_session.query.return_value.scalar.return_value = 100
-        db_session.query.return_value.join.return_value.group_by.return_value.all.return_value = []
+        # Setup: data version, aggregate row, then summary rows
+        version_result = Mock()
+        version_result.scalar.return_value = 7
+        totals_result = Mock()
+        totals_result.one.return_value = Mock(
+            total_skills=10,
+            active_skills=4,
+            draft_skills=3,
+            deprecated_skills=2,
+            archived_skills=1,
+            total_downloads=100,
+            total_views=200,
+            total_likes=30,
+            avg_rating=4.256,
+            total_ratings=12,
+            avg_quality_score=80.0,
+            avg_completeness=0.5,
+        )
+        summary_result = Mock()
+        summary_result.all.return_value = [
+            ("category", "cat-1", 6, "Tools"),
+            ("tag", "tag-1", 5, "python"),
+            ("content_type", "yaml", 10, None),
+        ]
+        db_session.execute.side_effect = [version_result, totals_result, summary_result]
 
         # Execute
         result = await skill_manager.get_skill_stats()
@@ -548,6 +605,51 @@ class TestSkillManager:
         # Verify
         assert result is not None
         assert result.total_skills == 10
+        assert result.active_skills == 4
+        assert result.avg_rating == 4.26
+        assert result.categories == [{"name": "Tools", "count": 6}]
+        assert result.top_tags == [{"name": "python", "count": 5}]
+        assert result.content_types == [{"type": "yaml", "count": 10}]
+        assert db_session.execute.call_count == 3
+        db_session.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_skill_stats_cached_per_data_version(self, skill_manager, db_session):
+        """Test statistics are served from cache until the data version moves."""
+        version_result = Mock()
+        version_result.scalar.return_value = 1
+        with patch.object(skill_manager, "_compute_skill_stats") as compute:
+            db_session.execute.return_value = version_result
+
+            first = await skill_manager.get_skill_stats()
+            second = await skill_manager.get_skill_stats()
+            assert first is second
+            assert compute.call_count == 1
+
+            version_result.scalar.return_value = 2
+            await skill_manager.get_skill_stats()
+            assert compute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_apply_stat_deltas_bumps_version(self, skill_manager, db_session):
+        """Test count deltas update the summary table and the data version."""
+        db_session.execute.return_value.rowcount = 1
+
+        await skill_manager.apply_stat_deltas({("category", "cat-1"): 1, ("tag", "tag-1"): -1})
+
+        # One update per delta, then the version row after the deltas commit
+        assert db_session.execute.call_count == 3
+        assert db_session.commit.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_apply_empty_stat_deltas_only_bumps_version(self, skill_manager, db_session):
+        """Test status-only changes just move the data version."""
+        db_session.execute.return_value.rowcount = 1
+
+        await skill_manager.apply_stat_deltas({})
+
+        assert db_session.execute.call_count == 1
+        db_session.commit.assert_called_once()
 
     # ================================
     # Test Bulk Operations
@@ -0,0 +1,171 @@
+"""Tests for skill search backends.
+
+This module contains unit tests for the in-process skill search backend:
+loading, incremental updates, filtered search-after paging and count
+estimates, and for backend selection.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+from app.skill.search import (
+    InMemorySkillSearchBackend,
+    PostgresSkillSearchBackend,
+    get_search_backend,
+)
+
+
+def _row(skill_id, name, description=None, keywords=None):
+    return SimpleNamespace(id=skill_id, name=name, description=description, keywords=keywords)
+
+
+class _FilteredQuery:
+    """Stand-in for a filtered skill query resolving IDs to skills."""
+
+    def __init__(self, skills, allowed=None):
+        self.skills = skills
+        self.allowed = allowed
+
+    def filter(self, clause):
+        ids = clause.right.value
+        return Mock(all=Mock(return_value=[
+            self.skills[skill_id]
+            for skill_id in ids
+            if skill_id in self.skills and (self.allowed is None or skill_id in self.allowed)
+        ]))
+
+
+@pytest.fixture
+def rows():
+    """Create skill rows; every skill mentions python."""
+    return [
+        _row(f"skill-{i:02d}", f"Tool {i}", "python helper " + "extra " * (i % 5), ["cli"] if i % 3 else ["python"])
+        for i in range(30)
+    ]
+
+
+@pytest.fixture
+def db(rows):
+    """Create mock session returning the skill rows."""
+    session = MagicMock()
+    session.execute.return_value = rows
+    return session
+
+
+@pytest.fixture
+def backend(db):
+    """Create loaded in-process backend."""
+    backend = InMemorySkillSearchBackend()
+    backend.rebuild(db)
+    return backend
+
+
+@pytest.fixture
+def skills(rows):
+    """Create skill objects keyed by ID."""
+    return {row.id: SimpleNamespace(id=row.id, name=row.name) for row in rows}
+
+
+class TestInMemorySkillSearchBackend:
+    """Test suite for InMemorySkillSearchBackend."""
+
+    def test_rebuild_loads_all_skills(self, backend):
+        """Test the index is loaded from the skills table."""
+        assert backend.loaded is True
+        assert len(backend.index) == 30
+
+    def test_cursor_pages_cover_all_matches(self, backend, db, skills):
+        """Test cursors page through every match once, in rank order."""
+        query = _FilteredQuery(skills)
+
+        seen = []
+        cursor = None
+        while True:
+            page = backend.search(db, query, "python", 7, cursor=cursor)
+            seen.extend(skill.id for skill in page.skills)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        first = backend.search(db, query, "python", 100)
+        assert seen == [skill.id for skill in first.skills]
+        assert first.total == 30
+        assert first.total_is_estimate is False
+
+    def test_offset_pages_match_cursor_pages(self, backend, db, skills):
+        """Test page numbers without a cursor skip earlier matches."""
+        query = _FilteredQuery(skills)
+
+        first = backend.search(db, query, "python", 5)
+        second = backend.search(db, query, "python", 5, cursor=first.next_cursor)
+
+        assert backend.search(db, query, "python", 5, skip=5).skills == second.skills
+
+    def test_filters_scale_estimated_total(self, backend, db, skills):
+        """Test filtered-out hits are skipped and the total is estimated."""
+        allowed = {skill_id for i, skill_id in enumerate(sorted(skills)) if i % 2 == 0}
+        query = _FilteredQuery(skills, allowed)
+
+        page = backend.search(db, query, "python", 5)
+        assert len(page.skills) == 5
+        assert all(skill.id in allowed for skill in page.skills)
+
+        later = backend.search(db, query, "python", 5, cursor=page.next_cursor)
+        assert later.total_is_estimate is True
+        assert 0 < later.total <= 30
+
+    def test_incremental_updates(self, backend, db, skills):
+        """Test updated skills are re-read and deleted skills dropped."""
+        db.execute.return_value = Mock(first=Mock(return_value=_row("skill-01", "Zebra Renderer")))
+        backend.index_skill(db, "skill-01")
+        backend.remove_skill("skill-02")
+
+        query = _FilteredQuery(skills)
+        assert [skill.id for skill in backend.search(db, query, "zebra", 10).skills] == ["skill-01"]
+        assert backend.index.search("tool").total == 28
+
+    def test_updates_before_load_are_skipped(self, db):
+        """Test an unloaded index ignores updates and loads on first search."""
+        backend = InMemorySkillSearchBackend()
+        backend.index_skill(db, "skill-01")
+        db.execute.assert_not_called()
+
+        backend.search(db, _FilteredQuery({}), "python", 5)
+        assert backend.loaded is True
+
+    def test_rejects_foreign_cursor(self, backend, db, skills):
+        """Test cursors of another ordering are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            backend.search(db, _FilteredQuery(skills), "python", 5, cursor="bm90LWEtbGlzdA")
+
+
+class TestSearchBackendSelection:
+    """Test suite for get_search_backend."""
+
+    def _session(self, dialect, url):
+        session = Mock()
+        session.get_bind.return_value = SimpleNamespace(dialect=SimpleNamespace(name=dialect), url=url)
+        return session
+
+    def test_auto_selects_by_dialect(self):
+        """Test PostgreSQL uses the database indexes and others the in-process index."""
+        postgres = get_search_backend(self._session("postgresql", "postgresql://db/a"), "auto")
+        sqlite = get_search_backend(self._session("sqlite", "sqlite:///a.db"), "auto")
+
+        assert isinstance(postgres, PostgresSkillSearchBackend)
+        assert isinstance(sqlite, InMemorySkillSearchBackend)
+
+    def test_backend_shared_per_database(self):
+        """Test sessions of one database share the in-process index."""
+        first = get_search_backend(self._session("sqlite", "sqlite:///shared.db"), "memory")
+        second = get_search_backend(self._session("sqlite", "sqlite:///shared.db"), "memory")
+        other = get_search_backend(self._session("sqlite", "sqlite:///other.db"), "memory")
+
+        assert first is second
+        assert first is not other
+
+    def test_unknown_backend(self):
+        """Test unsupported backend names are rejected."""
+        with pytest.raises(ValueError, match="Unsupported search backend"):
+            get_search_backend(self._session("sqlite", "sqlite://"), "elastic")
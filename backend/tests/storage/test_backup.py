@@ -4,10 +4,15 @@ This module contains unit and integration tests for the BackupManager class,
 testing all backup operations including creation, restore, verification, and scheduling.
 """
 
+import asyncio
+import hashlib
 import io
 import json
 import pytest
+from collections import namedtuple
+from contextlib import nullcontext
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from uuid import uuid4, UUID
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from sqlalchemy.orm import Session
@@ -22,6 +27,7 @@ from backend.app.storage.backup import (
     BackupVerificationError,
     BackupNotFoundError,
 )
+from backend.app.storage import backup as backup_module
 from backend.app.storage.manager import SkillStorageManager
 from backend.app.storage.client import MinIOClient
 from backend.app.storage.models import Skill, SkillFile
@@ -129,7 +135,7 @@ class TestBackupManager:
     def mock_db_session(self):
         """Create mock database session."""
         session = Mock(spec=Session)
-        session.query.return_value.filter.return_value.all.return_value = []
+        session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = []
         session.add = Mock()
         session.commit = Mock()
         session.rollback = Mock()
@@ -222,7 +228,7 @@ class TestBackupManager:
         mock_minio_client.bucket_exists.return_value = True
 
         # Mock query to return files
-        mock_db_session.query.return_value.filter.return_value.all.return_value = test_files
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = test_files
 
         # Mock MinIO operations
         mock_minio_client.operation_context.return_value.__enter__ = Mock()
@@ -251,7 +257,7 @@ class TestBackupManager:
         mock_minio_client.bucket_exists.return_value = True
 
         # Mock query to return no files
-        mock_db_session.query.return_value.filter.return_value.all.return_value = []
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = []
 
         # Execute
         backup_id = await backup_manager.create_backup(skill_id=skill_id)
@@ -269,7 +275,7 @@ class TestBackupManager:
         mock_minio_client.bucket_exists.return_value = True
 
         # Mock query to return files
-        mock_db_session.query.return_value.filter.return_value.all.return_value = test_files
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = test_files
 
         # Mock MinIO operations
         mock_minio_client.operation_context.return_value.__enter__ = Mock()
@@ -295,7 +301,7 @@ class TestBackupManager:
         mock_minio_client.bucket_exists.return_value = True
 
         # Mock query to return files
-        mock_db_session.query.return_value.filter.return_value.all.return_value = test_files
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = test_files
 
         # Mock MinIO operations
         mock_minio_client.operation_context.return_value.__enter__ = Mock()
@@ -361,7 +367,7 @@ class TestBackupManager:
         }
 
         # Mock MinIO operations
-        mock_minio_client.get_object.return_value = io.BytesIO(json.dumps(manifest).encode("utf-8"))
+        mock_minio_client.get_object.side_effect = lambda **kwargs: io.BytesIO(json.dumps(manifest).encode("utf-8"))
         mock_minio_client.stat_object.return_value = Mock()
         mock_storage_manager.upload_file.return_value = Mock(success=True)
 
@@ -410,7 +416,7 @@ class TestBackupManager:
         }
 
         # Mock MinIO operations
-        mock_minio_client.get_object.return_value = io.BytesIO(json.dumps(manifest).encode("utf-8"))
+        mock_minio_client.get_object.side_effect = lambda **kwargs: io.BytesIO(json.dumps(manifest).encode("utf-8"))
         mock_minio_client.stat_object.return_value = Mock()
         mock_storage_manager.upload_file.return_value = Mock(success=True)
 
@@ -715,7 +721,7 @@ class TestBackupManager:
     async def test_get_files_to_backup_full(self, backup_manager, mock_db_session, test_skill, test_files):
         """Test get files for full backup."""
         # Setup
-        mock_db_session.query.return_value.filter.return_value.all.return_value = test_files
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = test_files
 
         # Execute
         files = await backup_manager._get_files_to_backup(test_skill.id, "full")
@@ -728,7 +734,7 @@ class TestBackupManager:
     async def test_get_files_to_backup_incremental(self, backup_manager, mock_db_session, test_skill, test_files):
         """Test get files for incremental backup."""
         # Setup
-        mock_db_session.query.return_value.filter.return_value.all.return_value = test_files
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = test_files
 
         # Execute
         files = await backup_manager._get_files_to_backup(test_skill.id, "incremental")
@@ -740,7 +746,7 @@ class TestBackupManager:
     async def test_get_files_to_backup_no_skill(self, backup_manager, mock_db_session, test_files):
         """Test get files for backup without skill filter."""
         # Setup
-        mock_db_session.query.return_value.all.return_value = test_files
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = test_files
 
         # Execute
         files = await backup_manager._get_files_to_backup(None, "full")
@@ -1000,7 +1006,7 @@ class TestBackupManager:
         mock_minio_client.bucket_exists.return_value = True
 
         # Mock query to return files
-        mock_db_session.query.return_value.filter.return_value.all.return_value = test_files
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = test_files
 
         # Mock MinIO operations
         mock_minio_client.operation_context.return_value.__enter__ = Mock()
@@ -1073,7 +1079,7 @@ class TestBackupManager:
         mock_minio_client.bucket_exists.return_value = True
 
         # Mock query to return files
-        mock_db_session.query.return_value.filter.return_value.all.return_value = test_files
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = test_files
 
         # Mock MinIO operations
         mock_minio_client.operation_context.return_value.__enter__ = Mock()
@@ -1130,3 +1136,582 @@ class TestBackupManager:
         assert backup_manager.backup_prefix == "custom"
         assert backup_manager.max_concurrent_backups == 10
         assert backup_manager.verification_enabled is False
+
+
+_CopySource = namedtuple("_CopySource", ["bucket_name", "object_name"])
+
+
+class InMemoryMinIOClient:
+    """In-memory stand-in for MinIOClient."""
+
+    def __init__(self):
+        self.objects = {}
+        self.server_side_copies = 0
+        self.copy_error = None
+        self.puts = []
+        self.range_reads = []
+
+    def operation_context(self, operation_name):
+        return nullcontext()
+
+    def bucket_exists(self, bucket_name):
+        return True
+
+    def put_object(self, bucket_name, object_name, data, length, content_type=None, **kwargs):
+        content = data if isinstance(data, bytes) else data.read(length)
+        self.objects[(bucket_name, object_name)] = bytes(content)
+        self.puts.append(object_name)
+        return {"object_name": object_name, "etag": "etag", "size": len(content)}
+
+    def get_object(self, bucket_name, object_name, offset=0, length=0, **kwargs):
+        if (bucket_name, object_name) not in self.objects:
+            raise Exception(f"Object {object_name} not found")
+        content = self.objects[(bucket_name, object_name)]
+        if length:
+            self.range_reads.append((object_name, offset, length))
+            content = content[offset:offset + length]
+        return io.BytesIO(content)
+
+    def copy_object(self, bucket_name, object_name, source, **kwargs):
+        if self.copy_error:
+            raise self.copy_error
+        self.objects[(bucket_name, object_name)] = self.objects[(source.bucket_name, source.object_name)]
+        self.server_side_copies += 1
+        return {"etag": "etag", "size": len(self.objects[(bucket_name, object_name)])}
+
+    def stat_object(self, bucket_name, object_name, **kwargs):
+        if (bucket_name, object_name) not in self.objects:
+            raise Exception(f"Object {object_name} not found")
+        return {"size": len(self.objects[(bucket_name, object_name)])}
+
+    def remove_object(self, bucket_name, object_name, **kwargs):
+        self.objects.pop((bucket_name, object_name), None)
+        return True
+
+    def list_objects(self, bucket_name, prefix="", **kwargs):
+        for bucket, object_name in sorted(self.objects):
+            if bucket == bucket_name and object_name.startswith(prefix):
+                yield {"object_name": object_name, "size": len(self.objects[(bucket, object_name)])}
+
+
+class TestIncrementalBackup:
+    """Test suite for watermark-based incremental and streaming backups."""
+
+    @pytest.fixture
+    def minio(self, monkeypatch):
+        """Create in-memory MinIO client."""
+        monkeypatch.setattr(backup_module, "CopySource", _CopySource)
+        return InMemoryMinIOClient()
+
+    @pytest.fixture
+    def rows(self):
+        """Create skill file rows returned by the database."""
+        return []
+
+    @pytest.fixture
+    def db_session(self, rows):
+        """Create database session streaming the rows."""
+        session = Mock(spec=Session)
+        session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.side_effect = lambda: list(rows)
+        return session
+
+    @pytest.fixture
+    def manager(self, minio, db_session):
+        """Create BackupManager with stubbed blob references."""
+        manager = BackupManager(
+            minio_client=minio,
+            storage_manager=Mock(spec=SkillStorageManager),
+            database_session=db_session,
+            max_concurrent_backups=2,
+        )
+        manager.blob_store.adopt = AsyncMock()
+        return manager
+
+    @staticmethod
+    def _row(skill_id, name, checksum):
+        return SimpleNamespace(
+            id=uuid4(),
+            skill_id=skill_id,
+            file_path=name,
+            object_name=f"skills/{skill_id}/{name}",
+            file_size=10,
+            checksum=checksum,
+            content_type="text/plain",
+            updated_at=datetime.utcnow(),
+        )
+
+    def _catalog(self, minio, manager, skill_id):
+        lines = minio.objects[(manager.backup_bucket, manager._get_catalog_object_name(skill_id))]
+        header, *entries = [json.loads(line) for line in lines.splitlines()]
+        return header, {entry["file_id"]: entry["checksum"] for entry in entries}
+
+    def test_scan_reads_keyset_pages(self, manager, db_session, rows):
+        """Test files are read in pages keyed on the file ID, not through one open cursor."""
+        skill_id = uuid4()
+        rows.extend(self._row(skill_id, f"{i}.txt", f"c{i}") for i in range(5))
+        scoped = db_session.query.return_value.filter.return_value
+        scoped.order_by.return_value.limit.return_value.all.side_effect = None
+        scoped.order_by.return_value.limit.return_value.all.return_value = rows[:2]
+        scoped.filter.return_value.order_by.return_value.limit.return_value.all.side_effect = [
+            rows[2:4],
+            rows[4:],
+        ]
+
+        files = list(manager._iter_files_to_backup(skill_id, batch_size=2))
+
+        assert [f["file_id"] for f in files] == [str(row.id) for row in rows]
+        keys = [call.args[0].right.value for call in scoped.filter.call_args_list]
+        assert keys == [rows[1].id, rows[3].id]
+
+    @pytest.mark.asyncio
+    async def test_incremental_skips_unchanged_files(self, manager, minio, db_session, rows):
+        """Test incremental backups start at the watermark and skip unchanged content."""
+        skill_id = uuid4()
+        rows.extend([self._row(skill_id, "a.txt", "c1"), self._row(skill_id, "b.txt", "c2")])
+
+        full_id = await manager.create_backup(skill_id=skill_id, backup_type="full")
+        header, checksums = self._catalog(minio, manager, skill_id)
+        assert header["backup_id"] == full_id
+        assert set(checksums.values()) == {"c1", "c2"}
+
+        rows[1].checksum = "c3"
+        rows.append(self._row(skill_id, "c.txt", "c4"))
+        incremental_id = await manager.create_backup(skill_id=skill_id, backup_type="incremental")
+
+        # The scan is bounded by the skill and the previous watermark
+        assert len(db_session.query.return_value.filter.call_args.args) == 2
+
+        manifest = await manager._get_backup_manifest(incremental_id)
+        assert sorted(f["file_path"] for f in manifest["files"]) == ["b.txt", "c.txt"]
+        assert manifest["base_backup_id"] == full_id
+        assert manifest["skipped_unchanged"] == 1
+        assert manager.stats["files_skipped_unchanged"] == 1
+
+        _, checksums = self._catalog(minio, manager, skill_id)
+        assert set(checksums.values()) == {"c1", "c3", "c4"}
+
+    @pytest.mark.asyncio
+    async def test_manifest_is_json_lines(self, manager, minio, rows):
+        """Test the file list is stored as JSON Lines next to a summary manifest."""
+        skill_id = uuid4()
+        rows.extend(self._row(skill_id, f"f{i}.txt", None) for i in range(5))
+        for row in rows:
+            minio.objects[(manager.source_bucket, row.object_name)] = b"0123456789"
+
+        backup_id = await manager.create_backup(skill_id=skill_id)
+
+        summary = json.loads(minio.objects[(manager.backup_bucket, f"backups/{backup_id}/manifest.json")])
+        lines = minio.objects[(manager.backup_bucket, summary["files_object"])].splitlines()
+        assert "files" not in summary
+        assert summary["file_count"] == len(lines) == 5
+        assert summary["total_size"] == 50
+        assert minio.server_side_copies == 5
+
+        backups = await manager.list_backups()
+        assert [b["backup_id"] for b in backups] == [backup_id]
+
+    @pytest.mark.asyncio
+    async def test_copy_falls_back_to_streaming(self, manager, minio, rows):
+        """Test files are streamed through when server-side copy fails."""
+        skill_id = uuid4()
+        rows.append(self._row(skill_id, "a.txt", None))
+        minio.objects[(manager.source_bucket, rows[0].object_name)] = b"0123456789"
+        minio.copy_error = Exception("copy not supported")
+
+        backup_id = await manager.create_backup(skill_id=skill_id)
+
+        backup_object = manager._get_backup_object_name(backup_id, "files/a.txt")
+        assert minio.objects[(manager.backup_bucket, backup_object)] == b"0123456789"
+
+    @pytest.mark.asyncio
+    async def test_failed_files_keep_watermark(self, manager, minio, rows):
+        """Test a file that failed to copy is retried by the next incremental backup."""
+        skill_id = uuid4()
+        rows.extend([self._row(skill_id, "ok.txt", "c1"), self._row(skill_id, "bad.txt", "c2")])
+
+        async def adopt(object_name, checksum, size, **kwargs):
+            if checksum == "c2":
+                raise Exception("copy failed")
+
+        manager.blob_store.adopt = AsyncMock(side_effect=adopt)
+        await manager.create_backup(skill_id=skill_id, backup_type="full")
+
+        header, checksums = self._catalog(minio, manager, skill_id)
+        assert header["watermark"] is None
+        assert list(checksums.values()) == ["c1"]
+
+        manager.blob_store.adopt = AsyncMock()
+        backup_id = await manager.create_backup(skill_id=skill_id, backup_type="incremental")
+
+        manifest = await manager._get_backup_manifest(backup_id)
+        assert [f["file_path"] for f in manifest["files"]] == ["bad.txt"]
+        header, _ = self._catalog(minio, manager, skill_id)
+        assert header["watermark"] is not None
+
+    @pytest.mark.asyncio
+    async def test_slow_file_does_not_block_window(self, manager):
+        """Test workers pick up new files while a slow one is still copying."""
+        running = 0
+        peak = 0
+        finished = []
+
+        async def upload(backup_id, file_info):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.2 if file_info["file_path"] == "slow" else 0.01)
+            running -= 1
+            finished.append(file_info["file_path"])
+            return file_info
+
+        manager._upload_single_backup_file = upload
+        files = [{"file_path": "slow"}] + [{"file_path": f"fast{i}"} for i in range(4)]
+
+        results = [result async for _, result in manager._iter_uploaded_backup_files("backup", files)]
+
+        assert len(results) == 5
+        assert finished[-1] == "slow"
+        assert peak == 2
+
+
+class InMemoryTaskTracker:
+    """In-memory stand-in for the progress TaskTracker."""
+
+    def __init__(self):
+        self.tasks = {}
+        self.updates = []
+
+    async def get_task(self, task_id):
+        if task_id not in self.tasks:
+            raise KeyError(task_id)
+        return self.tasks[task_id]
+
+    async def create_task(self, request):
+        self.tasks[request.task_id] = {
+            "task_id": request.task_id,
+            "task_type": request.task_type,
+            "status": "pending",
+            "progress": 0.0,
+            "metadata": dict(request.metadata),
+        }
+        return self.tasks[request.task_id]
+
+    async def update_task_progress(self, request):
+        task = self.tasks[request.task_id]
+        task.update(progress=request.progress, status=request.status or task["status"])
+        task["metadata"].update(request.metadata)
+        self.updates.append(request)
+        return task
+
+
+class TestBackupJobs:
+    """Test suite for resumable parallel verify and restore jobs."""
+
+    @pytest.fixture
+    def minio(self):
+        """Create in-memory MinIO client."""
+        return InMemoryMinIOClient()
+
+    @pytest.fixture
+    def storage_manager(self):
+        """Create storage manager recording restored files."""
+        manager = Mock(spec=SkillStorageManager)
+        manager.restored = []
+
+        async def upload_file(request, file_data):
+            manager.restored.append((request.skill_id, request.file_path, file_data.read()))
+            return SimpleNamespace(success=True, error=None)
+
+        manager.upload_file = AsyncMock(side_effect=upload_file)
+        return manager
+
+    @pytest.fixture
+    def manager(self, minio, storage_manager):
+        """Create BackupManager working on the in-memory client."""
+        return BackupManager(
+            minio_client=minio,
+            storage_manager=storage_manager,
+            database_session=Mock(spec=Session),
+            max_concurrent_backups=3,
+        )
+
+    @pytest.fixture
+    def skill_id(self):
+        """Create skill ID."""
+        return uuid4()
+
+    @pytest.fixture
+    def backup_id(self, minio, manager, skill_id):
+        """Create a backup of ten files with a JSON Lines manifest."""
+        backup_id = str(uuid4())
+        lines = []
+        for i in range(10):
+            content = f"content of file {i}".encode("utf-8")
+            entry = {
+                "file_id": str(uuid4()),
+                "skill_id": str(skill_id),
+                "file_path": f"file{i}.txt",
+                "file_size": len(content),
+                "checksum": hashlib.sha256(content).hexdigest(),
+                "content_type": "text/plain",
+            }
+            object_name = manager._get_backup_file_object_name(backup_id, entry)
+            minio.objects[(manager.backup_bucket, object_name)] = content
+            lines.append(json.dumps(entry))
+
+        files = ("\n".join(lines) + "\n").encode("utf-8")
+        files_object = manager._get_backup_object_name(backup_id, "manifest.jsonl")
+        minio.objects[(manager.backup_bucket, files_object)] = files
+        manifest = {
+            "backup_id": backup_id,
+            "backup_type": "full",
+            "created_at": datetime.utcnow().isoformat(),
+            "file_count": 10,
+            "skills": [str(skill_id)],
+            "files_object": files_object,
+            "files_checksum": hashlib.sha256(files).hexdigest(),
+        }
+        minio.objects[(manager.backup_bucket, f"backups/{backup_id}/manifest.json")] = json.dumps(manifest).encode("utf-8")
+        return backup_id
+
+    def _corrupt(self, minio, manager, backup_id, file_path):
+        object_name = manager._get_backup_object_name(backup_id, f"files/{file_path}")
+        minio.objects[(manager.backup_bucket, object_name)] = b"corrupted"
+
+    def _checkpoint(self, minio, manager, backup_id, job_id):
+        data = minio.objects.get((manager.backup_bucket, manager._get_job_object_name(backup_id, job_id)))
+        return json.loads(data) if data is not None else None
+
+    @pytest.mark.asyncio
+    async def test_verify_streams_checksums(self, manager, minio, backup_id):
+        """Test verification checks file content against the manifest checksums."""
+        self._corrupt(minio, manager, backup_id, "file4.txt")
+
+        result = await manager.verify_backup(backup_id)
+
+        assert result["manifest_verified"] is True
+        assert result["checksum_verified"] is True
+        assert result["files_verified"] is False
+        assert result["overall_status"] == "failed"
+        assert result["verified_file_count"] == 9
+        assert result["failed_files"] == ["file4.txt"]
+
+        # The failed file is kept for the next run
+        checkpoint = self._checkpoint(minio, manager, backup_id, result["job_id"])
+        assert checkpoint["failed"] == [4]
+        assert checkpoint["position"] == 10
+
+    @pytest.mark.asyncio
+    async def test_verify_resume_only_retries_failed_files(self, manager, minio, backup_id):
+        """Test a resumed verification re-reads only the files that failed."""
+        object_name = manager._get_backup_object_name(backup_id, "files/file4.txt")
+        content = minio.objects[(manager.backup_bucket, object_name)]
+        self._corrupt(minio, manager, backup_id, "file4.txt")
+        first = await manager.verify_backup(backup_id)
+
+        minio.objects[(manager.backup_bucket, object_name)] = content
+        reads = []
+        get_object = minio.get_object
+        minio.get_object = lambda bucket_name, object_name, **kwargs: (
+            reads.append(object_name) or get_object(bucket_name, object_name)
+        )
+        second = await manager.verify_backup(backup_id)
+
+        assert second["job_id"] == first["job_id"]
+        assert second["resumed"] is True
+        assert second["overall_status"] == "passed"
+        assert second["verified_file_count"] == 10
+        assert [name for name in reads if "/files_" in name] == [object_name]
+        assert self._checkpoint(minio, manager, backup_id, second["job_id"]) is None
+        assert manager.stats["jobs_resumed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interrupted_restore_resumes(self, manager, minio, storage_manager, backup_id, skill_id, monkeypatch):
+        """Test an interrupted restore continues where it stopped."""
+        monkeypatch.setattr(backup_module, "CHECKPOINT_INTERVAL_FILES", 1)
+        upload_file = storage_manager.upload_file.side_effect
+
+        async def stalling_upload(request, file_data):
+            if len(storage_manager.restored) >= 4:
+                await asyncio.Event().wait()
+            return await upload_file(request, file_data)
+
+        storage_manager.upload_file.side_effect = stalling_upload
+        task = asyncio.create_task(manager.restore_backup(backup_id))
+        while len(storage_manager.restored) < 4:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        job_id = manager._get_job_id("restore", backup_id, None, None)
+        assert self._checkpoint(minio, manager, backup_id, job_id)["completed"] == 4
+
+        storage_manager.upload_file.side_effect = upload_file
+        assert await manager.restore_backup(backup_id) is True
+
+        paths = [path for _, path, _ in storage_manager.restored]
+        assert sorted(paths) == sorted(f"file{i}.txt" for i in range(10))
+        assert {restored_skill for restored_skill, _, _ in storage_manager.restored} == {skill_id}
+        assert self._checkpoint(minio, manager, backup_id, job_id) is None
+
+    @pytest.mark.asyncio
+    async def test_restore_rejects_corrupt_file(self, manager, minio, storage_manager, backup_id):
+        """Test a file failing its checksum is not restored and fails the job."""
+        self._corrupt(minio, manager, backup_id, "file7.txt")
+        target_skill_id = uuid4()
+
+        with pytest.raises(BackupRestoreError, match="1 files could not be restored"):
+            await manager.restore_backup(backup_id, target_skill_id=target_skill_id)
+
+        paths = [path for _, path, _ in storage_manager.restored]
+        assert len(paths) == 9
+        assert "file7.txt" not in paths
+        assert {restored_skill for restored_skill, _, _ in storage_manager.restored} == {target_skill_id}
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_to_task_tracker(self, minio, storage_manager, backup_id):
+        """Test jobs report throughput and ETA through the TaskTracker."""
+        tracker = InMemoryTaskTracker()
+        manager = BackupManager(
+            minio_client=minio,
+            storage_manager=storage_manager,
+            database_session=Mock(spec=Session),
+            task_tracker=tracker,
+        )
+
+        result = await manager.verify_backup(backup_id)
+
+        task = await tracker.get_task(result["job_id"])
+        assert task["task_type"] == "backup_verify"
+        assert task["status"] == "completed"
+        assert task["progress"] == 100.0
+        assert task["metadata"]["completed"] == 10
+        assert task["metadata"]["total"] == 10
+        assert task["metadata"]["files_per_second"] > 0
+        assert "eta_seconds" in task["metadata"]
+        assert tracker.updates[0].status == "running"
+
+
+class TestPackedBackup:
+    """Test suite for backups packing small files into segments."""
+
+    @pytest.fixture
+    def minio(self, monkeypatch):
+        """Create in-memory MinIO client."""
+        monkeypatch.setattr(backup_module, "CopySource", _CopySource)
+        return InMemoryMinIOClient()
+
+    @pytest.fixture
+    def skill_id(self):
+        """Create skill ID."""
+        return uuid4()
+
+    @pytest.fixture
+    def rows(self, minio, skill_id):
+        """Create ten small files and one large file in the source bucket."""
+        rows = []
+        for i in range(11):
+            content = f"{i:02d}".encode("utf-8") * (40 if i == 10 else 10)
+            row = SimpleNamespace(
+                id=uuid4(),
+                skill_id=skill_id,
+                file_path=f"dir/file{i}.txt",
+                object_name=f"skills/{skill_id}/dir/file{i}.txt",
+                file_size=len(content),
+                checksum=None,
+                content_type="text/plain",
+                updated_at=datetime.utcnow(),
+            )
+            minio.objects[("skillseekers-skills", row.object_name)] = content
+            rows.append(row)
+        return rows
+
+    @pytest.fixture
+    def storage_manager(self):
+        """Create storage manager recording restored files."""
+        manager = Mock(spec=SkillStorageManager)
+        manager.restored = {}
+
+        async def upload_file(request, file_data):
+            manager.restored[request.file_path] = file_data.read()
+            return SimpleNamespace(success=True, error=None)
+
+        manager.upload_file = AsyncMock(side_effect=upload_file)
+        return manager
+
+    @pytest.fixture
+    def manager(self, minio, rows, storage_manager, request):
+        """Create BackupManager packing files of up to 50 bytes into 100-byte segments."""
+        session = Mock(spec=Session)
+        session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.side_effect = lambda: list(rows)
+        return BackupManager(
+            minio_client=minio,
+            storage_manager=storage_manager,
+            database_session=session,
+            max_concurrent_backups=2,
+            packed=True,
+            pack_format=getattr(request, "param", "tar"),
+            segment_size=100,
+            pack_threshold=50,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("manager", ["tar", "zip"], indirect=True)
+    async def test_small_files_are_packed(self, manager, minio, rows):
+        """Test small files go into segments written with one PUT each."""
+        backup_id = await manager.create_backup()
+
+        manifest = await manager._get_backup_manifest(backup_id)
+        packed = [f for f in manifest["files"] if f.get("segment")]
+        segments = sorted({f["segment"] for f in packed})
+
+        assert len(packed) == 10
+        assert manifest["segment_count"] == len(segments) == 2
+        assert manifest["pack_format"] == manager.pack_format
+        assert sum(1 for name in minio.puts if name in segments) == 2
+        assert manager.stats["files_packed"] == 10
+
+        # The large file is copied on its own
+        large = manager._get_backup_object_name(backup_id, "files/dir/file10.txt")
+        assert minio.objects[(manager.backup_bucket, large)] == minio.objects[("skillseekers-skills", rows[10].object_name)]
+
+    @pytest.mark.asyncio
+    async def test_segments_are_standard_archives(self, manager, minio, rows):
+        """Test segments can be opened with tarfile."""
+        import tarfile
+
+        backup_id = await manager.create_backup()
+        manifest = await manager._get_backup_manifest(backup_id)
+        segment = next(f["segment"] for f in manifest["files"] if f.get("segment"))
+
+        with tarfile.open(fileobj=io.BytesIO(minio.objects[(manager.backup_bucket, segment)])) as archive:
+            names = archive.getnames()
+
+        assert names and all(name.startswith(f"{rows[0].skill_id}/dir/") for name in names)
+
+    @pytest.mark.asyncio
+    async def test_files_restored_with_range_reads(self, manager, minio, rows, storage_manager):
+        """Test packed files are verified and restored one range read at a time."""
+        backup_id = await manager.create_backup()
+
+        minio.range_reads.clear()
+        result = await manager.verify_backup(backup_id)
+        assert result["overall_status"] == "passed"
+        assert len(minio.range_reads) == 10
+
+        assert await manager.restore_backup(backup_id) is True
+
+        for row in rows:
+            assert storage_manager.restored[row.file_path] == minio.objects[("skillseekers-skills", row.object_name)]
+        assert len(minio.range_reads) == 20
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_segments(self, manager, minio):
+        """Test deleting a packed backup removes its segments."""
+        backup_id = await manager.create_backup()
+
+        await manager.delete_backup(backup_id)
+
+        assert not [name for bucket, name in minio.objects if backup_id in name and "segments" in name]
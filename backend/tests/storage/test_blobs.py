@@ -0,0 +1,118 @@
+"""Tests for BlobStore.
+
+This module contains unit tests for the content-addressed blob store,
+using an in-memory SQLite database for reference counting and a mocked
+MinIO client.
+"""
+
+import hashlib
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.storage.blobs import BlobStore
+from backend.app.storage.models.content_blob import Base
+
+
+class TestBlobStore:
+    """Test suite for BlobStore."""
+
+    @pytest.fixture
+    def db_session(self):
+        """Create in-memory database session."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    @pytest.fixture
+    def mock_minio_client(self):
+        """Create mock MinIO client."""
+        client = Mock()
+        client.operation_context.return_value.__enter__ = Mock()
+        client.operation_context.return_value.__exit__ = Mock()
+        return client
+
+    @pytest.fixture
+    def blob_store(self, mock_minio_client, db_session):
+        """Create BlobStore instance without a GC grace period."""
+        return BlobStore(
+            mock_minio_client,
+            db_session,
+            "skillseekers-skills",
+            gc_grace_period=timedelta(seconds=-1),
+        )
+
+    @pytest.mark.asyncio
+    async def test_identical_content_uploaded_once(self, blob_store, mock_minio_client):
+        """Test storing the same bytes twice shares one object."""
+        data = b"same content"
+
+        first = await blob_store.store(data)
+        second = await blob_store.store(data)
+
+        assert first.object_name == second.object_name
+        assert first.checksum == hashlib.sha256(data).hexdigest()
+        assert blob_store.get(first.checksum).ref_count == 2
+        mock_minio_client.put_object.assert_called_once()
+        assert blob_store.get_stats()["deduplicated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_missing_blob(self, blob_store):
+        """Test acquiring unknown content returns None."""
+        assert await blob_store.acquire("0" * 64) is None
+
+    @pytest.mark.asyncio
+    async def test_garbage_collection_keeps_referenced_blobs(self, blob_store, mock_minio_client):
+        """Test only blobs without references are collected."""
+        kept = await blob_store.store(b"kept")
+        dropped = await blob_store.store(b"dropped")
+        await blob_store.acquire(kept.checksum)
+        await blob_store.release(kept.checksum)
+        await blob_store.release(dropped.checksum)
+
+        result = await blob_store.collect_garbage()
+
+        assert result == {"collected": 1, "bytes_reclaimed": len(b"dropped")}
+        mock_minio_client.remove_object.assert_called_once_with(
+            bucket_name="skillseekers-skills",
+            object_name=dropped.object_name,
+        )
+        assert blob_store.get(dropped.checksum) is None
+        assert blob_store.get(kept.checksum).ref_count == 1
+
+    @pytest.mark.asyncio
+    async def test_release_never_goes_negative(self, blob_store):
+        """Test extra releases leave the count at zero."""
+        blob = await blob_store.store(b"content")
+
+        await blob_store.release(blob.checksum)
+        await blob_store.release(blob.checksum)
+
+        assert blob_store.get(blob.checksum).ref_count == 0
+
+    @pytest.mark.asyncio
+    async def test_grace_period_delays_collection(self, mock_minio_client, db_session):
+        """Test recently released blobs survive collection."""
+        blob_store = BlobStore(mock_minio_client, db_session, "skillseekers-skills")
+        blob = await blob_store.store(b"content")
+        await blob_store.release(blob.checksum)
+
+        result = await blob_store.collect_garbage()
+
+        assert result["collected"] == 0
+        mock_minio_client.remove_object.assert_not_called()
+
+    def test_object_names(self, blob_store):
+        """Test blob object naming and ownership."""
+        checksum = "ab" + "0" * 62
+
+        object_name = blob_store.object_name_for(checksum)
+
+        assert object_name == f"blobs/ab/{checksum}"
+        assert blob_store.owns(object_name)
+        assert not blob_store.owns("skills/123/file.txt")
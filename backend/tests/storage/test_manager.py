@@ -25,6 +25,7 @@ from backend.app.storage.schemas.file_operations import (
     FileDeleteRequest,
     FileListRequest,
     FileMoveRequest,
+    FileCopyRequest,
 )
 from backend.app.storage.schemas.storage_config import StorageConfig, MinIOConfig
 
@@ -117,6 +118,9 @@ class TestSkillStorageManager:
         # Mock skill exists
         mock_db_session.query.return_value.filter.return_value.first.return_value = test_skill
 
+        # Mock no blob with this content yet
+        mock_db_session.query.return_value.filter.return_value.update.return_value = 0
+
         # Mock MinIO upload
         mock_minio_client.put_object.return_value = {
             "object_name": "skills/test-skill/test.txt"
@@ -140,9 +144,40 @@ class TestSkillStorageManager:
         assert result.file_path == "test.txt"
         assert result.file_size == len(file_data)
         assert result.checksum is not None
+        assert result.object_name == storage_manager.blob_store.object_name_for(result.checksum)
         mock_minio_client.put_object.assert_called_once()
+        # Blob record and file record
+        assert mock_db_session.add.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_upload_file_deduplicates_content(self, storage_manager, mock_minio_client, mock_db_session, test_skill):
+        """Test uploading existing content only adds a reference."""
+        # Setup
+        file_data = b"test file content"
+
+        # Mock skill exists
+        mock_db_session.query.return_value.filter.return_value.first.return_value = test_skill
+
+        # Mock blob with this content already stored
+        mock_db_session.query.return_value.filter.return_value.update.return_value = 1
+
+        # Mock operation context
+        mock_minio_client.operation_context.return_value.__enter__ = Mock()
+        mock_minio_client.operation_context.return_value.__exit__ = Mock()
+
+        # Execute
+        request = FileUploadRequest(
+            skill_id=test_skill.id,
+            file_path="copy.txt",
+            content_type="text/plain",
+        )
+
+        result = await storage_manager.upload_file(request, file_data)
+
+        # Verify
+        assert result.success is True
+        mock_minio_client.put_object.assert_not_called()
         mock_db_session.add.assert_called_once()
-        mock_db_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_upload_file_skill_not_found(self, storage_manager, mock_db_session):
@@ -269,6 +304,46 @@ class TestSkillStorageManager:
         mock_db_session.delete.assert_called_once()
         mock_db_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_delete_file_releases_versions(self, storage_manager, mock_minio_client, mock_db_session, test_skill):
+        """Test deleting a file drops the content references of its versions."""
+        blob_version = Mock(
+            version_id="v1",
+            object_name="blobs/ab/abc",
+            checksum="abc",
+            version_metadata={"blob": storage_manager.blob_store.bucket_name},
+        )
+        delta_version = Mock(
+            version_id="v2",
+            object_name="versions/f/test.txt/v2",
+            checksum="def",
+            version_metadata={"delta": {"base_version_id": "v1"}},
+        )
+        skill_file = Mock(
+            object_name="skills/test-skill/test.txt",
+            checksum="def",
+            file_size=1024,
+            versions=[blob_version, delta_version],
+        )
+        mock_minio_client.operation_context.return_value = MagicMock()
+
+        with patch.object(storage_manager, "_get_file", new_callable=AsyncMock) as mock_get_file, \
+                patch.object(storage_manager, "_release_object", new_callable=AsyncMock), \
+                patch.object(storage_manager, "_update_skill_stats", new_callable=AsyncMock), \
+                patch.object(storage_manager.blob_store, "release", new_callable=AsyncMock) as mock_release:
+            mock_get_file.return_value = skill_file
+
+            result = await storage_manager.delete_file(
+                FileDeleteRequest(skill_id=test_skill.id, file_path="test.txt")
+            )
+
+        assert result.success is True
+        mock_release.assert_awaited_once_with("abc")
+        mock_minio_client.remove_object.assert_called_once_with(
+            bucket_name="skillseekers-versions",
+            object_name="versions/f/test.txt/v2",
+        )
+
     # Test list_files
     @pytest.mark.asyncio
     async def test_list_files_success(self, storage_manager, mock_db_session, test_skill, test_skill_file):
@@ -355,10 +430,43 @@ class TestSkillStorageManager:
         assert result.success is True
         assert result.source_path == source_path
         assert result.target_path == target_path
-        mock_minio_client.copy_object.assert_called_once()
-        mock_minio_client.remove_object.assert_called_once()
+        assert result.new_object_name == test_skill_file.object_name
+        mock_minio_client.copy_object.assert_not_called()
+        mock_minio_client.remove_object.assert_not_called()
         mock_db_session.commit.assert_called_once()
 
+    # Test copy_file
+    @pytest.mark.asyncio
+    async def test_copy_file_shares_blob(self, storage_manager, mock_minio_client, mock_db_session, test_skill, test_skill_file):
+        """Test copying a file references the source blob without copying data."""
+        # Setup
+        test_skill_file.object_name = storage_manager.blob_store.object_name_for("abc123")
+        blob = Mock(object_name=test_skill_file.object_name)
+        storage_manager.blob_store.acquire = AsyncMock(return_value=blob)
+        storage_manager._get_file = AsyncMock(side_effect=[test_skill_file, None])
+        storage_manager._update_skill_stats = AsyncMock()
+
+        # Mock operation context
+        mock_minio_client.operation_context.return_value.__enter__ = Mock()
+        mock_minio_client.operation_context.return_value.__exit__ = Mock()
+
+        # Execute
+        request = FileCopyRequest(
+            skill_id=test_skill.id,
+            source_path="test.txt",
+            target_path="copy.txt",
+        )
+
+        result = await storage_manager.copy_file(request)
+
+        # Verify
+        assert result.success is True
+        assert result.object_name == test_skill_file.object_name
+        storage_manager.blob_store.acquire.assert_awaited_once_with("abc123")
+        mock_minio_client.copy_object.assert_not_called()
+        mock_minio_client.put_object.assert_not_called()
+        mock_db_session.add.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_move_file_source_not_found(self, storage_manager, mock_db_session):
         """Test move file when source doesn't exist."""
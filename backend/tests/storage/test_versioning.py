@@ -560,6 +560,33 @@ class TestVersionManager:
         mock_db_session.delete.assert_called_once()
         mock_db_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_materialize_dependents_keeps_delta_until_commit(self, version_manager, mock_minio_client, mock_db_session):
+        """Test materialized deltas are written to a new object and the old one removed after commit."""
+        base = Mock(version_id="v1", version_metadata={})
+        dependent = Mock(
+            version_id="v2",
+            object_name="versions/test.txt/v2",
+            version_metadata={"delta": {"base_version_id": "v1", "chain_length": 1}},
+        )
+        calls = []
+        mock_minio_client.put_object.side_effect = lambda **kwargs: calls.append(("put", kwargs["object_name"]))
+        mock_minio_client.remove_object.side_effect = lambda **kwargs: calls.append(("remove", kwargs["object_name"]))
+        mock_db_session.commit.side_effect = lambda: calls.append(("commit", None))
+
+        with patch.object(version_manager, "_reconstruct_version_data", new_callable=AsyncMock) as mock_reconstruct:
+            mock_reconstruct.return_value = b"full content"
+            materialized = await version_manager._materialize_dependents([base], candidates=[base, dependent])
+
+        assert materialized == 1
+        assert dependent.object_name == "versions/test.txt/v2.full"
+        assert "delta" not in dependent.version_metadata
+        assert calls == [
+            ("put", "versions/test.txt/v2.full"),
+            ("commit", None),
+            ("remove", "versions/test.txt/v2"),
+        ]
+
     @pytest.mark.asyncio
     async def test_delete_version_file_not_found(self, version_manager, mock_db_session):
         """Test delete version when file doesn't exist."""